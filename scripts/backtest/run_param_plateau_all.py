@@ -11,16 +11,17 @@
     poetry run python scripts/backtest/run_param_plateau_all.py
     poetry run python scripts/backtest/run_param_plateau_all.py --experiment hold_days
     poetry run python scripts/backtest/run_param_plateau_all.py --experiment sell_buffer
+    poetry run python scripts/backtest/run_param_plateau_all.py --no-cache
 """
 
 import argparse
+import os
 import sys
 from dataclasses import replace
 from typing import Any
 
 import pandas as pd
 
-from qbt.backtest.analysis import add_single_moving_average
 from qbt.backtest.constants import (
     FIXED_4P_BUY_BUFFER_ZONE_PCT,
     FIXED_4P_HOLD_DAYS,
@@ -28,15 +29,19 @@ from qbt.backtest.constants import (
     FIXED_4P_SELL_BUFFER_ZONE_PCT,
 )
 from qbt.backtest.engines.backtest_engine import run_buffer_strategy
+from qbt.backtest.feature_store import enable_feature_persistence, with_moving_averages
+from qbt.backtest.result_cache import ResultCache, buffer_strategy_payload, data_key_fields
 from qbt.backtest.strategies.buffer_zone import (
     get_config,
     resolve_params_for_config,
 )
+from qbt.backtest.types import BufferStrategyParams, SummaryDict
 from qbt.common_constants import BACKTEST_RESULTS_DIR
-from qbt.utils import get_logger
+from qbt.utils import WorkerPool, get_logger
 from qbt.utils.cli_helpers import cli_exception_handler
 from qbt.utils.data_loader import load_signal_trade_pair
 from qbt.utils.formatting import Align, TableLogger
+from qbt.utils.parallel_executor import WORKER_CACHE
 
 logger = get_logger(__name__)
 
@@ -71,6 +76,14 @@ _EXPERIMENT_META: list[tuple[str, str, str, list[float] | list[int]]] = [
     ("ma_window", "ma_window", "ma", _MA_WINDOW_VALUES),
 ]
 
+# 실험명 → 변경할 config 필드명
+_EXPERIMENT_PARAM_FIELD: dict[str, str] = {
+    "hold_days": "hold_days",
+    "sell_buffer": "sell_buffer_zone_pct",
+    "buy_buffer": "buy_buffer_zone_pct",
+    "ma_window": "ma_window",
+}
+
 # 피벗 지표
 _METRICS: list[tuple[str, str]] = [
     ("calmar", "Calmar"),
@@ -156,13 +169,123 @@ def _load_asset_data(
     return load_signal_trade_pair(base_config.signal_data_path, base_config.trade_data_path)
 
 
-def _run_experiments(selected_experiments: list[str]) -> pd.DataFrame:
+def _evaluate_task(params: BufferStrategyParams, strategy_name: str) -> SummaryDict:
+    """워커 작업: WORKER_CACHE의 signal_df/trade_df로 단일 조합의 성과 요약을 계산한다.
+
+    Args:
+        params: 전략 파라미터
+        strategy_name: 전략 식별 이름
+
+    Returns:
+        백테스트 성과 요약
+    """
+    _, _, summary = run_buffer_strategy(
+        WORKER_CACHE["signal_df"],
+        WORKER_CACHE["trade_df"],
+        params,
+        log_trades=False,
+        strategy_name=strategy_name,
+    )
+    return summary
+
+
+def _build_asset_tasks(
+    base_config: Any,
+    selected_experiments: list[str],
+) -> list[tuple[str, float | int, BufferStrategyParams, str]]:
+    """자산 1개의 실험 작업 목록을 생성한다.
+
+    각 실험에서 1개 파라미터만 변경하고 나머지는 4P 확정값으로 고정한다.
+
+    Args:
+        base_config: 자산의 버퍼존 config
+        selected_experiments: 실행할 실험 이름 리스트
+
+    Returns:
+        (experiment, param_value, params, strategy_name) 튜플 리스트 (실험/값 순서)
+    """
+    tasks: list[tuple[str, float | int, BufferStrategyParams, str]] = []
+    for exp_name, _, _, param_values in _EXPERIMENT_META:
+        if exp_name not in selected_experiments:
+            continue
+        for value in param_values:
+            overrides: dict[str, float | int] = {
+                "ma_window": FIXED_4P_MA_WINDOW,
+                "buy_buffer_zone_pct": FIXED_4P_BUY_BUFFER_ZONE_PCT,
+                "sell_buffer_zone_pct": FIXED_4P_SELL_BUFFER_ZONE_PCT,
+                "hold_days": FIXED_4P_HOLD_DAYS,
+            }
+            overrides[_EXPERIMENT_PARAM_FIELD[exp_name]] = value
+            config = replace(base_config, **overrides)
+            tasks.append((exp_name, value, resolve_params_for_config(config), config.strategy_name))
+    return tasks
+
+
+def _evaluate_tasks(
+    tasks: list[tuple[str, float | int, BufferStrategyParams, str]],
+    signal_df: pd.DataFrame,
+    trade_df: pd.DataFrame,
+    cache: ResultCache | None,
+    pool: WorkerPool | None,
+) -> list[SummaryDict]:
+    """작업 목록의 성과 요약을 계산한다.
+
+    결과 캐시에 있는 조합은 재사용하고, 미스만 모아 워커 풀(없으면 현재 프로세스)에서 계산한다.
+
+    Args:
+        tasks: _build_asset_tasks() 결과
+        signal_df: 시그널용 DataFrame (필요한 MA 컬럼 사전 계산)
+        trade_df: 매매용 DataFrame
+        cache: 결과 캐시 (None이면 캐시 미사용)
+        pool: 재사용 워커 풀 (None이면 순차 실행)
+
+    Returns:
+        작업 순서대로 정렬된 성과 요약 리스트
+    """
+    summaries: list[SummaryDict | None] = [None] * len(tasks)
+    keys: list[str] = []
+    if cache is not None:
+        data_fields = data_key_fields(signal_df, trade_df)
+        for i, (_, _, params, strategy_name) in enumerate(tasks):
+            key = cache.make_key(buffer_strategy_payload(data_fields, params, strategy_name))
+            keys.append(key)
+            summaries[i] = cache.get(key)
+
+    missing = [i for i, summary in enumerate(summaries) if summary is None]
+    if missing:
+        task_kwargs = [{"params": tasks[i][2], "strategy_name": tasks[i][3]} for i in missing]
+        if pool is not None:
+            pool.update_cache(shared_frames={"signal_df": signal_df, "trade_df": trade_df})
+            computed = pool.map_with_kwargs(_evaluate_task, task_kwargs, log_progress=False)
+        else:
+            computed = [
+                run_buffer_strategy(
+                    signal_df, trade_df, kw["params"], log_trades=False, strategy_name=kw["strategy_name"]
+                )[2]
+                for kw in task_kwargs
+            ]
+        for i, summary in zip(missing, computed, strict=True):
+            summaries[i] = summary
+            if cache is not None:
+                cache.put(keys[i], summary)
+
+    logger.debug(f"  계산 {len(missing)}개, 캐시 재사용 {len(tasks) - len(missing)}개")
+    return [summary for summary in summaries if summary is not None]
+
+
+def _run_experiments(
+    selected_experiments: list[str],
+    cache: ResultCache | None,
+    pool: WorkerPool | None,
+) -> pd.DataFrame:
     """선택된 실험들을 실행하고 결과를 DataFrame으로 반환한다.
 
-    자산별로 데이터 로딩과 MA 계산을 최소화한다.
+    자산별로 데이터 로딩과 MA 계산을 1회로 줄이고, 같은 워커 풀을 자산 간에 재사용한다.
 
     Args:
         selected_experiments: 실행할 실험 이름 리스트
+        cache: 결과 캐시 (None이면 캐시 미사용)
+        pool: 재사용 워커 풀 (None이면 순차 실행)
 
     Returns:
         결과 DataFrame
@@ -173,99 +296,22 @@ def _run_experiments(selected_experiments: list[str]) -> pd.DataFrame:
         signal_df, trade_df = _load_asset_data(config_name)
         base_config = get_config(config_name)
 
-        # MA=200 사전 계산 (hold_days, sell_buffer, buy_buffer 실험용)
-        signal_ma200 = add_single_moving_average(signal_df, FIXED_4P_MA_WINDOW, ma_type="ema")
+        # 실험에 필요한 MA를 한 번에 사전 계산 (MA=200 + ma_window 실험 값)
+        ma_windows = {FIXED_4P_MA_WINDOW}
+        if "ma_window" in selected_experiments:
+            ma_windows.update(_MA_WINDOW_VALUES)
+        signal_df = with_moving_averages(
+            signal_df, sorted(ma_windows), ma_type="ema", name=base_config.signal_data_path.stem
+        )
 
         logger.debug(f"[{asset_label}] 데이터 로딩 완료: {len(signal_df)}행")
 
-        # 실험 1: hold_days
-        if "hold_days" in selected_experiments:
-            for hold_val in _HOLD_DAYS_VALUES:
-                config = replace(
-                    base_config,
-                    ma_window=FIXED_4P_MA_WINDOW,
-                    buy_buffer_zone_pct=FIXED_4P_BUY_BUFFER_ZONE_PCT,
-                    sell_buffer_zone_pct=FIXED_4P_SELL_BUFFER_ZONE_PCT,
-                    hold_days=hold_val,
-                )
-                params = resolve_params_for_config(config)
-                _, _, summary = run_buffer_strategy(
-                    signal_ma200,
-                    trade_df,
-                    params,
-                    log_trades=False,
-                    strategy_name=config.strategy_name,
-                )
-                results.append(_build_row("hold_days", "hold_days", hold_val, asset_label, summary))
-                logger.debug(f"  hold={hold_val}: " f"Calmar={summary['calmar']:.2f}, " f"CAGR={summary['cagr']:.2f}%")
-
-        # 실험 2: sell_buffer
-        if "sell_buffer" in selected_experiments:
-            for sell_val in _SELL_BUFFER_VALUES:
-                config = replace(
-                    base_config,
-                    ma_window=FIXED_4P_MA_WINDOW,
-                    buy_buffer_zone_pct=FIXED_4P_BUY_BUFFER_ZONE_PCT,
-                    sell_buffer_zone_pct=sell_val,
-                    hold_days=FIXED_4P_HOLD_DAYS,
-                )
-                params = resolve_params_for_config(config)
-                _, _, summary = run_buffer_strategy(
-                    signal_ma200,
-                    trade_df,
-                    params,
-                    log_trades=False,
-                    strategy_name=config.strategy_name,
-                )
-                results.append(_build_row("sell_buffer", "sell_buffer", sell_val, asset_label, summary))
-                logger.debug(
-                    f"  sell={sell_val:.2f}: " f"Calmar={summary['calmar']:.2f}, " f"CAGR={summary['cagr']:.2f}%"
-                )
-
-        # 실험 3: buy_buffer
-        if "buy_buffer" in selected_experiments:
-            for buy_val in _BUY_BUFFER_VALUES:
-                config = replace(
-                    base_config,
-                    ma_window=FIXED_4P_MA_WINDOW,
-                    buy_buffer_zone_pct=buy_val,
-                    sell_buffer_zone_pct=FIXED_4P_SELL_BUFFER_ZONE_PCT,
-                    hold_days=FIXED_4P_HOLD_DAYS,
-                )
-                params = resolve_params_for_config(config)
-                _, _, summary = run_buffer_strategy(
-                    signal_ma200,
-                    trade_df,
-                    params,
-                    log_trades=False,
-                    strategy_name=config.strategy_name,
-                )
-                results.append(_build_row("buy_buffer", "buy_buffer", buy_val, asset_label, summary))
-                logger.debug(
-                    f"  buy={buy_val:.2f}: " f"Calmar={summary['calmar']:.2f}, " f"CAGR={summary['cagr']:.2f}%"
-                )
-
-        # 실험 4: ma_window (MA 재계산 필요)
-        if "ma_window" in selected_experiments:
-            for ma_val in _MA_WINDOW_VALUES:
-                signal_with_ma = add_single_moving_average(signal_df, ma_val, ma_type="ema")
-                config = replace(
-                    base_config,
-                    ma_window=ma_val,
-                    buy_buffer_zone_pct=FIXED_4P_BUY_BUFFER_ZONE_PCT,
-                    sell_buffer_zone_pct=FIXED_4P_SELL_BUFFER_ZONE_PCT,
-                    hold_days=FIXED_4P_HOLD_DAYS,
-                )
-                params = resolve_params_for_config(config)
-                _, _, summary = run_buffer_strategy(
-                    signal_with_ma,
-                    trade_df,
-                    params,
-                    log_trades=False,
-                    strategy_name=config.strategy_name,
-                )
-                results.append(_build_row("ma_window", "ma_window", ma_val, asset_label, summary))
-                logger.debug(f"  ma={ma_val}: " f"Calmar={summary['calmar']:.2f}, " f"CAGR={summary['cagr']:.2f}%")
+        tasks = _build_asset_tasks(base_config, selected_experiments)
+        summaries = _evaluate_tasks(tasks, signal_df, trade_df, cache, pool)
+
+        for (exp_name, value, _, _), summary in zip(tasks, summaries, strict=True):
+            results.append(_build_row(exp_name, exp_name, value, asset_label, summary))
+            logger.debug(f"  {exp_name}={value}: Calmar={summary['calmar']:.2f}, CAGR={summary['cagr']:.2f}%")
 
     return pd.DataFrame(results)
 
@@ -402,6 +448,11 @@ def _parse_args() -> argparse.Namespace:
         choices=sorted(_VALID_EXPERIMENTS),
         help="실행할 실험 (기본: all)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="결과 캐시를 사용하지 않고 모든 조합을 다시 계산",
+    )
     return parser.parse_args()
 
 
@@ -430,8 +481,21 @@ def main() -> int:
     logger.debug(f"자산: {len(_ASSET_CONFIGS)}개, 실험: {selected_experiments}")
     logger.debug(f"총 실행 횟수: {total_runs}회")
 
-    # 1. 백테스트 실행
-    detail_df = _run_experiments(selected_experiments)
+    # 이동평균은 storage/stock/features에 저장하여 다음 실행에서 재사용
+    enable_feature_persistence()
+
+    # 1. 백테스트 실행 (데이터가 갱신되었으면 결과 캐시를 먼저 비움)
+    cache: ResultCache | None = None
+    if not args.no_cache:
+        cache = ResultCache()
+        cache.invalidate_if_data_updated()
+    # 워커 풀은 스크립트 실행 동안 1개만 만들어 자산 간에 재사용 (단일 코어면 순차 실행)
+    max_workers = max(1, (os.cpu_count() or 1) - 1)
+    if max_workers > 1:
+        with WorkerPool(max_workers=max_workers) as pool:
+            detail_df = _run_experiments(selected_experiments, cache, pool)
+    else:
+        detail_df = _run_experiments(selected_experiments, cache, None)
 
     # 2. CSV 저장
     _save_results(detail_df, selected_experiments)
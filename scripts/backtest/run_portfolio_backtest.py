@@ -11,6 +11,7 @@
 
 import argparse
 import json
+import os
 import sys
 from datetime import date
 from typing import Any
@@ -25,6 +26,7 @@ from qbt.backtest.analysis import (
     calculate_yearly_returns,
 )
 from qbt.backtest.constants import (
+    DEFAULT_PORTFOLIO_START_DATE,
     ROUND_CAPITAL,
     ROUND_PERCENT,
     ROUND_PRICE,
@@ -37,8 +39,10 @@ from qbt.backtest.csv_export import (
     add_ohlc_change_pct,
     prepare_trades_for_csv,
 )
-from qbt.backtest.engines.portfolio_engine import compute_portfolio_effective_start_date, run_portfolio_backtest
+from qbt.backtest.engines.portfolio_engine import compute_portfolio_effective_start_date
+from qbt.backtest.feature_store import enable_feature_persistence
 from qbt.backtest.portfolio_configs import PORTFOLIO_CONFIGS, get_portfolio_config
+from qbt.backtest.portfolio_scheduler import load_portfolio_data_frames, run_portfolio_experiments
 from qbt.backtest.portfolio_types import (
     ASSET_COL_SUFFIX_WEIGHT,
     AssetSlotConfig,
@@ -69,11 +73,6 @@ logger = get_logger(__name__)
 # 실험명 -> config 매핑
 _CONFIG_MAP = {c.experiment_name: c for c in PORTFOLIO_CONFIGS}
 
-# 포트폴리오 백테스트 최소 시작일 하한
-# 각 실험의 effective_start_date가 이 날짜 이전이어도 이 날짜부터 실행한다
-# (2005년 이전 데이터는 포트폴리오 비교 범위에서 제외).
-DEFAULT_PORTFOLIO_START_DATE: date = date(2005, 1, 1)
-
 
 def _build_execution_comparison_df(
     equity_df: pd.DataFrame,
@@ -552,6 +551,9 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    # 이동평균은 storage/stock/features에 저장하여 다음 실행에서 재사용
+    enable_feature_persistence()
+
     # 2. 대상 실험 결정
     if args.experiment == "all":
         target_configs = list(PORTFOLIO_CONFIGS)
@@ -562,15 +564,19 @@ def main() -> int:
 
     logger.debug(f"실험 목록: {[c.experiment_name for c in target_configs]}")
 
-    # 3. 실험별 유효 시작일 계산
+    # 3. 데이터 로딩 (전 실험이 참조하는 CSV 경로당 1회, 이후 모든 단계가 공유)
+    data_frames = load_portfolio_data_frames(PORTFOLIO_CONFIGS)
+
+    # 4. 실험별 유효 시작일 계산
     # 각 실험은 자기 자산 조합의 공통 기간 + MA 워밍업 이후를 사용하되,
     # 정책 하한인 DEFAULT_PORTFOLIO_START_DATE로 끌어올린다 (2005년 이전 데이터는 스킵).
     # QQQ 벤치마크 JSON은 전체 실험 중 가장 이른 시작일(min)에 동일 하한을 적용하여
     # 공유 파일로 저장한다. 대시보드는 연도별 inner join으로 각 실험 기간에 공통되는
     # 연도만 비교하므로 별도 분리 저장이 불필요하다.
+    # (이 단계에서 계산된 MA는 피처 저장소에 저장되어 실험 실행 시 재사용된다)
     logger.debug("실험별 유효 시작일 계산 중...")
     effective_start_dates: dict[str, date] = {
-        cfg.experiment_name: compute_portfolio_effective_start_date(cfg) for cfg in PORTFOLIO_CONFIGS
+        cfg.experiment_name: compute_portfolio_effective_start_date(cfg, data_frames) for cfg in PORTFOLIO_CONFIGS
     }
     min_effective = min(effective_start_dates.values())
     benchmark_start_date = max(min_effective, DEFAULT_PORTFOLIO_START_DATE)
@@ -578,26 +584,41 @@ def main() -> int:
     logger.debug(f"정책 하한: {DEFAULT_PORTFOLIO_START_DATE}")
     logger.debug(f"QQQ 벤치마크 기준 시작일: {benchmark_start_date} (min(effective)={min_effective}, 하한 적용 후)")
 
-    # 3-1. QQQ 벤치마크 연간 수익률 JSON 생성 (하한 적용된 최소 시작일 기준 공유)
+    # 4-1. QQQ 벤치마크 연간 수익률 JSON 생성 (하한 적용된 최소 시작일 기준 공유)
     _save_benchmark_qqq_json(benchmark_start_date)
 
-    # 4. 실험별 실행 (각 실험의 고유 시작일 + 정책 하한 적용)
+    # 5. 실험 실행 (각 실험의 고유 시작일 + 정책 하한 적용)
+    # 워커 풀에서 실험을 병렬 실행하고, 끝나는 순서대로 결과 파일을 즉시 저장한다 (단일 코어면 순차 실행)
+    start_dates: dict[str, date] = {}
     for config in target_configs:
         raw_start_date = effective_start_dates[config.experiment_name]
-        exp_start_date = max(raw_start_date, DEFAULT_PORTFOLIO_START_DATE)
-        logger.debug("=" * 70)
+        start_dates[config.experiment_name] = max(raw_start_date, DEFAULT_PORTFOLIO_START_DATE)
         logger.debug(
-            f"실험 시작: {config.experiment_name} ({config.display_name}) — "
-            f"start_date={exp_start_date} (데이터 기준 {raw_start_date}, 하한 {DEFAULT_PORTFOLIO_START_DATE})"
+            f"실험 예약: {config.experiment_name} ({config.display_name}) — "
+            f"start_date={start_dates[config.experiment_name]} "
+            f"(데이터 기준 {raw_start_date}, 하한 {DEFAULT_PORTFOLIO_START_DATE})"
         )
-        result = run_portfolio_backtest(config, start_date=exp_start_date)
-        _print_summary(result)
 
-        # 정합성 자동 검증 (5개 규칙) -- 위반 시 결과 저장 후 스크립트 중지
-        violations = validate_portfolio_result(result)
+    def _save_on_complete(result: PortfolioResult) -> None:
         _save_portfolio_results(result)
-        logger.debug(f"{config.display_name} 결과 파일 저장 완료: {config.result_dir}")
+        logger.debug(f"{result.config.display_name} 결과 파일 저장 완료: {result.config.result_dir}")
+
+    max_workers = max(1, (os.cpu_count() or 1) - 1)
+    results = run_portfolio_experiments(
+        target_configs,
+        start_dates=start_dates,
+        data_frames=data_frames,
+        max_workers=max_workers,
+        on_result=_save_on_complete,
+    )
 
+    # 6. 요약 출력 + 정합성 자동 검증 (5개 규칙) -- 실험 목록 순서로 출력, 위반 시 스크립트 중지
+    for result in results:
+        config = result.config
+        logger.debug("=" * 70)
+        _print_summary(result)
+
+        violations = validate_portfolio_result(result)
         if violations:
             for v in violations:
                 logger.error(f"  {v}")
@@ -0,0 +1,222 @@
+"""포트폴리오 비중/리밸런싱 임계값 탐색 스크립트
+
+실험 구성(자산/전략 고정)에서 목표 비중 격자와 리밸런싱 임계값 후보의 전 조합을
+배치 커널로 평가하고, Calmar 순위표를 CSV로 저장한다.
+
+실행 명령어:
+    poetry run python scripts/backtest/run_portfolio_search.py --experiment portfolio_q2
+    poetry run python scripts/backtest/run_portfolio_search.py --experiment portfolio_d1 --weight-step 0.1
+    poetry run python scripts/backtest/run_portfolio_search.py --experiment portfolio_q2 \\
+        --monthly-thresholds 0.05 0.1 --daily-thresholds 0.2 0.3 --min-weight 0.1
+"""
+
+import argparse
+import sys
+from datetime import date
+from typing import Any
+
+import pandas as pd
+
+from qbt.backtest.constants import (
+    COL_CAGR,
+    COL_CALMAR,
+    COL_FINAL_CAPITAL,
+    COL_MDD,
+    COL_TOTAL_RETURN_PCT,
+    COL_TOTAL_TRADES,
+    COL_WIN_RATE,
+    DEFAULT_PORTFOLIO_SEARCH_DAILY_THRESHOLDS,
+    DEFAULT_PORTFOLIO_SEARCH_MONTHLY_THRESHOLDS,
+    DEFAULT_PORTFOLIO_SEARCH_WEIGHT_STEP,
+    DEFAULT_PORTFOLIO_START_DATE,
+    ROUND_CAPITAL,
+    ROUND_PERCENT,
+    ROUND_RATIO,
+)
+from qbt.backtest.engines.portfolio_engine import compute_portfolio_effective_start_date
+from qbt.backtest.feature_store import enable_feature_persistence
+from qbt.backtest.portfolio_configs import PORTFOLIO_CONFIGS, get_portfolio_config
+from qbt.backtest.portfolio_scheduler import load_portfolio_data_frames
+from qbt.backtest.portfolio_search import (
+    COL_DAILY_THRESHOLD_RATE,
+    COL_MONTHLY_THRESHOLD_RATE,
+    generate_weight_grid,
+    run_portfolio_search,
+)
+from qbt.backtest.portfolio_types import PortfolioConfig, asset_weight_col
+from qbt.common_constants import META_JSON_PATH
+from qbt.utils import get_logger
+from qbt.utils.cli_helpers import cli_exception_handler
+from qbt.utils.formatting import Align, TableLogger
+from qbt.utils.meta_manager import save_metadata
+
+logger = get_logger(__name__)
+
+# 실험명 -> config 매핑
+_CONFIG_MAP = {c.experiment_name: c for c in PORTFOLIO_CONFIGS}
+
+# 결과 파일명 (실험 결과 디렉토리 하위)
+_SEARCH_FILENAME = "weight_threshold_search.csv"
+
+# 터미널 출력 상위 조합 수
+_TOP_N = 20
+
+
+def _parse_args() -> argparse.Namespace:
+    """명령행 인자를 파싱한다.
+
+    Returns:
+        파싱된 인자 Namespace
+    """
+    parser = argparse.ArgumentParser(description="포트폴리오 비중/리밸런싱 임계값 탐색")
+    parser.add_argument(
+        "--experiment",
+        choices=list(_CONFIG_MAP.keys()),
+        required=True,
+        help="탐색할 실험 (자산 구성과 자산별 전략은 실험 설정을 그대로 사용)",
+    )
+    parser.add_argument(
+        "--weight-step",
+        type=float,
+        default=DEFAULT_PORTFOLIO_SEARCH_WEIGHT_STEP,
+        help=f"목표 비중 격자 간격 (기본값: {DEFAULT_PORTFOLIO_SEARCH_WEIGHT_STEP})",
+    )
+    parser.add_argument(
+        "--min-weight",
+        type=float,
+        default=None,
+        help="자산별 최소 비중 (기본값: weight-step)",
+    )
+    parser.add_argument(
+        "--monthly-thresholds",
+        type=float,
+        nargs="+",
+        default=DEFAULT_PORTFOLIO_SEARCH_MONTHLY_THRESHOLDS,
+        help=f"월 첫 거래일 리밸런싱 임계값 후보 (기본값: {DEFAULT_PORTFOLIO_SEARCH_MONTHLY_THRESHOLDS})",
+    )
+    parser.add_argument(
+        "--daily-thresholds",
+        type=float,
+        nargs="+",
+        default=DEFAULT_PORTFOLIO_SEARCH_DAILY_THRESHOLDS,
+        help=f"매일 긴급 리밸런싱 임계값 후보 (기본값: {DEFAULT_PORTFOLIO_SEARCH_DAILY_THRESHOLDS})",
+    )
+    return parser.parse_args()
+
+
+def _save_search_results(config: PortfolioConfig, results_df: pd.DataFrame, start_date: date) -> None:
+    """탐색 결과 CSV와 메타데이터를 저장한다.
+
+    Args:
+        config: 탐색한 실험 설정
+        results_df: run_portfolio_search 결과 (순위 순)
+        start_date: 백테스트 시작일 하한
+    """
+    config.result_dir.mkdir(parents=True, exist_ok=True)
+    output_path = config.result_dir / _SEARCH_FILENAME
+
+    ratio_cols = [asset_weight_col(slot.asset_id) for slot in config.asset_slots]
+    ratio_cols += [COL_MONTHLY_THRESHOLD_RATE, COL_DAILY_THRESHOLD_RATE, COL_CALMAR]
+    round_map: dict[str, int] = dict.fromkeys(ratio_cols, ROUND_RATIO)
+    round_map.update(dict.fromkeys([COL_TOTAL_RETURN_PCT, COL_CAGR, COL_MDD, COL_WIN_RATE], ROUND_PERCENT))
+    round_map[COL_FINAL_CAPITAL] = ROUND_CAPITAL
+    export_df = results_df.round(round_map)
+    export_df.insert(0, "rank", range(1, len(export_df) + 1))
+    export_df.to_csv(output_path, index=False)
+    logger.debug(f"탐색 결과 저장 완료: {output_path}")
+
+    best = results_df.iloc[0]
+    metadata: dict[str, Any] = {
+        "experiment_name": config.experiment_name,
+        "start_date": str(start_date),
+        "combinations": len(results_df),
+        "best": {
+            "weights": {slot.asset_id: float(best[asset_weight_col(slot.asset_id)]) for slot in config.asset_slots},
+            COL_MONTHLY_THRESHOLD_RATE: float(best[COL_MONTHLY_THRESHOLD_RATE]),
+            COL_DAILY_THRESHOLD_RATE: float(best[COL_DAILY_THRESHOLD_RATE]),
+            COL_CAGR: float(best[COL_CAGR]),
+            COL_MDD: float(best[COL_MDD]),
+            COL_CALMAR: float(best[COL_CALMAR]),
+        },
+        "output_files": {"search_csv": str(output_path)},
+    }
+    save_metadata("portfolio_search", metadata)
+    logger.debug(f"메타데이터 저장 완료: {META_JSON_PATH}")
+
+
+def _print_top(config: PortfolioConfig, results_df: pd.DataFrame) -> None:
+    """상위 조합을 테이블로 출력한다.
+
+    Args:
+        config: 탐색한 실험 설정
+        results_df: run_portfolio_search 결과 (순위 순)
+    """
+    columns = [("순위", 6, Align.RIGHT)]
+    columns += [(slot.asset_id, 8, Align.RIGHT) for slot in config.asset_slots]
+    columns += [
+        ("월간", 8, Align.RIGHT),
+        ("일간", 8, Align.RIGHT),
+        ("CAGR", 10, Align.RIGHT),
+        ("MDD", 10, Align.RIGHT),
+        ("Calmar", 10, Align.RIGHT),
+        ("거래수", 8, Align.RIGHT),
+    ]
+    rows: list[list[str]] = []
+    for rank, values in enumerate(results_df.head(_TOP_N).to_dict("records"), start=1):
+        rows.append(
+            [
+                str(rank),
+                *[f"{values[asset_weight_col(slot.asset_id)]:.0%}" for slot in config.asset_slots],
+                f"{values[COL_MONTHLY_THRESHOLD_RATE]:.0%}",
+                f"{values[COL_DAILY_THRESHOLD_RATE]:.0%}",
+                f"{values[COL_CAGR]:.2f}%",
+                f"{values[COL_MDD]:.2f}%",
+                f"{values[COL_CALMAR]:.2f}",
+                str(values[COL_TOTAL_TRADES]),
+            ]
+        )
+    TableLogger(columns, logger).print_table(rows, title=f"[{config.display_name}] 비중/임계값 탐색 상위 {len(rows)}개")
+
+
+@cli_exception_handler
+def main() -> int:
+    """메인 실행 함수.
+
+    Returns:
+        종료 코드 (0: 성공, 1: 실패)
+    """
+    # 1. 명령행 인자 파싱
+    args = _parse_args()
+    config = get_portfolio_config(args.experiment)
+
+    # 이동평균은 storage/stock/features에 저장하여 다음 실행에서 재사용
+    enable_feature_persistence()
+
+    # 2. 데이터 로딩 + 시작일 결정 (run_portfolio_backtest.py와 같은 정책 하한 적용)
+    data_frames = load_portfolio_data_frames([config])
+    start_date = max(compute_portfolio_effective_start_date(config, data_frames), DEFAULT_PORTFOLIO_START_DATE)
+
+    # 3. 탐색 실행
+    weight_grid = generate_weight_grid(len(config.asset_slots), args.weight_step, args.min_weight)
+    logger.debug(
+        f"탐색 시작: {config.experiment_name} ({config.display_name}), start_date={start_date}, "
+        f"비중 벡터 {len(weight_grid)}개, 월간 임계값 {args.monthly_thresholds}, 일간 임계값 {args.daily_thresholds}"
+    )
+    results_df = run_portfolio_search(
+        config,
+        weight_grid,
+        args.monthly_thresholds,
+        args.daily_thresholds,
+        start_date=start_date,
+        data_frames=data_frames,
+    )
+
+    # 4. 저장 + 출력
+    _save_search_results(config, results_df, start_date)
+    _print_top(config, results_df)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
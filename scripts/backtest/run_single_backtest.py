@@ -34,6 +34,7 @@ from qbt.backtest.csv_export import (
     add_ohlc_change_pct,
     prepare_trades_for_csv,
 )
+from qbt.backtest.feature_store import enable_feature_persistence
 from qbt.backtest.strategies import (
     buffer_zone,
     buy_and_hold,
@@ -366,6 +367,9 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    # 이동평균은 storage/stock/features에 저장하여 다음 실행에서 재사용
+    enable_feature_persistence()
+
     # 2. 전략 목록 결정
     if args.strategy == "all":
         strategy_names = list(STRATEGY_RUNNERS.keys())
@@ -8,6 +8,7 @@
     poetry run python scripts/backtest/run_walkforward.py
     poetry run python scripts/backtest/run_walkforward.py --strategy buffer_zone_tqqq
     poetry run python scripts/backtest/run_walkforward.py --strategy buffer_zone_qqq
+    poetry run python scripts/backtest/run_walkforward.py --no-cache
 """
 
 import argparse
@@ -47,6 +48,7 @@ from qbt.backtest.constants import (
     WFO_WINDOWS_FULLY_FIXED_DIR,
 )
 from qbt.backtest.csv_export import prepare_trades_for_csv
+from qbt.backtest.result_cache import ResultCache, cached_walkforward
 from qbt.backtest.strategies import buffer_zone
 from qbt.backtest.types import WfoModeSummaryDict, WfoWindowResultDict
 from qbt.backtest.walkforward import (
@@ -103,6 +105,7 @@ def _run_single_mode(
     sell_buffer_zone_pct_list: list[float],
     hold_days_list: list[int],
     initial_capital: float,
+    cache: ResultCache | None,
 ) -> tuple[list[WfoWindowResultDict], WfoModeSummaryDict, pd.DataFrame]:
     """단일 WFO 모드를 실행한다.
 
@@ -111,23 +114,26 @@ def _run_single_mode(
         signal_df: 시그널 DataFrame
         trade_df: 매매 DataFrame
         기타: 파라미터 리스트들
+        cache: 결과 캐시 (None이면 WFO를 항상 새로 실행)
 
     Returns:
         (window_results, mode_summary, equity_df) 튜플
     """
     start_time = time.time()
 
-    window_results = run_walkforward(
-        signal_df=signal_df,
-        trade_df=trade_df,
-        ma_window_list=ma_window_list,
-        buy_buffer_zone_pct_list=buy_buffer_zone_pct_list,
-        sell_buffer_zone_pct_list=sell_buffer_zone_pct_list,
-        hold_days_list=hold_days_list,
-        initial_is_months=DEFAULT_WFO_INITIAL_IS_MONTHS,
-        oos_months=DEFAULT_WFO_OOS_MONTHS,
-        initial_capital=initial_capital,
-    )
+    wfo_kwargs = {
+        "ma_window_list": ma_window_list,
+        "buy_buffer_zone_pct_list": buy_buffer_zone_pct_list,
+        "sell_buffer_zone_pct_list": sell_buffer_zone_pct_list,
+        "hold_days_list": hold_days_list,
+        "initial_is_months": DEFAULT_WFO_INITIAL_IS_MONTHS,
+        "oos_months": DEFAULT_WFO_OOS_MONTHS,
+        "initial_capital": initial_capital,
+    }
+    if cache is not None:
+        window_results = cached_walkforward(cache, signal_df, trade_df, **wfo_kwargs)
+    else:
+        window_results = run_walkforward(signal_df=signal_df, trade_df=trade_df, **wfo_kwargs)
 
     # Stitched Equity 생성
     equity_df, stitched_summary = run_stitched_equity(signal_df, trade_df, window_results, initial_capital)
@@ -369,8 +375,19 @@ def main() -> int:
         default="all",
         help="실행할 전략 (기본값: all)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="결과 캐시를 사용하지 않고 WFO를 다시 계산",
+    )
     args = parser.parse_args()
 
+    # 결과 캐시 (데이터가 갱신되었으면 먼저 비움)
+    cache: ResultCache | None = None
+    if not args.no_cache:
+        cache = ResultCache()
+        cache.invalidate_if_data_updated()
+
     # 2. 전략 목록 결정
     if args.strategy == "all":
         strategy_names = list(STRATEGY_CONFIG.keys())
@@ -403,6 +420,7 @@ def main() -> int:
             list(DEFAULT_WFO_SELL_BUFFER_ZONE_PCT_LIST),
             list(DEFAULT_WFO_HOLD_DAYS_LIST),
             DEFAULT_INITIAL_CAPITAL,
+            cache,
         )
 
         # 3-3. Mode 2: Fully Fixed (첫 윈도우 best params 고정)
@@ -419,6 +437,7 @@ def main() -> int:
             [first_best["best_sell_buffer_zone_pct"]],
             [first_best["best_hold_days"]],
             DEFAULT_INITIAL_CAPITAL,
+            cache,
         )
 
         # 3-4. 요약 출력
@@ -23,6 +23,7 @@ from typing import Final
 
 from qbt.utils import get_logger
 from qbt.utils.cli_helpers import cli_exception_handler
+from qbt.utils.meta_manager import save_metadata
 from qbt.utils.stock_downloader import download_stock_data
 
 logger = get_logger(__name__)
@@ -91,6 +92,10 @@ def main() -> int:
             _download_single(ticker, args.start, args.end)
         logger.debug(f"전체 종목 다운로드 완료: {len(DEFAULT_TICKERS)}개")
 
+    # 데이터 갱신 시각 기록 (백테스트 결과 캐시 무효화 기준)
+    tickers = [args.ticker.upper()] if args.ticker is not None else list(DEFAULT_TICKERS)
+    save_metadata("stock_download", {"tickers": tickers, "start": args.start, "end": args.end})
+
     return 0
 
 
@@ -15,7 +15,7 @@ import pandas as pd
 
 from qbt.common_constants import COL_CLOSE, META_JSON_PATH, QQQ_DATA_PATH
 from qbt.tqqq import (
-    build_monthly_spread_map,
+    build_monthly_spread_series,
     calculate_validation_metrics,
     simulate,
 )
@@ -71,7 +71,7 @@ def main() -> int:
     qqq_overlap, tqqq_overlap = extract_overlap_period(qqq_df, tqqq_df)
 
     # 3. softplus 스프레드 맵 생성
-    spread_map = build_monthly_spread_map(ffr_df, DEFAULT_SOFTPLUS_A, DEFAULT_SOFTPLUS_B)
+    spread_map = build_monthly_spread_series(ffr_df, DEFAULT_SOFTPLUS_A, DEFAULT_SOFTPLUS_B)
     logger.debug(
         f"시뮬레이션 실행: leverage={DEFAULT_LEVERAGE_MULTIPLIER}, "
         f"softplus(a={DEFAULT_SOFTPLUS_A}, b={DEFAULT_SOFTPLUS_B})"
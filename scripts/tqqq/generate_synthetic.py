@@ -17,8 +17,6 @@ QQQ 전체 기간을 SoftPlus 동적 스프레드 모델로 시뮬레이션하
 
 import sys
 
-import pandas as pd
-
 from qbt.common_constants import (
     COL_CLOSE,
     COL_DATE,
@@ -26,7 +24,7 @@ from qbt.common_constants import (
     QQQ_DATA_PATH,
     TQQQ_SYNTHETIC_DATA_PATH,
 )
-from qbt.tqqq import build_monthly_spread_map, simulate
+from qbt.tqqq import build_monthly_spread_series, simulate
 from qbt.tqqq.constants import (
     DEFAULT_LEVERAGE_MULTIPLIER,
     DEFAULT_PRE_LISTING_EXPENSE_RATIO,
@@ -42,9 +40,10 @@ from qbt.tqqq.data_loader import (
     load_expense_ratio_data,
     load_ffr_data,
 )
+from qbt.tqqq.synthetic import merge_synthetic_with_actual
 from qbt.utils import get_logger
 from qbt.utils.cli_helpers import cli_exception_handler
-from qbt.utils.data_loader import load_stock_data
+from qbt.utils.data_loader import load_stock_data, write_columnar_cache
 from qbt.utils.meta_manager import save_metadata
 
 logger = get_logger(__name__)
@@ -75,7 +74,7 @@ def main() -> int:
     logger.debug(f"TQQQ(실제): {len(tqqq_df):,}행 ({tqqq_df[COL_DATE].min()} ~ {tqqq_df[COL_DATE].max()})")
 
     # 2. SoftPlus 스프레드 맵 생성
-    spread_map = build_monthly_spread_map(ffr_df, a=DEFAULT_SOFTPLUS_A, b=DEFAULT_SOFTPLUS_B)
+    spread_map = build_monthly_spread_series(ffr_df, a=DEFAULT_SOFTPLUS_A, b=DEFAULT_SOFTPLUS_B)
     logger.debug(f"SoftPlus 스프레드 맵 생성 완료: {len(spread_map)}개월")
 
     # 3. expense_dict 확장 (1999-01 ~ expense_df 최초월 직전까지 고정값 채우기)
@@ -98,46 +97,28 @@ def main() -> int:
     )
     logger.debug(f"시뮬레이션 완료: {len(synthetic_df):,}행")
 
-    # 5. 접합점 계산
+    # 5. 접합점 스케일링 + 병합: 스케일링된 합성(< 실제 TQQQ 첫 거래일) + 실제 TQQQ(>= 첫 거래일)
+    merged_df, scale_factor = merge_synthetic_with_actual(synthetic_df, tqqq_df)
     overlap_date = tqqq_df[COL_DATE].min()
-    logger.debug(f"접합점(실제 TQQQ 첫 거래일): {overlap_date}")
-
-    synthetic_overlap_rows = synthetic_df[synthetic_df[COL_DATE] == overlap_date]
-    actual_overlap_rows = tqqq_df[tqqq_df[COL_DATE] == overlap_date]
-    synthetic_at_overlap = float(synthetic_overlap_rows.iloc[0][COL_CLOSE])
-    actual_at_overlap = float(actual_overlap_rows.iloc[0][COL_CLOSE])
-    scale_factor = actual_at_overlap / synthetic_at_overlap
-
-    logger.debug(f"시뮬레이션 접합점 종가: {synthetic_at_overlap:.6f}")
-    logger.debug(f"실제 TQQQ 접합점 종가: {actual_at_overlap:.6f}")
-    logger.debug(f"스케일 팩터: {scale_factor:.6f}")
-
-    # 6. 합성 구간 스케일링 (접합일 이전 구간)
-    synthetic_before = synthetic_df[synthetic_df[COL_DATE] < overlap_date].copy()
-    for col in PRICE_COLUMNS:
-        if col in synthetic_before.columns:
-            synthetic_before[col] = synthetic_before[col] * scale_factor
-
-    # 7. 병합: 스케일링된 합성(< overlap_date) + 실제 TQQQ(>= overlap_date)
-    actual_from_overlap = tqqq_df[tqqq_df[COL_DATE] >= overlap_date].copy()
-    frames: list[pd.DataFrame] = [synthetic_before, actual_from_overlap]
-    merged_df = pd.concat(frames, ignore_index=True)
-    merged_df = merged_df.sort_values(COL_DATE).reset_index(drop=True)
+    synthetic_before = merged_df[merged_df[COL_DATE] < overlap_date]
+    actual_from_overlap = merged_df[merged_df[COL_DATE] >= overlap_date]
+    logger.debug(f"접합점(실제 TQQQ 첫 거래일): {overlap_date}, 스케일 팩터: {scale_factor:.6f}")
 
     logger.debug(f"병합 완료: {len(merged_df):,}행 ({merged_df[COL_DATE].min()} ~ {merged_df[COL_DATE].max()})")
     logger.debug(f"  합성 구간: {len(synthetic_before):,}행 (~ {overlap_date} 이전)")
     logger.debug(f"  실제 구간: {len(actual_from_overlap):,}행 ({overlap_date} ~)")
 
-    # 8. CSV 저장 (가격 컬럼 소수점 6자리 라운딩)
+    # 6. CSV 저장 (가격 컬럼 소수점 6자리 라운딩)
     TQQQ_SYNTHETIC_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
     for col in PRICE_COLUMNS:
         if col in merged_df.columns:
             merged_df[col] = merged_df[col].round(6)
 
     merged_df.to_csv(TQQQ_SYNTHETIC_DATA_PATH, index=False)
+    write_columnar_cache(TQQQ_SYNTHETIC_DATA_PATH)
     logger.debug(f"병합 데이터 저장 완료: {TQQQ_SYNTHETIC_DATA_PATH}")
 
-    # 9. 결과 요약 출력
+    # 7. 결과 요약 출력
     initial_close = float(merged_df.iloc[0][COL_CLOSE])
     final_close = float(merged_df.iloc[-1][COL_CLOSE])
     cumulative_return_pct = (final_close / initial_close - 1) * 100
@@ -146,7 +127,7 @@ def main() -> int:
     logger.debug(f"최종 가격: {final_close:.6f}")
     logger.debug(f"누적 수익률: {cumulative_return_pct:+.2f}%")
 
-    # 10. 메타데이터 저장
+    # 8. 메타데이터 저장
     synthetic_end_date = synthetic_before[COL_DATE].max()
     actual_end_date = actual_from_overlap[COL_DATE].max()
     file_size_bytes = TQQQ_SYNTHETIC_DATA_PATH.stat().st_size
@@ -0,0 +1,120 @@
+"""
+레버리지 ETF 합성+실제 병합 데이터 일괄 생성 스크립트
+
+SYNTHETIC_SPECS에 선언된 (기초 자산, 레버리지, 운용비율) 조합 전체를 한 번에 생성한다.
+각 조합은 기초 자산 전체 기간을 SoftPlus 동적 스프레드 모델로 시뮬레이션하고,
+실제 ETF 첫 거래일에서 가격을 스케일링하여 실제 데이터와 병합한다.
+
+- TQQQ: QQQ 3배, 월별 운용비율 (generate_synthetic.py와 같은 결과)
+- QLD / SSO / UGL / UBT: QQQ / SPY / GLD / TLT 2배, 고정 운용비율
+- 출력: storage/stock/{TICKER}_synthetic_max.csv + 바이너리 컬럼 캐시 + 메타데이터
+
+실행 명령어:
+    poetry run python scripts/tqqq/generate_synthetic_batch.py
+    poetry run python scripts/tqqq/generate_synthetic_batch.py SSO QLD
+"""
+
+import argparse
+import os
+import sys
+
+from qbt.common_constants import COL_CLOSE, COL_DATE, PRICE_COLUMNS
+from qbt.tqqq.constants import DEFAULT_SOFTPLUS_A, DEFAULT_SOFTPLUS_B, FFR_DATA_PATH
+from qbt.tqqq.data_loader import load_ffr_data
+from qbt.tqqq.synthetic import SYNTHETIC_SPECS, SyntheticResult, generate_synthetic_batch
+from qbt.utils import get_logger
+from qbt.utils.cli_helpers import cli_exception_handler
+from qbt.utils.data_loader import write_columnar_cache
+from qbt.utils.meta_manager import save_metadata
+
+logger = get_logger(__name__)
+
+# CSV 저장 시 가격 컬럼 반올림 자릿수 (generate_synthetic.py와 동일)
+_PRICE_ROUND = 6
+
+
+def _save_result(result: SyntheticResult) -> dict[str, object]:
+    """병합 결과를 CSV + 바이너리 컬럼 캐시로 저장하고 메타데이터 항목을 반환한다."""
+    spec = result.spec
+    merged_df = result.merged_df.copy()
+    for col in PRICE_COLUMNS:
+        if col in merged_df.columns:
+            merged_df[col] = merged_df[col].round(_PRICE_ROUND)
+
+    spec.output_path.parent.mkdir(parents=True, exist_ok=True)
+    merged_df.to_csv(spec.output_path, index=False)
+    write_columnar_cache(spec.output_path)
+
+    initial_close = float(merged_df.iloc[0][COL_CLOSE])
+    final_close = float(merged_df.iloc[-1][COL_CLOSE])
+    logger.debug(
+        f"{spec.ticker}: {len(merged_df):,}행 ({merged_df[COL_DATE].min()} ~ {merged_df[COL_DATE].max()}), "
+        f"합성 {result.synthetic_days:,}행 (~ {result.overlap_date} 이전), "
+        f"스케일 팩터 {result.scale_factor:.6f} → {spec.output_path}"
+    )
+
+    return {
+        "underlying": spec.underlying_path.stem,
+        "leverage": spec.leverage,
+        "expense_ratio": spec.expense_ratio,
+        "expense_ratio_path": str(spec.expense_ratio_path) if spec.expense_ratio_path is not None else None,
+        "start_date": str(merged_df[COL_DATE].min()),
+        "overlap_date": str(result.overlap_date),
+        "end_date": str(merged_df[COL_DATE].max()),
+        "synthetic_days": result.synthetic_days,
+        "total_days": len(merged_df),
+        "scale_factor": round(result.scale_factor, 6),
+        "cumulative_return_pct": round((final_close / initial_close - 1) * 100, 2),
+        "csv_path": str(spec.output_path),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    """명령행 인자를 파싱한다.
+
+    Returns:
+        파싱된 인자 Namespace
+    """
+    parser = argparse.ArgumentParser(description="레버리지 ETF 합성+실제 병합 데이터 일괄 생성 스크립트")
+    parser.add_argument(
+        "tickers",
+        nargs="*",
+        choices=[spec.ticker for spec in SYNTHETIC_SPECS],
+        help="생성할 티커 (생략 시 전체)",
+    )
+    return parser.parse_args()
+
+
+@cli_exception_handler
+def main() -> int:
+    """
+    메인 실행 함수.
+
+    Returns:
+        종료 코드 (0: 성공, 1: 실패)
+    """
+    args = _parse_args()
+    specs = [spec for spec in SYNTHETIC_SPECS if not args.tickers or spec.ticker in args.tickers]
+    max_workers = max(1, (os.cpu_count() or 1) - 1)
+
+    # 1. 조합 전체 생성 (FFR/spread 월별 시계열 공유, 조합 단위 병렬)
+    results = generate_synthetic_batch(specs, load_ffr_data(FFR_DATA_PATH), max_workers=max_workers)
+
+    # 2. 저장 + 메타데이터
+    series_meta = {result.spec.ticker: _save_result(result) for result in results}
+    metadata = {
+        "execution_params": {
+            "funding_spread_mode": "softplus",
+            "softplus_a": DEFAULT_SOFTPLUS_A,
+            "softplus_b": DEFAULT_SOFTPLUS_B,
+        },
+        "series": series_meta,
+    }
+    save_metadata("synthetic_batch", metadata)
+    logger.debug(f"일괄 생성 완료: {', '.join(series_meta)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
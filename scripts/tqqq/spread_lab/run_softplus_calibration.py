@@ -0,0 +1,163 @@
+"""
+Softplus 스프레드 (a, b) 캘리브레이션 스크립트
+
+전체기간 2단계 그리드 튜닝과 3가지 월별 워크포워드(동적, b 고정, (a, b) 완전 고정)를 실행하여
+spread_lab 결과 CSV를 다시 생성한다. 결과는 app_rate_spread_lab.py에서 확인한다.
+
+- 튜닝: tqqq_softplus_tuning.csv (a, b, rmse_pct, RMSE 오름차순, 두 단계에서 중복 평가된 (a, b)는 1행만 기록)
+- 정적 spread: tqqq_softplus_spread_series_static.csv (튜닝 최적 (a, b)의 월별 spread)
+- 워크포워드: tqqq_rate_spread_lab_walkforward*.csv + *_summary.csv (metric, value)
+  (완전 고정 요약에는 금리 구간별 RMSE 분해 포함)
+- b 고정 / 완전 고정 워크포워드는 DEFAULT_SOFTPLUS_A/B를 고정값으로 사용한다
+
+실행 명령어:
+    poetry run python scripts/tqqq/spread_lab/run_softplus_calibration.py
+    poetry run python scripts/tqqq/spread_lab/run_softplus_calibration.py --no-local-refine
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from qbt.common_constants import QQQ_DATA_PATH
+from qbt.tqqq.calibration import (
+    build_static_spread_series,
+    prepare_calibration_data,
+    run_softplus_walkforward,
+    search_softplus_two_stage,
+)
+from qbt.tqqq.constants import (
+    COL_A,
+    COL_A_BEST,
+    COL_A_GLOBAL,
+    COL_B,
+    COL_B_BEST,
+    COL_B_GLOBAL,
+    COL_FFR_PCT,
+    COL_FFR_PCT_TEST,
+    COL_RMSE_PCT,
+    COL_SPREAD_GLOBAL,
+    COL_SPREAD_TEST,
+    COL_TEST_RMSE_PCT,
+    COL_TRAIN_RMSE_PCT,
+    DEFAULT_SOFTPLUS_A,
+    DEFAULT_SOFTPLUS_B,
+    EXPENSE_RATIO_DATA_PATH,
+    FFR_DATA_PATH,
+    SOFTPLUS_SPREAD_SERIES_STATIC_PATH,
+    SOFTPLUS_TUNING_CSV_PATH,
+    TQQQ_DATA_PATH,
+    TQQQ_WALKFORWARD_FIXED_AB_PATH,
+    TQQQ_WALKFORWARD_FIXED_AB_SUMMARY_PATH,
+    TQQQ_WALKFORWARD_FIXED_B_PATH,
+    TQQQ_WALKFORWARD_FIXED_B_SUMMARY_PATH,
+    TQQQ_WALKFORWARD_PATH,
+    TQQQ_WALKFORWARD_SUMMARY_PATH,
+)
+from qbt.tqqq.data_loader import load_expense_ratio_data, load_ffr_data
+from qbt.utils import get_logger
+from qbt.utils.cli_helpers import cli_exception_handler
+from qbt.utils.data_loader import load_stock_data
+
+logger = get_logger(__name__)
+
+# ============================================================================
+# 로컬 상수
+# ============================================================================
+
+# CSV 저장 시 반올림 자릿수
+_TUNING_ROUND = {COL_A: 4, COL_B: 4, COL_RMSE_PCT: 4}
+_WALKFORWARD_ROUND = {
+    COL_A_BEST: 4,
+    COL_B_BEST: 4,
+    COL_TRAIN_RMSE_PCT: 4,
+    COL_TEST_RMSE_PCT: 4,
+    COL_FFR_PCT_TEST: 2,
+    COL_SPREAD_TEST: 4,
+}
+_STATIC_ROUND = {COL_FFR_PCT: 2, COL_A_GLOBAL: 4, COL_B_GLOBAL: 4, COL_SPREAD_GLOBAL: 6}
+_SUMMARY_ROUND = 4
+
+# 튜닝 CSV 인코딩 (기존 파일과 동일하게 BOM 포함, 나머지 CSV는 utf-8)
+_TUNING_ENCODING = "utf-8-sig"
+
+
+def _save_walkforward(result_df: pd.DataFrame, summary: dict[str, float], path: Path, summary_path: Path) -> None:
+    """워크포워드 월별 결과와 요약(metric, value)을 CSV로 저장한다."""
+    result_df.round(_WALKFORWARD_ROUND).to_csv(path, index=False, encoding="utf-8")
+    summary_df = pd.DataFrame({"metric": list(summary), "value": [round(v, _SUMMARY_ROUND) for v in summary.values()]})
+    summary_df.to_csv(summary_path, index=False, encoding="utf-8")
+    logger.debug(f"워크포워드 저장 완료: {path} (stitched RMSE: {summary['stitched_rmse']:.4f}%)")
+
+
+def _parse_args() -> argparse.Namespace:
+    """명령행 인자를 파싱한다.
+
+    Returns:
+        파싱된 인자 Namespace
+    """
+    parser = argparse.ArgumentParser(description="Softplus 스프레드 (a, b) 캘리브레이션 스크립트")
+    parser.add_argument(
+        "--no-local-refine",
+        action="store_true",
+        help="워크포워드의 모든 월을 2단계 그리드로 독립 탐색 (월 단위 프로세스 병렬)",
+    )
+    return parser.parse_args()
+
+
+@cli_exception_handler
+def main() -> int:
+    """
+    메인 실행 함수.
+
+    Returns:
+        종료 코드 (0: 성공, 1: 실패)
+    """
+    args = _parse_args()
+    local_refine = not args.no_local_refine
+    max_workers = max(1, (os.cpu_count() or 1) - 1)
+
+    # 1. 데이터 로드 및 배열 준비 (1회)
+    data = prepare_calibration_data(
+        load_stock_data(QQQ_DATA_PATH),
+        load_stock_data(TQQQ_DATA_PATH),
+        load_ffr_data(FFR_DATA_PATH),
+        load_expense_ratio_data(EXPENSE_RATIO_DATA_PATH),
+    )
+    logger.debug(f"캘리브레이션 기간: {data.months[0]} ~ {data.months[-1]} ({len(data.months)}개월)")
+    SOFTPLUS_TUNING_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    # 2. 전체기간 2단계 그리드 튜닝
+    tuning_df = search_softplus_two_stage(data)
+    tuning_df.round(_TUNING_ROUND).to_csv(SOFTPLUS_TUNING_CSV_PATH, index=False, encoding=_TUNING_ENCODING)
+    best = tuning_df.iloc[0]
+    logger.debug(
+        f"튜닝 완료: a={best[COL_A]:.2f}, b={best[COL_B]:.2f}, RMSE={best[COL_RMSE_PCT]:.4f}% "
+        f"({len(tuning_df)}개 후보) → {SOFTPLUS_TUNING_CSV_PATH}"
+    )
+
+    # 3. 정적 spread 시계열 (튜닝 최적 (a, b))
+    static_df = build_static_spread_series(data, float(best[COL_A]), float(best[COL_B]))
+    static_df.round(_STATIC_ROUND).to_csv(SOFTPLUS_SPREAD_SERIES_STATIC_PATH, index=False, encoding="utf-8")
+    logger.debug(f"정적 spread 시계열 저장 완료: {len(static_df)}개월 → {SOFTPLUS_SPREAD_SERIES_STATIC_PATH}")
+
+    # 4. 워크포워드 (동적 / b 고정 / 완전 고정)
+    result_df, summary = run_softplus_walkforward(data, local_refine=local_refine, max_workers=max_workers)
+    _save_walkforward(result_df, summary, TQQQ_WALKFORWARD_PATH, TQQQ_WALKFORWARD_SUMMARY_PATH)
+
+    result_df, summary = run_softplus_walkforward(
+        data, fixed_b=DEFAULT_SOFTPLUS_B, local_refine=local_refine, max_workers=max_workers
+    )
+    _save_walkforward(result_df, summary, TQQQ_WALKFORWARD_FIXED_B_PATH, TQQQ_WALKFORWARD_FIXED_B_SUMMARY_PATH)
+
+    result_df, summary = run_softplus_walkforward(data, fixed_ab=(DEFAULT_SOFTPLUS_A, DEFAULT_SOFTPLUS_B))
+    _save_walkforward(result_df, summary, TQQQ_WALKFORWARD_FIXED_AB_PATH, TQQQ_WALKFORWARD_FIXED_AB_SUMMARY_PATH)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
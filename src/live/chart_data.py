@@ -9,19 +9,27 @@
 원칙:
 
 - 데이터 소스: ``{state_dir}/data/stock/{TICKER}.csv``
-- MA / 밴드는 QBT 의 :func:`add_single_moving_average` 재사용 (SSoT)
+- MA / 밴드는 QBT 의 이동평균 피처 저장소(:func:`with_moving_averages`) 재사용 (SSoT)
 - 이동평균 워밍업 구간(``slot.ma_window - 1`` 개 인덱스) 은 ``None``
 - 마커는 ISO 8601 날짜 문자열 (``list[str]``). 연도 슬라이스 분할에 독립적.
+- 바뀐 슬라이스만 게시: :func:`build_changed_chart_slices` /
+  :func:`build_changed_equity_slices` 는 연도 슬라이스마다 내용 해시를 계산하여
+  이전 게시 해시(``chart_hashes.json``) 와 다른 슬라이스만 빌드한다.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+from collections.abc import Collection
+from dataclasses import asdict
 from datetime import date
 from pathlib import Path
 from typing import Any, Final, Literal
 
+import pandas as pd
+
 from live.constants import (
     HISTORY_SUMMARY_FILENAME,
     extract_ticker_from_path,
@@ -30,8 +38,8 @@ from live.constants import (
 )
 from live.data_fetcher import load_csv
 from live.models import ChartMeta, ChartSeries, EquityChartMeta, EquityChartSeries, UserTrade
-from qbt.backtest.analysis import add_single_moving_average
 from qbt.backtest.constants import ROUND_CAPITAL, ROUND_PRICE
+from qbt.backtest.feature_store import with_moving_averages
 from qbt.backtest.portfolio_types import AssetSlotConfig
 from qbt.common_constants import COL_CLOSE, COL_DATE
 
@@ -39,10 +47,8 @@ __all__ = [
     "build_chart_meta",
     "build_chart_year_slice",
     "build_chart_year_slices",
-    "build_chart_meta_and_year_slices",
-    "build_equity_meta",
-    "build_equity_year_slice",
-    "build_equity_year_slices",
+    "build_changed_chart_slices",
+    "build_changed_equity_slices",
 ]
 
 
@@ -52,6 +58,9 @@ __all__ = [
 SOURCE_KIND_SIGNAL_HISTORY: Final[Literal["signal_history"]] = "signal_history"
 SOURCE_KIND_USER_TRADES: Final[Literal["user_trades"]] = "user_trades"
 
+# 슬라이스 해시 입력 형식 / 빌드 규칙이 바뀌면 올려서 기존 chart_hashes.json 을 전부 무효화한다.
+CHART_HASH_VERSION: Final[int] = 1
+
 
 # ============================================================================
 # 내부 헬퍼
@@ -76,18 +85,20 @@ def _to_optional_float_list(values: list[Any], decimals: int = ROUND_PRICE) -> l
     return out
 
 
-def _load_slot_frame(state_dir: Path, slot: AssetSlotConfig) -> tuple[list[date], list[float], list[float | None]]:
-    """자산 CSV 를 로드하여 (dates, close, ma_value) 를 반환한다.
+def _load_slot_csv(state_dir: Path, slot: AssetSlotConfig) -> pd.DataFrame:
+    """차트 대상 자산 CSV 를 로드한다."""
+    return load_csv(live_csv_path(state_dir, _ticker_for_chart(slot)))
+
+
+def _slot_series(df: pd.DataFrame, slot: AssetSlotConfig) -> tuple[list[date], list[float], list[float | None]]:
+    """로드된 자산 frame 에서 (dates, close, ma_value) 를 계산한다.
 
     close 는 CSV 의 원본 값이므로 항상 값을 가진다 (`list[float]`).
-    MA 는 QBT 의 ``add_single_moving_average`` 로 계산되며, 워밍업 구간
+    MA 는 QBT 의 ``with_moving_averages`` 로 계산되며, 워밍업 구간
     (``ma_window - 1`` 개) 은 ``None`` 으로 마스킹된다.
     """
     ticker = _ticker_for_chart(slot)
-    csv_path = live_csv_path(state_dir, ticker)
-    df = load_csv(csv_path)
-
-    df = add_single_moving_average(df, window=slot.ma_window, ma_type=slot.ma_type)
+    df = with_moving_averages(df, [slot.ma_window], ma_type=slot.ma_type, name=ticker)
     ma_col = f"ma_{slot.ma_window}"
 
     dates: list[date] = list(df[COL_DATE].tolist())
@@ -100,6 +111,11 @@ def _load_slot_frame(state_dir: Path, slot: AssetSlotConfig) -> tuple[list[date]
     return dates, close_list, ma_list
 
 
+def _load_slot_frame(state_dir: Path, slot: AssetSlotConfig) -> tuple[list[date], list[float], list[float | None]]:
+    """자산 CSV 를 로드하여 (dates, close, ma_value) 를 반환한다 (:func:`_slot_series` 참고)."""
+    return _slot_series(_load_slot_csv(state_dir, slot), slot)
+
+
 def _compute_bands(
     ma_list: list[float | None],
     buy_buffer_pct: float,
@@ -179,28 +195,14 @@ def _filter_markers_in_range(
     return out
 
 
-def _build_slice(
-    slot: AssetSlotConfig,
-    dates: list[date],
-    close_list: list[float],
-    ma_list: list[float | None],
+def _slice_markers(
     *,
     start: date,
     end: date,
     asset_user_trades: list[UserTrade],
     asset_signal_history: list[tuple[str, str]],
-) -> ChartSeries:
-    """[start, end] 구간 슬라이스를 ChartSeries 로 빌드.
-
-    마커 4 종은 ISO 날짜 문자열 리스트로 저장된다.
-    """
-    lo, hi = _slice_range(dates, start, end)
-
-    sliced_dates = [d.isoformat() for d in dates[lo:hi]]
-    sliced_close = close_list[lo:hi]
-    sliced_ma = ma_list[lo:hi]
-    upper, lower = _compute_bands(sliced_ma, slot.buy_buffer_zone_pct, slot.sell_buffer_zone_pct)
-
+) -> tuple[list[str], list[str], list[str], list[str]]:
+    """[start, end] 구간의 마커 4 종 (buy_signals, sell_signals, user_buys, user_sells)."""
     user_buys = _filter_markers_in_range(
         [t.date for t in asset_user_trades if t.direction == "buy"],
         start=start,
@@ -228,6 +230,38 @@ def _build_slice(
         predicate="sell",
     )
 
+    return buy_signals, sell_signals, user_buys, user_sells
+
+
+def _build_slice(
+    slot: AssetSlotConfig,
+    dates: list[date],
+    close_list: list[float],
+    ma_list: list[float | None],
+    *,
+    start: date,
+    end: date,
+    asset_user_trades: list[UserTrade],
+    asset_signal_history: list[tuple[str, str]],
+) -> ChartSeries:
+    """[start, end] 구간 슬라이스를 ChartSeries 로 빌드.
+
+    마커 4 종은 ISO 날짜 문자열 리스트로 저장된다.
+    """
+    lo, hi = _slice_range(dates, start, end)
+
+    sliced_dates = [d.isoformat() for d in dates[lo:hi]]
+    sliced_close = close_list[lo:hi]
+    sliced_ma = ma_list[lo:hi]
+    upper, lower = _compute_bands(sliced_ma, slot.buy_buffer_zone_pct, slot.sell_buffer_zone_pct)
+
+    buy_signals, sell_signals, user_buys, user_sells = _slice_markers(
+        start=start,
+        end=end,
+        asset_user_trades=asset_user_trades,
+        asset_signal_history=asset_signal_history,
+    )
+
     return ChartSeries(
         dates=sliced_dates,
         close=sliced_close,
@@ -241,6 +275,75 @@ def _build_slice(
     )
 
 
+def _price_year_hashes(
+    slot: AssetSlotConfig,
+    dates: list[date],
+    raw_closes: list[float],
+    *,
+    asset_user_trades: list[UserTrade],
+    asset_signal_history: list[tuple[str, str]],
+) -> dict[int, str]:
+    """자산의 연도 슬라이스별 입력 해시 ``{year: sha256 hex}`` 를 계산한다.
+
+    이동평균(특히 EMA) 은 첫 행부터의 전체 종가에 의존하므로, 연도 Y 의 해시는
+    슬롯 파라미터 + **Y 말까지의 누적 종가** + Y 구간 마커로 구성한다. 따라서 과거
+    종가가 다시 쓰이면 (스플릿 대응 등) 그 이후 모든 연도가 변경으로 잡히고,
+    당일 행 append 는 현재 연도만 바꾼다. MA 계산 없이 CSV 값만으로 구할 수 있다.
+    """
+    running = hashlib.sha256(
+        f"v{CHART_HASH_VERSION}|{slot.ma_type}|{slot.ma_window}|"
+        f"{slot.buy_buffer_zone_pct!r}|{slot.sell_buffer_zone_pct!r}".encode()
+    )
+    hashes: dict[int, str] = {}
+    lo = 0
+    while lo < len(dates):
+        year = dates[lo].year
+        hi = lo
+        while hi < len(dates) and dates[hi].year == year:
+            hi += 1
+        closes = zip(dates[lo:hi], raw_closes[lo:hi], strict=True)
+        running.update("".join(f"{d.isoformat()},{c!r};" for d, c in closes).encode())
+        markers = _slice_markers(
+            start=date(year, 1, 1),
+            end=date(year, 12, 31),
+            asset_user_trades=asset_user_trades,
+            asset_signal_history=asset_signal_history,
+        )
+        year_hash = running.copy()
+        year_hash.update(json.dumps(markers).encode())
+        hashes[year] = year_hash.hexdigest()
+        lo = hi
+    return hashes
+
+
+def _content_hash(payload: Any) -> str:
+    """JSON 직렬화 가능한 payload 의 sha256 hex (키 정렬)."""
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"v{CHART_HASH_VERSION}|{encoded}".encode()).hexdigest()
+
+
+def _changed_years(
+    target_years: list[int],
+    current: dict[int, str],
+    previous: dict[int, str],
+    *,
+    force: bool,
+) -> list[int]:
+    """해시가 이전과 다른 (또는 force) 대상 연도를 반환한다."""
+    return [year for year in target_years if force or previous.get(year) != current[year]]
+
+
+def _merge_hashes(
+    previous: dict[int, str],
+    published: dict[int, str],
+    existing_years: Collection[int],
+) -> dict[int, str]:
+    """게시 후 기록할 해시. 대상 연도는 새 해시로, 나머지는 이전 값 유지 (데이터에 없는 연도는 제거)."""
+    merged = {year: digest for year, digest in previous.items() if year in existing_years}
+    merged.update(published)
+    return dict(sorted(merged.items()))
+
+
 # ============================================================================
 # 공개 빌더
 # ============================================================================
@@ -331,74 +434,48 @@ def build_chart_year_slice(
     return slice_map
 
 
-def build_chart_meta_and_year_slices(
+def build_chart_year_slices(
     state_dir: Path,
-    years: list[int] | None = None,
+    years: list[int],
     user_trades: dict[str, list[UserTrade]] | None = None,
     signal_history: dict[str, list[tuple[str, str]]] | None = None,
-) -> tuple[dict[str, ChartMeta], dict[int, dict[str, ChartSeries]]]:
-    """``meta_map`` 과 연도 슬라이스를 한 번에 생성한다 (자산 frame 1 회 로드).
+) -> dict[int, dict[str, ChartSeries]]:
+    """**여러 연도** 의 자산별 :class:`ChartSeries` 슬라이스를 일괄 생성한다.
 
-    `build_chart_meta` + `build_chart_year_slices` 를 따로 호출하면 자산 CSV 가
-    각각 1 번씩 총 2 번 로드된다. 본 함수는 자산 frame 을 **자산당 정확히 1 회만**
-    로드하고, meta 와 연도 슬라이스를 동시에 빌드한다. ``run-daily`` /
-    ``reset`` / ``backfill-chart-years`` 의 차트 재생성 단계에서 사용한다.
+    자산별 CSV 로드 + MA 계산을 **자산당 1회** 만 수행하고, 각 연도별로 메모리
+    내에서 슬라이싱한다. ``reset`` / ``backfill-chart-years`` 처럼 N 개 연도를
+    한 번에 재생성할 때 사용한다.
+
+    빈 ``years`` 리스트는 빈 dict 를 반환한다 (no-op). 해당 연도에 거래일이
+    하나도 없는 경우 그 연도 슬라이스는 빈 배열로 채워진다.
 
     Args:
         state_dir: 정본 워크스페이스 디렉토리.
-        years: 슬라이싱할 연도 리스트.
-
-            - ``None`` (기본): meta 를 만든 뒤 자산별 ``meta.years`` 의 합집합을 자동
-              사용. ``reset`` / ``backfill --target=all`` 처럼 "모든 가능 연도"를
-              슬라이스할 때 사용한다 (자산 frame 1 회 로드 보장).
-            - 빈 리스트: meta 만 만들고 슬라이스는 빈 dict 반환.
-            - 명시 리스트: 해당 연도들만 슬라이스 (``run-daily`` 의 단일 연도 등).
+        years: 슬라이싱할 연도 리스트 (정렬 권장).
         user_trades: 자산 ID → 사용자 체결 마커 리스트 (선택).
         signal_history: 자산 ID → ``(date_iso, state)`` 튜플 리스트 (선택).
 
     Returns:
-        ``(meta_map, slices_map)`` 튜플:
-
-        - ``meta_map``: ``{asset_id: ChartMeta}``
-        - ``slices_map``: ``{year: {asset_id: ChartSeries}}``.
+        ``{year: {asset_id: ChartSeries}}``. 입력 ``years`` 의 모든 연도가 키로 포함된다.
     """
     user_trades = user_trades or {}
     signal_history = signal_history or {}
     config = get_live_portfolio_config()
 
+    if not years:
+        return {}
+
     # 자산별 frame 을 1 회만 로드 (CSV + MA 계산)
     asset_frames: dict[str, tuple[AssetSlotConfig, list[date], list[float], list[float | None]]] = {}
     for slot in config.asset_slots:
         dates, close_list, ma_list = _load_slot_frame(state_dir, slot)
         if not dates:
-            raise RuntimeError(f"내부 불변조건 위반: 자산 {slot.asset_id!r} CSV 가 비어 있음 (chart meta+slices 생성 불가)")
+            raise RuntimeError(f"내부 불변조건 위반: 자산 {slot.asset_id!r} CSV 가 비어 있음 (chart year slices 생성 불가)")
         asset_frames[slot.asset_id] = (slot, dates, close_list, ma_list)
 
-    # meta 빌드 (frame 재사용)
-    meta_map: dict[str, ChartMeta] = {}
-    for asset_id, (slot, dates, _close, _ma) in asset_frames.items():
-        first = dates[0]
-        last = dates[-1]
-        years_set: set[int] = {d.year for d in dates}
-        meta_map[asset_id] = ChartMeta(
-            first_date=first.isoformat(),
-            last_date=last.isoformat(),
-            ma_window=slot.ma_window,
-            years=sorted(years_set),
-        )
-
-    # years 가 None 이면 자산별 meta.years 의 합집합을 자동 사용 (reset / backfill 전체 모드)
-    if years is None:
-        union_years: set[int] = set()
-        for meta in meta_map.values():
-            union_years.update(meta.years)
-        target_years = sorted(union_years)
-    else:
-        target_years = years
-
-    # 연도별 슬라이스 빌드 (frame 재사용)
-    slices_map: dict[int, dict[str, ChartSeries]] = {}
-    for year in target_years:
+    # 연도별로 메모리 내 슬라이싱
+    result: dict[int, dict[str, ChartSeries]] = {}
+    for year in years:
         start = date(year, 1, 1)
         end = date(year, 12, 31)
         slice_map: dict[str, ChartSeries] = {}
@@ -413,70 +490,95 @@ def build_chart_meta_and_year_slices(
                 asset_user_trades=user_trades.get(asset_id, []),
                 asset_signal_history=signal_history.get(asset_id, []),
             )
-        slices_map[year] = slice_map
+        result[year] = slice_map
 
-    return meta_map, slices_map
+    return result
 
 
-def build_chart_year_slices(
+def build_changed_chart_slices(
     state_dir: Path,
-    years: list[int],
+    previous_hashes: dict[str, dict[int, str]],
+    *,
+    years: list[int] | None = None,
     user_trades: dict[str, list[UserTrade]] | None = None,
     signal_history: dict[str, list[tuple[str, str]]] | None = None,
-) -> dict[int, dict[str, ChartSeries]]:
-    """**여러 연도** 의 자산별 :class:`ChartSeries` 슬라이스를 일괄 생성한다.
+    force: bool = False,
+) -> tuple[dict[str, ChartMeta], dict[int, dict[str, ChartSeries]], dict[str, dict[int, str]]]:
+    """meta 와 **내용이 바뀐** (자산, 연도) 슬라이스만 생성한다.
 
-    자산별 CSV 로드 + MA 계산을 **자산당 1회** 만 수행하고, 각 연도별로 메모리
-    내에서 슬라이싱한다. ``reset`` / ``backfill-chart-years`` 처럼 N 개 연도를
-    한 번에 재생성할 때 사용한다.
-
-    빈 ``years`` 리스트는 빈 dict 를 반환한다 (no-op). 해당 연도에 거래일이
-    하나도 없는 경우 그 연도 슬라이스는 빈 배열로 채워진다.
+    자산 CSV 를 자산당 1 회 로드하여 연도별 입력 해시(:func:`_price_year_hashes`) 를
+    계산하고, ``previous_hashes`` 와 같은 슬라이스는 MA 계산 / 슬라이싱을 모두
+    건너뛴다. 평상시 run-daily 에서는 현재 연도만 바뀐다.
 
     Args:
         state_dir: 정본 워크스페이스 디렉토리.
-        years: 슬라이싱할 연도 리스트 (정렬 권장).
+        previous_hashes: 마지막 게시 해시 ``{asset_id: {year: hex}}`` (``chart_hashes.json``).
+        years: 비교 대상 연도. ``None`` 이면 자산 CSV 에 존재하는 모든 연도.
+            데이터가 없는 연도는 무시한다.
         user_trades: 자산 ID → 사용자 체결 마커 리스트 (선택).
         signal_history: 자산 ID → ``(date_iso, state)`` 튜플 리스트 (선택).
+        force: True 면 해시와 무관하게 대상 연도를 모두 생성한다 (RTDB 초기화 직후 등).
 
     Returns:
-        ``{year: {asset_id: ChartSeries}}``. 입력 ``years`` 의 모든 연도가 키로 포함된다.
+        ``(meta_map, slices_map, hashes)`` 튜플:
+
+        - ``meta_map``: ``{asset_id: ChartMeta}`` (항상 전체 자산)
+        - ``slices_map``: ``{year: {asset_id: ChartSeries}}`` — 바뀐 슬라이스만 포함
+        - ``hashes``: 게시 후 ``chart_hashes.json`` 에 기록할 ``{asset_id: {year: hex}}``
     """
     user_trades = user_trades or {}
     signal_history = signal_history or {}
     config = get_live_portfolio_config()
 
-    if not years:
-        return {}
+    meta_map: dict[str, ChartMeta] = {}
+    slices_map: dict[int, dict[str, ChartSeries]] = {}
+    hashes: dict[str, dict[int, str]] = {}
 
-    # 자산별 frame 을 1 회만 로드 (CSV + MA 계산)
-    asset_frames: dict[str, tuple[AssetSlotConfig, list[date], list[float], list[float | None]]] = {}
     for slot in config.asset_slots:
-        dates, close_list, ma_list = _load_slot_frame(state_dir, slot)
-        if not dates:
-            raise RuntimeError(f"내부 불변조건 위반: 자산 {slot.asset_id!r} CSV 가 비어 있음 (chart year slices 생성 불가)")
-        asset_frames[slot.asset_id] = (slot, dates, close_list, ma_list)
+        asset_id = slot.asset_id
+        df = _load_slot_csv(state_dir, slot)
+        if df.empty:
+            raise RuntimeError(f"내부 불변조건 위반: 자산 {asset_id!r} CSV 가 비어 있음 (chart 게시 불가)")
+        dates: list[date] = list(df[COL_DATE].tolist())
+        asset_user_trades = user_trades.get(asset_id, [])
+        asset_signal_history = signal_history.get(asset_id, [])
+
+        current = _price_year_hashes(
+            slot,
+            dates,
+            [float(c) for c in df[COL_CLOSE].tolist()],
+            asset_user_trades=asset_user_trades,
+            asset_signal_history=asset_signal_history,
+        )
+        meta_map[asset_id] = ChartMeta(
+            first_date=dates[0].isoformat(),
+            last_date=dates[-1].isoformat(),
+            ma_window=slot.ma_window,
+            years=sorted(current),
+        )
 
-    # 연도별로 메모리 내 슬라이싱
-    result: dict[int, dict[str, ChartSeries]] = {}
-    for year in years:
-        start = date(year, 1, 1)
-        end = date(year, 12, 31)
-        slice_map: dict[str, ChartSeries] = {}
-        for asset_id, (slot, dates, close_list, ma_list) in asset_frames.items():
-            slice_map[asset_id] = _build_slice(
+        target_years = sorted(current) if years is None else [y for y in years if y in current]
+        previous = previous_hashes.get(asset_id, {})
+        changed = _changed_years(target_years, current, previous, force=force)
+        hashes[asset_id] = _merge_hashes(previous, {y: current[y] for y in target_years}, current.keys())
+        if not changed:
+            continue
+
+        # 바뀐 연도가 있을 때만 MA 계산 (frame 재사용)
+        series_dates, close_list, ma_list = _slot_series(df, slot)
+        for year in changed:
+            slices_map.setdefault(year, {})[asset_id] = _build_slice(
                 slot,
-                dates,
+                series_dates,
                 close_list,
                 ma_list,
-                start=start,
-                end=end,
-                asset_user_trades=user_trades.get(asset_id, []),
-                asset_signal_history=signal_history.get(asset_id, []),
+                start=date(year, 1, 1),
+                end=date(year, 12, 31),
+                asset_user_trades=asset_user_trades,
+                asset_signal_history=asset_signal_history,
             )
-        result[year] = slice_map
 
-    return result
+    return meta_map, dict(sorted(slices_map.items())), hashes
 
 
 # ============================================================================
@@ -539,69 +641,42 @@ def _equity_series_from_rows(rows: list[dict[str, Any]]) -> EquityChartSeries:
     )
 
 
-def build_equity_meta(state_dir: Path) -> EquityChartMeta:
-    """`history/summary.jsonl` 전체를 읽어 :class:`EquityChartMeta` 를 생성한다.
-
-    Args:
-        state_dir: 정본 워크스페이스 디렉토리 (``history/`` 하위).
-
-    Returns:
-        :class:`EquityChartMeta` 인스턴스.
-    """
-    rows = _load_summary_rows(state_dir / "history")
-    first = str(rows[0]["date"])
-    last = str(rows[-1]["date"])
-    years = sorted({date.fromisoformat(str(r["date"])).year for r in rows})
-    return EquityChartMeta(
-        first_date=first,
-        last_date=last,
-        years=years,
-    )
-
-
-def build_equity_year_slice(state_dir: Path, year: int) -> EquityChartSeries:
-    """특정 연도 equity 슬라이스를 생성한다 (단일 연도).
-
-    매 호출마다 ``summary.jsonl`` 을 다시 파싱하므로, **여러 연도를 일괄 생성할 때**
-    는 :func:`build_equity_year_slices` 를 사용하라 (1회 파싱). 본 함수는
-    ``run-daily`` 가 현재 연도 1개만 갱신하는 단일 호출 케이스 전용이다.
+def build_changed_equity_slices(
+    state_dir: Path,
+    previous_hashes: dict[int, str],
+    *,
+    years: list[int] | None = None,
+    force: bool = False,
+) -> tuple[EquityChartMeta, dict[int, EquityChartSeries], dict[int, str]]:
+    """equity meta 와 **내용이 바뀐** 연도 슬라이스만 반환한다.
 
-    해당 연도에 summary 로우가 하나도 없으면 모든 배열이 빈 슬라이스가 반환된다.
+    ``summary.jsonl`` 을 1 회 파싱하고, 연도별 슬라이스의 내용 해시가
+    ``previous_hashes`` 와 같은 연도는 결과에서 제외한다.
 
     Args:
         state_dir: 정본 워크스페이스 디렉토리.
-        year: 슬라이스할 연도 (예: 2025).
+        previous_hashes: 마지막 게시 해시 ``{year: hex}`` (``chart_hashes.json``).
+        years: 비교 대상 연도. ``None`` 이면 summary 에 존재하는 모든 연도.
+        force: True 면 해시와 무관하게 대상 연도를 모두 반환한다.
 
     Returns:
-        :class:`EquityChartSeries` 인스턴스.
+        ``(meta, slices, hashes)`` — ``slices`` 는 바뀐 연도만, ``hashes`` 는 게시 후
+        기록할 ``{year: hex}``.
     """
     rows = _load_summary_rows(state_dir / "history")
-    filtered = [r for r in rows if date.fromisoformat(str(r["date"])).year == year]
-    return _equity_series_from_rows(filtered)
-
-
-def build_equity_year_slices(state_dir: Path, years: list[int]) -> dict[int, EquityChartSeries]:
-    """**여러 연도** 의 equity :class:`EquityChartSeries` 슬라이스를 일괄 생성한다.
-
-    ``summary.jsonl`` 을 1 회만 파싱하고, 각 연도별로 메모리 내에서 필터링한다.
-    ``reset`` / ``backfill-chart-years`` 처럼 N 개 연도를 한 번에 재생성할 때
-    사용한다.
-
-    빈 ``years`` 리스트는 빈 dict 를 반환한다 (no-op). 해당 연도에 summary 로우가
-    하나도 없는 경우 그 연도 슬라이스는 빈 배열로 채워진다.
+    rows_by_year: dict[int, list[dict[str, Any]]] = {}
+    for row in rows:
+        rows_by_year.setdefault(date.fromisoformat(str(row["date"])).year, []).append(row)
 
-    Args:
-        state_dir: 정본 워크스페이스 디렉토리.
-        years: 슬라이싱할 연도 리스트.
+    meta = EquityChartMeta(
+        first_date=str(rows[0]["date"]),
+        last_date=str(rows[-1]["date"]),
+        years=sorted(rows_by_year),
+    )
 
-    Returns:
-        ``{year: EquityChartSeries}``. 입력 ``years`` 의 모든 연도가 키로 포함된다.
-    """
-    if not years:
-        return {}
-    rows = _load_summary_rows(state_dir / "history")
-    result: dict[int, EquityChartSeries] = {}
-    for year in years:
-        filtered = [r for r in rows if date.fromisoformat(str(r["date"])).year == year]
-        result[year] = _equity_series_from_rows(filtered)
-    return result
+    target_years = sorted(rows_by_year) if years is None else [y for y in years if y in rows_by_year]
+    series_by_year = {year: _equity_series_from_rows(rows_by_year[year]) for year in target_years}
+    current = {year: _content_hash(asdict(series)) for year, series in series_by_year.items()}
+    changed = _changed_years(target_years, current, previous_hashes, force=force)
+    hashes = _merge_hashes(previous_hashes, current, rows_by_year.keys())
+    return meta, {year: series_by_year[year] for year in changed}, hashes
@@ -10,7 +10,7 @@ argparse subcommand 구조로 실매매 파이프라인의 모든 운영 명령
   (스플릿 대응 및 최초 배포 데이터 초기화)
 - ``drift`` — 현재 drift 지표 출력
 - ``fetch-fills`` — RTDB 의 미처리 fill 목록 조회 출력
-- ``backfill-chart-years`` — 차트 연도 슬라이스 전체 재생성 (스플릿 대응 수동 명령)
+- ``backfill-chart-years`` — 차트 연도 슬라이스 재게시 (스플릿 대응 / RTDB 복구 수동 명령)
 - ``notify-failure`` — 수동 실패 알림 발송 (Actions retry job 등에서 호출)
 
 원칙:
@@ -37,21 +37,20 @@ from dotenv import load_dotenv
 from exchange_calendars import ExchangeCalendar, get_calendar
 
 from live import data_validator, history, notifier, rtdb_gateway, storage_gateway
-from live.chart_data import (
-    build_chart_meta_and_year_slices,
-    build_equity_meta,
-    build_equity_year_slice,
-    build_equity_year_slices,
-)
+from live.chart_data import build_changed_chart_slices, build_changed_equity_slices
 from live.constants import (
     APPLIED_FILL_IDS_MAX_AGE_DAYS,
     DEFAULT_APPLIED_BALANCE_ADJUST_IDS_FILENAME,
     DEFAULT_APPLIED_FILL_IDS_FILENAME,
+    DEFAULT_CHART_HASHES_FILENAME,
+    DEFAULT_DATA_STOCK_SUBDIR,
     DEFAULT_LIVE_STATE_FILENAME,
+    DEFAULT_MA_CACHE_FILENAME,
     DEFAULT_RECENT_FETCH_DAYS,
     FIREBASE_CRED_ENV_KEY,
     FIREBASE_DB_URL,
     KST_TIMEZONE,
+    LIVE_MA_FULL_RECOMPUTE_INTERVAL,
     NYSE_CALENDAR_CODE,
     TELEGRAM_CHAT_ENV_KEY,
     TELEGRAM_TOKEN_ENV_KEY,
@@ -67,12 +66,15 @@ from live.data_fetcher import (
     rebuild_full_csv,
 )
 from live.drift import compute_drift
+from live.incremental_market import build_incremental_bundle, find_bundle_mismatches, ma_cache_from_bundle
 from live.models import (
     ActualFill,
     AssetMarketData,
     BalanceAdjust,
+    ChartHashes,
     DailyResult,
     FillDismiss,
+    MaCache,
     MarketBundle,
     ModelSync,
 )
@@ -82,16 +84,21 @@ from live.state import (
     load_applied_balance_adjust_ids,
     load_applied_fill_dismiss_ids,
     load_applied_fill_ids,
+    load_chart_hashes,
+    load_ma_cache,
     load_state,
     save_applied_balance_adjust_ids,
     save_applied_fill_dismiss_ids,
     save_applied_fill_ids,
+    save_chart_hashes,
+    save_ma_cache,
     save_state,
     save_state_snapshot,
 )
-from qbt.backtest.analysis import add_single_moving_average
+from qbt.backtest.feature_store import with_moving_averages
 from qbt.backtest.portfolio_types import AssetSlotConfig
 from qbt.common_constants import COL_CLOSE, COL_DATE
+from qbt.utils.date_index import align_frames
 from qbt.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -237,6 +244,15 @@ def _safe_notify_failure(rtdb_app: Any | None, message: str) -> None:
         logger.error(f"실패 알림 발송 자체 실패: {exc}")
 
 
+def _load_chart_hashes_or_empty(path: Path) -> ChartHashes:
+    """``chart_hashes.json`` 로드. 손상된 파일은 실행을 막지 않고 빈 원장 (전체 재게시) 으로 대체한다."""
+    try:
+        return load_chart_hashes(path)
+    except ValueError as exc:
+        logger.warning(f"chart_hashes.json 무시 — 전체 차트 재게시: {exc}")
+        return ChartHashes()
+
+
 def _publish_to_rtdb(
     rtdb_app: Any,
     state_dir: Path,
@@ -244,39 +260,41 @@ def _publish_to_rtdb(
     result: DailyResult,
     newly_applied_fill_keys: set[str],
 ) -> None:
-    """RTDB 에 read model + chart_data (meta/years/{현재_연도}) 를 갱신하고
+    """RTDB 에 read model + 차트 (meta + 내용이 바뀐 연도 슬라이스) 를 갱신하고
     신규 fill 을 processed 마킹한다.
     """
     # 1. read model 갱신
     rtdb_gateway.write_read_model(rtdb_app, state, result)
 
-    # 2. 차트 데이터 갱신 — meta + 현재 연도 슬라이스
-    #    (이전 연도 슬라이스는 backfill CLI 가 1 회 생성하고 스플릿 등 이벤트 시
-    #    수동 재생성한다. daily runner 는 건드리지 않는다.)
-    execution_date = date.fromisoformat(result.execution_date)
+    # 2. 차트 데이터 갱신 — meta + 내용 해시가 바뀐 연도 슬라이스만.
+    #    평상시에는 현재 연도만 바뀌고, CSV 재작성 (rebuild-data 등) 이나 과거 날짜
+    #    체결 마커가 생기면 해당 연도 이후 슬라이스가 자동으로 다시 게시된다.
     history_dir = _history_dir(state_dir)
     user_trades = history.load_user_trades(history_dir)
     signal_history = history.load_signal_history(history_dir)
+    hashes_path = state_dir / DEFAULT_CHART_HASHES_FILENAME
+    prev_hashes = _load_chart_hashes_or_empty(hashes_path)
 
-    current_year = execution_date.year
-    # 자산 frame 1 회 로드로 meta + 현재 연도 슬라이스 동시 생성 (N+1 회피).
-    meta_map, slices_map = build_chart_meta_and_year_slices(
+    # 자산 frame 1 회 로드로 meta + 변경 슬라이스 동시 생성 (N+1 회피).
+    meta_map, slices_map, price_hashes = build_changed_chart_slices(
         state_dir,
-        years=[current_year],
+        prev_hashes.prices,
         user_trades=user_trades,
         signal_history=signal_history,
     )
+    for year, year_map in slices_map.items():
+        rtdb_gateway.write_chart_year_slice(rtdb_app, year=year, year_map=year_map)
     rtdb_gateway.write_chart_meta(rtdb_app, meta_map)
-    rtdb_gateway.write_chart_year_slice(rtdb_app, year=current_year, year_map=slices_map[current_year])
 
-    # 3-b. equity 차트 갱신 — meta + 현재 연도 슬라이스 (/charts/equity/)
+    # 3-b. equity 차트 갱신 — meta + 바뀐 연도 슬라이스 (/charts/equity/)
     #      데이터 소스는 GCS 정본 history/summary.jsonl. run-daily 는 이 시점에
     #      _persist_history 를 통해 당일 1 줄을 이미 append 했으므로 파일이 최소
-    #      1 줄 이상 보장된다. 과거 연도 슬라이스는 backfill CLI 로만 재생성.
-    equity_meta = build_equity_meta(state_dir)
+    #      1 줄 이상 보장된다.
+    equity_meta, equity_slices, equity_hashes = build_changed_equity_slices(state_dir, prev_hashes.equity)
+    for year, series in equity_slices.items():
+        rtdb_gateway.write_equity_year_slice(rtdb_app, year=year, series=series)
     rtdb_gateway.write_equity_meta(rtdb_app, equity_meta)
-    equity_year = build_equity_year_slice(state_dir, year=current_year)
-    rtdb_gateway.write_equity_year_slice(rtdb_app, year=current_year, series=equity_year)
+    logger.debug(f"차트 게시: 주가 연도 {sorted(slices_map)} / equity 연도 {sorted(equity_slices)} (내용이 바뀐 슬라이스만)")
 
     # 3-c. /history/signals/ 미러 — 당일 4 자산 전체 덮어쓰기 (idempotent).
     #      fills / balance_adjusts 미러는 cli 본문(run-daily)에서 신규 키만 선별해
@@ -287,6 +305,9 @@ def _publish_to_rtdb(
     if newly_applied_fill_keys:
         rtdb_gateway.mark_fills_processed(rtdb_app, list(newly_applied_fill_keys))
 
+    # 5. 게시 해시 기록 — RTDB 쓰기가 모두 성공한 뒤에만 갱신한다 (실패 시 다음 실행이 재게시)
+    save_chart_hashes(ChartHashes(prices=price_hashes, equity=equity_hashes), hashes_path)
+
 
 def _send_daily_notifications(rtdb_app: Any | None, result: DailyResult) -> None:
     """FCM + 텔레그램 동시 발송. 만료 토큰은 RTDB 에서 정리."""
@@ -326,11 +347,12 @@ def _cmd_reset(args: argparse.Namespace) -> int:
     1. 사전 검증 — Firebase 초기화 가능 여부 확인. 실패 시 정본 / RTDB 미수정.
     2. GCS 정본 다운로드 (state workspace 컨텍스트 진입)
     3. ``live_state.json`` 초기값 저장
-    4. ``applied_*_ids.json`` 3 개 파일 삭제
+    4. ``applied_*_ids.json`` 3 개 파일 삭제 + ``ma_cache.json`` 비우기
     5. ``history/`` 디렉토리 삭제 (summary / user_trades / signals / balance_adjusts 포함)
     6. CSV 전체 재다운로드 (``period="max"``)
     7. RTDB 전체 삭제 (``device_tokens`` 제외)
     8. RTDB 주가 차트 재생성 — meta / 연도별 슬라이스. 체결/시그널 마커는 빈 리스트.
+       ``chart_hashes.json`` 도 새로 기록한다.
     9. GCS 정본 업로드 (state workspace 컨텍스트 종료 시 변경분 자동 동기화)
 
     equity 차트 / ``/history/*`` 는 summary.jsonl 이 없어 이 시점에 생성 불가.
@@ -360,6 +382,8 @@ def _cmd_reset(args: argparse.Namespace) -> int:
             p = state_dir / filename
             if p.exists():
                 p.unlink()
+        # CSV 재다운로드로 MA 캐시 기준이 바뀌므로 빈 캐시로 덮어쓴다 (다음 run-daily 가 전체 재계산)
+        save_ma_cache(MaCache(entries={}), state_dir / DEFAULT_MA_CACHE_FILENAME)
 
         # 5. history/ 삭제
         hist_dir = _history_dir(state_dir)
@@ -378,16 +402,19 @@ def _cmd_reset(args: argparse.Namespace) -> int:
 
         # 8. RTDB 주가 차트 재생성 — 체결/시그널 마커는 빈 리스트.
         #    summary.jsonl 이 없어 equity 차트는 생성하지 않는다 (run-daily 가 누적).
-        #    years=None 으로 호출 → 자산 frame 1 회 로드로 meta + 전체 연도 슬라이스 동시 생성.
-        meta_map, slices_map = build_chart_meta_and_year_slices(
+        #    RTDB 를 비웠으므로 force=True 로 전체 연도 슬라이스를 생성하고 (자산 frame 1 회
+        #    로드), 게시 해시를 새로 기록한다 (이전 equity 해시도 함께 비워짐).
+        meta_map, slices_map, price_hashes = build_changed_chart_slices(
             state_dir,
-            years=None,
+            {},
             user_trades={},
             signal_history={},
+            force=True,
         )
         rtdb_gateway.write_chart_meta(rtdb_app, meta_map)
         for year in sorted(slices_map.keys()):
             rtdb_gateway.write_chart_year_slice(rtdb_app, year=year, year_map=slices_map[year])
+        save_chart_hashes(ChartHashes(prices=price_hashes), state_dir / DEFAULT_CHART_HASHES_FILENAME)
 
     logger.debug(f"reset 완료: capital={capital:,.0f}")
     return 0
@@ -454,39 +481,24 @@ def _cmd_run_daily(args: argparse.Namespace) -> int:
 
         # 주가 CSV append (data_fetcher)
         try:
-            _refresh_live_csvs(state_dir, trade_date)
+            frames = _refresh_live_csvs(state_dir, trade_date)
         except ValueError as exc:
             raise RuntimeError(f"데이터 검증 실패: {exc}") from exc
 
-        # market_bundle 준비
+        # market_bundle 준비 (증분 모드 우선, 주기적으로 전체 재계산)
+        ma_cache_path = state_dir / DEFAULT_MA_CACHE_FILENAME
         try:
-            bundle = _build_market_bundle(state_dir)
+            bundle, next_ma_cache = _prepare_market_bundle(state_dir, frames, ma_cache_path, trade_date)
         except (FileNotFoundError, ValueError) as exc:
             raise RuntimeError(f"market_bundle 준비 실패: {exc}") from exc
 
-        # RTDB fills 가져오기
-        try:
-            pending_fills: list[ActualFill] = rtdb_gateway.fetch_unprocessed_fills(rtdb_app)
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(f"RTDB fills 읽기 실패: {exc}") from exc
-
-        # RTDB balance_adjusts 가져오기
-        try:
-            pending_adjusts: list[BalanceAdjust] = rtdb_gateway.fetch_pending_balance_adjusts(rtdb_app)
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(f"RTDB balance_adjusts 읽기 실패: {exc}") from exc
-
-        # RTDB fill_dismisses 가져오기
-        try:
-            pending_dismisses: list[FillDismiss] = rtdb_gateway.fetch_pending_fill_dismisses(rtdb_app)
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(f"RTDB fill_dismisses 읽기 실패: {exc}") from exc
-
-        # RTDB model_sync 가져오기 (전체 model=actual 동기화 요청, 멱등)
-        try:
-            pending_model_syncs: list[ModelSync] = rtdb_gateway.fetch_unprocessed_model_syncs(rtdb_app)
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(f"RTDB model_syncs 읽기 실패: {exc}") from exc
+        # RTDB inbox 4 종 (fills / balance_adjusts / fill_dismisses / model_syncs) 을 동시에 읽는다.
+        # model_sync 는 전체 model=actual 동기화 요청 (멱등). 실패 시 RuntimeError 로 중단.
+        inboxes = rtdb_gateway.fetch_pending_inboxes(rtdb_app)
+        pending_fills: list[ActualFill] = inboxes.fills
+        pending_adjusts: list[BalanceAdjust] = inboxes.balance_adjusts
+        pending_dismisses: list[FillDismiss] = inboxes.fill_dismisses
+        pending_model_syncs: list[ModelSync] = inboxes.model_syncs
 
         # applied_balance_adjust_ids 원장 로드 (run_daily 에 전달)
         adjust_path = state_dir / DEFAULT_APPLIED_BALANCE_ADJUST_IDS_FILENAME
@@ -544,6 +556,9 @@ def _cmd_run_daily(args: argparse.Namespace) -> int:
         cleaned_dismiss_ids = cleanup_old_applied_ids(applied_dismiss_ids, max_age_days=APPLIED_FILL_IDS_MAX_AGE_DAYS)
         save_applied_fill_dismiss_ids(cleaned_dismiss_ids, dismiss_path)
 
+        # 증분 모드 MA 캐시 저장 (run_daily 성공 후에만 갱신)
+        save_ma_cache(next_ma_cache, ma_cache_path)
+
         # 새로 반영된 fill 을 user_trades.jsonl 에 append + RTDB /history/fills/ 미러.
         # run_daily 전후의 applied_fill_ids 차분으로 신규 fill 을 식별한다 (차트 마커용).
         prev_applied_set = set(applied_ids.keys())
@@ -729,19 +744,24 @@ def _validate_against_csv(
             raise ValueError(f"{ticker}: {errors[0]}")
 
 
-def _refresh_live_csvs(state_dir: Path, trade_date: date) -> None:
+def _refresh_live_csvs(state_dir: Path, trade_date: date) -> dict[str, pd.DataFrame]:
     """각 자산 티커에 대해 최근 OHLC 를 가져와 검증 후 CSV 에 append.
 
     검증 실패 시 ``ValueError`` 를 전파하여 상위 ``_cmd_run_daily`` 가
     ``RuntimeError("데이터 검증 실패: ...")`` 로 래핑한 뒤 알림을 발송한다.
 
     validate_date_gap 을 위한 NYSE 달력은 모든 티커가 공유한다 (싱글톤).
+
+    Returns:
+        ``{티커: append 후 CSV 전체 DataFrame}``. CSV 가 없고 당일 행도 없는 티커는 제외.
+        증분 market_bundle 구성에 사용한다.
     """
     # NYSE 달력 싱글톤 로드 (validate_date_gap 용). 테스트는 monkeypatch 로
     # _get_nyse_calendar 를 가짜로 교체하여 네트워크 없이 검증할 수 있다.
     # 로드 실패 시 RuntimeError 가 호출자로 전파되어 상위 알림 훅에 도달한다.
     calendar = _get_nyse_calendar()
 
+    frames: dict[str, pd.DataFrame] = {}
     for ticker in _collect_all_tickers():
         recent = fetch_recent_ohlc(ticker, days=DEFAULT_RECENT_FETCH_DAYS)
         csv_path = live_csv_path(state_dir, ticker)
@@ -759,16 +779,62 @@ def _refresh_live_csvs(state_dir: Path, trade_date: date) -> None:
         today_row = recent[recent[COL_DATE] == trade_date]
         if today_row.empty:
             logger.debug(f"{ticker}: {trade_date} 데이터 없음 (휴장일?) — skip")
+            if csv_df is not None:
+                frames[ticker] = csv_df
             continue
         # 이미 위에서 로드한 csv_df 를 전달하여 append_today_to_csv 내부의 재로드를 피한다.
-        append_today_to_csv(csv_path, today_row.head(1), existing_df=csv_df)
+        frames[ticker] = append_today_to_csv(csv_path, today_row.head(1), existing_df=csv_df)
+
+    return frames
+
+
+def _prepare_market_bundle(
+    state_dir: Path,
+    frames: dict[str, pd.DataFrame],
+    ma_cache_path: Path,
+    trade_date: date,
+) -> tuple[MarketBundle, MaCache]:
+    """run_daily 에 전달할 market_bundle 과 다음 실행용 MA 캐시를 준비한다.
+
+    기본은 증분 모드다 (:func:`live.incremental_market.build_incremental_bundle`):
+    직전 EMA 값에 새 종가를 접어 마지막 2 행만으로 bundle 을 만든다. 다음 경우에는
+    CSV 전체 재로드 + MA 재계산(``_build_market_bundle``) 으로 bundle 을 만들고 캐시를
+    다시 만든다.
+
+    - 캐시가 없거나 손상 / 조건 불일치로 증분 bundle 을 만들 수 없을 때
+    - 증분 실행이 ``LIVE_MA_FULL_RECOMPUTE_INTERVAL`` 회 연속되었을 때 (정합성 검사).
+      이때 증분 bundle 과 전체 bundle 의 마지막 2 행이 다르면 경고 로그를 남긴다.
+
+    Raises:
+        FileNotFoundError: 전체 경로에서 CSV 가 없을 때.
+        ValueError: 전체 경로에서 공통 거래 기간 계산이 실패할 때.
+    """
+    slots = get_live_portfolio_config().asset_slots
+
+    try:
+        ma_cache = load_ma_cache(ma_cache_path)
+    except ValueError as exc:
+        # 캐시는 CSV 에서 언제든 재생성 가능한 파생 데이터이므로 전체 경로로 진행한다
+        logger.warning(f"ma_cache.json 무시 (전체 재계산): {exc}")
+        ma_cache = MaCache(entries={})
+
+    incremental = build_incremental_bundle(slots, frames, ma_cache, trade_date)
+    if incremental is not None and ma_cache.runs_since_full < LIVE_MA_FULL_RECOMPUTE_INTERVAL:
+        return incremental
+
+    bundle = _build_market_bundle(state_dir)
+    if incremental is not None:
+        mismatches = find_bundle_mismatches(slots, incremental[0], bundle)
+        if mismatches:
+            logger.warning(f"증분 market_bundle 정합성 검사 불일치 (전체 재계산 결과 사용): {mismatches}")
+    return bundle, ma_cache_from_bundle(slots, bundle)
 
 
 def _build_market_bundle(state_dir: Path) -> MarketBundle:
     """자산별 시그널/체결 DataFrame 을 로드하고, 전 자산 공통 기간으로 정렬한다.
 
-    QBT 포트폴리오 엔진의 ``_load_portfolio_data_with_common_period`` 와 동일한
-    패턴으로, 모든 자산의 trade_df 날짜 교집합을 계산한 뒤 signal_df / trade_df 를
+    QBT 포트폴리오 엔진의 ``_load_portfolio_data_with_common_period`` 와 동일하게
+    ``align_frames`` 로 모든 자산의 trade_df 공통 거래일을 계산한 뒤 signal_df / trade_df 를
     공통 기간으로 필터링한다. 이를 통해 ``_validate_trade_date_alignment`` 에서
     요구하는 날짜 집합 동일성 불변조건을 보장한다.
     """
@@ -782,30 +848,23 @@ def _build_market_bundle(state_dir: Path) -> MarketBundle:
 
         signal_df = load_csv(live_csv_path(state_dir, signal_ticker))
         if signal_ticker == trade_ticker:
-            trade_df = signal_df.copy()
+            # 아래 공통 기간 필터링(불리언 마스크)이 새 DataFrame을 만들므로 복사 없이 공유한다
+            trade_df = signal_df
         else:
             trade_df = load_csv(live_csv_path(state_dir, trade_ticker))
 
-        signal_df = add_single_moving_average(signal_df, window=slot.ma_window, ma_type=slot.ma_type)
+        signal_df = with_moving_averages(signal_df, [slot.ma_window], ma_type=slot.ma_type, name=signal_ticker)
         raw_bundle[slot.asset_id] = AssetMarketData(signal_df=signal_df, trade_df=trade_df)
 
-    # 2. 전 자산 trade_df 날짜 교집합 계산
-    date_sets = [set(data.trade_df[COL_DATE]) for data in raw_bundle.values()]
-    common_dates: set[date] = date_sets[0]
-    for ds in date_sets[1:]:
-        common_dates &= ds
-
-    if not common_dates:
-        raise ValueError("전 자산의 공통 거래 기간이 없습니다.")
+    # 2. 전 자산 trade_df 공통 기간 (int64 날짜 키 정렬 병합)
+    panel = align_frames({asset_id: data.trade_df for asset_id, data in raw_bundle.items()})
 
-    # 3. 공통 기간으로 필터링
+    # 3. 공통 기간으로 필터링 (행 위치로 일괄 추출)
     bundle: MarketBundle = {}
     for asset_id, data in raw_bundle.items():
-        signal_mask = data.signal_df[COL_DATE].isin(common_dates)
-        trade_mask = data.trade_df[COL_DATE].isin(common_dates)
         bundle[asset_id] = AssetMarketData(
-            signal_df=data.signal_df[signal_mask].reset_index(drop=True),
-            trade_df=data.trade_df[trade_mask].reset_index(drop=True),
+            signal_df=panel.reindex(data.signal_df),
+            trade_df=panel.take(asset_id, data.trade_df),
         )
 
     return bundle
@@ -870,6 +929,8 @@ def _cmd_rebuild_data(args: argparse.Namespace) -> int:
     # 초기화가 필요하다.
     _require_rtdb_app()
 
+    # 재다운로드한 CSV 는 과거 종가(배당 조정 등)가 바뀔 수 있으므로 MA 캐시를 빈 캐시로 덮어쓴다.
+    # 다음 run-daily 가 전체 재계산으로 캐시를 다시 만든다.
     ticker_arg: str | None = args.ticker
     if ticker_arg is None:
         with storage_gateway.state_workspace(push_on_success=True) as state_dir:
@@ -877,6 +938,7 @@ def _cmd_rebuild_data(args: argparse.Namespace) -> int:
                 csv_path = live_csv_path(state_dir, ticker)
                 rebuild_full_csv(ticker, csv_path, period="max")
                 logger.debug(f"rebuild-data: {ticker} → {csv_path}")
+            save_ma_cache(MaCache(entries={}), state_dir / DEFAULT_MA_CACHE_FILENAME)
         return 0
 
     ticker = ticker_arg.upper()
@@ -884,6 +946,7 @@ def _cmd_rebuild_data(args: argparse.Namespace) -> int:
         csv_path = live_csv_path(state_dir, ticker)
         rebuild_full_csv(ticker, csv_path, period="max")
         logger.debug(f"rebuild-data: {ticker} → {csv_path}")
+        save_ma_cache(MaCache(entries={}), state_dir / DEFAULT_MA_CACHE_FILENAME)
     return 0
 
 
@@ -899,7 +962,11 @@ def _cmd_drift(args: argparse.Namespace) -> int:
     # 요구하기 때문이다. drift 자체는 RTDB 를 직접 사용하지 않지만 GCS 접근을 위해
     # 초기화가 필요하다.
     _require_rtdb_app()
-    with storage_gateway.state_workspace(push_on_success=False) as state_dir:
+    # drift 는 live_state.json 과 주가 CSV 만 읽는다
+    with storage_gateway.state_workspace(
+        push_on_success=False,
+        prefixes=(DEFAULT_LIVE_STATE_FILENAME, f"{DEFAULT_DATA_STOCK_SUBDIR.as_posix()}/"),
+    ) as state_dir:
         state = load_state(state_dir / DEFAULT_LIVE_STATE_FILENAME)
 
         bundle = _build_market_bundle(state_dir)
@@ -946,24 +1013,25 @@ def _cmd_fetch_fills(args: argparse.Namespace) -> int:
 
 
 def _cmd_backfill_chart_years(args: argparse.Namespace) -> int:
-    """차트 연도 슬라이스를 일괄 재생성한다 (최초 배포 / 스플릿 대응 수동 명령).
+    """차트 연도 슬라이스를 일괄 재게시한다 (최초 배포 / 스플릿 대응 / RTDB 복구 수동 명령).
 
-    daily runner 는 매 실행마다 meta + years/{현재_연도} 만 갱신하므로,
-    (1) 최초 배포 직후 과거 연도 슬라이스가 아예 없는 상태이거나,
-    (2) 스플릿/무상증자 발생으로 과거 연도 슬라이스를 새 조정가 기준으로 다시
-    쓸 필요가 있을 때, 운영자가 이 명령을 수동 실행한다.
+    run-daily 는 ``chart_hashes.json`` 과 내용 해시가 다른 슬라이스만 게시하므로
+    CSV 재작성 (스플릿 대응) 도 다음 실행에서 자동 반영된다. 본 명령은 그 과정을
+    즉시 수행하거나, RTDB 데이터가 해시 원장과 어긋났을 때 (``--force``) 사용한다.
 
     옵션:
 
-    - ``--target prices|equity|all``: 재생성 대상 차트 종류 (기본값 ``all``).
-    - ``--year YYYY``: 단일 연도만 재생성 (기본: 대상 차트의 years 전체).
+    - ``--target prices|equity|all``: 재게시 대상 차트 종류 (기본값 ``all``).
+    - ``--year YYYY``: 단일 연도만 대상 (기본: 대상 차트의 years 전체).
+    - ``--force``: 해시와 무관하게 대상 연도를 모두 다시 쓴다.
     - ``--dry-run``: 실제 RTDB 쓰기 없이 대상 연도만 출력.
 
-    본 명령은 state workspace 를 read-only 로 clone 하여 CSV / summary.jsonl
-    만 사용한다. GCS 업로드는 수행하지 않는다.
+    state workspace 에서 CSV / history / ``chart_hashes.json`` 만 내려받으며,
+    쓰기 성공 시 갱신된 ``chart_hashes.json`` 만 업로드된다.
     """
     target: str = args.target
     year_arg: int | None = args.year
+    force: bool = args.force
     dry_run: bool = args.dry_run
 
     # Firebase Admin SDK 초기화는 state_workspace 진입 전에 수행한다.
@@ -971,67 +1039,77 @@ def _cmd_backfill_chart_years(args: argparse.Namespace) -> int:
     # 요구하기 때문이다.
     rtdb_app = _require_rtdb_app()
 
-    with storage_gateway.state_workspace(push_on_success=False) as state_dir:
+    # 차트 재생성은 주가 CSV 와 history/ (summary / user_trades / signals), 해시 원장만 읽는다
+    with storage_gateway.state_workspace(
+        push_on_success=not dry_run,
+        prefixes=(f"{DEFAULT_DATA_STOCK_SUBDIR.as_posix()}/", "history/", DEFAULT_CHART_HASHES_FILENAME),
+    ) as state_dir:
         history_dir = _history_dir(state_dir)
         user_trades = history.load_user_trades(history_dir)
         signal_history = history.load_signal_history(history_dir)
+        hashes_path = state_dir / DEFAULT_CHART_HASHES_FILENAME
+        prev_hashes = _load_chart_hashes_or_empty(hashes_path)
+        years = [year_arg] if year_arg is not None else None
 
         do_prices = target in ("prices", "all")
         do_equity = target in ("equity", "all")
 
-        # 주가 차트: 자산 frame 1 회 로드로 meta + 전체 연도 슬라이스 동시 빌드.
+        # 주가 차트: 자산 frame 1 회 로드로 meta + 바뀐 연도 슬라이스 동시 빌드.
         prices_meta_map: dict[str, Any] = {}
         prices_slices_map: dict[int, dict[str, Any]] = {}
         prices_years: list[int] = []
+        price_hashes = prev_hashes.prices
         if do_prices:
-            prices_meta_map, prices_slices_map = build_chart_meta_and_year_slices(
+            prices_meta_map, prices_slices_map, price_hashes = build_changed_chart_slices(
                 state_dir,
-                years=None,
+                prev_hashes.prices,
+                years=years,
                 user_trades=user_trades,
                 signal_history=signal_history,
+                force=force,
             )
-            prices_years = sorted(prices_slices_map.keys())
+            prices_years = sorted({y for meta in prices_meta_map.values() for y in meta.years})
 
         equity_meta = None
         equity_slices_map: dict[int, Any] = {}
         equity_years: list[int] = []
+        equity_hashes = prev_hashes.equity
         if do_equity:
-            equity_meta = build_equity_meta(state_dir)
+            equity_meta, equity_slices_map, equity_hashes = build_changed_equity_slices(
+                state_dir,
+                prev_hashes.equity,
+                years=years,
+                force=force,
+            )
             equity_years = sorted(equity_meta.years)
-            equity_slices_map = build_equity_year_slices(state_dir, years=equity_years)
 
-        target_prices_years: list[int]
-        target_equity_years: list[int]
         if year_arg is not None:
             if do_prices and year_arg not in prices_years and not (do_equity and year_arg in equity_years):
                 logger.warning(f"--year={year_arg} 가 주가 / equity years 어디에도 없음. 대상 연도 없음.")
                 return 0
-            target_prices_years = [year_arg] if (do_prices and year_arg in prices_years) else []
-            target_equity_years = [year_arg] if (do_equity and year_arg in equity_years) else []
-        else:
-            target_prices_years = prices_years if do_prices else []
-            target_equity_years = equity_years if do_equity else []
 
         if dry_run:
             sys.stdout.write(
-                f"[dry-run] target={target} | 주가 자산 {sorted(prices_meta_map.keys())} × 연도 {target_prices_years} "
-                f"| equity 연도 {target_equity_years}\n"
+                f"[dry-run] target={target} force={force} | 주가 자산 {sorted(prices_meta_map.keys())} × "
+                f"연도 {sorted(prices_slices_map)} | equity 연도 {sorted(equity_slices_map)}\n"
             )
             return 0
 
-        for year in target_prices_years:
-            rtdb_gateway.write_chart_year_slice(rtdb_app, year=year, year_map=prices_slices_map[year])
-            logger.debug(f"prices/years/{year} 재생성 완료")
+        for year, year_map in prices_slices_map.items():
+            rtdb_gateway.write_chart_year_slice(rtdb_app, year=year, year_map=year_map)
+            logger.debug(f"prices/years/{year} 재게시 완료 (자산 {sorted(year_map)})")
 
         if do_prices:
             rtdb_gateway.write_chart_meta(rtdb_app, prices_meta_map)
 
-        for year in target_equity_years:
-            rtdb_gateway.write_equity_year_slice(rtdb_app, year=year, series=equity_slices_map[year])
-            logger.debug(f"equity/years/{year} 재생성 완료")
+        for year, series in equity_slices_map.items():
+            rtdb_gateway.write_equity_year_slice(rtdb_app, year=year, series=series)
+            logger.debug(f"equity/years/{year} 재게시 완료")
 
         if do_equity and equity_meta is not None:
             rtdb_gateway.write_equity_meta(rtdb_app, equity_meta)
+
+        save_chart_hashes(ChartHashes(prices=price_hashes, equity=equity_hashes), hashes_path)
     return 0
 
 
@@ -1096,7 +1174,7 @@ def _build_parser() -> argparse.ArgumentParser:
     # backfill-chart-years
     p_backfill = sub.add_parser(
         "backfill-chart-years",
-        help="차트 연도 슬라이스 전체 재생성 (최초 배포 / 스플릿 대응 수동 명령)",
+        help="차트 연도 슬라이스 재게시 (최초 배포 / 스플릿 대응 / RTDB 복구 수동 명령)",
     )
     p_backfill.add_argument(
         "--target",
@@ -1110,6 +1188,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="선택. 단일 연도만 재생성 (기본: 대상 차트의 years 전체)",
     )
+    p_backfill.add_argument(
+        "--force",
+        action="store_true",
+        help="해시 원장과 무관하게 대상 연도를 모두 다시 쓴다 (RTDB 복구용)",
+    )
     p_backfill.add_argument(
         "--dry-run",
         action="store_true",
@@ -77,6 +77,12 @@ DEFAULT_APPLIED_FILL_IDS_FILENAME: Final[str] = "applied_fill_ids.json"
 # applied_balance_adjust_ids JSON 파일명 (자산 직접 보정 idempotency 원장).
 DEFAULT_APPLIED_BALANCE_ADJUST_IDS_FILENAME: Final[str] = "applied_balance_adjust_ids.json"
 
+# 증분 run-daily 용 이동평균 캐시 JSON 파일명 (시그널 티커별 마지막 EMA 값).
+DEFAULT_MA_CACHE_FILENAME: Final[str] = "ma_cache.json"
+
+# RTDB 에 게시한 차트 연도 슬라이스의 내용 해시 JSON 파일명 (바뀐 슬라이스만 재게시).
+DEFAULT_CHART_HASHES_FILENAME: Final[str] = "chart_hashes.json"
+
 
 # ============================================================================
 # history 파일 이름 / 하위 디렉토리 (정본 워크스페이스의 history/ 내부)
@@ -137,6 +143,10 @@ TELEGRAM_TIMEOUT_SECONDS: Final[int] = 10
 # ``cli.py`` history 커맨드에서 --tail 의 기본값.
 DEFAULT_HISTORY_TAIL_LINES: Final[int] = 10
 
+# 증분 run-daily 에서 전체 이력 기반 market_bundle 재계산(정합성 검사)을 수행하는 주기 (실행 횟수).
+# 증분 실행이 이 횟수만큼 연속되면 다음 실행은 전체 CSV 로드 + MA 재계산으로 검증한다.
+LIVE_MA_FULL_RECOMPUTE_INTERVAL: Final[int] = 20
+
 
 # ============================================================================
 # 알림 제목
@@ -162,6 +172,10 @@ APPLIED_FILL_IDS_MAX_AGE_DAYS: Final[int] = 90
 # Firebase RTDB 기본 URL (Admin SDK 초기화 시 사용).
 FIREBASE_DB_URL: Final[str] = "https://qbt-live-default-rtdb.asia-southeast1.firebasedatabase.app"
 
+# RTDB multi-path ``update()`` 1 회에 담는 최대 경로 수. backfill 처럼 경로가 많을 때
+# 요청 1 건의 payload 가 과도하게 커지지 않도록 이 단위로 나눠 보낸다.
+RTDB_UPDATE_MAX_PATHS: Final[int] = 500
+
 # exchange_calendars NYSE 달력 코드.
 NYSE_CALENDAR_CODE: Final[str] = "XNYS"
 
@@ -170,6 +184,22 @@ FIREBASE_CRED_ENV_KEY: Final[str] = "GOOGLE_APPLICATION_CREDENTIALS"
 TELEGRAM_TOKEN_ENV_KEY: Final[str] = "TELEGRAM_BOT_TOKEN"
 TELEGRAM_CHAT_ENV_KEY: Final[str] = "TELEGRAM_CHAT_ID"
 
+# 정본 버킷 대신 사용할 로컬 디렉토리 (오프라인 실행 / 테스트용). 설정 시 GCS 에 접근하지 않는다.
+LOCAL_BUCKET_DIR_ENV_KEY: Final[str] = "QBT_LIVE_LOCAL_BUCKET_DIR"
+
+# state_workspace 의 로컬 blob 캐시 디렉토리. 설정 시 generation / md5 가 바뀐 blob 만 download 한다.
+WORKSPACE_CACHE_DIR_ENV_KEY: Final[str] = "QBT_LIVE_WORKSPACE_CACHE_DIR"
+
+# state_workspace 의 동시 download / upload 작업 수.
+GCS_SYNC_MAX_WORKERS: Final[int] = 8
+
+# 어떤 명령도 읽지 않는(쓰기 전용) blob prefix. state_workspace 진입 시 download 하지 않는다.
+# 하루 1 파일씩 늘어나는 일별 상세 로그 / 상태 스냅샷이 해당된다.
+WORKSPACE_WRITE_ONLY_PREFIXES: Final[tuple[str, ...]] = (
+    f"history/{HISTORY_DAILY_SUBDIR}/",
+    f"history/{HISTORY_STATES_SUBDIR}/",
+)
+
 
 # ============================================================================
 # 데이터 검증 임계값
@@ -23,6 +23,7 @@ import copy
 from datetime import date, datetime
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
 from live.balance_adjust import apply_balance_adjusts_idempotent
@@ -59,6 +60,7 @@ from qbt.backtest.portfolio_types import AssetSlotConfig, AssetState
 from qbt.backtest.strategies.buffer_zone import BufferZoneStrategy
 from qbt.backtest.strategies.strategy_common import SignalStrategy
 from qbt.common_constants import COL_CLOSE, COL_DATE, COL_OPEN
+from qbt.utils.date_index import DateIndex, frame_date_keys, key_to_date
 
 __all__ = ["run_daily"]
 
@@ -71,33 +73,37 @@ __all__ = ["run_daily"]
 def _validate_trade_date_alignment(market_bundle: MarketBundle) -> None:
     """모든 자산의 trade_df 날짜 집합이 동일한지 검증한다.
 
+    int64 날짜 키 배열로 비교한다. 정렬된 공통 기간 번들(통상 경로)은 배열 비교 한 번으로 끝나고,
+    배열이 다를 때만 집합 차이를 계산한다 (순서만 다른 경우는 통과).
+
     Raises:
         RuntimeError: 자산 간 trade_df 날짜 집합이 불일치할 때.
     """
-    date_sets: dict[str, set[date]] = {}
-    for asset_id, data in market_bundle.items():
-        date_sets[asset_id] = set(data.trade_df[COL_DATE].tolist())
-
-    reference_id = next(iter(date_sets))
-    reference = date_sets[reference_id]
-    for asset_id, dates in date_sets.items():
-        if dates != reference:
-            diff = reference.symmetric_difference(dates)
+    keys_by_asset = {asset_id: frame_date_keys(data.trade_df) for asset_id, data in market_bundle.items()}
+
+    reference_id = next(iter(keys_by_asset))
+    reference = keys_by_asset[reference_id]
+    for asset_id, keys in keys_by_asset.items():
+        if np.array_equal(keys, reference):
+            continue
+        diff = np.setxor1d(reference, keys)
+        if len(diff) > 0:
             raise RuntimeError(
-                f"내부 불변조건 위반: trade_df 날짜 집합 불일치. " f"{reference_id} vs {asset_id}, 차이={sorted(diff)[:5]}"
+                f"내부 불변조건 위반: trade_df 날짜 집합 불일치. "
+                f"{reference_id} vs {asset_id}, 차이={[key_to_date(int(k)) for k in diff[:5]]}"
             )
 
 
 def _find_trade_index(trade_df: pd.DataFrame, trade_date: date) -> int:
-    """trade_df 에서 주어진 날짜의 행 인덱스를 찾는다.
+    """trade_df 에서 주어진 날짜의 행 위치를 찾는다 (int64 날짜 키 위치 조회).
 
     Raises:
         RuntimeError: 해당 날짜가 trade_df 에 존재하지 않을 때 (내부 불변조건 위반).
     """
-    matches = trade_df.index[trade_df[COL_DATE] == trade_date].tolist()
-    if not matches:
+    position = DateIndex.from_frame(trade_df).get_position(trade_date)
+    if position is None:
         raise RuntimeError(f"내부 불변조건 위반: trade_date {trade_date} 가 trade_df 에 없음")
-    return int(matches[0])
+    return position
 
 
 def _build_slot_dict() -> dict[str, AssetSlotConfig]:
@@ -33,7 +33,7 @@ import yfinance as yf
 from live.constants import DEFAULT_RECENT_FETCH_DAYS
 from qbt.backtest.constants import ROUND_PRICE
 from qbt.common_constants import COL_DATE, PRICE_COLUMNS, REQUIRED_COLUMNS
-from qbt.utils.data_loader import load_stock_data
+from qbt.utils.data_loader import load_stock_data, write_columnar_cache
 
 __all__ = [
     "fetch_recent_ohlc",
@@ -109,7 +109,7 @@ def append_today_to_csv(
     csv_path: Path,
     today_row: pd.DataFrame,
     existing_df: pd.DataFrame | None = None,
-) -> None:
+) -> pd.DataFrame:
     """기존 CSV 에 1 행을 append 한다 (중복 날짜 방지).
 
     규칙:
@@ -128,6 +128,10 @@ def append_today_to_csv(
             CSV 를 로드해 검증에 사용했다면, 그 frame 을 전달하여 디스크 재로드를 피할 수
             있다 (run-daily 의 ``_refresh_live_csvs`` 에서 사용).
 
+    Returns:
+        append 후 CSV 전체 DataFrame (중복 날짜면 기존 DataFrame). run-daily 증분
+        모드가 CSV 재로드 없이 최근 행을 읽는 데 사용한다.
+
     Raises:
         ValueError: ``today_row`` 가 1 행이 아닐 때.
     """
@@ -143,17 +147,20 @@ def append_today_to_csv(
     if not csv_path.exists():
         out = new_row[REQUIRED_COLUMNS].sort_values(COL_DATE).reset_index(drop=True)
         out.to_csv(csv_path, index=False)
-        return
+        write_columnar_cache(csv_path)
+        return out
 
     existing = existing_df if existing_df is not None else load_stock_data(csv_path)
     if new_date in set(existing[COL_DATE]):
         # 중복 날짜 — 기존 값을 덮어쓰지 않고 그대로 유지
-        return
+        return existing
 
     combined = pd.concat([existing, new_row[REQUIRED_COLUMNS]], ignore_index=True)
     combined = combined.sort_values(COL_DATE).reset_index(drop=True)
     combined[PRICE_COLUMNS] = combined[PRICE_COLUMNS].round(ROUND_PRICE)
     combined.to_csv(csv_path, index=False)
+    write_columnar_cache(csv_path)
+    return combined
 
 
 def rebuild_full_csv(ticker: str, csv_path: Path, period: str = "max") -> None:
@@ -180,6 +187,7 @@ def rebuild_full_csv(ticker: str, csv_path: Path, period: str = "max") -> None:
 
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(csv_path, index=False)
+    write_columnar_cache(csv_path)
 
 
 def load_csv(csv_path: Path) -> pd.DataFrame:
@@ -194,6 +202,8 @@ def load_csv(csv_path: Path) -> pd.DataFrame:
 
     Returns:
         전처리된 DataFrame (Date 오름차순, 중복 제거, 필수 컬럼 검증 완료).
+        컬럼 캐시를 사용하면 숫자 컬럼은 읽기 전용 memory-map 이다
+        (``load_stock_data`` 의 읽기 전용 계약 참고). 수정하려면 ``.copy()`` 후 수정한다.
 
     Raises:
         FileNotFoundError: 파일이 존재하지 않을 때.
@@ -0,0 +1,261 @@
+"""증분 market_bundle 구성 (run-daily 전용).
+
+run-daily 는 매일 1 행만 추가되는 CSV 로 당일 시그널을 판정한다. 전체 이력을 다시
+로드하고 EMA 를 첫 행부터 재계산하는 대신, 직전 실행의 EMA 값(``ma_cache.json``)에
+새 종가만 접어 넣어(fold) run_daily 가 읽는 마지막 2 행만으로 market_bundle 을 만든다.
+
+run_daily 가 bundle 에서 읽는 값:
+
+- 당일 행 ``i`` 의 trade_df Open / Close, signal_df Close / MA
+- 전일 행 ``i - 1`` 의 signal_df Close / MA (버퍼존 밴드 초기화) 와 날짜 (월 첫 거래일 판정)
+
+따라서 모든 자산의 마지막 2 행 날짜가 같고 마지막 행이 ``trade_date`` 이면, 공통 기간
+정렬 결과의 마지막 2 행과 동일하다.
+
+EMA 접기는 pandas ``ewm(span=w, adjust=False).mean()`` 의 점화식을 연산 순서까지 그대로
+재현하므로 전체 재계산과 비트 단위로 같다. SMA 는 윈도우 밖 값이 필요하므로 증분 대상이
+아니며, 조건이 하나라도 맞지 않으면 ``None`` 을 반환하여 호출자가 전체 경로로 폴백한다.
+
+주요 함수:
+
+- :func:`fold_ema` — 직전 EMA 값에 종가들을 순서대로 접기
+- :func:`build_incremental_bundle` — 캐시 + 최근 행으로 market_bundle / 새 캐시 생성
+- :func:`ma_cache_from_bundle` — 전체 경로 bundle 에서 캐시 재생성 (runs_since_full=0)
+- :func:`find_bundle_mismatches` — 증분 / 전체 bundle 의 마지막 2 행 비교 (정합성 검사)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from live.constants import extract_ticker_from_path
+from live.models import AssetMarketData, MaCache, MaCacheEntry, MarketBundle
+from qbt.backtest.constants import ma_col_name
+from qbt.backtest.portfolio_types import AssetSlotConfig
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_OPEN
+from qbt.utils.date_index import DateIndex
+from qbt.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "ma_cache_key",
+    "fold_ema",
+    "build_incremental_bundle",
+    "ma_cache_from_bundle",
+    "find_bundle_mismatches",
+]
+
+# 증분 bundle 의 행 수. run_daily 는 당일 행(i)과 전일 행(i - 1)만 읽는다.
+_TAIL_ROWS = 2
+
+
+def ma_cache_key(signal_ticker: str, ma_type: str, ma_window: int) -> str:
+    """ma_cache 엔트리 키 ``"{signal_ticker}:{ma_type}:{ma_window}"`` 를 만든다."""
+    return f"{signal_ticker}:{ma_type}:{ma_window}"
+
+
+def fold_ema(ma_value: float, closes: Iterable[float], window: int) -> list[float]:
+    """직전 EMA 값에 종가를 순서대로 접어 각 시점의 EMA 를 반환한다.
+
+    pandas ``ewm(span=window, adjust=False)`` 와 같은 가중치 / 연산 순서를 사용한다
+    (값이 같으면 갱신하지 않는 분기 포함). 따라서 전체 재계산과 비트 단위로 같다.
+
+    Args:
+        ma_value: 첫 종가 직전 시점의 EMA.
+        closes: 이어지는 종가 (시간 순).
+        window: EMA 기간 (span).
+
+    Returns:
+        closes 와 같은 길이의 EMA 목록.
+
+    Raises:
+        ValueError: ``window`` 가 1 미만일 때.
+    """
+    if window < 1:
+        raise ValueError(f"window 는 1 이상이어야 한다. 입력: {window}")
+
+    com = (window - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+
+    folded: list[float] = []
+    weighted = float(ma_value)
+    for close in closes:
+        cur = float(close)
+        if weighted != cur:
+            weighted = ((old_wt * weighted) + (alpha * cur)) / (old_wt + alpha)
+        folded.append(weighted)
+    return folded
+
+
+# ============================================================================
+# 증분 bundle 구성
+# ============================================================================
+
+
+def _tail_dates(df: pd.DataFrame) -> tuple[date, ...]:
+    return tuple(df[COL_DATE].iloc[-_TAIL_ROWS:])
+
+
+def _fold_tail_ma(signal_df: pd.DataFrame, entry: MaCacheEntry) -> np.ndarray | None:
+    """캐시 엔트리에서 signal_df 마지막 2 행의 MA 를 접어 계산한다 (불가 시 None)."""
+    last_date = date.fromisoformat(entry.last_date)
+    position = DateIndex.from_frame(signal_df).get_position(last_date)
+    n = len(signal_df)
+    if position is None:
+        logger.debug(f"{entry.signal_ticker}: 캐시 기준일 {last_date} 가 CSV 에 없음 — 증분 불가")
+        return None
+    if position > n - _TAIL_ROWS:
+        # 캐시가 당일 행까지 반영한 상태 (같은 날짜 재실행) — 전일 MA 를 알 수 없음
+        logger.debug(f"{entry.signal_ticker}: 캐시 기준일 {last_date} 이후 행이 부족 — 증분 불가")
+        return None
+
+    closes = signal_df[COL_CLOSE].to_numpy(dtype=np.float64)
+    if float(closes[position]) != entry.last_close:
+        # CSV 재작성(스플릿 / 배당 조정 등)으로 과거 종가가 바뀐 경우
+        logger.debug(f"{entry.signal_ticker}: {last_date} 종가가 캐시와 다름 — 증분 불가")
+        return None
+
+    folded = [entry.ma_value, *fold_ema(entry.ma_value, closes[position + 1 :], entry.ma_window)]
+    return np.asarray(folded[-_TAIL_ROWS:], dtype=np.float64)
+
+
+def build_incremental_bundle(
+    slots: Sequence[AssetSlotConfig],
+    frames: Mapping[str, pd.DataFrame],
+    ma_cache: MaCache,
+    trade_date: date,
+) -> tuple[MarketBundle, MaCache] | None:
+    """캐시된 EMA 와 각 CSV 의 마지막 2 행으로 market_bundle 을 만든다.
+
+    다음 조건을 모두 만족할 때만 증분 bundle 을 반환하고, 아니면 ``None`` 을 반환한다.
+
+    - 모든 슬롯이 EMA 이며 (signal 티커, ma_type, ma_window) 캐시 엔트리가 있음
+    - 모든 signal / trade CSV 의 마지막 2 행 날짜가 같고, 마지막 날짜가 ``trade_date``
+    - 캐시 기준일이 CSV 에 있고 그 이후 1 행 이상이 추가되었으며, 그날 종가가 캐시와 같음
+
+    Args:
+        slots: 라이브 포트폴리오 자산 슬롯.
+        frames: ``{티커: CSV 전체 DataFrame}`` (run-daily 가 당일 행을 append 한 결과).
+        ma_cache: 직전 실행의 이동평균 캐시.
+        trade_date: 당일 거래일.
+
+    Returns:
+        ``(market_bundle, 새 캐시)`` 또는 ``None``. bundle 의 각 DataFrame 은 2 행이며
+        새 캐시의 ``runs_since_full`` 은 1 증가한다.
+    """
+    tickers = {
+        extract_ticker_from_path(path) for slot in slots for path in (slot.signal_data_path, slot.trade_data_path)
+    }
+    missing = sorted(ticker for ticker in tickers if ticker not in frames)
+    if missing:
+        logger.debug(f"증분 bundle 불가: CSV 없음 {missing}")
+        return None
+
+    expected_dates = _tail_dates(frames[sorted(tickers)[0]])
+    if len(expected_dates) < _TAIL_ROWS or expected_dates[-1] != trade_date:
+        logger.debug(f"증분 bundle 불가: 마지막 행이 {trade_date} 가 아님")
+        return None
+    if any(_tail_dates(frames[ticker]) != expected_dates for ticker in tickers):
+        logger.debug("증분 bundle 불가: 자산 간 최근 거래일 불일치")
+        return None
+
+    bundle: MarketBundle = {}
+    entries: dict[str, MaCacheEntry] = {}
+    for slot in slots:
+        if slot.ma_type != "ema":
+            logger.debug(f"증분 bundle 불가: {slot.asset_id} ma_type={slot.ma_type}")
+            return None
+
+        signal_ticker = extract_ticker_from_path(slot.signal_data_path)
+        key = ma_cache_key(signal_ticker, slot.ma_type, slot.ma_window)
+        entry = ma_cache.entries.get(key)
+        if entry is None:
+            logger.debug(f"증분 bundle 불가: 캐시 엔트리 없음 ({key})")
+            return None
+
+        signal_full = frames[signal_ticker]
+        tail_ma = _fold_tail_ma(signal_full, entry)
+        if tail_ma is None:
+            return None
+
+        signal_df = signal_full.iloc[-_TAIL_ROWS:].reset_index(drop=True)
+        signal_df[ma_col_name(slot.ma_window)] = tail_ma
+        trade_df = frames[extract_ticker_from_path(slot.trade_data_path)].iloc[-_TAIL_ROWS:].reset_index(drop=True)
+        bundle[slot.asset_id] = AssetMarketData(signal_df=signal_df, trade_df=trade_df)
+
+        entries[key] = MaCacheEntry(
+            signal_ticker=signal_ticker,
+            ma_window=slot.ma_window,
+            ma_type=slot.ma_type,
+            last_date=trade_date.isoformat(),
+            last_close=float(signal_df[COL_CLOSE].iloc[-1]),
+            ma_value=float(tail_ma[-1]),
+        )
+
+    return bundle, MaCache(entries=entries, runs_since_full=ma_cache.runs_since_full + 1)
+
+
+def ma_cache_from_bundle(slots: Sequence[AssetSlotConfig], bundle: MarketBundle) -> MaCache:
+    """전체 경로로 만든 market_bundle 의 마지막 행으로 캐시를 만든다 (runs_since_full=0).
+
+    bundle 의 MA 컬럼은 signal CSV 전체 이력 기준으로 계산된 값이므로 그대로 다음 실행의
+    접기 시작점이 된다. SMA 슬롯은 증분 대상이 아니므로 제외한다.
+
+    Args:
+        slots: 라이브 포트폴리오 자산 슬롯.
+        bundle: ``_build_market_bundle`` 결과 (자산 ID 키).
+
+    Returns:
+        새 MaCache.
+    """
+    entries: dict[str, MaCacheEntry] = {}
+    for slot in slots:
+        if slot.ma_type != "ema":
+            continue
+        signal_ticker = extract_ticker_from_path(slot.signal_data_path)
+        last_row = bundle[slot.asset_id].signal_df.iloc[-1]
+        entries[ma_cache_key(signal_ticker, slot.ma_type, slot.ma_window)] = MaCacheEntry(
+            signal_ticker=signal_ticker,
+            ma_window=slot.ma_window,
+            ma_type=slot.ma_type,
+            last_date=last_row[COL_DATE].isoformat(),
+            last_close=float(last_row[COL_CLOSE]),
+            ma_value=float(last_row[ma_col_name(slot.ma_window)]),
+        )
+    return MaCache(entries=entries, runs_since_full=0)
+
+
+def find_bundle_mismatches(
+    slots: Sequence[AssetSlotConfig], incremental: MarketBundle, full: MarketBundle
+) -> list[str]:
+    """증분 / 전체 bundle 의 마지막 2 행에서 run_daily 가 읽는 값을 비교한다.
+
+    Args:
+        slots: 라이브 포트폴리오 자산 슬롯.
+        incremental: :func:`build_incremental_bundle` 결과.
+        full: ``_build_market_bundle`` 결과.
+
+    Returns:
+        불일치 설명 목록 (일치하면 빈 리스트).
+    """
+    mismatches: list[str] = []
+    for slot in slots:
+        inc_data = incremental[slot.asset_id]
+        full_data = full[slot.asset_id]
+        checks = (
+            ("signal_df", inc_data.signal_df, full_data.signal_df, (COL_DATE, COL_CLOSE, ma_col_name(slot.ma_window))),
+            ("trade_df", inc_data.trade_df, full_data.trade_df, (COL_DATE, COL_OPEN, COL_CLOSE)),
+        )
+        for label, inc_df, full_df, columns in checks:
+            for column in columns:
+                inc_values = inc_df[column].iloc[-_TAIL_ROWS:].tolist()
+                full_values = full_df[column].iloc[-_TAIL_ROWS:].tolist()
+                if inc_values != full_values:
+                    mismatches.append(f"{slot.asset_id}.{label}.{column}: 증분={inc_values} 전체={full_values}")
+    return mismatches
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, TypedDict, get_args
 
 import pandas as pd
@@ -40,6 +40,7 @@ __all__ = [
     "BalanceAdjust",
     "FillDismiss",
     "ModelSync",
+    "PendingInboxes",
     "SignalDetection",
     "ChartMeta",
     "ChartSeries",
@@ -50,6 +51,9 @@ __all__ = [
     "DailyResult",
     "AssetMarketData",
     "MarketBundle",
+    "MaCacheEntry",
+    "MaCache",
+    "ChartHashes",
     "UserTrade",
 ]
 
@@ -313,6 +317,25 @@ class ModelSync:
     input_time_kst: str  # ISO 8601 KST
 
 
+# ============================================================================
+# PendingInboxes — run-daily 가 한 번에 읽는 앱 입력 큐 4 종
+# ============================================================================
+
+
+@dataclass
+class PendingInboxes:
+    """RTDB inbox 4 종에서 ``processed=false`` 인 항목만 모은 스냅샷.
+
+    run-daily 는 네 inbox 를 동시에 읽어 이 컨테이너 하나로 받는다
+    (:func:`live.rtdb_gateway.fetch_pending_inboxes`).
+    """
+
+    fills: list[ActualFill]
+    balance_adjusts: list[BalanceAdjust]
+    fill_dismisses: list[FillDismiss]
+    model_syncs: list[ModelSync]
+
+
 # ============================================================================
 # SignalDetection — 시그널 감지 결과 (알림/차트 재사용)
 # ============================================================================
@@ -512,6 +535,60 @@ class AssetMarketData:
 type MarketBundle = dict[str, AssetMarketData]
 
 
+# ============================================================================
+# MaCache — 증분 run-daily 용 이동평균 캐시 (ma_cache.json)
+# ============================================================================
+
+
+@dataclass
+class MaCacheEntry:
+    """시그널 티커 1 개의 마지막 이동평균 값.
+
+    ``ma_value`` 는 시그널 CSV 전체 이력(첫 행부터) 기준 ``last_date`` 의 MA 이다.
+    ``last_close`` 는 다음 실행에서 CSV 의 같은 날짜 종가와 비교하여
+    CSV 재작성(스플릿 대응 등) 여부를 감지하는 데 사용한다.
+    """
+
+    signal_ticker: str
+    ma_window: int
+    ma_type: Literal["ema", "sma"]
+    last_date: str  # ISO 8601 날짜
+    last_close: float
+    ma_value: float
+
+
+@dataclass
+class MaCache:
+    """``ma_cache.json`` 원장.
+
+    - ``entries``: 키는 ``"{signal_ticker}:{ma_type}:{ma_window}"``
+    - ``runs_since_full``: 마지막 전체 재계산 이후 연속 증분 실행 횟수
+    """
+
+    entries: dict[str, MaCacheEntry]
+    runs_since_full: int = 0
+
+
+# ============================================================================
+# ChartHashes — RTDB 에 게시한 차트 연도 슬라이스 해시 (chart_hashes.json)
+# ============================================================================
+
+
+@dataclass
+class ChartHashes:
+    """``chart_hashes.json`` 원장.
+
+    마지막으로 RTDB 에 쓴 연도 슬라이스마다 내용 해시를 기록한다. 차트 게시 시
+    해시가 같은 슬라이스는 재계산 / 재게시하지 않는다.
+
+    - ``prices``: ``{asset_id: {year: sha256 hex}}`` (``/charts/prices/{asset_id}/years/{YYYY}``)
+    - ``equity``: ``{year: sha256 hex}`` (``/charts/equity/years/{YYYY}``)
+    """
+
+    prices: dict[str, dict[int, str]] = field(default_factory=dict)
+    equity: dict[int, str] = field(default_factory=dict)
+
+
 # ============================================================================
 # UserTrade — 차트 화면의 사용자 체결 마커
 # ============================================================================
@@ -5,6 +5,11 @@ live 도메인이 RTDB 를 드나드는 모든 경로를 한 모듈에 캡슐화
 (의존성 주입). 테스트에서는 mock App 으로 격리하고, 실제 환경에서는
 :func:`initialize_firebase_app` 으로 초기화한다.
 
+여러 경로에 쓰는 함수는 경로마다 ``set`` / ``update`` 를 호출하지 않고 루트
+reference 의 multi-path ``update()`` 한 번으로 묶는다 (:func:`_multi_path_update`).
+multi-path update 의 각 경로는 ``set`` 과 같은 덮어쓰기 의미이며 원자적으로
+반영된다. run-daily 의 inbox 4 종 읽기는 :func:`fetch_pending_inboxes` 가 동시에 수행한다.
+
 지원 경로:
 
 - ``/latest/portfolio``, ``/latest/signals``, ``/latest/pending_orders``
@@ -22,6 +27,8 @@ live 도메인이 RTDB 를 드나드는 모든 경로를 한 모듈에 캡슐화
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -29,6 +36,7 @@ from typing import Any, Literal, cast
 import firebase_admin
 from firebase_admin import credentials, db
 
+from live.constants import RTDB_UPDATE_MAX_PATHS
 from live.models import (
     ActualFill,
     BalanceAdjust,
@@ -40,6 +48,7 @@ from live.models import (
     FillDismiss,
     LiveState,
     ModelSync,
+    PendingInboxes,
     SignalDetection,
 )
 from qbt.backtest.constants import ROUND_RATIO
@@ -62,6 +71,7 @@ __all__ = [
     "mark_fill_dismisses_processed",
     "fetch_unprocessed_model_syncs",
     "mark_model_syncs_processed",
+    "fetch_pending_inboxes",
     "write_read_model",
     "write_chart_meta",
     "write_chart_year_slice",
@@ -112,6 +122,29 @@ def _db_reference(app: FirebaseAppLike, path: str) -> Any:
     return db.reference(path, app=app)
 
 
+def _multi_path_update(app: FirebaseAppLike, updates: dict[str, Any]) -> None:
+    """절대 경로 → 값 매핑을 루트 reference 의 multi-path ``update()`` 로 기록한다.
+
+    각 경로는 ``set`` 과 같은 덮어쓰기 의미다. 경로 수가 :data:`RTDB_UPDATE_MAX_PATHS`
+    를 넘으면 그 단위로 나눠 호출한다. 빈 매핑은 RTDB 호출 없이 즉시 반환 (no-op).
+
+    Args:
+        app: Firebase App 인스턴스.
+        updates: ``{"/history/signals/2026-04-10/sso": {...}, ...}`` 형태의 매핑.
+    """
+    if not updates:
+        return
+    items = [(path.lstrip("/"), value) for path, value in updates.items()]
+    root = _db_reference(app, "/")
+    for start in range(0, len(items), RTDB_UPDATE_MAX_PATHS):
+        root.update(dict(items[start : start + RTDB_UPDATE_MAX_PATHS]))
+
+
+def _mark_processed(app: FirebaseAppLike, inbox_path: str, keys: list[str]) -> None:
+    """inbox 하위 키들의 ``processed`` 필드만 한 번의 multi-path update 로 true 마킹한다."""
+    _multi_path_update(app, {f"{inbox_path}/{key}/processed": True for key in keys})
+
+
 # ============================================================================
 # fills (앱 → daily runner)
 # ============================================================================
@@ -183,11 +216,9 @@ def mark_fills_processed(app: FirebaseAppLike, keys: list[str]) -> None:
 
     Args:
         app: ``firebase_admin.App`` 인스턴스.
-        keys: ``/fills/inbox/`` 하위의 RTDB 키 목록.
+        keys: ``/fills/inbox/`` 하위의 RTDB 키 목록. 빈 리스트면 no-op.
     """
-    for key in keys:
-        ref = _db_reference(app, f"{_FILLS_INBOX_PATH}/{key}")
-        ref.update({"processed": True})
+    _mark_processed(app, _FILLS_INBOX_PATH, keys)
 
 
 # ============================================================================
@@ -258,9 +289,7 @@ def fetch_pending_balance_adjusts(app: FirebaseAppLike) -> list[BalanceAdjust]:
 
 def mark_balance_adjusts_processed(app: FirebaseAppLike, keys: list[str]) -> None:
     """주어진 balance_adjust ID 들을 ``processed=true`` 로 마킹한다."""
-    for key in keys:
-        ref = _db_reference(app, f"{_BALANCE_ADJUST_INBOX_PATH}/{key}")
-        ref.update({"processed": True})
+    _mark_processed(app, _BALANCE_ADJUST_INBOX_PATH, keys)
 
 
 # ============================================================================
@@ -312,9 +341,7 @@ def fetch_pending_fill_dismisses(app: FirebaseAppLike) -> list[FillDismiss]:
 
 def mark_fill_dismisses_processed(app: FirebaseAppLike, keys: list[str]) -> None:
     """주어진 fill_dismiss ID 들을 ``processed=true`` 로 마킹한다."""
-    for key in keys:
-        ref = _db_reference(app, f"{_FILL_DISMISS_INBOX_PATH}/{key}")
-        ref.update({"processed": True})
+    _mark_processed(app, _FILL_DISMISS_INBOX_PATH, keys)
 
 
 # ============================================================================
@@ -364,9 +391,39 @@ def fetch_unprocessed_model_syncs(app: FirebaseAppLike) -> list[ModelSync]:
 
 def mark_model_syncs_processed(app: FirebaseAppLike, keys: list[str]) -> None:
     """주어진 model_sync ID 들을 ``processed=true`` 로 마킹한다."""
-    for key in keys:
-        ref = _db_reference(app, f"{_MODEL_SYNC_INBOX_PATH}/{key}")
-        ref.update({"processed": True})
+    _mark_processed(app, _MODEL_SYNC_INBOX_PATH, keys)
+
+
+def fetch_pending_inboxes(app: FirebaseAppLike) -> PendingInboxes:
+    """inbox 4 종 (fills / balance_adjust / fill_dismiss / model_sync) 을 동시에 읽는다.
+
+    네 읽기는 서로 독립이므로 스레드 풀에서 병렬로 수행해 RTDB 왕복 지연을 1 회
+    수준으로 줄인다. 하나라도 실패하면 어느 inbox 인지 포함한 ``RuntimeError`` 로
+    중단한다 (자동 복구 금지).
+
+    Raises:
+        RuntimeError: inbox 읽기 또는 레코드 변환 실패 시.
+    """
+    readers: dict[str, Callable[[FirebaseAppLike], list[Any]]] = {
+        "fills": fetch_unprocessed_fills,
+        "balance_adjusts": fetch_pending_balance_adjusts,
+        "fill_dismisses": fetch_pending_fill_dismisses,
+        "model_syncs": fetch_unprocessed_model_syncs,
+    }
+    with ThreadPoolExecutor(max_workers=len(readers)) as pool:
+        futures = {name: pool.submit(reader, app) for name, reader in readers.items()}
+        results: dict[str, list[Any]] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as exc:  # noqa: BLE001
+                raise RuntimeError(f"RTDB {name} 읽기 실패: {exc}") from exc
+    return PendingInboxes(
+        fills=results["fills"],
+        balance_adjusts=results["balance_adjusts"],
+        fill_dismisses=results["fill_dismisses"],
+        model_syncs=results["model_syncs"],
+    )
 
 
 # ============================================================================
@@ -404,7 +461,6 @@ def write_read_model(app: FirebaseAppLike, state: LiveState, result: DailyResult
             for aid, asset in state.assets.items()
         },
     }
-    _db_reference(app, f"{_LATEST_PATH}/portfolio").set(portfolio_payload)
 
     signals_payload = {
         aid: {
@@ -417,12 +473,20 @@ def write_read_model(app: FirebaseAppLike, state: LiveState, result: DailyResult
         }
         for aid, sig in result.signals.items()
     }
-    _db_reference(app, f"{_LATEST_PATH}/signals").set(signals_payload)
 
     pending_payload = {
         aid: dict(asset.pending_order) for aid, asset in state.assets.items() if asset.pending_order is not None
     }
-    _db_reference(app, f"{_LATEST_PATH}/pending_orders").set(pending_payload)
+    # 세 경로를 한 번의 multi-path update 로 원자적으로 교체한다 (앱이 반쯤 갱신된
+    # read model 을 보지 않는다). 빈 pending 은 RTDB 에서 노드 삭제와 같다.
+    _multi_path_update(
+        app,
+        {
+            f"{_LATEST_PATH}/portfolio": portfolio_payload,
+            f"{_LATEST_PATH}/signals": signals_payload,
+            f"{_LATEST_PATH}/pending_orders": pending_payload,
+        },
+    )
 
 
 def write_chart_meta(app: FirebaseAppLike, meta_map: dict[str, ChartMeta]) -> None:
@@ -430,9 +494,10 @@ def write_chart_meta(app: FirebaseAppLike, meta_map: dict[str, ChartMeta]) -> No
 
     앱은 차트 진입 시 이 메타를 먼저 읽어 어느 연도 슬라이스를 로드할지 결정한다.
     """
-    for asset_id, meta in meta_map.items():
-        payload = asdict(meta)
-        _db_reference(app, f"{_CHART_PRICES_PATH}/{asset_id}/meta").set(payload)
+    _multi_path_update(
+        app,
+        {f"{_CHART_PRICES_PATH}/{asset_id}/meta": asdict(meta) for asset_id, meta in meta_map.items()},
+    )
 
 
 def write_chart_year_slice(
@@ -447,9 +512,13 @@ def write_chart_year_slice(
         year: 4 자리 연도 (예: 2026).
         year_map: 자산 ID → 해당 연도 슬라이스.
     """
-    for asset_id, chart_series in year_map.items():
-        payload = asdict(chart_series)
-        _db_reference(app, f"{_CHART_PRICES_PATH}/{asset_id}/years/{year}").set(payload)
+    _multi_path_update(
+        app,
+        {
+            f"{_CHART_PRICES_PATH}/{asset_id}/years/{year}": asdict(chart_series)
+            for asset_id, chart_series in year_map.items()
+        },
+    )
 
 
 # ============================================================================
@@ -484,8 +553,8 @@ def write_equity_year_slice(app: FirebaseAppLike, year: int, series: EquityChart
 # balance_adjust 만 기록하고, signals 는 당일 4 자산을 덮어쓴다. 영구 보존이며
 # rolling 정리 / cleanup 은 없다 (Firebase Spark 한도 대비 충분).
 #
-# idempotency: 모든 쓰기는 ``set`` (덮어쓰기). 동일 날짜/UUID/asset_id 재호출 시
-# 자연 수렴. 빈 리스트 입력은 RTDB 호출 없이 즉시 반환 (no-op).
+# idempotency: 모든 쓰기는 경로별 덮어쓰기 (multi-path update). 동일 날짜/UUID/asset_id
+# 재호출 시 자연 수렴. 빈 리스트 입력은 RTDB 호출 없이 즉시 반환 (no-op).
 
 
 def write_history_fills(app: FirebaseAppLike, fills: list[ActualFill], applied_at: str) -> None:
@@ -500,16 +569,13 @@ def write_history_fills(app: FirebaseAppLike, fills: list[ActualFill], applied_a
     ``applied_at`` 을 추가한 dict. 날짜 폴더 키는 fill 의 ``trade_date`` (사용자
     입력 체결 일자). 빈 리스트 입력 시 RTDB 호출 없이 즉시 반환.
     """
-    if not fills:
-        return
+    updates: dict[str, Any] = {}
     for fill in fills:
         payload = asdict(fill)
         payload.pop("rtdb_key", None)
         payload["applied_at"] = applied_at
-        _db_reference(
-            app,
-            f"{_HISTORY_FILLS_PATH}/{fill.trade_date}/{fill.rtdb_key}",
-        ).set(payload)
+        updates[f"{_HISTORY_FILLS_PATH}/{fill.trade_date}/{fill.rtdb_key}"] = payload
+    _multi_path_update(app, updates)
 
 
 def write_history_balance_adjusts(
@@ -528,17 +594,14 @@ def write_history_balance_adjusts(
     "교체 시점" 기준이다. payload 는 :class:`BalanceAdjust` dataclass 필드에서
     ``rtdb_key`` 를 제거하고 ``applied_at`` 을 추가한 dict. 빈 리스트 입력 시 no-op.
     """
-    if not adjusts:
-        return
     applied_at_date = applied_at[:10]
+    updates: dict[str, Any] = {}
     for adjust in adjusts:
         payload = asdict(adjust)
         payload.pop("rtdb_key", None)
         payload["applied_at"] = applied_at
-        _db_reference(
-            app,
-            f"{_HISTORY_BALANCE_ADJUSTS_PATH}/{applied_at_date}/{adjust.rtdb_key}",
-        ).set(payload)
+        updates[f"{_HISTORY_BALANCE_ADJUSTS_PATH}/{applied_at_date}/{adjust.rtdb_key}"] = payload
+    _multi_path_update(app, updates)
 
 
 def write_history_signals(
@@ -557,12 +620,13 @@ def write_history_signals(
     1 건이 보장되므로 asset_id 를 자연 키로 사용한다. 매일 4 자산 전체를 덮어쓰므로
     idempotent.
     """
-    for asset_id, signal in signals.items():
-        payload = asdict(signal)
-        _db_reference(
-            app,
-            f"{_HISTORY_SIGNALS_PATH}/{execution_date}/{asset_id}",
-        ).set(payload)
+    _multi_path_update(
+        app,
+        {
+            f"{_HISTORY_SIGNALS_PATH}/{execution_date}/{asset_id}": asdict(signal)
+            for asset_id, signal in signals.items()
+        },
+    )
 
 
 def write_history_fills_raw(app: FirebaseAppLike, rows: list[dict[str, Any]]) -> None:
@@ -576,14 +640,15 @@ def write_history_fills_raw(app: FirebaseAppLike, rows: list[dict[str, Any]]) ->
     각 row 의 폴더 키는 ``trade_date``, 레코드 키는 ``rtdb_key``. 페이로드는 row 에서
     ``rtdb_key`` 를 제거한 dict (필드 누락 시 그대로 ``null`` 기록). 빈 리스트 입력 시 no-op.
     """
-    if not rows:
-        return
-    for row in rows:
-        payload = {k: v for k, v in row.items() if k != "rtdb_key"}
-        _db_reference(
-            app,
-            f"{_HISTORY_FILLS_PATH}/{row['trade_date']}/{row['rtdb_key']}",
-        ).set(payload)
+    _multi_path_update(
+        app,
+        {
+            f"{_HISTORY_FILLS_PATH}/{row['trade_date']}/{row['rtdb_key']}": {
+                k: v for k, v in row.items() if k != "rtdb_key"
+            }
+            for row in rows
+        },
+    )
 
 
 def write_history_balance_adjusts_raw(app: FirebaseAppLike, rows: list[dict[str, Any]]) -> None:
@@ -592,15 +657,15 @@ def write_history_balance_adjusts_raw(app: FirebaseAppLike, rows: list[dict[str,
     각 row 의 폴더 키는 ``applied_at[:10]``, 레코드 키는 ``rtdb_key``. 호출자가
     두 필드를 보장해야 한다. 빈 리스트 입력 시 no-op.
     """
-    if not rows:
-        return
-    for row in rows:
-        payload = {k: v for k, v in row.items() if k != "rtdb_key"}
-        applied_at_date = str(row["applied_at"])[:10]
-        _db_reference(
-            app,
-            f"{_HISTORY_BALANCE_ADJUSTS_PATH}/{applied_at_date}/{row['rtdb_key']}",
-        ).set(payload)
+    _multi_path_update(
+        app,
+        {
+            f"{_HISTORY_BALANCE_ADJUSTS_PATH}/{str(row['applied_at'])[:10]}/{row['rtdb_key']}": {
+                k: v for k, v in row.items() if k != "rtdb_key"
+            }
+            for row in rows
+        },
+    )
 
 
 def write_history_signals_raw(app: FirebaseAppLike, rows: list[dict[str, Any]]) -> None:
@@ -609,14 +674,15 @@ def write_history_signals_raw(app: FirebaseAppLike, rows: list[dict[str, Any]])
     각 row 의 폴더 키는 ``date``, 레코드 키는 ``asset_id``. 호출자가 두 필드를
     보장해야 한다. 페이로드는 row 에서 두 키를 제거한 dict. 빈 리스트 입력 시 no-op.
     """
-    if not rows:
-        return
-    for row in rows:
-        payload = {k: v for k, v in row.items() if k not in ("date", "asset_id")}
-        _db_reference(
-            app,
-            f"{_HISTORY_SIGNALS_PATH}/{row['date']}/{row['asset_id']}",
-        ).set(payload)
+    _multi_path_update(
+        app,
+        {
+            f"{_HISTORY_SIGNALS_PATH}/{row['date']}/{row['asset_id']}": {
+                k: v for k, v in row.items() if k not in ("date", "asset_id")
+            }
+            for row in rows
+        },
+    )
 
 
 # ============================================================================
@@ -656,6 +722,7 @@ def remove_invalid_tokens(app: FirebaseAppLike, tokens: list[str]) -> None:
     if not isinstance(raw, dict):
         return
 
+    removals: dict[str, Any] = {}
     for device_id, value in raw.items():
         token: str | None = None
         if isinstance(value, str):
@@ -663,7 +730,9 @@ def remove_invalid_tokens(app: FirebaseAppLike, tokens: list[str]) -> None:
         elif isinstance(value, dict):
             token = str(value.get("token", ""))
         if token and token in invalid_set:
-            _db_reference(app, f"{_DEVICE_TOKENS_PATH}/{device_id}").delete()
+            # multi-path update 에서 None 값은 해당 경로 삭제를 뜻한다.
+            removals[f"{_DEVICE_TOKENS_PATH}/{device_id}"] = None
+    _multi_path_update(app, removals)
 
 
 def delete_all_except_device_tokens(app: FirebaseAppLike) -> None:
@@ -9,6 +9,8 @@
 - :func:`load_state`, :func:`save_state` — LiveState JSON 왕복
 - :func:`load_applied_fill_ids`, :func:`save_applied_fill_ids` — idempotency 원장
 - :func:`cleanup_old_fill_ids` — 90 일 초과 fill ID 정리
+- :func:`load_ma_cache`, :func:`save_ma_cache` — 증분 run-daily 용 이동평균 캐시
+- :func:`load_chart_hashes`, :func:`save_chart_hashes` — 게시한 차트 연도 슬라이스 해시
 
 applied_fill_ids 포맷 (D1 결정):
     ``dict[str, str]`` — 키는 fill ID (``ActualFill.rtdb_key``), 값은 ISO 8601 KST
@@ -45,9 +47,12 @@ from live.models import (
     VALID_INTENT_TYPES,
     AssetLiveState,
     BufferZoneState,
+    ChartHashes,
     HoldState,
     IntentTypeLiteral,
     LiveState,
+    MaCache,
+    MaCacheEntry,
     PendingOrderDict,
 )
 
@@ -63,6 +68,10 @@ __all__ = [
     "load_applied_fill_dismiss_ids",
     "save_applied_fill_dismiss_ids",
     "cleanup_old_applied_ids",
+    "load_ma_cache",
+    "save_ma_cache",
+    "load_chart_hashes",
+    "save_chart_hashes",
 ]
 
 
@@ -497,3 +506,118 @@ def cleanup_old_applied_ids(ids: dict[str, str], max_age_days: int = APPLIED_FIL
         if ts >= cutoff:
             result[entry_id] = iso_ts
     return result
+
+
+# ============================================================================
+# ma_cache 관리
+# ============================================================================
+
+_MA_CACHE_ENTRY_FIELDS = ("signal_ticker", "ma_window", "ma_type", "last_date", "last_close", "ma_value")
+
+
+def save_ma_cache(cache: MaCache, path: Path) -> None:
+    """ma_cache 원장을 JSON 으로 저장한다 (atomic).
+
+    float 는 ``json`` 의 repr 표기로 저장되므로 로드 후 비트 단위로 같은 값이 복원된다.
+    """
+    payload = {
+        "runs_since_full": cache.runs_since_full,
+        "entries": {key: asdict(entry) for key, entry in cache.entries.items()},
+    }
+    content = json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True)
+    _atomic_write_text(path, content)
+
+
+def load_ma_cache(path: Path) -> MaCache:
+    """ma_cache 원장을 로드한다. 파일이 없으면 빈 캐시.
+
+    Raises:
+        ValueError: JSON 파싱 실패, 루트/엔트리 형식 오류, 필수 필드 누락.
+    """
+    if not path.exists():
+        return MaCache(entries={})
+
+    raw = path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"ma_cache.json 파싱 실패: {path} ({exc})") from exc
+
+    if not isinstance(data, dict) or not isinstance(data.get("entries"), dict):
+        raise ValueError(f"ma_cache.json 루트는 entries dict 를 포함해야 함: {path}")
+
+    entries: dict[str, MaCacheEntry] = {}
+    for key, item in data["entries"].items():
+        if not isinstance(item, dict):
+            raise ValueError(f"ma_cache.json 엔트리는 dict 이어야 함: key={key!r}")
+        missing = [name for name in _MA_CACHE_ENTRY_FIELDS if name not in item]
+        if missing:
+            raise ValueError(f"ma_cache.json 필드 누락: key={key!r}, missing={missing}")
+        ma_type = str(item["ma_type"])
+        if ma_type not in ("ema", "sma"):
+            raise ValueError(f"ma_cache.json ma_type 오류: key={key!r}, value={ma_type!r}")
+        entries[str(key)] = MaCacheEntry(
+            signal_ticker=str(item["signal_ticker"]),
+            ma_window=int(item["ma_window"]),
+            ma_type=ma_type,
+            last_date=str(item["last_date"]),
+            last_close=float(item["last_close"]),
+            ma_value=float(item["ma_value"]),
+        )
+
+    return MaCache(entries=entries, runs_since_full=int(data.get("runs_since_full", 0)))
+
+
+# ============================================================================
+# chart_hashes 관리
+# ============================================================================
+
+
+def save_chart_hashes(hashes: ChartHashes, path: Path) -> None:
+    """chart_hashes 원장을 JSON 으로 저장한다 (atomic). 연도 키는 문자열로 기록한다."""
+    payload = {
+        "prices": {
+            asset_id: {str(year): digest for year, digest in by_year.items()}
+            for asset_id, by_year in hashes.prices.items()
+        },
+        "equity": {str(year): digest for year, digest in hashes.equity.items()},
+    }
+    content = json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True)
+    _atomic_write_text(path, content)
+
+
+def _parse_year_hashes(raw: Any, label: str) -> dict[int, str]:
+    if not isinstance(raw, dict):
+        raise ValueError(f"chart_hashes.json {label} 는 dict 이어야 함")
+    result: dict[int, str] = {}
+    for year, digest in raw.items():
+        try:
+            result[int(year)] = str(digest)
+        except ValueError as exc:
+            raise ValueError(f"chart_hashes.json 연도 키 오류: {label}, key={year!r}") from exc
+    return result
+
+
+def load_chart_hashes(path: Path) -> ChartHashes:
+    """chart_hashes 원장을 로드한다. 파일이 없으면 빈 원장 (모든 슬라이스가 변경으로 취급).
+
+    Raises:
+        ValueError: JSON 파싱 실패, 루트 / 연도 키 형식 오류.
+    """
+    if not path.exists():
+        return ChartHashes()
+
+    raw = path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"chart_hashes.json 파싱 실패: {path} ({exc})") from exc
+
+    if not isinstance(data, dict) or not isinstance(data.get("prices", {}), dict):
+        raise ValueError(f"chart_hashes.json 루트는 prices dict 를 포함해야 함: {path}")
+
+    prices = {
+        str(asset_id): _parse_year_hashes(by_year, f"prices[{asset_id!r}]")
+        for asset_id, by_year in data.get("prices", {}).items()
+    }
+    return ChartHashes(prices=prices, equity=_parse_year_hashes(data.get("equity", {}), "equity"))
@@ -8,6 +8,13 @@
 - generation precondition (``if_generation_match``) 위반은 ``RuntimeError``.
 - ``state_workspace`` 컨텍스트는 변경된 파일만 upload 하며 ``live_state.json`` 을
   마지막에 업로드한다 (LiveState 일관성 보호 — BRIEFING §6.5).
+- CSV 에서 파생되는 바이너리 컬럼 캐시(``*.columns/``) 는 정본이 아니므로 upload 하지 않는다.
+- ``state_workspace`` 는 명령이 읽는 blob 만 download 한다. 쓰기 전용 prefix
+  (``WORKSPACE_WRITE_ONLY_PREFIXES``) 는 받지 않고, 로컬 캐시
+  (``QBT_LIVE_WORKSPACE_CACHE_DIR``) 가 있으면 generation / md5 가 바뀐 blob 만 받는다.
+  download / upload 는 스레드 풀로 동시에 수행한다.
+- ``QBT_LIVE_LOCAL_BUCKET_DIR`` 가 설정되면 GCS 대신 로컬 디렉토리를 버킷으로 사용한다
+  (:class:`LocalDirBucket` — 오프라인 실행 / 테스트용).
 
 함수:
 
@@ -20,16 +27,30 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
+import json
+import os
+import shutil
 import tempfile
-from collections.abc import Iterator
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from firebase_admin import storage as fa_storage
 
-from live.constants import DEFAULT_LIVE_STATE_FILENAME, STATE_BUCKET_NAME
+from live.constants import (
+    DEFAULT_LIVE_STATE_FILENAME,
+    GCS_SYNC_MAX_WORKERS,
+    LOCAL_BUCKET_DIR_ENV_KEY,
+    STATE_BUCKET_NAME,
+    WORKSPACE_CACHE_DIR_ENV_KEY,
+    WORKSPACE_WRITE_ONLY_PREFIXES,
+)
+from qbt.utils.data_loader import COLUMNAR_CACHE_SUFFIX
 from qbt.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,11 +61,18 @@ __all__ = [
     "list_blobs_with_prefix",
     "delete_blob",
     "state_workspace",
+    "LocalDirBucket",
 ]
 
 
 def _bucket():
-    """버킷 핸들 획득. firebase_admin 이 내부적으로 캐싱한다."""
+    """버킷 핸들 획득. firebase_admin 이 내부적으로 캐싱한다.
+
+    ``QBT_LIVE_LOCAL_BUCKET_DIR`` 가 설정되어 있으면 해당 디렉토리의 :class:`LocalDirBucket` 을 반환한다.
+    """
+    local_dir = os.environ.get(LOCAL_BUCKET_DIR_ENV_KEY)
+    if local_dir:
+        return LocalDirBucket(Path(local_dir))
     try:
         return fa_storage.bucket(name=STATE_BUCKET_NAME)
     except Exception as exc:
@@ -146,51 +174,243 @@ def delete_blob(blob_path: Path | str) -> None:
 
 
 # ============================================================================
-# state_workspace — ephemeral 워크스페이스 컨텍스트
+# LocalDirBucket — 로컬 디렉토리 버킷 (오프라인 실행 / 테스트용)
 # ============================================================================
 
+# LocalDirBucket 임시 파일 접두사 (list_blobs 에서 제외)
+_LOCAL_TMP_PREFIX = ".qbt-tmp-"
+
 
-def _sha256(path: Path) -> str:
-    """파일의 sha256 hex digest. 변경 감지에 사용."""
-    h = hashlib.sha256()
+def _md5_base64(path: Path) -> str:
+    """파일의 md5 digest 를 GCS ``Blob.md5_hash`` 와 같은 base64 문자열로 반환한다."""
+    h = hashlib.md5()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(1 << 16), b""):
             h.update(chunk)
-    return h.hexdigest()
+    return base64.b64encode(h.digest()).decode("ascii")
 
 
-def _sort_for_upload(names: list[str]) -> list[str]:
-    """upload 순서 정렬 — ``live_state.json`` 을 가장 마지막으로.
+class LocalBlob:
+    """:class:`LocalDirBucket` 의 blob. ``google.cloud.storage.Blob`` 중 본 모듈이 쓰는 부분만 제공한다.
 
-    BRIEFING §6.5 — 부분 실패 시 LiveState 갱신을 마지막으로 미루어 다음 실행이
-    정합 복원 가능하도록 한다.
+    generation 은 파일 mtime(ns) 이며, upload 시 이전 값보다 항상 커지도록 보정한다.
     """
-    rest = sorted(n for n in names if n != DEFAULT_LIVE_STATE_FILENAME)
-    if DEFAULT_LIVE_STATE_FILENAME in names:
-        return rest + [DEFAULT_LIVE_STATE_FILENAME]
-    return rest
+
+    def __init__(self, root: Path, name: str) -> None:
+        self.name = name
+        self._path = root / name
+        self.generation: int | None = None
+        self.size: int | None = None
+        self.md5_hash: str | None = None
+        if self._path.is_file():
+            self._refresh()
+
+    def _refresh(self) -> None:
+        stat = self._path.stat()
+        self.generation = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.md5_hash = _md5_base64(self._path)
+
+    def reload(self) -> None:
+        if not self._path.is_file():
+            raise FileNotFoundError(f"local blob not found: {self.name}")
+        self._refresh()
+
+    def download_to_filename(self, filename: str) -> None:
+        if not self._path.is_file():
+            raise FileNotFoundError(f"local blob not found: {self.name}")
+        shutil.copyfile(self._path, filename)
+
+    def upload_from_filename(self, filename: str, *, if_generation_match: int | None = None) -> None:
+        current = self._path.stat().st_mtime_ns if self._path.is_file() else 0
+        if if_generation_match is not None and current != if_generation_match:
+            raise ValueError(f"generation mismatch: expected={if_generation_match}, actual={current}")
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{_LOCAL_TMP_PREFIX}{uuid.uuid4().hex}")
+        try:
+            shutil.copyfile(filename, tmp_path)
+            os.replace(tmp_path, self._path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        if self._path.stat().st_mtime_ns <= current:
+            # mtime 해상도가 낮은 파일 시스템에서도 generation 이 증가하도록 보정
+            os.utime(self._path, ns=(current + 1, current + 1))
+        self._refresh()
+
+    def delete(self) -> None:
+        self._path.unlink()
+        self.generation = self.size = None
+        self.md5_hash = None
+
+
+class LocalDirBucket:
+    """로컬 디렉토리를 GCS 버킷처럼 다루는 stand-in.
+
+    blob 이름은 디렉토리 기준 상대 경로(``/`` 구분)이다. ``QBT_LIVE_LOCAL_BUCKET_DIR`` 로 활성화한다.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.name = str(root)
+
+    def blob(self, name: str) -> LocalBlob:
+        return LocalBlob(self.root, name)
+
+    def list_blobs(self, prefix: str = "") -> list[LocalBlob]:
+        if not self.root.exists():
+            return []
+        names = sorted(
+            path.relative_to(self.root).as_posix()
+            for path in self.root.rglob("*")
+            if path.is_file() and not path.name.startswith(_LOCAL_TMP_PREFIX)
+        )
+        return [LocalBlob(self.root, name) for name in names if name.startswith(prefix)]
+
+
+# ============================================================================
+# state_workspace — ephemeral 워크스페이스 컨텍스트
+# ============================================================================
+
+
+# 로컬 blob 캐시 내부 구조: {cache_dir}/manifest.json + {cache_dir}/blobs/{blob 이름}
+_CACHE_MANIFEST_FILENAME = "manifest.json"
+_CACHE_BLOBS_SUBDIR = "blobs"
+
+
+def _run_concurrently[T](func: Callable[[str], T], names: Sequence[str]) -> dict[str, T]:
+    """blob 이름마다 func 를 스레드 풀에서 실행한다. 실패가 있으면 첫 예외를 그대로 전파한다."""
+    if not names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(GCS_SYNC_MAX_WORKERS, len(names))) as pool:
+        futures = {name: pool.submit(func, name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _is_wanted(name: str, prefixes: Sequence[str] | None) -> bool:
+    """state_workspace 진입 시 download 할 blob 인지 판정한다."""
+    if name.startswith(WORKSPACE_WRITE_ONLY_PREFIXES):
+        return False
+    return prefixes is None or name.startswith(tuple(prefixes))
+
+
+def _workspace_cache_dir() -> Path | None:
+    cache_dir = os.environ.get(WORKSPACE_CACHE_DIR_ENV_KEY)
+    return Path(cache_dir) if cache_dir else None
+
+
+def _load_cache_manifest(cache_dir: Path) -> dict[str, dict[str, Any]]:
+    """로컬 캐시 manifest ``{blob 이름: {"generation", "md5_hash"}}`` (없거나 손상 시 빈 dict)."""
+    path = cache_dir / _CACHE_MANIFEST_FILENAME
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        # 캐시는 버킷에서 언제든 다시 받을 수 있으므로 비우고 진행한다
+        logger.debug(f"workspace 캐시 manifest 무시: {path} ({exc})")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_cache_manifest(cache_dir: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    path = cache_dir / _CACHE_MANIFEST_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _materialize(
+    names: Sequence[str],
+    remote: dict[str, tuple[int, str | None]],
+    workspace: Path,
+    cache_dir: Path | None,
+) -> None:
+    """blob 들을 워크스페이스에 준비한다 (캐시가 있으면 바뀐 blob 만 download)."""
+    if cache_dir is None:
+        _run_concurrently(lambda name: download_blob(name, workspace / name), names)
+        return
+
+    blobs_dir = cache_dir / _CACHE_BLOBS_SUBDIR
+    manifest = _load_cache_manifest(cache_dir)
+    stale = [
+        name
+        for name in names
+        if manifest.get(name) != {"generation": remote[name][0], "md5_hash": remote[name][1]}
+        or not (blobs_dir / name).is_file()
+    ]
+    _run_concurrently(lambda name: download_blob(name, blobs_dir / name), stale)
+    for name in stale:
+        manifest[name] = {"generation": remote[name][0], "md5_hash": remote[name][1]}
+    _save_cache_manifest(cache_dir, {name: entry for name, entry in manifest.items() if name in remote})
+    logger.debug(f"state_workspace 캐시: {len(names) - len(stale)} 재사용, {len(stale)} download")
+
+    for name in names:
+        dest = workspace / name
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # 워크스페이스 수정이 캐시에 번지지 않도록 복사한다 (하드링크 금지 — append 쓰기 존재)
+        shutil.copyfile(blobs_dir / name, dest)
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _collect_modified(
+    workspace: Path,
+    remote: dict[str, tuple[int, str | None]],
+    materialized: dict[str, tuple[int, int]],
+) -> dict[str, str]:
+    """upload 대상 ``{blob 이름: 로컬 md5}`` 를 구한다.
+
+    - 준비한 파일: 크기 / mtime 이 그대로면 변경 없음, 바뀌었으면 md5 를 버킷 값과 비교
+    - 받지 않은 파일 (쓰기 전용 prefix 등): 버킷에 있으면 md5 비교, 없으면 신규
+    """
+    modified: dict[str, str] = {}
+    for local_file in workspace.rglob("*"):
+        if not local_file.is_file():
+            continue
+        rel_path = local_file.relative_to(workspace)
+        if any(part.endswith(COLUMNAR_CACHE_SUFFIX) for part in rel_path.parts[:-1]):
+            # CSV 파생 캐시 — 워크스페이스 안에서만 사용
+            continue
+        rel = rel_path.as_posix()  # GCS 는 '/' 사용
+        if materialized.get(rel) == _stat_key(local_file):
+            continue
+        md5 = _md5_base64(local_file)
+        if rel in remote and remote[rel][1] == md5:
+            continue
+        modified[rel] = md5
+    return modified
 
 
 @contextmanager
-def state_workspace(*, push_on_success: bool) -> Iterator[Path]:
+def state_workspace(*, push_on_success: bool, prefixes: Sequence[str] | None = None) -> Iterator[Path]:
     """매 CLI 실행마다 GCS 버킷 ↔ tempdir 동기화 흐름.
 
     흐름:
 
     1. tempdir 생성
-    2. 버킷의 모든 blob 을 tempdir 로 download (구조 그대로)
-    3. download 시점 sha256 스냅샷 기록
+    2. 버킷 blob 목록(generation / md5) 조회 후, 명령이 읽는 blob 만 동시 download
+       (쓰기 전용 prefix 제외, ``prefixes`` 지정 시 해당 prefix 만). 로컬 캐시가 있으면
+       generation / md5 가 바뀐 blob 만 download 하고 나머지는 캐시에서 복사
+    3. 준비한 파일의 크기 / mtime 스냅샷 기록
     4. ``yield workspace``
-    5. 정상 종료 시 sha256 비교로 **변경된 파일만** upload
-    6. ``live_state.json`` 은 항상 마지막에 upload (BRIEFING §6.5)
-    7. tempdir 자동 삭제
+    5. 정상 종료 시 변경된 파일(md5 가 버킷과 다른 파일) 만 동시 upload
+    6. ``live_state.json`` 은 항상 다른 upload 가 모두 끝난 뒤 마지막에 upload (BRIEFING §6.5)
+    7. upload 한 파일을 로컬 캐시에 반영, tempdir 자동 삭제
 
-    본문 예외 시: ``yield`` 가 예외를 다시 raise 하므로 5~6 단계로 진입하지 않는다.
+    본문 예외 시: ``yield`` 가 예외를 다시 raise 하므로 5~7 단계로 진입하지 않는다.
     부분 upload 로 LiveState 일관성이 깨지는 시나리오 방지.
 
     Args:
         push_on_success: ``True`` 면 정상 종료 시 변경분 upload. 읽기 전용 명령
-            (``drift`` / ``backfill-chart-years``) 은 ``False``.
+            (``drift``) 은 ``False``. ``backfill-chart-years`` 는 차트 해시 원장
+            (``chart_hashes.json``) 갱신을 위해 ``--dry-run`` 이 아닐 때만 ``True``.
+        prefixes: download 할 blob 이름 prefix 목록 (파일명 전체도 가능). ``None`` 이면
+            쓰기 전용 prefix 를 제외한 전체.
 
     Yields:
         tempdir 내부의 워크스페이스 루트 (``Path``). 이 경로를 ``state_dir`` 로 사용.
@@ -198,19 +418,18 @@ def state_workspace(*, push_on_success: bool) -> Iterator[Path]:
     Raises:
         RuntimeError: download / upload 실패 시 (자동 복구 금지 원칙에 따라 전파).
     """
+    cache_dir = _workspace_cache_dir()
     with tempfile.TemporaryDirectory(prefix="qbt-live-gcs-") as td:
         workspace = Path(td) / "workspace"
         workspace.mkdir(parents=True, exist_ok=True)
         logger.debug(f"state_workspace 시작: {workspace}")
 
-        # 1. 버킷의 모든 blob 을 tempdir 로 download
-        blobs = list_blobs_with_prefix("")
-        snapshots: dict[str, str] = {}  # name → sha256
-        for blob in blobs:
-            local = workspace / blob.name
-            download_blob(blob.name, local)
-            snapshots[blob.name] = _sha256(local)
-        logger.debug(f"state_workspace download 완료: {len(blobs)} blobs")
+        # 1. blob 목록 조회 → 필요한 blob 만 download
+        remote = {blob.name: (int(blob.generation or 0), blob.md5_hash) for blob in list_blobs_with_prefix("")}
+        wanted = [name for name in sorted(remote) if _is_wanted(name, prefixes)]
+        _materialize(wanted, remote, workspace, cache_dir)
+        materialized = {name: _stat_key(workspace / name) for name in wanted}
+        logger.debug(f"state_workspace download 완료: {len(wanted)}/{len(remote)} blobs")
 
         # 2. yield — 본문 예외 시 자동 raise 후 아래 코드 미실행
         yield workspace
@@ -220,19 +439,24 @@ def state_workspace(*, push_on_success: bool) -> Iterator[Path]:
             logger.debug("state_workspace read-only — upload skip")
             return
 
-        modified: list[str] = []
-        for local_file in workspace.rglob("*"):
-            if not local_file.is_file():
-                continue
-            rel = local_file.relative_to(workspace).as_posix()  # GCS 는 '/' 사용
-            current_hash = _sha256(local_file)
-            old_hash = snapshots.get(rel)
-            if old_hash != current_hash:
-                modified.append(rel)
-
-        for name in _sort_for_upload(modified):
-            local_file = workspace / Path(name)
-            upload_blob(local_file, name)
+        modified = _collect_modified(workspace, remote, materialized)
+        rest = sorted(name for name in modified if name != DEFAULT_LIVE_STATE_FILENAME)
+        generations = _run_concurrently(lambda name: upload_blob(workspace / name, name), rest)
+        if DEFAULT_LIVE_STATE_FILENAME in modified:
+            generations[DEFAULT_LIVE_STATE_FILENAME] = upload_blob(
+                workspace / DEFAULT_LIVE_STATE_FILENAME, DEFAULT_LIVE_STATE_FILENAME
+            )
+        for name in generations:
             logger.debug(f"state_workspace upload: {name}")
 
+        # 4. upload 한 파일을 로컬 캐시에 반영 (다음 실행에서 다시 받지 않도록)
+        if cache_dir is not None and generations:
+            manifest = _load_cache_manifest(cache_dir)
+            for name, generation in generations.items():
+                dest = cache_dir / _CACHE_BLOBS_SUBDIR / name
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(workspace / name, dest)
+                manifest[name] = {"generation": generation, "md5_hash": modified[name]}
+            _save_cache_manifest(cache_dir, manifest)
+
         logger.debug(f"state_workspace upload 완료: {len(modified)} files")
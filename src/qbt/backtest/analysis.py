@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, cast
 
 import numpy as np
 import pandas as pd
@@ -30,6 +30,41 @@ from qbt.utils import get_logger
 logger = get_logger(__name__)
 
 
+def compute_moving_average(
+    close: pd.Series,
+    window: int,
+    ma_type: Literal["ema", "sma"] = "sma",
+) -> pd.Series:
+    """
+    종가 시리즈의 이동평균을 계산한다.
+
+    add_single_moving_average와 피처 저장소(feature_store)가 공유하는 계산식이다.
+
+    Args:
+        close: 종가 시리즈
+        window: 이동평균 기간
+        ma_type: 이동평균 유형 ("sma" 또는 "ema")
+
+    Returns:
+        이동평균 시리즈 (close와 같은 인덱스)
+
+    Raises:
+        ValueError: 지원하지 않는 ma_type인 경우
+    """
+    if ma_type == "sma":
+        # SMA (Simple Moving Average): 단순 이동평균
+        # .rolling(window=20): 20개 행씩 묶어 이동 윈도우 생성
+        # .mean(): 각 윈도우의 평균 계산
+        # 예: [1,2,3,4,5]에서 window=3 → [NaN, NaN, 2, 3, 4]
+        return cast(pd.Series, close.rolling(window=window).mean())
+    if ma_type == "ema":
+        # EMA (Exponential Moving Average): 지수 이동평균
+        # .ewm(): 지수 가중 이동평균 (최근 데이터에 더 큰 가중치)
+        # span: EMA 기간, adjust=False: 표준 EMA 공식 사용
+        return cast(pd.Series, close.ewm(span=window, adjust=False).mean())
+    raise ValueError(f"지원하지 않는 ma_type: {ma_type}")
+
+
 def add_single_moving_average(
     df: pd.DataFrame,
     window: int,
@@ -67,21 +102,7 @@ def add_single_moving_average(
     # 컬럼명 설정
     # f-string으로 동적 컬럼명 생성 (예: "ma_20", "ma_50")
     col_name = ma_col_name(window)
-
-    # 이동평균 계산
-    if ma_type == "sma":
-        # SMA (Simple Moving Average): 단순 이동평균
-        # .rolling(window=20): 20개 행씩 묶어 이동 윈도우 생성
-        # .mean(): 각 윈도우의 평균 계산
-        # 예: [1,2,3,4,5]에서 window=3 → [NaN, NaN, 2, 3, 4]
-        df[col_name] = df[COL_CLOSE].rolling(window=window).mean()
-    elif ma_type == "ema":
-        # EMA (Exponential Moving Average): 지수 이동평균
-        # .ewm(): 지수 가중 이동평균 (최근 데이터에 더 큰 가중치)
-        # span: EMA 기간, adjust=False: 표준 EMA 공식 사용
-        df[col_name] = df[COL_CLOSE].ewm(span=window, adjust=False).mean()
-    else:
-        raise ValueError(f"지원하지 않는 ma_type: {ma_type}")
+    df[col_name] = compute_moving_average(cast(pd.Series, df[COL_CLOSE]), window, ma_type)
 
     # 유효 데이터 수 확인
     # .notna(): NaN이 아닌 값 확인 (True/False Series 반환)
@@ -4,9 +4,11 @@
 백테스트 도메인에서만 사용하는 전략 파라미터와 상수를 정의한다.
 - 백테스트 기본 설정 (거래 비용, 초기 자본)
 - 전략 파라미터 (버퍼존 기본값, 제약 조건, 그리드 서치)
+- 포트폴리오 설정 (시작일 하한, 비중/리밸런싱 임계값 탐색)
 - 결과 데이터 컬럼 및 표시
 """
 
+from datetime import date
 from typing import Final
 
 # ============================================================
@@ -67,6 +69,46 @@ WALKFORWARD_SUMMARY_FILENAME: Final = "walkforward_summary.json"
 WFO_WINDOWS_DYNAMIC_DIR: Final = "wfo_windows_dynamic"
 WFO_WINDOWS_FULLY_FIXED_DIR: Final = "wfo_windows_fully_fixed"
 
+# ============================================================
+# 포트폴리오 설정
+# ============================================================
+
+# 포트폴리오 백테스트 최소 시작일 하한
+# 각 실험의 effective_start_date가 이 날짜 이전이어도 이 날짜부터 실행한다
+# (2005년 이전 데이터는 포트폴리오 비교 범위에서 제외).
+DEFAULT_PORTFOLIO_START_DATE: Final = date(2005, 1, 1)
+
+# --- 비중/리밸런싱 임계값 탐색 (run_portfolio_search) ---
+DEFAULT_PORTFOLIO_SEARCH_WEIGHT_STEP: Final = 0.05  # 목표 비중 격자 간격 (0.05 = 5%p)
+DEFAULT_PORTFOLIO_SEARCH_MONTHLY_THRESHOLDS: Final = [0.05, 0.10, 0.15]  # 월 첫 거래일 임계값 후보
+DEFAULT_PORTFOLIO_SEARCH_DAILY_THRESHOLDS: Final = [0.15, 0.20, 0.30]  # 매일 긴급 임계값 후보
+DEFAULT_PORTFOLIO_SEARCH_BATCH_SIZE: Final = 2048  # 배치 커널 1회 호출당 조합 수 (메모리 상한)
+
+# ============================================================
+# 결과 캐시 설정
+# ============================================================
+
+# 캐시 스키마 버전 (엔진 체결 규칙/성과 지표 정의가 바뀌면 올려서 기존 항목을 무효화)
+RESULT_CACHE_SCHEMA_VERSION: Final = 1
+# 캐시 디렉토리 최대 크기 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+DEFAULT_RESULT_CACHE_MAX_BYTES: Final = 256 * 1024 * 1024  # 256MB
+# 입력 데이터를 갱신하는 작업의 meta.json 타입 (이 타임스탬프가 갱신되면 캐시 전체 무효화)
+RESULT_CACHE_DATA_META_TYPES: Final = ("stock_download", "tqqq_synthetic", "synthetic_batch")
+
+# ============================================================
+# 이동평균 피처 저장소 설정
+# ============================================================
+
+# 메모리에 유지할 최대 MA 배열 수 (초과 시 가장 오래 사용되지 않은 배열부터 제거)
+DEFAULT_FEATURE_STORE_MAX_ENTRIES: Final = 512
+
+# ============================================================
+# 포트폴리오 시그널 트랙 저장소 설정
+# ============================================================
+
+# 메모리에 유지할 최대 자산별 시그널 트랙 수 (초과 시 가장 오래 사용되지 않은 트랙부터 제거)
+DEFAULT_SIGNAL_TRACK_STORE_MAX_ENTRIES: Final = 256
+
 # ============================================================
 # 반올림 규칙 상수 (루트 CLAUDE.md "출력 데이터 반올림 규칙" 참조)
 # ============================================================
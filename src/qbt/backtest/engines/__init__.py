@@ -3,9 +3,13 @@
 엔진별 모듈을 제공한다.
 - engine_common: PendingOrder, TradeRecord, EquityRecord, 체결/equity 기록 공통 함수
 - backtest_engine: 단일 백테스트 엔진 (run_backtest, run_grid_search)
+- grid_kernel: 버퍼존 파라미터 조합 배치 시뮬레이션 커널 (run_buffer_zone_batch)
 - portfolio_planning: 주문 의도(OrderIntent), 시그널/투영/병합 함수
 - portfolio_rebalance: 리밸런싱 정책(RebalancePolicy), 월 첫 거래일 판정 함수
 - portfolio_execution: SELL→BUY 순 체결 함수 (AssetState는 portfolio_types.py에 정의)
 - portfolio_data: 데이터 로딩/검증, 에쿼티 DataFrame 빌드 함수
+- portfolio_signals: 자산별 시그널 트랙 사전 계산/캐시, 엔진용 전략 어댑터 (PrecomputedSignalStrategy)
+- portfolio_recorder: 일별 에쿼티/상태 로그 컬럼 배열 기록기 (PortfolioRecorder)
 - portfolio_engine: 포트폴리오 백테스트 facade (run_portfolio_backtest)
+- portfolio_kernel: 포트폴리오 비중/임계값 조합 배치 시뮬레이션 커널 (run_portfolio_batch)
 """
@@ -5,17 +5,19 @@ SignalStrategy Protocol을 통해 전략을 의존성 주입 방식으로 사용
 
 주요 함수:
 - run_backtest: 전략 객체를 받아 단일 백테스트를 실행
-- run_grid_search: 파라미터 그리드 탐색 (병렬 처리)
+- run_grid_search: 파라미터 그리드 탐색 (배치 커널로 조합 동시 평가)
+- ExpandingGridSearch: Expanding WFO용 증분 그리드 서치 (IS 체크포인트 재사용)
 - run_buffer_strategy: BufferStrategyParams 기반 버퍼존 백테스트 편의 래퍼
 """
 
-import os
+from bisect import bisect_right
 from datetime import date
-from typing import TypedDict
+from typing import TypedDict, cast
 
+import numpy as np
 import pandas as pd
 
-from qbt.backtest.analysis import add_single_moving_average, calculate_calmar, calculate_summary
+from qbt.backtest.analysis import calculate_calmar, calculate_summary
 from qbt.backtest.constants import (
     COL_BUY_BUFFER_ZONE_PCT,
     COL_CAGR,
@@ -45,6 +47,14 @@ from qbt.backtest.engines.engine_common import (
     execute_sell_order,
     record_equity,
 )
+from qbt.backtest.engines.grid_kernel import (
+    advance_batch,
+    calculate_batch_cagr,
+    compute_batch_signal_flags,
+    init_batch_state,
+    run_buffer_zone_batch,
+)
+from qbt.backtest.feature_store import get_feature_store, with_moving_averages
 from qbt.backtest.strategies.buffer_zone import BufferZoneStrategy
 from qbt.backtest.strategies.strategy_common import (
     PendingOrderConflictError,
@@ -57,7 +67,6 @@ from qbt.common_constants import (
     COL_OPEN,
 )
 from qbt.utils import get_logger
-from qbt.utils.parallel_executor import WORKER_CACHE, execute_parallel_with_kwargs, init_worker_cache
 
 logger = get_logger(__name__)
 
@@ -68,7 +77,7 @@ logger = get_logger(__name__)
 
 
 class GridSearchResult(TypedDict):
-    """_run_backtest_for_grid() 반환 타입.
+    """run_grid_search() 결과 행 타입.
 
     키 이름은 backtest/constants.py의 COL_* 상수 값과 동일하다.
     """
@@ -172,64 +181,150 @@ def filter_valid_rows(
 
 
 # ============================================================================
-# 그리드 서치 병렬 헬퍼 (module-level, pickle 가능)
+# 그리드 서치 배치 헬퍼
 # ============================================================================
 
 
-def _run_backtest_for_grid(
-    params: BufferStrategyParams,
-) -> GridSearchResult:
-    """그리드 서치를 위해 단일 파라미터 조합에 대해 백테스트를 실행한다.
+def _run_grid_batch(
+    signal_df: pd.DataFrame,
+    trade_df: pd.DataFrame,
+    params_list: list[BufferStrategyParams],
+) -> list[GridSearchResult]:
+    """MA 유효 구간이 같은 파라미터 조합들을 배치 커널로 한 번에 평가한다.
 
-    병렬 실행을 위한 헬퍼 함수. 예외 발생 시 즉시 전파한다.
-    signal_df, trade_df는 WORKER_CACHE에서 조회한다.
-    signal_df에는 해당 ma_window 컬럼이 사전 계산되어 있어야 한다.
+    signal_df에는 params_list의 모든 ma_window 컬럼이 사전 계산되어 있어야 하며,
+    각 ma_window의 유효 행(NaN 아닌 행)이 모두 동일해야 한다.
 
     Args:
-        params: 전략 파라미터
+        signal_df: 시그널 DataFrame (MA 컬럼 포함, 필터링 전)
+        trade_df: 매매 DataFrame (필터링 전)
+        params_list: 평가할 파라미터 조합 목록 (비어 있지 않음)
 
     Returns:
-        성과 지표 딕셔너리
+        params_list와 같은 순서의 성과 지표 딕셔너리 리스트
 
     Raises:
-        예외 발생 시 즉시 전파
+        ValueError: 유효 데이터 부족 시
     """
-    # WORKER_CACHE에서 DataFrame 조회
-    signal_df = WORKER_CACHE["signal_df"]
-    trade_df = WORKER_CACHE["trade_df"]
-
-    # MA 컬럼 기준으로 유효 행 필터링
-    ma_col = ma_col_name(params.ma_window)
+    ma_col = ma_col_name(params_list[0].ma_window)
     filtered_signal, filtered_trade = filter_valid_rows(signal_df, trade_df, ma_col)
 
-    # BufferZoneStrategy 생성 (파라미터 포함)
-    strategy = BufferZoneStrategy(
-        ma_col=ma_col,
-        buy_buffer_pct=params.buy_buffer_zone_pct,
-        sell_buffer_pct=params.sell_buffer_zone_pct,
-        hold_days=params.hold_days,
+    if len(filtered_signal) < MIN_VALID_ROWS:
+        raise ValueError(f"유효 데이터 부족: {len(filtered_signal)}행 (최소 {MIN_VALID_ROWS}행 필요)")
+
+    initial_capital = params_list[0].initial_capital
+    ma_arrays = {p.ma_window: filtered_signal[ma_col_name(p.ma_window)].to_numpy(dtype=float) for p in params_list}
+    batch = run_buffer_zone_batch(
+        signal_close=filtered_signal[COL_CLOSE].to_numpy(dtype=float),
+        ma_matrix=np.column_stack([ma_arrays[p.ma_window] for p in params_list]),
+        trade_open=filtered_trade[COL_OPEN].to_numpy(dtype=float),
+        trade_close=filtered_trade[COL_CLOSE].to_numpy(dtype=float),
+        buy_buffer_pcts=np.array([p.buy_buffer_zone_pct for p in params_list], dtype=float),
+        sell_buffer_pcts=np.array([p.sell_buffer_zone_pct for p in params_list], dtype=float),
+        hold_days=np.array([p.hold_days for p in params_list], dtype=np.int64),
+        initial_capital=initial_capital,
+    )
+
+    cagr_list = calculate_batch_cagr(
+        batch.final_capital,
+        initial_capital,
+        filtered_signal[COL_DATE].iloc[0],
+        filtered_signal[COL_DATE].iloc[-1],
+    )
+
+    return _build_grid_results(
+        params_list,
+        initial_capital,
+        cagr_list,
+        batch.final_capital,
+        batch.mdd,
+        batch.total_trades,
+        batch.winning_trades,
     )
 
-    _, _, summary = run_backtest(strategy, filtered_signal, filtered_trade, params.initial_capital, log_trades=False)
 
-    # Calmar 계산 (CAGR / |MDD|, MDD=0 안전 처리)
-    calmar = calculate_calmar(summary["cagr"], summary["mdd"])
+def _build_grid_results(
+    params_list: list[BufferStrategyParams],
+    initial_capital: float,
+    cagr_list: list[float],
+    final_capital_arr: np.ndarray,
+    mdd_arr: np.ndarray,
+    total_trades_arr: np.ndarray,
+    winning_trades_arr: np.ndarray,
+) -> list[GridSearchResult]:
+    """배치 커널 결과 배열을 조합별 GridSearchResult 리스트로 변환한다.
+
+    지표 공식은 calculate_summary와 동일하다.
+
+    Args:
+        params_list: 파라미터 조합 목록 (배열의 조합 축 순서와 동일)
+        initial_capital: 초기 자본금
+        cagr_list: 조합별 CAGR (%)
+        final_capital_arr: 조합별 최종 자본
+        mdd_arr: 조합별 MDD (%)
+        total_trades_arr: 조합별 거래 수
+        winning_trades_arr: 조합별 승리 거래 수
 
-    result: GridSearchResult = {
-        COL_MA_WINDOW: params.ma_window,
-        COL_BUY_BUFFER_ZONE_PCT: params.buy_buffer_zone_pct,
-        COL_SELL_BUFFER_ZONE_PCT: params.sell_buffer_zone_pct,
-        COL_HOLD_DAYS: params.hold_days,
-        COL_TOTAL_RETURN_PCT: summary["total_return_pct"],
-        COL_CAGR: summary["cagr"],
-        COL_MDD: summary["mdd"],
-        COL_CALMAR: calmar,
-        COL_TOTAL_TRADES: summary["total_trades"],
-        COL_WIN_RATE: summary["win_rate"],
-        COL_FINAL_CAPITAL: summary["final_capital"],
-    }
+    Returns:
+        params_list와 같은 순서의 성과 지표 딕셔너리 리스트
+    """
+    results: list[GridSearchResult] = []
+    for k, params in enumerate(params_list):
+        final_capital = float(final_capital_arr[k])
+        mdd = float(mdd_arr[k])
+        total_trades = int(total_trades_arr[k])
+        win_rate = (int(winning_trades_arr[k]) / total_trades) * 100 if total_trades > 0 else 0.0
+        results.append(
+            {
+                COL_MA_WINDOW: params.ma_window,
+                COL_BUY_BUFFER_ZONE_PCT: params.buy_buffer_zone_pct,
+                COL_SELL_BUFFER_ZONE_PCT: params.sell_buffer_zone_pct,
+                COL_HOLD_DAYS: params.hold_days,
+                COL_TOTAL_RETURN_PCT: ((final_capital - initial_capital) / initial_capital) * 100,
+                COL_CAGR: cagr_list[k],
+                COL_MDD: mdd,
+                # Calmar 계산 (CAGR / |MDD|, MDD=0 안전 처리)
+                COL_CALMAR: calculate_calmar(cagr_list[k], mdd),
+                COL_TOTAL_TRADES: total_trades,
+                COL_WIN_RATE: win_rate,
+                COL_FINAL_CAPITAL: final_capital,
+            }
+        )
+
+    return results
+
+
+def _build_param_combinations(
+    ma_window_list: list[int],
+    buy_buffer_zone_pct_list: list[float],
+    sell_buffer_zone_pct_list: list[float],
+    hold_days_list: list[int],
+    initial_capital: float,
+) -> list[BufferStrategyParams]:
+    """그리드 파라미터 조합을 ma_window → buy → sell → hold_days 순서로 생성한다."""
+    param_combinations: list[BufferStrategyParams] = []
+
+    for ma_window in ma_window_list:
+        for buy_buffer_zone_pct in buy_buffer_zone_pct_list:
+            for sell_buffer_zone_pct in sell_buffer_zone_pct_list:
+                for hold_days in hold_days_list:
+                    param_combinations.append(
+                        BufferStrategyParams(
+                            ma_window=ma_window,
+                            buy_buffer_zone_pct=buy_buffer_zone_pct,
+                            sell_buffer_zone_pct=sell_buffer_zone_pct,
+                            hold_days=hold_days,
+                            initial_capital=initial_capital,
+                        )
+                    )
 
-    return result
+    return param_combinations
+
+
+def _to_sorted_grid_df(results: list[GridSearchResult]) -> pd.DataFrame:
+    """GridSearchResult 리스트를 Calmar 내림차순 DataFrame으로 변환한다."""
+    results_df = pd.DataFrame(results)
+    return results_df.sort_values(by=COL_CALMAR, ascending=False).reset_index(drop=True)
 
 
 # ============================================================================
@@ -313,14 +408,17 @@ def run_backtest(
     entry_buy_buffer_pct: float = 0.0
     entry_hold_days_used: int = 0
 
+    # 날짜/체결가/평가가 컬럼을 루프 전에 1회 추출 (행마다 iloc으로 Series를 만들지 않음)
+    dates: list[date] = signal_df[COL_DATE].tolist()
+    trade_opens = trade_df[COL_OPEN].to_numpy(dtype=float)
+    trade_closes = trade_df[COL_CLOSE].to_numpy(dtype=float)
+
     # 4. 백테스트 루프 (Day 0부터 시작 — B&H 첫 매수 타이밍 fix)
     # 시그널: signal_df의 close, MA → 전략 내부에서 밴드/돌파 감지
     # 체결: trade_df의 open → 매수/매도 체결가
     # 에쿼티: trade_df의 close → 포지션 평가
     for i in range(0, len(signal_df)):
-        signal_row = signal_df.iloc[i]
-        trade_row = trade_df.iloc[i]
-        current_date = signal_row[COL_DATE]
+        current_date = dates[i]
 
         # 4-0. params_schedule 전환 체크 (strategy 객체 직접 교체)
         # while 루프: 데이터 갭 등으로 여러 전환 날짜를 건너뛰어야 하는 경우 안전 처리
@@ -334,7 +432,7 @@ def run_backtest(
         # 4-1. 예약된 주문 실행 (trade_df의 오늘 시가로 체결)
         if pending_order is not None:
             if pending_order.order_type == "buy" and position == 0:
-                shares, buy_price, cost = execute_buy_order(float(trade_row[COL_OPEN]), capital)
+                shares, buy_price, cost = execute_buy_order(float(trade_opens[i]), capital)
                 if shares > 0:
                     position = shares
                     capital -= cost
@@ -352,9 +450,7 @@ def run_backtest(
 
             elif pending_order.order_type == "sell" and position > 0:
                 assert entry_date is not None, "포지션이 있으면 entry_date는 None이 아니어야 함"
-                sell_price, proceeds, pnl, pnl_pct = execute_sell_order(
-                    float(trade_row[COL_OPEN]), position, entry_price
-                )
+                sell_price, proceeds, pnl, pnl_pct = execute_sell_order(float(trade_opens[i]), position, entry_price)
                 capital += proceeds
                 trade_record = create_trade_record(
                     entry_date=entry_date,
@@ -379,7 +475,7 @@ def run_backtest(
             current_date=current_date,
             capital=capital,
             position=position,
-            close_price=float(trade_row[COL_CLOSE]),
+            close_price=float(trade_closes[i]),
         )
         equity_records.append(equity_record)
 
@@ -446,6 +542,10 @@ def run_grid_search(
     모든 파라미터 조합에 대해 EMA 기반 버퍼존 전략을 실행하고
     성과 지표를 기록한다.
 
+    조합별로 run_backtest를 반복 호출하지 않고, MA 유효 구간이 같은 조합들을
+    grid_kernel.run_buffer_zone_batch로 한 번의 시계열 순회에서 동시에 평가한다.
+    체결 규칙과 연산 순서가 run_backtest와 동일하므로 성과 지표도 동일하다.
+
     Args:
         signal_df: 시그널용 DataFrame (MA 계산 대상)
         trade_df: 매매용 DataFrame (체결가: Open, 에쿼티: Close)
@@ -457,7 +557,12 @@ def run_grid_search(
 
     Returns:
         그리드 탐색 결과 DataFrame (각 조합별 성과 지표 포함)
+
+    Raises:
+        ValueError: 필수 컬럼 누락, 날짜 불일치 또는 유효 데이터 부족 시
     """
+    _validate_backtest_inputs(signal_df, trade_df)
+
     logger.debug(
         f"그리드 탐색 시작: "
         f"ma_window={ma_window_list}, buy_buffer_zone_pct={buy_buffer_zone_pct_list}, "
@@ -466,58 +571,150 @@ def run_grid_search(
     )
 
     # 1. signal_df에 모든 이동평균 기간에 대해 EMA 미리 계산
-    signal_df = signal_df.copy()
-    trade_df = trade_df.copy()
+    # 피처 저장소: 같은 종가로 계산한 EMA는 재사용하고, 원본 컬럼은 복사하지 않는다 (입력은 읽기 전용)
     logger.debug(f"이동평균 사전 계산 (EMA): {sorted(ma_window_list)}")
-
-    for window in ma_window_list:
-        signal_df = add_single_moving_average(signal_df, window, ma_type=DEFAULT_BUFFER_MA_TYPE)
+    signal_df = with_moving_averages(signal_df, ma_window_list, ma_type=DEFAULT_BUFFER_MA_TYPE)
 
     logger.debug("이동평균 사전 계산 완료")
 
     # 2. 파라미터 조합 생성
-    param_combinations: list[dict[str, BufferStrategyParams]] = []
+    param_combinations = _build_param_combinations(
+        ma_window_list, buy_buffer_zone_pct_list, sell_buffer_zone_pct_list, hold_days_list, initial_capital
+    )
 
-    for ma_window in ma_window_list:
-        for buy_buffer_zone_pct in buy_buffer_zone_pct_list:
-            for sell_buffer_zone_pct in sell_buffer_zone_pct_list:
-                for hold_days in hold_days_list:
-                    param_combinations.append(
-                        {
-                            "params": BufferStrategyParams(
-                                ma_window=ma_window,
-                                buy_buffer_zone_pct=buy_buffer_zone_pct,
-                                sell_buffer_zone_pct=sell_buffer_zone_pct,
-                                hold_days=hold_days,
-                                initial_capital=initial_capital,
-                            ),
-                        }
-                    )
+    logger.debug(f"총 {len(param_combinations)}개 조합 배치 실행 시작")
 
-    logger.debug(f"총 {len(param_combinations)}개 조합 병렬 실행 시작 (DataFrame 캐시 사용)")
-
-    # 3. 병렬 실행 (signal_df, trade_df를 워커 캐시에 저장)
-    raw_count = os.cpu_count()
-    cpu_count = raw_count - 1 if raw_count is not None else None
-    results = execute_parallel_with_kwargs(
-        func=_run_backtest_for_grid,
-        inputs=param_combinations,
-        max_workers=cpu_count,
-        initializer=init_worker_cache,
-        initargs=({"signal_df": signal_df, "trade_df": trade_df},),
-    )
+    # 3. MA 유효 구간이 같은 조합끼리 묶어 배치 커널로 평가 (EMA는 보통 전 구간 유효 → 1회 호출)
+    groups: dict[bytes, list[int]] = {}
+    for idx, params in enumerate(param_combinations):
+        valid_key = signal_df[ma_col_name(params.ma_window)].notna().to_numpy().tobytes()
+        groups.setdefault(valid_key, []).append(idx)
 
-    # 4. 딕셔너리 리스트를 DataFrame으로 변환
-    results_df = pd.DataFrame(results)
+    results_by_idx: dict[int, GridSearchResult] = {}
+    for indices in groups.values():
+        group_results = _run_grid_batch(signal_df, trade_df, [param_combinations[idx] for idx in indices])
+        results_by_idx.update(zip(indices, group_results, strict=True))
+    results = [results_by_idx[idx] for idx in range(len(param_combinations))]
 
-    # 5. Calmar 기준 내림차순 정렬
-    results_df = results_df.sort_values(by=COL_CALMAR, ascending=False).reset_index(drop=True)
+    # 4. DataFrame 변환 + Calmar 기준 내림차순 정렬
+    results_df = _to_sorted_grid_df(results)
 
     logger.debug(f"그리드 탐색 완료: {len(results_df)}개 조합 테스트됨")
 
     return results_df
 
 
+class ExpandingGridSearch:
+    """Expanding Anchored WFO용 증분 그리드 서치.
+
+    IS 구간이 항상 데이터 시작일에서 시작하고 종료일만 늘어나는 경우,
+    직전 IS 종료 시점의 조합별 엔진 상태(grid_kernel.BatchKernelState: 현금, 포지션,
+    pending 주문, hold_days 대기 상태, 에쿼티 고점/최저 낙폭)를 체크포인트로 보관하고
+    새로 추가된 구간만 이어서 시뮬레이션한다. 전체 비용이 (데이터 길이 × 윈도우 수)가 아닌
+    데이터 길이에 비례한다.
+
+    EMA(adjust=False)는 재귀식이므로 전체 히스토리로 계산한 값의 앞부분은
+    IS 슬라이스만으로 다시 계산한 값과 같다. 따라서 evaluate_until(is_end)의 결과는
+    [데이터 시작일, is_end] 슬라이스로 run_grid_search를 호출한 결과와 동일하다.
+
+    사용 예:
+        search = ExpandingGridSearch(signal_df, trade_df, [100, 200], [0.03], [0.05], [0, 3])
+        for is_end in is_end_dates:  # 오름차순
+            grid_df = search.evaluate_until(is_end)
+    """
+
+    def __init__(
+        self,
+        signal_df: pd.DataFrame,
+        trade_df: pd.DataFrame,
+        ma_window_list: list[int],
+        buy_buffer_zone_pct_list: list[float],
+        sell_buffer_zone_pct_list: list[float],
+        hold_days_list: list[int],
+        initial_capital: float = DEFAULT_INITIAL_CAPITAL,
+    ) -> None:
+        """전체 구간 EMA와 돌파 판정을 1회 계산하고 초기 상태를 준비한다.
+
+        Args:
+            signal_df: 시그널용 DataFrame (날짜 오름차순, EMA는 내부에서 계산)
+            trade_df: 매매용 DataFrame (signal_df와 날짜 일치)
+            ma_window_list: 이동평균 기간 목록
+            buy_buffer_zone_pct_list: 매수 버퍼존 비율 목록
+            sell_buffer_zone_pct_list: 매도 버퍼존 비율 목록
+            hold_days_list: 유지조건 일수 목록
+            initial_capital: 초기 자본금
+
+        Raises:
+            ValueError: 필수 컬럼 누락, 날짜 불일치, 또는 EMA에 NaN이 포함된 경우
+        """
+        _validate_backtest_inputs(signal_df, trade_df)
+
+        self._params_list = _build_param_combinations(
+            ma_window_list, buy_buffer_zone_pct_list, sell_buffer_zone_pct_list, hold_days_list, initial_capital
+        )
+        self._initial_capital = initial_capital
+        self._dates: list[date] = signal_df[COL_DATE].tolist()
+
+        # run_grid_search와 동일하게 Close로부터 EMA를 계산한다 (피처 저장소 경유)
+        store = get_feature_store()
+        ma_arrays: dict[int, np.ndarray] = {}
+        for window in dict.fromkeys(ma_window_list):
+            ma_values = store.get(cast(pd.Series, signal_df[COL_CLOSE]), window, ma_type=DEFAULT_BUFFER_MA_TYPE)
+            if np.isnan(ma_values).any():
+                # 증분 모드는 모든 IS 구간이 같은 시작 행을 공유해야 하므로 MA 결측을 허용하지 않는다
+                raise ValueError(f"증분 그리드 서치는 MA 결측을 지원하지 않습니다: {ma_col_name(window)}")
+            ma_arrays[window] = ma_values
+
+        self._flags = compute_batch_signal_flags(
+            signal_df[COL_CLOSE].to_numpy(dtype=float),
+            np.column_stack([ma_arrays[p.ma_window] for p in self._params_list]),
+            np.array([p.buy_buffer_zone_pct for p in self._params_list], dtype=float),
+            np.array([p.sell_buffer_zone_pct for p in self._params_list], dtype=float),
+        )
+        self._trade_open = trade_df[COL_OPEN].to_numpy(dtype=float)
+        self._trade_close = trade_df[COL_CLOSE].to_numpy(dtype=float)
+        self._hold_days = np.array([p.hold_days for p in self._params_list], dtype=np.int64)
+        self._state = init_batch_state(len(self._params_list), initial_capital)
+
+    def evaluate_until(self, is_end: date) -> pd.DataFrame:
+        """[데이터 시작일, is_end] 구간의 그리드 서치 결과를 반환한다.
+
+        직전 호출의 체크포인트에서 이어서 진행하므로 is_end는 단조 비감소여야 한다.
+
+        Args:
+            is_end: IS 종료일 (포함)
+
+        Returns:
+            run_grid_search와 같은 형식의 결과 DataFrame (Calmar 내림차순)
+
+        Raises:
+            ValueError: is_end가 직전 호출보다 앞서거나 유효 데이터가 부족한 경우
+        """
+        stop = bisect_right(self._dates, is_end)
+        if stop < self._state.next_bar:
+            raise ValueError(
+                f"is_end는 직전 호출 이후여야 합니다: is_end={is_end}, checkpoint={self._dates[self._state.next_bar - 1]}"
+            )
+        if stop < MIN_VALID_ROWS:
+            raise ValueError(f"유효 데이터 부족: {stop}행 (최소 {MIN_VALID_ROWS}행 필요)")
+
+        advance_batch(self._state, self._flags, self._trade_open, self._trade_close, self._hold_days, stop)
+
+        cagr_list = calculate_batch_cagr(
+            self._state.last_equity, self._initial_capital, self._dates[0], self._dates[stop - 1]
+        )
+        results = _build_grid_results(
+            self._params_list,
+            self._initial_capital,
+            cagr_list,
+            self._state.last_equity,
+            self._state.min_drawdown * 100,
+            self._state.total_trades,
+            self._state.winning_trades,
+        )
+        return _to_sorted_grid_df(results)
+
+
 def run_buffer_strategy(
     signal_df: pd.DataFrame,
     trade_df: pd.DataFrame,
@@ -563,11 +760,9 @@ def run_buffer_strategy(
 
     # 2. 초기 MA 계산
     ma_col = ma_col_name(params.ma_window)
-    signal_df = signal_df.copy()
-    trade_df = trade_df.copy()
 
     if ma_col not in signal_df.columns:
-        signal_df = add_single_moving_average(signal_df, params.ma_window, ma_type=DEFAULT_BUFFER_MA_TYPE)
+        signal_df = with_moving_averages(signal_df, [params.ma_window], ma_type=DEFAULT_BUFFER_MA_TYPE)
 
     # 3. MA 유효 구간 필터링 (초기 MA 기준)
     filtered_signal, filtered_trade = filter_valid_rows(signal_df, trade_df, ma_col)
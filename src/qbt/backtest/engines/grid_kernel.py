@@ -0,0 +1,402 @@
+"""버퍼존 배치 시뮬레이션 커널
+
+여러 버퍼존 파라미터 조합을 한 번의 시계열 순회로 동시에 시뮬레이션한다.
+상태(현금, 포지션, pending 주문, hold_days 대기 상태)를 조합 축의 NumPy 배열로 유지하고,
+밴드 계산과 돌파 판정은 (bars × combos) 2-D 배열로 루프 전에 일괄 계산한다.
+
+run_backtest + BufferZoneStrategy와 동일한 체결 규칙을 따르며,
+동일한 부동소수점 연산 순서를 사용하므로 결과(final_capital, MDD, 거래 수 등)가 일치한다.
+
+핵심 실행 규칙 (run_backtest와 동일):
+- 시그널: i일 종가 기준 상향/하향 돌파 (i=0은 초기화만 수행)
+- 체결: i+1일 시가 (슬리피지 적용), 매수는 전액 정수 주 매수
+- 포지션 없음 → 매수 판정만, 포지션 보유 → 매도 판정만
+- equity = cash + position × 종가
+- 강제청산 없음
+
+상태 재개:
+BatchKernelState는 조합별 엔진 상태 전체(현금, 포지션, pending, hold 상태, 에쿼티 고점, 최저 낙폭)를
+담는다. advance_batch()로 stop 직전까지 진행한 상태를 그대로 보관했다가 이후 더 긴 구간으로
+이어서 진행할 수 있다 (Expanding WFO의 IS 체크포인트).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from qbt.backtest.constants import SLIPPAGE_RATE
+from qbt.common_constants import ANNUAL_DAYS
+
+# ============================================================================
+# 데이터클래스
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class BatchSignalFlags:
+    """조합별 돌파 판정 사전 계산 결과 (모든 배열 shape: bars × N).
+
+    Attributes:
+        above_upper: 당일 종가 > 당일 상단밴드 (hold_days 유지 조건)
+        buy_cross: 상향돌파 (전일 종가 <= 전일 상단밴드 AND 당일 종가 > 당일 상단밴드)
+        sell_cross: 하향돌파 (전일 종가 >= 전일 하단밴드 AND 당일 종가 < 당일 하단밴드)
+    """
+
+    above_upper: np.ndarray
+    buy_cross: np.ndarray
+    sell_cross: np.ndarray
+
+
+@dataclass
+class BatchKernelState:
+    """배치 커널의 조합별 엔진 상태 (체크포인트). 배열의 길이는 모두 N이다.
+
+    Attributes:
+        next_bar: 다음에 처리할 시계열 인덱스
+        capital: 현금
+        position: 보유 수량 (정수 주 수를 float64로 보관)
+        entry_price: 진입가 (슬리피지 포함)
+        pending_buy: 다음 시가 매수 예약 여부
+        pending_sell: 다음 시가 매도 예약 여부
+        hold_active: hold_days 대기 상태 여부
+        days_passed: hold_days 대기 경과일
+        total_trades: 청산 완료 거래 수
+        winning_trades: pnl > 0 거래 수
+        peak: 에쿼티 고점
+        min_drawdown: 최저 낙폭 비율 (0 이하, % 아님)
+        last_equity: 마지막 처리 시점의 에쿼티
+    """
+
+    next_bar: int
+    capital: np.ndarray
+    position: np.ndarray
+    entry_price: np.ndarray
+    pending_buy: np.ndarray
+    pending_sell: np.ndarray
+    hold_active: np.ndarray
+    days_passed: np.ndarray
+    total_trades: np.ndarray
+    winning_trades: np.ndarray
+    peak: np.ndarray
+    min_drawdown: np.ndarray
+    last_equity: np.ndarray
+
+
+@dataclass(frozen=True)
+class BatchSimulationResult:
+    """run_buffer_zone_batch() 반환 타입. 모든 배열의 조합 축 길이는 N이다.
+
+    Attributes:
+        equity: 일별 에쿼티 (shape: bars × N)
+        final_capital: 마지막 에쿼티 (shape: N)
+        mdd: 최대 낙폭 (%, 0 이하, shape: N)
+        total_trades: 청산 완료 거래 수 (shape: N)
+        winning_trades: pnl > 0 거래 수 (shape: N)
+    """
+
+    equity: np.ndarray
+    final_capital: np.ndarray
+    mdd: np.ndarray
+    total_trades: np.ndarray
+    winning_trades: np.ndarray
+
+
+# ============================================================================
+# 커널 구성 요소
+# ============================================================================
+
+
+def compute_batch_signal_flags(
+    signal_close: np.ndarray,
+    ma_matrix: np.ndarray,
+    buy_buffer_pcts: np.ndarray,
+    sell_buffer_pcts: np.ndarray,
+) -> BatchSignalFlags:
+    """조합별 밴드를 계산하고 돌파 판정을 (bars × N) 배열로 사전 계산한다.
+
+    compute_bands / detect_buy_signal / detect_sell_signal과 동일한 연산을 사용한다.
+    i=0 행의 돌파 플래그는 항상 False다 (전략의 최초 호출은 초기화만 수행).
+
+    Args:
+        signal_close: 시그널 종가 (shape: bars)
+        ma_matrix: 조합별 이동평균 (shape: bars × N)
+        buy_buffer_pcts: 조합별 매수 버퍼존 비율 (shape: N)
+        sell_buffer_pcts: 조합별 매도 버퍼존 비율 (shape: N)
+
+    Returns:
+        BatchSignalFlags
+    """
+    n_bars, n_combos = ma_matrix.shape
+    upper = ma_matrix * (1 + buy_buffer_pcts)
+    lower = ma_matrix * (1 - sell_buffer_pcts)
+    close_col = signal_close[:, None]
+
+    above_upper = close_col > upper
+    buy_cross = np.zeros((n_bars, n_combos), dtype=bool)
+    sell_cross = np.zeros((n_bars, n_combos), dtype=bool)
+    buy_cross[1:] = (close_col[:-1] <= upper[:-1]) & above_upper[1:]
+    sell_cross[1:] = (close_col[:-1] >= lower[:-1]) & (close_col[1:] < lower[1:])
+
+    return BatchSignalFlags(above_upper=above_upper, buy_cross=buy_cross, sell_cross=sell_cross)
+
+
+def init_batch_state(n_combos: int, initial_capital: float) -> BatchKernelState:
+    """시뮬레이션 시작(0번째 행 이전) 상태를 생성한다.
+
+    Args:
+        n_combos: 파라미터 조합 수
+        initial_capital: 초기 자본금
+
+    Returns:
+        next_bar=0인 초기 상태
+
+    Raises:
+        ValueError: initial_capital <= 0인 경우
+    """
+    if initial_capital <= 0:
+        raise ValueError(f"initial_capital은 양수여야 합니다: {initial_capital}")
+
+    return BatchKernelState(
+        next_bar=0,
+        capital=np.full(n_combos, float(initial_capital)),
+        position=np.zeros(n_combos),
+        entry_price=np.zeros(n_combos),
+        pending_buy=np.zeros(n_combos, dtype=bool),
+        pending_sell=np.zeros(n_combos, dtype=bool),
+        hold_active=np.zeros(n_combos, dtype=bool),
+        days_passed=np.zeros(n_combos, dtype=np.int64),
+        total_trades=np.zeros(n_combos, dtype=np.int64),
+        winning_trades=np.zeros(n_combos, dtype=np.int64),
+        peak=np.zeros(n_combos),
+        min_drawdown=np.zeros(n_combos),
+        last_equity=np.full(n_combos, float(initial_capital)),
+    )
+
+
+def advance_batch(
+    state: BatchKernelState,
+    flags: BatchSignalFlags,
+    trade_open: np.ndarray,
+    trade_close: np.ndarray,
+    hold_days: np.ndarray,
+    stop: int,
+    equity_out: np.ndarray | None = None,
+) -> None:
+    """state.next_bar부터 stop 직전 행까지 시뮬레이션을 진행한다 (state를 in-place 갱신).
+
+    stop 행 이후 데이터는 참조하지 않으므로, [0, stop) 구간만으로 실행한 결과와
+    동일한 상태가 된다. 마지막 행의 신호는 pending으로 남아 이어지는 진행에서 체결된다.
+
+    Args:
+        state: 진행할 상태 (in-place 갱신)
+        flags: compute_batch_signal_flags() 결과
+        trade_open: 매매 시가 (shape: bars)
+        trade_close: 매매 종가 (shape: bars)
+        hold_days: 조합별 유지조건 일수 (shape: N)
+        stop: 진행 종료 인덱스 (미포함, state.next_bar 이상 bars 이하)
+        equity_out: 일별 에쿼티를 기록할 배열 (shape: bars × N, None이면 기록 안 함)
+
+    Raises:
+        ValueError: stop이 진행 가능 범위를 벗어난 경우
+    """
+    n_bars = flags.buy_cross.shape[0]
+    if stop < state.next_bar or stop > n_bars:
+        raise ValueError(f"stop 범위 오류: next_bar={state.next_bar}, stop={stop}, bars={n_bars}")
+
+    hold_required = hold_days.astype(np.int64)
+    immediate = hold_required == 0
+
+    capital = state.capital
+    position = state.position
+    entry_price = state.entry_price
+    pending_buy = state.pending_buy
+    pending_sell = state.pending_sell
+    hold_active = state.hold_active
+    days_passed = state.days_passed
+    peak = state.peak
+    min_drawdown = state.min_drawdown
+    equity = state.last_equity
+
+    for i in range(state.next_bar, stop):
+        # 1. 예약된 주문 실행 (오늘 시가)
+        if pending_buy.any():
+            buy_price = float(trade_open[i]) * (1 + SLIPPAGE_RATE)
+            shares = np.floor(capital / buy_price)
+            filled = pending_buy & (shares > 0)
+            capital = np.where(filled, capital - shares * buy_price, capital)
+            position = np.where(filled, shares, position)
+            entry_price = np.where(filled, buy_price, entry_price)
+            pending_buy = np.zeros_like(pending_buy)
+
+        if pending_sell.any():
+            sell_price = float(trade_open[i]) * (1 - SLIPPAGE_RATE)
+            sold = pending_sell & (position > 0)
+            pnl = (sell_price - entry_price) * position
+            capital = np.where(sold, capital + position * sell_price, capital)
+            state.total_trades += sold
+            state.winning_trades += sold & (pnl > 0)
+            position = np.where(sold, 0.0, position)
+            pending_sell = np.zeros_like(pending_sell)
+
+        # 2. 에쿼티 기록 (오늘 종가) 및 낙폭 갱신
+        holding = position > 0
+        equity = np.where(holding, capital + position * float(trade_close[i]), capital)
+        if equity_out is not None:
+            equity_out[i] = equity
+        peak = np.maximum(peak, equity)
+        if i == 0 and (peak == 0).any():
+            # peak는 비감소이므로 첫 행만 확인하면 충분하다
+            raise RuntimeError("내부 불변조건 위반: equity peak에 0이 존재 (initial_capital > 0이면 불가능)")
+        min_drawdown = np.minimum(min_drawdown, (equity - peak) / peak)
+
+        # 3. 신호 판정 (i=0은 prev 밴드 초기화만 수행)
+        if i == 0:
+            continue
+
+        flat = ~holding
+
+        # hold_days 대기 중: 상단밴드 위 유지 시 days_passed 증가, 충족 시 매수, 이탈 시 해제
+        waiting = flat & hold_active
+        keep = waiting & flags.above_upper[i]
+        next_days = days_passed + 1
+        fire_hold = keep & (next_days >= hold_required)
+        days_passed = np.where(keep & ~fire_hold, next_days, days_passed)
+        hold_active = hold_active & ~(waiting & ~keep) & ~fire_hold
+
+        # 대기 상태가 아닌 경우: 상향돌파 감지
+        breakout = flat & ~waiting & flags.buy_cross[i]
+        fire_immediate = breakout & immediate
+        start_hold = breakout & ~immediate
+        hold_active = hold_active | start_hold
+        days_passed = np.where(start_hold, 0, days_passed)
+
+        pending_buy = fire_hold | fire_immediate
+        pending_sell = holding & flags.sell_cross[i]
+
+    state.next_bar = stop
+    state.capital = capital
+    state.position = position
+    state.entry_price = entry_price
+    state.pending_buy = pending_buy
+    state.pending_sell = pending_sell
+    state.hold_active = hold_active
+    state.days_passed = days_passed
+    state.peak = peak
+    state.min_drawdown = min_drawdown
+    state.last_equity = equity
+
+
+# ============================================================================
+# 커널
+# ============================================================================
+
+
+def run_buffer_zone_batch(
+    signal_close: np.ndarray,
+    ma_matrix: np.ndarray,
+    trade_open: np.ndarray,
+    trade_close: np.ndarray,
+    buy_buffer_pcts: np.ndarray,
+    sell_buffer_pcts: np.ndarray,
+    hold_days: np.ndarray,
+    initial_capital: float,
+) -> BatchSimulationResult:
+    """N개 버퍼존 파라미터 조합을 한 번의 시계열 순회로 시뮬레이션한다.
+
+    입력 배열은 MA 유효 구간으로 사전 필터링되어 있어야 한다 (NaN 불가).
+    조합마다 MA가 다를 수 있으므로 ma_matrix의 각 열이 해당 조합의 MA 시계열이다.
+
+    Args:
+        signal_close: 시그널 종가 (shape: bars)
+        ma_matrix: 조합별 이동평균 (shape: bars × N)
+        trade_open: 매매 시가 (shape: bars)
+        trade_close: 매매 종가 (shape: bars)
+        buy_buffer_pcts: 조합별 매수 버퍼존 비율 (shape: N)
+        sell_buffer_pcts: 조합별 매도 버퍼존 비율 (shape: N)
+        hold_days: 조합별 유지조건 일수 (shape: N)
+        initial_capital: 초기 자본금
+
+    Returns:
+        BatchSimulationResult
+
+    Raises:
+        ValueError: 배열 shape 불일치 또는 initial_capital <= 0인 경우
+    """
+    n_bars, n_combos = ma_matrix.shape
+    validate_batch_shapes(
+        signal_close, ma_matrix, trade_open, trade_close, buy_buffer_pcts, sell_buffer_pcts, hold_days
+    )
+
+    flags = compute_batch_signal_flags(signal_close, ma_matrix, buy_buffer_pcts, sell_buffer_pcts)
+    state = init_batch_state(n_combos, initial_capital)
+    equity = np.empty((n_bars, n_combos))
+    advance_batch(state, flags, trade_open, trade_close, hold_days, n_bars, equity_out=equity)
+
+    return BatchSimulationResult(
+        equity=equity,
+        final_capital=state.last_equity.copy(),
+        mdd=state.min_drawdown * 100,
+        total_trades=state.total_trades,
+        winning_trades=state.winning_trades,
+    )
+
+
+def validate_batch_shapes(
+    signal_close: np.ndarray,
+    ma_matrix: np.ndarray,
+    trade_open: np.ndarray,
+    trade_close: np.ndarray,
+    buy_buffer_pcts: np.ndarray,
+    sell_buffer_pcts: np.ndarray,
+    hold_days: np.ndarray,
+) -> None:
+    """배치 커널 입력 배열의 shape 정합성을 검증한다.
+
+    Raises:
+        ValueError: 시계열 길이 또는 조합 수가 일치하지 않는 경우
+    """
+    n_bars, n_combos = ma_matrix.shape
+    if signal_close.shape != (n_bars,) or trade_open.shape != (n_bars,) or trade_close.shape != (n_bars,):
+        raise ValueError(
+            f"시계열 배열 길이 불일치: ma_matrix={ma_matrix.shape}, signal_close={signal_close.shape}, "
+            f"trade_open={trade_open.shape}, trade_close={trade_close.shape}"
+        )
+    if buy_buffer_pcts.shape != (n_combos,) or sell_buffer_pcts.shape != (n_combos,) or hold_days.shape != (n_combos,):
+        raise ValueError(
+            f"파라미터 배열 길이 불일치: combos={n_combos}, buy={buy_buffer_pcts.shape}, "
+            f"sell={sell_buffer_pcts.shape}, hold_days={hold_days.shape}"
+        )
+
+
+def calculate_batch_cagr(
+    final_capital: np.ndarray,
+    initial_capital: float,
+    start_date: date,
+    end_date: date,
+) -> list[float]:
+    """배치 결과의 조합별 CAGR(%)를 계산한다 (calculate_summary와 동일 공식).
+
+    Args:
+        final_capital: 조합별 최종 자본 (shape: N)
+        initial_capital: 초기 자본금
+        start_date: 시작일
+        end_date: 종료일
+
+    Returns:
+        조합별 CAGR 리스트 (퍼센트 단위)
+
+    Raises:
+        RuntimeError: 기간이 0 이하이거나 final_capital <= 0인 경우 (정상 흐름에서는 도달 불가)
+    """
+    years = float((pd.Timestamp(end_date) - pd.Timestamp(start_date)).days) / ANNUAL_DAYS
+    if years <= 0:
+        raise RuntimeError(f"내부 불변조건 위반: years <= 0 (start_date={start_date}, end_date={end_date}, years={years})")
+
+    cagr_list: list[float] = []
+    for value in final_capital.tolist():
+        if value <= 0:
+            raise RuntimeError(f"내부 불변조건 위반: final_capital <= 0 (final_capital={value})")
+        cagr_list.append(((value / initial_capital) ** (1 / years) - 1) * 100)
+    return cagr_list
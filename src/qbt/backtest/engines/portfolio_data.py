@@ -1,25 +1,42 @@
 """포트폴리오 데이터 — 자산 데이터 로딩/검증 및 에쿼티 DataFrame 빌드 함수"""
 
-from typing import Any
+from collections.abc import Mapping
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from qbt.backtest.analysis import calculate_drawdown_pct_series
-from qbt.backtest.constants import COL_EQUITY
-from qbt.backtest.portfolio_types import (
-    ASSET_COL_SUFFIX_SHARES,
-    AssetSlotConfig,
-    PortfolioConfig,
-    asset_shares_col,
-    asset_value_col,
-)
+from qbt.backtest.engines.portfolio_recorder import PortfolioRecorder
+from qbt.backtest.portfolio_types import AssetSlotConfig, PortfolioConfig
 from qbt.backtest.strategy_registry import STRATEGY_REGISTRY
 from qbt.common_constants import EPSILON
 from qbt.utils.data_loader import extract_overlap_period, load_stock_data
 
 
+def get_stock_data(path: Path, data_frames: Mapping[str, pd.DataFrame] | None = None) -> pd.DataFrame:
+    """미리 로딩된 DataFrame이 있으면 그대로, 없으면 CSV에서 주식 데이터를 로딩한다.
+
+    여러 실험을 한 번에 실행하는 스케줄러가 경로별 데이터를 1회만 로딩해 넘겨줄 때 사용한다.
+    반환된 DataFrame은 여러 실험이 공유할 수 있으므로 제자리 수정하지 않는다.
+
+    Args:
+        path: 주식 데이터 CSV 경로
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 항상 CSV 로딩)
+
+    Returns:
+        주식 데이터 DataFrame
+    """
+    if data_frames is not None:
+        preloaded = data_frames.get(str(path))
+        if preloaded is not None:
+            return preloaded
+    return load_stock_data(path)
+
+
 def load_and_prepare_data(
     slot: AssetSlotConfig,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """자산 슬롯의 데이터를 로딩하고 전략별 전처리를 적용한다.
 
@@ -28,12 +45,13 @@ def load_and_prepare_data(
 
     Args:
         slot: 자산 슬롯 설정
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 CSV 로딩)
 
     Returns:
         (signal_df, trade_df) — buffer_zone이면 MA 컬럼 포함
     """
-    signal_df = load_stock_data(slot.signal_data_path)
-    trade_df = load_stock_data(slot.trade_data_path)
+    signal_df = get_stock_data(slot.signal_data_path, data_frames)
+    trade_df = get_stock_data(slot.trade_data_path, data_frames)
 
     # signal/trade 데이터 경로가 다르면 교집합 기간 추출
     if slot.signal_data_path != slot.trade_data_path:
@@ -85,10 +103,10 @@ def validate_portfolio_config(config: PortfolioConfig) -> None:
 
 
 def build_combined_equity(
-    equity_rows: list[dict[str, Any]],
+    recorder: PortfolioRecorder,
     initial_capital: float,
 ) -> pd.DataFrame:
-    """에쿼티 행 목록을 DataFrame으로 변환하고 파생 뷰 컬럼을 계산한다.
+    """기록기의 컬럼 배열로 에쿼티 DataFrame을 만들고 파생 뷰 컬럼을 계산한다.
 
     추가하는 파생 컬럼:
         - drawdown_pct: equity 곡선 기준 드로우다운(%)
@@ -100,83 +118,51 @@ def build_combined_equity(
 
     이 컬럼들은 보유 현황·수익률·기여도 표시 용도이며, 단일 진실 공급원(SSoT) 원칙에 따라
     엔진에서 한 번만 계산한다 (대시보드 등 CLI 계층에서 동일 계산 중복 금지).
+    파생 컬럼은 기록기의 자산별 배열에서 바로 계산하고, DataFrame은 마지막에 한 번만 만든다.
+    기록기가 자산별 보유 현황을 기록하지 않은 경우(capture_level "summary" 이하) 자산별 컬럼은 생략된다.
+
+    Args:
+        recorder: 엔진 메인 루프가 채운 PortfolioRecorder
+        initial_capital: 초기 자본금 (양수)
+
+    Returns:
+        equity_df (PortfolioResult.equity_df 컬럼 명세)
+
+    Raises:
+        ValueError: initial_capital이 양수가 아닌 경우
     """
     if initial_capital <= 0:
         # 입력 검증: PortfolioConfig.total_capital은 양수여야 한다.
         raise ValueError(f"initial_capital은 양수여야 합니다: {initial_capital}")
 
-    equity_df = pd.DataFrame(equity_rows)
+    columns = recorder.equity_columns()
 
     # drawdown 계산 (analysis.py의 공용 함수 사용 — 방어 로직 통일)
-    equity_df["drawdown_pct"] = calculate_drawdown_pct_series(equity_df[COL_EQUITY])
-
-    # 파생 뷰 컬럼 계산
-    _attach_holding_view_columns(equity_df, initial_capital)
-
-    return equity_df
-
+    columns["drawdown_pct"] = calculate_drawdown_pct_series(pd.Series(recorder.equity)).to_numpy()
 
-def _attach_holding_view_columns(equity_df: pd.DataFrame, initial_capital: float) -> None:
-    """equity_df에 보유 현황 파생 컬럼을 in-place로 추가한다.
+    # 자산별 current_price / return_pct / contribution (보유 현황을 기록한 수준에서만)
+    for j, asset_id in enumerate(recorder.asset_ids if recorder.records_holdings else ()):
+        shares = recorder.shares[j]
+        avg_price = recorder.avg_price[j]
+        has_position = shares > 0
 
-    자산 식별: `{asset_id}_shares` 패턴의 컬럼에서 asset_id를 추론한다.
-    각 자산에 대해 current_price, return_pct, contribution을 계산하고,
-    포트폴리오 단위로 total_pnl, total_return_pct를 계산한다.
-
-    Args:
-        equity_df: equity_rows로부터 만든 DataFrame (in-place로 컬럼 추가)
-        initial_capital: 초기 자본금 (양수)
-    """
-    # 1. 자산 식별: {asset_id}_shares 컬럼에서 asset_id 추출
-    asset_ids = [
-        col[: -len(ASSET_COL_SUFFIX_SHARES)] for col in equity_df.columns if col.endswith(ASSET_COL_SUFFIX_SHARES)
-    ]
-
-    # 2. 자산별 current_price / return_pct / contribution
-    for asset_id in asset_ids:
-        shares_col = asset_shares_col(asset_id)
-        value_col = asset_value_col(asset_id)
-        avg_price_col = f"{asset_id}_avg_price"
-        realized_pnl_col = f"{asset_id}_realized_pnl"
-        unrealized_pnl_col = f"{asset_id}_unrealized_pnl"
-        current_price_col = f"{asset_id}_current_price"
-        return_pct_col = f"{asset_id}_return_pct"
-        contribution_col = f"{asset_id}_contribution"
-
-        if value_col not in equity_df.columns or avg_price_col not in equity_df.columns:
-            # 입력 row가 표준 포맷이 아니면 안전하게 0 처리 — 정상 흐름에서는 도달 불가
-            equity_df[current_price_col] = 0.0
-            equity_df[return_pct_col] = 0.0
-            equity_df[contribution_col] = 0.0
-            continue
-
-        shares_series = equity_df[shares_col]
-        value_series = equity_df[value_col]
-        avg_price_series = equity_df[avg_price_col]
-
-        has_position = shares_series > 0
         # current_price = value / shares (보유 시), 그 외 0.0
-        current_price_series = pd.Series(0.0, index=equity_df.index)
-        current_price_series.loc[has_position] = value_series.loc[has_position] / shares_series.loc[has_position]
-        equity_df[current_price_col] = current_price_series
+        current_price = np.zeros(recorder.n_days, dtype=np.float64)
+        current_price[has_position] = recorder.value[j][has_position] / shares[has_position]
+        columns[f"{asset_id}_current_price"] = current_price
 
         # return_pct = (current_price / avg_price - 1) * 100 (보유 + 유효 평균가), 그 외 0.0
-        valid_for_return = has_position & (avg_price_series > 0)
-        return_pct_series = pd.Series(0.0, index=equity_df.index)
-        return_pct_series.loc[valid_for_return] = (
-            current_price_series.loc[valid_for_return] / avg_price_series.loc[valid_for_return] - 1.0
-        ) * 100.0
-        equity_df[return_pct_col] = return_pct_series
+        valid_for_return = has_position & (avg_price > 0)
+        return_pct = np.zeros(recorder.n_days, dtype=np.float64)
+        return_pct[valid_for_return] = (current_price[valid_for_return] / avg_price[valid_for_return] - 1.0) * 100.0
+        columns[f"{asset_id}_return_pct"] = return_pct
 
         # contribution = realized_pnl + unrealized_pnl (자산별 누적 기여 손익)
-        # portfolio_engine이 매 거래일 두 컬럼을 모두 채워주므로 부재는 내부 불변조건 위반.
-        if realized_pnl_col not in equity_df.columns or unrealized_pnl_col not in equity_df.columns:
-            raise RuntimeError(
-                f"내부 불변조건 위반: {realized_pnl_col}/{unrealized_pnl_col} 컬럼이 누락되었습니다 "
-                f"(asset_id={asset_id}). portfolio_engine 출력 스키마를 확인하세요."
-            )
-        equity_df[contribution_col] = equity_df[realized_pnl_col] + equity_df[unrealized_pnl_col]
+        columns[f"{asset_id}_contribution"] = recorder.realized_pnl[j] + recorder.unrealized_pnl[j]
+
+    # 포트폴리오 누적 손익
+    total_pnl = recorder.equity - initial_capital
+    columns["total_pnl"] = total_pnl
+    columns["total_return_pct"] = (total_pnl / initial_capital) * 100.0
 
-    # 3. 포트폴리오 누적 손익
-    equity_df["total_pnl"] = equity_df[COL_EQUITY] - initial_capital
-    equity_df["total_return_pct"] = (equity_df["total_pnl"] / initial_capital) * 100.0
+    return pd.DataFrame(columns)
@@ -12,14 +12,17 @@
 - projected state: signal intent 반영 후 리밸런싱 계획 → planning 왜곡 방지
 - 체결 기준: 익일 open 가격 (Lookahead 방지)
 - 체결 흐름: SELL 먼저 체결 → available_cash 확정 → BUY 체결 (execute_orders)
+- 일별 상태: 시가/종가는 (거래일 수, 자산 수) 배열, 현금/보유/진입 정보는 슬롯 순서 장부(PortfolioBook)
 - 현금 부족 시: BUY 총 비용이 available_cash 초과이면 raw_shares × scale_factor로 비례 축소
 - 부분 매도: 리밸런싱 REDUCE_TO_TARGET은 delta_amount 기준 수량, 신호 EXIT_ALL은 전량
 - 결과: PortfolioResult (equity_df, trades_df, per_asset, summary)
 """
 
+from collections.abc import Mapping, Sequence
 from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from qbt.backtest.analysis import calculate_summary
@@ -38,46 +41,45 @@ from qbt.backtest.constants import (
 from qbt.backtest.engines.engine_common import PortfolioTradeRecord
 from qbt.backtest.engines.portfolio_data import (
     build_combined_equity,
+    get_stock_data,
     load_and_prepare_data,
     validate_portfolio_config,
 )
-from qbt.backtest.engines.portfolio_execution import execute_orders
+from qbt.backtest.engines.portfolio_execution import PortfolioBook
 from qbt.backtest.engines.portfolio_planning import (
     OrderIntent,
-    compute_portfolio_equity,
     compute_projected_portfolio,
-    create_strategy_for_slot,
     generate_signal_intents,
     merge_intents,
 )
 from qbt.backtest.engines.portfolio_rebalance import (
     DEFAULT_REBALANCE_POLICY,
+    RebalancePolicy,
     is_first_trading_day_of_month,
 )
+from qbt.backtest.engines.portfolio_recorder import PortfolioRecorder
+from qbt.backtest.engines.portfolio_signals import PrecomputedSignalStrategy
 from qbt.backtest.portfolio_types import (
+    PORTFOLIO_CAPTURE_LEVELS,
     AssetState,
     PortfolioAssetResult,
+    PortfolioCaptureLevel,
     PortfolioConfig,
     PortfolioResult,
-    asset_close_col,
-    asset_executed_intent_col,
-    asset_pending_intent_col,
-    asset_shares_col,
-    asset_signal_today_col,
-    asset_value_col,
-    asset_weight_col,
 )
 from qbt.backtest.strategies.strategy_common import SignalStrategy
 from qbt.backtest.strategy_registry import STRATEGY_REGISTRY
 from qbt.common_constants import COL_CLOSE, COL_DATE, COL_OPEN, EPSILON
 from qbt.utils import get_logger
-from qbt.utils.data_loader import extract_overlap_period, load_stock_data
+from qbt.utils.data_loader import extract_overlap_period
+from qbt.utils.date_index import align_frames
 
 logger = get_logger(__name__)
 
 
 def _load_portfolio_data_with_common_period(
     config: PortfolioConfig,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
 ) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame], dict[str, Any], int]:
     """자산별 데이터 로딩 → 공통 기간 필터링 → MA 워밍업 인덱스 계산.
 
@@ -86,6 +88,7 @@ def _load_portfolio_data_with_common_period(
 
     Args:
         config: 포트폴리오 실험 설정
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 CSV 로딩)
 
     Returns:
         (asset_signal_dfs, asset_trade_dfs, slot_dict, valid_start_index) 튜플.
@@ -93,7 +96,7 @@ def _load_portfolio_data_with_common_period(
         asset_signal_dfs, asset_trade_dfs는 공통 기간으로 필터링된 상태 (워밍업 슬라이싱 미적용).
 
     Raises:
-        ValueError: 공통 기간 없음 또는 MA 컬럼 누락 시
+        ValueError: 공통 기간 없음, 시그널 데이터에 공통 거래일 누락 또는 MA 컬럼 누락 시
     """
     # 1. 자산별 데이터 로딩 + MA 계산 (signal_data_path 기준 캐시, 슬롯별 MA 파라미터 사용)
     signal_cache: dict[str, pd.DataFrame] = {}
@@ -104,36 +107,22 @@ def _load_portfolio_data_with_common_period(
     for slot in config.asset_slots:
         signal_key = f"{slot.signal_data_path}::{slot.strategy_id}::{slot.ma_window}::{slot.ma_type}"
         if signal_key not in signal_cache:
-            signal_df_raw, trade_df = load_and_prepare_data(slot)
+            signal_df_raw, trade_df = load_and_prepare_data(slot, data_frames)
             signal_cache[signal_key] = signal_df_raw
         else:
             signal_df_raw = signal_cache[signal_key]
-            trade_df = load_stock_data(slot.trade_data_path)
+            trade_df = get_stock_data(slot.trade_data_path, data_frames)
             if slot.signal_data_path != slot.trade_data_path:
                 signal_df_raw, trade_df = extract_overlap_period(signal_df_raw.copy(), trade_df)
 
         asset_signal_dfs[slot.asset_id] = signal_df_raw
         asset_trade_dfs[slot.asset_id] = trade_df
 
-    # 2. 공통 기간 추출 (전 자산 trade_df의 날짜 교집합)
-    date_sets = [set(df[COL_DATE]) for df in asset_trade_dfs.values()]
-    common_dates_set: set[date] = date_sets[0]
-    for ds in date_sets[1:]:
-        common_dates_set &= ds
-
-    if not common_dates_set:
-        raise ValueError("전 자산의 공통 거래 기간이 없습니다.")
-
-    # 공통 기간으로 필터링
+    # 2. 공통 기간 추출 (전 자산 trade_df int64 날짜 키의 정렬 병합) + 행 위치로 일괄 필터링
+    panel = align_frames(asset_trade_dfs)
     for asset_id in asset_signal_dfs:
-        signal_df = asset_signal_dfs[asset_id]
-        trade_df = asset_trade_dfs[asset_id]
-
-        mask_s = pd.Series(signal_df[COL_DATE]).isin(common_dates_set)
-        mask_t = pd.Series(trade_df[COL_DATE]).isin(common_dates_set)
-
-        asset_signal_dfs[asset_id] = signal_df[mask_s.values].reset_index(drop=True)
-        asset_trade_dfs[asset_id] = trade_df[mask_t.values].reset_index(drop=True)
+        asset_signal_dfs[asset_id] = panel.reindex(asset_signal_dfs[asset_id])
+        asset_trade_dfs[asset_id] = panel.take(asset_id, asset_trade_dfs[asset_id])
 
     # 3. MA 워밍업 구간 필터링 (registry의 get_warmup_periods 경유)
     valid_start_indices: list[int] = []
@@ -160,7 +149,10 @@ def _load_portfolio_data_with_common_period(
     return asset_signal_dfs, asset_trade_dfs, slot_dict, valid_start
 
 
-def compute_portfolio_effective_start_date(config: PortfolioConfig) -> date:
+def compute_portfolio_effective_start_date(
+    config: PortfolioConfig,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
+) -> date:
     """포트폴리오 실험의 유효 시작일을 계산한다.
 
     전 자산 데이터의 날짜 교집합을 구하고 buffer_zone 슬롯의 MA 워밍업 완료 이후
@@ -170,6 +162,7 @@ def compute_portfolio_effective_start_date(config: PortfolioConfig) -> date:
 
     Args:
         config: 포트폴리오 실험 설정
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 CSV 로딩)
 
     Returns:
         MA 워밍업 완료 이후 첫 유효 거래일 (date 객체)
@@ -177,7 +170,7 @@ def compute_portfolio_effective_start_date(config: PortfolioConfig) -> date:
     Raises:
         ValueError: 공통 기간 없음 또는 MA 컬럼 누락 시
     """
-    _, asset_trade_dfs, _, valid_start = _load_portfolio_data_with_common_period(config)
+    _, asset_trade_dfs, _, valid_start = _load_portfolio_data_with_common_period(config, data_frames)
 
     first_trade_df = next(iter(asset_trade_dfs.values()))
     first_trade_df_filtered = first_trade_df.iloc[valid_start:].reset_index(drop=True)
@@ -192,38 +185,30 @@ def compute_portfolio_effective_start_date(config: PortfolioConfig) -> date:
     )
 
 
-def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = None) -> PortfolioResult:
-    """포트폴리오 백테스트를 실행한다.
+def prepare_portfolio_period(
+    config: PortfolioConfig,
+    start_date: date | None = None,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
+) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame], dict[str, Any]]:
+    """백테스트 구간의 자산별 signal/trade DataFrame을 준비한다.
 
-    복수 자산의 독립 시그널 + 목표 비중 배분 + 이중 트리거 리밸런싱을 수행한다.
-    OrderIntent 기반 주문 모델로 signal과 rebalance 충돌을 merge_intents가 해소한다.
-
-    메인 루프 흐름:
-        Step A: SELL 체결 (전일 next_day_intents: EXIT_ALL, REDUCE_TO_TARGET)
-        Step B: BUY 체결 (전일 next_day_intents: ENTER_TO_TARGET, INCREASE_TO_TARGET)
-        Step C: Equity 계산 (당일 종가 기준)
-        Step D: Signal → Projected → Rebalance → Merge → next_day_intents
-        Step E: Equity row 기록
+    공통 기간 필터링 → MA 워밍업 구간 제거 → start_date 하한 적용 순서로 처리한다.
+    run_portfolio_backtest와 배치 커널(portfolio_kernel)이 같은 구간을 쓰도록 공유한다.
 
     Args:
         config: 포트폴리오 실험 설정
-        start_date: 백테스트 시작일 하한 (None이면 MA 워밍업 완료 시점부터 자동 결정).
-            CLI 러너에서는 각 실험의 `compute_portfolio_effective_start_date(config)`
-            결과를 전달하여 실험별 독립 기간으로 실행한다.
+        start_date: 백테스트 시작일 하한 (None이면 MA 워밍업 완료 시점부터)
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 CSV 로딩)
 
     Returns:
-        PortfolioResult (equity_df, trades_df, summary, per_asset 포함)
+        (asset_signal_dfs, asset_trade_dfs, slot_dict) 튜플. 모든 DataFrame은 같은 거래일 행을 가진다.
 
     Raises:
-        ValueError: 설정 검증 실패 또는 공통 기간 없음
+        ValueError: 공통 기간 없음, MA 컬럼 누락 또는 유효 데이터가 2행 미만인 경우
     """
-    logger.debug(f"포트폴리오 백테스트 시작: {config.experiment_name}")
-
-    # 1. 설정 검증
-    validate_portfolio_config(config)
-
-    # 2. 자산별 데이터 로딩 + 공통 기간 필터링 + MA 워밍업 인덱스 계산
-    asset_signal_dfs, asset_trade_dfs, slot_dict, valid_start = _load_portfolio_data_with_common_period(config)
+    asset_signal_dfs, asset_trade_dfs, slot_dict, valid_start = _load_portfolio_data_with_common_period(
+        config, data_frames
+    )
 
     # MA 워밍업 구간 슬라이싱
     for asset_id in asset_signal_dfs:
@@ -245,32 +230,105 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
     if n < 2:
         raise ValueError(f"유효 데이터 부족: {n}행 (최소 2행 필요)")
 
+    return asset_signal_dfs, asset_trade_dfs, slot_dict
+
+
+def build_price_panel(
+    asset_trade_dfs: Mapping[str, pd.DataFrame],
+    asset_ids: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray]:
+    """자산별 trade DataFrame의 시가/종가를 2차원 배열로 쌓는다.
+
+    Args:
+        asset_trade_dfs: {asset_id: trade DataFrame} (prepare_portfolio_period 결과, 같은 거래일 행)
+        asset_ids: 열 순서로 사용할 자산 ID
+
+    Returns:
+        (open_prices, close_prices) 튜플. shape: (거래일 수, 자산 수), dtype: float64
+    """
+    open_prices = np.column_stack([asset_trade_dfs[aid][COL_OPEN].to_numpy(dtype=np.float64) for aid in asset_ids])
+    close_prices = np.column_stack([asset_trade_dfs[aid][COL_CLOSE].to_numpy(dtype=np.float64) for aid in asset_ids])
+    return open_prices, close_prices
+
+
+def run_portfolio_backtest(
+    config: PortfolioConfig,
+    start_date: date | None = None,
+    capture_level: PortfolioCaptureLevel = "full",
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
+    rebalance_policy: RebalancePolicy = DEFAULT_REBALANCE_POLICY,
+) -> PortfolioResult:
+    """포트폴리오 백테스트를 실행한다.
+
+    복수 자산의 독립 시그널 + 목표 비중 배분 + 이중 트리거 리밸런싱을 수행한다.
+    OrderIntent 기반 주문 모델로 signal과 rebalance 충돌을 merge_intents가 해소한다.
+
+    메인 루프 흐름:
+        Step A: SELL 체결 (전일 next_day_intents: EXIT_ALL, REDUCE_TO_TARGET)
+        Step B: BUY 체결 (전일 next_day_intents: ENTER_TO_TARGET, INCREASE_TO_TARGET)
+        Step C: Equity 계산 (당일 종가 기준)
+        Step D: Signal → Projected → Rebalance → Merge → next_day_intents
+        Step E: Equity row 기록
+        Step F: state_log 기록 (capture_level="full"일 때만)
+
+    Args:
+        config: 포트폴리오 실험 설정
+        start_date: 백테스트 시작일 하한 (None이면 MA 워밍업 완료 시점부터 자동 결정).
+            CLI 러너에서는 각 실험의 `compute_portfolio_effective_start_date(config)`
+            결과를 전달하여 실험별 독립 기간으로 실행한다.
+        capture_level: 일별 기록 수준. 거래/요약 결과는 수준과 무관하게 동일하다.
+            - "full": equity_df 전체 + state_log_df (기본값, 디버깅/검증용)
+            - "equity": equity_df 전체, state_log_df 생략 (자산별 주문/체결 컬럼 계산 생략)
+            - "summary": equity_df 포트폴리오 단위 컬럼만 (자산별 보유 현황 컬럼 계산 생략)
+            - "none": equity_df 조립 생략, equity_df/state_log_df 모두 빈 DataFrame (summary, trades_df만 쓰는 일괄 실험용)
+            validate_portfolio_result는 "equity" 이상, 규칙 1~3은 "full"에서만 검증된다.
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 CSV 로딩).
+            여러 실험을 병렬 실행할 때 경로별 데이터를 1회만 로딩하여 공유하는 용도.
+        rebalance_policy: 리밸런싱 임계값 정책 (기본값: DEFAULT_REBALANCE_POLICY).
+            실험 설정(PortfolioConfig)은 엔진 기본 정책을 사용하며, 임계값 탐색(portfolio_search)에서만 변경한다.
+
+    Returns:
+        PortfolioResult (equity_df, trades_df, summary, per_asset 포함)
+
+    Raises:
+        ValueError: 설정 검증 실패, 공통 기간 없음 또는 지원하지 않는 capture_level
+    """
+    logger.debug(f"포트폴리오 백테스트 시작: {config.experiment_name}")
+
+    # 1. 설정 검증
+    validate_portfolio_config(config)
+    if capture_level not in PORTFOLIO_CAPTURE_LEVELS:
+        raise ValueError(f"지원하지 않는 capture_level: {capture_level} (허용: {PORTFOLIO_CAPTURE_LEVELS})")
+
+    # 2. 자산별 데이터 로딩 + 공통 기간 필터링 + MA 워밍업/시작일 슬라이싱
+    asset_signal_dfs, asset_trade_dfs, slot_dict = prepare_portfolio_period(config, start_date, data_frames)
+    n = len(next(iter(asset_trade_dfs.values())))
+
     trade_dates = list(next(iter(asset_trade_dfs.values()))[COL_DATE])
 
-    # 4. 전략 객체 생성 (자산별 strategy_type 기반 팩토리, 슬롯별 파라미터 사용)
+    # 4. 자산별 시그널 사전 계산 (전 구간 매수/매도 이벤트, 같은 슬롯 파라미터·데이터는 캐시 재사용)
+    # 메인 루프는 전략을 매일 실행하지 않고 트랙을 조회한다. 실제 포지션이 통상 경로와 어긋나면
+    # (진입 수량 0주 등) 어댑터가 그날 보유 여부를 고정해 트랙을 재계산하므로 결과는 동일하다.
     strategies: dict[str, SignalStrategy] = {
-        slot.asset_id: create_strategy_for_slot(slot) for slot in config.asset_slots
+        slot.asset_id: PrecomputedSignalStrategy(slot, asset_signal_dfs[slot.asset_id], trade_dates)
+        for slot in config.asset_slots
     }
 
     # 5. 자산별 상태 초기화 (모든 자산 "sell"로 시작, pending_order 없음)
+    # 현금/보유/진입 정보는 슬롯 순서 고정 인덱스 장부(PortfolioBook), 시그널 상태는 AssetState에 둔다.
+    # AssetState.position은 플래닝 함수 입력용 사본이며 체결일에만 장부에서 동기화한다.
     asset_states: dict[str, AssetState] = {
         slot.asset_id: AssetState(position=0, signal_state="sell") for slot in config.asset_slots
     }
+    asset_ids = list(asset_states)
+    book = PortfolioBook.open(asset_ids, config.total_capital)
 
-    shared_cash = config.total_capital
+    # 시가/종가 패널: (거래일 수, 자산 수) — 매일 DataFrame 행 조회 없이 배열 행을 읽는다
+    open_panel, close_panel = build_price_panel(asset_trade_dfs, asset_ids)
 
-    # 자산별 진입 정보 (entry_price, entry_date, entry_hold_days)
-    entry_prices: dict[str, float] = {slot.asset_id: 0.0 for slot in config.asset_slots}
-    entry_dates: dict[str, date | None] = {slot.asset_id: None for slot in config.asset_slots}
-    entry_hold_days: dict[str, int] = {slot.asset_id: 0 for slot in config.asset_slots}
-
-    # 거래 기록 및 에쿼티 기록
+    # 거래 기록 및 일별 에쿼티/상태 기록 (자산 순서 = asset_states 순서)
     all_trades: list[Any] = []
-    equity_rows: list[dict[str, Any]] = []
-    state_log_rows: list[dict[str, Any]] = []
-
-    # 자산별 누적 실현손익 추적 (매도 후에도 기여 이력 유지)
-    cumulative_realized_pnl: dict[str, float] = {slot.asset_id: 0.0 for slot in config.asset_slots}
+    recorder = PortfolioRecorder(asset_ids, n, capture_level)
 
     # next_day_intents: 전일 생성된 merged intents → 당일 체결 대상
     next_day_intents: dict[str, OrderIntent] = {}
@@ -281,52 +339,30 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
     # 신호와 체결을 하루씩 분리(Lookahead 방지): i일 종가 시그널 → i+1일 시가 체결
     for i in range(0, n):
         current_date = trade_dates[i]
-        rebalanced_today = False
 
         # Step A+B: SELL → BUY 순 체결 (SELL 확보 현금 → BUY에 활용, 부족 시 비례 축소)
         # state_log용: 체결 예정 intents + 체결 전 포지션 보관
-        intents_to_execute = dict(next_day_intents)
-        pre_exec_positions = {aid: st.position for aid, st in asset_states.items()}
-        open_prices_map: dict[str, float] = {aid: float(asset_trade_dfs[aid].iloc[i][COL_OPEN]) for aid in asset_states}
-        exec_result = execute_orders(
-            order_intents=next_day_intents,
-            open_prices=open_prices_map,
-            current_positions={aid: st.position for aid, st in asset_states.items()},
-            current_cash=shared_cash,
-            entry_prices=entry_prices,
-            entry_dates=entry_dates,
-            entry_hold_days=entry_hold_days,
-            current_date=current_date,
-        )
-        shared_cash = exec_result.updated_cash
-        for aid, new_pos in exec_result.updated_positions.items():
-            if aid in asset_states:
-                asset_states[aid].position = new_pos
-        entry_prices = exec_result.updated_entry_prices
-        entry_dates = exec_result.updated_entry_dates
-        entry_hold_days = exec_result.updated_entry_hold_days
-        # 누적 실현손익 업데이트 (체결된 거래의 pnl을 자산별로 누적)
-        for trade in exec_result.new_trades:
-            cumulative_realized_pnl[trade["asset_id"]] += trade["pnl"]
-        all_trades.extend(exec_result.new_trades)
-        rebalanced_today = exec_result.rebalanced_today
+        intents_to_execute = next_day_intents
+        pre_exec_positions = list(book.positions) if recorder.records_orders else []
+        new_trades: list[PortfolioTradeRecord] = []
+        rebalanced_today = False
+        if next_day_intents:
+            new_trades, rebalanced_today = book.execute(next_day_intents, open_panel[i].tolist(), current_date)
+            for st, position in zip(asset_states.values(), book.positions, strict=True):
+                st.position = position
+            all_trades.extend(new_trades)
         # 전일 결정된 리밸런싱 사유 (체결된 경우에만 기록)
         rebalance_reason_today = next_day_rebalance_reason if rebalanced_today else ""
 
         # Step C: 에쿼티 계산 (체결 완료 후, 당일 종가 기준)
         # 체결 후에 계산해야 리밸런싱 판정 시 목표 비중 편차가 정확히 반영된다
-        asset_positions = {aid: st.position for aid, st in asset_states.items()}
-        asset_closes_map: dict[str, float] = {}
-        for asset_id in asset_states:
-            trade_df = asset_trade_dfs[asset_id]
-            asset_closes_map[asset_id] = float(trade_df.iloc[i][COL_CLOSE])
-
-        current_equity = compute_portfolio_equity(shared_cash, asset_positions, asset_closes_map)
+        # equity = cash + Σ(position × close) — compute_portfolio_equity와 같은 합산 순서
+        closes = close_panel[i].tolist()
+        values = book.market_values(closes)
+        current_equity = book.cash + sum(values)
 
         # Step D: Signal → Projected → Rebalance → Merge (익일 체결용 next_day_intents 생성)
-        equity_vals_now: dict[str, float] = {
-            aid: asset_states[aid].position * asset_closes_map[aid] for aid in asset_states
-        }
+        equity_vals_now: dict[str, float] = dict(zip(asset_ids, values, strict=True))
 
         # D.1: signal intents 생성 (전략 호출, 내부 prev 상태 갱신 포함)
         signal_intents = generate_signal_intents(
@@ -334,13 +370,13 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
         )
 
         # D.2: projected portfolio 계산 (signal intents 반영 후 예상 상태)
-        projected = compute_projected_portfolio(asset_states, signal_intents, equity_vals_now, shared_cash)
+        projected = compute_projected_portfolio(asset_states, signal_intents, equity_vals_now, book.cash)
 
         # D.3: rebalance intents 생성 (projected 기준, 이중 트리거 임계값 적용)
         total_equity_projected = projected.projected_cash + sum(projected.projected_amounts.values())
         is_month_start = is_first_trading_day_of_month(trade_dates, i)
-        if DEFAULT_REBALANCE_POLICY.should_rebalance(projected, slot_dict, total_equity_projected, is_month_start):
-            rebalance_intents = DEFAULT_REBALANCE_POLICY.build_rebalance_intents(
+        if rebalance_policy.should_rebalance(projected, slot_dict, total_equity_projected, is_month_start):
+            rebalance_intents = rebalance_policy.build_rebalance_intents(
                 projected, slot_dict, total_equity_projected, current_date
             )
             next_day_rebalance_reason = "monthly" if is_month_start else "daily"
@@ -361,102 +397,100 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
         # D.6: 익일 체결용 intents 저장
         next_day_intents = merged_intents
 
-        # Step E: 에쿼티 행 기록 (자산별 value/weight/signal/shares/avg_price 포함)
-        row: dict[str, Any] = {
-            COL_DATE: current_date,
-            COL_EQUITY: current_equity,
-            "cash": shared_cash,
-            "rebalanced": rebalanced_today,
-            "rebalance_reason": rebalance_reason_today,
-        }
-        for asset_id, st in asset_states.items():
-            val = st.position * asset_closes_map[asset_id]
-            row[asset_value_col(asset_id)] = val
-            row[asset_weight_col(asset_id)] = val / (current_equity + EPSILON) if current_equity > 0 else 0.0
-            row[f"{asset_id}_signal"] = st.signal_state
-            row[asset_shares_col(asset_id)] = st.position
-            row[f"{asset_id}_avg_price"] = entry_prices[asset_id]
-            # 자산별 손익 추적 (매도 후에도 기여 이력 유지)
-            row[f"{asset_id}_realized_pnl"] = cumulative_realized_pnl[asset_id]
-            unrealized = (asset_closes_map[asset_id] - entry_prices[asset_id]) * st.position if st.position > 0 else 0.0
-            row[f"{asset_id}_unrealized_pnl"] = unrealized
-        equity_rows.append(row)
-
-        # Step F: state_log 행 수집 (디버깅/검증용, 비즈니스 로직 변경 없음)
-        state_row: dict[str, Any] = {
-            COL_DATE: current_date,
-            COL_EQUITY: current_equity,
-            "cash": shared_cash,
-            "is_month_start": is_month_start,
-            "rebalanced": rebalanced_today,
-            "rebalance_reason": rebalance_reason_today,
-        }
+        # Step E: 에쿼티 기록 (자산별 value/weight/signal/shares/avg_price 포함)
+        recorder.record_portfolio(
+            i, current_date, current_equity, book.cash, rebalanced_today, rebalance_reason_today, is_month_start
+        )
+        # 자산별 보유 현황은 capture_level "equity" 이상에서만 기록
+        if recorder.records_holdings:
+            for j, st in enumerate(asset_states.values()):
+                close_val = closes[j]
+                position = book.positions[j]
+                entry_price = book.entry_prices[j]
+                # 자산별 손익 추적 (매도 후에도 기여 이력 유지)
+                unrealized = (close_val - entry_price) * position if position > 0 else 0.0
+                recorder.record_holding(
+                    i,
+                    j,
+                    close=close_val,
+                    shares=position,
+                    weight=values[j] / (current_equity + EPSILON) if current_equity > 0 else 0.0,
+                    signal=st.signal_state,
+                    avg_price=entry_price,
+                    realized_pnl=book.realized_pnl[j],
+                    unrealized_pnl=unrealized,
+                )
+
+        # Step F: state_log 기록 (디버깅/검증용, 비즈니스 로직 변경 없음)
+        # capture_level "full"이 아니면 자산별 시그널/pending/체결 컬럼 계산 자체를 생략
+        if not recorder.records_orders:
+            continue
+
         # 당일 체결 정보: intents_to_execute (전일 결정) + 포지션 변화 + new_trades (매도 기록)
         # new_trades는 매도 거래만 포함하므로, 매수는 포지션 변화로 감지한다
         executed_trades_by_asset: dict[str, list[PortfolioTradeRecord]] = {}
-        for trade in exec_result.new_trades:
+        for trade in new_trades:
             aid = trade["asset_id"]
             executed_trades_by_asset.setdefault(aid, []).append(trade)
 
-        for aid in asset_states:
-            close_val = asset_closes_map[aid]
-            st = asset_states[aid]
-            val = st.position * close_val
-            weight = val / (current_equity + EPSILON) if current_equity > 0 else 0.0
-
-            state_row[asset_close_col(aid)] = close_val
-            state_row[asset_shares_col(aid)] = st.position
-            state_row[asset_weight_col(aid)] = weight
-
+        for j, aid in enumerate(asset_ids):
             # 당일 시그널 판정: signal_intents에서 추출
             signal_intent = signal_intents.get(aid)
             if signal_intent and signal_intent.intent_type == "EXIT_ALL":
-                state_row[asset_signal_today_col(aid)] = "sell"
+                signal_today = "sell"
             elif signal_intent and signal_intent.intent_type == "ENTER_TO_TARGET":
-                state_row[asset_signal_today_col(aid)] = "buy"
+                signal_today = "buy"
             else:
-                state_row[asset_signal_today_col(aid)] = "hold"
+                signal_today = "hold"
 
             # 익일 체결 예정 (merged_intents)
             pending = merged_intents.get(aid)
-            state_row[asset_pending_intent_col(aid)] = pending.intent_type if pending else ""
-            state_row[f"{aid}_pending_reason"] = pending.reason if pending else ""
-            state_row[f"{aid}_pending_delta"] = pending.delta_amount if pending else 0.0
 
             # 당일 체결 결과: intents_to_execute + new_trades(매도) + 포지션 변화(매수)
             intent_executed = intents_to_execute.get(aid)
             trades_for_asset = executed_trades_by_asset.get(aid, [])
-            # pre_exec_positions/open_prices_map는 asset_states 전 자산으로 사전 초기화되므로
-            # 직접 인덱싱으로 fail-fast 한다.
-            pre_pos = pre_exec_positions[aid]
-            post_pos = st.position
+            pre_pos = pre_exec_positions[j]
+            post_pos = book.positions[j]
             position_changed = pre_pos != post_pos
 
+            executed_intent = ""
+            exec_side = ""
+            exec_shares = 0
+            exec_price = 0.0
             if intent_executed and (trades_for_asset or position_changed):
-                intent_type = intent_executed.intent_type
-                is_sell = intent_type in ("EXIT_ALL", "REDUCE_TO_TARGET")
+                executed_intent = intent_executed.intent_type
+                is_sell = executed_intent in ("EXIT_ALL", "REDUCE_TO_TARGET")
                 if is_sell and trades_for_asset:
                     # 매도: new_trades에서 체결 상세 추출
-                    total_shares = sum(int(t["shares"]) for t in trades_for_asset)
+                    exec_shares = sum(int(t["shares"]) for t in trades_for_asset)
                     exec_price = float(trades_for_asset[0]["exit_price"])
                 else:
                     # 매수: 포지션 변화에서 추출
-                    total_shares = abs(post_pos - pre_pos)
-                    exec_price = open_prices_map[aid]
-                state_row[asset_executed_intent_col(aid)] = intent_type
-                state_row[f"{aid}_exec_side"] = "sell" if is_sell else "buy"
-                state_row[f"{aid}_exec_shares"] = total_shares
-                state_row[f"{aid}_exec_price"] = exec_price
-            else:
-                state_row[asset_executed_intent_col(aid)] = ""
-                state_row[f"{aid}_exec_side"] = ""
-                state_row[f"{aid}_exec_shares"] = 0
-                state_row[f"{aid}_exec_price"] = 0.0
-
-        state_log_rows.append(state_row)
+                    exec_shares = abs(post_pos - pre_pos)
+                    exec_price = float(open_panel[i, j])
+                exec_side = "sell" if is_sell else "buy"
+
+            recorder.record_orders(
+                i,
+                j,
+                signal_today=signal_today,
+                pending_intent=pending.intent_type if pending else "",
+                pending_reason=pending.reason if pending else "",
+                pending_delta=pending.delta_amount if pending else 0.0,
+                executed_intent=executed_intent,
+                exec_side=exec_side,
+                exec_shares=exec_shares,
+                exec_price=exec_price,
+            )
 
     # 8. 결과 조합
-    equity_df = build_combined_equity(equity_rows, config.total_capital)
+    # capture_level "none"은 equity_df를 만들지 않고, summary 계산에 필요한 날짜/에쿼티 컬럼만 사용한다
+    if capture_level == "none":
+        equity_df = pd.DataFrame()
+        summary_equity_df = pd.DataFrame({COL_DATE: recorder.dates, COL_EQUITY: recorder.equity})
+    else:
+        equity_df = build_combined_equity(recorder, config.total_capital)
+        summary_equity_df = equity_df
 
     # trades_df 정리
     if all_trades:
@@ -478,7 +512,7 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
         )
 
     # 성과 요약 (합산 에쿼티 기준)
-    summary = calculate_summary(trades_df, equity_df, config.total_capital)
+    summary = calculate_summary(trades_df, summary_equity_df, config.total_capital)
 
     # 자산별 결과
     per_asset: list[PortfolioAssetResult] = []
@@ -498,9 +532,9 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
         "experiment_name": config.experiment_name,
         "display_name": config.display_name,
         "total_capital": config.total_capital,
-        # 리밸런싱 임계값: 엔진 레벨 상수로 고정 (모든 실험에 동일하게 적용됨)
-        "monthly_rebalance_threshold_rate": DEFAULT_REBALANCE_POLICY.monthly_threshold_rate,
-        "daily_rebalance_threshold_rate": DEFAULT_REBALANCE_POLICY.daily_threshold_rate,
+        # 리밸런싱 임계값: 실험 설정은 엔진 기본 정책(DEFAULT_REBALANCE_POLICY)을 사용 (탐색 시에만 변경)
+        "monthly_rebalance_threshold_rate": rebalance_policy.monthly_threshold_rate,
+        "daily_rebalance_threshold_rate": rebalance_policy.daily_threshold_rate,
         "assets": [
             {
                 "asset_id": slot.asset_id,
@@ -522,8 +556,8 @@ def run_portfolio_backtest(config: PortfolioConfig, start_date: date | None = No
         f"포트폴리오 백테스트 완료: {config.experiment_name}, " f"총 거래={len(trades_df)}, 총 수익률={summary['total_return_pct']:.2f}%"
     )
 
-    # state_log DataFrame 구성
-    state_log_df = pd.DataFrame(state_log_rows) if state_log_rows else pd.DataFrame()
+    # state_log DataFrame 구성 (capture_level "full"이 아니면 빈 DataFrame)
+    state_log_df = recorder.state_log_frame()
 
     return PortfolioResult(
         experiment_name=config.experiment_name,
@@ -1,5 +1,6 @@
 """포트폴리오 체결 -- 자산 상태 및 SELL->BUY 순 주문 체결 함수"""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date
 
@@ -261,3 +262,102 @@ def execute_orders(
         new_trades=new_trades,
         rebalanced_today=rebalanced_today,
     )
+
+
+@dataclass
+class PortfolioBook:
+    """슬롯 순서 고정 인덱스로 보관하는 포트폴리오 현금/보유 상태.
+
+    자산 j의 상태는 각 리스트의 j번째 원소다. 백테스트 메인 루프는 매일 자산별 dict를
+    다시 만들지 않고 이 리스트를 그대로 읽는다. 체결은 execute()가 execute_orders의
+    dict 호출 규약으로 변환해 위임하므로 체결 규칙과 부동소수점 연산 순서가 같다.
+
+    Attributes:
+        asset_ids: 자산 ID (인덱스 순서 = 슬롯 순서)
+        cash: 미투자 현금
+        positions: 보유 수량
+        entry_prices: 진입 가격 (미보유 시 0.0)
+        entry_dates: 진입 날짜 (미보유 시 None)
+        entry_hold_days: 진입 시 hold_days
+        realized_pnl: 누적 실현손익 (매도 후에도 기여 이력 유지)
+    """
+
+    asset_ids: tuple[str, ...]
+    cash: float
+    positions: list[int]
+    entry_prices: list[float]
+    entry_dates: list[date | None]
+    entry_hold_days: list[int]
+    realized_pnl: list[float]
+
+    @classmethod
+    def open(cls, asset_ids: Sequence[str], cash: float) -> "PortfolioBook":
+        """전 자산 미보유 상태의 장부를 만든다.
+
+        Args:
+            asset_ids: 자산 ID (슬롯 순서)
+            cash: 초기 현금
+
+        Returns:
+            PortfolioBook
+        """
+        k = len(asset_ids)
+        return cls(
+            asset_ids=tuple(asset_ids),
+            cash=cash,
+            positions=[0] * k,
+            entry_prices=[0.0] * k,
+            entry_dates=[None] * k,
+            entry_hold_days=[0] * k,
+            realized_pnl=[0.0] * k,
+        )
+
+    def market_values(self, close_prices: Sequence[float]) -> list[float]:
+        """자산별 평가액(position × close)을 인덱스 순서로 반환한다.
+
+        Args:
+            close_prices: 자산별 종가 (인덱스 순서)
+
+        Returns:
+            자산별 평가액
+        """
+        return [position * close for position, close in zip(self.positions, close_prices, strict=True)]
+
+    def execute(
+        self,
+        order_intents: dict[str, OrderIntent],
+        open_prices: Sequence[float],
+        current_date: date,
+    ) -> tuple[list[PortfolioTradeRecord], bool]:
+        """주문 의도를 execute_orders로 체결하고 장부를 갱신한다.
+
+        Args:
+            order_intents: {asset_id: OrderIntent} (비어 있으면 체결 없이 반환)
+            open_prices: 자산별 당일 시가 (인덱스 순서)
+            current_date: 체결 날짜
+
+        Returns:
+            (new_trades, rebalanced_today) — execute_orders 결과와 같다.
+        """
+        if not order_intents:
+            return [], False
+
+        ids = self.asset_ids
+        result = execute_orders(
+            order_intents=order_intents,
+            open_prices=dict(zip(ids, open_prices, strict=True)),
+            current_positions=dict(zip(ids, self.positions, strict=True)),
+            current_cash=self.cash,
+            entry_prices=dict(zip(ids, self.entry_prices, strict=True)),
+            entry_dates=dict(zip(ids, self.entry_dates, strict=True)),
+            entry_hold_days=dict(zip(ids, self.entry_hold_days, strict=True)),
+            current_date=current_date,
+        )
+        self.cash = result.updated_cash
+        self.positions = [result.updated_positions[aid] for aid in ids]
+        self.entry_prices = [result.updated_entry_prices[aid] for aid in ids]
+        self.entry_dates = [result.updated_entry_dates[aid] for aid in ids]
+        self.entry_hold_days = [result.updated_entry_hold_days[aid] for aid in ids]
+        for trade in result.new_trades:
+            self.realized_pnl[ids.index(trade["asset_id"])] += trade["pnl"]
+        return result.new_trades, result.rebalanced_today
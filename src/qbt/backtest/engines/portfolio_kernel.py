@@ -0,0 +1,361 @@
+"""포트폴리오 배치 시뮬레이션 커널
+
+같은 자산 구성(슬롯별 전략 파라미터)에서 목표 비중 벡터와 리밸런싱 임계값만 다른
+여러 조합을 한 번의 시계열 순회로 동시에 시뮬레이션한다.
+
+핵심 관찰:
+- 자산별 매수/매도 시그널은 자기 가격/MA 경로와 보유 여부에만 의존하고 비중과 무관하다.
+  따라서 시그널 이벤트(PortfolioSignalPanel)는 구성당 1회만 계산해 모든 조합이 공유한다.
+- 비중/임계값에 따라 달라지는 것은 현금 배분, 리밸런싱, 체결 수량뿐이므로
+  이 부분만 조합 축 (조합 수,) / (조합 수, 자산 수) NumPy 배열로 진행한다.
+
+run_portfolio_backtest와 동일한 체결 규칙과 부동소수점 연산 순서를 사용하므로,
+조합별 에쿼티/거래 수가 엔진 결과와 비트 단위로 일치한다. 다음 순서를 그대로 따른다:
+- 체결: 전일 intent를 당일 시가로 SELL(EXIT_ALL 자산 → REDUCE 자산, 각각 슬롯 순서) → BUY
+  (ENTER 자산 → INCREASE 단독 자산, 각각 슬롯 순서), 현금 부족 시 scale_factor 비례 축소
+- 리밸런싱: signal intent 반영 후 projected 상태 기준 이중 트리거, 슬롯 순서로 금액 합산
+- 병합: EXIT_ALL 우선, ENTER + INCREASE → ENTER(리밸런싱 목표 금액 사용)
+
+전제 조건(발산 감지):
+시그널 계산은 "매수 시그널 → 다음 날 포지션 > 0"을 가정한다. 비중이 아주 작거나 현금 부족으로
+진입 수량이 0주가 되면 엔진의 시그널 호출 패턴(check_buy/check_sell)이 달라진다.
+커널은 매일 포지션 보유 여부를 시그널 가정과 비교하고, 어긋난 조합은 diverged로 표시한다.
+호출자는 diverged 조합을 run_portfolio_backtest로 다시 계산해야 한다 (portfolio_search가 수행).
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from qbt.backtest.constants import SLIPPAGE_RATE
+from qbt.backtest.engines.portfolio_engine import build_price_panel, prepare_portfolio_period
+from qbt.backtest.engines.portfolio_rebalance import is_first_trading_day_of_month
+from qbt.backtest.engines.portfolio_signals import get_signal_track_store
+from qbt.backtest.portfolio_types import PortfolioConfig
+from qbt.common_constants import COL_DATE, EPSILON
+
+# ============================================================================
+# 데이터클래스
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class PortfolioSignalPanel:
+    """비중과 무관한 자산별 가격/시그널 패널. 2차원 배열 shape: (거래일 수, 자산 수).
+
+    Attributes:
+        asset_ids: 자산 ID (열 순서 = 슬롯 순서)
+        dates: 거래일 목록
+        open_prices: 시가
+        close_prices: 종가
+        enter: i일 종가 기준 매수 시그널 (익일 ENTER_TO_TARGET)
+        exit: i일 종가 기준 매도 시그널 (익일 EXIT_ALL)
+        holding: i일 시그널 판정 시점에 보유 중이어야 하는지 (= 포지션 > 0, signal_state == "buy")
+        is_month_start: 월 첫 거래일 여부 (shape: 거래일 수)
+    """
+
+    asset_ids: tuple[str, ...]
+    dates: tuple[date, ...]
+    open_prices: np.ndarray
+    close_prices: np.ndarray
+    enter: np.ndarray
+    exit: np.ndarray
+    holding: np.ndarray
+    is_month_start: np.ndarray
+
+
+@dataclass(frozen=True)
+class PortfolioBatchResult:
+    """run_portfolio_batch() 반환 타입. 조합 축 길이는 모두 N이다.
+
+    Attributes:
+        final_capital: 마지막 거래일 에쿼티 (shape: N)
+        mdd: 최대 낙폭 (%, 0 이하, shape: N)
+        total_trades: 매도 체결 거래 수 (EXIT_ALL + REDUCE_TO_TARGET, shape: N)
+        winning_trades: pnl > 0 거래 수 (shape: N)
+        diverged: 시그널 가정과 포지션이 어긋난 조합 (결과 무효, 엔진 재계산 필요, shape: N)
+        equity: 일별 에쿼티 (shape: 거래일 수 × N, record_equity=False이면 None)
+    """
+
+    final_capital: np.ndarray
+    mdd: np.ndarray
+    total_trades: np.ndarray
+    winning_trades: np.ndarray
+    diverged: np.ndarray
+    equity: np.ndarray | None
+
+
+# ============================================================================
+# 시그널 패널
+# ============================================================================
+
+
+def build_signal_panel(
+    config: PortfolioConfig,
+    start_date: date | None = None,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
+) -> PortfolioSignalPanel:
+    """구성의 자산별 시그널 이벤트를 1회 계산한다 (비중/리밸런싱 정책과 무관).
+
+    run_portfolio_backtest와 같은 구간(prepare_portfolio_period)과 같은 시그널 트랙
+    (portfolio_signals, 미보유면 check_buy·보유 중이면 check_sell 호출 패턴)을 사용한다.
+
+    Args:
+        config: 포트폴리오 실험 설정 (target_weight는 사용하지 않음)
+        start_date: 백테스트 시작일 하한 (None이면 MA 워밍업 완료 시점부터)
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 CSV 로딩)
+
+    Returns:
+        PortfolioSignalPanel
+
+    Raises:
+        ValueError: 공통 기간 없음, MA 컬럼 누락 또는 유효 데이터 부족 시
+    """
+    asset_signal_dfs, asset_trade_dfs, _ = prepare_portfolio_period(config, start_date, data_frames)
+    asset_ids = tuple(slot.asset_id for slot in config.asset_slots)
+    trade_dates = list(asset_trade_dfs[asset_ids[0]][COL_DATE])
+    n = len(trade_dates)
+
+    open_prices, close_prices = build_price_panel(asset_trade_dfs, asset_ids)
+    # 자산별 통상 경로 시그널 트랙 (엔진과 같은 저장소를 공유하므로 엔진 실행 후에는 재계산 없음)
+    store = get_signal_track_store()
+    tracks = [store.get(slot, asset_signal_dfs[slot.asset_id], trade_dates) for slot in config.asset_slots]
+    enter = np.column_stack([track.enter for track in tracks])
+    exit_ = np.column_stack([track.exit for track in tracks])
+    holding = np.column_stack([track.holding for track in tracks])
+
+    is_month_start = np.array([is_first_trading_day_of_month(trade_dates, i) for i in range(n)], dtype=np.bool_)
+
+    return PortfolioSignalPanel(
+        asset_ids=asset_ids,
+        dates=tuple(trade_dates),
+        open_prices=open_prices,
+        close_prices=close_prices,
+        enter=enter,
+        exit=exit_,
+        holding=holding,
+        is_month_start=is_month_start,
+    )
+
+
+# ============================================================================
+# 배치 시뮬레이션
+# ============================================================================
+
+
+def validate_batch_weights(weights: np.ndarray, n_assets: int) -> None:
+    """비중 행렬을 검증한다.
+
+    Args:
+        weights: 조합별 목표 비중 (shape: N × 자산 수)
+        n_assets: 자산 수
+
+    Raises:
+        ValueError: shape 불일치, 0 이하 비중, 합계 1.0 초과인 경우
+    """
+    if weights.ndim != 2 or weights.shape[1] != n_assets or weights.shape[0] == 0:
+        raise ValueError(f"weights shape은 (조합 수 ≥ 1, {n_assets})이어야 합니다: {weights.shape}")
+    # 비중 0 자산은 매수 시그널에서 delta_amount=0 intent가 되어 엔진이 중단되므로 허용하지 않는다
+    if (weights <= 0).any():
+        raise ValueError("target_weight는 0보다 커야 합니다 (비중 0 자산은 구성에서 제외)")
+    over = weights.sum(axis=1) > 1.0 + EPSILON
+    if over.any():
+        raise ValueError(f"target_weight 합이 1.0을 초과하는 조합: {weights[over][0].tolist()}")
+
+
+def run_portfolio_batch(
+    panel: PortfolioSignalPanel,
+    weights: np.ndarray,
+    monthly_thresholds: np.ndarray,
+    daily_thresholds: np.ndarray,
+    initial_capital: float,
+    record_equity: bool = False,
+) -> PortfolioBatchResult:
+    """비중/임계값 조합 N개를 한 번의 시계열 순회로 시뮬레이션한다.
+
+    Args:
+        panel: build_signal_panel 결과 (조합이 공유하는 시그널)
+        weights: 조합별 목표 비중 (shape: N × 자산 수, 열 순서 = panel.asset_ids)
+        monthly_thresholds: 조합별 월 첫 거래일 리밸런싱 임계값 (shape: N)
+        daily_thresholds: 조합별 매일 긴급 리밸런싱 임계값 (shape: N)
+        initial_capital: 초기 자본금
+        record_equity: True이면 일별 에쿼티 행렬을 반환 (메모리: 거래일 수 × N × 8바이트)
+
+    Returns:
+        PortfolioBatchResult
+
+    Raises:
+        ValueError: 비중/임계값 shape 불일치, 비중 범위 위반, initial_capital이 양수가 아닌 경우
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    n_days, n_assets = panel.close_prices.shape
+    validate_batch_weights(weights, n_assets)
+    n_combos = weights.shape[0]
+    monthly_thresholds = np.asarray(monthly_thresholds, dtype=np.float64)
+    daily_thresholds = np.asarray(daily_thresholds, dtype=np.float64)
+    if monthly_thresholds.shape != (n_combos,) or daily_thresholds.shape != (n_combos,):
+        raise ValueError(f"임계값 배열 길이는 조합 수({n_combos})와 같아야 합니다")
+    if initial_capital <= 0:
+        raise ValueError(f"initial_capital은 양수여야 합니다: {initial_capital}")
+
+    # 1. 조합별 상태
+    cash = np.full(n_combos, initial_capital, dtype=np.float64)
+    shares = np.zeros((n_combos, n_assets), dtype=np.int64)
+    entry = np.zeros((n_combos, n_assets), dtype=np.float64)
+    total_trades = np.zeros(n_combos, dtype=np.int64)
+    winning_trades = np.zeros(n_combos, dtype=np.int64)
+    diverged = np.zeros(n_combos, dtype=np.bool_)
+    peak = np.full(n_combos, -np.inf)
+    min_drawdown = np.zeros(n_combos, dtype=np.float64)
+    equity_out = np.empty((n_days, n_combos), dtype=np.float64) if record_equity else None
+    equity = cash.copy()
+
+    # 전일 결정된 익일 체결 intent (자산별 마스크 + 금액)
+    p_exit = np.zeros(n_assets, dtype=np.bool_)
+    p_reduce = np.zeros((n_combos, n_assets), dtype=np.bool_)
+    p_reduce_amount = np.zeros((n_combos, n_assets), dtype=np.float64)
+    p_enter = np.zeros(n_assets, dtype=np.bool_)
+    p_increase = np.zeros((n_combos, n_assets), dtype=np.bool_)
+    p_buy_delta = np.zeros((n_combos, n_assets), dtype=np.float64)
+
+    for i in range(n_days):
+        open_i = panel.open_prices[i]
+        close_i = panel.close_prices[i]
+
+        # Step A: SELL 체결 (EXIT_ALL 자산 → REDUCE 자산, 각각 슬롯 순서)
+        for j in np.flatnonzero(p_exit).tolist():
+            sell_price = open_i[j] * (1 - SLIPPAGE_RATE)
+            _apply_sell(j, shares[:, j].copy(), sell_price, cash, shares, entry, total_trades, winning_trades)
+        for j in np.flatnonzero(p_reduce.any(axis=0)).tolist():
+            sell_price = open_i[j] * (1 - SLIPPAGE_RATE)
+            to_sell = np.floor(p_reduce_amount[:, j] / sell_price).astype(np.int64)
+            sold = np.where(p_reduce[:, j], np.minimum(to_sell, shares[:, j]), 0)
+            _apply_sell(j, sold, sell_price, cash, shares, entry, total_trades, winning_trades)
+
+        # Step B: BUY 체결 (ENTER 자산 → INCREASE 단독 자산, 각각 슬롯 순서)
+        buy_order = [(j, np.broadcast_to(p_enter[j], (n_combos,))) for j in np.flatnonzero(p_enter)]
+        buy_order += [(j, p_increase[:, j]) for j in np.flatnonzero(p_increase.any(axis=0))]
+        if buy_order:
+            raw_shares: list[np.ndarray] = []
+            raw_costs: list[np.ndarray] = []
+            for j, mask in buy_order:
+                buy_price = open_i[j] * (1 + SLIPPAGE_RATE)
+                raw = np.where(mask, np.floor(p_buy_delta[:, j] / buy_price), 0.0).astype(np.int64)
+                raw_shares.append(raw)
+                raw_costs.append(np.where(raw > 0, raw * buy_price, 0.0))
+            total_raw_cost = python_float_sum(raw_costs)
+            scaled = (total_raw_cost > cash) & (total_raw_cost > EPSILON)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scale_factor = np.where(scaled, cash / total_raw_cost, 1.0)
+            for (j, _), raw in zip(buy_order, raw_shares, strict=True):
+                buy_price = open_i[j] * (1 + SLIPPAGE_RATE)
+                bought = np.where(scale_factor < 1.0, np.floor(raw * scale_factor).astype(np.int64), raw)
+                filled = bought > 0
+                cash -= np.where(filled, bought * buy_price, 0.0)
+                prev_shares = shares[:, j]
+                new_shares = prev_shares + bought
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    averaged = (entry[:, j] * prev_shares + buy_price * bought) / new_shares
+                entry[:, j] = np.where(filled, np.where(prev_shares == 0, buy_price, averaged), entry[:, j])
+                shares[:, j] = new_shares
+
+        # 시그널 가정 검증: i일 판정 시점의 보유 여부가 시그널 패널과 같아야 한다
+        diverged |= ((shares > 0) != panel.holding[i]).any(axis=1)
+
+        # Step C: 에쿼티 (종가 기준, 슬롯 순서 합산)
+        values = shares * close_i
+        equity = cash + python_float_sum(values.T)
+
+        peak = np.maximum(peak, equity)
+        min_drawdown = np.minimum(min_drawdown, (equity - peak) / peak)
+        if equity_out is not None:
+            equity_out[i] = equity
+
+        # Step D: Signal → Projected → Rebalance → Merge
+        enter_i = panel.enter[i]
+        exit_i = panel.exit[i]
+        projected_cash = cash.copy()
+        for j in np.flatnonzero(exit_i).tolist():
+            projected_cash = projected_cash + values[:, j]
+        projected_amounts = np.where(exit_i, 0.0, values)
+        total_projected = projected_cash + python_float_sum(projected_amounts.T)
+        active = (panel.holding[i] | enter_i) & ~exit_i
+
+        # D.3: 이중 트리거 판정 (active 자산 중 편차가 임계값 초과인 자산이 있으면 리밸런싱)
+        threshold = monthly_thresholds if panel.is_month_start[i] else daily_thresholds
+        deviation = np.abs(projected_amounts / total_projected[:, None] / weights - 1.0)
+        rebalance = (active & (deviation > threshold[:, None])).any(axis=1)
+
+        # D.3-2: 리밸런싱 금액 (슬롯 순서 합산, 현금 부족 시 매수 금액 비례 축소)
+        delta = total_projected[:, None] * weights - projected_amounts
+        sell_mask = rebalance[:, None] & active & (delta < 0)
+        buy_mask = rebalance[:, None] & active & (delta > 0)
+        sell_amounts = np.where(sell_mask, np.abs(delta), 0.0)
+        buy_amounts = np.where(buy_mask, delta, 0.0)
+        available = projected_cash + python_float_sum(sell_amounts.T)
+        total_buy = python_float_sum(buy_amounts.T)
+        shrink = (total_buy > available) & (total_buy > EPSILON)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy_scale = np.where(shrink, available / total_buy, 1.0)
+        buy_amounts = np.where(shrink[:, None], buy_amounts * buy_scale[:, None], buy_amounts)
+
+        # D.4: 병합 (EXIT_ALL 우선, ENTER + INCREASE → ENTER(리밸런싱 금액), ENTER 단독 → equity × 비중)
+        p_exit = exit_i.copy()
+        p_enter = enter_i.copy()
+        p_reduce = sell_mask
+        p_reduce_amount = sell_amounts
+        p_increase = buy_mask & ~enter_i
+        p_buy_delta = np.where(buy_mask, buy_amounts, np.where(enter_i, equity[:, None] * weights, 0.0))
+
+    return PortfolioBatchResult(
+        final_capital=equity,
+        mdd=min_drawdown * 100,
+        total_trades=total_trades,
+        winning_trades=winning_trades,
+        diverged=diverged,
+        equity=equity_out,
+    )
+
+
+def python_float_sum(terms: Sequence[np.ndarray] | np.ndarray) -> np.ndarray:
+    """내장 sum()과 같은 방식으로 항목들을 조합별로 합산한다.
+
+    Python 3.12의 sum()은 float 항목을 Neumaier 보정 합산으로 더한다 (단순 누적합과 마지막 비트가 다를 수 있음).
+    엔진은 에쿼티/리밸런싱 금액을 sum()으로 합산하므로, 커널도 같은 알고리즘을 써야 결과가 비트 단위로 일치한다.
+    빠진 항목을 0.0으로 채워 넣어도 합과 보정값이 변하지 않으므로 마스크된 자산은 0.0으로 전달하면 된다.
+
+    Args:
+        terms: 합산 순서대로 나열한 항목 배열들 (각 shape: N)
+
+    Returns:
+        조합별 합계 (shape: N)
+    """
+    total = np.zeros_like(np.asarray(terms[0]), dtype=np.float64)
+    compensation = np.zeros_like(total)
+    for term in terms:
+        summed = total + term
+        compensation += np.where(np.abs(total) >= np.abs(term), (total - summed) + term, (term - summed) + total)
+        total = summed
+    return total + np.where(np.isfinite(compensation), compensation, 0.0)
+
+
+def _apply_sell(
+    j: int,
+    sold: np.ndarray,
+    sell_price: float,
+    cash: np.ndarray,
+    shares: np.ndarray,
+    entry: np.ndarray,
+    total_trades: np.ndarray,
+    winning_trades: np.ndarray,
+) -> None:
+    """j번째 자산 매도 체결을 조합별 상태에 제자리 반영한다 (sold=0인 조합은 변화 없음)."""
+    filled = sold > 0
+    cash += np.where(filled, sold * sell_price, 0.0)
+    total_trades += filled
+    winning_trades += filled & ((sell_price - entry[:, j]) * sold > 0)
+    shares[:, j] -= sold
+    entry[:, j] = np.where(shares[:, j] == 0, 0.0, entry[:, j])
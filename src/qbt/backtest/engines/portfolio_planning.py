@@ -247,7 +247,9 @@ def merge_intents(
         {asset_id: OrderIntent} — 자산당 1개 보장
     """
     merged: dict[str, OrderIntent] = {}
-    all_assets = set(signal_intents) | set(rebalance_intents)
+    # 순서 고정: set 순회 순서는 프로세스 해시 시드에 따라 달라져 체결 순서/현금 합산이 실행마다 바뀐다
+    # (병렬 워커마다 시드가 다르므로 signal → rebalance 등장 순서로 결정적으로 순회한다)
+    all_assets = dict.fromkeys([*signal_intents, *rebalance_intents])
 
     for asset_id in all_assets:
         sig = signal_intents.get(asset_id)
@@ -106,7 +106,9 @@ class RebalancePolicy:
         buy_intents: dict[str, float] = {}  # {asset_id: 매수 필요 금액}
 
         # active_assets ⊆ slot_dict.keys() 가 항상 성립한다 (should_rebalance 동일 가정).
-        for asset_id in projected.active_assets:
+        # active_assets(set)의 순회 순서는 해시 시드에 따라 달라지므로 슬롯 순서로 순회한다
+        # (금액 합산/체결 순서가 실행·워커마다 같도록)
+        for asset_id in (aid for aid in slot_dict if aid in projected.active_assets):
             slot = slot_dict[asset_id]
             target_amount = total_equity_projected * slot.target_weight
             current_amount = projected.projected_amounts.get(asset_id, 0.0)
@@ -0,0 +1,259 @@
+"""포트폴리오 기록기 — 일별 에쿼티/상태 로그를 사전 할당된 컬럼 배열에 기록
+
+엔진 메인 루프가 매 거래일 자산별 dict 행을 만들던 방식 대신,
+(자산 수, 거래일 수) 크기의 타입별 numpy 배열에 인덱스로 직접 기록한다.
+문자열 컬럼(시그널, intent, 사유)은 범주 코드(int32)로 보관하고,
+DataFrame 변환 시점에 한 번만 문자열로 복원한다.
+
+학습 포인트:
+1. 사전 할당: 거래일 수를 알고 있으므로 배열을 한 번에 만들고 인덱스로 채운다 (행 dict 생성 없음)
+2. 범주 코드: 반복되는 문자열은 정수 코드 + 범주 목록으로 저장하여 메모리를 줄인다
+3. 컬럼 순서/dtype은 기존 행 dict 기반 DataFrame과 동일하게 유지한다 (equity_df/state_log_df 스키마 불변)
+4. 기록 수준(capture_level): 필요 없는 자산별 배열은 크기 0으로 만들어 메모리를 쓰지 않는다
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from qbt.backtest.constants import COL_EQUITY
+from qbt.backtest.portfolio_types import (
+    PORTFOLIO_CAPTURE_LEVELS,
+    PortfolioCaptureLevel,
+    asset_close_col,
+    asset_executed_intent_col,
+    asset_pending_intent_col,
+    asset_shares_col,
+    asset_signal_today_col,
+    asset_value_col,
+    asset_weight_col,
+)
+from qbt.common_constants import COL_DATE
+
+
+class CategoryColumn:
+    """문자열 컬럼을 정수 코드 배열과 범주 목록으로 보관한다.
+
+    처음 보는 문자열은 범주 목록 끝에 추가된다. 코드 0은 빈 문자열("")이다.
+    """
+
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        """
+        Args:
+            shape: 코드 배열 크기
+        """
+        self.codes = np.zeros(shape, dtype=np.int32)
+        self.categories: list[str] = [""]
+        self._code_by_value: dict[str, int] = {"": 0}
+
+    def code_of(self, value: str) -> int:
+        """문자열의 범주 코드를 반환한다 (없으면 새 범주로 등록)."""
+        code = self._code_by_value.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self._code_by_value[value] = code
+        return code
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """코드 배열을 문자열 object 배열로 복원한다."""
+        return np.array(self.categories, dtype=object)[codes]
+
+
+class PortfolioRecorder:
+    """포트폴리오 엔진의 일별 기록을 컬럼 배열로 보관한다.
+
+    포트폴리오 단위 컬럼은 (거래일 수,), 자산별 컬럼은 (자산 수, 거래일 수) 배열이다.
+    엔진은 record_* 메서드로 i번째 거래일, j번째 자산 위치에 값을 기록하고,
+    결과 조립 단계에서 build_combined_equity / state_log_frame이 배열을 그대로 사용한다.
+
+    기록 수준에 따라 보관하는 배열이 달라진다:
+        - records_holdings (capture_level "equity" 이상): 자산별 보유 현황 (record_holding)
+        - records_orders (capture_level "full"): 자산별 주문/체결 상태 (record_orders)
+    기록하지 않는 수준의 record_* 메서드는 호출하면 안 된다 (엔진이 플래그로 건너뛴다).
+
+    Example:
+        >>> recorder = PortfolioRecorder(["qqq", "gld"], n_days=len(trade_dates))
+        >>> recorder.record_portfolio(i, current_date, equity, cash, False, "", False)
+        >>> state_log_df = recorder.state_log_frame()
+    """
+
+    def __init__(self, asset_ids: Sequence[str], n_days: int, capture_level: PortfolioCaptureLevel = "full") -> None:
+        """
+        Args:
+            asset_ids: 자산 ID 목록 (기록 위치 j의 순서)
+            n_days: 거래일 수
+            capture_level: 기록 수준 ("none" / "summary" / "equity" / "full")
+
+        Raises:
+            ValueError: 자산이 없거나 n_days가 음수이거나 지원하지 않는 capture_level인 경우
+        """
+        if not asset_ids:
+            raise ValueError("asset_ids가 비어있습니다")
+        if n_days < 0:
+            raise ValueError(f"n_days는 0 이상이어야 합니다: {n_days}")
+        if capture_level not in PORTFOLIO_CAPTURE_LEVELS:
+            raise ValueError(f"지원하지 않는 capture_level: {capture_level} (허용: {PORTFOLIO_CAPTURE_LEVELS})")
+
+        self.asset_ids: tuple[str, ...] = tuple(asset_ids)
+        self.n_days = n_days
+        self.capture_level: PortfolioCaptureLevel = capture_level
+        self.records_holdings = capture_level in ("equity", "full")
+        self.records_orders = capture_level == "full"
+        n_assets = len(self.asset_ids)
+        shape = (n_assets, n_days if self.records_holdings else 0)
+        order_shape = (n_assets, n_days if self.records_orders else 0)
+
+        # 포트폴리오 단위 컬럼
+        self.dates = np.empty(n_days, dtype=object)
+        self.equity = np.zeros(n_days, dtype=np.float64)
+        self.cash = np.zeros(n_days, dtype=np.float64)
+        self.rebalanced = np.zeros(n_days, dtype=np.bool_)
+        self.rebalance_reason = CategoryColumn((n_days,))
+        self.is_month_start = np.zeros(n_days, dtype=np.bool_)
+
+        # 자산별 보유 현황 (equity_df)
+        self.close = np.zeros(shape, dtype=np.float64)
+        self.shares = np.zeros(shape, dtype=np.int64)
+        self.value = np.zeros(shape, dtype=np.float64)
+        self.weight = np.zeros(shape, dtype=np.float64)
+        self.signal = CategoryColumn(shape)
+        self.avg_price = np.zeros(shape, dtype=np.float64)
+        self.realized_pnl = np.zeros(shape, dtype=np.float64)
+        self.unrealized_pnl = np.zeros(shape, dtype=np.float64)
+
+        # 자산별 주문/체결 상태 (state_log_df)
+        self.signal_today = CategoryColumn(order_shape)
+        self.pending_intent = CategoryColumn(order_shape)
+        self.pending_reason = CategoryColumn(order_shape)
+        self.pending_delta = np.zeros(order_shape, dtype=np.float64)
+        self.executed_intent = CategoryColumn(order_shape)
+        self.exec_side = CategoryColumn(order_shape)
+        self.exec_shares = np.zeros(order_shape, dtype=np.int64)
+        self.exec_price = np.zeros(order_shape, dtype=np.float64)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def record_portfolio(
+        self,
+        i: int,
+        current_date: date,
+        equity: float,
+        cash: float,
+        rebalanced: bool,
+        rebalance_reason: str,
+        is_month_start: bool,
+    ) -> None:
+        """i번째 거래일의 포트폴리오 단위 값을 기록한다."""
+        self.dates[i] = current_date
+        self.equity[i] = equity
+        self.cash[i] = cash
+        self.rebalanced[i] = rebalanced
+        self.rebalance_reason.codes[i] = self.rebalance_reason.code_of(rebalance_reason)
+        self.is_month_start[i] = is_month_start
+
+    def record_holding(
+        self,
+        i: int,
+        j: int,
+        close: float,
+        shares: int,
+        weight: float,
+        signal: str,
+        avg_price: float,
+        realized_pnl: float,
+        unrealized_pnl: float,
+    ) -> None:
+        """i번째 거래일, j번째 자산의 보유 현황을 기록한다 (value = shares × close)."""
+        self.close[j, i] = close
+        self.shares[j, i] = shares
+        self.value[j, i] = shares * close
+        self.weight[j, i] = weight
+        self.signal.codes[j, i] = self.signal.code_of(signal)
+        self.avg_price[j, i] = avg_price
+        self.realized_pnl[j, i] = realized_pnl
+        self.unrealized_pnl[j, i] = unrealized_pnl
+
+    def record_orders(
+        self,
+        i: int,
+        j: int,
+        signal_today: str,
+        pending_intent: str,
+        pending_reason: str,
+        pending_delta: float,
+        executed_intent: str,
+        exec_side: str,
+        exec_shares: int,
+        exec_price: float,
+    ) -> None:
+        """i번째 거래일, j번째 자산의 시그널 판정/익일 주문/당일 체결 상태를 기록한다."""
+        self.signal_today.codes[j, i] = self.signal_today.code_of(signal_today)
+        self.pending_intent.codes[j, i] = self.pending_intent.code_of(pending_intent)
+        self.pending_reason.codes[j, i] = self.pending_reason.code_of(pending_reason)
+        self.pending_delta[j, i] = pending_delta
+        self.executed_intent.codes[j, i] = self.executed_intent.code_of(executed_intent)
+        self.exec_side.codes[j, i] = self.exec_side.code_of(exec_side)
+        self.exec_shares[j, i] = exec_shares
+        self.exec_price[j, i] = exec_price
+
+    # ------------------------------------------------------------------
+    # 컬럼 조립
+    # ------------------------------------------------------------------
+
+    def equity_columns(self) -> dict[str, np.ndarray]:
+        """equity_df 기본 컬럼을 {컬럼명: 배열} 순서대로 반환한다 (파생 뷰 컬럼 제외).
+
+        자산별 보유 현황을 기록하지 않는 수준("none"/"summary")이면 포트폴리오 단위 컬럼만 반환한다.
+        """
+        columns: dict[str, np.ndarray] = {
+            COL_DATE: self.dates,
+            COL_EQUITY: self.equity,
+            "cash": self.cash,
+            "rebalanced": self.rebalanced,
+            "rebalance_reason": self.rebalance_reason.decode(self.rebalance_reason.codes),
+        }
+        if not self.records_holdings:
+            return columns
+        for j, aid in enumerate(self.asset_ids):
+            columns[asset_value_col(aid)] = self.value[j]
+            columns[asset_weight_col(aid)] = self.weight[j]
+            columns[f"{aid}_signal"] = self.signal.decode(self.signal.codes[j])
+            columns[asset_shares_col(aid)] = self.shares[j]
+            columns[f"{aid}_avg_price"] = self.avg_price[j]
+            columns[f"{aid}_realized_pnl"] = self.realized_pnl[j]
+            columns[f"{aid}_unrealized_pnl"] = self.unrealized_pnl[j]
+        return columns
+
+    def state_log_frame(self) -> pd.DataFrame:
+        """state_log_df를 구성한다 (PortfolioResult.state_log_df 컬럼 명세와 동일).
+
+        주문/체결 상태를 기록하지 않는 수준("full" 미만)이면 빈 DataFrame을 반환한다.
+        """
+        if not self.records_orders:
+            return pd.DataFrame()
+        columns: dict[str, np.ndarray] = {
+            COL_DATE: self.dates,
+            COL_EQUITY: self.equity,
+            "cash": self.cash,
+            "is_month_start": self.is_month_start,
+            "rebalanced": self.rebalanced,
+            "rebalance_reason": self.rebalance_reason.decode(self.rebalance_reason.codes),
+        }
+        for j, aid in enumerate(self.asset_ids):
+            columns[asset_close_col(aid)] = self.close[j]
+            columns[asset_shares_col(aid)] = self.shares[j]
+            columns[asset_weight_col(aid)] = self.weight[j]
+            columns[asset_signal_today_col(aid)] = self.signal_today.decode(self.signal_today.codes[j])
+            columns[asset_pending_intent_col(aid)] = self.pending_intent.decode(self.pending_intent.codes[j])
+            columns[f"{aid}_pending_reason"] = self.pending_reason.decode(self.pending_reason.codes[j])
+            columns[f"{aid}_pending_delta"] = self.pending_delta[j]
+            columns[asset_executed_intent_col(aid)] = self.executed_intent.decode(self.executed_intent.codes[j])
+            columns[f"{aid}_exec_side"] = self.exec_side.decode(self.exec_side.codes[j])
+            columns[f"{aid}_exec_shares"] = self.exec_shares[j]
+            columns[f"{aid}_exec_price"] = self.exec_price[j]
+        return pd.DataFrame(columns)
@@ -0,0 +1,265 @@
+"""포트폴리오 자산별 시그널 사전 계산 모듈
+
+포트폴리오 엔진이 매일 자산마다 전략(check_buy/check_sell)을 호출하던 것을,
+자산별로 전 구간 매수/매도 이벤트 배열(SignalTrack)을 한 번에 계산해 두고 조회하는 방식으로 바꾼다.
+
+핵심 관찰:
+- 전략 결과는 자기 시그널 데이터와 "어느 날 check_buy/check_sell 중 무엇을 호출했는가"에만 의존한다.
+- 엔진은 포지션이 0이면 check_buy, 보유 중이면 check_sell을 호출하므로, 통상 호출 패턴은
+  "매수 시그널 → 다음 날부터 보유, 매도 시그널 → 다음 날부터 미보유"로 시그널만으로 결정된다.
+- 따라서 (전략 파라미터, 시그널 데이터)가 같은 슬롯은 비중/자산 ID/실험과 무관하게 같은 트랙을 공유한다.
+
+호출 패턴이 달라지는 경우(진입 수량 0주 등)는 PrecomputedSignalStrategy가 감지하여
+실제 보유 상태를 고정한 채 트랙을 다시 계산하므로, 결과는 전략을 매일 호출한 것과 항상 같다.
+
+학습 포인트:
+1. 이벤트 사전 계산: 상태 의존 루프를 "통상 경로 1회 계산 + 예외 시 재계산"으로 분리
+2. 내용 주소화 캐시: 시그널 데이터 해시를 키에 포함하여 무효화 로직 없이 재사용
+"""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from pandas.core.util.hashing import hash_pandas_object
+
+from qbt.backtest.constants import DEFAULT_SIGNAL_TRACK_STORE_MAX_ENTRIES
+from qbt.backtest.engines.portfolio_planning import create_strategy_for_slot
+from qbt.backtest.portfolio_types import AssetSlotConfig
+
+# ============================================================================
+# 데이터클래스
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SignalTrack:
+    """한 자산의 전 구간 시그널 이벤트. 배열 shape: (거래일 수,).
+
+    Attributes:
+        enter: i일 check_buy 결과 (holding[i]가 False인 날만 True 가능)
+        exit: i일 check_sell 결과 (holding[i]가 True인 날만 True 가능)
+        holding: i일 시그널 판정 시점의 보유 여부 (True면 check_sell, False면 check_buy를 호출한 날)
+        buy_meta: {매수 시그널 인덱스: get_buy_meta() 결과}
+    """
+
+    enter: np.ndarray
+    exit: np.ndarray
+    holding: np.ndarray
+    buy_meta: Mapping[int, dict[str, float | int]]
+
+
+# ============================================================================
+# 트랙 계산
+# ============================================================================
+
+
+def compute_signal_track(
+    slot: AssetSlotConfig,
+    signal_df: pd.DataFrame,
+    trade_dates: Sequence[date],
+    forced_holding: Mapping[int, bool] | None = None,
+) -> SignalTrack:
+    """새 전략 객체로 전 구간을 순회하여 시그널 트랙을 계산한다.
+
+    엔진과 같은 호출 패턴을 따른다: 미보유면 check_buy, 보유 중이면 check_sell.
+    forced_holding에 있는 날은 시그널과 무관하게 해당 보유 여부로 호출한다 (실제 포지션 반영).
+
+    Args:
+        slot: 자산 슬롯 설정 (전략 생성용)
+        signal_df: 시그널용 DataFrame (MA 컬럼 포함, trade_dates와 같은 행 수)
+        trade_dates: 거래일 목록 (check_buy의 current_date)
+        forced_holding: {인덱스: 보유 여부} 실제 포지션이 통상 경로와 달랐던 날 (None이면 없음)
+
+    Returns:
+        SignalTrack
+
+    Raises:
+        ValueError: 미등록 strategy_id이거나 signal_df와 trade_dates 길이가 다른 경우
+    """
+    n = len(trade_dates)
+    if len(signal_df) != n:
+        raise ValueError(f"signal_df 행 수({len(signal_df)})와 거래일 수({n})가 다릅니다 (asset_id={slot.asset_id})")
+
+    strategy = create_strategy_for_slot(slot)
+    forced = forced_holding or {}
+    enter = np.zeros(n, dtype=np.bool_)
+    exit_ = np.zeros(n, dtype=np.bool_)
+    holding = np.zeros(n, dtype=np.bool_)
+    buy_meta: dict[int, dict[str, float | int]] = {}
+
+    held = False
+    for i in range(n):
+        held = forced.get(i, held)
+        holding[i] = held
+        if not held:
+            if strategy.check_buy(signal_df, i, trade_dates[i]):
+                enter[i] = True
+                buy_meta[i] = dict(strategy.get_buy_meta())
+                held = True
+        elif strategy.check_sell(signal_df, i):
+            exit_[i] = True
+            held = False
+
+    for arr in (enter, exit_, holding):
+        arr.flags.writeable = False
+    return SignalTrack(enter=enter, exit=exit_, holding=holding, buy_meta=buy_meta)
+
+
+def _signal_track_key(
+    slot: AssetSlotConfig, signal_df: pd.DataFrame, trade_dates: Sequence[date]
+) -> tuple[object, ...]:
+    """트랙 캐시 키를 만든다 (전략 파라미터 + 시그널 데이터 해시 + 기간).
+
+    asset_id, target_weight, 데이터 경로는 트랙에 영향을 주지 않으므로 키에서 제외한다.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(str(list(signal_df.columns)).encode("utf-8"))
+    if len(signal_df) > 0:
+        hasher.update(hash_pandas_object(signal_df, index=False).to_numpy().tobytes())
+    period = (str(trade_dates[0]), str(trade_dates[-1])) if trade_dates else ("", "")
+    return (
+        slot.strategy_id,
+        slot.ma_window,
+        slot.buy_buffer_zone_pct,
+        slot.sell_buffer_zone_pct,
+        slot.hold_days,
+        slot.ma_type,
+        len(trade_dates),
+        period,
+        hasher.hexdigest(),
+    )
+
+
+# ============================================================================
+# 트랙 저장소
+# ============================================================================
+
+
+class SignalTrackStore:
+    """통상 경로 시그널 트랙을 (전략 파라미터, 시그널 데이터) 단위로 보관하는 프로세스 내 LRU 저장소.
+
+    반환하는 트랙의 배열은 읽기 전용이며 여러 엔진 실행이 공유한다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SIGNAL_TRACK_STORE_MAX_ENTRIES) -> None:
+        """
+        Args:
+            max_entries: 메모리에 유지할 최대 트랙 수
+
+        Raises:
+            ValueError: max_entries가 1 미만인 경우
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+
+        self._max_entries = max_entries
+        self._tracks: OrderedDict[tuple[object, ...], SignalTrack] = OrderedDict()
+
+    def get(self, slot: AssetSlotConfig, signal_df: pd.DataFrame, trade_dates: Sequence[date]) -> SignalTrack:
+        """슬롯의 통상 경로 시그널 트랙을 반환한다 (캐시 적중 시 전략 재실행 없음).
+
+        Args:
+            slot: 자산 슬롯 설정
+            signal_df: 시그널용 DataFrame
+            trade_dates: 거래일 목록
+
+        Returns:
+            SignalTrack (forced_holding 없이 계산한 트랙)
+
+        Raises:
+            ValueError: 미등록 strategy_id이거나 signal_df와 trade_dates 길이가 다른 경우
+        """
+        key = _signal_track_key(slot, signal_df, trade_dates)
+        track = self._tracks.get(key)
+        if track is not None:
+            self._tracks.move_to_end(key)
+            return track
+
+        track = compute_signal_track(slot, signal_df, trade_dates)
+        self._tracks[key] = track
+        while len(self._tracks) > self._max_entries:
+            self._tracks.popitem(last=False)
+        return track
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def clear(self) -> None:
+        """보관한 트랙을 모두 비운다."""
+        self._tracks.clear()
+
+
+# 프로세스 기본 저장소
+_DEFAULT_STORE = SignalTrackStore()
+
+
+def get_signal_track_store() -> SignalTrackStore:
+    """프로세스 기본 시그널 트랙 저장소를 반환한다."""
+    return _DEFAULT_STORE
+
+
+# ============================================================================
+# 엔진용 전략 어댑터
+# ============================================================================
+
+
+class PrecomputedSignalStrategy:
+    """사전 계산한 SignalTrack을 SignalStrategy 인터페이스로 제공하는 어댑터.
+
+    엔진은 기존과 같이 i = 0, 1, ... 순서로 하루 한 번 check_buy 또는 check_sell을 호출한다.
+    호출된 메서드가 트랙의 holding[i]와 다르면(= 실제 포지션이 통상 경로와 어긋남)
+    그날의 보유 여부를 고정하여 트랙을 다시 계산한다. 이후 결과는 전략을 매일 호출한 것과 같다.
+
+    생성 시 바인딩한 signal_df를 사용하며, 메서드 인자의 signal_df는 인터페이스 호환용이다.
+    """
+
+    def __init__(
+        self,
+        slot: AssetSlotConfig,
+        signal_df: pd.DataFrame,
+        trade_dates: Sequence[date],
+        store: SignalTrackStore | None = None,
+    ) -> None:
+        """
+        Args:
+            slot: 자산 슬롯 설정
+            signal_df: 시그널용 DataFrame (엔진이 호출 시 넘기는 DataFrame과 같은 객체)
+            trade_dates: 거래일 목록
+            store: 통상 경로 트랙 저장소 (None이면 프로세스 기본 저장소)
+
+        Raises:
+            ValueError: 미등록 strategy_id이거나 signal_df와 trade_dates 길이가 다른 경우
+        """
+        self._slot = slot
+        self._signal_df = signal_df
+        self._trade_dates = trade_dates
+        self._track = (store or get_signal_track_store()).get(slot, signal_df, trade_dates)
+        self._forced_holding: dict[int, bool] = {}
+        self._last_buy_index = -1
+
+    def _sync_holding(self, i: int, held: bool) -> None:
+        """i일 실제 보유 여부가 트랙과 다르면 보유 여부를 고정하고 트랙을 다시 계산한다."""
+        if bool(self._track.holding[i]) == held:
+            return
+        self._forced_holding[i] = held
+        self._track = compute_signal_track(self._slot, self._signal_df, self._trade_dates, self._forced_holding)
+
+    def check_buy(self, signal_df: pd.DataFrame, i: int, current_date: date) -> bool:
+        """i일 매수 시그널 여부를 반환한다 (i일 미보유 상태로 호출된 것으로 트랙을 맞춤)."""
+        self._sync_holding(i, False)
+        self._last_buy_index = i
+        return bool(self._track.enter[i])
+
+    def check_sell(self, signal_df: pd.DataFrame, i: int) -> bool:
+        """i일 매도 시그널 여부를 반환한다 (i일 보유 상태로 호출된 것으로 트랙을 맞춤)."""
+        self._sync_holding(i, True)
+        return bool(self._track.exit[i])
+
+    def get_buy_meta(self) -> dict[str, float | int]:
+        """마지막 check_buy 날의 매수 메타데이터를 반환한다 (매수 시그널이 아니었으면 빈 딕셔너리)."""
+        return dict(self._track.buy_meta.get(self._last_buy_index, {}))
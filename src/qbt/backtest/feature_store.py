@@ -0,0 +1,233 @@
+"""이동평균 피처 저장소 모듈
+
+엔진과 스크립트가 같은 종가 데이터에 대해 반복 계산하던 EMA/SMA를 한 번만 계산하고 재사용한다.
+- 키: (종가 데이터 버전, window, ma_type) — 데이터 버전은 종가 배열 내용의 해시
+- 메모리: 프로세스 내 LRU 캐시 (읽기 전용 numpy 배열)
+- 디스크(선택): 이름(티커)이 주어지고 영속화가 켜져 있으면 storage/stock/features에
+  컬럼 하나당 .npy 파일로 저장하고, 다음 실행에서 memory-map으로 읽는다 (복사 없음)
+
+데이터 내용이 키에 포함되므로 CSV가 갱신되거나 기간을 잘라낸 데이터는 자동으로 새로 계산된다.
+EMA는 시리즈 첫 행부터 누적되므로, 슬라이스한 데이터의 EMA는 전체 데이터의 EMA와 다르다는 점에 유의한다.
+
+학습 포인트:
+1. 내용 주소화(content addressing): 데이터 자체의 해시를 키로 사용하여 무효화 로직이 필요 없음
+2. np.load(mmap_mode="r"): 파일을 메모리에 매핑하여 읽은 만큼만 로드 (복사 없음)
+3. df.copy(deep=False): 컬럼 데이터를 공유하는 얕은 복사 (새 컬럼 추가는 원본에 영향 없음)
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from qbt.backtest.analysis import compute_moving_average
+from qbt.backtest.constants import DEFAULT_FEATURE_STORE_MAX_ENTRIES, ma_col_name
+from qbt.common_constants import COL_CLOSE, FEATURE_STORE_DIR
+from qbt.utils import get_logger
+
+logger = get_logger(__name__)
+
+MaType = Literal["ema", "sma"]
+
+# 데이터 버전 해시 길이 (16진수 문자 수, 파일명에 포함)
+_VERSION_LENGTH = 16
+# 같은 (이름, ma_type, window)에 대해 디스크에 남겨둘 최대 데이터 버전 수
+# 같은 티커를 전체 기간/교집합 기간으로 번갈아 쓰는 경우 서로의 파일을 지우지 않도록 여유를 둔다
+_MAX_VERSIONS_PER_FEATURE = 4
+
+
+def close_data_version(close: np.ndarray) -> str:
+    """종가 배열 내용의 버전 문자열(SHA-256 앞 16자리)을 계산한다.
+
+    Args:
+        close: float64 종가 배열
+
+    Returns:
+        16자리 16진수 문자열
+    """
+    return hashlib.sha256(np.ascontiguousarray(close, dtype=np.float64).tobytes()).hexdigest()[:_VERSION_LENGTH]
+
+
+class MovingAverageStore:
+    """이동평균 배열을 (데이터 버전, window, ma_type) 단위로 계산·보관하는 저장소.
+
+    반환하는 배열은 읽기 전용이며 여러 호출자가 공유한다. 수정이 필요하면 호출자가 .copy()해야 한다.
+
+    Example:
+        >>> store = MovingAverageStore()
+        >>> ema_200 = store.get(df["Close"], 200, "ema")
+    """
+
+    def __init__(self, feature_dir: Path | None = None, max_entries: int = DEFAULT_FEATURE_STORE_MAX_ENTRIES) -> None:
+        """
+        Args:
+            feature_dir: 디스크 영속화 디렉토리 (None이면 메모리 전용)
+            max_entries: 메모리에 유지할 최대 배열 수
+
+        Raises:
+            ValueError: max_entries가 1 미만인 경우
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+
+        self.feature_dir = feature_dir
+        self._max_entries = max_entries
+        self._arrays: OrderedDict[tuple[str, int, str], np.ndarray] = OrderedDict()
+
+    def get(self, close: pd.Series, window: int, ma_type: MaType = "ema", name: str | None = None) -> np.ndarray:
+        """종가 시리즈의 이동평균 배열을 반환한다 (캐시 적중 시 재계산 없음).
+
+        Args:
+            close: 종가 시리즈
+            window: 이동평균 기간
+            ma_type: 이동평균 유형 ("ema" 또는 "sma")
+            name: 디스크 영속화에 사용할 이름 (예: 티커). None이면 메모리에만 보관
+
+        Returns:
+            close와 같은 길이의 읽기 전용 float64 배열
+
+        Raises:
+            ValueError: window < 1 또는 지원하지 않는 ma_type인 경우
+        """
+        values = close.to_numpy(dtype=np.float64)
+        return self.lookup(values, close_data_version(values), window, ma_type, name)
+
+    def lookup(
+        self, values: np.ndarray, version: str, window: int, ma_type: MaType = "ema", name: str | None = None
+    ) -> np.ndarray:
+        """데이터 버전을 이미 계산한 종가 배열로 이동평균 배열을 조회한다.
+
+        같은 종가로 여러 window를 조회할 때 해시를 한 번만 계산하기 위한 진입점이다.
+
+        Args:
+            values: float64 종가 배열
+            version: close_data_version(values) 결과
+            window: 이동평균 기간
+            ma_type: 이동평균 유형 ("ema" 또는 "sma")
+            name: 디스크 영속화에 사용할 이름 (예: 티커)
+
+        Returns:
+            values와 같은 길이의 읽기 전용 float64 배열
+
+        Raises:
+            ValueError: window < 1 또는 지원하지 않는 ma_type인 경우
+        """
+        if window < 1:
+            raise ValueError(f"window는 1 이상이어야 합니다: {window}")
+
+        key = (version, window, ma_type)
+        cached = self._arrays.get(key)
+        if cached is not None:
+            self._arrays.move_to_end(key)
+            return cached
+
+        prefix = self._feature_prefix(name, window, ma_type)
+        path = self.feature_dir / f"{prefix}{version}.npy" if self.feature_dir is not None and prefix else None
+        array = self._load(path, len(values)) if path is not None else None
+        if array is None:
+            array = compute_moving_average(pd.Series(values), window, ma_type).to_numpy(dtype=np.float64)
+            array.flags.writeable = False
+            if path is not None:
+                self._save(path, prefix, array)
+
+        self._arrays[key] = array
+        if len(self._arrays) > self._max_entries:
+            self._arrays.popitem(last=False)
+        return array
+
+    @staticmethod
+    def _feature_prefix(name: str | None, window: int, ma_type: str) -> str:
+        # 파일명: {name}_{ma_type}_{window}_{데이터 버전}.npy (이름이 없으면 영속화하지 않음)
+        return f"{name}_{ma_type}_{window}_" if name is not None else ""
+
+    @staticmethod
+    def _load(path: Path, n_rows: int) -> np.ndarray | None:
+        if not path.exists():
+            return None
+        try:
+            array = np.load(path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            logger.debug(f"손상된 피처 파일 무시: {path.name} ({e})")
+            return None
+        if array.shape != (n_rows,):
+            return None
+        return array
+
+    @staticmethod
+    def _save(path: Path, prefix: str, array: np.ndarray) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 같은 (이름, ma_type, window)의 오래된 데이터 버전 파일 정리 (새 파일 포함 최대 개수 유지)
+        previous = sorted(path.parent.glob(f"{prefix}*.npy"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in previous[_MAX_VERSIONS_PER_FEATURE - 1 :]:
+            stale.unlink(missing_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체하여 동시 실행 중에도 잘린 파일이 보이지 않도록 한다
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """메모리에 보관한 배열을 모두 비운다 (디스크 파일은 유지)."""
+        self._arrays.clear()
+
+
+# 프로세스 기본 저장소 (메모리 전용, 스크립트에서 enable_feature_persistence()로 디스크 영속화 활성화)
+_DEFAULT_STORE = MovingAverageStore()
+
+
+def get_feature_store() -> MovingAverageStore:
+    """프로세스 기본 이동평균 저장소를 반환한다."""
+    return _DEFAULT_STORE
+
+
+def enable_feature_persistence(feature_dir: Path = FEATURE_STORE_DIR) -> None:
+    """기본 저장소의 디스크 영속화를 켠다 (name이 주어진 조회만 저장/로드).
+
+    Args:
+        feature_dir: .npy 파일 저장 디렉토리 (기본값: storage/stock/features)
+    """
+    _DEFAULT_STORE.feature_dir = feature_dir
+
+
+def with_moving_averages(
+    df: pd.DataFrame,
+    windows: Iterable[int],
+    ma_type: MaType = "ema",
+    name: str | None = None,
+    store: MovingAverageStore | None = None,
+) -> pd.DataFrame:
+    """MA 컬럼(ma_{window})이 추가된 DataFrame을 반환한다.
+
+    add_single_moving_average와 같은 값을 만들지만, 원본 컬럼을 복사하지 않는 얕은 복사본에
+    저장소의 읽기 전용 배열을 붙인다. 원본 DataFrame은 변경되지 않는다.
+    반환된 DataFrame의 기존 컬럼은 원본과 메모리를 공유하므로 제자리 수정하지 않는다.
+
+    Args:
+        df: 주식 데이터 DataFrame (Close 컬럼 필수)
+        windows: 이동평균 기간 목록 (중복은 1회만 계산, 기존 같은 이름의 컬럼은 덮어씀)
+        ma_type: 이동평균 유형 ("ema" 또는 "sma")
+        name: 디스크 영속화에 사용할 이름 (예: 티커)
+        store: 사용할 저장소 (None이면 프로세스 기본 저장소)
+
+    Returns:
+        MA 컬럼이 추가된 얕은 복사본
+
+    Raises:
+        ValueError: window < 1 또는 지원하지 않는 ma_type인 경우
+    """
+    if store is None:
+        store = _DEFAULT_STORE
+
+    result = df.copy(deep=False)
+    values = df[COL_CLOSE].to_numpy(dtype=np.float64)
+    version = close_data_version(values)
+    for window in dict.fromkeys(windows):
+        result[ma_col_name(window)] = store.lookup(values, version, window, ma_type, name)
+    return result
@@ -0,0 +1,232 @@
+"""배치 성과 지표 모듈
+
+여러 에쿼티 곡선(거래일 수 × 곡선 수 2차원 배열)의 성과 지표를 한 번에 계산한다.
+
+analysis 모듈의 단일 곡선 함수(calculate_summary, calculate_sharpe_ratio 등)는 곡선마다
+DataFrame을 만들고 수익률/낙폭을 함수별로 다시 계산한다. 그리드 탐색, WFO, 포트폴리오
+실험처럼 곡선 수천 개를 평가할 때는 그 오버헤드가 지표 계산 자체보다 크다.
+이 모듈은 일별 수익률, 누적 고점, 월말 위치를 곡선 축 전체에 대해 1회씩만 계산하고
+모든 지표를 그 결과에서 파생한다.
+
+단일 곡선 함수와의 관계:
+- CAGR / MDD / Calmar / 월별 수익률: 같은 공식과 연산 순서 (비트 단위 일치)
+- 샤프 / 소르티노: 같은 공식 (곡선별 행 축 합산, 단일 함수와 비트 단위 일치)
+- 월별 수익률은 반올림하지 않는다 (calculate_monthly_returns는 ROUND_PERCENT로 반올림)
+- 연간 수익률은 연말 월말 에쿼티의 비율이다 (= 비반올림 월별 수익률의 복리 누적)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from qbt.backtest.constants import CALMAR_MDD_ZERO_SUBSTITUTE
+from qbt.common_constants import ANNUAL_DAYS, EPSILON, TRADING_DAYS_PER_YEAR
+from qbt.utils.date_index import date_keys
+
+# ============================================================================
+# 데이터클래스
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class CurveMetrics:
+    """compute_curve_metrics() 반환 타입. 곡선 축 길이는 모두 N이다.
+
+    Attributes:
+        cagr: 연평균 복리 성장률 (%, shape: N)
+        mdd: 최대 낙폭 (%, 0 이하, shape: N)
+        calmar: CAGR / |MDD| (MDD=0 안전 처리는 calculate_calmar와 동일, shape: N)
+        sharpe: 연율화 샤프 비율 (shape: N)
+        sortino: 연율화 소르티노 비율 (shape: N)
+        max_drawdown_days: 최장 낙폭 기간 (달력일, shape: N). 고점 거래일부터
+            고점을 회복하지 못한 마지막 거래일까지의 일수 (낙폭이 없으면 0)
+        month_keys: 월별 수익률 행의 연월 (YYYYMM 정수, shape: M)
+        monthly_returns: 월별 수익률 (%, 반올림 없음, shape: M × N). 첫 달은 기준 월이므로 제외
+        years: 연간 수익률 행의 연도 (shape: Y)
+        yearly_returns: 연간 수익률 (%, shape: Y × N)
+    """
+
+    cagr: np.ndarray
+    mdd: np.ndarray
+    calmar: np.ndarray
+    sharpe: np.ndarray
+    sortino: np.ndarray
+    max_drawdown_days: np.ndarray
+    month_keys: np.ndarray
+    monthly_returns: np.ndarray
+    years: np.ndarray
+    yearly_returns: np.ndarray
+
+
+# ============================================================================
+# 개별 지표 (배열 입력)
+# ============================================================================
+
+
+def calmar_ratios(cagr: np.ndarray, mdd: np.ndarray) -> np.ndarray:
+    """calculate_calmar의 배열 버전.
+
+    Args:
+        cagr: CAGR (%, shape: N)
+        mdd: MDD (%, 0 이하, shape: N)
+
+    Returns:
+        Calmar 배열 (shape: N). |MDD| < EPSILON이면 CAGR > 0일 때 CALMAR_MDD_ZERO_SUBSTITUTE + cagr, 아니면 0.0
+    """
+    abs_mdd = np.abs(mdd)
+    zero_mdd = abs_mdd < EPSILON
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = cagr / abs_mdd
+    substitute = np.where(cagr > 0, CALMAR_MDD_ZERO_SUBSTITUTE + cagr, 0.0)
+    return np.where(zero_mdd, substitute, ratio)
+
+
+def _annualized_ratios(returns: np.ndarray, risk_free_rate: float) -> tuple[np.ndarray, np.ndarray]:
+    """곡선별 일별 수익률 행(shape: N × 거래일 수-1)로 샤프/소르티노를 계산한다.
+
+    calculate_sharpe_ratio / calculate_sortino_ratio와 같은 공식이며, 곡선마다 연속 메모리 행을
+    축소하므로 단일 곡선 계산과 합산 순서가 같다. 수익률이 2개 미만이거나 표준편차/하방 편차가
+    EPSILON 미만인 곡선은 0.0이다.
+    """
+    n_curves, n_returns = returns.shape
+    if n_returns < 2:
+        zeros = np.zeros(n_curves, dtype=np.float64)
+        return zeros, zeros.copy()
+
+    sqrt_days = np.sqrt(TRADING_DAYS_PER_YEAR)
+    rf_daily = risk_free_rate / TRADING_DAYS_PER_YEAR
+
+    std = np.std(returns, axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (np.mean(returns, axis=1) - rf_daily) / std * sqrt_days
+    sharpe = np.where(std < EPSILON, 0.0, sharpe)
+
+    excess = returns - rf_daily
+    downside_dev = np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2, axis=1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sortino = np.mean(excess, axis=1) / downside_dev * sqrt_days
+    sortino = np.where(downside_dev < EPSILON, 0.0, sortino)
+    return sharpe, sortino
+
+
+def _max_drawdown_days(equity: np.ndarray, peak: np.ndarray, day_keys: np.ndarray) -> np.ndarray:
+    """곡선별 최장 낙폭 기간(달력일)을 계산한다.
+
+    거래일마다 직전 고점 거래일의 위치를 누적 최대로 전파하고, 그 고점부터의 경과 일수 중
+    최댓값을 취한다. 고점을 갱신한 거래일은 경과 일수가 0이다.
+    """
+    n_bars = equity.shape[0]
+    at_peak = equity >= peak
+    bar_index = np.arange(n_bars, dtype=np.int64)[:, np.newaxis]
+    last_peak = np.maximum.accumulate(np.where(at_peak, bar_index, 0), axis=0)
+    elapsed = day_keys[:, np.newaxis] - day_keys[last_peak]
+    return elapsed.max(axis=0)
+
+
+def _period_returns(equity: np.ndarray, day_keys: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """월말 에쿼티로 월별/연간 수익률을 계산한다.
+
+    월말 = 각 연월의 마지막 거래일 (calculate_monthly_returns의 resample("ME").last()와 같은 값).
+    연간 수익률의 기준은 직전 연도 마지막 월말이며, 첫 연도는 첫 월말이다.
+    """
+    months = day_keys.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    month_end_rows = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+    month_end_equity = equity[month_end_rows]
+    end_months = months[month_end_rows]
+
+    # 월별 수익률: 첫 월말은 기준값 (pct_change 첫 행 제외와 동일)
+    monthly_returns = (month_end_equity[1:] / month_end_equity[:-1] - 1) * 100
+    return_months = end_months[1:]
+    years_of_rows = return_months // 12 + 1970
+    month_keys = years_of_rows * 100 + return_months % 12 + 1
+
+    # 연간 수익률: 연도별 마지막 월말 / 그 연도 첫 수익률 행의 기준 월말
+    if len(return_months) == 0:
+        return month_keys, monthly_returns, np.array([], dtype=np.int64), np.empty((0, equity.shape[1]))
+    year_change = np.append(years_of_rows[1:] != years_of_rows[:-1], True)
+    last_rows = np.flatnonzero(year_change)
+    first_rows = np.append(0, last_rows[:-1] + 1)
+    yearly_returns = (month_end_equity[last_rows + 1] / month_end_equity[first_rows] - 1) * 100
+    return month_keys, monthly_returns, years_of_rows[last_rows], yearly_returns
+
+
+# ============================================================================
+# 배치 계산
+# ============================================================================
+
+
+def compute_curve_metrics(
+    equity: np.ndarray,
+    dates: pd.Series | Iterable[date],
+    initial_capital: float,
+    risk_free_rate: float = 0.0,
+) -> CurveMetrics:
+    """에쿼티 곡선 N개의 성과 지표를 한 번에 계산한다.
+
+    Args:
+        equity: 에쿼티 (shape: 거래일 수 × N, 곡선마다 한 열)
+        dates: 거래일 (오름차순, 길이 = 거래일 수)
+        initial_capital: 초기 자본금 (CAGR 기준, calculate_summary와 동일)
+        risk_free_rate: 연간 무위험 수익률 (샤프/소르티노용, 0.03 = 3%)
+
+    Returns:
+        CurveMetrics
+
+    Raises:
+        ValueError: 2차원이 아니거나, 거래일 2행 미만, 날짜 길이 불일치/비오름차순, initial_capital <= 0인 경우
+        RuntimeError: 기간이 0 이하, 최종 에쿼티 <= 0 또는 고점이 0인 경우 (정상 흐름에서는 도달 불가)
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    if equity.ndim != 2:
+        raise ValueError(f"equity는 (거래일 수, 곡선 수) 2차원 배열이어야 합니다: shape={equity.shape}")
+    n_bars = equity.shape[0]
+    if n_bars < 2:
+        raise ValueError(f"유효 데이터 부족: {n_bars}행 (최소 2행 필요)")
+    if initial_capital <= 0:
+        raise ValueError(f"initial_capital은 양수여야 합니다: {initial_capital}")
+    day_keys = date_keys(dates)
+    if len(day_keys) != n_bars:
+        raise ValueError(f"날짜 길이 불일치: dates={len(day_keys)}, equity={n_bars}")
+    if np.any(day_keys[1:] <= day_keys[:-1]):
+        raise ValueError("dates는 중복 없이 오름차순이어야 합니다")
+
+    # 1. CAGR (calculate_summary와 동일 공식)
+    years = float(day_keys[-1] - day_keys[0]) / ANNUAL_DAYS
+    if years <= 0:
+        raise RuntimeError(f"내부 불변조건 위반: years <= 0 (years={years})")
+    final_capital = equity[-1]
+    if np.any(final_capital <= 0):
+        raise RuntimeError(f"내부 불변조건 위반: final_capital <= 0 (min={float(final_capital.min())})")
+    cagr = ((final_capital / initial_capital) ** (1 / years) - 1) * 100
+
+    # 2. 누적 고점 → MDD / 최장 낙폭 기간
+    peak = np.maximum.accumulate(equity, axis=0)
+    if np.any(peak == 0):
+        raise RuntimeError("내부 불변조건 위반: equity peak에 0이 존재 (initial_capital > 0이면 불가능)")
+    mdd = ((equity - peak) / peak).min(axis=0) * 100
+
+    # 3. 일별 수익률 → 샤프 / 소르티노 (곡선별 연속 행으로 전치)
+    curves = np.ascontiguousarray(equity.T)
+    returns = curves[:, 1:] / curves[:, :-1] - 1
+    sharpe, sortino = _annualized_ratios(returns, risk_free_rate)
+
+    # 4. 월말 위치 → 월별 / 연간 수익률
+    month_keys, monthly_returns, year_values, yearly_returns = _period_returns(equity, day_keys)
+
+    return CurveMetrics(
+        cagr=cagr,
+        mdd=mdd,
+        calmar=calmar_ratios(cagr, mdd),
+        sharpe=sharpe,
+        sortino=sortino,
+        max_drawdown_days=_max_drawdown_days(equity, peak, day_keys),
+        month_keys=month_keys,
+        monthly_returns=monthly_returns,
+        years=year_values,
+        yearly_returns=yearly_returns,
+    )
@@ -0,0 +1,152 @@
+"""포트폴리오 실험 스케줄러
+
+여러 PortfolioConfig 실험을 데이터 1회 로딩 + 프로세스 풀로 실행한다.
+- 데이터: 전 실험이 참조하는 CSV 경로를 경로당 1회만 로딩하고, 병렬 실행 시 공유 메모리로 게시한다
+- 이동평균: 기본 피처 저장소(feature_store)를 경유하므로, 영속화가 켜져 있으면 먼저 계산된 MA를
+  워커가 storage/stock/features에서 memory-map으로 재사용한다
+- 실행: 실험 1개 = 작업 1개. 완료되는 순서대로 on_result 콜백을 호출한다 (결과 파일 즉시 저장용)
+- 결과: 실험 목록 순서대로 반환한다 (요약 출력/검증 순서는 실행 순서와 무관하게 고정)
+
+학습 포인트:
+1. 작업 단위가 큰 경우(실험 1개당 수 초) 묶음 제출 없이 1개씩 제출하고 완료 순서로 수집한다
+2. 전체 소요 시간은 실험 수의 합이 아니라 (워커 수가 충분하면) 가장 느린 실험에 수렴한다
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from qbt.backtest.engines.portfolio_engine import run_portfolio_backtest
+from qbt.backtest.feature_store import enable_feature_persistence, get_feature_store
+from qbt.backtest.portfolio_types import PortfolioConfig, PortfolioResult
+from qbt.utils import get_logger
+from qbt.utils.data_loader import load_stock_data
+from qbt.utils.parallel_executor import WORKER_CACHE, WorkerPool
+
+logger = get_logger(__name__)
+
+
+def collect_portfolio_data_paths(configs: Sequence[PortfolioConfig]) -> list[Path]:
+    """실험 목록이 참조하는 데이터 경로를 중복 없이 등장 순서대로 반환한다.
+
+    Args:
+        configs: 포트폴리오 실험 설정 목록
+
+    Returns:
+        signal/trade 데이터 경로 목록 (중복 제거)
+    """
+    paths: dict[Path, None] = {}
+    for config in configs:
+        for slot in config.asset_slots:
+            paths[slot.signal_data_path] = None
+            paths[slot.trade_data_path] = None
+    return list(paths)
+
+
+def load_portfolio_data_frames(configs: Sequence[PortfolioConfig]) -> dict[str, pd.DataFrame]:
+    """실험 목록이 참조하는 데이터를 경로당 1회씩 로딩한다.
+
+    반환값은 run_portfolio_backtest / compute_portfolio_effective_start_date의 data_frames 인자로 사용한다.
+
+    Args:
+        configs: 포트폴리오 실험 설정 목록
+
+    Returns:
+        {str(경로): 주식 데이터 DataFrame}
+    """
+    return {str(path): load_stock_data(path) for path in collect_portfolio_data_paths(configs)}
+
+
+def _run_portfolio_job(job: tuple[PortfolioConfig, date | None, Path | None]) -> PortfolioResult:
+    """
+    워커에서 실험 1개를 실행한다 (WORKER_CACHE의 공유 데이터 사용).
+
+    ProcessPoolExecutor에서 pickle 가능하도록 모듈 레벨에 정의한다.
+
+    Args:
+        job: (실험 설정, 시작일 하한, 피처 영속화 디렉토리) 튜플
+
+    Returns:
+        포트폴리오 백테스트 결과
+    """
+    config, start_date, feature_dir = job
+    # spawn 워커는 부모의 피처 저장소 설정을 물려받지 않으므로 작업마다 맞춘다 (대입만 수행)
+    if feature_dir is not None:
+        enable_feature_persistence(feature_dir)
+    return run_portfolio_backtest(config, start_date=start_date, data_frames=WORKER_CACHE)
+
+
+def run_portfolio_experiments(
+    configs: Sequence[PortfolioConfig],
+    start_dates: Mapping[str, date] | None = None,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
+    max_workers: int = 1,
+    on_result: Callable[[PortfolioResult], None] | None = None,
+) -> list[PortfolioResult]:
+    """여러 포트폴리오 실험을 실행하고 실험 목록 순서대로 결과를 반환한다.
+
+    max_workers가 1이면 현재 프로세스에서 순차 실행하고,
+    2 이상이면 WorkerPool에 데이터를 공유 메모리로 1회 게시한 뒤 실험을 병렬 실행한다.
+
+    Args:
+        configs: 포트폴리오 실험 설정 목록
+        start_dates: {experiment_name: 시작일 하한} (없는 실험은 MA 워밍업 기준 자동 결정)
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 load_portfolio_data_frames로 로딩)
+        max_workers: 최대 워커 수 (실험 수보다 많으면 실험 수로 제한)
+        on_result: 실험이 끝날 때마다 완료 순서대로 호출할 콜백 (예: 결과 파일 저장)
+
+    Returns:
+        configs 순서대로 정렬된 PortfolioResult 목록
+
+    Raises:
+        ValueError: configs가 비어있거나, experiment_name이 중복되거나, max_workers가 1 미만인 경우
+        Exception: 실험 실행 중 발생한 예외 (첫 번째 예외만 전파, 남은 실험은 취소)
+    """
+    # 1. 입력 검증
+    if not configs:
+        raise ValueError("configs가 비어있습니다")
+    names = [config.experiment_name for config in configs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"중복된 experiment_name: {duplicates}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+
+    # 2. 데이터 로딩 (경로당 1회)
+    if data_frames is None:
+        data_frames = load_portfolio_data_frames(configs)
+    start_dates = start_dates or {}
+
+    results: list[PortfolioResult | None] = [None] * len(configs)
+    n_workers = min(max_workers, len(configs))
+    logger.debug(f"포트폴리오 실험 {len(configs)}개 실행 - 워커 수: {n_workers}, 데이터 경로: {len(data_frames)}개")
+
+    # 3-A. 순차 실행 (단일 워커)
+    if n_workers == 1:
+        for idx, config in enumerate(configs):
+            result = run_portfolio_backtest(
+                config, start_date=start_dates.get(config.experiment_name), data_frames=data_frames
+            )
+            results[idx] = result
+            if on_result is not None:
+                on_result(result)
+    # 3-B. 병렬 실행: 데이터는 공유 메모리로 1회 게시, 결과는 완료 순서대로 콜백 후 인덱스 위치에 보관
+    else:
+        feature_dir = get_feature_store().feature_dir
+        jobs = [(config, start_dates.get(config.experiment_name), feature_dir) for config in configs]
+        with WorkerPool(max_workers=n_workers) as pool:
+            pool.update_cache(shared_frames=dict(data_frames))
+            for idx, result in pool.imap_completed(_run_portfolio_job, jobs):
+                logger.debug(f"실험 완료: {configs[idx].experiment_name}")
+                results[idx] = result
+                if on_result is not None:
+                    on_result(result)
+
+    ordered: list[PortfolioResult] = []
+    for config, result in zip(configs, results, strict=True):
+        if result is None:
+            raise RuntimeError(f"내부 불변조건 위반: 실험 결과 누락 ({config.experiment_name})")
+        ordered.append(result)
+    return ordered
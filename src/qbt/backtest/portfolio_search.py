@@ -0,0 +1,230 @@
+"""포트폴리오 비중/리밸런싱 임계값 탐색
+
+하나의 포트폴리오 구성(자산과 자산별 전략은 고정)에서 목표 비중 벡터와
+리밸런싱 이중 트리거 임계값(월 첫 거래일 / 매일)을 격자 탐색한다.
+
+- 시그널: 비중과 무관하므로 구성당 1회만 계산한다 (portfolio_kernel.build_signal_panel)
+- 시뮬레이션: 조합을 배치로 묶어 portfolio_kernel.run_portfolio_batch로 한 번에 평가한다
+- 검증: 진입 수량이 0주가 되어 시그널 가정이 깨진 조합은 run_portfolio_backtest로 다시 계산한다
+- 결과: 조합별 CAGR/MDD/Calmar 표를 Calmar 내림차순(동률이면 CAGR 내림차순)으로 반환한다
+
+배치 커널은 run_portfolio_backtest와 체결 규칙/연산 순서가 같으므로
+조합별 성과 지표는 엔진을 조합마다 실행한 결과와 일치한다.
+"""
+
+import dataclasses
+import itertools
+from collections.abc import Mapping, Sequence
+from datetime import date
+from typing import cast
+
+import numpy as np
+import pandas as pd
+
+from qbt.backtest.constants import (
+    COL_CAGR,
+    COL_CALMAR,
+    COL_FINAL_CAPITAL,
+    COL_MDD,
+    COL_TOTAL_RETURN_PCT,
+    COL_TOTAL_TRADES,
+    COL_WIN_RATE,
+    DEFAULT_PORTFOLIO_SEARCH_BATCH_SIZE,
+)
+from qbt.backtest.engines.grid_kernel import calculate_batch_cagr
+from qbt.backtest.engines.portfolio_engine import run_portfolio_backtest
+from qbt.backtest.engines.portfolio_kernel import build_signal_panel, run_portfolio_batch, validate_batch_weights
+from qbt.backtest.engines.portfolio_rebalance import RebalancePolicy
+from qbt.backtest.metrics import calmar_ratios
+from qbt.backtest.portfolio_scheduler import load_portfolio_data_frames
+from qbt.backtest.portfolio_types import PortfolioConfig, asset_weight_col
+from qbt.backtest.types import SummaryDict
+from qbt.common_constants import EPSILON
+from qbt.utils import get_logger
+
+logger = get_logger(__name__)
+
+COL_MONTHLY_THRESHOLD_RATE = "monthly_threshold_rate"
+COL_DAILY_THRESHOLD_RATE = "daily_threshold_rate"
+COL_EVALUATED_BY = "evaluated_by"  # "kernel" (배치 커널) / "engine" (시그널 가정 불일치로 엔진 재계산)
+
+
+def generate_weight_grid(
+    n_assets: int,
+    step: float,
+    min_weight: float | None = None,
+    total: float = 1.0,
+) -> np.ndarray:
+    """합이 total인 목표 비중 벡터를 step 간격 격자로 모두 생성한다.
+
+    예: n_assets=2, step=0.25 → [[0.25, 0.75], [0.5, 0.5], [0.75, 0.25]]
+
+    Args:
+        n_assets: 자산 수
+        step: 비중 간격 (total을 나누어 떨어뜨려야 함)
+        min_weight: 자산별 최소 비중 (None이면 step). 0 비중은 엔진이 지원하지 않으므로 양수여야 한다
+        total: 비중 합계 (1.0 미만이면 나머지는 현금으로 유지)
+
+    Returns:
+        비중 행렬 (shape: 조합 수 × n_assets), 사전순 정렬
+
+    Raises:
+        ValueError: 인자가 범위를 벗어나거나 total이 step의 정수배가 아니거나 조건을 만족하는 벡터가 없는 경우
+    """
+    if n_assets < 1:
+        raise ValueError(f"n_assets는 1 이상이어야 합니다: {n_assets}")
+    if not 0 < total <= 1.0:
+        raise ValueError(f"total은 (0, 1] 범위여야 합니다: {total}")
+    if step <= 0:
+        raise ValueError(f"step은 양수여야 합니다: {step}")
+    min_weight = step if min_weight is None else min_weight
+    if min_weight <= 0:
+        raise ValueError(f"min_weight는 양수여야 합니다: {min_weight}")
+
+    # 1. 정수 단위로 변환 (부동소수점 누적 오차 없이 합계를 정확히 맞춘다)
+    total_units = round(total / step)
+    if abs(total_units * step - total) > EPSILON:
+        raise ValueError(f"total({total})이 step({step})의 정수배가 아닙니다")
+    min_units = int(np.ceil(min_weight / step - EPSILON))
+
+    # 2. 각 자산 min_units 이상, 합계 total_units인 정수 분할을 모두 나열 (마지막 자산은 나머지)
+    rows: list[tuple[int, ...]] = []
+    for head in itertools.product(range(min_units, total_units + 1), repeat=n_assets - 1):
+        last = total_units - sum(head)
+        if last >= min_units:
+            rows.append((*head, last))
+    if not rows:
+        raise ValueError(f"조건을 만족하는 비중 벡터가 없습니다 (n_assets={n_assets}, step={step}, min_weight={min_weight})")
+
+    return np.array(rows, dtype=np.float64) / total_units * total
+
+
+def run_portfolio_search(
+    config: PortfolioConfig,
+    weight_grid: np.ndarray,
+    monthly_thresholds: Sequence[float],
+    daily_thresholds: Sequence[float],
+    start_date: date | None = None,
+    data_frames: Mapping[str, pd.DataFrame] | None = None,
+    batch_size: int = DEFAULT_PORTFOLIO_SEARCH_BATCH_SIZE,
+) -> pd.DataFrame:
+    """목표 비중 × 월간 임계값 × 일간 임계값 전 조합을 평가하고 순위표를 반환한다.
+
+    Args:
+        config: 포트폴리오 실험 설정 (자산 구성/전략 파라미터/초기 자본 사용, target_weight는 무시)
+        weight_grid: 목표 비중 행렬 (shape: 비중 벡터 수 × 자산 수, 열 순서 = config.asset_slots)
+        monthly_thresholds: 월 첫 거래일 리밸런싱 임계값 후보
+        daily_thresholds: 매일 긴급 리밸런싱 임계값 후보
+        start_date: 백테스트 시작일 하한 (None이면 MA 워밍업 완료 시점부터)
+        data_frames: {str(경로): DataFrame} 미리 로딩된 데이터 (None이면 구성의 CSV를 1회 로딩)
+        batch_size: 배치 커널 1회 호출당 조합 수
+
+    Returns:
+        조합별 성과 DataFrame (Calmar 내림차순, 동률이면 CAGR 내림차순)
+        컬럼: {asset_id}_weight..., monthly_threshold_rate, daily_threshold_rate,
+              total_return_pct, cagr, mdd, calmar, total_trades, win_rate, final_capital, evaluated_by
+
+    Raises:
+        ValueError: 임계값 후보가 비어있거나 음수, batch_size가 1 미만, 비중 행렬이 유효하지 않은 경우
+    """
+    # 1. 입력 검증
+    weight_grid = np.asarray(weight_grid, dtype=np.float64)
+    validate_batch_weights(weight_grid, len(config.asset_slots))
+    if not monthly_thresholds or not daily_thresholds:
+        raise ValueError("monthly_thresholds와 daily_thresholds는 비어있을 수 없습니다")
+    if min([*monthly_thresholds, *daily_thresholds]) < 0:
+        raise ValueError("리밸런싱 임계값은 0 이상이어야 합니다")
+    if batch_size < 1:
+        raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+
+    # 2. 시그널 패널 (구성당 1회)
+    if data_frames is None:
+        data_frames = load_portfolio_data_frames([config])
+    panel = build_signal_panel(config, start_date, data_frames)
+
+    # 3. 조합 전개: (비중 벡터, 월간 임계값, 일간 임계값) 전 조합
+    weight_idx, monthly_idx, daily_idx = (
+        axis.ravel()
+        for axis in np.meshgrid(
+            np.arange(len(weight_grid)),
+            np.arange(len(monthly_thresholds)),
+            np.arange(len(daily_thresholds)),
+            indexing="ij",
+        )
+    )
+    weights = weight_grid[weight_idx]
+    monthly = np.asarray(monthly_thresholds, dtype=np.float64)[monthly_idx]
+    daily = np.asarray(daily_thresholds, dtype=np.float64)[daily_idx]
+    n_combos = len(weights)
+    logger.debug(
+        f"포트폴리오 탐색 시작: {config.experiment_name}, 비중 {len(weight_grid)}개 × "
+        f"월간 임계값 {len(monthly_thresholds)}개 × 일간 임계값 {len(daily_thresholds)}개 = {n_combos}개 조합"
+    )
+
+    # 4. 배치 커널 평가
+    final_capital = np.empty(n_combos, dtype=np.float64)
+    mdd = np.empty(n_combos, dtype=np.float64)
+    total_trades = np.empty(n_combos, dtype=np.int64)
+    winning_trades = np.empty(n_combos, dtype=np.int64)
+    diverged = np.empty(n_combos, dtype=np.bool_)
+    for start in range(0, n_combos, batch_size):
+        stop = min(start + batch_size, n_combos)
+        batch = run_portfolio_batch(
+            panel, weights[start:stop], monthly[start:stop], daily[start:stop], config.total_capital
+        )
+        final_capital[start:stop] = batch.final_capital
+        mdd[start:stop] = batch.mdd
+        total_trades[start:stop] = batch.total_trades
+        winning_trades[start:stop] = batch.winning_trades
+        diverged[start:stop] = batch.diverged
+
+    # 시그널 가정이 깨진 조합의 커널 값은 무효이므로 초기 자본으로 채워 계산한 뒤 5단계에서 덮어쓴다
+    kernel_final = np.where(diverged, config.total_capital, final_capital)
+    cagr = np.array(calculate_batch_cagr(kernel_final, config.total_capital, panel.dates[0], panel.dates[-1]))
+    calmar = calmar_ratios(cagr, mdd)
+    total_return_pct = (final_capital - config.total_capital) / config.total_capital * 100
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rate = np.where(total_trades > 0, winning_trades / total_trades * 100, 0.0)
+
+    # 5. 시그널 가정이 깨진 조합은 엔진으로 재계산 (진입 수량 0주 등 드문 경우)
+    evaluated_by = np.full(n_combos, "kernel", dtype=object)
+    diverged_idx = np.flatnonzero(diverged)
+    if len(diverged_idx) > 0:
+        logger.debug(f"시그널 가정 불일치 {len(diverged_idx)}개 조합 엔진 재계산")
+    for idx in diverged_idx.tolist():
+        slots = tuple(
+            dataclasses.replace(slot, target_weight=float(weights[idx, j])) for j, slot in enumerate(config.asset_slots)
+        )
+        result = run_portfolio_backtest(
+            dataclasses.replace(config, asset_slots=slots),
+            start_date=start_date,
+            capture_level="none",
+            data_frames=data_frames,
+            rebalance_policy=RebalancePolicy(float(monthly[idx]), float(daily[idx])),
+        )
+        summary = cast(SummaryDict, result.summary)
+        final_capital[idx] = summary["final_capital"]
+        mdd[idx] = summary["mdd"]
+        cagr[idx] = summary["cagr"]
+        calmar[idx] = summary["calmar"]
+        total_return_pct[idx] = summary["total_return_pct"]
+        total_trades[idx] = summary["total_trades"]
+        win_rate[idx] = summary["win_rate"]
+        evaluated_by[idx] = "engine"
+
+    # 6. 순위표 (Calmar 내림차순, 동률이면 CAGR 내림차순)
+    columns: dict[str, np.ndarray] = {asset_weight_col(aid): weights[:, j] for j, aid in enumerate(panel.asset_ids)}
+    columns[COL_MONTHLY_THRESHOLD_RATE] = monthly
+    columns[COL_DAILY_THRESHOLD_RATE] = daily
+    columns[COL_TOTAL_RETURN_PCT] = total_return_pct
+    columns[COL_CAGR] = cagr
+    columns[COL_MDD] = mdd
+    columns[COL_CALMAR] = calmar
+    columns[COL_TOTAL_TRADES] = total_trades
+    columns[COL_WIN_RATE] = win_rate
+    columns[COL_FINAL_CAPITAL] = final_capital
+    columns[COL_EVALUATED_BY] = evaluated_by
+    results_df = pd.DataFrame(columns)
+
+    logger.debug(f"포트폴리오 탐색 완료: {n_combos}개 조합 (엔진 재계산 {len(diverged_idx)}개)")
+    return results_df.sort_values(by=[COL_CALMAR, COL_CAGR], ascending=False, kind="stable").reset_index(drop=True)
@@ -8,6 +8,7 @@
 - PortfolioConfig: 포트폴리오 실험 설정 (frozen=True)
 - PortfolioAssetResult: 자산별 결과 (거래 내역 + 시그널 데이터)
 - PortfolioResult: 포트폴리오 전체 결과
+- PortfolioCaptureLevel: 일별 기록 수준 ("none" / "summary" / "equity" / "full")
 """
 
 from collections.abc import Mapping
@@ -67,6 +68,18 @@ def asset_executed_intent_col(asset_id: str) -> str:
     return f"{asset_id}{ASSET_COL_SUFFIX_EXECUTED_INTENT}"
 
 
+# ============================================================================
+# 일별 기록 수준 (run_portfolio_backtest capture_level)
+# ============================================================================
+# - "full": equity_df 전체 + state_log_df (디버깅/검증용, 기본값)
+# - "equity": equity_df 전체, state_log_df는 빈 DataFrame (자산별 주문/체결 컬럼 계산 생략)
+# - "summary": equity_df는 포트폴리오 단위 컬럼만 (자산별 보유 현황 컬럼 계산 생략)
+# - "none": equity_df/state_log_df 모두 빈 DataFrame (summary, trades_df만 필요한 일괄 실험용)
+
+PortfolioCaptureLevel = Literal["none", "summary", "equity", "full"]
+PORTFOLIO_CAPTURE_LEVELS: Final[tuple[PortfolioCaptureLevel, ...]] = ("none", "summary", "equity", "full")
+
+
 # ============================================================================
 # 런타임 상태
 # ============================================================================
@@ -176,6 +189,8 @@ class PortfolioResult:
     """포트폴리오 전체 결과.
 
     합산 에쿼티, 전 자산 거래 내역, 성과 요약, 자산별 결과를 담는다.
+    equity_df / state_log_df 의 범위는 run_portfolio_backtest 의 capture_level 에 따른다
+    (아래 명세는 기본값 "full" 기준, "summary"는 자산별 컬럼 없음, "none"은 빈 DataFrame).
 
     equity_df 컬럼 명세:
         - Date: 날짜 (date)
@@ -198,7 +213,7 @@ class PortfolioResult:
         - asset_id: 자산 식별자
         - trade_type: 거래 원인 ("signal" 또는 "rebalance")
 
-    state_log_df 컬럼 명세 (매 거래일 1행):
+    state_log_df 컬럼 명세 (매 거래일 1행, capture_level="full"일 때만):
         기본: Date, equity, cash, is_month_start, rebalanced, rebalance_reason
         자산별 ({asset_id}_ 접두사):
         - {aid}_close, {aid}_shares, {aid}_weight: 당일 상태
@@ -8,8 +8,11 @@ PortfolioResult의 state_log_df, equity_df를 기반으로
 규칙 3: EXIT_ALL 후 주수 0
 규칙 4: 현금 비음수
 규칙 5: 에쿼티 등식 (equity = cash + sum(shares * close))
+
+각 규칙은 행 단위 순회 대신 컬럼 배열(numpy)을 한 번에 비교하고, 위반 행에 대해서만 메시지를 만든다.
 """
 
+import numpy as np
 import pandas as pd
 
 from qbt.backtest.engines.portfolio_rebalance import DEFAULT_REBALANCE_POLICY
@@ -59,14 +62,13 @@ def _check_signal_execution_lag(
         if pending_col not in state_log_df.columns or executed_col not in state_log_df.columns:
             continue
 
-        for i in range(len(state_log_df) - 1):
-            pending = str(state_log_df.iloc[i][pending_col])
-            if not pending or pending == "" or pending == "nan":
-                continue
-            next_executed = str(state_log_df.iloc[i + 1][executed_col])
-            if pending != next_executed:
-                d = state_log_df.iloc[i]["Date"]
-                violations.append(f"[규칙1] {aid}: {d} pending={pending} -> 다음날 executed={next_executed}")
+        # i일 pending과 i+1일 executed를 한 칸 어긋난 배열로 비교 (빈 값/"nan"은 pending 없음)
+        pending = state_log_df[pending_col].astype(str).to_numpy()[:-1]
+        next_executed = state_log_df[executed_col].astype(str).to_numpy()[1:]
+        mismatch = (pending != "") & (pending != "nan") & (pending != next_executed)
+        for i in np.flatnonzero(mismatch):
+            d = state_log_df["Date"].iloc[i]
+            violations.append(f"[규칙1] {aid}: {d} pending={pending[i]} -> 다음날 executed={next_executed[i]}")
     return violations
 
 
@@ -89,23 +91,33 @@ def _check_rebalance_weight_consistency(
     if "rebalanced" not in state_log_df.columns:
         return violations
 
-    reb_rows = state_log_df[state_log_df["rebalanced"] == True]  # noqa: E712
+    reb_positions = np.flatnonzero((state_log_df["rebalanced"] == True).to_numpy())  # noqa: E712
+    if len(reb_positions) == 0:
+        return violations
+
     # asset_ids 는 state_log_df 컬럼에서 추출되었고 target_weights 는 동일 config 에서
     # 만들어졌으므로 두 키 집합은 일치한다. 따라서 .get default 는 dead branch.
-    for _, row in reb_rows.iterrows():
-        for aid in asset_ids:
-            target_w = target_weights[aid]
-            if target_w <= 0:
-                continue
-            shares = int(row[asset_shares_col(aid)])
-            if shares <= 0:
-                continue
-            actual_w = float(row[asset_weight_col(aid)])
-            deviation = abs(actual_w / target_w - 1.0)
-            if deviation > _REBALANCE_WEIGHT_DEVIATION_THRESHOLD:
+    # 자산별로 리밸런싱 행의 편차를 배열로 계산한 뒤, 메시지는 (행, 자산) 순서로 만든다.
+    deviations: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    for aid in asset_ids:
+        target_w = target_weights[aid]
+        if target_w <= 0:
+            continue
+        shares = state_log_df[asset_shares_col(aid)].to_numpy()[reb_positions].astype(np.int64)
+        actual_w = state_log_df[asset_weight_col(aid)].to_numpy()[reb_positions].astype(np.float64)
+        deviation = np.abs(actual_w / target_w - 1.0)
+        violated = (shares > 0) & (deviation > _REBALANCE_WEIGHT_DEVIATION_THRESHOLD)
+        deviations[aid] = (actual_w, deviation, violated)
+    if not deviations:
+        return violations
+
+    for k in np.flatnonzero(np.any([violated for _, _, violated in deviations.values()], axis=0)):
+        d = state_log_df["Date"].iloc[reb_positions[k]]
+        for aid, (actual_w, deviation, violated) in deviations.items():
+            if violated[k]:
                 violations.append(
-                    f"[규칙2] {row['Date']} {aid}: actual={actual_w:.4f}, "
-                    f"target={target_w:.4f}, deviation={deviation:.4f}"
+                    f"[규칙2] {d} {aid}: actual={actual_w[k]:.4f}, "
+                    f"target={target_weights[aid]:.4f}, deviation={deviation[k]:.4f}"
                 )
     return violations
 
@@ -130,12 +142,11 @@ def _check_exit_all_shares_zero(
         if executed_col not in state_log_df.columns:
             continue
 
-        exit_rows = state_log_df[state_log_df[executed_col] == "EXIT_ALL"]
         # shares_col 은 state_log_df 가 항상 갖는 자산별 컬럼이다.
-        for _, row in exit_rows.iterrows():
-            shares = int(row[shares_col])
-            if shares != 0:
-                violations.append(f"[규칙3] {row['Date']} {aid}: EXIT_ALL 후 shares={shares}")
+        shares = state_log_df[shares_col].to_numpy().astype(np.int64)
+        violated = (state_log_df[executed_col] == "EXIT_ALL").to_numpy() & (shares != 0)
+        for i in np.flatnonzero(violated):
+            violations.append(f"[규칙3] {state_log_df['Date'].iloc[i]} {aid}: EXIT_ALL 후 shares={shares[i]}")
     return violations
 
 
@@ -148,10 +159,8 @@ def _check_cash_non_negative(equity_df: pd.DataFrame) -> list[str]:
     Returns:
         위반 메시지 리스트
     """
-    negative = equity_df[equity_df["cash"] < 0]
-    if negative.empty:
-        return []
-    return [f"[규칙4] {row['Date']}: cash={row['cash']:.0f}" for _, row in negative.iterrows()]
+    cash = equity_df["cash"].to_numpy(dtype=np.float64)
+    return [f"[규칙4] {equity_df['Date'].iloc[i]}: cash={cash[i]:.0f}" for i in np.flatnonzero(cash < 0)]
 
 
 def _check_equity_equation(equity_df: pd.DataFrame) -> list[str]:
@@ -171,13 +180,16 @@ def _check_equity_equation(equity_df: pd.DataFrame) -> list[str]:
             f"(columns={list(equity_df.columns)}). "
             f"value_cols가 비면 sum=0.0으로 등식 검증이 우회되므로 즉시 중단한다."
         )
-    violations: list[str] = []
-    for _, row in equity_df.iterrows():
-        computed = float(row["cash"]) + sum(float(row[vc]) for vc in value_cols)
-        recorded = float(row["equity"])
-        if abs(computed - recorded) > _EQUITY_EQUATION_TOLERANCE:
-            violations.append(f"[규칙5] {row['Date']}: computed={computed:.0f} != equity={recorded:.0f}")
-    return violations
+    # 자산 평가액 합계는 컬럼 순서대로 누적한다 (행 단위 sum과 같은 덧셈 순서)
+    value_total = np.zeros(len(equity_df), dtype=np.float64)
+    for vc in value_cols:
+        value_total = value_total + equity_df[vc].to_numpy(dtype=np.float64)
+    computed = equity_df["cash"].to_numpy(dtype=np.float64) + value_total
+    recorded = equity_df["equity"].to_numpy(dtype=np.float64)
+    return [
+        f"[규칙5] {equity_df['Date'].iloc[i]}: computed={computed[i]:.0f} != equity={recorded[i]:.0f}"
+        for i in np.flatnonzero(np.abs(computed - recorded) > _EQUITY_EQUATION_TOLERANCE)
+    ]
 
 
 def validate_portfolio_result(result: PortfolioResult) -> list[str]:
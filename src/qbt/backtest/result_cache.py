@@ -0,0 +1,447 @@
+"""백테스트 결과 디스크 캐시 모듈
+
+동일한 입력 데이터 + 파라미터로 반복 실행되는 평가 결과를 storage/results/cache에 저장한다.
+- 키: 데이터 지문(signal/trade DataFrame 내용 해시) + 기간 + 전략 ID + 파라미터의 SHA-256
+- 저장: 항목당 JSON 파일 1개 (float는 repr 왕복으로 비트 단위 보존)
+- 축출: 디렉토리 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목(mtime 기준)부터 삭제
+- 무효화: meta.json의 데이터 갱신 타임스탬프(다운로드/합성 데이터 생성)가 바뀌면 전체 삭제
+
+데이터 내용이 키에 포함되므로 CSV가 바뀌면 자동으로 캐시 미스가 된다.
+엔진 체결 규칙이나 지표 정의가 바뀌면 RESULT_CACHE_SCHEMA_VERSION을 올린다.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+from pandas.core.util.hashing import hash_pandas_object
+
+from qbt.backtest.constants import (
+    DEFAULT_RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_DATA_META_TYPES,
+    RESULT_CACHE_SCHEMA_VERSION,
+    SLIPPAGE_RATE,
+)
+from qbt.backtest.engines.backtest_engine import run_buffer_strategy, run_grid_search
+from qbt.backtest.types import BufferStrategyParams, SummaryDict, WfoWindowResultDict
+from qbt.backtest.walkforward import run_walkforward
+from qbt.common_constants import COL_DATE, RESULT_CACHE_DIR
+from qbt.utils import get_logger
+from qbt.utils.meta_manager import get_latest_timestamp
+
+logger = get_logger(__name__)
+
+# 캐시 항목 파일 확장자와 데이터 버전 마커 파일명
+_ENTRY_SUFFIX = ".json"
+_DATA_VERSION_FILENAME = "_data_version.json"
+
+
+# ============================================================================
+# 키 생성
+# ============================================================================
+
+
+def fingerprint_frame(df: pd.DataFrame) -> str:
+    """DataFrame 내용의 지문(SHA-256 hex)을 계산한다.
+
+    컬럼명, 행 수, 모든 셀 값(인덱스 제외)을 해시한다.
+    동일 CSV에서 같은 기간을 슬라이스하고 같은 MA를 붙인 DataFrame은 같은 지문을 가진다.
+
+    Args:
+        df: 지문을 계산할 DataFrame
+
+    Returns:
+        64자리 16진수 문자열
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([str(c) for c in df.columns]).encode("utf-8"))
+    hasher.update(str(len(df)).encode("utf-8"))
+    if len(df) > 0:
+        row_hashes = hash_pandas_object(df, index=False).to_numpy()
+        hasher.update(row_hashes.tobytes())
+    return hasher.hexdigest()
+
+
+def data_key_fields(signal_df: pd.DataFrame, trade_df: pd.DataFrame) -> dict[str, Any]:
+    """signal/trade DataFrame의 키 구성 요소(지문 + 기간)를 반환한다.
+
+    같은 데이터로 여러 파라미터를 조회할 때는 한 번만 계산하여 재사용한다.
+
+    Args:
+        signal_df: 시그널용 DataFrame
+        trade_df: 매매용 DataFrame
+
+    Returns:
+        {"signal", "trade", "start_date", "end_date"} 딕셔너리
+    """
+    fields: dict[str, Any] = {
+        "signal": fingerprint_frame(signal_df),
+        "trade": fingerprint_frame(trade_df),
+    }
+    if len(signal_df) > 0 and COL_DATE in signal_df.columns:
+        fields["start_date"] = str(signal_df[COL_DATE].iloc[0])
+        fields["end_date"] = str(signal_df[COL_DATE].iloc[-1])
+    return fields
+
+
+def _json_default(value: object) -> object:
+    """json.dumps가 직접 처리하지 못하는 numpy 스칼라를 파이썬 기본 타입으로 변환한다."""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(value).__name__}")
+
+
+# ============================================================================
+# 캐시 저장소
+# ============================================================================
+
+
+class ResultCache:
+    """내용 주소 기반 백테스트 결과 캐시.
+
+    키 페이로드(dict)를 정규화된 JSON으로 직렬화한 뒤 SHA-256으로 파일명을 만든다.
+    조회 성공 시 파일 mtime을 갱신하여 LRU 순서를 유지한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """캐시 저장소를 초기화한다.
+
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 RESULT_CACHE_DIR)
+            max_bytes: 디렉토리 최대 크기 (바이트)
+
+        Raises:
+            ValueError: max_bytes가 양수가 아닌 경우
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes는 양수여야 합니다: {max_bytes}")
+
+        self.cache_dir = cache_dir if cache_dir is not None else RESULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def make_key(self, payload: dict[str, Any]) -> str:
+        """키 페이로드로부터 캐시 키를 생성한다.
+
+        스키마 버전과 슬리피지율을 함께 해시하여 엔진 규칙 변경 시 자동으로 미스가 나도록 한다.
+
+        Args:
+            payload: 데이터 지문, 전략 ID, 파라미터 등을 담은 JSON 직렬화 가능 딕셔너리
+
+        Returns:
+            64자리 16진수 캐시 키
+        """
+        full_payload = {
+            "schema_version": RESULT_CACHE_SCHEMA_VERSION,
+            "slippage_rate": SLIPPAGE_RATE,
+            **payload,
+        }
+        encoded = json.dumps(full_payload, sort_keys=True, default=_json_default)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """캐시 항목을 조회한다.
+
+        Args:
+            key: make_key()로 생성한 키
+
+        Returns:
+            저장된 값 (없거나 손상된 경우 None)
+        """
+        path = self._entry_path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            # 중단된 쓰기 등으로 손상된 항목은 삭제하고 미스로 처리
+            logger.debug(f"손상된 캐시 항목 삭제: {path.name} ({e})")
+            path.unlink(missing_ok=True)
+            return None
+
+        # LRU: 사용 시각 갱신
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """캐시 항목을 저장하고 크기 상한을 초과하면 축출한다.
+
+        임시 파일에 쓴 뒤 교체하므로 동시에 실행된 다른 프로세스가 반쯤 쓰인 파일을 읽지 않는다.
+
+        Args:
+            key: make_key()로 생성한 키
+            value: JSON 직렬화 가능한 값
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(value, f, default=_json_default)
+        os.replace(tmp_path, path)
+
+        self._evict()
+
+    def get_or_compute(
+        self,
+        payload: dict[str, Any],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """캐시에 있으면 저장된 값을, 없으면 compute() 결과를 저장 후 반환한다.
+
+        Args:
+            payload: 키 페이로드
+            compute: 미스 시 호출할 함수 (JSON 직렬화 가능한 값을 반환)
+
+        Returns:
+            저장된 값 또는 새로 계산한 값
+        """
+        key = self.make_key(payload)
+        cached = self.get(key)
+        if cached is not None:
+            logger.debug(f"결과 캐시 적중: {payload.get('kind', '')} {key[:12]}")
+            return cached
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return [
+            p
+            for p in self.cache_dir.iterdir()
+            if p.is_file() and p.suffix == _ENTRY_SUFFIX and p.name != _DATA_VERSION_FILENAME
+        ]
+
+    def _evict(self) -> None:
+        """디렉토리 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제한다."""
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> int:
+        """모든 캐시 항목을 삭제한다.
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = self._entries()
+        for path in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+    def invalidate_if_data_updated(
+        self,
+        data_meta_types: list[str] | tuple[str, ...] = RESULT_CACHE_DATA_META_TYPES,
+    ) -> bool:
+        """meta.json의 데이터 갱신 시각이 마지막 확인 시각보다 새로우면 캐시를 비운다.
+
+        데이터 지문이 키에 포함되어 있어 정합성은 이미 보장되지만, 갱신 전 데이터로 만든
+        항목은 다시 적중할 일이 없으므로 이 시점에 정리하여 디스크 공간을 회수한다.
+
+        Args:
+            data_meta_types: 입력 데이터를 갱신하는 작업의 meta.json 타입 목록
+
+        Returns:
+            삭제한 항목이 있으면 True
+        """
+        latest = get_latest_timestamp(data_meta_types)
+        if latest is None:
+            return False
+
+        marker_path = self.cache_dir / _DATA_VERSION_FILENAME
+        recorded: datetime | None = None
+        if marker_path.exists():
+            with marker_path.open("r", encoding="utf-8") as f:
+                recorded = datetime.fromisoformat(json.load(f)["data_updated_at"])
+
+        if recorded is not None and latest <= recorded:
+            return False
+
+        removed = self.clear()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with marker_path.open("w", encoding="utf-8") as f:
+            json.dump({"data_updated_at": latest.isoformat()}, f)
+
+        if removed > 0:
+            logger.debug(f"데이터 갱신 감지({latest.isoformat()}): 결과 캐시 {removed}개 삭제")
+        return removed > 0
+
+
+# ============================================================================
+# 캐시 적용 평가 함수
+# ============================================================================
+
+
+def buffer_strategy_payload(
+    data_fields: dict[str, Any],
+    params: BufferStrategyParams,
+    strategy_name: str = "buffer_zone",
+) -> dict[str, Any]:
+    """run_buffer_strategy 요약 캐시의 키 페이로드를 생성한다.
+
+    조회와 계산을 분리해야 하는 호출자(미스만 모아 병렬 실행하는 스크립트 등)가
+    ResultCache.make_key()/get()/put()과 함께 사용한다.
+
+    Args:
+        data_fields: data_key_fields()로 계산한 데이터 키 구성 요소
+        params: 전략 파라미터
+        strategy_name: 전략 식별 이름
+
+    Returns:
+        키 페이로드 딕셔너리
+    """
+    return {
+        "kind": "buffer_strategy_summary",
+        "strategy_id": strategy_name,
+        "data": data_fields,
+        "params": {
+            "initial_capital": params.initial_capital,
+            "ma_window": params.ma_window,
+            "buy_buffer_zone_pct": params.buy_buffer_zone_pct,
+            "sell_buffer_zone_pct": params.sell_buffer_zone_pct,
+            "hold_days": params.hold_days,
+        },
+    }
+
+
+def cached_buffer_strategy_summary(
+    cache: ResultCache,
+    signal_df: pd.DataFrame,
+    trade_df: pd.DataFrame,
+    params: BufferStrategyParams,
+    strategy_name: str = "buffer_zone",
+) -> SummaryDict:
+    """run_buffer_strategy의 성과 요약을 캐시를 거쳐 반환한다.
+
+    거래 내역/에쿼티는 캐시하지 않는다 (요약 지표만 필요한 고원 분석 등에서 사용).
+
+    Args:
+        cache: 결과 캐시
+        signal_df: 시그널용 DataFrame
+        trade_df: 매매용 DataFrame
+        params: 전략 파라미터
+        strategy_name: 전략 식별 이름
+
+    Returns:
+        run_buffer_strategy()의 summary와 동일한 값
+    """
+    payload = buffer_strategy_payload(data_key_fields(signal_df, trade_df), params, strategy_name)
+
+    def _compute() -> SummaryDict:
+        _, _, summary = run_buffer_strategy(signal_df, trade_df, params, log_trades=False, strategy_name=strategy_name)
+        return summary
+
+    return cast(SummaryDict, cache.get_or_compute(payload, _compute))
+
+
+def cached_grid_search(
+    cache: ResultCache,
+    signal_df: pd.DataFrame,
+    trade_df: pd.DataFrame,
+    ma_window_list: list[int],
+    buy_buffer_zone_pct_list: list[float],
+    sell_buffer_zone_pct_list: list[float],
+    hold_days_list: list[int],
+    initial_capital: float,
+) -> pd.DataFrame:
+    """run_grid_search 결과를 캐시를 거쳐 반환한다.
+
+    Args:
+        cache: 결과 캐시
+        signal_df, trade_df, 기타: run_grid_search()와 동일
+
+    Returns:
+        run_grid_search()와 동일한 DataFrame (컬럼 순서/dtype 포함)
+    """
+    payload = {
+        "kind": "grid_search",
+        "strategy_id": "buffer_zone",
+        "data": data_key_fields(signal_df, trade_df),
+        "grid": {
+            "ma_window_list": list(ma_window_list),
+            "buy_buffer_zone_pct_list": list(buy_buffer_zone_pct_list),
+            "sell_buffer_zone_pct_list": list(sell_buffer_zone_pct_list),
+            "hold_days_list": list(hold_days_list),
+            "initial_capital": initial_capital,
+        },
+    }
+
+    def _compute() -> dict[str, Any]:
+        results_df = run_grid_search(
+            signal_df,
+            trade_df,
+            ma_window_list,
+            buy_buffer_zone_pct_list,
+            sell_buffer_zone_pct_list,
+            hold_days_list,
+            initial_capital,
+        )
+        return {"columns": list(results_df.columns), "data": results_df.to_dict(orient="list")}
+
+    stored = cache.get_or_compute(payload, _compute)
+    return pd.DataFrame(stored["data"], columns=stored["columns"])
+
+
+def cached_walkforward(
+    cache: ResultCache,
+    signal_df: pd.DataFrame,
+    trade_df: pd.DataFrame,
+    **wfo_kwargs: Any,
+) -> list[WfoWindowResultDict]:
+    """run_walkforward 결과를 캐시를 거쳐 반환한다.
+
+    Args:
+        cache: 결과 캐시
+        signal_df: 시그널용 DataFrame
+        trade_df: 매매용 DataFrame
+        **wfo_kwargs: run_walkforward()의 나머지 키워드 인자
+
+    Returns:
+        run_walkforward()와 동일한 윈도우 결과 리스트
+    """
+    payload = {
+        "kind": "walkforward",
+        "strategy_id": "buffer_zone",
+        "data": data_key_fields(signal_df, trade_df),
+        # incremental_is는 결과에 영향을 주지 않는 실행 방식 옵션이므로 키에서 제외
+        "wfo": {k: v for k, v in wfo_kwargs.items() if k != "incremental_is"},
+    }
+
+    def _compute() -> list[WfoWindowResultDict]:
+        return run_walkforward(signal_df, trade_df, **wfo_kwargs)
+
+    return cast(list[WfoWindowResultDict], cache.get_or_compute(payload, _compute))
@@ -16,7 +16,6 @@ from typing import Any
 
 import pandas as pd
 
-from qbt.backtest.analysis import add_single_moving_average
 from qbt.backtest.constants import (
     COL_BUY_BUFFER_PCT,
     COL_LOWER_BAND,
@@ -26,6 +25,7 @@ from qbt.backtest.constants import (
     ma_col_name,
 )
 from qbt.backtest.engines.backtest_engine import run_backtest
+from qbt.backtest.feature_store import with_moving_averages
 from qbt.backtest.strategies.buffer_zone import (
     BufferZoneConfig,
     BufferZoneStrategy,
@@ -122,7 +122,9 @@ def create_buffer_zone_runner(config: BufferZoneConfig) -> Callable[[], SingleBa
         ma_col = ma_col_name(params.ma_window)
 
         # 3. 이동평균 계산
-        signal_df = add_single_moving_average(signal_df, params.ma_window, ma_type=config.ma_type)
+        signal_df = with_moving_averages(
+            signal_df, [params.ma_window], ma_type=config.ma_type, name=config.signal_data_path.stem
+        )
 
         # 4. MA 유효 구간 필터링
         valid_mask = signal_df[ma_col].notna()
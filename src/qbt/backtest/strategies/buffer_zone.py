@@ -11,6 +11,7 @@ from datetime import date
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
 from qbt.backtest.constants import (
@@ -243,6 +244,10 @@ class BufferZoneStrategy(SignalStrategy):
     내부 상태(_prev_upper, _prev_lower, _hold_state)를 관리하여 엔진이
     밴드 값을 직접 다룰 필요가 없도록 한다.
 
+    성능: 매 호출마다 signal_df.iloc[i]로 행(Series)을 만들지 않도록,
+    처음 전달받은 signal_df의 Close/MA 컬럼을 NumPy 배열로 1회 추출하여 캐싱한다.
+    다른 signal_df 객체가 전달되면 배열을 다시 추출한다 (값은 iloc 경로와 동일).
+
     생성자 파라미터:
         ma_col: 이동평균 컬럼명 (예: "ma_200")
         buy_buffer_pct: 매수 버퍼존 비율 (0~1)
@@ -278,9 +283,30 @@ class BufferZoneStrategy(SignalStrategy):
         self._last_buy_buffer_pct: float = 0.0
         self._last_hold_days_used: int = 0
 
+        # signal_df 컬럼 배열 캐시 (_bind_arrays에서 갱신)
+        self._bound_df: pd.DataFrame | None = None
+        self._close_arr: np.ndarray = np.empty(0, dtype=float)
+        self._ma_arr: np.ndarray = np.empty(0, dtype=float)
+
+    def _bind_arrays(self, signal_df: pd.DataFrame) -> None:
+        """signal_df의 Close/MA 컬럼을 연속 NumPy 배열로 캐싱한다.
+
+        같은 signal_df 객체로 반복 호출되면 아무 작업도 하지 않는다.
+        객체 참조를 보관하므로 id 재사용으로 인한 오캐싱이 발생하지 않는다.
+
+        Args:
+            signal_df: 시그널용 DataFrame (ma_col, Close 컬럼 포함)
+        """
+        if self._bound_df is signal_df:
+            return
+        self._close_arr = signal_df[COL_CLOSE].to_numpy(dtype=float)
+        self._ma_arr = signal_df[self._ma_col].to_numpy(dtype=float)
+        self._bound_df = signal_df
+
     def _init_prev_from_row(self, signal_df: pd.DataFrame, idx: int) -> None:
         """idx행 기준으로 _prev_upper/_prev_lower를 초기화한다."""
-        ma_val = float(signal_df.iloc[idx][self._ma_col])
+        self._bind_arrays(signal_df)
+        ma_val = float(self._ma_arr[idx])
         self._prev_upper, self._prev_lower = compute_bands(ma_val, self._buy_buffer_pct, self._sell_buffer_pct)
 
     def _update_bands(
@@ -309,8 +335,8 @@ class BufferZoneStrategy(SignalStrategy):
             None이면 초기화 완료 후 신호 없음.
             6-tuple이면 신호 판단에 필요한 (prev_close, cur_close, prev_upper, cur_upper, prev_lower, cur_lower).
         """
-        row = signal_df.iloc[i]
-        ma_val = float(row[self._ma_col])
+        self._bind_arrays(signal_df)
+        ma_val = float(self._ma_arr[i])
         cur_upper, cur_lower = compute_bands(ma_val, self._buy_buffer_pct, self._sell_buffer_pct)
 
         # 최초 호출 처리
@@ -325,8 +351,8 @@ class BufferZoneStrategy(SignalStrategy):
         assert self._prev_upper is not None and self._prev_lower is not None
         prev_upper = self._prev_upper
         prev_lower = self._prev_lower
-        prev_close = float(signal_df.iloc[i - 1][COL_CLOSE])
-        cur_close = float(row[COL_CLOSE])
+        prev_close = float(self._close_arr[i - 1])
+        cur_close = float(self._close_arr[i])
 
         # prev 상태를 현재 값으로 갱신
         self._prev_upper = cur_upper
@@ -14,8 +14,8 @@ from dataclasses import dataclass
 
 import pandas as pd
 
-from qbt.backtest.analysis import add_single_moving_average
 from qbt.backtest.constants import ma_col_name
+from qbt.backtest.feature_store import with_moving_averages
 from qbt.backtest.portfolio_types import AssetSlotConfig
 from qbt.backtest.strategies.buffer_zone import BufferZoneStrategy
 from qbt.backtest.strategies.buy_and_hold import BuyAndHoldStrategy
@@ -83,7 +83,7 @@ def _prepare_buffer_zone_signal_df(df: pd.DataFrame, slot: AssetSlotConfig) -> p
     Returns:
         MA 컬럼(ma_{ma_window})이 추가된 DataFrame
     """
-    return add_single_moving_average(df, slot.ma_window, slot.ma_type)
+    return with_moving_averages(df, [slot.ma_window], slot.ma_type, name=slot.signal_data_path.stem)
 
 
 def _get_buffer_zone_warmup_periods(slot: AssetSlotConfig) -> int:
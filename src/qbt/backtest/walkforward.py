@@ -17,7 +17,6 @@ from typing import cast
 import pandas as pd
 
 from qbt.backtest.analysis import (
-    add_single_moving_average,
     calculate_calmar,
     calculate_drawdown_pct_series,
 )
@@ -43,7 +42,8 @@ from qbt.backtest.constants import (
     DEFAULT_WFO_SELL_BUFFER_ZONE_PCT_LIST,
     ma_col_name,
 )
-from qbt.backtest.engines.backtest_engine import run_backtest, run_grid_search
+from qbt.backtest.engines.backtest_engine import ExpandingGridSearch, run_backtest, run_grid_search
+from qbt.backtest.feature_store import with_moving_averages
 from qbt.backtest.runners import enrich_equity_with_bands
 from qbt.backtest.strategies.buffer_zone import BufferZoneStrategy
 from qbt.backtest.strategies.strategy_common import SignalStrategy
@@ -248,6 +248,7 @@ def run_walkforward(
     initial_capital: float = DEFAULT_INITIAL_CAPITAL,
     min_trades: int = DEFAULT_WFO_MIN_TRADES,
     rolling_is_months: int | None = None,
+    incremental_is: bool = True,
 ) -> list[WfoWindowResultDict]:
     """핵심 WFO 루프를 실행한다.
 
@@ -259,6 +260,11 @@ def run_walkforward(
     3. IS 그리드 서치(run_grid_search)는 내부적으로 MA를 재계산하므로 IS 평가에는 영향이 없다.
     4. OOS 독립 평가는 전체 히스토리 기반 EMA 값을 그대로 사용하여 EMA 연속성을 보장한다.
 
+    증분 IS 최적화 (Expanding 모드 + incremental_is=True):
+    IS가 항상 데이터 시작일에서 시작하므로 ExpandingGridSearch가 직전 IS 종료 시점의
+    조합별 엔진 상태를 이어받아 새로 추가된 구간만 시뮬레이션한다.
+    결과는 윈도우마다 run_grid_search를 새로 호출한 것과 동일하다.
+
     Args:
         signal_df: 시그널용 DataFrame (MA 컬럼 미포함, 내부에서 계산)
         trade_df: 매매용 DataFrame
@@ -272,6 +278,8 @@ def run_walkforward(
         min_trades: IS 최적 파라미터 선택 시 최소 거래수 제약 (기본값: DEFAULT_WFO_MIN_TRADES)
         rolling_is_months: Rolling IS 최대 길이 (개월).
             None이면 Expanding 모드 (기본 동작). int이면 Rolling 모드.
+        incremental_is: Expanding 모드에서 IS 그리드 서치를 체크포인트 기반으로
+            증분 실행할지 여부 (기본값: True). Rolling 모드에서는 무시된다.
 
     Returns:
         윈도우별 결과 리스트
@@ -298,26 +306,15 @@ def run_walkforward(
     # 2. 루프 전: 전체 signal_df에 모든 MA 윈도우 사전 계산 (EMA 연속성 보장)
     # EMA는 전달된 시리즈의 첫 행부터 새로 계산되므로, OOS 슬라이스 후 계산하면
     # 전체 히스토리를 이어받지 못한다. 슬라이스 전에 전체 데이터로 먼저 계산한다.
-    signal_df_with_ma = signal_df.copy()
-    for _ma_window in ma_window_list:
-        _ma_col = ma_col_name(_ma_window)
-        if _ma_col not in signal_df_with_ma.columns:
-            signal_df_with_ma = add_single_moving_average(signal_df_with_ma, _ma_window, ma_type=DEFAULT_BUFFER_MA_TYPE)
-
-    for idx, (is_start, is_end, oos_start, oos_end) in enumerate(windows):
-        logger.debug(f"WFO [{idx + 1}/{len(windows)}] " f"IS={is_start}~{is_end}, OOS={oos_start}~{oos_end}")
-
-        # 3. IS 데이터 슬라이스 (전체 히스토리 MA 포함)
-        # 방어적 설계: trade_df에 독립 날짜 마스크 적용 (인덱스 정합성 가정 제거)
-        is_mask = (signal_df_with_ma[COL_DATE] >= is_start) & (signal_df_with_ma[COL_DATE] <= is_end)
-        is_signal = signal_df_with_ma[is_mask].reset_index(drop=True)
-        is_trade_mask = (trade_df[COL_DATE] >= is_start) & (trade_df[COL_DATE] <= is_end)
-        is_trade = trade_df[is_trade_mask].reset_index(drop=True)
-
-        # 4. IS 그리드 서치 실행
-        grid_df = run_grid_search(
-            signal_df=is_signal,
-            trade_df=is_trade,
+    missing_ma_windows = [w for w in ma_window_list if ma_col_name(w) not in signal_df.columns]
+    signal_df_with_ma = with_moving_averages(signal_df, missing_ma_windows, ma_type=DEFAULT_BUFFER_MA_TYPE)
+
+    # Expanding 모드: IS 체크포인트를 이어가는 증분 그리드 서치 준비
+    expanding_search: ExpandingGridSearch | None = None
+    if incremental_is and rolling_is_months is None:
+        expanding_search = ExpandingGridSearch(
+            signal_df=signal_df,
+            trade_df=trade_df,
             ma_window_list=ma_window_list,
             buy_buffer_zone_pct_list=buy_buffer_zone_pct_list,
             sell_buffer_zone_pct_list=sell_buffer_zone_pct_list,
@@ -325,6 +322,31 @@ def run_walkforward(
             initial_capital=initial_capital,
         )
 
+    for idx, (is_start, is_end, oos_start, oos_end) in enumerate(windows):
+        logger.debug(f"WFO [{idx + 1}/{len(windows)}] " f"IS={is_start}~{is_end}, OOS={oos_start}~{oos_end}")
+
+        if expanding_search is not None:
+            # 3-4. 증분 IS 그리드 서치 (직전 IS 종료 시점부터 이어서 시뮬레이션)
+            grid_df = expanding_search.evaluate_until(is_end)
+        else:
+            # 3. IS 데이터 슬라이스 (전체 히스토리 MA 포함)
+            # 방어적 설계: trade_df에 독립 날짜 마스크 적용 (인덱스 정합성 가정 제거)
+            is_mask = (signal_df_with_ma[COL_DATE] >= is_start) & (signal_df_with_ma[COL_DATE] <= is_end)
+            is_signal = signal_df_with_ma[is_mask].reset_index(drop=True)
+            is_trade_mask = (trade_df[COL_DATE] >= is_start) & (trade_df[COL_DATE] <= is_end)
+            is_trade = trade_df[is_trade_mask].reset_index(drop=True)
+
+            # 4. IS 그리드 서치 실행
+            grid_df = run_grid_search(
+                signal_df=is_signal,
+                trade_df=is_trade,
+                ma_window_list=ma_window_list,
+                buy_buffer_zone_pct_list=buy_buffer_zone_pct_list,
+                sell_buffer_zone_pct_list=sell_buffer_zone_pct_list,
+                hold_days_list=hold_days_list,
+                initial_capital=initial_capital,
+            )
+
         # 5. Calmar 기준 최적 파라미터 추출 (min_trades 필터링 적용)
         best = select_best_calmar_params(grid_df, min_trades=min_trades)
         best_ma = best[COL_MA_WINDOW]
@@ -685,9 +707,7 @@ def run_stitched_equity(
     # 모든 MA 윈도우 사전 계산 (EMA 연속성 보장 — OOS 슬라이스 전에 전체 signal_df에 계산)
     all_ma_windows: set[int] = {wr["best_ma_window"] for wr in window_results}
 
-    signal_df_with_ma = signal_df.copy()
-    for window in all_ma_windows:
-        signal_df_with_ma = add_single_moving_average(signal_df_with_ma, window, ma_type=DEFAULT_BUFFER_MA_TYPE)
+    signal_df_with_ma = with_moving_averages(signal_df, all_ma_windows, ma_type=DEFAULT_BUFFER_MA_TYPE)
 
     # OOS 구간 데이터 슬라이스 (독립 날짜 기반 마스크)
     oos_signal_mask = (signal_df_with_ma[COL_DATE] >= oos_start_date) & (signal_df_with_ma[COL_DATE] <= oos_end_date)
@@ -753,9 +773,7 @@ def run_window_detail_backtests(
     # 1. 모든 윈도우에서 사용되는 MA window 수집 및 사전 계산 (EMA 연속성 보장)
     all_ma_windows: set[int] = {wr["best_ma_window"] for wr in window_results}
 
-    signal_df_with_ma = signal_df.copy()
-    for ma_window in all_ma_windows:
-        signal_df_with_ma = add_single_moving_average(signal_df_with_ma, ma_window, ma_type=DEFAULT_BUFFER_MA_TYPE)
+    signal_df_with_ma = with_moving_averages(signal_df, all_ma_windows, ma_type=DEFAULT_BUFFER_MA_TYPE)
 
     # 2. 각 윈도우별 백테스트 실행
     results: list[WindowDetailData] = []
@@ -26,11 +26,13 @@ STORAGE_DIR: Final = Path("storage")
 # '/' 연산자로 경로 결합: Path 객체끼리 또는 Path와 문자열 결합 가능
 # STORAGE_DIR / "stock" = Path("storage/stock")
 STOCK_DIR: Final = STORAGE_DIR / "stock"  # 주식 데이터 저장 디렉토리
+FEATURE_STORE_DIR: Final = STOCK_DIR / "features"  # 이동평균 피처 컬럼 파일 (.npy) 저장 디렉토리
 ETC_DIR: Final = STORAGE_DIR / "etc"  # 금리 등 기타 데이터 저장 디렉토리
 RESULTS_DIR: Final = STORAGE_DIR / "results"  # 분석 결과 저장 디렉토리
 BACKTEST_RESULTS_DIR: Final = RESULTS_DIR / "backtest"  # 백테스트 결과 저장 디렉토리
 TQQQ_RESULTS_DIR: Final = RESULTS_DIR / "tqqq"  # TQQQ 시뮬레이션 결과 저장 디렉토리
 PORTFOLIO_RESULTS_DIR: Final = RESULTS_DIR / "portfolio"  # 포트폴리오 실험 결과
+RESULT_CACHE_DIR: Final = RESULTS_DIR / "cache"  # 백테스트 결과 캐시 (데이터 지문 + 파라미터 키)
 
 # --- 데이터 파일 경로 ---
 # 나스닥 100 추종 ETF 데이터 파일 경로
@@ -53,6 +55,12 @@ QLD_DATA_PATH: Final = STOCK_DIR / "QLD_max.csv"
 UGL_DATA_PATH: Final = STOCK_DIR / "UGL_max.csv"
 UBT_DATA_PATH: Final = STOCK_DIR / "UBT_max.csv"
 
+# 합성 2배 레버리지 ETF 데이터 파일 경로 (generate_synthetic_batch.py 생성, 상장 이전 구간 시뮬레이션 + 실제 병합)
+SSO_SYNTHETIC_DATA_PATH: Final = STOCK_DIR / "SSO_synthetic_max.csv"
+QLD_SYNTHETIC_DATA_PATH: Final = STOCK_DIR / "QLD_synthetic_max.csv"
+UGL_SYNTHETIC_DATA_PATH: Final = STOCK_DIR / "UGL_synthetic_max.csv"
+UBT_SYNTHETIC_DATA_PATH: Final = STOCK_DIR / "UBT_synthetic_max.csv"
+
 # --- 실행 이력 메타데이터 저장 경로 (JSON 형식) ---
 META_JSON_PATH: Final = RESULTS_DIR / "meta.json"
 
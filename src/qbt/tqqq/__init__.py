@@ -4,6 +4,7 @@ TQQQ 레버리지 ETF 시뮬레이션 패키지
 
 from qbt.tqqq.simulation import (
     build_monthly_spread_map,
+    build_monthly_spread_series,
     calculate_validation_metrics,
     simulate,
 )
@@ -11,5 +12,6 @@ from qbt.tqqq.simulation import (
 __all__ = [
     "simulate",
     "build_monthly_spread_map",
+    "build_monthly_spread_series",
     "calculate_validation_metrics",
 ]
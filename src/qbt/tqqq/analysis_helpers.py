@@ -9,8 +9,6 @@ Fail-fast 정책:
 - 조용히 진행하지 않고 명확한 에러 메시지 제공
 """
 
-from datetime import date
-
 import numpy as np
 import pandas as pd
 
@@ -22,7 +20,7 @@ from qbt.tqqq.constants import (
     COL_RATE_PCT,
     COL_SUM_DAILY_M,
 )
-from qbt.tqqq.data_loader import create_ffr_dict, lookup_ffr
+from qbt.tqqq.data_loader import create_ffr_series
 from qbt.utils import get_logger
 
 logger = get_logger(__name__)
@@ -277,23 +275,17 @@ def aggregate_monthly(
     monthly[COL_SUM_DAILY_M] = pd.NA
 
     # 7. FFR 데이터 매칭 (있을 때만)
-    # 딕셔너리 기반 조회 + 2개월 fallback + fail-fast
+    # 월별 시계열(MonthlySeries) 조회 + 2개월 fallback + fail-fast
     # lookup_ffr와 동일한 정책 적용
     if ffr_df is not None and not ffr_df.empty:
-        # FFR 딕셔너리 생성 (O(1) 조회용)
-        ffr_dict = create_ffr_dict(ffr_df)
-
-        # 각 월에 대해 FFR 조회 (2개월 fallback, 초과 시 ValueError)
-        # Period 객체를 date로 변환하여 lookup_ffr 호출
-        ffr_values: list[float] = []
-        for period in monthly[COL_MONTH]:
-            date_value = date(period.year, period.month, 1)
-            ffr_value = lookup_ffr(date_value, ffr_dict)
-            ffr_values.append(ffr_value)
+        # FFR 월별 시계열 생성 후 모든 월을 일괄 조회 (2개월 fallback, 초과 시 ValueError)
+        # Period의 월 시작일로 조회하며, 첫 조회 불가 월 기준으로 lookup_ffr와 같은 에러 발생
+        ffr_series = create_ffr_series(ffr_df)
+        ffr_values = ffr_series.lookup_many(monthly[COL_MONTH].dt.start_time)
 
         # rate_pct 계산 (0~1 소수 -> %)
         # 예: VALUE = 0.045 -> rate_pct = 4.5
-        monthly[COL_RATE_PCT] = [v * 100.0 for v in ffr_values]
+        monthly[COL_RATE_PCT] = ffr_values * 100.0
 
         # dr_m 계산 (금리 월간 변화, %p)
         monthly[COL_DR_M] = monthly[COL_RATE_PCT].diff()
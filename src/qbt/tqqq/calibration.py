@@ -0,0 +1,681 @@
+"""Softplus 스프레드 (a, b) 캘리브레이션 모듈
+
+softplus 동적 스프레드 모델 spread = softplus(a + b * ffr_pct)의 (a, b)를 실제 TQQQ 가격 경로에 맞춘다.
+목적 함수는 calculate_validation_metrics의 누적배수 로그차이 RMSE(%)이다.
+
+simulate + _calculate_cumul_multiple_log_diff 경로는 후보 1개마다 월별 spread 딕셔너리를 만들고
+날짜별 조회와 DataFrame 생성을 반복한다. 이 모듈은 입력을 1회만 배열로 펼친 뒤(CalibrationData)
+후보 K개의 월별 비용을 (K × 월 수) 행렬로, 누적 로그배수를 (K × 거래일 수) 행렬로 한 번에 계산한다.
+
+구성:
+- prepare_calibration_data: 겹치는 기간 추출, 월별 FFR/Expense 조회, 일일 수익률/로그 종가 (1회)
+- evaluate_softplus_rmse: (a, b) 후보 배열 전체의 월 구간 RMSE
+- search_softplus_two_stage / local_refine_softplus: 2단계 그리드 탐색 / 기준점 주변 탐색
+- build_static_spread_series: 전체기간 최적 (a, b)의 월별 spread 시계열
+- run_softplus_walkforward: 월별 워크포워드 (local refine 미사용 시 테스트 월 단위 프로세스 병렬)
+
+simulate 경로와의 관계:
+- 월별 비용 공식과 연산 순서는 _calculate_daily_cost와 같다 (FFR/Expense 이전 월 fallback 포함)
+- 월별 spread는 simulation.compute_softplus_spreads를 공유한다 (build_monthly_spread_series와 같은 배열 경로)
+- 월 구간 평가는 구간 첫 거래일에서 다시 시작한다 (구간만 잘라 simulate를 호출한 것과 같다)
+- 누적배수는 누적곱 대신 로그 성장률의 누적합으로 계산한다 (부동소수점 반올림 수준의 차이)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from qbt.common_constants import COL_CLOSE, COL_DATE, TRADING_DAYS_PER_YEAR
+from qbt.tqqq.constants import (
+    COL_A,
+    COL_A_BEST,
+    COL_A_GLOBAL,
+    COL_B,
+    COL_B_BEST,
+    COL_B_GLOBAL,
+    COL_FFR_PCT,
+    COL_FFR_PCT_TEST,
+    COL_MONTH,
+    COL_N_TEST_DAYS,
+    COL_N_TRAIN_DAYS,
+    COL_RMSE_PCT,
+    COL_SEARCH_MODE,
+    COL_SPREAD_GLOBAL,
+    COL_SPREAD_TEST,
+    COL_TEST_MONTH,
+    COL_TEST_RMSE_PCT,
+    COL_TRAIN_END,
+    COL_TRAIN_RMSE_PCT,
+    COL_TRAIN_START,
+    DEFAULT_LEVERAGE_MULTIPLIER,
+    SEARCH_MODE_FIXED_AB,
+    SEARCH_MODE_FULL_GRID,
+    SEARCH_MODE_LOCAL_REFINE,
+    SOFTPLUS_GRID_STAGE1_A_RANGE,
+    SOFTPLUS_GRID_STAGE1_B_RANGE,
+    SOFTPLUS_GRID_STAGE2_A_DELTA,
+    SOFTPLUS_GRID_STAGE2_A_STEP,
+    SOFTPLUS_GRID_STAGE2_B_DELTA,
+    SOFTPLUS_GRID_STAGE2_B_STEP,
+    WALKFORWARD_LOCAL_REFINE_A_DELTA,
+    WALKFORWARD_LOCAL_REFINE_A_STEP,
+    WALKFORWARD_LOCAL_REFINE_B_DELTA,
+    WALKFORWARD_LOCAL_REFINE_B_STEP,
+    WALKFORWARD_RATE_BOUNDARY_PCT,
+    WALKFORWARD_TRAIN_WINDOW_MONTHS,
+)
+from qbt.tqqq.data_loader import (
+    create_expense_series,
+    create_ffr_series,
+    format_month_code,
+    month_codes_from_dates,
+)
+from qbt.tqqq.simulation import compute_softplus_spreads
+from qbt.utils import get_logger
+from qbt.utils.data_loader import extract_overlap_period
+from qbt.utils.parallel_executor import WORKER_CACHE, WorkerPool
+
+logger = get_logger(__name__)
+
+# 후보 묶음당 최대 행렬 원소 수 (후보 수 × 거래일 수, float64 약 32MB)
+# 전체기간 x 1단계 그리드처럼 큰 평가도 이 크기 단위로 나누어 메모리 사용량을 제한한다
+MAX_CHUNK_CELLS = 4_000_000
+
+# 워커 캐시 키 (병렬 워크포워드)
+_WORKER_DATA_KEY = "calibration_data"
+
+# ============================================================================
+# 데이터클래스
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class CalibrationData:
+    """prepare_calibration_data() 반환 타입. 거래일 축 길이는 N, 월 축 길이는 M이다.
+
+    Attributes:
+        months: 월 키 ("YYYY-MM", 오름차순, shape: M)
+        month_starts: 월별 첫 거래일 행 위치, 마지막 원소는 N (shape: M + 1)
+        ffr: 월별 FFR (0~1 비율, 이전 월 fallback 반영, shape: M)
+        expense: 월별 운용비율 (0~1 비율, 이전 월 fallback 반영, shape: M)
+        underlying_returns: 기초 자산 일일 수익률 (첫 행 NaN, shape: N)
+        actual_log_close: 실제 레버리지 ETF 종가의 자연로그 (shape: N)
+        leverage: 레버리지 배율
+    """
+
+    months: tuple[str, ...]
+    month_starts: np.ndarray
+    ffr: np.ndarray
+    expense: np.ndarray
+    underlying_returns: np.ndarray
+    actual_log_close: np.ndarray
+    leverage: float
+
+    def n_days(self, start_month: int, end_month: int) -> int:
+        """월 구간 [start_month, end_month)의 거래일 수를 반환한다."""
+        return int(self.month_starts[end_month] - self.month_starts[start_month])
+
+
+# ============================================================================
+# 입력 준비
+# ============================================================================
+
+
+def prepare_calibration_data(
+    underlying_df: pd.DataFrame,
+    actual_df: pd.DataFrame,
+    ffr_df: pd.DataFrame,
+    expense_df: pd.DataFrame,
+    leverage: float = DEFAULT_LEVERAGE_MULTIPLIER,
+) -> CalibrationData:
+    """
+    캘리브레이션 입력을 겹치는 기간의 배열로 펼친다.
+
+    월별 FFR/Expense는 각 월의 첫 거래일로 조회한다 (_calculate_daily_costs와 같은 조회 규칙).
+    softplus spread 맵의 월 키는 FFR 월 키와 같고 fallback 한도도 같으므로,
+    후보별 spread는 조회된 월별 FFR로 바로 계산할 수 있다.
+
+    Args:
+        underlying_df: 기초 자산 DataFrame (Date, Close 컬럼 필수)
+        actual_df: 실제 레버리지 ETF DataFrame (Date, Close 컬럼 필수)
+        ffr_df: FFR DataFrame (DATE: str (yyyy-mm), VALUE: float (0~1 비율))
+        expense_df: 운용비용 DataFrame (DATE: str (yyyy-mm), VALUE: float (0~1 비율))
+        leverage: 레버리지 배율
+
+    Returns:
+        CalibrationData
+
+    Raises:
+        ValueError: leverage <= 0, 겹치는 기간 2행 미만, 종가에 0 이하/결측 값, FFR/Expense 데이터 부족 시
+    """
+    # 1. 파라미터 및 겹치는 기간 검증
+    if leverage <= 0:
+        raise ValueError(f"leverage는 양수여야 합니다: {leverage}")
+
+    underlying_overlap, actual_overlap = extract_overlap_period(underlying_df, actual_df)
+    n_rows = len(underlying_overlap)
+    if n_rows < 2:
+        raise ValueError(f"겹치는 기간이 너무 짧습니다: {n_rows}행 (최소 2행 필요)")
+
+    underlying_close = underlying_overlap[COL_CLOSE].to_numpy(dtype=np.float64)
+    actual_close = actual_overlap[COL_CLOSE].to_numpy(dtype=np.float64)
+    for label, close in (("기초 자산", underlying_close), ("실제", actual_close)):
+        if not np.all(np.isfinite(close) & (close > 0)):
+            raise ValueError(f"{label} 종가에 0 이하 또는 결측 값이 있습니다 (로그 계산 불가)")
+
+    # 2. 월 경계 (날짜 오름차순이므로 같은 월은 연속 구간)
+    dates = underlying_overlap[COL_DATE].to_numpy()
+    month_codes = month_codes_from_dates(dates)
+    first_rows = [0, *(np.flatnonzero(np.diff(month_codes)) + 1).tolist()]
+
+    # 3. 월별 FFR / Expense 일괄 조회 (월 순서대로, 데이터 부족 시 가장 이른 월에서 에러)
+    ffr = create_ffr_series(ffr_df).lookup_many(dates[first_rows])
+    expense = create_expense_series(expense_df).lookup_many(dates[first_rows])
+
+    # 4. 일일 수익률 (simulate의 pct_change와 같은 식)
+    underlying_returns = np.full(n_rows, np.nan, dtype=np.float64)
+    underlying_returns[1:] = underlying_close[1:] / underlying_close[:-1] - 1
+
+    return CalibrationData(
+        months=tuple(format_month_code(month_codes[i]) for i in first_rows),
+        month_starts=np.array([*first_rows, n_rows], dtype=np.int64),
+        ffr=ffr,
+        expense=expense,
+        underlying_returns=underlying_returns,
+        actual_log_close=np.log(actual_close),
+        leverage=float(leverage),
+    )
+
+
+# ============================================================================
+# 목적 함수 (후보 배열 일괄 평가)
+# ============================================================================
+
+
+def _window_log_diff(data: CalibrationData, start_month: int, end_month: int, spreads: np.ndarray) -> np.ndarray:
+    """
+    월 구간 [start_month, end_month)에서 후보별 거래일별 누적배수 로그차이를 계산한다.
+
+    구간 첫 거래일을 시작점(누적배수 1)으로 두고, 이후 거래일마다
+    1 + (기초 수익률 × 레버리지 - 일일 비용)의 로그를 누적한다.
+
+    Args:
+        data: 캘리브레이션 입력
+        start_month: 구간 시작 월 위치
+        end_month: 구간 끝 월 위치 (미포함)
+        spreads: 구간 월별 spread (shape: K × (end_month - start_month))
+
+    Returns:
+        실제 - 시뮬레이션 누적 로그배수 (shape: K × (구간 거래일 수 - 1), 로그차이가 0인 첫 거래일 제외)
+
+    Raises:
+        ValueError: 일일 성장 계수 <= 0 (시뮬레이션 누적배수 <= 0, 로그 계산 불가)
+    """
+    start = int(data.month_starts[start_month])
+    end = int(data.month_starts[end_month])
+    lev = data.leverage
+
+    # 1. 월별 일일 비용 (_calculate_daily_cost와 같은 연산 순서) 및 거래일별 월 위치 (첫 거래일 제외)
+    monthly_costs = (
+        (data.ffr[start_month:end_month] + spreads) * (lev - 1) + data.expense[start_month:end_month]
+    ) / TRADING_DAYS_PER_YEAR
+    days_per_month = np.diff(data.month_starts[start_month : end_month + 1])
+    day_month = np.repeat(np.arange(end_month - start_month), days_per_month)[1:]
+
+    leveraged_returns = data.underlying_returns[start + 1 : end] * lev
+    actual_log_multiple = data.actual_log_close[start + 1 : end] - data.actual_log_close[start]
+
+    # 2. 누적 로그배수 차이
+    factors = 1 + (leveraged_returns - monthly_costs[:, day_month])
+    if np.any(factors <= 0):
+        raise ValueError(
+            "M_sim <= 0 발견 (로그 계산 불가): 일일 성장 계수 <= 0\n"
+            f"구간: {data.months[start_month]}~{data.months[end_month - 1]}\n"
+            "조치: 시뮬레이션 입력 데이터 또는 (a, b) 탐색 범위 확인 필요"
+        )
+    return actual_log_multiple - np.cumsum(np.log(factors), axis=1)
+
+
+def _window_rmse(data: CalibrationData, start_month: int, end_month: int, spreads: np.ndarray) -> np.ndarray:
+    """
+    월 구간 [start_month, end_month)에서 후보별 누적배수 로그차이 RMSE(%)를 계산한다.
+
+    RMSE 분모는 구간 거래일 수이다 (로그차이가 0인 첫 거래일 포함, simulate 경로와 동일).
+    후보 수 × 거래일 수가 MAX_CHUNK_CELLS를 넘지 않도록 후보를 묶음 단위로 평가한다.
+
+    Args:
+        data: 캘리브레이션 입력
+        start_month: 구간 시작 월 위치
+        end_month: 구간 끝 월 위치 (미포함)
+        spreads: 구간 월별 spread (shape: K × (end_month - start_month))
+
+    Returns:
+        후보별 RMSE (%, shape: K)
+
+    Raises:
+        ValueError: 일일 성장 계수 <= 0 (시뮬레이션 누적배수 <= 0, 로그 계산 불가)
+    """
+    n_days = data.n_days(start_month, end_month)
+    n_candidates = len(spreads)
+    rmse = np.empty(n_candidates, dtype=np.float64)
+    chunk = max(1, MAX_CHUNK_CELLS // n_days)
+    for lo in range(0, n_candidates, chunk):
+        log_diff = _window_log_diff(data, start_month, end_month, spreads[lo : lo + chunk])
+        rmse[lo : lo + chunk] = np.sqrt(np.sum(log_diff**2, axis=1) / n_days) * 100
+    return rmse
+
+
+def _rate_segmented_rmse(
+    data: CalibrationData, start_month: int, spreads: np.ndarray, boundary_pct: float
+) -> dict[str, float]:
+    """
+    start_month부터 마지막 월까지 1회 시뮬레이션한 로그차이를 금리 구간별 RMSE(%)로 나눈다.
+
+    거래일은 해당 월 FFR(%)이 boundary_pct 미만이면 저금리, 이상이면 고금리로 분류한다.
+    두 구간의 제곱합을 합치면 같은 구간의 stitched RMSE와 같다 (첫 거래일의 로그차이 0 포함).
+
+    Args:
+        data: 캘리브레이션 입력
+        start_month: 구간 시작 월 위치
+        spreads: 구간 월별 spread (shape: 월 수 - start_month)
+        boundary_pct: 금리 구간 경계 (FFR %)
+
+    Returns:
+        low_rate_rmse, high_rate_rmse (해당 구간 거래일이 없으면 NaN), low_rate_days, high_rate_days, rate_boundary_pct
+    """
+    end_month = len(data.months)
+    log_diff = np.concatenate([[0.0], _window_log_diff(data, start_month, end_month, spreads[np.newaxis, :])[0]])
+    days_per_month = np.diff(data.month_starts[start_month : end_month + 1])
+    is_low = np.repeat(100.0 * data.ffr[start_month:end_month] < boundary_pct, days_per_month)
+
+    def _segment_rmse(mask: np.ndarray) -> float:
+        return float(np.sqrt(np.mean(log_diff[mask] ** 2)) * 100) if mask.any() else float("nan")
+
+    return {
+        "low_rate_rmse": _segment_rmse(is_low),
+        "high_rate_rmse": _segment_rmse(~is_low),
+        "low_rate_days": float(is_low.sum()),
+        "high_rate_days": float((~is_low).sum()),
+        "rate_boundary_pct": float(boundary_pct),
+    }
+
+
+def _resolve_month_range(data: CalibrationData, start_month: int, end_month: int | None) -> tuple[int, int]:
+    """월 구간을 검증하고 (start_month, end_month)를 반환한다 (end_month=None이면 마지막 월까지)."""
+    n_months = len(data.months)
+    end = n_months if end_month is None else end_month
+    if not 0 <= start_month < end <= n_months:
+        raise ValueError(f"월 구간이 유효하지 않습니다: [{start_month}, {end}) (월 수: {n_months})")
+    return start_month, end
+
+
+def evaluate_softplus_rmse(
+    data: CalibrationData,
+    a: np.ndarray | float,
+    b: np.ndarray | float,
+    start_month: int = 0,
+    end_month: int | None = None,
+) -> np.ndarray:
+    """
+    (a, b) 후보 전체의 월 구간 누적배수 로그차이 RMSE(%)를 한 번에 계산한다.
+
+    후보 1개의 결과는 구간 데이터로 simulate(funding_spread=build_monthly_spread_map(ffr_df, a, b))를
+    실행하고 calculate_validation_metrics의 RMSE를 구한 값과 같다 (부동소수점 반올림 수준 차이).
+
+    Args:
+        data: 캘리브레이션 입력
+        a: softplus 절편 (스칼라 또는 배열, b와 브로드캐스트)
+        b: softplus 기울기 (스칼라 또는 배열, a와 브로드캐스트)
+        start_month: 구간 시작 월 위치 (data.months 기준)
+        end_month: 구간 끝 월 위치 (미포함, None이면 마지막 월까지)
+
+    Returns:
+        후보별 RMSE (%, shape: 브로드캐스트된 a/b의 shape, 스칼라 입력이면 shape (1,))
+
+    Raises:
+        ValueError: 월 구간이 유효하지 않거나, spread/성장 계수가 유효하지 않을 때
+    """
+    start, end = _resolve_month_range(data, start_month, end_month)
+    a_arr, b_arr = np.broadcast_arrays(np.atleast_1d(np.asarray(a, dtype=np.float64)), np.atleast_1d(b))
+    b_arr = b_arr.astype(np.float64)
+
+    spreads = compute_softplus_spreads(a_arr.ravel()[:, np.newaxis], b_arr.ravel()[:, np.newaxis], data.ffr[start:end])
+    return _window_rmse(data, start, end, spreads).reshape(a_arr.shape)
+
+
+# ============================================================================
+# 그리드 탐색
+# ============================================================================
+
+
+def _grid_values(start: float, stop: float, step: float) -> np.ndarray:
+    """[start, stop]을 step 간격으로 나눈 값 (소수 4자리 반올림으로 누적 오차 제거)."""
+    count = int(round((stop - start) / step)) + 1
+    return np.round(start + step * np.arange(count), 4)
+
+
+def _local_values(center: float, delta: float, step: float, bounds: tuple[float, float] | None = None) -> np.ndarray:
+    """center ± delta를 step 간격으로 나눈 값. bounds가 있으면 그 범위 밖의 값은 제외한다."""
+    values = _grid_values(center - delta, center + delta, step)
+    if bounds is not None:
+        values = values[(values >= bounds[0]) & (values <= bounds[1])]
+    return values
+
+
+def _grid_table(
+    data: CalibrationData, start_month: int, end_month: int | None, a_values: np.ndarray, b_values: np.ndarray
+) -> pd.DataFrame:
+    """a_values × b_values 격자를 평가하여 (a, b, rmse_pct) 테이블을 반환한다 (a 우선 순서)."""
+    a_mesh, b_mesh = np.meshgrid(a_values, b_values, indexing="ij")
+    rmse = evaluate_softplus_rmse(data, a_mesh.ravel(), b_mesh.ravel(), start_month, end_month)
+    return pd.DataFrame({COL_A: a_mesh.ravel(), COL_B: b_mesh.ravel(), COL_RMSE_PCT: rmse})
+
+
+def _sort_table(table: pd.DataFrame) -> pd.DataFrame:
+    """RMSE 오름차순으로 정렬한다 (동률은 평가 순서 유지, 중복 (a, b)는 첫 행만 유지)."""
+    table = table.drop_duplicates(subset=[COL_A, COL_B], keep="first")
+    return table.sort_values(COL_RMSE_PCT, kind="stable").reset_index(drop=True)
+
+
+def search_softplus_two_stage(
+    data: CalibrationData,
+    start_month: int = 0,
+    end_month: int | None = None,
+    fixed_b: float | None = None,
+) -> pd.DataFrame:
+    """
+    2단계 그리드 탐색으로 월 구간의 RMSE를 최소화하는 (a, b)를 찾는다.
+
+    1단계는 SOFTPLUS_GRID_STAGE1_* 범위를 거친 간격으로, 2단계는 1단계 최적점 주변
+    (SOFTPLUS_GRID_STAGE2_* 반경/간격)을 촘촘한 간격으로 탐색한다. 2단계의 a는 1단계 범위 안으로 제한하고,
+    b는 하한(0)만 두어 1단계 상한 경계에 걸린 최적점을 상한 너머로 다듬을 수 있게 한다.
+
+    Args:
+        data: 캘리브레이션 입력
+        start_month: 구간 시작 월 위치
+        end_month: 구간 끝 월 위치 (미포함, None이면 마지막 월까지)
+        fixed_b: b 고정값 (None이면 a, b 모두 탐색, 지정하면 a만 탐색)
+
+    Returns:
+        두 단계의 평가 결과 (a, b, rmse_pct 컬럼, RMSE 오름차순, 첫 행이 최적)
+
+    Raises:
+        ValueError: 월 구간이 유효하지 않거나, spread/성장 계수가 유효하지 않을 때
+    """
+    a_start, a_stop, a_step = SOFTPLUS_GRID_STAGE1_A_RANGE
+    b_start, b_stop, b_step = SOFTPLUS_GRID_STAGE1_B_RANGE
+
+    # 1. 1단계: 거친 격자
+    b_coarse = np.array([fixed_b]) if fixed_b is not None else _grid_values(b_start, b_stop, b_step)
+    stage1 = _grid_table(data, start_month, end_month, _grid_values(a_start, a_stop, a_step), b_coarse)
+    best = stage1.iloc[int(np.argmin(stage1[COL_RMSE_PCT].to_numpy()))]
+
+    # 2. 2단계: 1단계 최적점 주변 촘촘한 격자
+    a_fine = _local_values(
+        float(best[COL_A]), SOFTPLUS_GRID_STAGE2_A_DELTA, SOFTPLUS_GRID_STAGE2_A_STEP, (a_start, a_stop)
+    )
+    if fixed_b is not None:
+        b_fine = b_coarse
+    else:
+        b_fine = _local_values(
+            float(best[COL_B]), SOFTPLUS_GRID_STAGE2_B_DELTA, SOFTPLUS_GRID_STAGE2_B_STEP, (b_start, np.inf)
+        )
+    stage2 = _grid_table(data, start_month, end_month, a_fine, b_fine)
+
+    return _sort_table(pd.concat([stage1, stage2], ignore_index=True))
+
+
+def local_refine_softplus(
+    data: CalibrationData,
+    center_a: float,
+    center_b: float,
+    start_month: int = 0,
+    end_month: int | None = None,
+    refine_b: bool = True,
+) -> pd.DataFrame:
+    """
+    기준점 (center_a, center_b) 주변만 탐색한다 (워크포워드의 직전 월 최적점 재사용).
+
+    탐색 범위는 WALKFORWARD_LOCAL_REFINE_* 반경/간격이며, b는 1단계 그리드 하한(0) 미만으로 내려가지 않는다.
+
+    Args:
+        data: 캘리브레이션 입력
+        center_a: 기준 a
+        center_b: 기준 b
+        start_month: 구간 시작 월 위치
+        end_month: 구간 끝 월 위치 (미포함, None이면 마지막 월까지)
+        refine_b: False면 b를 center_b로 고정하고 a만 탐색
+
+    Returns:
+        평가 결과 (a, b, rmse_pct 컬럼, RMSE 오름차순, 첫 행이 최적)
+
+    Raises:
+        ValueError: 월 구간이 유효하지 않거나, spread/성장 계수가 유효하지 않을 때
+    """
+    a_values = _local_values(center_a, WALKFORWARD_LOCAL_REFINE_A_DELTA, WALKFORWARD_LOCAL_REFINE_A_STEP)
+    if refine_b:
+        b_values = _local_values(
+            center_b,
+            WALKFORWARD_LOCAL_REFINE_B_DELTA,
+            WALKFORWARD_LOCAL_REFINE_B_STEP,
+            (SOFTPLUS_GRID_STAGE1_B_RANGE[0], np.inf),
+        )
+    else:
+        b_values = np.array([center_b])
+    return _sort_table(_grid_table(data, start_month, end_month, a_values, b_values))
+
+
+def build_static_spread_series(data: CalibrationData, a: float, b: float) -> pd.DataFrame:
+    """
+    전체기간 최적 (a, b)의 월별 softplus spread 시계열을 만든다 (spread_lab 정적 spread CSV).
+
+    Args:
+        data: 캘리브레이션 입력
+        a: 전체기간 최적 a
+        b: 전체기간 최적 b
+
+    Returns:
+        month, ffr_pct, a_global, b_global, spread_global 컬럼 DataFrame (data.months 순서, 반올림 없음)
+
+    Raises:
+        ValueError: spread가 유효하지 않을 때
+    """
+    return pd.DataFrame(
+        {
+            COL_MONTH: list(data.months),
+            COL_FFR_PCT: 100.0 * data.ffr,
+            COL_A_GLOBAL: float(a),
+            COL_B_GLOBAL: float(b),
+            COL_SPREAD_GLOBAL: compute_softplus_spreads(a, b, data.ffr),
+        }
+    )
+
+
+# ============================================================================
+# 워크포워드
+# ============================================================================
+
+
+def _best_fit(table: pd.DataFrame) -> tuple[float, float, float]:
+    """탐색 결과 테이블의 첫 행 (a, b, rmse_pct)를 반환한다."""
+    best = table.iloc[0]
+    return float(best[COL_A]), float(best[COL_B]), float(best[COL_RMSE_PCT])
+
+
+def _full_search_task(task: tuple[int, int, float | None]) -> tuple[float, float, float]:
+    """
+    워커에서 학습 구간 1개의 2단계 그리드 탐색을 실행한다 (WORKER_CACHE의 캘리브레이션 입력 사용).
+
+    ProcessPoolExecutor에서 pickle 가능하도록 모듈 레벨에 정의한다.
+
+    Args:
+        task: (학습 시작 월 위치, 학습 끝 월 위치(미포함), b 고정값) 튜플
+
+    Returns:
+        (a, b, 학습 RMSE) 튜플
+    """
+    start_month, end_month, fixed_b = task
+    return _best_fit(search_softplus_two_stage(WORKER_CACHE[_WORKER_DATA_KEY], start_month, end_month, fixed_b))
+
+
+def _search_walkforward_fits(
+    data: CalibrationData,
+    test_months: list[int],
+    train_window_months: int,
+    fixed_b: float | None,
+    local_refine: bool,
+    max_workers: int,
+) -> list[tuple[float, float, float, str]]:
+    """테스트 월마다 직전 학습 구간의 최적 (a, b, 학습 RMSE, 탐색 방식)을 구한다."""
+    # 1. local refine: 첫 월만 2단계 탐색, 이후는 직전 월 최적점 주변 탐색 (월 순서대로 연쇄)
+    if local_refine:
+        fits: list[tuple[float, float, float, str]] = []
+        for test_month in test_months:
+            train_start = test_month - train_window_months
+            if not fits:
+                table = search_softplus_two_stage(data, train_start, test_month, fixed_b)
+                mode = SEARCH_MODE_FULL_GRID
+            else:
+                prev_a, prev_b = fits[-1][0], fits[-1][1]
+                table = local_refine_softplus(data, prev_a, prev_b, train_start, test_month, refine_b=fixed_b is None)
+                mode = SEARCH_MODE_LOCAL_REFINE
+            fits.append((*_best_fit(table), mode))
+        return fits
+
+    # 2. 월별 독립 2단계 탐색: 월 사이 의존이 없으므로 워커 풀에서 병렬 실행
+    tasks = [(test_month - train_window_months, test_month, fixed_b) for test_month in test_months]
+    n_workers = min(max_workers, len(tasks))
+    if n_workers > 1:
+        with WorkerPool(max_workers=n_workers) as pool:
+            pool.update_cache(payload={_WORKER_DATA_KEY: data})
+            results = pool.map(_full_search_task, tasks, log_progress=False)
+    else:
+        results = [_best_fit(search_softplus_two_stage(data, *task)) for task in tasks]
+    return [(a, b, rmse, SEARCH_MODE_FULL_GRID) for a, b, rmse in results]
+
+
+def run_softplus_walkforward(
+    data: CalibrationData,
+    train_window_months: int = WALKFORWARD_TRAIN_WINDOW_MONTHS,
+    fixed_b: float | None = None,
+    fixed_ab: tuple[float, float] | None = None,
+    local_refine: bool = True,
+    max_workers: int = 1,
+) -> tuple[pd.DataFrame, dict[str, float]]:
+    """
+    월별 워크포워드로 (a, b)의 아웃오브샘플 성능을 검증한다.
+
+    테스트 월마다 직전 train_window_months개월로 (a, b)를 학습하고, 테스트 월 1개월의 RMSE를 계산한다.
+    stitched RMSE는 테스트 월별 최적 (a, b)의 spread를 이어 붙여 전체 테스트 기간을 한 번에 시뮬레이션한 RMSE이다.
+
+    탐색 방식:
+        - 기본 (동적): 첫 월 2단계 탐색, 이후 직전 월 최적점 주변 local refine (월 순서대로 연쇄, 순차 실행)
+        - local_refine=False: 모든 월을 2단계 탐색 (월 사이 의존이 없어 max_workers > 1이면 프로세스 병렬)
+        - fixed_b 지정: b를 고정하고 a만 탐색
+        - fixed_ab 지정: 탐색 없이 (a, b) 고정 (과최적화 진단용 기준선)
+
+    Args:
+        data: 캘리브레이션 입력
+        train_window_months: 학습 개월 수
+        fixed_b: b 고정값 (fixed_ab와 배타적)
+        fixed_ab: (a, b) 고정값 (fixed_b와 배타적)
+        local_refine: 두 번째 테스트 월부터 직전 최적점 주변만 탐색할지 여부
+        max_workers: 독립 2단계 탐색의 최대 워커 수 (local_refine=False일 때만 사용)
+
+    Returns:
+        (월별 결과 DataFrame, 요약 딕셔너리) 튜플
+        - 월별 결과: train_start, train_end, test_month, a_best, b_best, train_rmse_pct, test_rmse_pct,
+          n_train_days, n_test_days, search_mode, ffr_pct_test, spread_test 컬럼 (반올림 없음)
+        - 요약: test_rmse_mean/median/std/min/max, a_mean, a_std, b_mean, b_std,
+          n_test_months, train_window_months, stitched_rmse
+          (fixed_ab 지정 시 stitched 구간의 금리 구간별 분해 low_rate_rmse, high_rate_rmse,
+          low_rate_days, high_rate_days, rate_boundary_pct 추가, 경계는 WALKFORWARD_RATE_BOUNDARY_PCT)
+
+    Raises:
+        ValueError: train_window_months < 1, 테스트 월 없음, fixed_b/fixed_ab 동시 지정, max_workers < 1,
+            spread/성장 계수가 유효하지 않을 때
+    """
+    # 1. 입력 검증
+    if train_window_months < 1:
+        raise ValueError(f"train_window_months는 1 이상이어야 합니다: {train_window_months}")
+    if fixed_b is not None and fixed_ab is not None:
+        raise ValueError("fixed_b와 fixed_ab는 동시에 지정할 수 없습니다")
+    if max_workers < 1:
+        raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+    n_months = len(data.months)
+    test_months = list(range(train_window_months, n_months))
+    if not test_months:
+        raise ValueError(f"테스트 월이 없습니다: 데이터 {n_months}개월 <= 학습 {train_window_months}개월")
+
+    logger.debug(
+        f"softplus 워크포워드 시작 - 테스트 {len(test_months)}개월, 학습 {train_window_months}개월, "
+        f"fixed_b={fixed_b}, fixed_ab={fixed_ab}, local_refine={local_refine}"
+    )
+
+    # 2. 월별 학습 (a, b)
+    if fixed_ab is not None:
+        fixed_a, fixed_b_value = fixed_ab
+        fits = [
+            (
+                fixed_a,
+                fixed_b_value,
+                float(evaluate_softplus_rmse(data, fixed_a, fixed_b_value, m - train_window_months, m)[0]),
+                SEARCH_MODE_FIXED_AB,
+            )
+            for m in test_months
+        ]
+    else:
+        fits = _search_walkforward_fits(data, test_months, train_window_months, fixed_b, local_refine, max_workers)
+
+    # 3. 테스트 월 RMSE 및 spread
+    a_best = np.array([fit[0] for fit in fits])
+    b_best = np.array([fit[1] for fit in fits])
+    test_ffr = data.ffr[test_months[0] :]
+    test_spreads = compute_softplus_spreads(a_best, b_best, test_ffr)
+    test_rmse = [
+        float(_window_rmse(data, m, m + 1, test_spreads[np.newaxis, k : k + 1])[0]) for k, m in enumerate(test_months)
+    ]
+
+    result_df = pd.DataFrame(
+        {
+            COL_TRAIN_START: [data.months[m - train_window_months] for m in test_months],
+            COL_TRAIN_END: [data.months[m - 1] for m in test_months],
+            COL_TEST_MONTH: [data.months[m] for m in test_months],
+            COL_A_BEST: a_best,
+            COL_B_BEST: b_best,
+            COL_TRAIN_RMSE_PCT: [fit[2] for fit in fits],
+            COL_TEST_RMSE_PCT: test_rmse,
+            COL_N_TRAIN_DAYS: [data.n_days(m - train_window_months, m) for m in test_months],
+            COL_N_TEST_DAYS: [data.n_days(m, m + 1) for m in test_months],
+            COL_SEARCH_MODE: [fit[3] for fit in fits],
+            COL_FFR_PCT_TEST: 100.0 * test_ffr,
+            COL_SPREAD_TEST: test_spreads,
+        }
+    )
+
+    # 4. stitched RMSE: 테스트 월별 spread를 이어 붙인 전체 테스트 기간 1회 시뮬레이션
+    stitched_rmse = float(_window_rmse(data, test_months[0], n_months, test_spreads[np.newaxis, :])[0])
+
+    test_series = result_df[COL_TEST_RMSE_PCT]
+    summary = {
+        "test_rmse_mean": float(test_series.mean()),
+        "test_rmse_median": float(test_series.median()),
+        "test_rmse_std": float(test_series.std()),
+        "test_rmse_min": float(test_series.min()),
+        "test_rmse_max": float(test_series.max()),
+        "a_mean": float(result_df[COL_A_BEST].mean()),
+        "a_std": float(result_df[COL_A_BEST].std()),
+        "b_mean": float(result_df[COL_B_BEST].mean()),
+        "b_std": float(result_df[COL_B_BEST].std()),
+        "n_test_months": float(len(test_months)),
+        "train_window_months": float(train_window_months),
+        "stitched_rmse": stitched_rmse,
+    }
+    if fixed_ab is not None:
+        summary.update(_rate_segmented_rmse(data, test_months[0], test_spreads, WALKFORWARD_RATE_BOUNDARY_PCT))
+
+    logger.debug(f"softplus 워크포워드 완료 - stitched RMSE: {stitched_rmse:.4f}%")
+    return result_df, summary
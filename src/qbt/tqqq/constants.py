@@ -41,6 +41,12 @@ SOFTPLUS_SPREAD_SERIES_STATIC_PATH: Final = SPREAD_LAB_DIR / "tqqq_softplus_spre
 DEFAULT_LEVERAGE_MULTIPLIER: Final = 3.0  # TQQQ 3배 레버리지
 DEFAULT_SYNTHETIC_INITIAL_PRICE: Final = 200.0  # 합성 데이터 초기 가격
 
+# 2배 레버리지 ETF 운용비율 (합성 데이터 생성용 고정값, 월별 실제 데이터 없음)
+SSO_EXPENSE_RATIO: Final = 0.0089  # SSO (S&P 500 2배) 0.89%
+QLD_EXPENSE_RATIO: Final = 0.0095  # QLD (나스닥 100 2배) 0.95%
+UGL_EXPENSE_RATIO: Final = 0.0095  # UGL (금 2배) 0.95%
+UBT_EXPENSE_RATIO: Final = 0.0095  # UBT (미국 20년+ 국채 2배) 0.95%
+
 # ============================================================
 # 비용 모델 파라미터
 # ============================================================
@@ -70,6 +76,16 @@ DEFAULT_MIN_MONTHS_FOR_ANALYSIS: Final = 13  # Rolling 12M 상관 계산 위해
 DEFAULT_SOFTPLUS_A: Final = -6.1  # softplus 절편 파라미터
 DEFAULT_SOFTPLUS_B: Final = 0.37  # softplus 기울기 파라미터
 
+# --- 2단계 그리드 탐색 (전체기간 튜닝) ---
+# 1단계: 넓은 범위를 거친 간격으로 탐색 (시작, 끝, 간격)
+SOFTPLUS_GRID_STAGE1_A_RANGE: Final = (-10.0, -3.0, 0.25)
+SOFTPLUS_GRID_STAGE1_B_RANGE: Final = (0.0, 1.5, 0.05)
+# 2단계: 1단계 최적점 주변을 촘촘한 간격으로 탐색
+SOFTPLUS_GRID_STAGE2_A_DELTA: Final = 0.75  # a 파라미터 탐색 반경
+SOFTPLUS_GRID_STAGE2_A_STEP: Final = 0.05  # a 파라미터 탐색 간격
+SOFTPLUS_GRID_STAGE2_B_DELTA: Final = 0.30  # b 파라미터 탐색 반경
+SOFTPLUS_GRID_STAGE2_B_STEP: Final = 0.02  # b 파라미터 탐색 간격
+
 # ============================================================
 # 워크포워드 검증 파라미터 (앱에서 사용)
 # ============================================================
@@ -77,6 +93,19 @@ DEFAULT_SOFTPLUS_B: Final = 0.37  # softplus 기울기 파라미터
 # --- Local Refine 탐색 범위 ---
 WALKFORWARD_LOCAL_REFINE_A_DELTA: Final = 0.50  # a 파라미터 탐색 반경
 WALKFORWARD_LOCAL_REFINE_B_DELTA: Final = 0.15  # b 파라미터 탐색 반경
+WALKFORWARD_LOCAL_REFINE_A_STEP: Final = 0.05  # a 파라미터 탐색 간격
+WALKFORWARD_LOCAL_REFINE_B_STEP: Final = 0.01  # b 파라미터 탐색 간격
+
+# --- 학습 기간 ---
+WALKFORWARD_TRAIN_WINDOW_MONTHS: Final = 60  # 테스트 월 직전 학습 개월 수
+
+# --- 금리 구간별 RMSE 분해 (완전 고정 워크포워드 요약) ---
+WALKFORWARD_RATE_BOUNDARY_PCT: Final = 2.0  # FFR(%) 미만: 저금리, 이상: 고금리
+
+# --- 탐색 방식 (결과 CSV search_mode 값) ---
+SEARCH_MODE_FULL_GRID: Final = "full_grid_2stage"  # 2단계 그리드 전체 탐색
+SEARCH_MODE_LOCAL_REFINE: Final = "local_refine"  # 직전 월 최적점 주변 탐색
+SEARCH_MODE_FIXED_AB: Final = "fixed_ab"  # 탐색 없이 (a, b) 고정
 
 # --- 워크포워드 결과 파일 경로 ---
 TQQQ_WALKFORWARD_PATH: Final = SPREAD_LAB_DIR / "tqqq_rate_spread_lab_walkforward.csv"
@@ -138,6 +167,26 @@ COL_A: Final = "a"  # softplus 파라미터 a
 COL_B: Final = "b"  # softplus 파라미터 b
 COL_RMSE_PCT: Final = "rmse_pct"  # RMSE (%)
 
+# --- 워크포워드 결과 CSV 컬럼 ---
+COL_TRAIN_START: Final = "train_start"  # 학습 시작 월 (YYYY-MM)
+COL_TRAIN_END: Final = "train_end"  # 학습 종료 월 (YYYY-MM)
+COL_TEST_MONTH: Final = "test_month"  # 테스트 월 (YYYY-MM)
+COL_A_BEST: Final = "a_best"  # 학습 구간 최적 a
+COL_B_BEST: Final = "b_best"  # 학습 구간 최적 b
+COL_TRAIN_RMSE_PCT: Final = "train_rmse_pct"  # 학습 구간 RMSE (%)
+COL_TEST_RMSE_PCT: Final = "test_rmse_pct"  # 테스트 월 RMSE (%)
+COL_N_TRAIN_DAYS: Final = "n_train_days"  # 학습 거래일 수
+COL_N_TEST_DAYS: Final = "n_test_days"  # 테스트 거래일 수
+COL_SEARCH_MODE: Final = "search_mode"  # 탐색 방식
+COL_FFR_PCT_TEST: Final = "ffr_pct_test"  # 테스트 월 FFR (%)
+COL_SPREAD_TEST: Final = "spread_test"  # 테스트 월 spread
+
+# --- 정적 spread 시계열 CSV 컬럼 (월 컬럼은 COL_MONTH) ---
+COL_FFR_PCT: Final = "ffr_pct"  # 월별 FFR (%)
+COL_A_GLOBAL: Final = "a_global"  # 전체기간 최적 a
+COL_B_GLOBAL: Final = "b_global"  # 전체기간 최적 b
+COL_SPREAD_GLOBAL: Final = "spread_global"  # 전체기간 최적 (a, b)의 월별 spread
+
 
 # ============================================================
 # 출력용 한글 헤더 (DISPLAY_)
@@ -5,16 +5,19 @@ TQQQ 시뮬레이션 및 검증에 필요한 데이터 로딩, 월별 데이터
 주요 기능:
 1. 연방기금금리(FFR) 월별 데이터 로딩
 2. TQQQ 일별 비교 데이터 로딩
-3. 월별 데이터 딕셔너리 생성 및 조회 (FFR, Expense Ratio)
+3. 월별 데이터 딕셔너리/MonthlySeries 생성 및 조회 (FFR, Expense Ratio)
 4. 운용비율 딕셔너리 확장 (합성 데이터 생성용)
 
 이 모듈의 함수들은 TQQQ 도메인에서만 사용되며,
 프로젝트 전반의 공통 데이터 로딩은 utils/data_loader.py를 참고한다.
 """
 
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from qbt.common_constants import DISPLAY_DATE
@@ -132,11 +135,247 @@ def load_comparison_data(path: Path) -> pd.DataFrame:
     return df
 
 
+# ============================================================
+# 월별 시계열 (정수 월 코드 인덱스)
+# ============================================================
+
+
+def month_codes_from_keys(keys: Iterable[str]) -> np.ndarray:
+    """
+    "YYYY-MM" 월 키들을 정수 월 코드 배열로 변환한다.
+
+    월 코드 = year * 12 + (month - 1). 연속한 월은 코드가 1씩 증가하므로 월 차이를 뺄셈으로 계산할 수 있다.
+
+    Args:
+        keys: "YYYY-MM" 형식 월 키들
+
+    Returns:
+        int64 월 코드 배열 (입력 순서 유지)
+    """
+    key_series = pd.Series(list(keys), dtype=object).astype(str)
+    years = key_series.str.slice(0, 4).astype(np.int64).to_numpy()
+    months = key_series.str.slice(5, 7).astype(np.int64).to_numpy()
+    return years * 12 + (months - 1)
+
+
+def month_codes_from_dates(dates: np.ndarray | pd.Series | Sequence[date]) -> np.ndarray:
+    """
+    날짜 배열을 정수 월 코드 배열로 변환한다.
+
+    datetime64 배열은 월 단위 변환으로 한 번에 처리하고, 그 외(date/Timestamp 객체 배열)는
+    year/month 속성으로 변환한다.
+
+    Args:
+        dates: 날짜 배열 (datetime64 또는 date/Timestamp 객체)
+
+    Returns:
+        int64 월 코드 배열 (입력 순서 유지)
+    """
+    date_array = np.asarray(dates)
+    if date_array.dtype.kind == "M":
+        # datetime64[M]의 정수값은 1970-01 기준 월 수
+        return date_array.astype("datetime64[M]").astype(np.int64) + 1970 * 12
+    return np.fromiter((d.year * 12 + d.month - 1 for d in date_array), dtype=np.int64, count=len(date_array))
+
+
+def format_month_code(code: int) -> str:
+    """
+    정수 월 코드를 "YYYY-MM" 문자열로 변환한다.
+
+    Args:
+        code: 월 코드 (year * 12 + (month - 1))
+
+    Returns:
+        "YYYY-MM" 형식 문자열
+    """
+    year, month_index = divmod(int(code), 12)
+    return f"{year:04d}-{month_index + 1:02d}"
+
+
+@dataclass(frozen=True)
+class MonthlySeries:
+    """
+    정렬된 정수 월 코드와 값 배열로 구성된 월별 시계열.
+
+    조회 월에 값이 없으면 가장 가까운 이전 월 값을 사용하되(forward-fill),
+    월 차이가 max_months_diff를 넘으면 ValueError를 발생시킨다.
+    조회는 이진 탐색(O(log n))이며, lookup_many로 날짜 배열 전체를 한 번에 조회할 수 있다.
+    에러 메시지는 딕셔너리 기반 조회(_lookup_monthly_data)와 같다.
+
+    Attributes:
+        month_codes: 오름차순 월 코드 배열 (중복 없음, int64)
+        values: month_codes와 같은 길이의 값 배열 (float64)
+        max_months_diff: 최대 허용 월 차이 (예: FFR=2, Expense=12)
+        data_type: 데이터 타입 ("FFR", "Expense" 등, 에러 메시지용)
+    """
+
+    month_codes: np.ndarray
+    values: np.ndarray
+    max_months_diff: int
+    data_type: str
+
+    def __post_init__(self) -> None:
+        if len(self.month_codes) != len(self.values):
+            raise ValueError(f"{self.data_type} 월 코드와 값의 길이가 다릅니다: {len(self.month_codes)} != {len(self.values)}")
+        if np.any(np.diff(self.month_codes) <= 0):
+            raise ValueError(f"{self.data_type} 월 코드는 중복 없이 오름차순이어야 합니다")
+
+    @classmethod
+    def from_dict(cls, data_dict: dict[str, float], max_months_diff: int, data_type: str) -> "MonthlySeries":
+        """
+        {"YYYY-MM": value} 딕셔너리로부터 월별 시계열을 생성한다.
+
+        Args:
+            data_dict: 월별 데이터 딕셔너리
+            max_months_diff: 최대 허용 월 차이
+            data_type: 데이터 타입 (에러 메시지용)
+
+        Returns:
+            월 코드 오름차순으로 정렬된 MonthlySeries
+        """
+        codes = month_codes_from_keys(data_dict.keys())
+        values = np.fromiter(data_dict.values(), dtype=np.float64, count=len(data_dict))
+        order = np.argsort(codes, kind="stable")
+        return cls(codes[order], values[order], max_months_diff, data_type)
+
+    def __len__(self) -> int:
+        return len(self.month_codes)
+
+    @property
+    def first_month(self) -> str:
+        """첫 월 ("YYYY-MM")."""
+        return format_month_code(self.month_codes[0])
+
+    @property
+    def last_month(self) -> str:
+        """마지막 월 ("YYYY-MM")."""
+        return format_month_code(self.month_codes[-1])
+
+    def to_dict(self) -> dict[str, float]:
+        """{"YYYY-MM": value} 딕셔너리로 변환한다 (월 오름차순)."""
+        return {
+            format_month_code(code): float(value) for code, value in zip(self.month_codes, self.values, strict=True)
+        }
+
+    def lookup(self, date_value: date) -> float:
+        """
+        특정 날짜의 값을 조회한다 (해당 월 또는 max_months_diff 이내의 가장 가까운 이전 월).
+
+        Args:
+            date_value: 조회할 날짜
+
+        Returns:
+            해당 월 또는 가장 가까운 이전 월의 값
+
+        Raises:
+            ValueError: 이전 월 없음, 또는 월 차이 초과 시
+        """
+        code = date_value.year * 12 + date_value.month - 1
+        position = int(np.searchsorted(self.month_codes, code, side="right")) - 1
+
+        if position < 0 or code - int(self.month_codes[position]) > self.max_months_diff:
+            raise self._lookup_error(code, position)
+
+        return float(self.values[position])
+
+    def lookup_many(self, dates: np.ndarray | pd.Series | Sequence[date]) -> np.ndarray:
+        """
+        날짜 배열 전체의 값을 한 번에 조회한다 (lookup과 같은 fallback 정책).
+
+        Args:
+            dates: 조회할 날짜 배열 (datetime64 또는 date/Timestamp 객체)
+
+        Returns:
+            dates와 같은 길이의 값 배열 (float64)
+
+        Raises:
+            ValueError: 조회 불가 날짜가 있을 때 (배열 순서상 첫 번째 날짜 기준 메시지)
+        """
+        codes = month_codes_from_dates(dates)
+        positions = np.searchsorted(self.month_codes, codes, side="right") - 1
+
+        # 이전 월이 없거나 월 차이가 한도를 넘는 날짜 검출
+        invalid = positions < 0
+        if len(self.month_codes) > 0:
+            invalid |= codes - self.month_codes[np.maximum(positions, 0)] > self.max_months_diff
+        if invalid.any():
+            first_invalid = int(np.argmax(invalid))
+            raise self._lookup_error(int(codes[first_invalid]), int(positions[first_invalid]))
+
+        return self.values[positions]
+
+    def _lookup_error(self, code: int, position: int) -> ValueError:
+        """
+        조회 불가 월의 에러를 생성한다 (lookup, lookup_many 공통 메시지).
+
+        Args:
+            code: 조회 월 코드
+            position: 이진 탐색으로 찾은 이전 월 위치 (-1이면 이전 월 없음)
+
+        Returns:
+            이전 월 없음 또는 월 차이 초과를 설명하는 ValueError
+        """
+        year_month_str = format_month_code(code)
+
+        if position < 0:
+            return ValueError(f"{self.data_type} 데이터 부족: {year_month_str} 이전의 {self.data_type} 데이터가 존재하지 않습니다.")
+
+        total_months = code - int(self.month_codes[position])
+        return ValueError(
+            f"{self.data_type} 데이터 부족: 필요 월 {year_month_str}의 {self.data_type} 데이터가 없으며, "
+            f"가장 가까운 이전 데이터는 {format_month_code(self.month_codes[position])} ({total_months}개월 전)입니다. "
+            f"최대 {self.max_months_diff}개월 이내의 데이터만 사용 가능합니다."
+        )
+
+
+# 월별 데이터 조회 입력 타입: {"YYYY-MM": value} 딕셔너리 또는 MonthlySeries
+MonthlyData = dict[str, float] | MonthlySeries
+
+
 # ============================================================
 # 월별 데이터 딕셔너리 생성 및 조회 함수
 # ============================================================
 
 
+def _validated_monthly_keys_and_values(
+    df: pd.DataFrame, date_col: str, value_col: str, data_type: str
+) -> tuple[list[str], np.ndarray]:
+    """
+    월별 데이터 DataFrame에서 월 키와 값을 추출하고 빈 데이터/중복 월을 검증한다.
+
+    Args:
+        df: 월별 데이터 DataFrame
+        date_col: 날짜 컬럼명 (yyyy-mm 문자열 형식)
+        value_col: 값 컬럼명
+        data_type: 데이터 타입 ("FFR", "Expense" 등, 에러 메시지용)
+
+    Returns:
+        (월 키 리스트, 값 배열) 튜플 (DataFrame 행 순서 유지)
+
+    Raises:
+        ValueError: 빈 DataFrame 또는 중복 월 발견 시
+    """
+    # 1. 빈 DataFrame 검증
+    if df.empty:
+        raise ValueError(f"{data_type} 데이터가 비어있습니다")
+
+    keys = df[date_col].astype(str)
+    values = df[value_col].to_numpy(dtype=np.float64)
+
+    # 2. 중복 월 검증 (행 순서상 처음 중복된 월 기준, 데이터 무결성 보장)
+    duplicated = keys.duplicated().to_numpy()
+    if duplicated.any():
+        duplicate_position = int(np.argmax(duplicated))
+        month_key = keys.iloc[duplicate_position]
+        first_position = int(np.argmax((keys == month_key).to_numpy()))
+        raise ValueError(
+            f"{data_type} 데이터 무결성 오류: 월 {month_key}이(가) 중복 존재합니다. "
+            f"기존 값: {values[first_position]}, 중복 값: {values[duplicate_position]}"
+        )
+
+    return keys.tolist(), values
+
+
 def _create_monthly_data_dict(df: pd.DataFrame, date_col: str, value_col: str, data_type: str) -> dict[str, float]:
     """
     월별 데이터 DataFrame을 딕셔너리로 변환한다 (O(1) 조회용).
@@ -155,25 +394,33 @@ def _create_monthly_data_dict(df: pd.DataFrame, date_col: str, value_col: str, d
     Raises:
         ValueError: 빈 DataFrame 또는 중복 월 발견 시
     """
-    # 1. 빈 DataFrame 검증
-    if df.empty:
-        raise ValueError(f"{data_type} 데이터가 비어있습니다")
+    keys, values = _validated_monthly_keys_and_values(df, date_col, value_col, data_type)
+    return dict(zip(keys, values.tolist(), strict=True))
 
-    # 2. 딕셔너리 생성 및 중복 월 검증
-    data_dict: dict[str, float] = {}
-    for _, row in df.iterrows():
-        month_key = str(row[date_col])
-        value = float(row[value_col])
 
-        # 중복 월 발견 시 즉시 예외 (데이터 무결성 보장)
-        if month_key in data_dict:
-            raise ValueError(
-                f"{data_type} 데이터 무결성 오류: 월 {month_key}이(가) 중복 존재합니다. " f"기존 값: {data_dict[month_key]}, 중복 값: {value}"
-            )
+def _create_monthly_series(
+    df: pd.DataFrame, date_col: str, value_col: str, max_months_diff: int, data_type: str
+) -> MonthlySeries:
+    """
+    월별 데이터 DataFrame을 MonthlySeries로 변환한다.
 
-        data_dict[month_key] = value
+    Args:
+        df: 월별 데이터 DataFrame
+        date_col: 날짜 컬럼명 (yyyy-mm 문자열 형식)
+        value_col: 값 컬럼명
+        max_months_diff: 최대 허용 월 차이
+        data_type: 데이터 타입 ("FFR", "Expense" 등, 에러 메시지용)
 
-    return data_dict
+    Returns:
+        월 코드 오름차순으로 정렬된 MonthlySeries
+
+    Raises:
+        ValueError: 빈 DataFrame 또는 중복 월 발견 시
+    """
+    keys, values = _validated_monthly_keys_and_values(df, date_col, value_col, data_type)
+    codes = month_codes_from_keys(keys)
+    order = np.argsort(codes, kind="stable")
+    return MonthlySeries(codes[order], values[order], max_months_diff, data_type)
 
 
 def _lookup_monthly_data(date_value: date, data_dict: dict[str, float], max_months_diff: int, data_type: str) -> float:
@@ -181,6 +428,8 @@ def _lookup_monthly_data(date_value: date, data_dict: dict[str, float], max_mont
     특정 날짜의 월별 데이터 값을 딕셔너리에서 조회한다.
 
     FFR, Expense Ratio 등 월별 데이터를 공통으로 조회하는 제네릭 함수이다.
+    키가 없으면 허용 범위(max_months_diff) 안의 이전 월만 가까운 순서로 조회하므로
+    성공 경로는 O(max_months_diff)이고, 전체 키 탐색은 에러 메시지를 만들 때만 수행한다.
 
     Args:
         date_value: 조회할 날짜
@@ -201,30 +450,35 @@ def _lookup_monthly_data(date_value: date, data_dict: dict[str, float], max_mont
     if year_month_str in data_dict:
         return data_dict[year_month_str]
 
-    # 3. 월 키가 없으면 이전 월 중 가장 가까운 값 사용
+    # 3. 허용 범위 안의 이전 월을 가까운 순서로 조회
+    query_code = date_value.year * 12 + date_value.month - 1
+    for months_back in range(1, max_months_diff + 1):
+        candidate = format_month_code(query_code - months_back)
+        if candidate in data_dict:
+            return data_dict[candidate]
+
+    # 4. 허용 범위 안에 데이터가 없으면 에러 메시지용으로 가장 가까운 이전 월 탐색
     previous_months = [key for key in data_dict.keys() if key < year_month_str]
 
     if not previous_months:
         raise ValueError(f"{data_type} 데이터 부족: {year_month_str} 이전의 {data_type} 데이터가 존재하지 않습니다.")
 
-    # 4. 가장 가까운 이전 월 찾기
     closest_month = max(previous_months)
-
-    # 5. 월 차이 계산
-    query_year, query_month = date_value.year, date_value.month
     closest_year, closest_month_num = map(int, closest_month.split("-"))
-    total_months = (query_year - closest_year) * 12 + (query_month - closest_month_num)
+    total_months = (date_value.year - closest_year) * 12 + (date_value.month - closest_month_num)
 
-    # 6. 월 차이가 max_months_diff 초과 시 예외
-    if total_months > max_months_diff:
-        raise ValueError(
-            f"{data_type} 데이터 부족: 필요 월 {year_month_str}의 {data_type} 데이터가 없으며, "
-            f"가장 가까운 이전 데이터는 {closest_month} ({total_months}개월 전)입니다. "
-            f"최대 {max_months_diff}개월 이내의 데이터만 사용 가능합니다."
-        )
+    raise ValueError(
+        f"{data_type} 데이터 부족: 필요 월 {year_month_str}의 {data_type} 데이터가 없으며, "
+        f"가장 가까운 이전 데이터는 {closest_month} ({total_months}개월 전)입니다. "
+        f"최대 {max_months_diff}개월 이내의 데이터만 사용 가능합니다."
+    )
 
-    # 7. 가장 가까운 이전 월의 값 반환
-    return data_dict[closest_month]
+
+def _lookup_monthly(date_value: date, monthly_data: MonthlyData, max_months_diff: int, data_type: str) -> float:
+    """딕셔너리 또는 MonthlySeries에서 월별 값을 조회한다 (MonthlySeries는 자체 정책 사용)."""
+    if isinstance(monthly_data, MonthlySeries):
+        return monthly_data.lookup(date_value)
+    return _lookup_monthly_data(date_value, monthly_data, max_months_diff, data_type)
 
 
 def create_ffr_dict(ffr_df: pd.DataFrame) -> dict[str, float]:
@@ -245,7 +499,23 @@ def create_ffr_dict(ffr_df: pd.DataFrame) -> dict[str, float]:
     return _create_monthly_data_dict(ffr_df, COL_FFR_DATE, COL_FFR_VALUE, "FFR")
 
 
-def lookup_ffr(date_value: date, ffr_dict: dict[str, float]) -> float:
+def create_ffr_series(ffr_df: pd.DataFrame) -> MonthlySeries:
+    """
+    FFR DataFrame을 MonthlySeries로 변환한다 (최대 MAX_FFR_MONTHS_DIFF개월 fallback).
+
+    Args:
+        ffr_df: FFR DataFrame (DATE: str (yyyy-mm), VALUE: float)
+
+    Returns:
+        FFR 월별 시계열
+
+    Raises:
+        ValueError: 빈 DataFrame 또는 중복 월 발견 시
+    """
+    return _create_monthly_series(ffr_df, COL_FFR_DATE, COL_FFR_VALUE, MAX_FFR_MONTHS_DIFF, "FFR")
+
+
+def lookup_ffr(date_value: date, ffr_dict: MonthlyData) -> float:
     """
     특정 날짜의 FFR 값을 딕셔너리에서 조회한다.
 
@@ -253,7 +523,7 @@ def lookup_ffr(date_value: date, ffr_dict: dict[str, float]) -> float:
 
     Args:
         date_value: 조회할 날짜
-        ffr_dict: FFR 딕셔너리 ({"YYYY-MM": ffr_value})
+        ffr_dict: FFR 딕셔너리 ({"YYYY-MM": ffr_value}) 또는 MonthlySeries
 
     Returns:
         FFR 값 (0~1 비율, 예: 0.045 = 4.5%)
@@ -261,7 +531,7 @@ def lookup_ffr(date_value: date, ffr_dict: dict[str, float]) -> float:
     Raises:
         ValueError: 월 키 없음 + 이전 월 없음, 또는 월 차이 초과 시
     """
-    return _lookup_monthly_data(date_value, ffr_dict, MAX_FFR_MONTHS_DIFF, "FFR")
+    return _lookup_monthly(date_value, ffr_dict, MAX_FFR_MONTHS_DIFF, "FFR")
 
 
 def create_expense_dict(expense_df: pd.DataFrame) -> dict[str, float]:
@@ -282,7 +552,23 @@ def create_expense_dict(expense_df: pd.DataFrame) -> dict[str, float]:
     return _create_monthly_data_dict(expense_df, COL_EXPENSE_DATE, COL_EXPENSE_VALUE, "Expense")
 
 
-def lookup_expense(date_value: date, expense_dict: dict[str, float]) -> float:
+def create_expense_series(expense_df: pd.DataFrame) -> MonthlySeries:
+    """
+    Expense Ratio DataFrame을 MonthlySeries로 변환한다 (최대 MAX_EXPENSE_MONTHS_DIFF개월 fallback).
+
+    Args:
+        expense_df: Expense Ratio DataFrame (DATE: str (yyyy-mm), VALUE: float (0~1 비율))
+
+    Returns:
+        Expense Ratio 월별 시계열
+
+    Raises:
+        ValueError: 빈 DataFrame 또는 중복 월 발견 시
+    """
+    return _create_monthly_series(expense_df, COL_EXPENSE_DATE, COL_EXPENSE_VALUE, MAX_EXPENSE_MONTHS_DIFF, "Expense")
+
+
+def lookup_expense(date_value: date, expense_dict: MonthlyData) -> float:
     """
     특정 날짜의 Expense Ratio 값을 딕셔너리에서 조회한다.
 
@@ -290,7 +576,7 @@ def lookup_expense(date_value: date, expense_dict: dict[str, float]) -> float:
 
     Args:
         date_value: 조회할 날짜
-        expense_dict: Expense Ratio 딕셔너리 ({"YYYY-MM": expense_value})
+        expense_dict: Expense Ratio 딕셔너리 ({"YYYY-MM": expense_value}) 또는 MonthlySeries
 
     Returns:
         Expense Ratio 값 (0~1 비율, 예: 0.0095 = 0.95%)
@@ -298,10 +584,10 @@ def lookup_expense(date_value: date, expense_dict: dict[str, float]) -> float:
     Raises:
         ValueError: 월 키 없음 + 이전 월 없음, 또는 월 차이 초과 시
     """
-    return _lookup_monthly_data(date_value, expense_dict, MAX_EXPENSE_MONTHS_DIFF, "Expense")
+    return _lookup_monthly(date_value, expense_dict, MAX_EXPENSE_MONTHS_DIFF, "Expense")
 
 
-def lookup_funding_spread(date_value: date, spread_dict: dict[str, float]) -> float:
+def lookup_funding_spread(date_value: date, spread_dict: MonthlyData) -> float:
     """
     특정 날짜의 funding spread 값을 딕셔너리에서 조회한다.
 
@@ -309,7 +595,7 @@ def lookup_funding_spread(date_value: date, spread_dict: dict[str, float]) -> fl
 
     Args:
         date_value: 조회할 날짜
-        spread_dict: funding spread 딕셔너리 ({"YYYY-MM": spread_value})
+        spread_dict: funding spread 딕셔너리 ({"YYYY-MM": spread_value}) 또는 MonthlySeries
 
     Returns:
         funding spread 값
@@ -317,7 +603,7 @@ def lookup_funding_spread(date_value: date, spread_dict: dict[str, float]) -> fl
     Raises:
         ValueError: 월 키 없음 + 이전 월 없음, 또는 월 차이 초과 시
     """
-    return _lookup_monthly_data(date_value, spread_dict, MAX_FFR_MONTHS_DIFF, "funding_spread")
+    return _lookup_monthly(date_value, spread_dict, MAX_FFR_MONTHS_DIFF, "funding_spread")
 
 
 def build_extended_expense_dict(expense_df: pd.DataFrame) -> dict[str, float]:
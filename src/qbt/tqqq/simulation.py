@@ -55,14 +55,20 @@ from qbt.tqqq.constants import (
     KEY_OVERLAP_DAYS,
     KEY_OVERLAP_END,
     KEY_OVERLAP_START,
+    MAX_EXPENSE_MONTHS_DIFF,
     MAX_FFR_MONTHS_DIFF,
 )
 from qbt.tqqq.data_loader import (
-    create_expense_dict,
-    create_ffr_dict,
+    MonthlyData,
+    MonthlySeries,
+    create_expense_series,
+    create_ffr_series,
+    format_month_code,
     lookup_expense,
     lookup_ffr,
     lookup_funding_spread,
+    month_codes_from_dates,
+    month_codes_from_keys,
 )
 from qbt.utils import get_logger
 from qbt.utils.data_loader import extract_overlap_period
@@ -94,7 +100,8 @@ class ValidationMetricsDict(TypedDict):
 # 동적 funding_spread 지원 타입 정의
 # - float: 고정 spread
 # - dict[str, float]: 월별 spread ({"YYYY-MM": spread})
-FundingSpreadSpec = float | dict[str, float]
+# - MonthlySeries: 월별 spread 시계열 (build_monthly_spread_series)
+FundingSpreadSpec = float | dict[str, float] | MonthlySeries
 
 
 # ============================================================
@@ -169,6 +176,84 @@ def _compute_softplus_spread(a: float, b: float, ffr_ratio: float) -> float:
     return spread
 
 
+def compute_softplus_spreads(
+    a: float | np.ndarray,
+    b: float | np.ndarray,
+    ffr_ratio: np.ndarray,
+) -> np.ndarray:
+    """
+    softplus 기반 동적 spread를 배열 연산으로 계산한다 (_compute_softplus_spread의 배열 버전).
+
+    수식과 연산 순서는 _compute_softplus_spread와 같고, a, b, ffr_ratio는 NumPy 브로드캐스트 규칙을 따른다
+    (예: 후보 (K, 1) × 월 (M,) → (K, M)). NumPy의 exp/log1p 구현이 math 모듈과 달라
+    스칼라 경로와 비트 단위로 같지는 않으며, 상대 오차 1e-14 이내에서 일치한다 (수 ULP 수준).
+
+    Args:
+        a: 절편 파라미터 (스칼라 또는 배열)
+        b: 기울기 파라미터 (스칼라 또는 배열)
+        ffr_ratio: 연방기금금리 배열 (0~1 비율)
+
+    Returns:
+        브로드캐스트된 형태의 spread 배열 (모두 > 0)
+
+    Raises:
+        ValueError: spread <= 0 또는 NaN인 값이 있을 때 (극단 파라미터의 underflow 등)
+    """
+    # 1. softplus(a + b * ffr_pct) 계산 (수치 안정 수식은 _softplus와 동일)
+    x = a + b * (100.0 * ffr_ratio)
+    spreads = np.log1p(np.exp(-np.abs(x))) + np.maximum(x, 0.0)
+
+    # 2. 방어적 체크 (softplus는 항상 > 0이지만 수치 오류 대비, NaN은 비교가 False)
+    if not np.all(spreads > 0):
+        raise ValueError("softplus spread 결과가 유효하지 않음: spread <= 0 또는 NaN\n" f"파라미터: a={a}, b={b}\n" "조치: 파라미터 값 확인 필요")
+
+    return spreads
+
+
+def build_monthly_spread_series(
+    ffr_df: pd.DataFrame,
+    a: float,
+    b: float,
+) -> MonthlySeries:
+    """
+    FFR 데이터로부터 월별 softplus spread 시계열을 생성한다.
+
+    모든 월의 FFR 값에 softplus(a + b * ffr_pct) 공식을 배열 연산으로 한 번에 적용한다.
+    결과는 FFR과 같은 월 코드와 fallback 한도(MAX_FFR_MONTHS_DIFF)를 가지며,
+    simulate() 함수의 funding_spread 파라미터로 전달할 수 있다.
+
+    Args:
+        ffr_df: FFR DataFrame (DATE: str (yyyy-mm), VALUE: float (0~1 비율))
+        a: softplus 절편 파라미터
+        b: softplus 기울기 파라미터
+
+    Returns:
+        월별 spread MonthlySeries (data_type="funding_spread")
+
+    Raises:
+        ValueError: FFR DataFrame이 비어있거나 필수 컬럼 누락, 중복 월 발견 시
+        ValueError: spread 계산 결과가 유효하지 않을 때
+    """
+    # 1. 필수 컬럼 검증
+    if ffr_df.empty:
+        raise ValueError("FFR DataFrame이 비어있습니다")
+
+    required_cols = {COL_FFR_DATE, COL_FFR_VALUE}
+    missing_cols = required_cols - set(ffr_df.columns)
+    if missing_cols:
+        raise ValueError(f"FFR DataFrame 필수 컬럼 누락: {missing_cols}")
+
+    # 2. 월별 spread 계산
+    ffr_series = create_ffr_series(ffr_df)
+    spreads = compute_softplus_spreads(a, b, ffr_series.values)
+
+    logger.debug(
+        f"월별 spread 맵 생성 완료: {len(spreads)}개월, a={a}, b={b}, spread 범위=[{spreads.min():.6f}, {spreads.max():.6f}]"
+    )
+
+    return MonthlySeries(ffr_series.month_codes, spreads, MAX_FFR_MONTHS_DIFF, "funding_spread")
+
+
 def build_monthly_spread_map(
     ffr_df: pd.DataFrame,
     a: float,
@@ -180,6 +265,8 @@ def build_monthly_spread_map(
     각 월의 FFR 값에 대해 softplus(a + b * ffr_pct) 공식을 적용하여
     월별 spread 딕셔너리를 생성한다. 이 딕셔너리는 simulate() 함수의
     funding_spread 파라미터로 전달할 수 있다.
+    월별 스칼라 계산(_compute_softplus_spread)을 사용하며, build_monthly_spread_series()와 달리
+    중복 월을 거부하지 않는다 (행 순서상 마지막 값이 남는다).
 
     Args:
         ffr_df: FFR DataFrame (DATE: str (yyyy-mm), VALUE: float (0~1 비율))
@@ -202,15 +289,10 @@ def build_monthly_spread_map(
     if missing_cols:
         raise ValueError(f"FFR DataFrame 필수 컬럼 누락: {missing_cols}")
 
-    # 2. 월별 spread 계산
+    # 2. 월별 spread 계산 (중복 월은 딕셔너리 갱신 순서상 마지막 행 값 사용)
     spread_map: dict[str, float] = {}
-    for _, row in ffr_df.iterrows():
-        month_key = str(row[COL_FFR_DATE])
-        ffr_ratio = float(row[COL_FFR_VALUE])
-
-        # softplus spread 계산
-        spread = _compute_softplus_spread(a, b, ffr_ratio)
-        spread_map[month_key] = spread
+    for month_key, ffr_ratio in zip(ffr_df[COL_FFR_DATE].astype(str), ffr_df[COL_FFR_VALUE].astype(float), strict=True):
+        spread_map[month_key] = _compute_softplus_spread(a, b, ffr_ratio)
 
     logger.debug(
         f"월별 spread 맵 생성 완료: {len(spread_map)}개월, "
@@ -227,6 +309,7 @@ def _resolve_spread(d: date, spread_spec: FundingSpreadSpec) -> float:
     FundingSpreadSpec 타입에 따라 다르게 처리:
     - float: 그대로 반환
     - dict[str, float]: 월별 키 "YYYY-MM"으로 조회, 키 없으면 MAX_FFR_MONTHS_DIFF 이내 이전 월 fallback
+    - MonthlySeries: 같은 fallback 정책으로 월 코드 이진 탐색 조회
 
     제약 조건:
     - 반환 spread는 항상 > 0 (음수 불허, 0도 불허)
@@ -235,7 +318,7 @@ def _resolve_spread(d: date, spread_spec: FundingSpreadSpec) -> float:
 
     Args:
         d: 대상 날짜
-        spread_spec: funding_spread 스펙 (float 또는 dict)
+        spread_spec: funding_spread 스펙 (float, dict 또는 MonthlySeries)
 
     Returns:
         해당 날짜의 spread 값 (> 0)
@@ -249,7 +332,7 @@ def _resolve_spread(d: date, spread_spec: FundingSpreadSpec) -> float:
     if isinstance(spread_spec, float | int):
         spread = float(spread_spec)
 
-    # 2. dict 타입: 월별 키 조회 (키 없으면 MAX_FFR_MONTHS_DIFF 이내 이전 월 fallback)
+    # 2. dict/MonthlySeries 타입: 월별 조회 (키 없으면 MAX_FFR_MONTHS_DIFF 이내 이전 월 fallback)
     else:
         spread = lookup_funding_spread(d, spread_spec)
 
@@ -287,61 +370,50 @@ def _validate_ffr_coverage(
     start_year_month = f"{overlap_start.year:04d}-{overlap_start.month:02d}"
     end_year_month = f"{overlap_end.year:04d}-{overlap_end.month:02d}"
 
-    # 2. FFR 데이터 존재 여부 확인
-    ffr_dates = set(ffr_df[COL_FFR_DATE])
-    if not ffr_dates:
+    # 2. FFR 데이터 존재 여부 확인 (정렬된 고유 월 코드)
+    ffr_codes = np.unique(month_codes_from_keys(ffr_df[COL_FFR_DATE]))
+    if len(ffr_codes) == 0:
         raise ValueError(f"FFR 데이터 부족: 필요 기간 {start_year_month}~{end_year_month}에 대한 " f"FFR 데이터가 전혀 존재하지 않습니다.")
 
     # 3. FFR 데이터 범위 확인
-    ffr_start = min(ffr_dates)
-    ffr_end = max(ffr_dates)
-
-    # 4. overlap 기간의 모든 월 생성
-    required_months = set()
-    current = overlap_start
-    while current <= overlap_end:
-        month_str = f"{current.year:04d}-{current.month:02d}"
-        required_months.add(month_str)
-        # 다음 달로 이동
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-    # 5. 필요한 월 중 FFR 데이터가 없는 월 찾기
-    missing_months = required_months - ffr_dates
-
-    # 6. 누락된 월이 있으면 가장 가까운 이전 월 찾기 및 월 차 검증
-    if missing_months:
-        for missing_month in sorted(missing_months):
-            # 이전 월 찾기
-            previous_dates = [d for d in ffr_dates if d < missing_month]
-            if not previous_dates:
-                raise ValueError(
-                    f"FFR 데이터 부족: 필요 기간 {start_year_month}~{end_year_month}에서 {missing_month}의 "
-                    f"FFR 데이터가 없으며, 이전 데이터도 존재하지 않습니다. "
-                    f"FFR 데이터 범위: {ffr_start}~{ffr_end}"
-                )
-
-            closest_date_str = max(previous_dates)
-            # 월 차이 계산
-            missing_year, missing_month_num = map(int, missing_month.split("-"))
-            closest_year, closest_month_num = map(int, closest_date_str.split("-"))
-            total_months = (missing_year - closest_year) * 12 + (missing_month_num - closest_month_num)
-
-            if total_months > MAX_FFR_MONTHS_DIFF:
-                raise ValueError(
-                    f"FFR 데이터 부족: 필요 기간 {start_year_month}~{end_year_month}에서 {missing_month}의 "
-                    f"FFR 데이터가 없으며, 가장 가까운 이전 데이터는 {closest_date_str} ({total_months}개월 전)입니다. "
-                    f"최대 {MAX_FFR_MONTHS_DIFF}개월 이내의 데이터만 사용 가능합니다. "
-                    f"FFR 데이터 범위: {ffr_start}~{ffr_end}"
-                )
+    ffr_start = format_month_code(ffr_codes[0])
+    ffr_end = format_month_code(ffr_codes[-1])
+
+    # 4. overlap 기간의 모든 월 코드와 각 월의 가장 가까운 이전(또는 같은) FFR 월 위치 (이진 탐색)
+    start_code, end_code = month_codes_from_dates([overlap_start, overlap_end])
+    required_codes = np.arange(start_code, end_code + 1)
+    positions = np.searchsorted(ffr_codes, required_codes, side="right") - 1
+
+    # 5. 이전 데이터가 없거나 월 차이가 한도를 넘는 첫 월 찾기
+    no_previous = positions < 0
+    months_diff = required_codes - ffr_codes[np.maximum(positions, 0)]
+    invalid = no_previous | (months_diff > MAX_FFR_MONTHS_DIFF)
+    if not invalid.any():
+        return
+
+    k = int(np.argmax(invalid))
+    missing_month = format_month_code(required_codes[k])
+    if no_previous[k]:
+        raise ValueError(
+            f"FFR 데이터 부족: 필요 기간 {start_year_month}~{end_year_month}에서 {missing_month}의 "
+            f"FFR 데이터가 없으며, 이전 데이터도 존재하지 않습니다. "
+            f"FFR 데이터 범위: {ffr_start}~{ffr_end}"
+        )
+
+    closest_date_str = format_month_code(int(ffr_codes[positions[k]]))
+    total_months = int(months_diff[k])
+    raise ValueError(
+        f"FFR 데이터 부족: 필요 기간 {start_year_month}~{end_year_month}에서 {missing_month}의 "
+        f"FFR 데이터가 없으며, 가장 가까운 이전 데이터는 {closest_date_str} ({total_months}개월 전)입니다. "
+        f"최대 {MAX_FFR_MONTHS_DIFF}개월 이내의 데이터만 사용 가능합니다. "
+        f"FFR 데이터 범위: {ffr_start}~{ffr_end}"
+    )
 
 
 def _calculate_daily_cost(
     date_value: date,
-    ffr_dict: dict[str, float],
-    expense_dict: dict[str, float],
+    ffr_dict: MonthlyData,
+    expense_dict: MonthlyData,
     funding_spread: FundingSpreadSpec,
     leverage: float,
 ) -> float:
@@ -352,11 +424,11 @@ def _calculate_daily_cost(
 
     Args:
         date_value: 계산 대상 날짜
-        ffr_dict: 연방기금금리 딕셔너리 ({"YYYY-MM": ffr_value})
-        expense_dict: 운용비용 딕셔너리 ({"YYYY-MM": expense_value}, 0~1 비율)
+        ffr_dict: 연방기금금리 딕셔너리 ({"YYYY-MM": ffr_value}) 또는 MonthlySeries
+        expense_dict: 운용비용 딕셔너리 ({"YYYY-MM": expense_value}, 0~1 비율) 또는 MonthlySeries
         funding_spread: FFR에 더해지는 스프레드
             - float: 고정 spread (예: 0.006 = 0.6%)
-            - dict[str, float]: 월별 spread ({"YYYY-MM": spread})
+            - dict[str, float] 또는 MonthlySeries: 월별 spread
         leverage: 레버리지 배율 (예: 3.0 = 3배 레버리지)
 
     Returns:
@@ -397,6 +469,147 @@ def _calculate_daily_cost(
     return daily_cost
 
 
+def _resolve_spreads(dates: np.ndarray, spread_spec: FundingSpreadSpec) -> np.ndarray:
+    """
+    여러 날짜의 funding_spread 값을 배열로 해석한다 (_resolve_spread의 배열 버전).
+
+    Args:
+        dates: 대상 날짜 배열
+        spread_spec: funding_spread 스펙 (float, dict 또는 MonthlySeries)
+
+    Returns:
+        dates와 같은 길이의 spread 배열 (모두 > 0)
+
+    Raises:
+        ValueError: 이전 월 없음, 월 차이 초과, NaN/inf 반환, spread <= 0 등 (첫 위반 날짜 기준)
+    """
+    # 1. 스펙 타입별 배열 구성
+    if isinstance(spread_spec, float | int):
+        spreads = np.full(len(dates), float(spread_spec), dtype=np.float64)
+    elif isinstance(spread_spec, MonthlySeries):
+        spreads = spread_spec.lookup_many(dates)
+    else:
+        spreads = MonthlySeries.from_dict(spread_spec, MAX_FFR_MONTHS_DIFF, "funding_spread").lookup_many(dates)
+
+    # 2. 반환값 검증: NaN/inf, spread <= 0 (첫 위반 날짜 기준)
+    invalid = ~np.isfinite(spreads) | (spreads <= 0)
+    if invalid.any():
+        first_invalid = int(np.argmax(invalid))
+        raise ValueError(
+            f"funding_spread 반환값이 유효하지 않음: {spreads[first_invalid]} (날짜: {dates[first_invalid]})\n"
+            "조치: spread 값을 양수로 수정"
+        )
+
+    return spreads
+
+
+def _calculate_daily_costs(
+    dates: np.ndarray,
+    ffr_series: MonthlySeries,
+    expense_series: MonthlySeries,
+    funding_spread: FundingSpreadSpec,
+    leverage: float,
+) -> np.ndarray:
+    """
+    여러 날짜의 일일 비용률을 배열 연산으로 한 번에 계산한다.
+
+    FFR, Expense, spread를 MonthlySeries.lookup_many로 날짜 배열 전체에 대해 조회한 뒤
+    _calculate_daily_cost와 같은 순서의 연산으로 비용률을 계산한다.
+    조회 또는 검증에 실패하면 월 순서대로 _calculate_daily_cost를 다시 따라가
+    일별 계산과 같은 날짜의 에러를 발생시킨다.
+
+    Args:
+        dates: 계산 대상 날짜 배열 (datetime.date 객체)
+        ffr_series: 연방기금금리 월별 시계열
+        expense_series: 운용비용 월별 시계열 (0~1 비율)
+        funding_spread: FFR에 더해지는 스프레드 (float, 월별 dict 또는 MonthlySeries)
+        leverage: 레버리지 배율
+
+    Returns:
+        dates와 같은 길이의 일일 비용률 배열
+
+    Raises:
+        ValueError: FFR 또는 Expense 데이터가 존재하지 않을 때
+        ValueError: funding_spread가 유효하지 않을 때 (NaN, inf, <= 0, 키 누락 등)
+    """
+    # 1. 월별 값 일괄 조회
+    try:
+        ffr = ffr_series.lookup_many(dates)
+        expense_ratio = expense_series.lookup_many(dates)
+        spread = _resolve_spreads(dates, funding_spread)
+    except ValueError:
+        # 실패 시 날짜 순서대로 각 월의 첫 날짜를 일별 경로로 계산하여 가장 이른 에러 발생
+        _, first_positions = np.unique(month_codes_from_dates(dates), return_index=True)
+        for position in np.sort(first_positions):
+            _calculate_daily_cost(dates[int(position)], ffr_series, expense_series, funding_spread, leverage)
+        raise
+
+    # 2. 비용률 계산 (_calculate_daily_cost와 같은 연산 순서)
+    return ((ffr + spread) * (leverage - 1) + expense_ratio) / TRADING_DAYS_PER_YEAR
+
+
+def _compound_leveraged_prices(
+    dates: np.ndarray,
+    underlying_returns: np.ndarray,
+    leverage: float,
+    initial_price: float,
+    ffr_series: MonthlySeries,
+    expense_series: MonthlySeries,
+    funding_spread: FundingSpreadSpec,
+) -> np.ndarray:
+    """
+    기초 자산 일일 수익률로부터 레버리지 ETF 종가 배열을 누적곱으로 계산한다.
+
+    TQQQ_Close(t) = TQQQ_Close(t-1) × (1 + (underlying_return(t) × leverage - daily_cost(t)))
+    수익률이 NaN인 날(첫 행 포함)은 initial_price로 다시 시작한다.
+    np.cumprod는 앞에서부터 순차 곱셈이므로 일별 반복 계산과 같은 값을 만든다.
+
+    Args:
+        dates: 날짜 배열 (datetime.date 객체)
+        underlying_returns: 기초 자산 일일 수익률 배열 (첫 행은 NaN)
+        leverage: 레버리지 배율
+        initial_price: 시작 가격
+        ffr_series: 연방기금금리 월별 시계열
+        expense_series: 운용비용 월별 시계열
+        funding_spread: FFR에 더해지는 스프레드 (float, 월별 dict 또는 MonthlySeries)
+
+    Returns:
+        레버리지 ETF 종가 배열
+
+    Raises:
+        ValueError: FFR/Expense 데이터 부족 또는 funding_spread가 유효하지 않을 때
+    """
+    n_rows = len(underlying_returns)
+
+    # 1. 재시작 위치: 수익률이 NaN인 날 (첫 행은 항상 initial_price)
+    restart = np.isnan(underlying_returns)
+    if n_rows > 0:
+        restart[0] = True
+    valid_positions = np.flatnonzero(~restart)
+
+    # 2. 일별 성장 계수 (재시작 위치에는 initial_price를 두어 누적곱의 시작값으로 사용)
+    factors = np.full(n_rows, initial_price, dtype=np.float64)
+    if len(valid_positions) > 0:
+        daily_costs = _calculate_daily_costs(
+            dates[valid_positions], ffr_series, expense_series, funding_spread, leverage
+        )
+        factors[valid_positions] = 1 + (underlying_returns[valid_positions] * leverage - daily_costs)
+
+    # 3. 재시작 구간별 누적곱
+    prices = np.empty(n_rows, dtype=np.float64)
+    bounds = [*np.flatnonzero(restart).tolist(), n_rows]
+    for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+        prices[start:end] = np.cumprod(factors[start:end])
+    return prices
+
+
+def _as_monthly_series(monthly_data: MonthlyData, max_months_diff: int, data_type: str) -> MonthlySeries:
+    """딕셔너리 월별 데이터를 MonthlySeries로 변환한다 (이미 MonthlySeries면 그대로 반환)."""
+    if isinstance(monthly_data, MonthlySeries):
+        return monthly_data
+    return MonthlySeries.from_dict(monthly_data, max_months_diff, data_type)
+
+
 def simulate(
     underlying_df: pd.DataFrame,
     leverage: float,
@@ -405,8 +618,8 @@ def simulate(
     *,
     ffr_df: pd.DataFrame | None = None,
     funding_spread: FundingSpreadSpec,
-    ffr_dict: dict[str, float] | None = None,
-    expense_dict: dict[str, float] | None = None,
+    ffr_dict: MonthlyData | None = None,
+    expense_dict: MonthlyData | None = None,
 ) -> pd.DataFrame:
     """
     기초 자산 데이터로부터 레버리지 ETF를 시뮬레이션한다.
@@ -426,8 +639,9 @@ def simulate(
         funding_spread: FFR에 더해지는 스프레드
             - float: 고정 spread (예: 0.006 = 0.6%)
             - dict[str, float]: 월별 spread ({"YYYY-MM": spread})
-        ffr_dict: 이미 검증된 FFR 딕셔너리 (내부 사용), ffr_df와 배타적
-        expense_dict: 이미 검증된 Expense 딕셔너리 (내부 사용)
+            - MonthlySeries: 월별 spread 시계열 (build_monthly_spread_series)
+        ffr_dict: 이미 검증된 FFR 딕셔너리 또는 MonthlySeries (내부 사용), ffr_df와 배타적
+        expense_dict: 이미 검증된 Expense 딕셔너리 또는 MonthlySeries (내부 사용)
 
     Returns:
         시뮬레이션된 레버리지 ETF DataFrame (Date, Open, High, Low, Close, Volume 컬럼)
@@ -468,18 +682,22 @@ def simulate(
         start_date = underlying_df[COL_DATE].min()
         end_date = underlying_df[COL_DATE].max()
         _validate_ffr_coverage(start_date, end_date, ffr_df)
-        ffr_dict_to_use: dict[str, float] = create_ffr_dict(ffr_df)
+        ffr_series = create_ffr_series(ffr_df)
     else:
         # ffr_dict 직접 제공 시: 이미 검증된 것으로 간주
-        ffr_dict_to_use = cast(dict[str, float], ffr_dict)
+        ffr_series = _as_monthly_series(cast(MonthlyData, ffr_dict), MAX_FFR_MONTHS_DIFF, "FFR")
 
     # 4. Expense 처리
     if expense_dict is None:
         # expense_df 제공 시: 변환
-        expense_dict_to_use: dict[str, float] = create_expense_dict(expense_df)
+        expense_series = create_expense_series(expense_df)
     else:
         # expense_dict 직접 제공 시: 이미 검증된 것으로 간주
-        expense_dict_to_use = expense_dict
+        expense_series = _as_monthly_series(expense_dict, MAX_EXPENSE_MONTHS_DIFF, "Expense")
+
+    # 월별 spread 딕셔너리는 날짜 배열 조회를 위해 한 번만 시계열로 변환
+    if isinstance(funding_spread, dict):
+        funding_spread = _as_monthly_series(funding_spread, MAX_FFR_MONTHS_DIFF, "funding_spread")
 
     # 5. 데이터 복사 (원본 보존)
     df = underlying_df[[COL_DATE, COL_OPEN, COL_CLOSE]].copy()
@@ -488,28 +706,15 @@ def simulate(
     df["underlying_return"] = df[COL_CLOSE].pct_change()
 
     # 7. 레버리지 ETF 가격 계산 (복리, 동적 비용 반영)
-    leveraged_prices = [initial_price]
-
-    for i in range(1, len(df)):
-        underlying_return = df.iloc[i]["underlying_return"]
-
-        if pd.isna(underlying_return):
-            # 첫 번째 행의 경우 수익률이 NaN이므로 initial_price 유지
-            leveraged_prices.append(initial_price)
-        else:
-            # 동적 비용 계산
-            current_date = df.iloc[i][COL_DATE]
-            daily_cost = _calculate_daily_cost(
-                current_date, ffr_dict_to_use, expense_dict_to_use, funding_spread, leverage
-            )
-
-            # 레버리지 수익률 = 기초 자산 수익률 × 배율 - 일일 비용
-            # 예: 기초 자산 +1%, 3배 레버리지 -> +3% - 비용
-            leveraged_return = underlying_return * leverage - daily_cost
-
-            # 가격 업데이트 (복리 효과)
-            new_price = leveraged_prices[-1] * (1 + leveraged_return)
-            leveraged_prices.append(new_price)
+    leveraged_prices = _compound_leveraged_prices(
+        np.asarray(df[COL_DATE]),
+        np.asarray(df["underlying_return"], dtype=np.float64),
+        leverage,
+        initial_price,
+        ffr_series,
+        expense_series,
+        funding_spread,
+    )
 
     # 8. 기초 자산 Close 보존 (오버나이트 수익률 계산에 필요)
     underlying_close_series = df[COL_CLOSE].copy()
@@ -0,0 +1,390 @@
+"""레버리지 ETF 합성 장기 시계열 일괄 생성
+
+기초 자산 전체 기간을 softplus 동적 스프레드 모델로 시뮬레이션하고,
+실제 ETF 첫 거래일(접합점)에서 가격을 스케일링하여 합성 구간 + 실제 구간을 병합한다.
+TQQQ 전용 generate_synthetic.py와 같은 절차를 선언된 (기초 자산, 레버리지, 운용비율) 조합 전체에 적용한다.
+
+- SyntheticSpec / SYNTHETIC_SPECS: 생성 대상 조합 선언
+- merge_synthetic_with_actual: 접합점 가격 스케일링 + 병합
+- build_synthetic_series: 조합 1개의 시뮬레이션 + 병합
+- generate_synthetic_batch: 전체 조합 일괄 생성 (FFR/spread 월별 시계열 공유, 조합 단위 프로세스 병렬)
+
+SSO/QLD/UGL/UBT는 월별 운용비율 데이터가 없으므로 고정 운용비율을 사용하고,
+funding spread는 TQQQ로 캘리브레이션한 softplus 파라미터를 그대로 적용한다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+import pandas as pd
+
+from qbt.common_constants import (
+    COL_CLOSE,
+    COL_DATE,
+    GLD_DATA_PATH,
+    PRICE_COLUMNS,
+    QLD_DATA_PATH,
+    QLD_SYNTHETIC_DATA_PATH,
+    QQQ_DATA_PATH,
+    SPY_DATA_PATH,
+    SSO_DATA_PATH,
+    SSO_SYNTHETIC_DATA_PATH,
+    TLT_DATA_PATH,
+    TQQQ_SYNTHETIC_DATA_PATH,
+    UBT_DATA_PATH,
+    UBT_SYNTHETIC_DATA_PATH,
+    UGL_DATA_PATH,
+    UGL_SYNTHETIC_DATA_PATH,
+)
+from qbt.tqqq.constants import (
+    COL_EXPENSE_DATE,
+    COL_EXPENSE_VALUE,
+    DEFAULT_LEVERAGE_MULTIPLIER,
+    DEFAULT_SOFTPLUS_A,
+    DEFAULT_SOFTPLUS_B,
+    DEFAULT_SYNTHETIC_INITIAL_PRICE,
+    EXPENSE_RATIO_DATA_PATH,
+    QLD_EXPENSE_RATIO,
+    SSO_EXPENSE_RATIO,
+    TQQQ_DATA_PATH,
+    UBT_EXPENSE_RATIO,
+    UGL_EXPENSE_RATIO,
+)
+from qbt.tqqq.data_loader import (
+    MonthlySeries,
+    build_extended_expense_dict,
+    create_ffr_series,
+    format_month_code,
+    load_expense_ratio_data,
+    month_codes_from_dates,
+)
+from qbt.tqqq.simulation import build_monthly_spread_series, simulate
+from qbt.utils import get_logger
+from qbt.utils.data_loader import load_stock_data
+from qbt.utils.parallel_executor import WORKER_CACHE, WorkerPool
+
+logger = get_logger(__name__)
+
+# 워커 캐시 키 (조합 간 공유하는 FFR / spread 월별 시계열)
+_WORKER_FFR_KEY = "synthetic_ffr_series"
+_WORKER_SPREAD_KEY = "synthetic_spread_series"
+
+
+# ============================================================================
+# 생성 대상 선언
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """
+    합성 시계열 생성 대상 1개 (기초 자산, 레버리지, 운용비율) 선언.
+
+    운용비율은 expense_ratio(전 구간 고정값)와 expense_ratio_path(월별 CSV) 중 정확히 하나를 지정한다.
+    월별 CSV는 build_extended_expense_dict 규칙(데이터 시작 전 구간은 상장 이전 가정값)으로 확장한다.
+
+    Attributes:
+        ticker: 레버리지 ETF 티커 (예: "SSO")
+        underlying_path: 기초 자산 CSV 경로
+        actual_path: 실제 레버리지 ETF CSV 경로
+        output_path: 병합 결과 CSV 경로
+        leverage: 레버리지 배율
+        expense_ratio: 전 구간 고정 운용비율 (0~1 비율)
+        expense_ratio_path: 월별 운용비율 CSV 경로
+    """
+
+    ticker: str
+    underlying_path: Path
+    actual_path: Path
+    output_path: Path
+    leverage: float
+    expense_ratio: float | None = None
+    expense_ratio_path: Path | None = None
+
+    def __post_init__(self) -> None:
+        if self.leverage <= 0:
+            raise ValueError(f"{self.ticker}: leverage는 양수여야 합니다: {self.leverage}")
+        if (self.expense_ratio is None) == (self.expense_ratio_path is None):
+            raise ValueError(f"{self.ticker}: expense_ratio 또는 expense_ratio_path 중 정확히 하나만 지정해야 합니다")
+        if self.expense_ratio is not None and self.expense_ratio < 0:
+            raise ValueError(f"{self.ticker}: expense_ratio는 0 이상이어야 합니다: {self.expense_ratio}")
+
+
+# 일괄 생성 대상 (포트폴리오/전략 설정에서 거래하는 레버리지 ETF)
+SYNTHETIC_SPECS: tuple[SyntheticSpec, ...] = (
+    SyntheticSpec(
+        ticker="TQQQ",
+        underlying_path=QQQ_DATA_PATH,
+        actual_path=TQQQ_DATA_PATH,
+        output_path=TQQQ_SYNTHETIC_DATA_PATH,
+        leverage=DEFAULT_LEVERAGE_MULTIPLIER,
+        expense_ratio_path=EXPENSE_RATIO_DATA_PATH,
+    ),
+    SyntheticSpec(
+        ticker="QLD",
+        underlying_path=QQQ_DATA_PATH,
+        actual_path=QLD_DATA_PATH,
+        output_path=QLD_SYNTHETIC_DATA_PATH,
+        leverage=2.0,
+        expense_ratio=QLD_EXPENSE_RATIO,
+    ),
+    SyntheticSpec(
+        ticker="SSO",
+        underlying_path=SPY_DATA_PATH,
+        actual_path=SSO_DATA_PATH,
+        output_path=SSO_SYNTHETIC_DATA_PATH,
+        leverage=2.0,
+        expense_ratio=SSO_EXPENSE_RATIO,
+    ),
+    SyntheticSpec(
+        ticker="UGL",
+        underlying_path=GLD_DATA_PATH,
+        actual_path=UGL_DATA_PATH,
+        output_path=UGL_SYNTHETIC_DATA_PATH,
+        leverage=2.0,
+        expense_ratio=UGL_EXPENSE_RATIO,
+    ),
+    SyntheticSpec(
+        ticker="UBT",
+        underlying_path=TLT_DATA_PATH,
+        actual_path=UBT_DATA_PATH,
+        output_path=UBT_SYNTHETIC_DATA_PATH,
+        leverage=2.0,
+        expense_ratio=UBT_EXPENSE_RATIO,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticResult:
+    """
+    조합 1개의 합성+실제 병합 결과.
+
+    Attributes:
+        spec: 생성 대상 선언
+        merged_df: 스케일링된 합성 구간 + 실제 구간 (Date, Open, High, Low, Close, Volume)
+        scale_factor: 접합점 스케일 팩터 (실제 종가 / 시뮬레이션 종가)
+        overlap_date: 접합점 (실제 ETF 첫 거래일)
+        synthetic_days: 합성 구간 행 수 (접합점 이전)
+    """
+
+    spec: SyntheticSpec
+    merged_df: pd.DataFrame
+    scale_factor: float
+    overlap_date: date
+    synthetic_days: int
+
+
+# ============================================================================
+# 조합 1개 생성
+# ============================================================================
+
+
+def merge_synthetic_with_actual(synthetic_df: pd.DataFrame, actual_df: pd.DataFrame) -> tuple[pd.DataFrame, float]:
+    """
+    접합점(실제 ETF 첫 거래일)에서 합성 가격을 스케일링하고 실제 데이터와 병합한다.
+
+    처리 흐름:
+        1. 스케일 팩터 = 실제 접합점 종가 / 합성 접합점 종가
+        2. 접합점 이전 합성 구간의 가격 컬럼에 스케일 팩터 적용
+        3. 스케일링된 합성(< 접합점) + 실제(>= 접합점) 병합
+
+    Args:
+        synthetic_df: 시뮬레이션 결과 DataFrame (접합점 포함)
+        actual_df: 실제 레버리지 ETF DataFrame
+
+    Returns:
+        (병합 DataFrame (날짜 오름차순), 스케일 팩터) 튜플
+
+    Raises:
+        ValueError: 실제 데이터가 비어있거나 접합점이 합성 데이터에 없을 때
+    """
+    if actual_df.empty:
+        raise ValueError("실제 데이터가 비어있습니다")
+
+    # 1. 접합점 스케일 팩터
+    overlap_date = actual_df[COL_DATE].min()
+    synthetic_overlap_rows = synthetic_df[synthetic_df[COL_DATE] == overlap_date]
+    if synthetic_overlap_rows.empty:
+        raise ValueError(f"접합점 {overlap_date}이(가) 합성 데이터에 없습니다 (기초 자산 기간 확인 필요)")
+
+    actual_overlap_rows = actual_df[actual_df[COL_DATE] == overlap_date]
+    synthetic_at_overlap = float(synthetic_overlap_rows.iloc[0][COL_CLOSE])
+    actual_at_overlap = float(actual_overlap_rows.iloc[0][COL_CLOSE])
+    scale_factor = actual_at_overlap / synthetic_at_overlap
+
+    # 2. 합성 구간 스케일링 (접합일 이전 구간)
+    synthetic_before = synthetic_df.loc[synthetic_df[COL_DATE] < overlap_date].copy()
+    for col in PRICE_COLUMNS:
+        if col in synthetic_before.columns:
+            synthetic_before[col] = synthetic_before[col] * scale_factor
+
+    # 3. 병합: 스케일링된 합성(< overlap_date) + 실제(>= overlap_date)
+    actual_from_overlap = actual_df.loc[actual_df[COL_DATE] >= overlap_date].copy()
+    merged_df = pd.concat([synthetic_before, actual_from_overlap], ignore_index=True)
+    merged_df = merged_df.sort_values(COL_DATE).reset_index(drop=True)
+
+    return merged_df, scale_factor
+
+
+def _fixed_expense_df(expense_ratio: float, start_date: date, end_date: date) -> pd.DataFrame:
+    """start_date ~ end_date의 모든 월에 같은 운용비율을 둔 월별 Expense DataFrame을 만든다."""
+    start_code, end_code = month_codes_from_dates([start_date, end_date])
+    months = [format_month_code(code) for code in range(int(start_code), int(end_code) + 1)]
+    return pd.DataFrame({COL_EXPENSE_DATE: months, COL_EXPENSE_VALUE: np.full(len(months), expense_ratio)})
+
+
+def build_synthetic_series(
+    spec: SyntheticSpec,
+    underlying_df: pd.DataFrame,
+    actual_df: pd.DataFrame,
+    ffr_series: MonthlySeries,
+    spread_series: MonthlySeries,
+    expense_df: pd.DataFrame | None = None,
+) -> SyntheticResult:
+    """
+    조합 1개의 기초 자산 전체 기간을 시뮬레이션하고 실제 데이터와 병합한다.
+
+    FFR 데이터 시작 월 이전의 기초 자산 구간(예: 1999년 이전 SPY)은 비용 계산이 불가능하므로 제외한다.
+
+    Args:
+        spec: 생성 대상 선언
+        underlying_df: 기초 자산 DataFrame
+        actual_df: 실제 레버리지 ETF DataFrame
+        ffr_series: FFR 월별 시계열
+        spread_series: softplus funding spread 월별 시계열
+        expense_df: 월별 운용비율 DataFrame (spec.expense_ratio_path 지정 시 필수)
+
+    Returns:
+        병합 결과
+
+    Raises:
+        ValueError: 월별 운용비율 누락, FFR 기간과 겹치는 기초 자산 구간 없음, 접합점 누락 등
+    """
+    # 1. FFR 커버리지 시작 월 이전 구간 제외
+    ffr_start_code = int(ffr_series.month_codes[0])
+    ffr_start = date(ffr_start_code // 12, ffr_start_code % 12 + 1, 1)
+    underlying = underlying_df.loc[underlying_df[COL_DATE] >= ffr_start].reset_index(drop=True)
+    if underlying.empty:
+        raise ValueError(f"{spec.ticker}: FFR 데이터 시작({ffr_series.first_month}) 이후의 기초 자산 데이터가 없습니다")
+
+    # 2. 운용비율 입력 (월별 CSV: 상장 이전 구간 확장, 고정값: 기초 자산 전 기간 월별 채우기)
+    expense_dict: dict[str, float] | None = None
+    if spec.expense_ratio_path is not None:
+        if expense_df is None:
+            raise ValueError(f"{spec.ticker}: expense_ratio_path 조합은 expense_df가 필요합니다")
+        expense_dict = build_extended_expense_dict(expense_df)
+    else:
+        if spec.expense_ratio is None:
+            raise RuntimeError("내부 불변조건 위반: expense_ratio와 expense_ratio_path가 모두 None입니다")
+        start_date = cast(date, underlying[COL_DATE].min())
+        end_date = cast(date, underlying[COL_DATE].max())
+        expense_df = _fixed_expense_df(spec.expense_ratio, start_date, end_date)
+
+    # 3. 시뮬레이션 (FFR/spread 월별 시계열은 조합 간 공유)
+    synthetic_df = simulate(
+        underlying_df=underlying,
+        leverage=spec.leverage,
+        expense_df=expense_df,
+        initial_price=DEFAULT_SYNTHETIC_INITIAL_PRICE,
+        funding_spread=spread_series,
+        ffr_dict=ffr_series,
+        expense_dict=expense_dict,
+    )
+
+    # 4. 접합점 스케일링 + 병합
+    merged_df, scale_factor = merge_synthetic_with_actual(synthetic_df, actual_df)
+    overlap_date = cast(date, actual_df[COL_DATE].min())
+    synthetic_days = int((merged_df[COL_DATE] < overlap_date).sum())
+
+    return SyntheticResult(
+        spec=spec,
+        merged_df=merged_df,
+        scale_factor=scale_factor,
+        overlap_date=overlap_date,
+        synthetic_days=synthetic_days,
+    )
+
+
+# ============================================================================
+# 일괄 생성
+# ============================================================================
+
+
+def _load_and_build(spec: SyntheticSpec, ffr_series: MonthlySeries, spread_series: MonthlySeries) -> SyntheticResult:
+    """조합 1개의 입력 파일을 로드하고 build_synthetic_series를 실행한다."""
+    expense_df = load_expense_ratio_data(spec.expense_ratio_path) if spec.expense_ratio_path is not None else None
+    return build_synthetic_series(
+        spec,
+        load_stock_data(spec.underlying_path),
+        load_stock_data(spec.actual_path),
+        ffr_series,
+        spread_series,
+        expense_df,
+    )
+
+
+def _synthetic_task(spec: SyntheticSpec) -> SyntheticResult:
+    """
+    워커에서 조합 1개를 생성한다 (WORKER_CACHE의 공유 FFR/spread 시계열 사용).
+
+    ProcessPoolExecutor에서 pickle 가능하도록 모듈 레벨에 정의한다.
+    """
+    return _load_and_build(spec, WORKER_CACHE[_WORKER_FFR_KEY], WORKER_CACHE[_WORKER_SPREAD_KEY])
+
+
+def generate_synthetic_batch(
+    specs: Sequence[SyntheticSpec],
+    ffr_df: pd.DataFrame,
+    a: float = DEFAULT_SOFTPLUS_A,
+    b: float = DEFAULT_SOFTPLUS_B,
+    max_workers: int = 1,
+) -> list[SyntheticResult]:
+    """
+    선언된 조합 전체의 합성+실제 병합 시계열을 생성한다.
+
+    FFR / softplus spread 월별 시계열은 한 번만 만들어 모든 조합이 공유한다.
+    조합 사이에 의존이 없으므로 max_workers > 1이면 조합 단위로 프로세스 병렬 실행한다.
+
+    Args:
+        specs: 생성 대상 선언 목록
+        ffr_df: FFR DataFrame (DATE: str (yyyy-mm), VALUE: float (0~1 비율))
+        a: softplus 절편 파라미터
+        b: softplus 기울기 파라미터
+        max_workers: 최대 워커 수 (1이면 순차 실행)
+
+    Returns:
+        specs 순서대로 정렬된 결과 리스트
+
+    Raises:
+        ValueError: specs가 비어있거나 티커가 중복될 때, 또는 조합 생성 실패 시
+    """
+    if not specs:
+        raise ValueError("specs가 비어있습니다")
+    tickers = [spec.ticker for spec in specs]
+    if len(set(tickers)) != len(tickers):
+        raise ValueError(f"중복된 티커가 있습니다: {tickers}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+
+    # 1. 공유 월별 시계열 (1회)
+    ffr_series = create_ffr_series(ffr_df)
+    spread_series = build_monthly_spread_series(ffr_df, a, b)
+
+    # 2. 조합별 생성
+    n_workers = min(max_workers, len(specs))
+    logger.debug(f"합성 시계열 일괄 생성 시작 - 조합: {tickers}, 워커 수: {n_workers}")
+    if n_workers > 1:
+        with WorkerPool(max_workers=n_workers) as pool:
+            pool.update_cache(payload={_WORKER_FFR_KEY: ffr_series, _WORKER_SPREAD_KEY: spread_series})
+            results: list[SyntheticResult] = pool.map(_synthetic_task, list(specs), log_progress=False)
+    else:
+        results = [_load_and_build(spec, ffr_series, spread_series) for spec in specs]
+
+    return results
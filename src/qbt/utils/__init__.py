@@ -3,7 +3,7 @@
 from .data_loader import extract_overlap_period
 from .formatting import Align
 from .logger import get_logger, setup_logger
-from .parallel_executor import execute_parallel, execute_parallel_with_kwargs
+from .parallel_executor import WorkerPool, execute_parallel, execute_parallel_with_kwargs
 
 __all__ = [
     # Logger
@@ -16,4 +16,5 @@ __all__ = [
     # Parallel Execution
     "execute_parallel",
     "execute_parallel_with_kwargs",
+    "WorkerPool",
 ]
@@ -7,12 +7,25 @@
 2. 중앙 집중식 데이터 로딩: 공통 CSV 로딩 로직을 한 곳에서 관리
 3. 체이닝: df.sort_values().reset_index() 처럼 메서드를 연결해서 사용
 
+바이너리 컬럼 캐시:
+- CSV를 쓰는 쪽(다운로드/합성 데이터 생성/live append)이 write_columnar_cache()로
+  검증·정렬까지 끝난 결과를 `{CSV 이름}.columns/` 디렉토리에 컬럼별 .npy 파일로 저장한다
+- load_stock_data()는 캐시의 CSV 지문(SHA-256)이 현재 CSV와 같을 때만 캐시를 사용한다
+  (CSV를 직접 수정하면 자동으로 CSV 경로로 돌아감)
+- 숫자 컬럼은 memory-map으로 읽으므로 여러 워커 프로세스가 같은 페이지 캐시를 공유한다
+  (읽기 전용, 제자리 수정은 ValueError: load_stock_data() 읽기 전용 계약 참고)
+
 참고:
 - TQQQ 도메인 전용 데이터 로더: tqqq/data_loader.py 참고
 """
 
+import hashlib
+import json
+import os
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from qbt.common_constants import COL_DATE, REQUIRED_COLUMNS
@@ -22,6 +35,15 @@ from qbt.utils.logger import get_logger
 # __name__: 현재 모듈의 이름 (예: "qbt.utils.data_loader")
 logger = get_logger(__name__)
 
+# 바이너리 컬럼 캐시 설정
+# - 디렉토리 접미사: QQQ_max.csv → QQQ_max.columns/
+# - 포맷 버전: 저장 형식이 바뀌면 올려서 기존 캐시를 무시
+COLUMNAR_CACHE_SUFFIX = ".columns"
+_COLUMNAR_FORMAT_VERSION = 1
+_COLUMNAR_MANIFEST = "manifest.json"
+_KIND_DATE = "date"
+_KIND_NUMERIC = "numeric"
+
 
 def load_stock_data(path: Path) -> pd.DataFrame:
     """
@@ -35,11 +57,17 @@ def load_stock_data(path: Path) -> pd.DataFrame:
 
     날짜 파싱, 정렬, 필수 컬럼 검증, 중복 제거를 수행한다.
 
+    읽기 전용 계약:
+        CSV 지문이 일치하는 바이너리 컬럼 캐시가 있으면 숫자 컬럼은 memory-map 배열을
+        복사 없이 사용하므로 읽기 전용이다. 반환 DataFrame의 값을 제자리에서 수정하면
+        (df.loc[...] = ..., df[col] *= ... 등) ValueError("assignment destination is read-only")가
+        발생한다. 수정이 필요한 호출자는 df.copy()로 복사한 뒤 수정하거나 새 컬럼/DataFrame을 만든다.
+
     Args:
         path: CSV 파일 경로
 
     Returns:
-        전처리된 DataFrame (날짜순 정렬됨)
+        전처리된 DataFrame (날짜순 정렬됨, 캐시 사용 시 숫자 컬럼 읽기 전용)
 
     Raises:
         FileNotFoundError: 파일이 존재하지 않을 때
@@ -54,6 +82,17 @@ def load_stock_data(path: Path) -> pd.DataFrame:
     # f-string 사용: f"{변수}" 형태로 문자열에 변수 삽입
     logger.debug(f"데이터 로딩 시작: {path}")
 
+    # 2. 바이너리 컬럼 캐시 우선 사용 (CSV 지문이 일치할 때만, 검증/정렬이 끝난 결과)
+    cached = _read_columnar_cache(path)
+    if cached is not None:
+        logger.debug(f"컬럼 캐시 사용: {len(cached):,}행, 기간 {cached[COL_DATE].min()} ~ {cached[COL_DATE].max()}")
+        return cached
+
+    return _parse_stock_csv(path)
+
+
+def _parse_stock_csv(path: Path) -> pd.DataFrame:
+    """CSV 파일을 파싱하고 검증/정렬/중복 제거를 수행한다 (load_stock_data의 CSV 경로)."""
     # 2. CSV 파일 로드
     # pd.read_csv(): CSV 파일을 읽어 DataFrame으로 변환
     # DataFrame: 행(row)과 열(column)로 구성된 2차원 테이블
@@ -168,3 +207,137 @@ def load_signal_trade_pair(
         signal_df, trade_df = extract_overlap_period(signal_df, trade_df)
 
     return signal_df, trade_df
+
+
+# ============================================================
+# 바이너리 컬럼 캐시
+# ============================================================
+
+
+def columnar_cache_dir(path: Path) -> Path:
+    """CSV 경로에 대응하는 바이너리 컬럼 캐시 디렉토리를 반환한다.
+
+    Args:
+        path: CSV 파일 경로
+
+    Returns:
+        캐시 디렉토리 경로 (예: storage/stock/QQQ_max.columns)
+    """
+    return path.with_suffix(COLUMNAR_CACHE_SUFFIX)
+
+
+def _file_fingerprint(path: Path) -> str:
+    """파일 내용의 SHA-256 hex를 계산한다 (mtime과 무관하게 내용이 같으면 같은 값)."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _atomic_write_bytes(target: Path, write: Any) -> None:
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 잘린 파일을 보지 않도록 한다."""
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        write(f)
+    os.replace(tmp_path, target)
+
+
+def write_columnar_cache(path: Path) -> Path:
+    """
+    CSV를 로드·검증한 결과를 바이너리 컬럼 캐시로 저장한다.
+
+    CSV를 새로 쓴 직후 호출한다. 캐시에는 CSV 지문이 기록되므로,
+    이후 CSV만 수정되면 load_stock_data()는 캐시를 무시하고 CSV를 읽는다.
+
+    저장 형식:
+        - manifest.json: 포맷 버전, CSV 지문, 행 수, 컬럼 목록(이름/종류)
+        - {컬럼 순번}.npy: 컬럼 값 (Date는 datetime64[D], 나머지는 원래 숫자 dtype)
+
+    Args:
+        path: CSV 파일 경로
+
+    Returns:
+        캐시 디렉토리 경로
+
+    Raises:
+        FileNotFoundError: CSV 파일이 존재하지 않을 때
+        ValueError: 필수 컬럼이 누락되었거나 숫자가 아닌 컬럼이 있을 때
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    fingerprint = _file_fingerprint(path)
+    df = _parse_stock_csv(path)
+
+    columns: list[dict[str, str]] = []
+    arrays: list[np.ndarray] = []
+    for col, series in df.items():
+        if col == COL_DATE:
+            columns.append({"name": COL_DATE, "kind": _KIND_DATE})
+            arrays.append(np.array(series.tolist(), dtype="datetime64[D]"))
+        elif pd.api.types.is_numeric_dtype(series.dtype) and isinstance(series.dtype, np.dtype):
+            columns.append({"name": str(col), "kind": _KIND_NUMERIC})
+            arrays.append(series.to_numpy())
+        else:
+            raise ValueError(f"컬럼 캐시로 저장할 수 없는 컬럼입니다: {col} (dtype={series.dtype})")
+
+    cache_dir = columnar_cache_dir(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # manifest를 먼저 지워 쓰는 도중에는 캐시가 무효로 보이게 하고, 마지막에 다시 기록한다
+    manifest_path = cache_dir / _COLUMNAR_MANIFEST
+    manifest_path.unlink(missing_ok=True)
+    for stale in cache_dir.glob("*.npy"):
+        stale.unlink()
+    for idx, values in enumerate(arrays):
+        _atomic_write_bytes(cache_dir / f"{idx}.npy", lambda f, v=values: np.save(f, v))
+
+    manifest = {
+        "format_version": _COLUMNAR_FORMAT_VERSION,
+        "csv_sha256": fingerprint,
+        "n_rows": len(df),
+        "columns": columns,
+    }
+    _atomic_write_bytes(manifest_path, lambda f: f.write(json.dumps(manifest, ensure_ascii=False).encode("utf-8")))
+
+    logger.debug(f"컬럼 캐시 저장 완료: {cache_dir} ({len(df):,}행, {len(columns)}개 컬럼)")
+    return cache_dir
+
+
+def _read_columnar_cache(path: Path) -> pd.DataFrame | None:
+    """
+    CSV 지문이 일치하는 바이너리 컬럼 캐시를 DataFrame으로 읽는다.
+
+    숫자 컬럼은 memory-map 배열을 복사 없이 사용하므로 읽기 전용이다.
+    Date 컬럼은 CSV 경로와 같은 datetime.date 객체 컬럼으로 변환한다.
+
+    Args:
+        path: CSV 파일 경로
+
+    Returns:
+        캐시된 DataFrame. 캐시가 없거나 손상되었거나 CSV가 바뀌었으면 None
+    """
+    manifest_path = columnar_cache_dir(path) / _COLUMNAR_MANIFEST
+    if not manifest_path.exists():
+        return None
+
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest["format_version"] != _COLUMNAR_FORMAT_VERSION:
+            return None
+        if manifest["csv_sha256"] != _file_fingerprint(path):
+            logger.debug(f"CSV가 컬럼 캐시 이후 변경됨, CSV에서 로드: {path}")
+            return None
+
+        n_rows = manifest["n_rows"]
+        data: dict[str, np.ndarray] = {}
+        for idx, column in enumerate(manifest["columns"]):
+            values = np.load(manifest_path.parent / f"{idx}.npy", mmap_mode="r")
+            if values.shape != (n_rows,):
+                return None
+            # datetime64[D] → object 변환 시 numpy가 datetime.date 객체를 만든다
+            # 숫자 컬럼은 np.memmap 서브클래스 대신 같은 매핑을 가리키는 일반 ndarray 뷰로 노출한다
+            data[column["name"]] = values.astype(object) if column["kind"] == _KIND_DATE else values.view(np.ndarray)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"손상된 컬럼 캐시 무시: {manifest_path.parent} ({e})")
+        return None
+
+    # copy=False: 딕셔너리의 배열을 블록 통합 없이 그대로 사용 (memory-map 유지)
+    return pd.DataFrame(data, copy=False)
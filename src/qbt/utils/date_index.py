@@ -0,0 +1,238 @@
+"""정수 날짜 인덱스와 다중 자산 공통 기간 정렬 모듈
+
+여러 자산 DataFrame의 공통 거래일을 Python set/Timestamp 비교 대신
+정렬된 int64 날짜 키(1970-01-01 기준 일수)로 계산하고, 날짜 → 행 위치를 O(1)로 조회한다.
+
+- date_keys / frame_date_keys: Date 컬럼을 int64 키 배열로 변환 (DataFrame 단위 캐시)
+- DateIndex: 정렬된 키 + 위치 조회 테이블 (키 - 첫 키 → 행 위치)
+- AlignedPanel / align_frames: 자산별 키의 정렬 병합(np.intersect1d)으로 만든 공통 기간과
+  자산별 행 위치 배열. 공통 기간 DataFrame/컬럼 배열은 이 위치로 한 번에 잘라낸다.
+
+전제: 입력 DataFrame의 Date 컬럼은 오름차순이며 중복이 없다 (load_stock_data가 보장).
+
+학습 포인트:
+1. 정렬 병합: 정수 키 배열의 교집합은 객체 해시 없이 C 수준 정렬·인접 비교로 구한다
+2. 직접 주소 테이블: 거래일 키가 좁은 정수 범위에 있으므로 배열 인덱싱으로 O(1) 조회
+3. weakref: 원본 DataFrame이 사라지면 캐시 항목도 함께 제거하여 id 재사용 오류를 막는다
+"""
+
+import weakref
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from qbt.common_constants import COL_DATE
+
+# int64 날짜 키 기준일(1970-01-01)의 proleptic Gregorian 서수
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# DataFrame별 int64 날짜 키 캐시: {id(df): (df 약한 참조, 키 배열)}
+# 같은 DataFrame을 여러 실험/호출이 공유하므로 날짜 변환(객체 → 정수)을 1회만 수행한다
+_FRAME_KEY_CACHE: dict[int, tuple[weakref.ref[pd.DataFrame], np.ndarray]] = {}
+
+
+def date_keys(dates: pd.Series | Iterable[date]) -> np.ndarray:
+    """날짜 시퀀스를 int64 키 배열(1970-01-01 기준 일수)로 변환한다.
+
+    Args:
+        dates: datetime.date 시리즈 또는 이터러블
+
+    Returns:
+        읽기 전용 int64 배열
+    """
+    series = dates if isinstance(dates, pd.Series) else pd.Series(list(dates), dtype=object)
+    keys = pd.to_datetime(series).to_numpy(dtype="datetime64[D]").astype(np.int64)
+    keys.flags.writeable = False
+    return keys
+
+
+def frame_date_keys(df: pd.DataFrame) -> np.ndarray:
+    """DataFrame Date 컬럼의 int64 키 배열을 반환한다 (같은 DataFrame 객체는 캐시 재사용).
+
+    DataFrame은 제자리 수정하지 않는다는 프로젝트 규약을 전제로 객체 단위로 캐시한다.
+
+    Args:
+        df: Date 컬럼을 가진 DataFrame
+
+    Returns:
+        읽기 전용 int64 배열 (행 순서)
+    """
+    frame_id = id(df)
+    cached = _FRAME_KEY_CACHE.get(frame_id)
+    if cached is not None and cached[0]() is df and len(cached[1]) == len(df):
+        return cached[1]
+
+    keys = date_keys(df[COL_DATE])
+    _FRAME_KEY_CACHE[frame_id] = (weakref.ref(df, lambda _ref: _FRAME_KEY_CACHE.pop(frame_id, None)), keys)
+    return keys
+
+
+def key_to_date(key: int) -> date:
+    """int64 날짜 키를 datetime.date로 되돌린다."""
+    return date.fromordinal(_EPOCH_ORDINAL + int(key))
+
+
+# ============================================================================
+# 날짜 인덱스
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class DateIndex:
+    """오름차순 int64 날짜 키와 O(1) 위치 조회 테이블.
+
+    Attributes:
+        keys: 오름차순 int64 날짜 키 (중복 없음)
+        lookup: (키 - keys[0]) → 행 위치 (해당 날짜가 없으면 -1)
+    """
+
+    keys: np.ndarray
+    lookup: np.ndarray
+
+    @classmethod
+    def from_keys(cls, keys: np.ndarray) -> "DateIndex":
+        """int64 키 배열로 인덱스를 만든다.
+
+        Args:
+            keys: 오름차순 int64 날짜 키
+
+        Returns:
+            DateIndex
+
+        Raises:
+            ValueError: 키가 오름차순이 아니거나 중복이 있는 경우
+        """
+        if len(keys) > 1 and not bool((np.diff(keys) > 0).all()):
+            raise ValueError("날짜가 오름차순이 아니거나 중복이 있습니다")
+        lookup = np.full(int(keys[-1] - keys[0]) + 1 if len(keys) else 0, -1, dtype=np.int64)
+        if len(keys):
+            lookup[keys - keys[0]] = np.arange(len(keys), dtype=np.int64)
+        lookup.flags.writeable = False
+        return cls(keys=keys, lookup=lookup)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "DateIndex":
+        """DataFrame Date 컬럼으로 인덱스를 만든다 (frame_date_keys 캐시 사용).
+
+        Raises:
+            ValueError: Date 컬럼이 오름차순이 아니거나 중복이 있는 경우
+        """
+        return cls.from_keys(frame_date_keys(df))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def positions(self, keys: np.ndarray) -> np.ndarray:
+        """키 배열의 행 위치를 일괄 조회한다 (없는 날짜는 -1).
+
+        Args:
+            keys: int64 날짜 키 배열
+
+        Returns:
+            int64 행 위치 배열 (keys와 같은 shape)
+        """
+        if len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        offsets = keys - self.keys[0]
+        inside = (offsets >= 0) & (offsets < len(self.lookup))
+        result = np.full(len(keys), -1, dtype=np.int64)
+        result[inside] = self.lookup[offsets[inside]]
+        return result
+
+    def get_position(self, day: date) -> int | None:
+        """날짜의 행 위치를 반환한다 (없으면 None).
+
+        Args:
+            day: 조회할 날짜
+
+        Returns:
+            행 위치 또는 None
+        """
+        if len(self.keys) == 0:
+            return None
+        offset = (day.toordinal() - _EPOCH_ORDINAL) - int(self.keys[0])
+        if offset < 0 or offset >= len(self.lookup):
+            return None
+        position = int(self.lookup[offset])
+        return position if position >= 0 else None
+
+
+# ============================================================================
+# 공통 기간 정렬
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class AlignedPanel:
+    """여러 자산 DataFrame의 공통 거래일과 자산별 행 위치.
+
+    Attributes:
+        index: 공통 거래일 DateIndex
+        rows: {이름: 원본 DataFrame에서 공통 거래일의 행 위치 (index 순서)}
+    """
+
+    index: DateIndex
+    rows: Mapping[str, np.ndarray]
+
+    def take(self, name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """정렬에 사용한 DataFrame을 공통 기간으로 잘라 반환한다 (reset_index 완료).
+
+        Args:
+            name: align_frames에 전달한 이름
+            df: 해당 이름의 원본 DataFrame
+
+        Returns:
+            공통 기간 DataFrame
+        """
+        return df.iloc[self.rows[name]].reset_index(drop=True)
+
+    def reindex(self, df: pd.DataFrame) -> pd.DataFrame:
+        """정렬에 참여하지 않은 DataFrame(예: 시그널 데이터)을 공통 기간으로 잘라 반환한다.
+
+        공통 거래일 밖의 행은 버린다. 공통 거래일 중 없는 날짜가 있으면 행 정렬이 깨지므로 예외를 던진다.
+
+        Args:
+            df: Date 컬럼을 가진 DataFrame (오름차순, 중복 없음)
+
+        Returns:
+            공통 기간 DataFrame (reset_index 완료, 행 수 = len(index))
+
+        Raises:
+            ValueError: df에 공통 거래일 일부가 없거나 날짜가 정렬되어 있지 않은 경우
+        """
+        rows = DateIndex.from_frame(df).positions(self.index.keys)
+        if (rows < 0).any():
+            missing = key_to_date(int(self.index.keys[int(np.argmax(rows < 0))]))
+            raise ValueError(f"공통 거래일 {missing} 이(가) DataFrame에 없습니다")
+        return df.iloc[rows].reset_index(drop=True)
+
+
+def align_frames(frames: Mapping[str, pd.DataFrame]) -> AlignedPanel:
+    """DataFrame들의 공통 거래일을 정렬 병합으로 구하고 자산별 행 위치를 계산한다.
+
+    Args:
+        frames: {이름: Date 컬럼을 가진 DataFrame} (각 Date 오름차순, 중복 없음)
+
+    Returns:
+        AlignedPanel
+
+    Raises:
+        ValueError: frames가 비어 있거나, 공통 거래일이 없거나, 날짜가 정렬되어 있지 않은 경우
+    """
+    if not frames:
+        raise ValueError("정렬할 DataFrame이 없습니다")
+
+    indexes = {name: DateIndex.from_frame(df) for name, df in frames.items()}
+    common = reduce(
+        lambda left, right: np.intersect1d(left, right, assume_unique=True),
+        (index.keys for index in indexes.values()),
+    )
+    if len(common) == 0:
+        raise ValueError("전 자산의 공통 거래 기간이 없습니다.")
+
+    rows = {name: index.positions(common) for name, index in indexes.items()}
+    return AlignedPanel(index=DateIndex.from_keys(common), rows=rows)
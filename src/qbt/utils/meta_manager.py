@@ -132,3 +132,30 @@ def save_metadata(csv_type: str, metadata: MetaDict) -> None:
     META_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
     with META_JSON_PATH.open("w", encoding="utf-8") as f:
         json.dump(full_meta, f, indent=2, ensure_ascii=False)
+
+
+def get_latest_timestamp(csv_types: list[str] | tuple[str, ...]) -> datetime | None:
+    """
+    지정한 타입들의 가장 최근 실행 타임스탬프를 반환한다.
+
+    결과 캐시처럼 "입력 데이터가 마지막으로 갱신된 시점"이 필요한 곳에서 사용한다.
+    각 타입의 이력은 최신순으로 저장되므로 첫 항목만 비교한다.
+
+    Args:
+        csv_types: 조회할 CSV 타입 식별자 목록
+
+    Returns:
+        가장 최근 타임스탬프 (해당 타입 이력이 하나도 없으면 None)
+    """
+    full_meta = _load_full_metadata()
+
+    latest: datetime | None = None
+    for csv_type in csv_types:
+        history = full_meta.get(csv_type, [])
+        if not history or "timestamp" not in history[0]:
+            continue
+        ts = datetime.fromisoformat(history[0]["timestamp"])
+        if latest is None or ts > latest:
+            latest = ts
+
+    return latest
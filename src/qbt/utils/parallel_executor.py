@@ -7,14 +7,28 @@ ProcessPoolExecutor를 사용하여 CPU 집약적 작업을 병렬로 실행한
 2. ProcessPoolExecutor: 멀티프로세싱 기반 병렬 실행 (CPU 집약적 작업용)
 3. Future 객체: 비동기 작업의 결과를 나타내는 객체
 4. pickle: Python 객체를 직렬화하여 프로세스 간 전달
+5. 공유 메모리: 큰 DataFrame은 pickle 대신 shared_frames로 1회 게시하여 워커가 복사 없이 읽음
+6. 묶음 제출(chunking): 짧은 작업 여러 개를 한 번에 제출하여 작업당 Future/pickle 오버헤드를 줄임
 """
 
+import math
 import multiprocessing
-from collections.abc import Callable
-from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from contextlib import AbstractContextManager, nullcontext
+from types import TracebackType
 from typing import Any
 
+import pandas as pd
+
 from qbt.utils import get_logger
+from qbt.utils.shared_frames import (
+    SharedDataPlane,
+    SharedFrameSpec,
+    attach_shared_frames,
+    release_attached_segments,
+)
 
 logger = get_logger(__name__)
 
@@ -22,6 +36,19 @@ logger = get_logger(__name__)
 # 병렬 실행 시 큰 DataFrame을 작업마다 전달하지 않고, 워커당 1회만 세팅
 WORKER_CACHE: dict[str, Any] = {}
 
+# WorkerPool 작업이 마지막으로 동기화한 캐시 세대 (워커 프로세스 전역)
+# 작업에 실린 세대 번호와 다를 때만 WORKER_CACHE를 다시 구성한다
+_worker_cache_generation: int = -1
+
+# max_workers 미지정 시 기본 워커 수
+DEFAULT_MAX_WORKERS = 2
+
+# 자동 묶음 크기 결정 기준
+# - TARGET_CHUNK_SECONDS: 묶음 1개의 목표 실행 시간 (제출/pickle 오버헤드를 상각할 만큼 길게)
+# - MIN_CHUNKS_PER_WORKER: 워커당 최소 묶음 수 (느린 작업이 한 워커에 몰리지 않도록)
+TARGET_CHUNK_SECONDS = 0.05
+MIN_CHUNKS_PER_WORKER = 4
+
 
 def init_worker_cache(cache_payload: dict[str, Any]) -> None:
     """
@@ -70,6 +97,31 @@ def init_worker_cache(cache_payload: dict[str, Any]) -> None:
     WORKER_CACHE.update(cache_payload)
 
 
+def init_worker_shared(
+    spec: dict[str, SharedFrameSpec],
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> None:
+    """
+    공유 메모리 DataFrame을 WORKER_CACHE에 연결하는 워커 초기화 함수.
+
+    execute_parallel(shared_frames=...)가 내부에서 initializer로 사용한다.
+    사용자 initializer를 먼저 실행한 뒤(init_worker_cache는 캐시를 clear하므로),
+    공유 메모리에 게시된 DataFrame들을 같은 키로 WORKER_CACHE에 추가한다.
+
+    Args:
+        spec: SharedDataPlane.spec (세그먼트 이름과 컬럼 메타데이터만 담긴 작은 객체)
+        initializer: 추가로 실행할 사용자 initializer (None이면 생략)
+        initargs: 사용자 initializer 인자
+
+    Note:
+        - 공유 DataFrame의 숫자 컬럼은 읽기 전용 뷰이므로 수정하려면 .copy()가 필요함
+    """
+    if initializer is not None:
+        initializer(*initargs)
+    WORKER_CACHE.update(attach_shared_frames(spec))
+
+
 def _unwrap_kwargs(args: tuple[Callable[..., Any], dict[str, Any]]) -> Any:
     """
     (함수, kwargs 딕셔너리) 튜플을 받아 함수를 호출한다.
@@ -129,6 +181,160 @@ def _should_log_progress(
     return (False, current_percentage)
 
 
+def _validate_chunk_size(chunk_size: int | None) -> None:
+    """
+    chunk_size 인자를 검증한다.
+
+    Raises:
+        ValueError: chunk_size가 1 미만일 때
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size는 1 이상이어야 합니다: {chunk_size}")
+
+
+def _run_chunk(args: tuple[Callable[..., Any], list[Any]]) -> tuple[list[Any], float]:
+    """
+    입력 묶음(chunk)을 워커에서 순차 실행하고 결과와 소요 시간을 반환한다.
+
+    작업마다 Future를 만들지 않고 묶음 단위로 제출하여 pickle/Future 관리 비용을 줄인다.
+    같은 func는 묶음 안에서 한 번만 pickle된다 (pickle은 동일 객체 참조를 재사용).
+
+    Args:
+        args: (func, 입력 리스트) 튜플
+
+    Returns:
+        (입력 순서대로의 결과 리스트, 워커 측 실행 시간(초)) 튜플
+    """
+    func, chunk = args
+    start = time.perf_counter()
+    results = [func(input_data) for input_data in chunk]
+    return results, time.perf_counter() - start
+
+
+def _choose_chunk_size(task_seconds: float, remaining: int, max_workers: int) -> int:
+    """
+    측정된 작업당 소요 시간과 워커 수로 묶음 크기를 결정한다.
+
+    1. 묶음 1개가 약 TARGET_CHUNK_SECONDS 동안 실행되도록 크기를 키운다 (제출 오버헤드 상각)
+    2. 단, 워커당 최소 MIN_CHUNKS_PER_WORKER개 묶음이 돌아가도록 상한을 둔다 (부하 분산)
+
+    Args:
+        task_seconds: 작업 1개의 평균 소요 시간 (초)
+        remaining: 남은 작업 수
+        max_workers: 워커 수
+
+    Returns:
+        묶음 크기 (1 이상)
+    """
+    if remaining <= 0:
+        return 1
+
+    # 부하 분산 상한: 남은 작업을 워커당 MIN_CHUNKS_PER_WORKER개 이상으로 나눌 수 있는 크기
+    balance_cap = max(1, math.ceil(remaining / (max_workers * MIN_CHUNKS_PER_WORKER)))
+    if task_seconds <= 0:
+        return balance_cap
+
+    latency_size = max(1, int(TARGET_CHUNK_SECONDS / task_seconds))
+    return min(latency_size, balance_cap)
+
+
+def _collect_in_order(
+    executor: ProcessPoolExecutor,
+    func: Callable[..., Any],
+    inputs: list[Any],
+    log_progress: bool,
+    max_workers: int,
+    chunk_size: int | None = None,
+) -> list[Any]:
+    """
+    실행기에 작업을 묶음 단위로 제출하고 입력 순서대로 정렬된 결과를 반환한다.
+
+    execute_parallel(호출마다 새 풀)과 WorkerPool(재사용 풀)이 공유하는 수집 루프이다.
+
+    묶음 크기 결정:
+        - chunk_size 지정 시 고정 크기 사용
+        - None이면 먼저 워커 수만큼 작업을 1개씩 제출하고, 가장 먼저 끝난 작업의 소요 시간으로
+          _choose_chunk_size()가 정한 크기로 나머지 작업을 곧바로 묶어 제출한다
+          (나머지 측정 작업을 기다리지 않으므로 느린 작업 하나 때문에 워커가 놀지 않는다)
+
+    Args:
+        executor: 작업을 실행할 ProcessPoolExecutor
+        func: 실행할 함수 (단일 인자)
+        inputs: 입력 리스트
+        log_progress: 진행도 로깅 출력 여부
+        max_workers: 실행기의 워커 수 (자동 묶음 크기 계산용)
+        chunk_size: 고정 묶음 크기 (None이면 자동)
+
+    Returns:
+        입력 순서대로 정렬된 결과 리스트
+    """
+    total = len(inputs)
+    # 입력 위치에 결과를 직접 기록하여 순서를 복원 (묶음 단위로 채워짐)
+    results: list[Any] = [None] * total
+    completed_count = 0
+    last_logged_percentage = 0
+    task_seconds_sum = 0.0
+    measured_tasks = 0
+
+    # Future → (시작 인덱스, 묶음 길이)
+    future_to_range: dict[Future[Any], tuple[int, int]] = {}
+
+    def _submit_range(start: int, count: int) -> Future[Any]:
+        # executor.submit(func, input_data): 작업 제출하고 Future 객체 반환
+        future = executor.submit(_run_chunk, (func, inputs[start : start + count]))
+        future_to_range[future] = (start, count)
+        return future
+
+    def _record(future: Future[Any]) -> None:
+        nonlocal completed_count, last_logged_percentage, task_seconds_sum, measured_tasks
+        start, count = future_to_range[future]
+        try:
+            # future.result(): 작업의 실제 결과 가져오기 (완료될 때까지 대기)
+            chunk_results, elapsed = future.result()
+        except Exception as e:
+            logger.debug(f"작업 {start + 1}~{start + count}/{total} 실패: {e}")
+            # 남은 작업은 취소하여 재사용 풀이 실패한 호출의 작업을 계속 처리하지 않도록 한다
+            for pending in future_to_range:
+                pending.cancel()
+            raise
+
+        results[start : start + count] = chunk_results
+        completed_count += count
+        task_seconds_sum += elapsed
+        measured_tasks += count
+
+        # 진행도 로깅 (첫 번째, 마지막, 10% 경계마다)
+        if log_progress:
+            should_log, current_pct = _should_log_progress(completed_count, total, last_logged_percentage)
+            if should_log:
+                logger.debug(f"진행도: {completed_count}/{total} ({current_pct}%)")
+                last_logged_percentage = current_pct
+
+    next_index = 0
+    in_flight: list[Future[Any]] = []
+    if chunk_size is None:
+        # 1단계: 워커 수만큼 1개씩 제출하고, 첫 완료 작업으로 작업당 소요 시간 측정
+        probe_count = min(max_workers, total)
+        done, not_done = wait([_submit_range(idx, 1) for idx in range(probe_count)], return_when=FIRST_COMPLETED)
+        for future in done:
+            _record(future)
+        in_flight = list(not_done)
+        next_index = probe_count
+        chunk_size = _choose_chunk_size(task_seconds_sum / measured_tasks, total - next_index, max_workers)
+        if next_index < total:
+            logger.debug(f"자동 묶음 크기: {chunk_size} (작업당 {task_seconds_sum / measured_tasks * 1000:.2f}ms)")
+
+    # 2단계: 나머지 작업을 묶음 단위로 곧바로 제출하고, 아직 실행 중인 측정 작업과 함께 완료되는 대로 수집
+    # as_completed(): 작업이 완료되는 순서대로 Future 객체 반환
+    in_flight.extend(
+        _submit_range(start, min(chunk_size, total - start)) for start in range(next_index, total, chunk_size)
+    )
+    for future in as_completed(in_flight):
+        _record(future)
+
+    return results
+
+
 def execute_parallel(
     func: Callable[..., Any],
     inputs: list[Any],
@@ -136,6 +342,8 @@ def execute_parallel(
     initializer: Callable[..., None] | None = None,
     initargs: tuple[Any, ...] | None = None,
     log_progress: bool = True,
+    shared_frames: dict[str, pd.DataFrame] | None = None,
+    chunk_size: int | None = None,
 ) -> list[Any]:
     """
     CPU 집약적 함수를 여러 입력에 대해 병렬로 실행한다.
@@ -159,12 +367,19 @@ def execute_parallel(
         log_progress: 진행도 로깅 출력 여부 (기본값: True)
             - True: 첫 번째, 마지막, 10% 경계마다 진행도 로그 출력
             - False: 진행도 로그 미출력 (시작/완료 로그는 출력)
+        shared_frames: 워커와 공유할 DataFrame 딕셔너리 (기본값: None)
+            - 키별로 WORKER_CACHE[키]에 읽기 전용 DataFrame으로 노출됨
+            - pickle 대신 공유 메모리로 1회 게시되어 워커 수와 무관하게 메모리 1벌만 사용
+            - 실행이 끝나면(예외 포함) 공유 메모리 세그먼트를 즉시 해제
+        chunk_size: 한 번에 워커로 보낼 작업 묶음 크기 (기본값: None)
+            - None: 워커 수만큼 작업을 먼저 실행해 작업당 소요 시간을 측정한 뒤 자동 결정
+            - 정수: 고정 크기로 묶어서 제출 (짧은 작업이 많을수록 큰 값이 유리)
 
     Returns:
         입력 순서대로 정렬된 결과 리스트
 
     Raises:
-        ValueError: inputs가 비어있을 때
+        ValueError: inputs가 비어있거나, chunk_size가 1 미만이거나, shared_frames에 공유 불가 컬럼이 있을 때
         Exception: 작업 중 발생한 예외 (첫 번째 예외만 전파)
 
     Example:
@@ -183,18 +398,21 @@ def execute_parallel(
     # 1. 입력 검증
     if not inputs:
         raise ValueError("inputs가 비어있습니다")
+    _validate_chunk_size(chunk_size)
 
     # 2. max_workers 기본값 설정
     if max_workers is None:
-        max_workers = 2
+        max_workers = DEFAULT_MAX_WORKERS
 
     logger.debug(f"병렬 실행 시작 - 작업 수: {len(inputs)}, 워커 수: {max_workers}, " f"함수: {func.__module__}.{func.__name__}")
 
     # 3. 병렬 실행
-    # (입력 인덱스, 결과) 쌍을 저장하여 나중에 순서를 복원
-    # 타입 힌트: list[tuple[int, Any]] - (정수, 임의 타입) 튜플의 리스트
-    results_with_index: list[tuple[int, Any]] = []
-    last_logged_percentage = 0
+    # 공유 메모리 게시: 워커에는 세그먼트 이름(spec)만 전달하고, 풀 종료 후 세그먼트를 해제
+    plane_context: AbstractContextManager[Any] = nullcontext()
+    if shared_frames is not None:
+        plane = SharedDataPlane(shared_frames)
+        plane_context = plane
+        initializer, initargs = init_worker_shared, (plane.spec, initializer, initargs or ())
 
     # with 문: ProcessPoolExecutor를 자동으로 종료
     # spawn 컨텍스트 사용: fork() 대신 spawn() 사용하여 멀티스레드 환경에서 안정성 확보
@@ -202,48 +420,13 @@ def execute_parallel(
     # - spawn()은 새 Python 인터프리터를 시작하여 깨끗한 상태로 프로세스 생성
     # - 참고: WSL/Linux에서 기본은 fork(), Windows는 spawn() 사용
     mp_context = multiprocessing.get_context("spawn")
-    with ProcessPoolExecutor(
-        max_workers=max_workers, mp_context=mp_context, initializer=initializer, initargs=initargs or ()
-    ) as executor:
-        # 딕셔너리 컴프리헨션: {key: value for ...}
-        # enumerate(inputs): (0, inputs[0]), (1, inputs[1]), ... 생성
-        # executor.submit(func, input_data): 작업 제출하고 Future 객체 반환
-        # Future 객체를 키로, 인덱스를 값으로 하는 딕셔너리 생성
-        future_to_index: dict[Future[Any], int] = {
-            executor.submit(func, input_data): idx for idx, input_data in enumerate(inputs)
-        }
-
-        # 완료되는 대로 결과 수집
-        # as_completed(): 작업이 완료되는 순서대로 Future 객체 반환
-        for future in as_completed(future_to_index):
-            # 딕셔너리에서 Future에 해당하는 인덱스 가져오기
-            idx = future_to_index[future]
-            try:
-                # future.result(): 작업의 실제 결과 가져오기 (완료될 때까지 대기)
-                result: Any = future.result()
-                # (인덱스, 결과) 튜플로 저장
-                results_with_index.append((idx, result))
-
-                # 진행도 로깅 (첫 번째, 마지막, 10% 경계마다)
-                if log_progress:
-                    completed_count = len(results_with_index)
-                    should_log, current_pct = _should_log_progress(completed_count, len(inputs), last_logged_percentage)
-                    if should_log:
-                        logger.debug(f"진행도: {completed_count}/{len(inputs)} ({current_pct}%)")
-                        last_logged_percentage = current_pct
-
-            except Exception as e:
-                logger.debug(f"작업 {idx + 1}/{len(inputs)} 실패: {e}")
-                raise
-
-    # 4. 입력 순서대로 정렬
-    # .sort(key=...): key 함수의 반환값을 기준으로 정렬
-    # lambda x: x[0]: 튜플의 첫 번째 요소(인덱스)를 기준으로 정렬
-    results_with_index.sort(key=lambda x: x[0])
-
-    # 리스트 컴프리헨션: [표현식 for 변수 in 리스트]
-    # for _, result in results_with_index: 인덱스는 무시하고 결과만 추출
-    results = [result for _, result in results_with_index]
+    with (
+        plane_context,
+        ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context, initializer=initializer, initargs=initargs or ()
+        ) as executor,
+    ):
+        results = _collect_in_order(executor, func, inputs, log_progress, max_workers, chunk_size)
 
     logger.debug(f"병렬 실행 완료 - 총 {len(results)}개 작업 성공")
 
@@ -257,6 +440,8 @@ def execute_parallel_with_kwargs(
     initializer: Callable[..., None] | None = None,
     initargs: tuple[Any, ...] | None = None,
     log_progress: bool = True,
+    shared_frames: dict[str, pd.DataFrame] | None = None,
+    chunk_size: int | None = None,
 ) -> list[Any]:
     """
     CPU 집약적 함수를 여러 입력에 대해 병렬로 실행한다. (키워드 인자 지원)
@@ -273,12 +458,14 @@ def execute_parallel_with_kwargs(
         log_progress: 진행도 로깅 출력 여부 (기본값: True)
             - True: 첫 번째, 마지막, 10% 경계마다 진행도 로그 출력
             - False: 진행도 로그 미출력 (시작/완료 로그는 출력)
+        shared_frames: 워커와 공유할 DataFrame 딕셔너리 (execute_parallel 참고)
+        chunk_size: 작업 묶음 크기 (None이면 자동, execute_parallel 참고)
 
     Returns:
         입력 순서대로 정렬된 결과 리스트
 
     Raises:
-        ValueError: inputs가 비어있을 때
+        ValueError: inputs가 비어있거나, chunk_size가 1 미만이거나, shared_frames에 공유 불가 컬럼이 있을 때
         Exception: 작업 중 발생한 예외 (첫 번째 예외만 전파)
 
     Example:
@@ -298,4 +485,244 @@ def execute_parallel_with_kwargs(
     unwrap_inputs: list[tuple[Callable[..., Any], dict[str, Any]]] = [(func, kwargs_dict) for kwargs_dict in inputs]
 
     # 모듈 레벨 _unwrap_kwargs 함수 사용 (pickle 가능)
-    return execute_parallel(_unwrap_kwargs, unwrap_inputs, max_workers, initializer, initargs, log_progress)
+    return execute_parallel(
+        _unwrap_kwargs, unwrap_inputs, max_workers, initializer, initargs, log_progress, shared_frames, chunk_size
+    )
+
+
+def _sync_worker_cache(generation: int, spec: dict[str, SharedFrameSpec], payload: dict[str, Any]) -> None:
+    """
+    워커의 WORKER_CACHE를 WorkerPool의 현재 캐시 세대와 맞춘다.
+
+    세대가 같으면 아무것도 하지 않으므로 작업마다 호출해도 비용이 거의 없다.
+    세대가 바뀌었으면 이전 공유 메모리 핸들을 닫고 새 세그먼트에 다시 붙는다.
+
+    Args:
+        generation: WorkerPool 캐시 세대 번호
+        spec: 공유 메모리 DataFrame 메타데이터
+        payload: 공유 메모리 외에 함께 전달되는 작은 캐시 값
+    """
+    global _worker_cache_generation
+    if generation == _worker_cache_generation:
+        return
+
+    WORKER_CACHE.clear()
+    release_attached_segments()
+    WORKER_CACHE.update(payload)
+    WORKER_CACHE.update(attach_shared_frames(spec))
+    _worker_cache_generation = generation
+
+
+def _run_pooled_task(
+    args: tuple[int, dict[str, SharedFrameSpec], dict[str, Any], Callable[..., Any], Any],
+) -> Any:
+    """
+    WorkerPool 작업 실행 함수: 캐시 세대를 동기화한 뒤 func(input_data)를 호출한다.
+
+    ProcessPoolExecutor에서 pickle 가능하도록 모듈 레벨에 정의한다.
+
+    Args:
+        args: (세대 번호, 공유 메모리 spec, payload, func, input_data) 튜플
+
+    Returns:
+        함수 호출 결과
+    """
+    generation, spec, payload, func, input_data = args
+    _sync_worker_cache(generation, spec, payload)
+    return func(input_data)
+
+
+class WorkerPool:
+    """
+    스크립트 실행 동안 재사용하는 프로세스 풀.
+
+    execute_parallel은 호출마다 프로세스를 새로 띄우고(spawn + qbt import + 캐시 초기화),
+    반복 호출이 많은 분석 스크립트에서는 이 비용이 누적된다.
+    WorkerPool은 풀을 한 번만 만들고, 캐시 교체는 update_cache()로 수행한다.
+
+    캐시 교체 방식:
+        - update_cache()가 DataFrame을 공유 메모리에 새로 게시하고 세대 번호를 올린다
+        - 작업에는 세대 번호와 세그먼트 이름만 실려 가며, 워커는 세대가 바뀐 첫 작업에서만 다시 붙는다
+        - 이전 세대의 세그먼트는 교체 즉시 해제된다 (워커가 이미 붙은 매핑은 닫을 때까지 유효)
+
+    Example:
+        >>> with WorkerPool(max_workers=4) as pool:
+        ...     for asset_df in asset_dfs:
+        ...         pool.update_cache(shared_frames={"df": asset_df})
+        ...         results = pool.map(worker_func, inputs)
+
+    Note:
+        - func는 WORKER_CACHE에서 캐시를 조회한다 (execute_parallel과 동일한 규약)
+        - payload는 작업마다 함께 pickle되므로 작은 값만 넣고, 큰 데이터는 shared_frames를 사용
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        프로세스 풀을 생성한다.
+
+        Args:
+            max_workers: 최대 워커 수 (None이면 기본값 2)
+
+        Raises:
+            ValueError: max_workers가 1 미만일 때
+        """
+        if max_workers is None:
+            max_workers = DEFAULT_MAX_WORKERS
+        if max_workers < 1:
+            raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._plane: SharedDataPlane | None = None
+        self._spec: dict[str, SharedFrameSpec] = {}
+        self._payload: dict[str, Any] = {}
+        self._generation = 0
+
+    def update_cache(
+        self,
+        shared_frames: dict[str, pd.DataFrame] | None = None,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        워커 캐시를 교체한다. 다음 map() 작업부터 새 캐시가 적용된다.
+
+        Args:
+            shared_frames: 공유 메모리로 게시할 DataFrame 딕셔너리 (WORKER_CACHE[키]로 노출)
+            payload: 함께 전달할 작은 캐시 값 딕셔너리
+
+        Raises:
+            ValueError: shared_frames에 공유 불가 컬럼이 있을 때
+        """
+        new_plane = SharedDataPlane(shared_frames) if shared_frames else None
+
+        old_plane = self._plane
+        self._plane = new_plane
+        self._spec = new_plane.spec if new_plane is not None else {}
+        self._payload = dict(payload or {})
+        self._generation += 1
+
+        if old_plane is not None:
+            old_plane.close()
+
+    def map(
+        self, func: Callable[..., Any], inputs: list[Any], log_progress: bool = True, chunk_size: int | None = None
+    ) -> list[Any]:
+        """
+        재사용 풀에서 func를 병렬 실행하고 입력 순서대로 결과를 반환한다.
+
+        Args:
+            func: 실행할 함수 (단일 인자, pickle 가능)
+            inputs: 입력 리스트
+            log_progress: 진행도 로깅 출력 여부
+            chunk_size: 작업 묶음 크기 (None이면 자동, execute_parallel 참고)
+
+        Returns:
+            입력 순서대로 정렬된 결과 리스트
+
+        Raises:
+            ValueError: inputs가 비어있거나 chunk_size가 1 미만일 때
+            RuntimeError: shutdown() 이후 호출한 경우
+            Exception: 작업 중 발생한 예외 (첫 번째 예외만 전파)
+        """
+        if not inputs:
+            raise ValueError("inputs가 비어있습니다")
+        _validate_chunk_size(chunk_size)
+        if self._executor is None:
+            raise RuntimeError("이미 종료된 WorkerPool입니다")
+
+        logger.debug(
+            f"풀 병렬 실행 시작 - 작업 수: {len(inputs)}, 워커 수: {self.max_workers}, 함수: {func.__module__}.{func.__name__}"
+        )
+
+        # 같은 묶음 안의 spec/payload/func는 동일 객체이므로 pickle 시 1회만 직렬화된다
+        wrapped_inputs = [(self._generation, self._spec, self._payload, func, input_data) for input_data in inputs]
+        results = _collect_in_order(
+            self._executor, _run_pooled_task, wrapped_inputs, log_progress, self.max_workers, chunk_size
+        )
+
+        logger.debug(f"풀 병렬 실행 완료 - 총 {len(results)}개 작업 성공")
+        return results
+
+    def map_with_kwargs(
+        self,
+        func: Callable[..., Any],
+        inputs: list[dict[str, Any]],
+        log_progress: bool = True,
+        chunk_size: int | None = None,
+    ) -> list[Any]:
+        """
+        map()의 키워드 인자 버전. 각 입력 딕셔너리를 **kwargs로 전달한다.
+
+        Args:
+            func: 실행할 함수 (키워드 인자, pickle 가능)
+            inputs: 키워드 인자 딕셔너리 리스트
+            log_progress: 진행도 로깅 출력 여부
+            chunk_size: 작업 묶음 크기 (None이면 자동)
+
+        Returns:
+            입력 순서대로 정렬된 결과 리스트
+        """
+        unwrap_inputs: list[tuple[Callable[..., Any], dict[str, Any]]] = [(func, kwargs_dict) for kwargs_dict in inputs]
+        return self.map(_unwrap_kwargs, unwrap_inputs, log_progress, chunk_size)
+
+    def imap_completed(self, func: Callable[..., Any], inputs: list[Any]) -> Iterator[tuple[int, Any]]:
+        """
+        작업을 1개씩 제출하고 완료되는 순서대로 (입력 인덱스, 결과)를 내보낸다.
+
+        작업 하나가 수 초 이상 걸려 묶음 제출이 필요 없고, 호출자가 결과를
+        완료 즉시 처리(파일 저장 등)해야 할 때 사용한다. 순서 복원은 호출자가 인덱스로 수행한다.
+
+        Args:
+            func: 실행할 함수 (단일 인자, pickle 가능)
+            inputs: 입력 리스트
+
+        Yields:
+            (입력 인덱스, 결과) 튜플 (완료 순서)
+
+        Raises:
+            ValueError: inputs가 비어있을 때
+            RuntimeError: shutdown() 이후 호출한 경우
+            Exception: 작업 중 발생한 예외 (남은 작업은 취소 후 첫 번째 예외만 전파)
+        """
+        if not inputs:
+            raise ValueError("inputs가 비어있습니다")
+        if self._executor is None:
+            raise RuntimeError("이미 종료된 WorkerPool입니다")
+
+        future_to_index: dict[Future[Any], int] = {
+            self._executor.submit(
+                _run_pooled_task, (self._generation, self._spec, self._payload, func, input_data)
+            ): idx
+            for idx, input_data in enumerate(inputs)
+        }
+        try:
+            for future in as_completed(future_to_index):
+                yield future_to_index[future], future.result()
+        finally:
+            # 예외 또는 호출자가 순회를 중단한 경우 남은 작업을 취소한다
+            for pending in future_to_index:
+                pending.cancel()
+
+    def shutdown(self) -> None:
+        """
+        워커 프로세스를 종료하고 공유 메모리를 해제한다. 여러 번 호출해도 안전하다.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._plane is not None:
+            self._plane.close()
+            self._plane = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
@@ -0,0 +1,206 @@
+"""공유 메모리 DataFrame 전달 모듈
+
+병렬 워커에 큰 DataFrame을 pickle로 복사하지 않고, 부모 프로세스가 컬럼 배열을
+multiprocessing.shared_memory에 한 번 게시하면 워커가 복사 없이(zero-copy) 붙어서 읽는다.
+
+학습 포인트:
+1. shared_memory.SharedMemory: 프로세스 간에 같은 물리 메모리를 공유하는 버퍼
+2. zero-copy: np.ndarray(buffer=shm.buf)로 공유 버퍼 위에 배열 뷰를 만든다 (복사 없음)
+3. 블록 구성: 연속된 동일 dtype 컬럼을 (컬럼 수, 행 수) 2차원 블록 하나로 저장하여
+   pandas 내부 블록 구조와 맞춘다 (DataFrame 재구성 시 복사 방지)
+4. 결정적 정리: 게시한 부모가 close() + unlink()로 세그먼트를 해제한다 (with 문 권장)
+
+지원 컬럼:
+- 숫자/불리언/datetime64(타임존 없음) 컬럼: 공유 메모리 뷰로 전달 (읽기 전용)
+- datetime.date 객체 컬럼(프로젝트 Date 컬럼 형식): datetime64[ns]로 게시 후 워커에서 date로 복원
+  (object 배열은 공유 불가하므로 이 컬럼만 워커에서 1회 변환 비용 발생)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from multiprocessing import shared_memory
+from types import TracebackType
+
+import numpy as np
+import pandas as pd
+
+# 블록 종류
+_KIND_NUMERIC = "numeric"
+_KIND_DATE = "date"
+
+# 워커 프로세스에서 붙은 세그먼트 핸들 보관소
+# 핸들이 GC되면 버퍼가 닫혀 배열 뷰가 무효화되므로 프로세스 수명 동안 참조를 유지한다
+_ATTACHED_SEGMENTS: list[shared_memory.SharedMemory] = []
+
+
+@dataclass(frozen=True)
+class SharedBlockSpec:
+    """공유 메모리 블록 1개의 메타데이터 (pickle로 워커에 전달되는 부분)."""
+
+    shm_name: str  # SharedMemory 세그먼트 이름
+    columns: tuple[str, ...]  # 블록에 포함된 컬럼 (원본 순서)
+    dtype: str  # 저장된 numpy dtype 문자열
+    n_rows: int  # 행 수
+    kind: str  # "numeric" 또는 "date"
+
+
+@dataclass(frozen=True)
+class SharedFrameSpec:
+    """공유 메모리에 게시된 DataFrame 1개의 메타데이터."""
+
+    blocks: tuple[SharedBlockSpec, ...]  # 원본 컬럼 순서대로 나열된 블록들
+    n_rows: int  # 행 수
+
+
+def _column_layout(series: pd.Series) -> tuple[str, np.dtype]:
+    """컬럼을 공유 메모리로 전달할 방식(kind)과 저장 dtype을 결정한다.
+
+    Raises:
+        ValueError: 공유 메모리로 전달할 수 없는 dtype인 경우
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+        return _KIND_NUMERIC, dtype
+    if pd.api.types.is_object_dtype(dtype) and all(isinstance(v, date) and not isinstance(v, datetime) for v in series):
+        return _KIND_DATE, np.dtype("datetime64[ns]")
+    raise ValueError(f"공유 메모리로 전달할 수 없는 컬럼입니다: {series.name} (dtype={dtype})")
+
+
+def _split_blocks(df: pd.DataFrame) -> list[tuple[str, np.dtype, list[str]]]:
+    """연속된 동일 (kind, dtype) 컬럼을 하나의 블록으로 묶는다.
+
+    원본 컬럼 순서를 보존하면서 블록 수를 최소화한다.
+    """
+    blocks: list[tuple[str, np.dtype, list[str]]] = []
+    for col, series in df.items():
+        kind, dtype = _column_layout(series)
+        if blocks and blocks[-1][0] == kind and blocks[-1][1] == dtype:
+            blocks[-1][2].append(str(col))
+        else:
+            blocks.append((kind, dtype, [str(col)]))
+    return blocks
+
+
+class SharedDataPlane:
+    """부모 프로세스에서 DataFrame들을 공유 메모리에 게시하고 수명을 관리한다.
+
+    with 문으로 사용하면 블록을 벗어날 때 모든 세그먼트가 해제된다.
+    워커는 spec만 전달받아 attach_shared_frames()로 붙는다.
+
+    Example:
+        >>> with SharedDataPlane({"signal_df": signal_df}) as plane:
+        ...     execute_parallel(func, inputs, initializer=init_worker_shared, initargs=(plane.spec,))
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame]) -> None:
+        """DataFrame들을 공유 메모리에 게시한다.
+
+        Args:
+            frames: {캐시 키: DataFrame} 딕셔너리
+
+        Raises:
+            ValueError: 공유 메모리로 전달할 수 없는 컬럼이 있는 경우
+        """
+        self._segments: list[shared_memory.SharedMemory] = []
+        specs: dict[str, SharedFrameSpec] = {}
+        try:
+            for name, df in frames.items():
+                specs[name] = self._publish_frame(df)
+        except BaseException:
+            # 일부만 게시된 상태에서 실패하면 이미 만든 세그먼트를 즉시 해제
+            self.close()
+            raise
+        self.spec: dict[str, SharedFrameSpec] = specs
+
+    def _publish_frame(self, df: pd.DataFrame) -> SharedFrameSpec:
+        n_rows = len(df)
+        block_specs: list[SharedBlockSpec] = []
+        for kind, dtype, columns in _split_blocks(df):
+            if kind == _KIND_DATE:
+                values = pd.to_datetime(df[columns[0]]).to_numpy(dtype="datetime64[ns]")[np.newaxis, :]
+            else:
+                # (행 수, 컬럼 수) → (컬럼 수, 행 수): pandas 블록 레이아웃과 동일
+                values = df[columns].to_numpy(dtype=dtype).T
+
+            # 크기 0 세그먼트는 생성할 수 없으므로 최소 1바이트 확보
+            shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            self._segments.append(shm)
+            target: np.ndarray = np.ndarray(values.shape, dtype=dtype, buffer=shm.buf)
+            target[:] = values
+
+            block_specs.append(
+                SharedBlockSpec(
+                    shm_name=shm.name,
+                    columns=tuple(columns),
+                    dtype=dtype.str,
+                    n_rows=n_rows,
+                    kind=kind,
+                )
+            )
+        return SharedFrameSpec(blocks=tuple(block_specs), n_rows=n_rows)
+
+    def close(self) -> None:
+        """모든 세그먼트를 닫고 해제한다. 여러 번 호출해도 안전하다."""
+        while self._segments:
+            shm = self._segments.pop()
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "SharedDataPlane":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def attach_shared_frames(spec: dict[str, SharedFrameSpec]) -> dict[str, pd.DataFrame]:
+    """게시된 공유 메모리에 붙어 DataFrame들을 재구성한다.
+
+    숫자 컬럼은 공유 버퍼 위의 읽기 전용 뷰이므로 복사 비용이 없고,
+    수정이 필요하면 호출자가 .copy()해야 한다. 인덱스는 RangeIndex로 재구성된다.
+
+    Args:
+        spec: SharedDataPlane.spec
+
+    Returns:
+        {캐시 키: DataFrame} 딕셔너리
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    for name, frame_spec in spec.items():
+        parts: list[pd.DataFrame] = []
+        for block in frame_spec.blocks:
+            shm = shared_memory.SharedMemory(name=block.shm_name)
+            _ATTACHED_SEGMENTS.append(shm)
+            values: np.ndarray = np.ndarray(
+                (len(block.columns), block.n_rows), dtype=np.dtype(block.dtype), buffer=shm.buf
+            )
+            values.flags.writeable = False
+
+            if block.kind == _KIND_DATE:
+                parts.append(pd.DataFrame({block.columns[0]: pd.Series(values[0]).dt.date}))
+            else:
+                parts.append(pd.DataFrame(values.T, columns=pd.Index(block.columns), copy=False))
+
+        if parts:
+            frames[name] = pd.concat(parts, axis=1, copy=False)
+        else:
+            frames[name] = pd.DataFrame(index=pd.RangeIndex(frame_spec.n_rows))
+    return frames
+
+
+def release_attached_segments() -> None:
+    """워커 프로세스에서 붙은 세그먼트 핸들을 닫는다.
+
+    해제(unlink)는 게시한 부모의 책임이므로 여기서는 close만 수행한다.
+    닫은 뒤에는 이전에 재구성한 DataFrame을 사용하면 안 된다.
+    """
+    while _ATTACHED_SEGMENTS:
+        _ATTACHED_SEGMENTS.pop().close()
@@ -14,6 +14,7 @@ import pandas as pd
 import yfinance as yf
 
 from qbt.common_constants import COL_CLOSE, COL_DATE, PRICE_COLUMNS, REQUIRED_COLUMNS, STOCK_DIR
+from qbt.utils.data_loader import write_columnar_cache
 from qbt.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -151,6 +152,8 @@ def download_stock_data(
     # 10. CSV 파일로 저장 (검증 통과 시에만 실행)
     csv_path = output_path / filename
     df.to_csv(csv_path, index=False)
+    # 다음 로딩부터 CSV 파싱을 건너뛰도록 바이너리 컬럼 캐시를 함께 저장
+    write_columnar_cache(csv_path)
 
     # 11. 결과 출력
     logger.debug(f"데이터 저장 완료: {csv_path}")
@@ -8,8 +8,12 @@
 
 from __future__ import annotations
 
+import base64
+import copy
+import hashlib
 from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -53,7 +57,7 @@ class FakeBlob:
     """``google.cloud.storage.Blob`` 의 최소 시뮬레이션.
 
     storage_gateway 가 사용하는 메서드만 흉내낸다: upload_from_filename /
-    download_to_filename / delete / generation. ``if_generation_match`` precondition
+    download_to_filename / delete / generation / md5_hash. ``if_generation_match`` precondition
     위반은 :class:`FakePreconditionError` 를 raise 한다 (실제
     ``google.api_core.exceptions.PreconditionFailed`` 와 동일 위치).
     """
@@ -85,6 +89,8 @@ class FakeBlob:
         if self._data is None:
             raise FakeNotFoundError(f"blob not found: {self.name}")
         Path(filename).write_bytes(self._data)
+        if self._bucket is not None:
+            self._bucket.download_log.append(self.name)
 
     def delete(self) -> None:
         if self._data is None:
@@ -96,6 +102,13 @@ class FakeBlob:
         if self._data is None:
             raise FakeNotFoundError(f"blob not found: {self.name}")
 
+    @property
+    def md5_hash(self) -> str | None:
+        """GCS 와 같은 base64 md5 (blob 이 없으면 None)."""
+        if self._data is None:
+            return None
+        return base64.b64encode(hashlib.md5(self._data).digest()).decode("ascii")
+
     @property
     def exists_in_fake(self) -> bool:
         return self._data is not None
@@ -111,6 +124,8 @@ class FakeBucket:
 
     - ``upload_log``: blob.upload_from_filename 호출 순서를 name 으로 기록.
       live_state.json 마지막 upload 같은 순서 정책 검증에 사용.
+    - ``download_log``: blob.download_to_filename 호출을 name 으로 기록.
+      필요한 blob / 바뀐 blob 만 download 하는지 검증에 사용.
     - ``seed(name, content)``: tracker 를 거치지 않고 blob 데이터를 직접 주입.
       테스트의 'Given' 단계에서 사용.
     """
@@ -119,6 +134,7 @@ class FakeBucket:
         self.name = name
         self._blobs: dict[str, FakeBlob] = {}
         self.upload_log: list[str] = []
+        self.download_log: list[str] = []
 
     def blob(self, name: str) -> FakeBlob:
         if name not in self._blobs:
@@ -132,12 +148,13 @@ class FakeBucket:
         """테스트 헬퍼 — upload_log tracker 를 거치지 않고 blob 을 직접 주입한다.
 
         Given 단계에서 GCS 에 사전 데이터를 심을 때 사용. 실제 ``upload_from_filename``
-        호출과 구분되어 ``upload_log`` 에 기록되지 않는다.
+        호출과 구분되어 ``upload_log`` 에 기록되지 않는다. 같은 blob 에 다시 심으면
+        generation 이 1 증가한다 (외부 갱신 시뮬레이션).
         """
         blob = self.blob(name)
         blob._data = content
         blob.size = len(content)
-        blob.generation = 1
+        blob.generation += 1
         return blob
 
 
@@ -162,3 +179,143 @@ def fake_gcs_bucket(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeBucket]:
 
     monkeypatch.setattr(fa_storage, "bucket", _mock_bucket)
     yield fake
+
+
+# ============================================================================
+# Fake Firebase RTDB — rtdb_gateway 테스트용 in-process 트리 시뮬레이션
+# ============================================================================
+
+
+def _rtdb_parts(path: str) -> list[str]:
+    return [part for part in path.split("/") if part]
+
+
+class FakeRtdbRef:
+    """``firebase_admin.db.Reference`` 의 최소 시뮬레이션 (get / set / update / delete).
+
+    ``update`` 의 키는 reference 기준 상대 경로이며 ``/`` 를 포함하면 multi-path
+    update 로 취급한다. 모든 호출은 :attr:`FakeRtdb.request_log` 에 기록된다.
+    """
+
+    def __init__(self, db: FakeRtdb, path: str) -> None:
+        self._db = db
+        self.path = "/" + "/".join(_rtdb_parts(path))
+
+    def get(self) -> Any:
+        self._db.request_log.append(("get", self.path))
+        return copy.deepcopy(self._db.read(self.path))
+
+    def set(self, value: Any) -> None:
+        self._db.request_log.append(("set", self.path))
+        self._db.write(self.path, value)
+
+    def update(self, value: dict[str, Any]) -> None:
+        self._db.request_log.append(("update", self.path))
+        for key, child in value.items():
+            self._db.write(f"{self.path}/{key}", child)
+
+    def delete(self) -> None:
+        self._db.request_log.append(("delete", self.path))
+        self._db.write(self.path, None)
+
+
+class FakeRtdb:
+    """Firebase RTDB 의 in-process 트리 시뮬레이션.
+
+    실제 RTDB 와 같이 ``None`` / 빈 dict 쓰기는 노드 삭제이며, 자식이 모두 사라진
+    부모 노드도 함께 사라진다. 테스트는 절대 경로를 키로 하는 매핑처럼 직접
+    값을 심고 (``db["/fills/inbox"] = {...}``) 검증한다 (``"/latest/portfolio" in db``).
+    """
+
+    def __init__(self) -> None:
+        self.root: dict[str, Any] = {}
+        self.request_log: list[tuple[str, str]] = []
+
+    def reference(self, path: str) -> FakeRtdbRef:
+        return FakeRtdbRef(self, path)
+
+    def read(self, path: str) -> Any:
+        node: Any = self.root
+        for part in _rtdb_parts(path):
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    def write(self, path: str, value: Any) -> None:
+        parts = _rtdb_parts(path)
+        if not parts:
+            self.root = copy.deepcopy(value) if isinstance(value, dict) else {}
+            return
+        if value is None or value == {}:
+            self._delete(parts)
+            return
+        node = self.root
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {}
+                node[part] = child
+            node = child
+        node[parts[-1]] = copy.deepcopy(value)
+
+    def _delete(self, parts: list[str]) -> None:
+        chain: list[dict[str, Any]] = [self.root]
+        for part in parts[:-1]:
+            child = chain[-1].get(part)
+            if not isinstance(child, dict):
+                return
+            chain.append(child)
+        chain[-1].pop(parts[-1], None)
+        # 비어버린 부모 노드 정리
+        for depth in range(len(chain) - 1, 0, -1):
+            if chain[depth]:
+                break
+            chain[depth - 1].pop(parts[depth - 1], None)
+
+    # ---- 테스트용 매핑 인터페이스 (절대 경로 키) ----
+
+    def __getitem__(self, path: str) -> Any:
+        value = self.read(path)
+        if value is None:
+            raise KeyError(path)
+        return value
+
+    def __setitem__(self, path: str, value: Any) -> None:
+        self.write(path, value)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self.read(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """저장된 모든 노드의 절대 경로를 깊이 우선으로 순회한다."""
+        stack: list[tuple[str, Any]] = [("", self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, child in node.items():
+                path = f"{prefix}/{key}"
+                yield path
+                if isinstance(child, dict):
+                    stack.append((path, child))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FakeRtdb):
+            return self.root == other.root
+        return self.root == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@pytest.fixture
+def fake_rtdb(monkeypatch: pytest.MonkeyPatch) -> FakeRtdb:
+    """``rtdb_gateway._db_reference`` 를 in-process :class:`FakeRtdb` 로 대체한다.
+
+    Returns:
+        :class:`FakeRtdb` 인스턴스. 테스트는 여기에 직접 값을 심거나
+        ``request_log`` 로 RTDB 왕복 횟수를 검증할 수 있다.
+    """
+    from live import rtdb_gateway
+
+    fake = FakeRtdb()
+    monkeypatch.setattr(rtdb_gateway, "_db_reference", lambda app, path: fake.reference(path))
+    return fake
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
@@ -23,8 +24,8 @@ def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """``storage_gateway.state_workspace`` 를 ``tmp_path`` 로 교체하여 state 를 격리한다."""
 
     @contextmanager
-    def fake_state_workspace(*, push_on_success: bool):
-        del push_on_success
+    def fake_state_workspace(*, push_on_success: bool, prefixes: Sequence[str] | None = None):
+        del push_on_success, prefixes
         yield tmp_path
 
     monkeypatch.setattr(cli_module.storage_gateway, "state_workspace", fake_state_workspace)
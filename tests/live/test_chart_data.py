@@ -14,13 +14,11 @@ import pytest
 
 from live import chart_data as chart_data_module
 from live.chart_data import (
+    build_changed_chart_slices,
+    build_changed_equity_slices,
     build_chart_meta,
-    build_chart_meta_and_year_slices,
     build_chart_year_slice,
     build_chart_year_slices,
-    build_equity_meta,
-    build_equity_year_slice,
-    build_equity_year_slices,
 )
 from live.models import ChartMeta, ChartSeries, EquityChartMeta, EquityChartSeries, UserTrade
 
@@ -339,85 +337,114 @@ class TestBuildChartYearSlices:
 
 
 # ============================================================================
-# build_chart_meta_and_year_slices (meta + 연도 슬라이스 통합)
+# build_changed_chart_slices (해시 기반 변경 연도만 게시)
 # ============================================================================
 
 
-class TestBuildChartMetaAndYearSlices:
-    """``build_chart_meta_and_year_slices`` 는 자산 frame 을 1 회 로드하고
-    meta 와 연도 슬라이스를 동시에 빌드한다.
+class TestBuildChangedChartSlices:
+    """``build_changed_chart_slices`` 는 연도별 입력 해시가 바뀐 슬라이스만 만든다."""
 
-    개별 함수 (`build_chart_meta` + `build_chart_year_slices`) 를 따로 호출하면
-    자산 CSV 가 2 번 로드되는데, 본 통합 함수는 정확히 1 번만 로드한다.
-    """
+    def test_first_call_matches_full_builder(self, state_dir_with_csvs: Path):
+        """
+        목적: 해시 원장이 비어 있으면 전체 빌더와 같은 meta / 슬라이스를 돌려준다.
 
-    def test_returns_meta_and_slices_tuple(self, state_dir_with_csvs: Path):
-        """결과는 ``(meta_map, slices_map)`` 튜플."""
-        meta_map, slices_map = build_chart_meta_and_year_slices(state_dir_with_csvs, years=[2025, 2026])
-        assert set(meta_map.keys()) == {"sso", "qld", "gld", "tlt"}
-        for meta in meta_map.values():
-            assert isinstance(meta, ChartMeta)
-        assert set(slices_map.keys()) == {2025, 2026}
-
-    def test_results_match_individual_functions(self, state_dir_with_csvs: Path):
-        """통합 함수 결과는 개별 함수 결과와 동일 (회귀 보호)."""
-        # 개별 함수
-        single_meta = build_chart_meta(state_dir_with_csvs)
-        single_slices = build_chart_year_slices(state_dir_with_csvs, years=[2025, 2026])
-        # 통합 함수
-        meta_map, slices_map = build_chart_meta_and_year_slices(state_dir_with_csvs, years=[2025, 2026])
-
-        # meta 동등성
-        for asset_id in single_meta:
-            assert meta_map[asset_id].first_date == single_meta[asset_id].first_date
-            assert meta_map[asset_id].last_date == single_meta[asset_id].last_date
-            assert meta_map[asset_id].ma_window == single_meta[asset_id].ma_window
-            assert meta_map[asset_id].years == single_meta[asset_id].years
-
-        # slices 동등성
-        for year in [2025, 2026]:
-            for asset_id in single_slices[year]:
-                a = single_slices[year][asset_id]
-                b = slices_map[year][asset_id]
-                assert a.dates == b.dates
-                assert a.close == b.close
-                assert a.ma_value == b.ma_value
+        Given: 2025 / 2026 두 연도 CSV, 빈 previous_hashes.
+        When:  build_changed_chart_slices 와 build_chart_meta / build_chart_year_slices 호출.
+        Then:  meta 와 모든 (연도, 자산) 슬라이스가 동일, 해시는 자산별 두 연도.
+        """
+        expected_meta = build_chart_meta(state_dir_with_csvs)
+        expected_slices = build_chart_year_slices(state_dir_with_csvs, years=[2025, 2026])
 
-    def test_loads_each_asset_frame_only_once(self, state_dir_with_csvs: Path, monkeypatch: pytest.MonkeyPatch):
+        meta_map, slices_map, hashes = build_changed_chart_slices(state_dir_with_csvs, {})
+
+        assert meta_map == expected_meta
+        assert slices_map == expected_slices
+        assert {asset_id: sorted(h) for asset_id, h in hashes.items()} == {
+            asset_id: [2025, 2026] for asset_id in expected_meta
+        }
+
+    def test_unchanged_inputs_return_no_slices(self, state_dir_with_csvs: Path):
+        """같은 입력으로 다시 호출하면 바뀐 슬라이스가 없고 해시도 같다."""
+        _, _, hashes = build_changed_chart_slices(state_dir_with_csvs, {})
+
+        meta_map, slices_map, next_hashes = build_changed_chart_slices(state_dir_with_csvs, hashes)
+
+        assert len(meta_map) == 4
+        assert slices_map == {}
+        assert next_hashes == hashes
+
+    def test_loads_each_asset_csv_only_once(self, state_dir_with_csvs: Path, monkeypatch: pytest.MonkeyPatch):
         """
-        목적: 통합 함수는 자산 frame 을 자산당 정확히 1 회만 로드한다.
+        목적: 자산 CSV 를 연도 수와 무관하게 자산당 정확히 1 회만 로드한다.
 
-        Given: 4 자산 × 5 연도 슬라이스 입력.
-        When:  build_chart_meta_and_year_slices 호출.
-        Then:  ``_load_slot_frame`` 호출이 자산 수와 같음 (= 4). 연도 수와 무관.
+        Given: 4 자산 × 2 연도 CSV, 빈 previous_hashes (모든 슬라이스 빌드).
+        When:  build_changed_chart_slices 호출.
+        Then:  ``_load_slot_csv`` 호출이 자산 수와 같음 (= 4).
         """
         load_count = {"n": 0}
-        original = chart_data_module._load_slot_frame
+        original = chart_data_module._load_slot_csv
 
         def _spy(state_dir, slot):  # noqa: ANN001, ANN202
             load_count["n"] += 1
             return original(state_dir, slot)
 
-        monkeypatch.setattr(chart_data_module, "_load_slot_frame", _spy)
+        monkeypatch.setattr(chart_data_module, "_load_slot_csv", _spy)
 
-        build_chart_meta_and_year_slices(state_dir_with_csvs, years=[2025, 2026, 2099, 2100, 2101])
+        build_changed_chart_slices(state_dir_with_csvs, {})
 
-        assert load_count["n"] == 4, f"_load_slot_frame 이 {load_count['n']} 회 호출됨 (예상: 4)"
+        assert load_count["n"] == 4, f"_load_slot_csv 가 {load_count['n']} 회 호출됨 (예상: 4)"
 
-    def test_years_none_uses_meta_years_union(self, state_dir_with_csvs: Path):
-        """``years=None`` → 자산별 meta.years 의 합집합 자동 사용."""
-        meta_map, slices_map = build_chart_meta_and_year_slices(state_dir_with_csvs, years=None)
-        # 모든 자산의 years 합집합과 slices_map.keys() 가 일치해야 한다.
-        union = set()
-        for meta in meta_map.values():
-            union.update(meta.years)
-        assert set(slices_map.keys()) == union
+    def test_appended_row_changes_only_current_year(self, state_dir_with_csvs: Path):
+        """
+        목적: 평상시 run-daily (마지막 연도에 1 행 append) 는 그 연도만 다시 게시한다.
 
-    def test_empty_years_returns_meta_only(self, state_dir_with_csvs: Path):
-        """``years=[]`` → meta 만 만들고 slices 는 빈 dict."""
-        meta_map, slices_map = build_chart_meta_and_year_slices(state_dir_with_csvs, years=[])
-        assert len(meta_map) == 4
-        assert slices_map == {}
+        Given: 게시된 해시 + 모든 자산 CSV 에 다음 날 1 행 추가.
+        When:  build_changed_chart_slices(previous=게시 해시).
+        Then:  slices_map 은 2026 만, 내용은 전체 빌더 결과와 동일.
+        """
+        _, _, hashes = build_changed_chart_slices(state_dir_with_csvs, {})
+        for ticker, base in (("SSO", 80.0), ("QLD", 85.0), ("GLD", 180.0), ("TLT", 95.0)):
+            _make_trade_csv(state_dir_with_csvs / "data" / "stock" / f"{ticker}.csv", base, _FIXTURE_DAYS + 1)
+
+        _, slices_map, next_hashes = build_changed_chart_slices(state_dir_with_csvs, hashes)
+
+        expected_slices = build_chart_year_slices(state_dir_with_csvs, years=[2026])
+        assert slices_map == expected_slices
+        for asset_id in hashes:
+            assert next_hashes[asset_id][2025] == hashes[asset_id][2025]
+            assert next_hashes[asset_id][2026] != hashes[asset_id][2026]
+
+    def test_past_close_rewrite_changes_that_and_later_years(self, state_dir_with_csvs: Path):
+        """과거 종가 수정은 MA 가 이어지므로 해당 연도와 이후 연도를 모두 다시 게시한다."""
+        _, _, hashes = build_changed_chart_slices(state_dir_with_csvs, {})
+        path = state_dir_with_csvs / "data" / "stock" / "SSO.csv"
+        df = pd.read_csv(path)
+        df.loc[10, "Close"] = float(df.loc[10, "Close"]) + 1.0
+        df.to_csv(path, index=False)
+
+        _, slices_map, _ = build_changed_chart_slices(state_dir_with_csvs, hashes)
+
+        assert {year: sorted(assets) for year, assets in slices_map.items()} == {2025: ["sso"], 2026: ["sso"]}
+
+    def test_new_marker_changes_only_its_year(self, state_dir_with_csvs: Path):
+        """2025 사용자 체결 마커가 추가되면 그 자산의 2025 슬라이스만 바뀐다."""
+        _, _, hashes = build_changed_chart_slices(state_dir_with_csvs, {})
+        trades = {"qld": [UserTrade(date="2025-05-02", direction="buy")]}
+
+        _, slices_map, _ = build_changed_chart_slices(state_dir_with_csvs, hashes, user_trades=trades)
+
+        assert list(slices_map) == [2025]
+        assert list(slices_map[2025]) == ["qld"]
+        assert slices_map[2025]["qld"].user_buys
+
+    def test_force_and_years_filter(self, state_dir_with_csvs: Path):
+        """force 는 해시와 무관하게 대상 연도를 모두, years 는 그 연도만 대상으로 한다."""
+        _, _, hashes = build_changed_chart_slices(state_dir_with_csvs, {})
+
+        _, forced, _ = build_changed_chart_slices(state_dir_with_csvs, hashes, years=[2025, 2099], force=True)
+
+        assert list(forced) == [2025]
+        assert len(forced[2025]) == 4
 
 
 # ============================================================================
@@ -503,11 +530,11 @@ def _write_summary_jsonl(state_dir: Path, rows: list[dict[str, object]]) -> None
 class TestBuildEquityMeta:
     def test_meta_reflects_first_last_years(self, tmp_path: Path):
         """
-        목적: build_equity_meta 가 summary.jsonl 의 첫/마지막 날짜와 연도 집합을
-              올바르게 계산한다.
+        목적: build_changed_equity_slices 의 meta 가 summary.jsonl 의 첫/마지막 날짜와
+              연도 집합을 올바르게 계산한다.
 
         Given: 2024-01-02, 2024-12-31, 2025-03-15, 2026-04-10 네 줄짜리 summary.
-        When:  build_equity_meta 호출.
+        When:  build_changed_equity_slices 호출.
         Then:  first_date/last_date 가 각각 시작/끝 날짜, years 오름차순.
         """
         # Given
@@ -520,7 +547,7 @@ class TestBuildEquityMeta:
         _write_summary_jsonl(tmp_path, rows)
 
         # When
-        meta = build_equity_meta(tmp_path)
+        meta, _, _ = build_changed_equity_slices(tmp_path, {})
 
         # Then
         assert isinstance(meta, EquityChartMeta)
@@ -535,7 +562,7 @@ class TestBuildEquityMeta:
         목적: summary.jsonl 이 없을 때 RuntimeError 전파 (내부 불변조건 위반).
         """
         with pytest.raises(RuntimeError, match="내부 불변조건 위반"):
-            build_equity_meta(tmp_path)
+            build_changed_equity_slices(tmp_path, {})
 
     def test_empty_summary_raises_runtime_error(self, tmp_path: Path):
         """
@@ -547,7 +574,7 @@ class TestBuildEquityMeta:
         (history_dir / "summary.jsonl").write_text("", encoding="utf-8")
 
         with pytest.raises(RuntimeError, match="내부 불변조건 위반"):
-            build_equity_meta(tmp_path)
+            build_changed_equity_slices(tmp_path, {})
 
     def test_corrupted_jsonl_raises_runtime_error(self, tmp_path: Path):
         """
@@ -562,16 +589,16 @@ class TestBuildEquityMeta:
         )
 
         with pytest.raises(RuntimeError, match="손상된 JSONL"):
-            build_equity_meta(tmp_path)
+            build_changed_equity_slices(tmp_path, {})
 
 
 class TestBuildEquityYearSlice:
     def test_year_slice_filters_by_year(self, tmp_path: Path):
         """
-        목적: build_equity_year_slice 가 해당 연도의 로우만 포함한다.
+        목적: 연도 슬라이스가 해당 연도의 로우만 포함한다.
 
         Given: 2024 / 2025 / 2026 세 해에 걸친 summary.
-        When:  year=2025 로 호출.
+        When:  years=[2025] 로 build_changed_equity_slices 호출.
         Then:  dates 의 연도가 전부 2025, 갯수 = 입력의 2025 로우 수.
         """
         # Given
@@ -585,7 +612,8 @@ class TestBuildEquityYearSlice:
         _write_summary_jsonl(tmp_path, rows)
 
         # When
-        series = build_equity_year_slice(tmp_path, year=2025)
+        _, slices, _ = build_changed_equity_slices(tmp_path, {}, years=[2025])
+        series = slices[2025]
 
         # Then
         assert isinstance(series, EquityChartSeries)
@@ -602,7 +630,7 @@ class TestBuildEquityYearSlice:
               나타나지 않는다.
 
         Given: 소수점이 있는 equity + GCS 정본 컬럼인 drift_pct (무시 대상).
-        When:  build_equity_year_slice 호출.
+        When:  build_changed_equity_slices 호출.
         Then:  equity 는 정수 값, EquityChartSeries 에 drift_pct 속성 없음.
         """
         # Given — banker's rounding 경계가 아닌 값으로 구성한다.
@@ -623,16 +651,17 @@ class TestBuildEquityYearSlice:
         _write_summary_jsonl(tmp_path, rows)
 
         # When
-        series = build_equity_year_slice(tmp_path, year=2026)
+        _, slices, _ = build_changed_equity_slices(tmp_path, {})
+        series = slices[2026]
 
         # Then — equity 는 정수 (ROUND_CAPITAL=0), drift_pct 시계열은 미포함
         assert series.model_equity == [12_345_679, 12_400_000]
         assert series.actual_equity == [12_300_000, 12_350_002]
         assert not hasattr(series, "drift_pct")
 
-    def test_year_slice_empty_year_returns_empty_series(self, tmp_path: Path):
+    def test_year_without_data_is_skipped(self, tmp_path: Path):
         """
-        목적: 해당 연도에 로우가 없으면 모든 배열이 비어 있다 (에러 없음).
+        목적: 대상 연도에 로우가 없으면 슬라이스도 해시도 만들지 않는다 (에러 없음).
         """
         # Given
         rows = [
@@ -642,48 +671,12 @@ class TestBuildEquityYearSlice:
         _write_summary_jsonl(tmp_path, rows)
 
         # When
-        series = build_equity_year_slice(tmp_path, year=2025)
+        meta, slices, hashes = build_changed_equity_slices(tmp_path, {}, years=[2025])
 
         # Then
-        assert series.dates == []
-        assert series.model_equity == []
-        assert series.actual_equity == []
-        # drift_pct 시계열은 EquityChartSeries 에 포함되지 않는다 (앱 미사용으로 제거).
-        assert not hasattr(series, "drift_pct")
-
-
-class TestBuildEquityYearSlices:
-    """``build_equity_year_slices`` 는 ``summary.jsonl`` 을 1 회 파싱하고 연도별로 필터링한다."""
-
-    def test_returns_dict_keyed_by_year(self, tmp_path: Path):
-        """입력 ``years`` 의 모든 연도가 결과 dict 의 키로 들어간다."""
-        rows = [
-            {"date": "2024-12-31", "model_equity": 10_000_000, "actual_equity": 10_000_000, "drift_pct": 0.0},
-            {"date": "2025-06-15", "model_equity": 10_500_000, "actual_equity": 10_400_000, "drift_pct": 0.0095},
-            {"date": "2026-04-10", "model_equity": 12_000_000, "actual_equity": 12_000_000, "drift_pct": 0.0},
-        ]
-        _write_summary_jsonl(tmp_path, rows)
-
-        result = build_equity_year_slices(tmp_path, years=[2024, 2025, 2026])
-
-        assert set(result.keys()) == {2024, 2025, 2026}
-        for series in result.values():
-            assert isinstance(series, EquityChartSeries)
-
-    def test_single_year_call_matches_single_function(self, tmp_path: Path):
-        """복수 함수의 단일 연도 결과는 단일 함수의 결과와 동일해야 한다."""
-        rows = [
-            {"date": "2025-01-02", "model_equity": 10_100_000, "actual_equity": 10_080_000, "drift_pct": 0.002},
-            {"date": "2025-06-15", "model_equity": 10_500_000, "actual_equity": 10_400_000, "drift_pct": 0.0095},
-        ]
-        _write_summary_jsonl(tmp_path, rows)
-
-        single = build_equity_year_slice(tmp_path, year=2025)
-        batch = build_equity_year_slices(tmp_path, years=[2025])
-
-        assert single.dates == batch[2025].dates
-        assert single.model_equity == batch[2025].model_equity
-        assert single.actual_equity == batch[2025].actual_equity
+        assert meta.years == [2024, 2026]
+        assert slices == {}
+        assert hashes == {}
 
     def test_loads_summary_only_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         """
@@ -705,25 +698,50 @@ class TestBuildEquityYearSlices:
 
         monkeypatch.setattr(chart_data_module, "_load_summary_rows", _spy)
 
-        build_equity_year_slices(tmp_path, years=[2024, 2025, 2026])
+        _, slices, _ = build_changed_equity_slices(tmp_path, {})
 
+        assert sorted(slices) == [2024, 2025, 2026]
         assert load_count["n"] == 1, f"_load_summary_rows 가 {load_count['n']} 회 호출됨 (예상: 1)"
 
-    def test_empty_years_returns_empty_dict(self, tmp_path: Path):
-        """빈 연도 리스트 → 빈 dict (no-op). summary.jsonl 부재여도 에러 없음."""
-        # summary.jsonl 이 없어도 빈 입력은 즉시 빈 dict 반환
-        result = build_equity_year_slices(tmp_path, years=[])
-        assert result == {}
 
-    def test_year_without_data_returns_empty_slice(self, tmp_path: Path):
-        """summary 에 해당 연도가 없으면 빈 슬라이스 반환."""
-        rows = [
-            {"date": "2024-12-31", "model_equity": 10_000_000, "actual_equity": 10_000_000, "drift_pct": 0.0},
-        ]
-        _write_summary_jsonl(tmp_path, rows)
+class TestBuildChangedEquitySlices:
+    """``build_changed_equity_slices`` 는 내용 해시가 바뀐 연도만 돌려준다."""
+
+    _ROWS = [
+        {"date": "2025-06-15", "model_equity": 10_500_000, "actual_equity": 10_400_000, "drift_pct": 0.0095},
+        {"date": "2026-04-10", "model_equity": 12_000_000, "actual_equity": 12_000_000, "drift_pct": 0.0},
+    ]
+
+    def test_only_changed_year_is_returned(self, tmp_path: Path):
+        """
+        목적: 새 summary 행이 추가된 연도만 다시 게시한다.
+
+        Given: 2025 / 2026 summary 로 한 번 게시한 해시.
+        When:  2026 행을 1 줄 추가하고 다시 호출.
+        Then:  첫 호출은 두 연도 전체, 재호출은 2026 만.
+        """
+        _write_summary_jsonl(tmp_path, self._ROWS)
+        meta, slices, hashes = build_changed_equity_slices(tmp_path, {})
+        assert meta.years == [2025, 2026]
+        assert [series.dates for series in slices.values()] == [["2025-06-15"], ["2026-04-10"]]
+
+        _, unchanged, same_hashes = build_changed_equity_slices(tmp_path, hashes)
+        assert unchanged == {}
+        assert same_hashes == hashes
+
+        extra = {"date": "2026-04-13", "model_equity": 12_100_000, "actual_equity": 12_050_000, "drift_pct": 0.0}
+        _write_summary_jsonl(tmp_path, [*self._ROWS, extra])
+        _, changed, next_hashes = build_changed_equity_slices(tmp_path, hashes)
+
+        assert list(changed) == [2026]
+        assert changed[2026].dates == ["2026-04-10", "2026-04-13"]
+        assert next_hashes[2025] == hashes[2025]
+
+    def test_force_returns_all_target_years(self, tmp_path: Path):
+        """force 는 해시가 같아도 대상 연도를 모두 돌려준다."""
+        _write_summary_jsonl(tmp_path, self._ROWS)
+        _, _, hashes = build_changed_equity_slices(tmp_path, {})
 
-        result = build_equity_year_slices(tmp_path, years=[2025])
+        _, slices, _ = build_changed_equity_slices(tmp_path, hashes, years=[2025], force=True)
 
-        assert result[2025].dates == []
-        assert result[2025].model_equity == []
-        assert result[2025].actual_equity == []
+        assert list(slices) == [2025]
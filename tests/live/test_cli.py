@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
@@ -12,7 +13,7 @@ import pytest
 
 from live import cli as cli_module
 from live.cli import _collect_all_tickers, main
-from live.models import ChartMeta
+from live.models import ChartHashes, ChartMeta
 
 # ============================================================================
 # 공통 fixture
@@ -38,8 +39,8 @@ def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """
 
     @contextmanager
-    def fake_state_workspace(*, push_on_success: bool):
-        del push_on_success
+    def fake_state_workspace(*, push_on_success: bool, prefixes: Sequence[str] | None = None):
+        del push_on_success, prefixes
         yield tmp_path
 
     monkeypatch.setattr(cli_module.storage_gateway, "state_workspace", fake_state_workspace)
@@ -307,7 +308,7 @@ def _install_reset_spies(monkeypatch: pytest.MonkeyPatch) -> dict[str, list[Any]
         "require_rtdb_app": [],
         "delete_all_except_device_tokens": [],
         "rebuild_full_csv": [],
-        "build_chart_meta_and_year_slices": [],
+        "build_changed_chart_slices": [],
         "write_chart_meta": [],
         "write_chart_year_slice": [],
         "write_equity_meta": [],
@@ -349,26 +350,35 @@ def _install_reset_spies(monkeypatch: pytest.MonkeyPatch) -> dict[str, list[Any]
         ),
     }
 
-    def _spy_meta_and_slices(
+    def _spy_changed_slices(
         state_dir: Path,
+        previous_hashes: dict[str, dict[int, str]],
         *,
-        years: list[int] | None,
+        years: list[int] | None = None,
         user_trades: dict[str, Any],
         signal_history: dict[str, Any],
-    ) -> tuple[dict[str, ChartMeta], dict[int, dict[str, Any]]]:
+        force: bool = False,
+    ) -> tuple[dict[str, ChartMeta], dict[int, dict[str, Any]], dict[str, dict[int, str]]]:
         del state_dir
-        calls["build_chart_meta_and_year_slices"].append(
-            {"years": years, "user_trades": user_trades, "signal_history": signal_history}
+        calls["build_changed_chart_slices"].append(
+            {
+                "previous_hashes": previous_hashes,
+                "years": years,
+                "user_trades": user_trades,
+                "signal_history": signal_history,
+                "force": force,
+            }
         )
-        calls["order"].append("build_chart_meta_and_year_slices")
+        calls["order"].append("build_changed_chart_slices")
         # years=None 이면 stub_meta 의 자산별 years 합집합을 자동 사용 (실제 함수와 동일 의미론)
         if years is None:
             target = sorted({y for m in stub_meta.values() for y in m.years})
         else:
             target = list(years)
-        return stub_meta, {y: {} for y in target}
+        hashes = {aid: {y: f"h{y}" for y in m.years} for aid, m in stub_meta.items()}
+        return stub_meta, {y: {} for y in target}, hashes
 
-    monkeypatch.setattr(cli_module, "build_chart_meta_and_year_slices", _spy_meta_and_slices)
+    monkeypatch.setattr(cli_module, "build_changed_chart_slices", _spy_changed_slices)
 
     def _spy_write_meta(app: Any, m: Any) -> None:
         del app
@@ -499,7 +509,7 @@ class TestCmdReset:
     def test_reset_price_chart_markers_are_empty(self, state_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Given reset 경로 When 차트 빌더 호출 Then user_trades / signal_history 는 빈 dict.
 
-        N+1 회피 + meta/slices 통합으로 build_chart_meta_and_year_slices 가
+        N+1 회피 + meta/slices 통합으로 build_changed_chart_slices 가
         **정확히 1 회만** 호출되어야 한다 (자산 frame 1 회 로드 보장).
         """
         del state_dir
@@ -509,12 +519,31 @@ class TestCmdReset:
         assert exit_code == 0
 
         # 통합 빌더는 정확히 1 회 호출되어야 한다.
-        assert len(calls["build_chart_meta_and_year_slices"]) == 1
-        args = calls["build_chart_meta_and_year_slices"][0]
+        assert len(calls["build_changed_chart_slices"]) == 1
+        args = calls["build_changed_chart_slices"][0]
         assert args["user_trades"] == {}
         assert args["signal_history"] == {}
         # reset 은 자산 frame 1 회 로드 + 자동 years 합집합을 위해 years=None 으로 호출한다.
         assert args["years"] is None
+        # RTDB 를 비운 직후이므로 이전 해시를 무시하고 전체 연도를 다시 쓴다.
+        assert args["force"] is True
+        assert args["previous_hashes"] == {}
+
+    def test_reset_records_chart_hashes(self, state_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Given reset 성공 경로 When 실행 Then 게시한 주가 슬라이스 해시가 chart_hashes.json 에 기록되고
+        equity 해시는 비워진다 (summary.jsonl 삭제).
+        """
+        from live.state import load_chart_hashes, save_chart_hashes
+
+        save_chart_hashes(ChartHashes(equity={2025: "old"}), state_dir / "chart_hashes.json")
+        _install_reset_spies(monkeypatch)
+
+        exit_code = main(["reset", "--capital", "100000000"])
+
+        assert exit_code == 0
+        hashes = load_chart_hashes(state_dir / "chart_hashes.json")
+        assert hashes.prices == {"sso": {2024: "h2024", 2025: "h2025"}}
+        assert hashes.equity == {}
 
     def test_reset_is_idempotent_when_rtdb_write_fails_midway(
         self, state_dir: Path, monkeypatch: pytest.MonkeyPatch
@@ -741,14 +770,14 @@ class TestCmdRunDailySuccess:
         self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
         """
-        목적: ``_publish_to_rtdb`` 가 주가 / equity 차트의 meta + 현재 연도 슬라이스를
-              모두 호출한다.
+        목적: ``_publish_to_rtdb`` 가 주가 / equity 차트의 meta + 바뀐 연도 슬라이스를
+              모두 쓰고, 게시 해시를 chart_hashes.json 에 기록한다.
 
-        Given: 빌더와 write 함수들을 스파이로 교체.
+        Given: 빌더와 write 함수들을 스파이로 교체, 이전 해시 원장 존재.
         When:  _publish_to_rtdb 호출.
         Then:  write_chart_meta + write_chart_year_slice + write_equity_meta +
-               write_equity_year_slice 가 호출되며, 연도 슬라이스는 execution_date
-               의 연도로 호출된다.
+               write_equity_year_slice 가 빌더가 돌려준 바뀐 연도로만 호출되며,
+               빌더가 돌려준 해시가 원장에 기록된다.
         """
         # Given
         monkeypatch.setattr(cli_module.rtdb_gateway, "write_read_model", lambda app, state, result: None)
@@ -761,21 +790,29 @@ class TestCmdRunDailySuccess:
         sentinel_equity_meta = object()
         sentinel_equity_year = object()
 
-        # 통합 함수 1 회 호출로 meta + 현재 연도 슬라이스를 모두 받는다 (자산 frame 1 회 로드).
-        meta_and_slices_call_count = {"n": 0}
+        # 이전 게시 해시 — 빌더에 그대로 전달되어야 한다.
+        from live.state import load_chart_hashes, save_chart_hashes
 
-        def _spy_meta_and_slices(state_dir, *, years, user_trades, signal_history):  # noqa: ANN001, ANN202
+        save_chart_hashes(
+            ChartHashes(prices={"sso": {2025: "p2025"}}, equity={2025: "e2025"}), tmp_path / "chart_hashes.json"
+        )
+
+        # 통합 함수 1 회 호출로 meta + 바뀐 연도 슬라이스를 모두 받는다 (자산 frame 1 회 로드).
+        meta_and_slices_calls: list[dict[str, dict[int, str]]] = []
+        equity_previous: list[dict[int, str]] = []
+
+        def _spy_changed_slices(state_dir, previous_hashes, *, user_trades, signal_history):  # noqa: ANN001, ANN202
             del state_dir, user_trades, signal_history
-            meta_and_slices_call_count["n"] += 1
-            return sentinel_meta, {y: sentinel_year_map for y in years}
+            meta_and_slices_calls.append(previous_hashes)
+            return sentinel_meta, {2026: sentinel_year_map}, {"sso": {2025: "p2025", 2026: "p2026"}}
 
-        monkeypatch.setattr(cli_module, "build_chart_meta_and_year_slices", _spy_meta_and_slices)
-        monkeypatch.setattr(cli_module, "build_equity_meta", lambda state_dir: sentinel_equity_meta)
-        monkeypatch.setattr(
-            cli_module,
-            "build_equity_year_slice",
-            lambda state_dir, year: sentinel_equity_year,
-        )
+        def _spy_changed_equity(state_dir, previous_hashes):  # noqa: ANN001, ANN202
+            del state_dir
+            equity_previous.append(previous_hashes)
+            return sentinel_equity_meta, {2026: sentinel_equity_year}, {2025: "e2025", 2026: "e2026"}
+
+        monkeypatch.setattr(cli_module, "build_changed_chart_slices", _spy_changed_slices)
+        monkeypatch.setattr(cli_module, "build_changed_equity_slices", _spy_changed_equity)
 
         meta_calls: list[object] = []
         year_slice_calls: list[tuple[int, object]] = []
@@ -827,13 +864,18 @@ class TestCmdRunDailySuccess:
         # Then — 주가 차트
         assert meta_calls == [sentinel_meta]
         assert year_slice_calls == [(2026, sentinel_year_map)]
-        # 통합 함수는 정확히 1 회만 호출 (자산 frame 1 회 로드 보장).
-        assert meta_and_slices_call_count["n"] == 1
+        # 통합 함수는 정확히 1 회만 호출 (자산 frame 1 회 로드 보장), 이전 해시 전달.
+        assert meta_and_slices_calls == [{"sso": {2025: "p2025"}}]
+        assert equity_previous == [{2025: "e2025"}]
         # Then — equity 차트
         assert equity_meta_calls == [sentinel_equity_meta]
         assert equity_year_calls == [(2026, sentinel_equity_year)]
         # Then — /history/signals/ 미러
         assert history_signals_calls == [("2026-04-14", sentinel_signals)]
+        # Then — 게시 후 해시 원장 갱신
+        hashes = load_chart_hashes(tmp_path / "chart_hashes.json")
+        assert hashes.prices == {"sso": {2025: "p2025", 2026: "p2026"}}
+        assert hashes.equity == {2025: "e2025", 2026: "e2026"}
 
 
 # ============================================================================
@@ -896,12 +938,12 @@ class TestFetchFills:
 class TestCmdBackfillChartYears:
     """``backfill-chart-years`` 수동 CLI 의 계약 테스트.
 
-    정상 경로 / --year 옵션 / --dry-run / --target 옵션 / RTDB 초기화 실패를
-    고정한다.
+    정상 경로 / --year 옵션 / --dry-run / --target 옵션 / 해시 원장 (변경 연도만,
+    --force) / RTDB 초기화 실패를 고정한다.
     """
 
     def _stub_meta(self, years: list[int]) -> dict[str, ChartMeta]:
-        """build_chart_meta 의 반환값을 모사한다 (자산별 ChartMeta)."""
+        """build_changed_chart_slices 의 meta 반환값을 모사한다 (자산별 ChartMeta)."""
         return {
             "sso": ChartMeta(
                 first_date="2013-01-02",
@@ -918,7 +960,7 @@ class TestCmdBackfillChartYears:
         }
 
     def _stub_equity_meta(self, years: list[int]) -> object:
-        """build_equity_meta 의 반환값을 모사한다."""
+        """build_changed_equity_slices 의 meta 반환값을 모사한다."""
         from live.models import EquityChartMeta
 
         return EquityChartMeta(
@@ -940,29 +982,50 @@ class TestCmdBackfillChartYears:
         """
         meta_stub = self._stub_meta(years)
 
-        def _fake_meta_and_slices(
+        def _fake_changed_slices(
             state_dir: Path,
+            previous_hashes: dict[str, dict[int, str]],
             *,
-            years: list[int] | None,
+            years: list[int] | None = None,
             user_trades: object,
             signal_history: object,
-        ) -> tuple[dict[str, ChartMeta], dict[int, dict[str, object]]]:
+            force: bool = False,
+        ) -> tuple[dict[str, ChartMeta], dict[int, dict[str, object]], dict[str, dict[int, str]]]:
             del state_dir, user_trades, signal_history
-            # backfill 은 years=None 으로 호출하여 자동 합집합 사용한다.
-            target = sorted({y for m in meta_stub.values() for y in m.years}) if years is None else list(years)
-            return meta_stub, {y: {"sso": f"sso_{y}", "qld": f"qld_{y}"} for y in target}
+            # 실제 빌더와 같은 의미론: years=None 이면 전체, 해시 "h{y}" 가 이전과 같으면 제외.
+            all_years = sorted({y for m in meta_stub.values() for y in m.years})
+            target = all_years if years is None else [y for y in years if y in all_years]
+            slices: dict[int, dict[str, object]] = {}
+            for y in target:
+                changed = {
+                    aid: f"{aid}_{y}" for aid in meta_stub if force or previous_hashes.get(aid, {}).get(y) != f"h{y}"
+                }
+                if changed:
+                    slices[y] = changed
+            hashes = {aid: {y: f"h{y}" for y in m.years} for aid, m in meta_stub.items()}
+            return meta_stub, slices, hashes
 
-        monkeypatch.setattr(cli_module, "build_chart_meta_and_year_slices", _fake_meta_and_slices)
+        monkeypatch.setattr(cli_module, "build_changed_chart_slices", _fake_changed_slices)
 
         # equity 빌더 스텁
         eq_years = equity_years if equity_years is not None else years
         equity_meta_stub = self._stub_equity_meta(eq_years)
-        monkeypatch.setattr(cli_module, "build_equity_meta", lambda state_dir: equity_meta_stub)
-        monkeypatch.setattr(
-            cli_module,
-            "build_equity_year_slices",
-            lambda state_dir, *, years: {y: f"equity_series_{y}" for y in years},
-        )
+
+        def _fake_changed_equity(
+            state_dir: Path,
+            previous_hashes: dict[int, str],
+            *,
+            years: list[int] | None = None,
+            force: bool = False,
+        ) -> tuple[object, dict[int, object], dict[int, str]]:
+            del state_dir
+            target = list(eq_years) if years is None else [y for y in years if y in eq_years]
+            slices: dict[int, object] = {
+                y: f"equity_series_{y}" for y in target if force or previous_hashes.get(y) != f"e{y}"
+            }
+            return equity_meta_stub, slices, {y: f"e{y}" for y in eq_years}
+
+        monkeypatch.setattr(cli_module, "build_changed_equity_slices", _fake_changed_equity)
 
         price_year_calls: list[tuple[int, object]] = []
         price_meta_calls: list[object] = []
@@ -1130,6 +1193,69 @@ class TestCmdBackfillChartYears:
         # dry-run 출력에 target 표시가 포함된다.
         assert "target=all" in out
 
+    def test_backfill_skips_unchanged_years_and_records_hashes(
+        self,
+        state_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        목적: 해시 원장과 같은 연도는 다시 쓰지 않고, 쓴 뒤 해시 원장을 갱신한다.
+
+        Given: 2024 / 2025 는 이미 게시된 해시, 2026 은 미게시.
+        When:  main(["backfill-chart-years"])
+        Then:  주가 / equity 모두 2026 만 write, meta 는 1 회씩, 원장에 3 연도 해시.
+        """
+        from live.state import load_chart_hashes, save_chart_hashes
+
+        monkeypatch.setattr(cli_module, "_require_rtdb_app", lambda: object())
+        monkeypatch.setattr(cli_module, "_initialize_rtdb_app", lambda: object())
+        save_chart_hashes(
+            ChartHashes(
+                prices={aid: {2024: "h2024", 2025: "h2025"} for aid in ("sso", "qld")},
+                equity={2024: "e2024", 2025: "e2025"},
+            ),
+            state_dir / "chart_hashes.json",
+        )
+
+        price_years, price_meta, equity_years, equity_meta = self._setup_common_mocks(
+            monkeypatch, years=[2024, 2025, 2026]
+        )
+
+        exit_code = main(["backfill-chart-years"])
+        assert exit_code == 0
+        assert [year for year, _ in price_years] == [2026]
+        assert [year for year, _ in equity_years] == [2026]
+        assert len(price_meta) == 1
+        assert len(equity_meta) == 1
+        hashes = load_chart_hashes(state_dir / "chart_hashes.json")
+        assert hashes.prices["sso"] == {2024: "h2024", 2025: "h2025", 2026: "h2026"}
+        assert hashes.equity == {2024: "e2024", 2025: "e2025", 2026: "e2026"}
+
+    def test_backfill_force_rewrites_all_years(
+        self,
+        state_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        목적: --force 는 해시 원장과 무관하게 대상 연도를 모두 다시 쓴다 (RTDB 복구용).
+        """
+        from live.state import save_chart_hashes
+
+        monkeypatch.setattr(cli_module, "_require_rtdb_app", lambda: object())
+        monkeypatch.setattr(cli_module, "_initialize_rtdb_app", lambda: object())
+        save_chart_hashes(
+            ChartHashes(prices={aid: {2024: "h2024", 2025: "h2025"} for aid in ("sso", "qld")}),
+            state_dir / "chart_hashes.json",
+        )
+
+        price_years, _price_meta, _equity_years, _equity_meta = self._setup_common_mocks(
+            monkeypatch, years=[2024, 2025]
+        )
+
+        exit_code = main(["backfill-chart-years", "--target", "prices", "--force"])
+        assert exit_code == 0
+        assert sorted(year for year, _ in price_years) == [2024, 2025]
+
     def test_backfill_rtdb_init_failure_exits_without_notify(
         self,
         state_dir: Path,
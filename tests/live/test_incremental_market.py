@@ -0,0 +1,268 @@
+"""live.incremental_market — 증분 market_bundle 이 전체 재계산과 같은지 검증한다.
+
+원칙:
+- 파일 I/O 격리: tmp_path 에 라이브 포트폴리오 전 티커 CSV 작성
+- 비교 기준: ``_build_market_bundle`` (CSV 전체 로드 + MA 재계산 + 공통 기간 정렬)
+- 부동소수점: EMA 는 비트 단위 일치 (==) 로 검증
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from live.constants import LIVE_MA_FULL_RECOMPUTE_INTERVAL, get_live_portfolio_config, live_csv_path
+from live.daily_runner import run_daily
+from live.data_fetcher import append_today_to_csv, load_csv
+from live.incremental_market import (
+    build_incremental_bundle,
+    find_bundle_mismatches,
+    fold_ema,
+    ma_cache_from_bundle,
+)
+from live.models import MaCache
+from live.state import create_initial_state, save_ma_cache
+from qbt.backtest.analysis import compute_moving_average
+
+# ============================================================================
+# fixture
+# ============================================================================
+
+
+def _weekdays(start: date, count: int) -> list[date]:
+    out: list[date] = []
+    current = start
+    while len(out) < count:
+        if current.weekday() < 5:
+            out.append(current)
+        current += timedelta(days=1)
+    return out
+
+
+def _live_tickers() -> list[str]:
+    from live.cli import _collect_all_tickers
+
+    return _collect_all_tickers()
+
+
+def _write_live_csvs(state_dir: Path, dates: list[date], seed: int = 7) -> dict[str, pd.DataFrame]:
+    """라이브 전 티커 CSV 를 작성하고 {티커: DataFrame} 을 반환한다 (GLD 는 앞쪽 30 일 추가)."""
+    rng = np.random.default_rng(seed)
+    frames: dict[str, pd.DataFrame] = {}
+    for ticker in _live_tickers():
+        ticker_dates = _weekdays(dates[0] - timedelta(days=45), 30) + dates if ticker == "GLD" else dates
+        n = len(ticker_dates)
+        closes = np.round(100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, n)), 2)
+        # 같은 종가가 이어지는 구간 (EMA 점화식의 값 동일 분기)
+        closes[n // 2 : n // 2 + 3] = closes[n // 2]
+        df = pd.DataFrame(
+            {
+                "Date": ticker_dates,
+                "Open": np.round(closes * 0.995, 2),
+                "High": np.round(closes * 1.01, 2),
+                "Low": np.round(closes * 0.99, 2),
+                "Close": closes,
+                "Volume": [1_000_000] * n,
+            }
+        )
+        path = live_csv_path(state_dir, ticker)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False)
+        frames[ticker] = df
+    return frames
+
+
+def _append_rows(state_dir: Path, full_frames: dict[str, pd.DataFrame], days: list[date]) -> dict[str, pd.DataFrame]:
+    """run-daily 처럼 CSV 에 하루씩 append 하고 마지막 append 결과 DataFrame 을 반환한다."""
+    frames: dict[str, pd.DataFrame] = {}
+    for ticker, full in full_frames.items():
+        path = live_csv_path(state_dir, ticker)
+        current = load_csv(path)
+        for day in days:
+            current = append_today_to_csv(path, full[full["Date"] == day], existing_df=current)
+        frames[ticker] = current
+    return frames
+
+
+@pytest.fixture
+def live_dates() -> list[date]:
+    return _weekdays(date(2025, 3, 3), 260)
+
+
+# ============================================================================
+# fold_ema
+# ============================================================================
+
+
+class TestFoldEma:
+    @pytest.mark.parametrize("window", [5, 50, 200])
+    def test_fold_matches_pandas_ewm_bitwise(self, window: int):
+        """
+        목적: 직전 EMA 에 종가를 접은 값이 pandas 전체 재계산과 비트 단위로 같은지 검증
+
+        Given: 같은 값이 이어지는 구간을 포함한 종가 500 개
+        When: 300 번째 EMA 에서 나머지 종가를 fold_ema
+        Then: compute_moving_average(ema) 의 301 번째 이후 값과 == 로 일치
+        """
+        rng = np.random.default_rng(window)
+        closes = np.round(100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, 500)), 2)
+        closes[320:325] = closes[320]
+        full = compute_moving_average(pd.Series(closes), window, "ema").to_numpy()
+
+        folded = fold_ema(float(full[300]), closes[301:], window)
+
+        assert folded == full[301:].tolist()
+
+
+# ============================================================================
+# build_incremental_bundle
+# ============================================================================
+
+
+class TestBuildIncrementalBundle:
+    @pytest.mark.parametrize("missed_days", [0, 3])
+    def test_matches_full_bundle_and_run_daily(self, tmp_path: Path, live_dates: list[date], missed_days: int):
+        """
+        목적: 증분 bundle 로 run_daily 를 돌린 결과가 전체 재계산 bundle 과 같은지 검증
+
+        Given: 전일까지 CSV 로 만든 전체 bundle 의 캐시 (missed_days 만큼 실행을 건너뜀)
+        When: 당일 행 append 후 build_incremental_bundle / _build_market_bundle
+        Then: 마지막 2 행 값과 새 캐시가 일치하고, run_daily 시그널/주문/equity 가 같다
+        """
+        from live.cli import _build_market_bundle
+
+        slots = get_live_portfolio_config().asset_slots
+        history_days = len(live_dates) - 1 - missed_days
+        full_frames = _write_live_csvs(tmp_path, live_dates)
+        for ticker, df in full_frames.items():
+            df.iloc[: len(df) - 1 - missed_days].to_csv(live_csv_path(tmp_path, ticker), index=False)
+        prev_cache = ma_cache_from_bundle(slots, _build_market_bundle(tmp_path))
+        assert all(entry.last_date == live_dates[history_days - 1].isoformat() for entry in prev_cache.entries.values())
+
+        trade_date = live_dates[-1]
+        frames = _append_rows(tmp_path, full_frames, live_dates[history_days:])
+        incremental = build_incremental_bundle(slots, frames, prev_cache, trade_date)
+        full_bundle = _build_market_bundle(tmp_path)
+
+        assert incremental is not None
+        inc_bundle, next_cache = incremental
+        assert find_bundle_mismatches(slots, inc_bundle, full_bundle) == []
+        assert next_cache.entries == ma_cache_from_bundle(slots, full_bundle).entries
+        assert next_cache.runs_since_full == prev_cache.runs_since_full + 1
+
+        results = [
+            run_daily(
+                trade_date=trade_date,
+                state=create_initial_state(100_000_000.0),
+                market_bundle=bundle,
+                pending_fills=[],
+                applied_fill_ids={},
+            )
+            for bundle in (inc_bundle, full_bundle)
+        ]
+        assert results[0].signals == results[1].signals
+        assert results[0].order_intents == results[1].order_intents
+        assert results[0].ma_distances == results[1].ma_distances
+        assert results[0].model_equity == results[1].model_equity
+        assert results[0].rebalance_triggered == results[1].rebalance_triggered
+
+    def test_falls_back_when_preconditions_break(self, tmp_path: Path, live_dates: list[date]):
+        """
+        목적: 증분 전제가 깨지면 None 을 반환하여 전체 경로로 폴백하는지 검증
+
+        Given: 정상 캐시 + 당일 행이 append 된 CSV
+        When: 거래일 불일치 / 캐시 종가 불일치 / 캐시 엔트리 없음 / SMA 슬롯 / 같은 날 재실행
+        Then: 모두 None (정상 조건에서는 bundle 반환)
+        """
+        from live.cli import _build_market_bundle
+
+        slots = get_live_portfolio_config().asset_slots
+        full_frames = _write_live_csvs(tmp_path, live_dates)
+        for ticker, df in full_frames.items():
+            df.iloc[:-1].to_csv(live_csv_path(tmp_path, ticker), index=False)
+        cache = ma_cache_from_bundle(slots, _build_market_bundle(tmp_path))
+        frames = _append_rows(tmp_path, full_frames, live_dates[-1:])
+        trade_date = live_dates[-1]
+        key = next(iter(cache.entries))
+
+        stale_close = MaCache(
+            entries={**cache.entries, key: dataclasses.replace(cache.entries[key], last_close=-1.0)},
+        )
+        missing_entry = MaCache(entries={k: v for k, v in cache.entries.items() if k != key})
+        sma_slots = tuple(dataclasses.replace(slot, ma_type="sma") for slot in slots)
+        same_day_cache = ma_cache_from_bundle(slots, _build_market_bundle(tmp_path))
+
+        assert build_incremental_bundle(slots, frames, cache, trade_date) is not None
+        assert build_incremental_bundle(slots, frames, cache, trade_date + timedelta(days=1)) is None
+        assert build_incremental_bundle(slots, frames, stale_close, trade_date) is None
+        assert build_incremental_bundle(slots, frames, missing_entry, trade_date) is None
+        assert build_incremental_bundle(sma_slots, frames, cache, trade_date) is None
+        assert build_incremental_bundle(slots, frames, same_day_cache, trade_date) is None
+
+
+# ============================================================================
+# run-daily 통합 (_prepare_market_bundle)
+# ============================================================================
+
+
+class TestPrepareMarketBundle:
+    @pytest.mark.parametrize(
+        ("runs_since_full", "expect_incremental"),
+        [(0, True), (LIVE_MA_FULL_RECOMPUTE_INTERVAL - 1, True), (LIVE_MA_FULL_RECOMPUTE_INTERVAL, False)],
+    )
+    def test_periodic_full_recompute(
+        self, tmp_path: Path, live_dates: list[date], runs_since_full: int, expect_incremental: bool
+    ):
+        """
+        목적: 증분 실행이 주기만큼 연속되면 전체 재계산으로 bundle / 캐시를 다시 만드는지 검증
+
+        Given: runs_since_full 이 주기 미만 / 주기 도달인 캐시 파일
+        When: _prepare_market_bundle
+        Then: 주기 미만은 2 행 증분 bundle + 카운터 증가, 주기 도달은 전체 bundle + 카운터 0
+        """
+        from live.cli import _build_market_bundle, _prepare_market_bundle
+
+        slots = get_live_portfolio_config().asset_slots
+        full_frames = _write_live_csvs(tmp_path, live_dates)
+        for ticker, df in full_frames.items():
+            df.iloc[:-1].to_csv(live_csv_path(tmp_path, ticker), index=False)
+        cache = ma_cache_from_bundle(slots, _build_market_bundle(tmp_path))
+        cache_path = tmp_path / "ma_cache.json"
+        save_ma_cache(dataclasses.replace(cache, runs_since_full=runs_since_full), cache_path)
+        frames = _append_rows(tmp_path, full_frames, live_dates[-1:])
+
+        bundle, next_cache = _prepare_market_bundle(tmp_path, frames, cache_path, live_dates[-1])
+
+        lengths = {len(data.trade_df) for data in bundle.values()}
+        if expect_incremental:
+            assert lengths == {2}
+            assert next_cache.runs_since_full == runs_since_full + 1
+        else:
+            assert lengths == {len(live_dates)}
+            assert next_cache.runs_since_full == 0
+        assert next_cache.entries == ma_cache_from_bundle(slots, _build_market_bundle(tmp_path)).entries
+
+    def test_corrupt_cache_falls_back_to_full(self, tmp_path: Path, live_dates: list[date]):
+        """
+        목적: 손상된 ma_cache.json 은 실행을 막지 않고 전체 재계산으로 대체되는지 검증
+
+        Given: 파싱 불가 ma_cache.json
+        When: _prepare_market_bundle
+        Then: 전체 bundle + 새 캐시 (runs_since_full=0)
+        """
+        from live.cli import _prepare_market_bundle
+
+        full_frames = _write_live_csvs(tmp_path, live_dates)
+        cache_path = tmp_path / "ma_cache.json"
+        cache_path.write_text("not json", encoding="utf-8")
+
+        bundle, next_cache = _prepare_market_bundle(tmp_path, full_frames, cache_path, live_dates[-1])
+
+        assert {len(data.trade_df) for data in bundle.values()} == {len(live_dates)}
+        assert next_cache.runs_since_full == 0
+        assert next_cache.entries
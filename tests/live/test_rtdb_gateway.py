@@ -1,12 +1,12 @@
 """live.rtdb_gateway — Firebase Admin SDK mock 기반 테스트.
 
-Firebase 실제 호출 없이 ``firebase_admin.db.reference`` 를 monkeypatch 로 대체하여
-RTDB 진입점 호출 시그니처와 페이로드 구조를 검증한다.
+Firebase 실제 호출 없이 ``firebase_admin.db.reference`` 를 in-process 트리
+(conftest ``FakeRtdb``) 로 대체하여 RTDB 진입점 호출 시그니처와 페이로드 구조,
+RTDB 왕복 횟수를 검증한다.
 """
 
 from __future__ import annotations
 
-from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -26,6 +26,7 @@ from live.models import (
 from live.rtdb_gateway import (
     delete_all_except_device_tokens,
     fetch_pending_balance_adjusts,
+    fetch_pending_inboxes,
     fetch_unprocessed_fills,
     mark_balance_adjusts_processed,
     mark_fills_processed,
@@ -43,61 +44,14 @@ from live.rtdb_gateway import (
 from live.state import create_initial_state
 
 # ============================================================================
-# RefStore — 경로 → mock reference 매핑
+# mock_db — conftest 의 in-process FakeRtdb (절대 경로 → 값 매핑처럼 사용)
 # ============================================================================
 
 
-class _MockRef:
-    """firebase_admin.db.reference 가 반환하는 객체의 mock.
-
-    ``get()`` 은 RTDB 의 계층적 읽기를 느슨하게 흉내낸다:
-
-    1. 정확히 해당 경로에 값이 저장되어 있으면 그 값을 반환.
-    2. 그렇지 않으면 ``{path}/...`` 하위 경로들을 스캔하여 **즉시 자식** 을
-       dict 로 묶어 반환한다. 자식이 하나도 없으면 ``None``.
-
-    실제 Firebase RTDB 의 트리 구조 동작을 단순화한 모방이다.
-    """
-
-    def __init__(self, path: str, store: dict[str, Any]) -> None:
-        self.path = path
-        self.store = store
-
-    def get(self) -> Any:
-        if self.path in self.store:
-            return self.store[self.path]
-        prefix = self.path + "/"
-        children: dict[str, Any] = {}
-        for key, value in self.store.items():
-            if not key.startswith(prefix):
-                continue
-            remainder = key[len(prefix) :]
-            if "/" in remainder:
-                continue
-            children[remainder] = value
-        return children if children else None
-
-    def set(self, value: Any) -> None:
-        self.store[self.path] = value
-
-    def update(self, value: dict[str, Any]) -> None:
-        existing = self.store.get(self.path)
-        if isinstance(existing, dict):
-            existing.update(value)
-            self.store[self.path] = existing
-        else:
-            self.store[self.path] = dict(value)
-
-    def delete(self) -> None:
-        self.store.pop(self.path, None)
-
-
 @pytest.fixture
-def mock_db(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
-    """firebase_admin.db.reference 를 in-memory store 로 대체한다."""
-    store: dict[str, Any] = {}
-    monkeypatch.setattr(rtdb_module, "_db_reference", lambda app, path: _MockRef(path, store))
-    return store
+def mock_db(fake_rtdb):
+    """firebase_admin.db.reference 를 in-process 트리 store 로 대체한다."""
+    return fake_rtdb
 
 
 @pytest.fixture
@@ -1034,3 +988,132 @@ class TestHelpers:
         }
         with pytest.raises(ValueError, match="fill direction 값이 유효하지 않음"):
             _dict_to_actual_fill(bad_fill, rtdb_key="fill_bad_dir")
+
+
+# ============================================================================
+# 배치 쓰기 / 동시 읽기 — RTDB 왕복 횟수 계약
+# ============================================================================
+
+
+class TestBatchedWrites:
+    """여러 경로 쓰기가 키 수와 무관하게 multi-path update 1 회로 묶이는지 검증."""
+
+    def test_mark_processed_is_single_update_and_keeps_fields(self, mock_db, mock_app):
+        """
+        목적: processed 마킹이 키 수와 무관하게 1 회 왕복이며, 다른 필드는 보존되는지 검증.
+
+        Given: inbox 에 fill 3 건
+        When: mark_fills_processed(3 키)
+        Then: update 1 회, processed=True, asset_id 유지
+        """
+        # Given
+        for key in ("f1", "f2", "f3"):
+            mock_db[f"/fills/inbox/{key}"] = {"processed": False, "asset_id": "sso"}
+
+        # When
+        mark_fills_processed(mock_app, ["f1", "f2", "f3"])
+
+        # Then
+        assert mock_db.request_log == [("update", "/")]
+        for key in ("f1", "f2", "f3"):
+            assert mock_db[f"/fills/inbox/{key}"] == {"processed": True, "asset_id": "sso"}
+
+    def test_history_and_chart_writes_are_single_update(self, mock_db, mock_app):
+        """
+        목적: history / chart 쓰기 함수가 각각 RTDB 왕복 1 회인지 검증.
+        """
+        # Given
+        fills = [_make_actual_fill(rtdb_key=f"fill_{i}") for i in range(5)]
+        signal = SignalDetection(
+            state="none", close=1.0, upper_band=None, lower_band=None, ma_value=1.0, ma_distance_pct=0.0
+        )
+
+        # When
+        write_history_fills(mock_app, fills, applied_at="2026-04-11T07:27:15+09:00")
+        write_history_signals(mock_app, execution_date="2026-04-10", signals={"sso": signal, "qld": signal})
+        write_chart_year_slice(mock_app, year=2026, year_map={"sso": _sample_chart_series()})
+
+        # Then
+        assert mock_db.request_log == [("update", "/")] * 3
+        assert all(f"/history/fills/2026-04-10/fill_{i}" in mock_db for i in range(5))
+
+    def test_set_semantics_replace_existing_node(self, mock_db, mock_app):
+        """
+        목적: multi-path update 가 경로별 덮어쓰기(set) 의미를 유지하는지 검증 (병합 아님).
+        """
+        # Given — 이전 실행이 남긴 필드
+        mock_db["/charts/prices/sso/years/2026"] = {"stale_field": 1}
+
+        # When
+        write_chart_year_slice(mock_app, year=2026, year_map={"sso": _sample_chart_series()})
+
+        # Then
+        assert "stale_field" not in mock_db["/charts/prices/sso/years/2026"]
+
+    def test_raw_backfill_is_chunked(self, mock_db, mock_app, monkeypatch: pytest.MonkeyPatch):
+        """
+        목적: 경로 수가 RTDB_UPDATE_MAX_PATHS 를 넘으면 그 단위로 나눠 update 하는지 검증.
+        """
+        # Given
+        monkeypatch.setattr(rtdb_module, "RTDB_UPDATE_MAX_PATHS", 2)
+        rows = [{"date": "2026-04-10", "asset_id": f"a{i}", "state": "none"} for i in range(5)]
+
+        # When
+        rtdb_module.write_history_signals_raw(mock_app, rows)
+
+        # Then
+        assert mock_db.request_log == [("update", "/")] * 3
+        assert mock_db["/history/signals/2026-04-10"] == {f"a{i}": {"state": "none"} for i in range(5)}
+
+    def test_remove_invalid_tokens_single_update(self, mock_db, mock_app):
+        """Given 만료 토큰 2 건 When remove Then get 1 회 + update 1 회로 삭제, 나머지 유지."""
+        mock_db["/device_tokens"] = {"d1": "keep", "d2": "bad_1", "d3": {"token": "bad_2"}}
+
+        remove_invalid_tokens(mock_app, ["bad_1", "bad_2"])
+
+        assert mock_db.request_log == [("get", "/device_tokens"), ("update", "/")]
+        assert mock_db["/device_tokens"] == {"d1": "keep"}
+
+
+class TestFetchPendingInboxes:
+    """``fetch_pending_inboxes`` — inbox 4 종 동시 읽기 계약."""
+
+    def test_reads_all_four_inboxes(self, mock_db, mock_app):
+        """
+        목적: 네 inbox 를 각각 1 회씩 읽어 processed=false 항목만 담는지 검증.
+        """
+        # Given
+        mock_db["/fills/inbox/f1"] = {
+            "asset_id": "sso",
+            "direction": "buy",
+            "actual_price": 82.0,
+            "actual_shares": 10,
+            "trade_date": "2026-04-10",
+            "input_time_kst": "2026-04-10T20:00:00+09:00",
+            "processed": False,
+        }
+        mock_db["/balance_adjust/inbox/a1"] = {"new_cash": 1.0, "processed": True}
+        mock_db["/fill_dismiss/inbox/d1"] = {"asset_id": "qld", "processed": False}
+        mock_db["/model_sync/inbox/s1"] = {"input_time_kst": "2026-04-10T20:00:00+09:00", "processed": False}
+
+        # When
+        inboxes = fetch_pending_inboxes(mock_app)
+
+        # Then
+        assert [f.rtdb_key for f in inboxes.fills] == ["f1"]
+        assert inboxes.balance_adjusts == []
+        assert [d.rtdb_key for d in inboxes.fill_dismisses] == ["d1"]
+        assert [s.rtdb_key for s in inboxes.model_syncs] == ["s1"]
+        assert sorted(mock_db.request_log) == [
+            ("get", "/balance_adjust/inbox"),
+            ("get", "/fill_dismiss/inbox"),
+            ("get", "/fills/inbox"),
+            ("get", "/model_sync/inbox"),
+        ]
+
+    def test_failure_names_inbox(self, mock_db, mock_app):
+        """Given fill_dismiss 레코드가 무효 When fetch Then 해당 inbox 이름을 포함한 RuntimeError."""
+        mock_db["/fill_dismiss/inbox/d1"] = {"processed": False}
+
+        with pytest.raises(RuntimeError, match="RTDB fill_dismisses 읽기 실패"):
+            fetch_pending_inboxes(mock_app)
@@ -21,16 +21,23 @@ from live.constants import LIVE_PORTFOLIO_ID, SCHEMA_VERSION
 from live.models import (
     AssetLiveState,
     BufferZoneState,
+    ChartHashes,
     HoldState,
     LiveState,
+    MaCache,
+    MaCacheEntry,
     PendingOrderDict,
 )
 from live.state import (
     cleanup_old_applied_ids,
     create_initial_state,
     load_applied_fill_ids,
+    load_chart_hashes,
+    load_ma_cache,
     load_state,
     save_applied_fill_ids,
+    save_chart_hashes,
+    save_ma_cache,
     save_state,
     save_state_snapshot,
 )
@@ -690,6 +697,94 @@ class TestAppliedFillIds:
         assert path.exists()
 
 
+# ============================================================================
+# ma_cache
+# ============================================================================
+
+
+class TestMaCache:
+    def test_save_load_roundtrip_is_bit_exact(self, tmp_path: Path):
+        """Given 반올림 오차가 있는 EMA 값 When save → load Then float 비트 단위 일치."""
+        # Given
+        cache = MaCache(
+            entries={
+                "SPY:ema:200": MaCacheEntry(
+                    signal_ticker="SPY",
+                    ma_window=200,
+                    ma_type="ema",
+                    last_date="2026-04-10",
+                    last_close=512.345678,
+                    ma_value=0.1 + 0.2 + 487.123456789,
+                )
+            },
+            runs_since_full=7,
+        )
+        path = tmp_path / "ma_cache.json"
+
+        # When
+        save_ma_cache(cache, path)
+        loaded = load_ma_cache(path)
+
+        # Then
+        assert loaded == cache
+
+    def test_load_nonexistent_returns_empty_cache(self, tmp_path: Path):
+        """파일 없으면 빈 캐시 (첫 실행은 전체 재계산)."""
+        loaded = load_ma_cache(tmp_path / "ma_cache.json")
+        assert loaded.entries == {}
+        assert loaded.runs_since_full == 0
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "not json",
+            json.dumps({"runs_since_full": 1}),
+            json.dumps({"entries": {"SPY:ema:200": {"signal_ticker": "SPY"}}}),
+        ],
+    )
+    def test_load_invalid_raises(self, tmp_path: Path, content: str):
+        """JSON 파싱 실패 / entries 누락 / 필드 누락 → ValueError."""
+        path = tmp_path / "ma_cache.json"
+        path.write_text(content, encoding="utf-8")
+        with pytest.raises(ValueError, match="ma_cache.json"):
+            load_ma_cache(path)
+
+
+# ============================================================================
+# chart_hashes
+# ============================================================================
+
+
+class TestChartHashes:
+    def test_save_load_roundtrip_keeps_int_years(self, tmp_path: Path):
+        """Given 자산/equity 연도 해시 When save → load Then 연도 키가 int 로 복원."""
+        hashes = ChartHashes(prices={"sso": {2025: "a" * 64, 2026: "b" * 64}}, equity={2026: "c" * 64})
+        path = tmp_path / "chart_hashes.json"
+
+        save_chart_hashes(hashes, path)
+
+        assert load_chart_hashes(path) == hashes
+
+    def test_load_nonexistent_returns_empty(self, tmp_path: Path):
+        """파일 없으면 빈 해시 (첫 게시는 전체 연도)."""
+        assert load_chart_hashes(tmp_path / "chart_hashes.json") == ChartHashes()
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "not json",
+            json.dumps({"prices": [], "equity": {}}),
+            json.dumps({"prices": {"sso": {"20x5": "h"}}, "equity": {}}),
+        ],
+    )
+    def test_load_invalid_raises(self, tmp_path: Path, content: str):
+        """JSON 파싱 실패 / 구조 불일치 / 연도 키 오류 → ValueError."""
+        path = tmp_path / "chart_hashes.json"
+        path.write_text(content, encoding="utf-8")
+        with pytest.raises(ValueError, match="chart_hashes.json"):
+            load_chart_hashes(path)
+
+
 # ============================================================================
 # atomic save 검증
 # ============================================================================
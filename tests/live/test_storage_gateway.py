@@ -7,8 +7,9 @@
 - generation precondition (``if_generation_match``) 위반 시 ``RuntimeError``
 - ``state_workspace`` 컨텍스트:
 
-  - tempdir 생성 → 모든 blob download → yield → 변경된 파일만 upload → tempdir 삭제
-  - 변경 감지: download 시점 sha256 스냅샷 vs 종료 시점 sha256 비교
+  - tempdir 생성 → 필요한 blob 만 download → yield → 변경된 파일만 upload → tempdir 삭제
+  - 변경 감지: 크기 / mtime 이 바뀐 파일의 md5 vs 버킷 md5 비교
+  - 쓰기 전용 prefix 는 download 생략, 로컬 캐시가 있으면 generation / md5 가 바뀐 blob 만 download
   - write 순서 보호: ``live_state.json`` 을 가장 마지막에 upload (LiveState 일관성)
   - read-only (``push_on_success=False``) 시 upload skip
   - 컨텍스트 본문 예외 시 upload skip (LiveState 일관성 보호)
@@ -16,9 +17,12 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from live import storage_gateway
+from live.constants import LOCAL_BUCKET_DIR_ENV_KEY, WORKSPACE_CACHE_DIR_ENV_KEY
 
 # ============================================================================
 # download_blob
@@ -260,6 +264,24 @@ class TestStateWorkspace:
         assert new_blob.exists_in_fake
         assert new_blob._data == b'{"snapshot":"new"}'
 
+    def test_columnar_cache_files_not_uploaded(self, fake_gcs_bucket):
+        """
+        목적: CSV 에서 파생된 바이너리 컬럼 캐시(``*.columns/``) 는 upload 하지 않는지 검증.
+
+        Given: 컨텍스트 안에서 CSV 와 그 컬럼 캐시 파일을 생성
+        Then: CSV 만 upload, 캐시 파일은 버킷에 없음
+        """
+        # When
+        with storage_gateway.state_workspace(push_on_success=True) as workspace:
+            stock_dir = workspace / "data/stock"
+            (stock_dir / "SPY.columns").mkdir(parents=True)
+            (stock_dir / "SPY.csv").write_bytes(b"date,close\n")
+            (stock_dir / "SPY.columns/manifest.json").write_bytes(b"{}")
+
+        # Then
+        assert fake_gcs_bucket.blob("data/stock/SPY.csv").exists_in_fake
+        assert not fake_gcs_bucket.blob("data/stock/SPY.columns/manifest.json").exists_in_fake
+
     def test_live_state_json_uploaded_last(self, fake_gcs_bucket):
         """
         목적: BRIEFING §6.5 — LiveState 최신성 보호.
@@ -339,3 +361,164 @@ class TestStateWorkspace:
         assert fake_gcs_bucket.blob("a.txt").generation == gen_before
         assert fake_gcs_bucket.blob("a.txt")._data == b"a-original"
         assert fake_gcs_bucket.upload_log == []
+
+
+class TestStateWorkspaceDeltaSync:
+    """필요한 blob / 바뀐 blob 만 download 하는 동기화 정책 고정."""
+
+    def test_write_only_prefixes_not_downloaded_but_uploaded(self, fake_gcs_bucket):
+        """
+        목적: 어떤 명령도 읽지 않는 history/daily, history/states 는 download 하지 않되,
+        같은 이름을 새로 쓰면 (같은 날 재실행) 내용이 다를 때만 upload 되는지 검증.
+
+        Given: live_state.json + 일별 스냅샷 2 개
+        When: 컨텍스트 안에서 한 스냅샷을 다른 내용으로, 다른 하나는 같은 내용으로 다시 씀
+        Then: 스냅샷은 download 되지 않음 / 내용이 바뀐 스냅샷만 upload
+        """
+        # Given
+        fake_gcs_bucket.seed("live_state.json", b'{"v":1}')
+        fake_gcs_bucket.seed("history/states/2026-05-08.json", b"same")
+        fake_gcs_bucket.seed("history/daily/2026-05-08.json", b"old")
+
+        # When
+        with storage_gateway.state_workspace(push_on_success=True) as workspace:
+            assert not (workspace / "history/states/2026-05-08.json").exists()
+            (workspace / "history/states").mkdir(parents=True)
+            (workspace / "history/states/2026-05-08.json").write_bytes(b"same")
+            (workspace / "history/daily").mkdir(parents=True)
+            (workspace / "history/daily/2026-05-08.json").write_bytes(b"new")
+
+        # Then
+        assert fake_gcs_bucket.download_log == ["live_state.json"]
+        assert fake_gcs_bucket.upload_log == ["history/daily/2026-05-08.json"]
+
+    def test_prefixes_limit_downloads(self, fake_gcs_bucket):
+        """
+        목적: ``prefixes`` 를 지정하면 해당 blob 만 download 되는지 검증 (drift 등 읽기 전용 명령).
+        """
+        # Given
+        fake_gcs_bucket.seed("live_state.json", b"{}")
+        fake_gcs_bucket.seed("data/stock/SPY.csv", b"spy")
+        fake_gcs_bucket.seed("history/summary.jsonl", b"{}\n")
+
+        # When
+        with storage_gateway.state_workspace(
+            push_on_success=False, prefixes=("live_state.json", "data/stock/")
+        ) as workspace:
+            assert not (workspace / "history/summary.jsonl").exists()
+
+        # Then
+        assert sorted(fake_gcs_bucket.download_log) == ["data/stock/SPY.csv", "live_state.json"]
+
+    def test_rewriting_same_content_is_not_uploaded(self, fake_gcs_bucket):
+        """
+        목적: 파일을 다시 써도 내용(md5)이 같으면 upload 하지 않는지 검증.
+        """
+        # Given
+        fake_gcs_bucket.seed("live_state.json", b'{"v":1}')
+
+        # When
+        with storage_gateway.state_workspace(push_on_success=True) as workspace:
+            (workspace / "live_state.json").write_bytes(b'{"v":1}')
+
+        # Then
+        assert fake_gcs_bucket.upload_log == []
+
+    def test_local_cache_downloads_only_changed_blobs(self, fake_gcs_bucket, tmp_path, monkeypatch):
+        """
+        목적: 로컬 캐시가 있으면 generation / md5 가 바뀐 blob 만 download 하는지 검증.
+
+        Given: 캐시 디렉토리 설정, 첫 실행으로 캐시 채움 (a.txt 는 컨텍스트 안에서 수정 → upload)
+        When: 외부에서 b.txt 만 갱신된 뒤 두 번째 실행
+        Then: 두 번째 실행은 b.txt 만 download, 워크스페이스 내용은 버킷 최신본과 같음
+        """
+        # Given
+        monkeypatch.setenv(WORKSPACE_CACHE_DIR_ENV_KEY, str(tmp_path / "cache"))
+        fake_gcs_bucket.seed("a.txt", b"a-1")
+        fake_gcs_bucket.seed("b.txt", b"b-1")
+        with storage_gateway.state_workspace(push_on_success=True) as workspace:
+            (workspace / "a.txt").write_bytes(b"a-2")
+        fake_gcs_bucket.seed("b.txt", b"b-2")
+        fake_gcs_bucket.download_log.clear()
+
+        # When
+        with storage_gateway.state_workspace(push_on_success=True) as workspace:
+            a_content = (workspace / "a.txt").read_bytes()
+            b_content = (workspace / "b.txt").read_bytes()
+            (workspace / "b.txt").write_bytes(b"b-3-local-edit")
+
+        # Then
+        assert fake_gcs_bucket.download_log == ["b.txt"]
+        assert (a_content, b_content) == (b"a-2", b"b-2")
+        # 워크스페이스 수정은 캐시 원본을 오염시키지 않고, upload 후 캐시도 최신본으로 갱신된다
+        fake_gcs_bucket.download_log.clear()
+        with storage_gateway.state_workspace(push_on_success=False) as workspace:
+            assert (workspace / "b.txt").read_bytes() == b"b-3-local-edit"
+        assert fake_gcs_bucket.download_log == []
+
+    def test_download_failure_raises_runtime_error(self, fake_gcs_bucket):
+        """
+        목적: 동시 download 중 하나라도 실패하면 RuntimeError 로 중단 (자동 복구 금지).
+        """
+        # Given — 목록에는 있으나 download 가 실패하는 blob
+        fake_gcs_bucket.seed("a.txt", b"a")
+        broken = fake_gcs_bucket.seed("b.txt", b"b")
+
+        def _fail(filename: str) -> None:
+            raise OSError("network down")
+
+        broken.download_to_filename = _fail  # type: ignore[method-assign]
+
+        # When + Then
+        with pytest.raises(RuntimeError, match="GCS download 실패: blob=b.txt"):
+            with storage_gateway.state_workspace(push_on_success=False):
+                pass
+
+
+class TestLocalDirBucket:
+    """``QBT_LIVE_LOCAL_BUCKET_DIR`` 로컬 디렉토리 버킷 stand-in (오프라인 실행)."""
+
+    def test_state_workspace_roundtrip_on_local_dir(self, tmp_path: Path, monkeypatch):
+        """
+        목적: GCS 없이 로컬 디렉토리를 버킷으로 사용해 동기화 전체 흐름이 동작하는지 검증.
+
+        Given: 로컬 버킷 디렉토리에 live_state.json / CSV
+        When: 컨텍스트 안에서 상태 수정 + 새 파일 생성
+        Then: 변경분이 로컬 버킷에 반영되고 generation 이 증가, 미변경 파일은 그대로
+        """
+        # Given
+        bucket_dir = tmp_path / "bucket"
+        (bucket_dir / "data/stock").mkdir(parents=True)
+        (bucket_dir / "live_state.json").write_bytes(b'{"v":1}')
+        (bucket_dir / "data/stock/SPY.csv").write_bytes(b"spy")
+        monkeypatch.setenv(LOCAL_BUCKET_DIR_ENV_KEY, str(bucket_dir))
+        csv_mtime = (bucket_dir / "data/stock/SPY.csv").stat().st_mtime_ns
+        gen_before = storage_gateway.list_blobs_with_prefix("live_state.json")[0].generation
+
+        # When
+        with storage_gateway.state_workspace(push_on_success=True) as workspace:
+            assert (workspace / "data/stock/SPY.csv").read_bytes() == b"spy"
+            (workspace / "live_state.json").write_bytes(b'{"v":2}')
+            (workspace / "history").mkdir()
+            (workspace / "history/summary.jsonl").write_bytes(b"{}\n")
+
+        # Then
+        assert (bucket_dir / "live_state.json").read_bytes() == b'{"v":2}'
+        assert (bucket_dir / "history/summary.jsonl").read_bytes() == b"{}\n"
+        assert (bucket_dir / "data/stock/SPY.csv").stat().st_mtime_ns == csv_mtime
+        assert storage_gateway.list_blobs_with_prefix("live_state.json")[0].generation > gen_before
+
+    def test_generation_precondition_mismatch_raises_runtime_error(self, tmp_path: Path, monkeypatch):
+        """
+        목적: 로컬 버킷도 ``if_generation_match`` 불일치 시 RuntimeError 를 전파하는지 검증.
+        """
+        # Given
+        monkeypatch.setenv(LOCAL_BUCKET_DIR_ENV_KEY, str(tmp_path / "bucket"))
+        src = tmp_path / "src.txt"
+        src.write_bytes(b"x")
+        generation = storage_gateway.upload_blob(src, "a.txt")
+
+        # When + Then
+        assert storage_gateway.upload_blob(src, "a.txt", if_generation_match=generation) > generation
+        with pytest.raises(RuntimeError, match="if_generation_match"):
+            storage_gateway.upload_blob(src, "a.txt", if_generation_match=generation)
@@ -395,3 +395,67 @@ class TestRunGridSearch:
 
         # Then
         assert len(results_df) == 8, "2x2x1x2 = 8개 조합이 생성되어야 함"
+
+
+class TestExpandingGridSearch:
+    """Expanding WFO용 증분 그리드 서치 테스트"""
+
+    @staticmethod
+    def _make_df() -> pd.DataFrame:
+        """돌파/이탈이 반복되는 진동 가격 데이터 (200일)."""
+        import math
+        from datetime import timedelta
+
+        closes = [100 + 15 * math.sin(i * 0.15) + i * 0.05 for i in range(200)]
+        return pd.DataFrame(
+            {
+                "Date": [date(2023, 1, 1) + timedelta(days=i) for i in range(200)],
+                "Open": [c * 0.998 for c in closes],
+                "Close": closes,
+            }
+        )
+
+    def test_checkpointed_results_match_run_grid_search(self):
+        """
+        목적: 체크포인트를 이어가며 얻은 결과가 같은 IS 슬라이스의 run_grid_search와 동일한지 검증
+
+        Given: 200일 진동 데이터, IS 종료일 3개 (오름차순)
+        When: ExpandingGridSearch.evaluate_until(is_end) 연속 호출
+        Then: 각 결과 DataFrame이 [시작일, is_end] 슬라이스로 run_grid_search를 호출한 결과와 동일
+        """
+        from qbt.backtest.engines.backtest_engine import ExpandingGridSearch, run_grid_search
+
+        df = self._make_df()
+        grid = {
+            "ma_window_list": [5, 20],
+            "buy_buffer_zone_pct_list": [0.01, 0.03],
+            "sell_buffer_zone_pct_list": [0.02],
+            "hold_days_list": [0, 2],
+            "initial_capital": 10000.0,
+        }
+        search = ExpandingGridSearch(df, df, **grid)
+
+        for is_end in (date(2023, 3, 1), date(2023, 5, 15), date(2023, 7, 19)):
+            sliced = df[df["Date"] <= is_end].reset_index(drop=True)
+            expected = run_grid_search(signal_df=sliced, trade_df=sliced, **grid)
+
+            actual = search.evaluate_until(is_end)
+
+            pd.testing.assert_frame_equal(actual, expected)
+
+    def test_is_end_before_checkpoint_raises(self):
+        """
+        목적: 체크포인트보다 앞선 is_end 요청 시 ValueError 발생
+
+        Given: evaluate_until(2023-05-01) 호출 완료
+        When: evaluate_until(2023-03-01) 호출
+        Then: ValueError (상태는 앞으로만 진행 가능)
+        """
+        from qbt.backtest.engines.backtest_engine import ExpandingGridSearch
+
+        df = self._make_df()
+        search = ExpandingGridSearch(df, df, [5], [0.01], [0.02], [0], initial_capital=10000.0)
+        search.evaluate_until(date(2023, 5, 1))
+
+        with pytest.raises(ValueError, match="직전 호출 이후"):
+            search.evaluate_until(date(2023, 3, 1))
@@ -8,6 +8,7 @@ data_loader 모듈 테스트
 4. 중복 날짜가 제거되고 경고 로그가 찍히는가?
 5. 파일이 없을 때 명확한 에러를 내는가?
 6. 두 DataFrame의 겹치는 기간이 정확히 추출되는가?
+7. 바이너리 컬럼 캐시가 CSV 로딩과 같은 결과를 주고, CSV가 바뀌면 무시되는가?
 
 왜 중요한가요?
 백테스트의 모든 결과는 입력 데이터에 의존합니다.
@@ -21,7 +22,13 @@ import pandas as pd
 import pytest
 
 from qbt.common_constants import COL_CLOSE, COL_DATE
-from qbt.utils.data_loader import extract_overlap_period, load_signal_trade_pair, load_stock_data
+from qbt.utils.data_loader import (
+    columnar_cache_dir,
+    extract_overlap_period,
+    load_signal_trade_pair,
+    load_stock_data,
+    write_columnar_cache,
+)
 
 
 class TestLoadStockData:
@@ -356,3 +363,83 @@ class TestLoadSignalTradePair:
         # When & Then
         with pytest.raises(ValueError, match="겹치는 기간"):
             load_signal_trade_pair(path1, path2)
+
+
+class TestColumnarCache:
+    """바이너리 컬럼 캐시 테스트"""
+
+    def test_cache_matches_csv_load_and_is_memory_mapped(self, tmp_path):
+        """
+        목적: 캐시 로딩 결과가 CSV 로딩 결과와 완전히 같고, 숫자 컬럼은 memory-map인지 검증
+
+        Given: 정렬되지 않은 날짜 + 중복 날짜가 있는 CSV와 그 컬럼 캐시
+        When: load_stock_data 호출
+        Then: CSV 경로 결과와 equals (dtype/Date 객체 포함), Close는 읽기 전용(memory-map)
+        """
+        csv_path = tmp_path / "SPY_max.csv"
+        pd.DataFrame(
+            {
+                "Date": ["2023-01-03", "2023-01-02", "2023-01-03", "2023-01-04"],
+                "Open": [101.0, 100.0, 101.5, 102.0],
+                "High": [102.0, 101.0, 102.5, 103.0],
+                "Low": [100.0, 99.0, 100.5, 101.0],
+                "Close": [101.5, 100.5, 102.0, 102.5],
+                "Volume": [1100, 1000, 1200, 1300],
+            }
+        ).to_csv(csv_path, index=False)
+        expected = load_stock_data(csv_path)
+
+        write_columnar_cache(csv_path)
+        cached = load_stock_data(csv_path)
+
+        pd.testing.assert_frame_equal(cached, expected)
+        assert all(isinstance(d, date) for d in cached[COL_DATE])
+        # memory-map 배열은 읽기 전용 (CSV 경로 결과는 쓰기 가능)
+        assert not cached[COL_CLOSE].to_numpy().flags.writeable
+        assert expected[COL_CLOSE].to_numpy().flags.writeable
+
+    def test_cached_frame_is_read_only_until_copied(self, tmp_path, sample_stock_df):
+        """
+        목적: 캐시 로딩 결과의 읽기 전용 계약을 고정 (제자리 수정은 실패, 복사본은 수정 가능)
+
+        Given: 컬럼 캐시가 있는 CSV
+        When: 로드한 DataFrame의 Close를 제자리에서 수정 / .copy() 후 수정
+        Then: 제자리 수정은 ValueError(read-only), 복사본 수정은 성공하고 캐시 값은 그대로
+        """
+        csv_path = tmp_path / "QQQ_max.csv"
+        sample_stock_df.to_csv(csv_path, index=False)
+        write_columnar_cache(csv_path)
+        original_close = float(sample_stock_df[COL_CLOSE].iloc[0])
+
+        cached = load_stock_data(csv_path)
+        with pytest.raises(ValueError, match="read-only"):
+            cached.loc[0, COL_CLOSE] = -1.0
+        with pytest.raises(ValueError, match="read-only"):
+            cached[COL_CLOSE] *= 2.0
+
+        writable = cached.copy()
+        writable.loc[0, COL_CLOSE] = -1.0
+
+        assert writable[COL_CLOSE].iloc[0] == -1.0
+        assert load_stock_data(csv_path)[COL_CLOSE].iloc[0] == original_close
+
+    def test_csv_change_bypasses_stale_cache(self, tmp_path, sample_stock_df):
+        """
+        목적: 캐시 저장 후 CSV가 바뀌면 캐시를 무시하고 CSV를 읽는지 검증
+
+        Given: 컬럼 캐시가 있는 CSV
+        When: CSV의 Close 값을 바꿔 다시 저장 후 load_stock_data 호출
+        Then: 바뀐 Close 값이 반환됨 (캐시 디렉토리는 그대로 존재)
+        """
+        csv_path = tmp_path / "QQQ_max.csv"
+        sample_stock_df.to_csv(csv_path, index=False)
+        write_columnar_cache(csv_path)
+
+        modified = sample_stock_df.copy()
+        modified[COL_CLOSE] = modified[COL_CLOSE] + 1.0
+        modified.to_csv(csv_path, index=False)
+
+        df = load_stock_data(csv_path)
+
+        assert columnar_cache_dir(csv_path).exists()
+        assert df[COL_CLOSE].tolist() == (sample_stock_df[COL_CLOSE] + 1.0).tolist()
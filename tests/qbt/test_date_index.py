@@ -0,0 +1,145 @@
+"""정수 날짜 인덱스 / 공통 기간 정렬 테스트
+
+align_frames가 Python set 교집합 + isin 필터링과 같은 공통 기간을 만드는지,
+DateIndex 위치 조회와 입력 검증이 동작하는지 검증한다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.common_constants import COL_CLOSE, COL_DATE
+from qbt.utils.date_index import DateIndex, align_frames, frame_date_keys, key_to_date
+
+
+def _make_df(dates: list[date], base: float) -> pd.DataFrame:
+    """Date + Close 두 컬럼 DataFrame."""
+    return pd.DataFrame({COL_DATE: dates, COL_CLOSE: [base + k for k in range(len(dates))]})
+
+
+def _weekdays(start: date, count: int, skip: set[int] | None = None) -> list[date]:
+    """start부터 평일 count개 (skip에 있는 순번은 제외)."""
+    out: list[date] = []
+    current = start
+    k = 0
+    while len(out) < count:
+        if current.weekday() < 5:
+            if not skip or k not in skip:
+                out.append(current)
+            k += 1
+        current += timedelta(days=1)
+    return out
+
+
+class TestAlignFrames:
+    """공통 기간 정렬 테스트"""
+
+    def test_matches_set_intersection_filtering(self):
+        """
+        목적: 정렬 병합 결과가 기존 set 교집합 + isin 필터링과 행 단위로 같은지 검증
+
+        Given: 시작일/결측일이 서로 다른 3개 자산 DataFrame
+        When: align_frames → take
+        Then: 자산별 결과가 set 교집합으로 필터링한 DataFrame과 동일
+        """
+        frames = {
+            "a": _make_df(_weekdays(date(2020, 1, 1), 200, skip={5, 17}), 100.0),
+            "b": _make_df(_weekdays(date(2020, 2, 3), 180, skip={30}), 200.0),
+            "c": _make_df(_weekdays(date(2019, 12, 2), 230), 300.0),
+        }
+
+        panel = align_frames(frames)
+
+        common = set(frames["a"][COL_DATE]) & set(frames["b"][COL_DATE]) & set(frames["c"][COL_DATE])
+        assert len(panel.index) == len(common)
+        for name, df in frames.items():
+            expected = df[df[COL_DATE].isin(common)].reset_index(drop=True)
+            pd.testing.assert_frame_equal(panel.take(name, df), expected)
+
+    def test_reindex_rejects_frame_missing_common_date(self):
+        """
+        목적: 정렬에 참여하지 않은 DataFrame에 공통 거래일이 빠져 있으면 행 정렬이 깨지므로 ValueError
+
+        Given: 공통 기간 100일, 그중 하루가 빠진 시그널 DataFrame
+        When: panel.reindex
+        Then: 빠진 날짜를 담은 ValueError / 빠짐 없는 DataFrame은 공통 기간 길이로 잘림
+        """
+        dates = _weekdays(date(2021, 3, 1), 100)
+        panel = align_frames({"a": _make_df(dates, 1.0)})
+        longer = _make_df(_weekdays(date(2021, 2, 1), 140), 5.0)
+
+        assert panel.reindex(longer)[COL_DATE].tolist() == dates
+        with pytest.raises(ValueError, match=str(dates[10])):
+            panel.reindex(_make_df(dates[:10] + dates[11:], 1.0))
+
+    def test_no_common_period_raises(self):
+        """
+        목적: 공통 거래일이 없으면 ValueError
+
+        Given: 기간이 겹치지 않는 두 DataFrame
+        When: align_frames
+        Then: ValueError("공통 거래 기간")
+        """
+        frames = {
+            "a": _make_df(_weekdays(date(2020, 1, 1), 10), 1.0),
+            "b": _make_df(_weekdays(date(2021, 1, 1), 10), 1.0),
+        }
+
+        with pytest.raises(ValueError, match="공통 거래 기간"):
+            align_frames(frames)
+
+
+class TestDateIndex:
+    """날짜 → 행 위치 조회 테스트"""
+
+    def test_position_lookup(self):
+        """
+        목적: 존재하는 날짜는 행 위치, 범위 밖/휴일은 None을 반환하는지 검증
+
+        Given: 평일만 있는 DataFrame
+        When: get_position / positions
+        Then: 행 위치 일치, 주말과 범위 밖 날짜는 None(-1)
+        """
+        df = _make_df(_weekdays(date(2022, 1, 3), 30), 1.0)
+        index = DateIndex.from_frame(df)
+
+        for position, day in enumerate(df[COL_DATE]):
+            assert index.get_position(day) == position
+        assert index.get_position(date(2022, 1, 8)) is None  # 토요일
+        assert index.get_position(date(2021, 12, 31)) is None
+        assert index.positions(np.array([index.keys[3], index.keys[-1] + 100])).tolist() == [3, -1]
+        assert key_to_date(int(index.keys[0])) == date(2022, 1, 3)
+
+    def test_unsorted_dates_raise(self):
+        """
+        목적: 오름차순이 아니거나 중복된 날짜는 위치 조회가 불가능하므로 ValueError
+
+        Given: 날짜 순서가 뒤바뀐 DataFrame / 중복 날짜 DataFrame
+        When: DateIndex.from_frame
+        Then: ValueError
+        """
+        dates = _weekdays(date(2022, 1, 3), 5)
+
+        with pytest.raises(ValueError, match="오름차순"):
+            DateIndex.from_frame(_make_df(dates[::-1], 1.0))
+        with pytest.raises(ValueError, match="중복"):
+            DateIndex.from_frame(_make_df(dates + dates[-1:], 1.0))
+
+    def test_frame_keys_are_cached_per_frame(self):
+        """
+        목적: 같은 DataFrame 객체의 날짜 키는 1회만 변환되어 재사용되는지 검증
+
+        Given: DataFrame 1개와 같은 내용의 복사본
+        When: frame_date_keys를 두 번 / 복사본으로 한 번 호출
+        Then: 같은 객체는 같은 배열, 복사본은 새 배열(값은 동일)
+        """
+        df = _make_df(_weekdays(date(2022, 1, 3), 20), 1.0)
+
+        keys = frame_date_keys(df)
+        copied = frame_date_keys(df.copy())
+
+        assert frame_date_keys(df) is keys
+        assert copied is not keys
+        np.testing.assert_array_equal(copied, keys)
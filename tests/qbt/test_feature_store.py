@@ -0,0 +1,127 @@
+"""이동평균 피처 저장소 테스트
+
+feature_store 모듈이 add_single_moving_average와 같은 값을 돌려주는지,
+같은 데이터는 재계산하지 않는지, 원본을 복사/변경하지 않는지, 디스크 영속화가 동작하는지 검증한다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.analysis import add_single_moving_average
+from qbt.backtest.feature_store import MovingAverageStore, with_moving_averages
+
+
+def _make_price_df(n_days: int = 120, seed: int = 3) -> pd.DataFrame:
+    """랜덤워크 가격 DataFrame."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1 + rng.normal(0.0, 0.02, n_days))
+    return pd.DataFrame(
+        {
+            "Date": [date(2020, 1, 1) + timedelta(days=i) for i in range(n_days)],
+            "Open": close,
+            "Close": close,
+        }
+    )
+
+
+class TestMovingAverageStore:
+    """메모리 저장소 테스트"""
+
+    @pytest.mark.parametrize("ma_type", ["ema", "sma"])
+    def test_matches_add_single_moving_average_and_reuses(self, ma_type):
+        """
+        목적: 저장소 값이 add_single_moving_average와 비트 단위로 같고, 같은 데이터는 재사용되는지 검증
+
+        Given: 랜덤워크 가격, 빈 저장소
+        When: 같은 종가로 2회 조회, 종가를 바꾼 데이터로 1회 조회
+        Then: 값 동일(NaN 위치 포함), 두 번째 조회는 같은 배열 객체, 변경 데이터는 다른 값
+        """
+        df = _make_price_df()
+        store = MovingAverageStore()
+
+        first = store.get(df["Close"], 20, ma_type)
+        second = store.get(df["Close"].copy(), 20, ma_type)
+        changed = store.get(df["Close"] * 1.01, 20, ma_type)
+
+        expected = add_single_moving_average(df, 20, ma_type=ma_type)["ma_20"].to_numpy()
+        np.testing.assert_array_equal(first, expected)
+        assert second is first
+        assert not first.flags.writeable
+        assert not np.array_equal(changed, first, equal_nan=True)
+
+    def test_invalid_window_raises(self):
+        """
+        목적: window < 1이면 ValueError
+
+        Given: 가격 DataFrame
+        When: window=0으로 조회
+        Then: ValueError
+        """
+        with pytest.raises(ValueError, match="window는 1 이상"):
+            MovingAverageStore().get(_make_price_df()["Close"], 0)
+
+
+class TestWithMovingAverages:
+    """MA 컬럼 추가 테스트"""
+
+    def test_adds_columns_without_copying_or_mutating_input(self):
+        """
+        목적: 원본을 변경하지 않고, 원본 컬럼 메모리를 공유하는 DataFrame에 MA 컬럼을 추가하는지 검증
+
+        Given: 가격 DataFrame
+        When: with_moving_averages(windows=[5, 10, 5])
+        Then: ma_5/ma_10이 add_single_moving_average와 동일, 원본 컬럼 불변, Close 메모리 공유
+        """
+        df = _make_price_df()
+        original_columns = list(df.columns)
+
+        result = with_moving_averages(df, [5, 10, 5], ma_type="ema", store=MovingAverageStore())
+
+        assert list(df.columns) == original_columns
+        assert list(result.columns) == [*original_columns, "ma_5", "ma_10"]
+        for window in (5, 10):
+            expected = add_single_moving_average(df, window, ma_type="ema")[f"ma_{window}"]
+            pd.testing.assert_series_equal(result[f"ma_{window}"], expected)
+        assert np.shares_memory(result["Close"].to_numpy(), df["Close"].to_numpy())
+
+
+class TestFeaturePersistence:
+    """디스크 영속화 테스트"""
+
+    def test_persists_and_reloads_memory_mapped(self, tmp_path):
+        """
+        목적: 이름이 주어지면 .npy로 저장되고, 새 저장소가 파일을 memory-map으로 읽는지 검증
+
+        Given: 영속화 디렉토리를 가진 저장소
+        When: name="QQQ"로 조회 후 새 저장소 인스턴스로 같은 데이터 조회
+        Then: 파일 1개 생성, 두 번째 결과는 np.memmap이며 값 동일
+        """
+        df = _make_price_df()
+        first = MovingAverageStore(tmp_path).get(df["Close"], 20, "ema", name="QQQ")
+        files = list(tmp_path.glob("QQQ_ema_20_*.npy"))
+
+        reloaded = MovingAverageStore(tmp_path).get(df["Close"], 20, "ema", name="QQQ")
+
+        assert len(files) == 1
+        assert isinstance(reloaded, np.memmap)
+        np.testing.assert_array_equal(reloaded, first)
+
+    def test_keeps_limited_versions_per_feature(self, tmp_path):
+        """
+        목적: 같은 (이름, ma_type, window)의 데이터 버전 파일이 무한히 쌓이지 않는지 검증
+
+        Given: 영속화 저장소
+        When: 종가가 서로 다른 데이터 6개를 같은 이름으로 조회
+        Then: 남은 파일 수가 버전 상한(4) 이하, 다른 window 파일은 영향 없음
+        """
+        store = MovingAverageStore(tmp_path)
+        df = _make_price_df()
+        store.get(df["Close"], 10, "ema", name="SPY")
+        for i in range(6):
+            store.get(df["Close"] + i, 20, "ema", name="SPY")
+
+        assert len(list(tmp_path.glob("SPY_ema_20_*.npy"))) <= 4
+        assert len(list(tmp_path.glob("SPY_ema_10_*.npy"))) == 1
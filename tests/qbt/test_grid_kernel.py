@@ -0,0 +1,150 @@
+"""버퍼존 배치 시뮬레이션 커널 테스트
+
+grid_kernel.run_buffer_zone_batch()가 조합별 run_backtest + BufferZoneStrategy와
+동일한 결과를 내는지, 그리고 입력 검증이 동작하는지 검증한다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.analysis import add_single_moving_average
+from qbt.backtest.engines.backtest_engine import run_backtest
+from qbt.backtest.engines.grid_kernel import calculate_batch_cagr, run_buffer_zone_batch
+from qbt.backtest.strategies.buffer_zone import BufferZoneStrategy
+
+
+def _make_price_df(n_days: int = 300, seed: int = 7) -> pd.DataFrame:
+    """돌파/이탈이 반복되는 랜덤워크 가격 DataFrame (ma_10, ma_30 EMA 포함)."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1 + rng.normal(0.0, 0.02, n_days))
+    open_ = close * (1 + rng.normal(0.0, 0.005, n_days))
+    df = pd.DataFrame(
+        {
+            "Date": [date(2020, 1, 1) + timedelta(days=i) for i in range(n_days)],
+            "Open": open_,
+            "Close": close,
+        }
+    )
+    for window in (10, 30):
+        df = add_single_moving_average(df, window, ma_type="ema")
+    return df
+
+
+class TestRunBufferZoneBatch:
+    """배치 커널 vs 단일 엔진 일치성 테스트"""
+
+    def test_matches_run_backtest_per_combination(self):
+        """
+        목적: 여러 조합을 한 번에 평가한 결과가 조합별 run_backtest 결과와 정확히 일치하는지 검증
+
+        Given: 랜덤워크 가격, (ma, buy, sell, hold) 조합 8개 (hold_days 0/1/3 포함)
+        When: run_buffer_zone_batch 1회 호출 / 조합별 run_backtest 호출
+        Then: final_capital, mdd, 거래 수, 승리 거래 수, 일별 equity가 모두 동일
+        """
+        df = _make_price_df()
+        combos = [
+            (10, 0.01, 0.01, 0),
+            (10, 0.03, 0.05, 0),
+            (10, 0.01, 0.03, 1),
+            (10, 0.02, 0.02, 3),
+            (30, 0.0, 0.0, 0),
+            (30, 0.01, 0.03, 2),
+            (30, 0.03, 0.01, 3),
+            (30, 0.05, 0.05, 5),
+        ]
+
+        batch = run_buffer_zone_batch(
+            signal_close=df["Close"].to_numpy(),
+            ma_matrix=np.column_stack([df[f"ma_{ma}"].to_numpy() for ma, _, _, _ in combos]),
+            trade_open=df["Open"].to_numpy(),
+            trade_close=df["Close"].to_numpy(),
+            buy_buffer_pcts=np.array([c[1] for c in combos]),
+            sell_buffer_pcts=np.array([c[2] for c in combos]),
+            hold_days=np.array([c[3] for c in combos]),
+            initial_capital=10_000.0,
+        )
+
+        for k, (ma, buy, sell, hold) in enumerate(combos):
+            strategy = BufferZoneStrategy(f"ma_{ma}", buy, sell, hold)
+            trades_df, equity_df, summary = run_backtest(strategy, df, df, 10_000.0, log_trades=False)
+
+            assert batch.final_capital[k] == summary["final_capital"]
+            assert batch.mdd[k] == summary["mdd"]
+            assert batch.total_trades[k] == summary["total_trades"]
+            assert batch.winning_trades[k] == summary["winning_trades"]
+            np.testing.assert_array_equal(batch.equity[:, k], equity_df["equity"].to_numpy())
+
+        # 검증 데이터가 실제로 거래를 발생시키는지 확인 (무의미한 일치 방지)
+        assert batch.total_trades.sum() > 0
+
+    def test_insufficient_capital_leaves_position_flat(self):
+        """
+        목적: 매수 가능 수량이 0이면 미체결로 처리되는지 검증 (execute_buy_order와 동일)
+
+        Given: 초기 자본 50, 시가 100 근처 (1주도 매수 불가), 상향돌파 발생
+        When: run_buffer_zone_batch 호출
+        Then: 거래 0건, equity는 전 구간 초기 자본과 동일
+        """
+        df = pd.DataFrame(
+            {
+                "Date": [date(2023, 1, d) for d in range(1, 7)],
+                "Open": [100.0] * 6,
+                "Close": [100.0, 110.0, 110.0, 90.0, 90.0, 90.0],
+                "ma": [100.0] * 6,
+            }
+        )
+
+        batch = run_buffer_zone_batch(
+            signal_close=df["Close"].to_numpy(),
+            ma_matrix=df[["ma"]].to_numpy(),
+            trade_open=df["Open"].to_numpy(),
+            trade_close=df["Close"].to_numpy(),
+            buy_buffer_pcts=np.array([0.03]),
+            sell_buffer_pcts=np.array([0.05]),
+            hold_days=np.array([0]),
+            initial_capital=50.0,
+        )
+
+        assert batch.total_trades[0] == 0
+        np.testing.assert_array_equal(batch.equity[:, 0], np.full(6, 50.0))
+
+    def test_shape_mismatch_raises(self):
+        """
+        목적: 파라미터 배열 길이가 조합 수와 다르면 ValueError 발생
+
+        Given: ma_matrix 조합 2개, buy_buffer_pcts 1개
+        When: run_buffer_zone_batch 호출
+        Then: ValueError
+        """
+        close = np.array([100.0, 101.0, 102.0])
+        with pytest.raises(ValueError, match="파라미터 배열 길이 불일치"):
+            run_buffer_zone_batch(
+                signal_close=close,
+                ma_matrix=np.column_stack([close, close]),
+                trade_open=close,
+                trade_close=close,
+                buy_buffer_pcts=np.array([0.03]),
+                sell_buffer_pcts=np.array([0.05, 0.05]),
+                hold_days=np.array([0, 0]),
+                initial_capital=10_000.0,
+            )
+
+
+class TestCalculateBatchCagr:
+    """배치 CAGR 계산 테스트"""
+
+    def test_one_year_doubling(self):
+        """
+        목적: 정확히 1년(ANNUAL_DAYS) 동안 2배 → CAGR 100%
+
+        Given: final_capital=[200, 100], initial=100, 기간 365.25일에 가까운 1년
+        When: calculate_batch_cagr 호출
+        Then: 두 번째 조합(변화 없음)은 0%, 첫 번째 조합은 약 100%
+        """
+        cagr = calculate_batch_cagr(np.array([200.0, 100.0]), 100.0, date(2020, 1, 1), date(2021, 1, 1))
+
+        assert cagr[0] == pytest.approx(100.0, rel=1e-2)
+        assert cagr[1] == 0.0
@@ -17,7 +17,7 @@ import json
 
 from freezegun import freeze_time
 
-from qbt.utils.meta_manager import MAX_HISTORY_COUNT, save_metadata
+from qbt.utils.meta_manager import MAX_HISTORY_COUNT, get_latest_timestamp, save_metadata
 
 
 class TestSaveMetadata:
@@ -389,3 +389,26 @@ class TestSaveMetadata:
         assert "output_files" in entry
         assert "walkforward_csv" in entry["output_files"]
         assert "walkforward_summary_csv" in entry["output_files"]
+
+
+class TestGetLatestTimestamp:
+    """타입별 최신 타임스탬프 조회 테스트 클래스"""
+
+    def test_returns_latest_across_types(self, mock_results_dir):
+        """
+        목적: 여러 타입 중 가장 최근 실행 시각을 반환하는지 검증
+
+        Given: stock_download(2023-06-01), tqqq_synthetic(2023-06-10) 이력
+        When: 두 타입과 이력 없는 타입을 함께 조회
+        Then: 2023-06-10 타임스탬프 반환, 이력 없는 타입만 조회하면 None
+        """
+        with freeze_time("2023-06-01 09:00:00"):
+            save_metadata("stock_download", {"tickers": ["QQQ"]})
+        with freeze_time("2023-06-10 09:00:00"):
+            save_metadata("tqqq_synthetic", {})
+
+        latest = get_latest_timestamp(["stock_download", "tqqq_synthetic", "unknown"])
+
+        assert latest is not None
+        assert latest.date().isoformat() == "2023-06-10"
+        assert get_latest_timestamp(["unknown"]) is None
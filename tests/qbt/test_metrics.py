@@ -0,0 +1,134 @@
+"""
+backtest/metrics 모듈 테스트
+
+이 파일은 무엇을 검증하나요?
+1. 배치 지표(CAGR, MDD, Calmar, 샤프, 소르티노, 월별 수익률)가 곡선별 analysis 함수 결과와
+   비트 단위로 같은가?
+2. 연간 수익률과 최장 낙폭 기간이 정의대로 계산되는가?
+3. 잘못된 입력(차원/길이/날짜 순서)을 거부하는가?
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.analysis import (
+    calculate_calmar,
+    calculate_monthly_returns,
+    calculate_sharpe_ratio,
+    calculate_sortino_ratio,
+    calculate_summary,
+)
+from qbt.backtest.constants import COL_EQUITY, COL_PNL, ROUND_PERCENT
+from qbt.backtest.metrics import calmar_ratios, compute_curve_metrics
+from qbt.common_constants import COL_DATE
+
+
+@pytest.fixture
+def curves() -> tuple[np.ndarray, list[date]]:
+    """연도 경계를 여러 번 지나는 에쿼티 곡선 4개 (마지막 곡선은 변동 없음)."""
+    rng = np.random.default_rng(22)
+    dates = [ts.date() for ts in pd.bdate_range("2019-11-15", "2023-03-10")]
+    equity = 10_000_000.0 * np.cumprod(1.0 + rng.normal(0.0004, 0.012, (len(dates), 4)), axis=0)
+    equity[:, 3] = 10_000_000.0
+    return equity, dates
+
+
+def _equity_df(equity: np.ndarray, dates: list[date], j: int) -> pd.DataFrame:
+    return pd.DataFrame({COL_DATE: dates, COL_EQUITY: equity[:, j]})
+
+
+class TestComputeCurveMetrics:
+    def test_matches_single_curve_functions_bitwise(self, curves):
+        """
+        목적: 배치 결과가 곡선별 analysis 함수 결과와 == 로 일치
+
+        Given: 에쿼티 곡선 4개 (변동 없는 곡선 포함)
+        When: compute_curve_metrics / calculate_summary·sharpe·sortino·monthly_returns
+        Then: CAGR, MDD, Calmar, 샤프, 소르티노, 월별 수익률(반올림 후)과 연월이 모두 같다
+        """
+        equity, dates = curves
+        metrics = compute_curve_metrics(equity, dates, 10_000_000.0)
+
+        for j in range(equity.shape[1]):
+            df = _equity_df(equity, dates, j)
+            summary = calculate_summary(pd.DataFrame(columns=[COL_PNL]), df, 10_000_000.0)
+            monthly = calculate_monthly_returns(df)
+            assert metrics.cagr[j] == summary["cagr"]
+            assert metrics.mdd[j] == summary["mdd"]
+            assert metrics.calmar[j] == summary["calmar"]
+            assert metrics.sharpe[j] == calculate_sharpe_ratio(df)
+            assert metrics.sortino[j] == calculate_sortino_ratio(df)
+            assert metrics.month_keys.tolist() == [int(f"{row['year']}{row['month']:02d}") for row in monthly]
+            assert [round(float(v), ROUND_PERCENT) for v in metrics.monthly_returns[:, j]] == [
+                row["return_pct"] for row in monthly
+            ]
+
+    def test_yearly_returns_compound_monthly_returns(self, curves):
+        """
+        목적: 연간 수익률이 같은 연도 비반올림 월별 수익률의 복리 누적과 같은지 검증
+
+        Given: 2019-11 ~ 2023-03 곡선
+        When: compute_curve_metrics
+        Then: 연도 2019~2023, 각 연도 값이 월별 복리 누적과 근사 일치 (변동 없는 곡선은 0)
+        """
+        equity, dates = curves
+        metrics = compute_curve_metrics(equity, dates, 10_000_000.0)
+
+        assert metrics.years.tolist() == [2019, 2020, 2021, 2022, 2023]
+        row_years = metrics.month_keys // 100
+        for k, year in enumerate(metrics.years.tolist()):
+            compounded = np.prod(1.0 + metrics.monthly_returns[row_years == year] / 100.0, axis=0)
+            np.testing.assert_allclose(metrics.yearly_returns[k], (compounded - 1.0) * 100.0, rtol=1e-9)
+        assert metrics.yearly_returns[:, 3].tolist() == [0.0] * 5
+
+    def test_max_drawdown_days(self):
+        """
+        목적: 최장 낙폭 기간이 고점일부터 미회복 마지막 거래일까지의 달력일인지 검증
+
+        Given: 곡선 A (1/2 고점 → 1/3~1/5 하락 → 1/6 회복), 곡선 B (1/3 고점 후 미회복), 곡선 C (단조 증가)
+        When: compute_curve_metrics
+        Then: A = 3일 (1/2 → 1/5), B = 3일 (1/3 → 1/6), C = 0일
+        """
+        dates = [date(2024, 1, d) for d in range(1, 7)]
+        equity = np.array(
+            [
+                [100.0, 100.0, 100.0],
+                [110.0, 105.0, 101.0],
+                [105.0, 120.0, 102.0],
+                [100.0, 110.0, 103.0],
+                [108.0, 115.0, 104.0],
+                [111.0, 119.0, 105.0],
+            ]
+        )
+
+        metrics = compute_curve_metrics(equity, dates, 100.0)
+
+        assert metrics.max_drawdown_days.tolist() == [3, 3, 0]
+
+    @pytest.mark.parametrize(
+        ("equity", "dates", "match"),
+        [
+            (np.ones(3), [date(2024, 1, d) for d in (1, 2, 3)], "2차원"),
+            (np.ones((1, 2)), [date(2024, 1, 1)], "최소 2행"),
+            (np.ones((3, 2)), [date(2024, 1, d) for d in (1, 2)], "날짜 길이 불일치"),
+            (np.ones((3, 2)), [date(2024, 1, d) for d in (1, 3, 2)], "오름차순"),
+        ],
+    )
+    def test_invalid_inputs_raise(self, equity, dates, match):
+        """차원 / 행 수 / 날짜 길이 / 날짜 순서 오류 → ValueError"""
+        with pytest.raises(ValueError, match=match):
+            compute_curve_metrics(equity, dates, 1.0)
+
+
+class TestCalmarRatios:
+    def test_matches_calculate_calmar(self):
+        """MDD=0 안전 처리를 포함해 calculate_calmar와 원소별로 같은 값을 반환한다."""
+        cagr = np.array([12.5, -3.0, 7.0, 0.0, 4.2])
+        mdd = np.array([-25.0, -10.0, 0.0, 0.0, -1e-15])
+
+        result = calmar_ratios(cagr, mdd)
+
+        assert result.tolist() == [calculate_calmar(c, m) for c, m in zip(cagr.tolist(), mdd.tolist(), strict=True)]
@@ -5,11 +5,16 @@
 """
 
 import logging
+import os
+import time
+from datetime import date
+from multiprocessing import shared_memory
 
 import pandas as pd
 import pytest
 
 from qbt.utils import parallel_executor
+from qbt.utils.shared_frames import SharedDataPlane, attach_shared_frames, release_attached_segments
 
 
 def _simple_multiply(x: int) -> int:
@@ -17,6 +22,13 @@ def _simple_multiply(x: int) -> int:
     return x * 2
 
 
+def _record_finish_time(args: tuple[int, float]) -> float:
+    """지정한 시간만큼 대기한 뒤 종료 시각을 반환하는 함수 (측정 작업 지연 재현용)"""
+    x, sleep_seconds = args
+    time.sleep(sleep_seconds)
+    return time.time()
+
+
 def _use_cached_df(multiplier: int) -> int:
     """캐시된 DataFrame을 사용하는 워커 함수"""
     df = parallel_executor.WORKER_CACHE.get("df")
@@ -70,6 +82,77 @@ class TestExecuteParallel:
         expected = [x * 2 for x in inputs]
         assert results == expected
 
+    def test_auto_chunking_preserves_order_for_many_inputs(self):
+        """
+        목적: 자동 묶음 크기로 많은 작업을 제출해도 결과가 입력 순서대로인지 검증
+
+        Given: 짧은 작업 200개, 워커 2개 (측정 후 여러 작업이 한 묶음으로 제출됨)
+        When: execute_parallel 실행 (chunk_size 미지정)
+        Then: 입력 순서대로 x * 2
+        """
+        inputs = list(range(200))
+        results = parallel_executor.execute_parallel(_simple_multiply, inputs, max_workers=2, log_progress=False)
+
+        assert results == [x * 2 for x in inputs]
+
+    def test_slow_probe_does_not_block_remaining_tasks(self):
+        """
+        목적: 측정 작업 중 하나가 느려도 첫 측정 완료 직후 나머지 작업이 제출되는지 검증
+
+        Given: 워커 2개, 첫 작업만 1초 대기, 나머지 20개는 즉시 종료
+        When: execute_parallel 실행 (chunk_size 미지정)
+        Then: 나머지 작업이 모두 느린 측정 작업보다 먼저 끝남
+        """
+        inputs = [(0, 1.0)] + [(x, 0.0) for x in range(1, 21)]
+        finish_times = parallel_executor.execute_parallel(
+            _record_finish_time, inputs, max_workers=2, log_progress=False
+        )
+
+        assert max(finish_times[1:]) < finish_times[0]
+
+    def test_fixed_chunk_size_and_invalid_value(self):
+        """
+        목적: 고정 chunk_size(입력 수의 약수가 아닌 값)가 동작하고, 1 미만은 거부되는지 검증
+
+        Given: 입력 7개
+        When: chunk_size=3으로 실행 / chunk_size=0으로 실행
+        Then: 입력 순서대로 결과, 0은 ValueError
+        """
+        inputs = [{"x": x} for x in range(7)]
+        results = parallel_executor.execute_parallel_with_kwargs(_simple_multiply, inputs, max_workers=2, chunk_size=3)
+
+        assert results == [x * 2 for x in range(7)]
+        with pytest.raises(ValueError, match="chunk_size는 1 이상"):
+            parallel_executor.execute_parallel(_simple_multiply, [1], chunk_size=0)
+
+
+class TestChooseChunkSize:
+    """자동 묶음 크기 결정 테스트"""
+
+    def test_fast_tasks_capped_by_load_balance(self):
+        """
+        목적: 매우 짧은 작업은 묶음이 커지되, 워커당 최소 묶음 수를 지키는지 검증
+
+        Given: 작업당 1µs, 남은 작업 1000개, 워커 2개
+        When: _choose_chunk_size 호출
+        Then: ceil(1000 / (2 * MIN_CHUNKS_PER_WORKER))
+        """
+        size = parallel_executor._choose_chunk_size(1e-6, 1000, 2)
+
+        assert size == -(-1000 // (2 * parallel_executor.MIN_CHUNKS_PER_WORKER))
+
+    def test_slow_tasks_submitted_one_by_one(self):
+        """
+        목적: 목표 묶음 시간보다 긴 작업은 1개씩 제출되는지 검증
+
+        Given: 작업당 TARGET_CHUNK_SECONDS의 2배, 남은 작업 1000개
+        When: _choose_chunk_size 호출
+        Then: 1
+        """
+        size = parallel_executor._choose_chunk_size(parallel_executor.TARGET_CHUNK_SECONDS * 2, 1000, 2)
+
+        assert size == 1
+
 
 class TestWorkerCache:
     """워커 캐시 구조 테스트"""
@@ -137,6 +220,140 @@ class TestWorkerCache:
         assert test_df.loc[0, "A"] == original_value
 
 
+def _sum_shared_close(dummy: int) -> float:
+    """공유 메모리로 전달된 df의 Close 합계를 반환하는 워커 함수"""
+    df = parallel_executor.WORKER_CACHE["df"]
+    return float(df["Close"].sum()) + dummy
+
+
+class TestSharedFrames:
+    """공유 메모리 DataFrame 전달 테스트"""
+
+    def test_attach_reconstructs_frame_zero_copy(self):
+        """
+        목적: 게시 후 재구성한 DataFrame이 원본과 같고, 숫자 컬럼이 공유 버퍼 뷰인지 검증
+
+        Given: Date(date 객체), Open/Close(float), Volume(int) 컬럼 DataFrame
+        When: SharedDataPlane으로 게시 후 attach_shared_frames로 재구성
+        Then: 값/컬럼 순서가 원본과 동일, Close는 읽기 전용 뷰
+        """
+        df = pd.DataFrame(
+            {
+                "Date": [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)],
+                "Open": [100.0, 101.0, 102.0],
+                "Close": [100.5, 101.5, 102.5],
+                "Volume": [1000, 1100, 1200],
+            }
+        )
+
+        with SharedDataPlane({"df": df}) as plane:
+            attached = attach_shared_frames(plane.spec)["df"]
+
+            pd.testing.assert_frame_equal(attached, df)
+            assert not attached["Close"].to_numpy().flags.writeable
+            del attached
+            release_attached_segments()
+
+    def test_segments_released_after_execution(self):
+        """
+        목적: execute_parallel(shared_frames=...) 결과가 정확하고, 종료 후 세그먼트가 해제되는지 검증
+
+        Given: Close 합계가 6.0인 DataFrame
+        When: shared_frames로 전달하여 2개 워커에서 실행
+        Then: 결과 [6.0, 7.0], 실행 후 동일 이름으로 세그먼트 접근 불가
+        """
+        df = pd.DataFrame({"Close": [1.0, 2.0, 3.0]})
+        created: list[str] = []
+        original_init = SharedDataPlane.__init__
+
+        def _recording_init(self, frames):
+            original_init(self, frames)
+            created.extend(block.shm_name for spec in self.spec.values() for block in spec.blocks)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(SharedDataPlane, "__init__", _recording_init)
+            results = parallel_executor.execute_parallel(
+                _sum_shared_close, [0, 1], max_workers=2, shared_frames={"df": df}
+            )
+
+        assert results == [6.0, 7.0]
+        assert created
+        for name in created:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_unsupported_column_raises(self):
+        """
+        목적: 공유 메모리로 전달할 수 없는 문자열 컬럼이 있으면 ValueError 발생
+
+        Given: 문자열 컬럼을 가진 DataFrame
+        When: SharedDataPlane 생성
+        Then: ValueError
+        """
+        df = pd.DataFrame({"ticker": ["QQQ", "SPY"]})
+
+        with pytest.raises(ValueError, match="공유 메모리로 전달할 수 없는 컬럼"):
+            SharedDataPlane({"df": df})
+
+
+def _len_cached_df_with_pid(dummy: int) -> tuple[int, int]:
+    """캐시된 df 길이와 워커 PID를 반환하는 워커 함수"""
+    return len(parallel_executor.WORKER_CACHE["df"]), os.getpid()
+
+
+class TestWorkerPool:
+    """재사용 워커 풀 테스트"""
+
+    def test_reuses_workers_across_cache_updates(self):
+        """
+        목적: 캐시를 교체해도 같은 워커 프로세스가 재사용되고 새 캐시를 읽는지 검증
+
+        Given: 워커 1개 풀
+        When: df(3행) 캐시로 map → df(5행) 캐시로 교체 후 map
+        Then: 각각 3, 5를 반환하고 두 호출의 워커 PID가 동일
+        """
+        with parallel_executor.WorkerPool(max_workers=1) as pool:
+            pool.update_cache(shared_frames={"df": pd.DataFrame({"A": [1.0, 2.0, 3.0]})})
+            first = pool.map(_len_cached_df_with_pid, [0, 1])
+
+            pool.update_cache(shared_frames={"df": pd.DataFrame({"A": [1.0, 2.0, 3.0, 4.0, 5.0]})})
+            second = pool.map(_len_cached_df_with_pid, [0])
+
+        assert [length for length, _ in first] == [3, 3]
+        assert second[0][0] == 5
+        assert first[0][1] == second[0][1]
+
+    def test_map_with_kwargs_and_shutdown(self):
+        """
+        목적: map_with_kwargs가 입력 순서대로 결과를 반환하고, 종료 후 호출은 RuntimeError인지 검증
+
+        Given: 워커 2개 풀, 키워드 입력 3개
+        When: map_with_kwargs 실행 후 shutdown, 다시 map 호출
+        Then: [2, 4, 6], 종료 후 RuntimeError
+        """
+        pool = parallel_executor.WorkerPool(max_workers=2)
+        results = pool.map_with_kwargs(_simple_multiply, [{"x": 1}, {"x": 2}, {"x": 3}])
+        pool.shutdown()
+
+        assert results == [2, 4, 6]
+        with pytest.raises(RuntimeError, match="이미 종료된 WorkerPool"):
+            pool.map(_simple_multiply, [1])
+
+    def test_imap_completed_yields_every_index_once(self):
+        """
+        목적: imap_completed가 모든 입력을 (입력 인덱스, 결과)로 한 번씩 내보내는지 검증
+
+        Given: 워커 2개 풀, df(4행) 캐시, 입력 [1, 2, 3]
+        When: imap_completed로 완료 순서대로 수집
+        Then: 인덱스로 정렬하면 [(0, 4), (1, 8), (2, 12)]
+        """
+        with parallel_executor.WorkerPool(max_workers=2) as pool:
+            pool.update_cache(shared_frames={"df": pd.DataFrame({"A": [1.0, 2.0, 3.0, 4.0]})})
+            collected = list(pool.imap_completed(_use_cached_df, [1, 2, 3]))
+
+        assert sorted(collected) == [(0, 4), (1, 8), (2, 12)]
+
+
 class TestLogProgress:
     """log_progress 파라미터 테스트
 
@@ -15,6 +15,7 @@ from qbt.backtest.engines.portfolio_engine import (
 )
 from qbt.backtest.engines.portfolio_execution import (
     ExecutionResult,
+    PortfolioBook,
     execute_orders,
 )
 from qbt.backtest.engines.portfolio_planning import (
@@ -1095,3 +1096,92 @@ class TestExecuteOrdersOpenPriceInvariant:
                 entry_hold_days=entry_hold_days,
                 current_date=current_date,
             )
+
+
+# ============================================================================
+# PortfolioBook (슬롯 순서 고정 인덱스 장부)
+# ============================================================================
+
+
+class TestPortfolioBook:
+    """PortfolioBook.execute()가 execute_orders와 같은 결과를 인덱스 리스트로 반영하는지 검증한다."""
+
+    @staticmethod
+    def _intents() -> dict[str, OrderIntent]:
+        return {
+            "qqq": OrderIntent(
+                asset_id="qqq",
+                intent_type="REDUCE_TO_TARGET",
+                current_amount=12_000.0,
+                target_amount=9_000.0,
+                delta_amount=-3_000.0,
+                target_weight=0.3,
+                reason="rebalance",
+            ),
+            "gld": OrderIntent(
+                asset_id="gld",
+                intent_type="ENTER_TO_TARGET",
+                current_amount=0.0,
+                target_amount=5_000.0,
+                delta_amount=5_000.0,
+                target_weight=0.5,
+                reason="signal buy",
+                hold_days_used=2,
+            ),
+        }
+
+    def test_execute_matches_execute_orders(self) -> None:
+        """
+        목적: 장부 체결 결과가 dict 기반 execute_orders 결과와 같다.
+
+        Given: spy/qqq/gld 장부 (qqq 120주 보유), qqq REDUCE + gld ENTER intent
+        When:  book.execute() / execute_orders() 각각 호출
+        Then:  현금, 자산별 보유/진입 정보, 거래 기록, rebalanced 플래그가 동일,
+               qqq 실현손익이 누적되고 intent가 없는 spy는 변하지 않음
+        """
+        # Given
+        current_date = date(2024, 3, 1)
+        book = PortfolioBook.open(["spy", "qqq", "gld"], 1_000.0)
+        book.positions[1] = 120
+        book.entry_prices[1] = 90.0
+        book.entry_dates[1] = date(2024, 1, 2)
+        book.entry_hold_days[1] = 3
+        open_prices = [400.0, 100.0, 180.0]
+
+        # When
+        expected = execute_orders(
+            order_intents=self._intents(),
+            open_prices=dict(zip(book.asset_ids, open_prices, strict=True)),
+            current_positions={"spy": 0, "qqq": 120, "gld": 0},
+            current_cash=1_000.0,
+            entry_prices={"spy": 0.0, "qqq": 90.0, "gld": 0.0},
+            entry_dates={"spy": None, "qqq": date(2024, 1, 2), "gld": None},
+            entry_hold_days={"spy": 0, "qqq": 3, "gld": 0},
+            current_date=current_date,
+        )
+        new_trades, rebalanced_today = book.execute(self._intents(), open_prices, current_date)
+
+        # Then
+        assert book.cash == expected.updated_cash
+        assert book.positions == [expected.updated_positions[aid] for aid in book.asset_ids]
+        assert book.entry_prices == [expected.updated_entry_prices[aid] for aid in book.asset_ids]
+        assert book.entry_dates == [expected.updated_entry_dates[aid] for aid in book.asset_ids]
+        assert book.entry_hold_days == [expected.updated_entry_hold_days[aid] for aid in book.asset_ids]
+        assert new_trades == expected.new_trades
+        assert rebalanced_today is expected.rebalanced_today is True
+        assert book.realized_pnl == [0.0, expected.new_trades[0]["pnl"], 0.0]
+        assert book.positions[0] == 0 and book.entry_dates[0] is None
+
+    def test_empty_intents_leave_book_unchanged(self) -> None:
+        """intent가 없으면 체결 없이 ([], False)를 반환하고 장부를 바꾸지 않는다."""
+        book = PortfolioBook.open(["spy", "qqq"], 10_000.0)
+
+        assert book.execute({}, [400.0, 100.0], date(2024, 3, 1)) == ([], False)
+        assert book == PortfolioBook.open(["spy", "qqq"], 10_000.0)
+
+    def test_market_values_follow_index_order(self) -> None:
+        """평가액은 position × close를 자산 인덱스 순서로 반환한다."""
+        book = PortfolioBook.open(["spy", "qqq"], 0.0)
+        book.positions[:] = [3, 0]
+
+        assert book.market_values([400.5, 100.0]) == [3 * 400.5, 0.0]
@@ -0,0 +1,145 @@
+"""포트폴리오 배치 시뮬레이션 커널 테스트
+
+portfolio_kernel.run_portfolio_batch()가 비중/임계값 조합별 run_portfolio_backtest와
+동일한 결과를 내는지, 시그널 가정이 깨진 조합을 diverged로 표시하는지, 입력 검증이 동작하는지 검증한다.
+"""
+
+import dataclasses
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.engines.portfolio_engine import run_portfolio_backtest
+from qbt.backtest.engines.portfolio_kernel import build_signal_panel, run_portfolio_batch
+from qbt.backtest.engines.portfolio_rebalance import RebalancePolicy
+from qbt.backtest.portfolio_types import AssetSlotConfig, PortfolioConfig
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_HIGH, COL_LOW, COL_OPEN, COL_VOLUME
+
+
+def _make_random_walk_df(seed: int, n_rows: int = 260, base_price: float = 100.0) -> pd.DataFrame:
+    """돌파/이탈이 반복되는 평일 랜덤워크 주가 데이터."""
+    rng = np.random.default_rng(seed)
+    dates: list[date] = []
+    current = date(2023, 1, 2)
+    while len(dates) < n_rows:
+        if current.weekday() < 5:
+            dates.append(current)
+        current += timedelta(days=1)
+    closes = base_price * np.cumprod(1 + rng.normal(0.0, 0.02, n_rows))
+    opens = closes * (1 + rng.normal(0.0, 0.005, n_rows))
+    return pd.DataFrame(
+        {
+            COL_DATE: dates,
+            COL_OPEN: opens,
+            COL_HIGH: np.maximum(opens, closes) * 1.01,
+            COL_LOW: np.minimum(opens, closes) * 0.99,
+            COL_CLOSE: closes,
+            COL_VOLUME: [1_000_000] * n_rows,
+        }
+    )
+
+
+def _with_weights(config: PortfolioConfig, weights: np.ndarray) -> PortfolioConfig:
+    """슬롯 순서대로 target_weight만 바꾼 설정."""
+    slots = tuple(
+        dataclasses.replace(slot, target_weight=float(weights[j])) for j, slot in enumerate(config.asset_slots)
+    )
+    return dataclasses.replace(config, asset_slots=slots)
+
+
+@pytest.fixture
+def three_asset_config(tmp_path, create_csv_file) -> PortfolioConfig:  # type: ignore[no-untyped-def]
+    """버퍼존 2개 + Buy&Hold 1개 구성 (3자산: 에쿼티 합산 순서가 결과 비트에 영향을 주는 크기)."""
+    paths: dict[str, Path] = {
+        aid: create_csv_file(f"{aid.upper()}_max.csv", _make_random_walk_df(seed, base_price=price))
+        for aid, seed, price in (("aaa", 1, 100.0), ("bbb", 2, 40.0), ("ccc", 3, 250.0))
+    }
+    slots = (
+        AssetSlotConfig("aaa", paths["aaa"], paths["aaa"], 0.4, ma_window=20, hold_days=0),
+        AssetSlotConfig("bbb", paths["bbb"], paths["bbb"], 0.4, ma_window=10, buy_buffer_zone_pct=0.01),
+        AssetSlotConfig("ccc", paths["ccc"], paths["ccc"], 0.2, strategy_id="buy_and_hold"),
+    )
+    return PortfolioConfig(
+        experiment_name="kernel_test",
+        display_name="kernel_test",
+        asset_slots=slots,
+        total_capital=10_000_000.0,
+        result_dir=tmp_path / "kernel_test",
+    )
+
+
+class TestRunPortfolioBatch:
+    """배치 커널 vs 포트폴리오 엔진 일치성 테스트"""
+
+    def test_matches_run_portfolio_backtest_per_combination(self, three_asset_config):  # type: ignore[no-untyped-def]
+        """
+        목적: 비중/임계값 조합을 한 번에 평가한 결과가 조합별 run_portfolio_backtest와 비트 단위로 일치하는지 검증
+
+        Given: 3자산 구성, 비중 벡터 4개(합계 1.0 미만 포함) × 임계값 쌍 (작은 값 포함 → 리밸런싱 빈발)
+        When: run_portfolio_batch 1회 호출 / 조합별 run_portfolio_backtest(rebalance_policy) 호출
+        Then: 일별 equity, final_capital, mdd, 거래 수, 승리 거래 수가 모두 동일하고 diverged 조합 없음
+        """
+        config = three_asset_config
+        weights = np.array([[0.4, 0.4, 0.2], [0.1, 0.6, 0.3], [0.6, 0.2, 0.15], [0.3, 0.3, 0.3]])
+        monthly = np.array([0.10, 0.02, 0.05, 0.20])
+        daily = np.array([0.20, 0.05, 0.50, 0.10])
+        panel = build_signal_panel(config)
+
+        batch = run_portfolio_batch(panel, weights, monthly, daily, config.total_capital, record_equity=True)
+
+        assert batch.equity is not None
+        assert not batch.diverged.any()
+        for k in range(len(weights)):
+            result = run_portfolio_backtest(
+                _with_weights(config, weights[k]),
+                capture_level="summary",
+                rebalance_policy=RebalancePolicy(float(monthly[k]), float(daily[k])),
+            )
+            np.testing.assert_array_equal(batch.equity[:, k], result.equity_df["equity"].to_numpy())
+            assert batch.final_capital[k] == result.summary["final_capital"]
+            assert batch.mdd[k] == result.summary["mdd"]
+            assert batch.total_trades[k] == result.summary["total_trades"]
+            assert batch.winning_trades[k] == result.summary["winning_trades"]
+
+        # 검증 데이터가 실제로 시그널 매매와 리밸런싱을 발생시키는지 확인 (무의미한 일치 방지)
+        assert panel.exit.any()
+        assert batch.total_trades.min() > panel.exit.sum()
+
+    def test_zero_share_entry_is_flagged_diverged(self, three_asset_config):  # type: ignore[no-untyped-def]
+        """
+        목적: 목표 금액이 1주 가격보다 작아 진입 수량이 0주가 되면 diverged로 표시되는지 검증
+
+        Given: 초기 자본 1,000원, 주가 40~250원 (5% 비중 = 50원 → 일부 자산 0주 진입)
+        When: run_portfolio_batch
+        Then: 해당 조합은 diverged, 충분한 비중 조합은 diverged 아님
+        """
+        panel = build_signal_panel(three_asset_config)
+        weights = np.array([[0.05, 0.05, 0.9], [0.3, 0.3, 0.4]])
+
+        batch = run_portfolio_batch(panel, weights, np.array([0.1, 0.1]), np.array([0.2, 0.2]), 1_000.0)
+
+        assert batch.diverged.tolist() == [True, False]
+
+    @pytest.mark.parametrize(
+        "weights, match",
+        [
+            (np.array([[0.5, 0.5, 0.0]]), "0보다 커야"),
+            (np.array([[0.5, 0.4, 0.2]]), "1.0을 초과"),
+            (np.array([[0.5, 0.5]]), "shape"),
+        ],
+    )
+    def test_invalid_weights_raise(self, three_asset_config, weights, match):  # type: ignore[no-untyped-def]
+        """
+        목적: 엔진이 지원하지 않는 비중(0 비중, 합계 초과, 자산 수 불일치)은 ValueError
+
+        Given: 유효하지 않은 비중 행렬
+        When: run_portfolio_batch
+        Then: ValueError
+        """
+        panel = build_signal_panel(three_asset_config)
+
+        with pytest.raises(ValueError, match=match):
+            run_portfolio_batch(panel, weights, np.array([0.1]), np.array([0.2]), 10_000_000.0)
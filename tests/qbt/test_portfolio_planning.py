@@ -552,6 +552,30 @@ class TestMergeIntents:
         assert "qqq" in merged
         assert merged["qqq"].intent_type == "REDUCE_TO_TARGET"
 
+    def test_merged_order_is_deterministic(self) -> None:
+        """
+        목적: 병합 결과의 자산 순서가 해시 시드와 무관하게 signal → rebalance 등장 순서인지 검증.
+
+        Given: signal={tlt, qqq}, rebalance={gld, qqq}
+        When:  merge_intents() 호출
+        Then:  list(merged) == ["tlt", "qqq", "gld"] (체결 순서/현금 합산 순서가 실행마다 같음)
+        """
+        # Given
+        signal_intents: dict[str, Any] = {
+            "tlt": self._make_intent("tlt", "EXIT_ALL"),
+            "qqq": self._make_intent("qqq", "ENTER_TO_TARGET"),
+        }
+        rebalance_intents: dict[str, Any] = {
+            "gld": self._make_intent("gld", "REDUCE_TO_TARGET", delta_amount=-100.0),
+            "qqq": self._make_intent("qqq", "INCREASE_TO_TARGET", delta_amount=100.0),
+        }
+
+        # When
+        merged = merge_intents(signal_intents, rebalance_intents)
+
+        # Then
+        assert list(merged) == ["tlt", "qqq", "gld"]
+
 
 class TestDualTriggerThreshold:
     """이중 트리거 임계값 계약 테스트.
@@ -0,0 +1,128 @@
+"""포트폴리오 기록기 테스트
+
+PortfolioRecorder가 컬럼 배열에 기록한 값을 기존 행 dict 기반 DataFrame과 같은
+컬럼 순서/dtype/값으로 복원하는지, build_combined_equity가 기록기를 직접 소비하는지 검증한다.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.engines.portfolio_data import build_combined_equity
+from qbt.backtest.engines.portfolio_recorder import CategoryColumn, PortfolioRecorder
+
+
+def _record_two_days() -> PortfolioRecorder:
+    """2자산 × 2거래일 기록 (첫날 미보유, 둘째 날 qqq 10주 보유)."""
+    recorder = PortfolioRecorder(["qqq", "gld"], n_days=2)
+    recorder.record_portfolio(0, date(2024, 1, 2), 1000.0, 1000.0, False, "", False)
+    recorder.record_portfolio(1, date(2024, 1, 3), 1010.0, 0.0, True, "monthly", True)
+    for j in range(2):
+        recorder.record_holding(0, j, 100.0, 0, 0.0, "sell", 0.0, 0.0, 0.0)
+        recorder.record_orders(0, j, "hold", "", "", 0.0, "", "", 0, 0.0)
+    recorder.record_holding(1, 0, 101.0, 10, 1.0, "buy", 100.0, 0.0, 10.0)
+    recorder.record_orders(1, 0, "buy", "ENTER_TO_TARGET", "signal buy", 500.0, "ENTER_TO_TARGET", "buy", 10, 100.0)
+    recorder.record_holding(1, 1, 50.0, 0, 0.0, "sell", 0.0, 0.0, 0.0)
+    recorder.record_orders(1, 1, "hold", "", "", 0.0, "", "", 0, 0.0)
+    return recorder
+
+
+class TestCategoryColumn:
+    """범주 코드 컬럼 테스트"""
+
+    def test_codes_roundtrip_to_strings(self):
+        """
+        목적: 문자열이 정수 코드로 저장되고 같은 문자열로 복원되는지 검증
+
+        Given: 빈 문자열이 코드 0인 범주 컬럼
+        When: "buy", "sell", "buy", "" 순서로 기록 후 복원
+        Then: 코드는 [1, 2, 1, 0], 복원 값은 원래 문자열 (object 배열)
+        """
+        column = CategoryColumn((4,))
+        for i, value in enumerate(["buy", "sell", "buy", ""]):
+            column.codes[i] = column.code_of(value)
+
+        decoded = column.decode(column.codes)
+
+        assert column.codes.tolist() == [1, 2, 1, 0]
+        assert decoded.dtype == object
+        assert decoded.tolist() == ["buy", "sell", "buy", ""]
+
+
+class TestPortfolioRecorder:
+    """기록기 → DataFrame 변환 테스트"""
+
+    def test_state_log_frame_matches_row_dict_frame(self):
+        """
+        목적: state_log_frame이 행 dict 목록으로 만든 DataFrame과 완전히 같은지 검증
+
+        Given: 2자산 × 2거래일 기록
+        When: state_log_frame() 호출
+        Then: 같은 값을 행 dict로 만든 DataFrame과 equals, 컬럼 순서/dtype 동일
+        """
+        rows = []
+        for i, (d, equity, cash, month_start, rebalanced, reason) in enumerate(
+            [
+                (date(2024, 1, 2), 1000.0, 1000.0, False, False, ""),
+                (date(2024, 1, 3), 1010.0, 0.0, True, True, "monthly"),
+            ]
+        ):
+            row: dict[str, object] = {"Date": d, "equity": equity, "cash": cash, "is_month_start": month_start}
+            row.update({"rebalanced": rebalanced, "rebalance_reason": reason})
+            bought = i == 1
+            for aid, close in (("qqq", 101.0 if bought else 100.0), ("gld", 50.0 if bought else 100.0)):
+                filled = bought and aid == "qqq"
+                row.update(
+                    {
+                        f"{aid}_close": close,
+                        f"{aid}_shares": 10 if filled else 0,
+                        f"{aid}_weight": 1.0 if filled else 0.0,
+                        f"{aid}_signal_today": "buy" if filled else "hold",
+                        f"{aid}_pending_intent": "ENTER_TO_TARGET" if filled else "",
+                        f"{aid}_pending_reason": "signal buy" if filled else "",
+                        f"{aid}_pending_delta": 500.0 if filled else 0.0,
+                        f"{aid}_executed_intent": "ENTER_TO_TARGET" if filled else "",
+                        f"{aid}_exec_side": "buy" if filled else "",
+                        f"{aid}_exec_shares": 10 if filled else 0,
+                        f"{aid}_exec_price": 100.0 if filled else 0.0,
+                    }
+                )
+            rows.append(row)
+
+        result = _record_two_days().state_log_frame()
+
+        pd.testing.assert_frame_equal(result, pd.DataFrame(rows))
+
+    def test_build_combined_equity_consumes_recorder(self):
+        """
+        목적: build_combined_equity가 기록기 배열로 기본/파생 컬럼을 계산하는지 검증
+
+        Given: 둘째 날 qqq 10주(평가액 1010, 평균가 100) 보유 기록
+        When: build_combined_equity(recorder, 1000.0)
+        Then: qqq_value=1010, current_price=101, return_pct=1%, contribution=10, total_pnl=10, drawdown 0
+        """
+        equity_df = build_combined_equity(_record_two_days(), 1000.0)
+
+        last = equity_df.iloc[1]
+        assert list(equity_df.columns[:5]) == ["Date", "equity", "cash", "rebalanced", "rebalance_reason"]
+        assert last["qqq_value"] == pytest.approx(1010.0)
+        assert last["qqq_current_price"] == pytest.approx(101.0)
+        assert last["qqq_return_pct"] == pytest.approx(1.0)
+        assert last["qqq_contribution"] == pytest.approx(10.0)
+        assert last["gld_current_price"] == 0.0
+        assert last["total_pnl"] == pytest.approx(10.0)
+        np.testing.assert_array_equal(equity_df["drawdown_pct"].to_numpy(), [0.0, 0.0])
+        assert equity_df["qqq_shares"].dtype == np.int64
+
+    def test_invalid_capital_raises(self):
+        """
+        목적: initial_capital이 양수가 아니면 ValueError
+
+        Given: 기록기
+        When: build_combined_equity(recorder, 0.0)
+        Then: ValueError
+        """
+        with pytest.raises(ValueError, match="initial_capital은 양수"):
+            build_combined_equity(_record_two_days(), 0.0)
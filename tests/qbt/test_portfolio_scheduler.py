@@ -0,0 +1,153 @@
+"""포트폴리오 실험 스케줄러 테스트
+
+run_portfolio_experiments가 데이터를 경로당 1회만 로딩하고,
+병렬 실행 결과가 개별 run_portfolio_backtest와 같으며 실험 목록 순서로 반환되는지 검증한다.
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from qbt.backtest import portfolio_scheduler
+from qbt.backtest.engines.portfolio_engine import run_portfolio_backtest
+from qbt.backtest.portfolio_scheduler import collect_portfolio_data_paths, run_portfolio_experiments
+from qbt.backtest.portfolio_types import AssetSlotConfig, PortfolioConfig, PortfolioResult
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_HIGH, COL_LOW, COL_OPEN, COL_VOLUME
+
+
+def _make_stock_df(n_rows: int = 80, base_price: float = 100.0) -> pd.DataFrame:
+    """상승 후 하락하는 평일 주가 데이터 (buy → sell 전환 포함)."""
+    dates: list[date] = []
+    current = date(2024, 1, 2)
+    while len(dates) < n_rows:
+        if current.weekday() < 5:
+            dates.append(current)
+        current += timedelta(days=1)
+    closes = [base_price] * 10 + [base_price * 1.12] * 40 + [base_price * 0.82] * (n_rows - 50)
+    return pd.DataFrame(
+        {
+            COL_DATE: dates,
+            COL_OPEN: [c - 0.5 for c in closes],
+            COL_HIGH: [c + 1.0 for c in closes],
+            COL_LOW: [c - 1.0 for c in closes],
+            COL_CLOSE: closes,
+            COL_VOLUME: [1_000_000] * n_rows,
+        }
+    )
+
+
+def _make_config(name: str, paths: dict[str, Path], result_dir: Path, ma_window: int = 5) -> PortfolioConfig:
+    """자산별 동일 비중 설정 (signal/trade 경로 동일)."""
+    slots = tuple(
+        AssetSlotConfig(
+            asset_id=aid,
+            signal_data_path=path,
+            trade_data_path=path,
+            target_weight=1.0 / len(paths),
+            ma_window=ma_window,
+        )
+        for aid, path in paths.items()
+    )
+    return PortfolioConfig(
+        experiment_name=name,
+        display_name=name,
+        asset_slots=slots,
+        total_capital=10_000_000.0,
+        result_dir=result_dir / name,
+    )
+
+
+@pytest.fixture
+def three_configs(tmp_path, create_csv_file) -> list[PortfolioConfig]:  # type: ignore[no-untyped-def]
+    """데이터 경로 2개를 서로 겹쳐 쓰는 실험 3개."""
+    path_a = create_csv_file("ASSET_A_max.csv", _make_stock_df())
+    path_b = create_csv_file("ASSET_B_max.csv", _make_stock_df(base_price=50.0))
+    return [
+        _make_config("exp_ab", {"asset_a": path_a, "asset_b": path_b}, tmp_path),
+        _make_config("exp_a", {"asset_a": path_a}, tmp_path, ma_window=10),
+        _make_config("exp_ba", {"asset_b": path_b, "asset_a": path_a}, tmp_path),
+    ]
+
+
+class TestCollectPortfolioDataPaths:
+    """데이터 경로 수집 테스트"""
+
+    def test_unique_paths_in_first_appearance_order(self, three_configs):  # type: ignore[no-untyped-def]
+        """
+        목적: 여러 실험이 같은 경로를 참조해도 경로는 1번만, 등장 순서대로 수집되는지 검증
+
+        Given: 경로 2개(A, B)를 서로 다른 조합으로 참조하는 실험 3개
+        When: collect_portfolio_data_paths 호출
+        Then: [A, B]
+        """
+        paths = collect_portfolio_data_paths(three_configs)
+
+        assert [p.name for p in paths] == ["ASSET_A_max.csv", "ASSET_B_max.csv"]
+
+
+class TestRunPortfolioExperiments:
+    """실험 일괄 실행 테스트"""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_individual_runs_in_config_order(self, three_configs, max_workers):  # type: ignore[no-untyped-def]
+        """
+        목적: 일괄 실행 결과가 실험별 개별 실행과 같고, 반환 순서가 실험 목록 순서인지 검증
+
+        Given: 실험 3개, 실험별 시작일 하한(exp_a만 지정)
+        When: run_portfolio_experiments(max_workers=1 또는 2, on_result=수집)
+        Then:
+          - 반환 순서 = 실험 목록 순서
+          - trades_df/equity_df/summary가 개별 run_portfolio_backtest와 동일
+          - on_result가 실험마다 1번씩 호출됨
+        """
+        start_dates = {"exp_a": date(2024, 2, 1)}
+        completed: list[str] = []
+
+        def _on_result(result: PortfolioResult) -> None:
+            completed.append(result.config.experiment_name)
+
+        results = run_portfolio_experiments(
+            three_configs, start_dates=start_dates, max_workers=max_workers, on_result=_on_result
+        )
+
+        assert [r.config.experiment_name for r in results] == ["exp_ab", "exp_a", "exp_ba"]
+        assert sorted(completed) == ["exp_a", "exp_ab", "exp_ba"]
+        for config, result in zip(three_configs, results, strict=True):
+            expected = run_portfolio_backtest(config, start_date=start_dates.get(config.experiment_name))
+            pd.testing.assert_frame_equal(result.trades_df, expected.trades_df)
+            pd.testing.assert_frame_equal(result.equity_df, expected.equity_df)
+            assert result.summary == expected.summary
+
+    def test_loads_each_path_once(self, three_configs, monkeypatch):  # type: ignore[no-untyped-def]
+        """
+        목적: 실험 수와 무관하게 데이터 경로당 CSV 로딩이 1회인지 검증
+
+        Given: 경로 2개를 참조하는 실험 3개, load_stock_data 호출 기록
+        When: 순차 실행(max_workers=1)
+        Then: 로딩 호출은 경로별 1회 (총 2회)
+        """
+        loaded: list[str] = []
+        original = portfolio_scheduler.load_stock_data
+
+        def _spy(path: Path) -> pd.DataFrame:
+            loaded.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(portfolio_scheduler, "load_stock_data", _spy)
+
+        run_portfolio_experiments(three_configs)
+
+        assert sorted(loaded) == ["ASSET_A_max.csv", "ASSET_B_max.csv"]
+
+    def test_duplicate_experiment_name_raises(self, three_configs):  # type: ignore[no-untyped-def]
+        """
+        목적: 같은 experiment_name이 두 번 있으면 결과 디렉토리가 겹치므로 ValueError
+
+        Given: 같은 실험이 두 번 포함된 목록
+        When: run_portfolio_experiments 호출
+        Then: ValueError
+        """
+        with pytest.raises(ValueError, match="중복된 experiment_name"):
+            run_portfolio_experiments([three_configs[0], three_configs[0]])
@@ -0,0 +1,163 @@
+"""포트폴리오 비중/리밸런싱 임계값 탐색 테스트
+
+generate_weight_grid의 격자 생성 규칙과, run_portfolio_search의 순위표가
+조합별 run_portfolio_backtest 결과와 같은지(엔진 재계산 경로 포함) 검증한다.
+"""
+
+import dataclasses
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.engines.portfolio_engine import run_portfolio_backtest
+from qbt.backtest.engines.portfolio_rebalance import RebalancePolicy
+from qbt.backtest.portfolio_search import generate_weight_grid, run_portfolio_search
+from qbt.backtest.portfolio_types import AssetSlotConfig, PortfolioConfig
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_HIGH, COL_LOW, COL_OPEN, COL_VOLUME
+
+
+def _make_random_walk_df(seed: int, n_rows: int = 200, base_price: float = 100.0) -> pd.DataFrame:
+    """평일 랜덤워크 주가 데이터."""
+    rng = np.random.default_rng(seed)
+    dates: list[date] = []
+    current = date(2023, 1, 2)
+    while len(dates) < n_rows:
+        if current.weekday() < 5:
+            dates.append(current)
+        current += timedelta(days=1)
+    closes = base_price * np.cumprod(1 + rng.normal(0.0, 0.02, n_rows))
+    return pd.DataFrame(
+        {
+            COL_DATE: dates,
+            COL_OPEN: closes * 0.998,
+            COL_HIGH: closes * 1.01,
+            COL_LOW: closes * 0.99,
+            COL_CLOSE: closes,
+            COL_VOLUME: [1_000_000] * n_rows,
+        }
+    )
+
+
+@pytest.fixture
+def two_asset_config(tmp_path, create_csv_file) -> PortfolioConfig:  # type: ignore[no-untyped-def]
+    """버퍼존 1개 + Buy&Hold 1개 구성."""
+    path_a = create_csv_file("AAA_max.csv", _make_random_walk_df(11))
+    path_b = create_csv_file("BBB_max.csv", _make_random_walk_df(12, base_price=300.0))
+    return PortfolioConfig(
+        experiment_name="search_test",
+        display_name="search_test",
+        asset_slots=(
+            AssetSlotConfig("aaa", path_a, path_a, 0.5, ma_window=10, hold_days=0),
+            AssetSlotConfig("bbb", path_b, path_b, 0.5, strategy_id="buy_and_hold"),
+        ),
+        total_capital=10_000_000.0,
+        result_dir=tmp_path / "search_test",
+    )
+
+
+def _engine_summary(config: PortfolioConfig, row: pd.Series) -> dict[str, float]:
+    """순위표 한 행의 조합을 엔진으로 실행한 요약 지표."""
+    slots = tuple(
+        dataclasses.replace(slot, target_weight=float(row[f"{slot.asset_id}_weight"])) for slot in config.asset_slots
+    )
+    policy = RebalancePolicy(float(row["monthly_threshold_rate"]), float(row["daily_threshold_rate"]))
+    result = run_portfolio_backtest(
+        dataclasses.replace(config, asset_slots=slots), capture_level="none", rebalance_policy=policy
+    )
+    return dict(result.summary)  # type: ignore[arg-type]
+
+
+class TestGenerateWeightGrid:
+    """목표 비중 격자 생성 테스트"""
+
+    def test_two_assets_quarter_step(self):
+        """
+        목적: 합계 1.0, step 간격, 0 비중 제외 규칙 검증
+
+        Given: 자산 2개, step=0.25
+        When: generate_weight_grid
+        Then: [[0.25, 0.75], [0.5, 0.5], [0.75, 0.25]]
+        """
+        grid = generate_weight_grid(2, 0.25)
+
+        np.testing.assert_allclose(grid, [[0.25, 0.75], [0.5, 0.5], [0.75, 0.25]])
+
+    def test_min_weight_and_partial_total(self):
+        """
+        목적: min_weight 하한과 total < 1.0(나머지 현금) 처리 검증
+
+        Given: 자산 3개, step=0.1, min_weight=0.2, total=0.9
+        When: generate_weight_grid
+        Then: 모든 행의 합이 0.9, 모든 비중 ≥ 0.2, 조합 수는 정수 분할 수(10개)와 같음
+        """
+        grid = generate_weight_grid(3, 0.1, min_weight=0.2, total=0.9)
+
+        np.testing.assert_allclose(grid.sum(axis=1), 0.9)
+        assert (grid >= 0.2 - 1e-12).all()
+        assert grid.shape == (10, 3)
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"n_assets": 2, "step": 0.3}, "정수배"),
+            ({"n_assets": 2, "step": 0.1, "min_weight": 0.0}, "min_weight"),
+            ({"n_assets": 3, "step": 0.5}, "비중 벡터가 없습니다"),
+        ],
+    )
+    def test_invalid_arguments_raise(self, kwargs, match):  # type: ignore[no-untyped-def]
+        """
+        목적: 나누어 떨어지지 않는 step, 0 이하 최소 비중, 해가 없는 조건은 ValueError
+
+        Given: 유효하지 않은 인자
+        When: generate_weight_grid
+        Then: ValueError
+        """
+        with pytest.raises(ValueError, match=match):
+            generate_weight_grid(**kwargs)
+
+
+class TestRunPortfolioSearch:
+    """비중/임계값 탐색 순위표 테스트"""
+
+    def test_ranked_table_matches_engine(self, two_asset_config):  # type: ignore[no-untyped-def]
+        """
+        목적: 순위표가 전 조합을 포함하고 Calmar 내림차순이며, 각 행 지표가 엔진 실행 결과와 같은지 검증
+
+        Given: 비중 3개 × 월간 임계값 2개 × 일간 임계값 2개 = 12개 조합
+        When: run_portfolio_search
+        Then:
+          - 12행, Calmar 내림차순, 전부 배치 커널로 평가됨
+          - 행별 final_capital/cagr/mdd/calmar/total_trades/win_rate가 run_portfolio_backtest 요약과 동일
+        """
+        grid = generate_weight_grid(2, 0.25)
+
+        results_df = run_portfolio_search(two_asset_config, grid, [0.05, 0.10], [0.20, 0.30], batch_size=5)
+
+        assert len(results_df) == 12
+        assert results_df["calmar"].is_monotonic_decreasing
+        assert (results_df["evaluated_by"] == "kernel").all()
+        for _, row in results_df.iterrows():
+            summary = _engine_summary(two_asset_config, row)
+            for key in ("final_capital", "cagr", "mdd", "calmar", "total_trades", "win_rate"):
+                assert row[key] == summary[key], key
+
+    def test_diverged_combinations_fall_back_to_engine(self, two_asset_config):  # type: ignore[no-untyped-def]
+        """
+        목적: 진입 수량이 0주가 되는 조합은 엔진으로 재계산되어 엔진 결과가 그대로 기록되는지 검증
+
+        Given: 초기 자본 2,000원 (BBB 1주 ≈ 300원 → 10% 비중은 0주 진입)
+        When: run_portfolio_search
+        Then: 해당 조합은 evaluated_by == "engine"이고 지표가 엔진 결과와 동일
+        """
+        config = dataclasses.replace(two_asset_config, total_capital=2_000.0)
+        grid = np.array([[0.9, 0.1], [0.5, 0.5]])
+
+        results_df = run_portfolio_search(config, grid, [0.10], [0.20])
+
+        engine_rows = results_df[results_df["evaluated_by"] == "engine"]
+        assert engine_rows["bbb_weight"].tolist() == [0.1]
+        summary = _engine_summary(config, engine_rows.iloc[0])
+        assert engine_rows.iloc[0]["final_capital"] == summary["final_capital"]
+        assert engine_rows.iloc[0]["calmar"] == summary["calmar"]
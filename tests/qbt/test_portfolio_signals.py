@@ -0,0 +1,127 @@
+"""포트폴리오 자산별 시그널 사전 계산 테스트
+
+PrecomputedSignalStrategy가 엔진의 호출 패턴(통상 경로 + 포지션이 어긋난 날)에서
+전략을 매일 호출한 결과와 같은지, SignalTrackStore가 같은 슬롯 파라미터/데이터의 트랙을 재사용하는지 검증한다.
+"""
+
+import dataclasses
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.backtest.engines.portfolio_planning import create_strategy_for_slot
+from qbt.backtest.engines.portfolio_signals import PrecomputedSignalStrategy, SignalTrackStore
+from qbt.backtest.feature_store import with_moving_averages
+from qbt.backtest.portfolio_types import AssetSlotConfig
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_OPEN
+
+
+def _make_signal_df(seed: int, n_rows: int = 300, ma_window: int = 10) -> pd.DataFrame:
+    """MA 워밍업 구간을 잘라낸 평일 랜덤워크 시그널 데이터."""
+    rng = np.random.default_rng(seed)
+    dates: list[date] = []
+    current = date(2023, 1, 2)
+    while len(dates) < n_rows + ma_window:
+        if current.weekday() < 5:
+            dates.append(current)
+        current += timedelta(days=1)
+    closes = 100.0 * np.cumprod(1 + rng.normal(0.0, 0.02, len(dates)))
+    df = pd.DataFrame({COL_DATE: dates, COL_OPEN: closes, COL_CLOSE: closes})
+    df = with_moving_averages(df, [ma_window], "ema")
+    return df.iloc[ma_window:].reset_index(drop=True)
+
+
+@pytest.fixture
+def buffer_slot() -> AssetSlotConfig:
+    """유지일수와 매수 버퍼가 있는 버퍼존 슬롯 (hold_state 경로 포함)."""
+    path = Path("AAA_max.csv")
+    return AssetSlotConfig("aaa", path, path, 0.5, ma_window=10, buy_buffer_zone_pct=0.01, hold_days=2)
+
+
+class TestPrecomputedSignalStrategy:
+    """사전 계산 어댑터 vs 전략 직접 호출 일치성 테스트"""
+
+    @pytest.mark.parametrize("forced_days", [{}, {48: False, 150: True}])
+    def test_matches_live_strategy_under_engine_call_pattern(self, buffer_slot, forced_days):  # type: ignore[no-untyped-def]
+        """
+        목적: 엔진 호출 패턴(미보유 → check_buy, 보유 → check_sell)에서 어댑터가 전략 직접 호출과 같은
+              시그널/매수 메타를 반환하는지, 포지션이 통상 경로와 어긋난 날(0주 진입 등)이 있어도 같은지 검증
+
+        Given: 버퍼존 슬롯(hold_days=2), 300거래일 시그널 데이터,
+               어긋남 없음 / 일부 날짜의 보유 여부를 시그널과 무관하게 고정
+        When: 같은 호출 순서로 전략과 어댑터를 매일 1회 호출
+        Then: 모든 날의 반환값과 매수 메타가 동일
+        """
+        signal_df = _make_signal_df(7)
+        trade_dates = list(signal_df[COL_DATE])
+        live = create_strategy_for_slot(buffer_slot)
+        adapter = PrecomputedSignalStrategy(buffer_slot, signal_df, trade_dates, store=SignalTrackStore())
+
+        held = False
+        signal_days = 0
+        for i, current_date in enumerate(trade_dates):
+            held = forced_days.get(i, held)
+            if not held:
+                expected = live.check_buy(signal_df, i, current_date)
+                assert adapter.check_buy(signal_df, i, current_date) == expected, i
+                if expected:
+                    assert adapter.get_buy_meta() == live.get_buy_meta(), i
+                    held = True
+            else:
+                expected = live.check_sell(signal_df, i)
+                assert adapter.check_sell(signal_df, i) == expected, i
+                held = not expected
+            signal_days += int(expected)
+
+        # 검증 데이터가 실제로 매수/매도 시그널을 여러 번 발생시키는지 확인 (무의미한 일치 방지)
+        assert signal_days >= 4
+
+
+class TestSignalTrackStore:
+    """시그널 트랙 캐시 테스트"""
+
+    def test_reuses_track_for_same_strategy_parameters(self, buffer_slot):  # type: ignore[no-untyped-def]
+        """
+        목적: 자산 ID/비중/경로만 다른 슬롯은 트랙을 공유하고, 전략 파라미터나 데이터가 다르면 새로 계산하는지 검증
+
+        Given: 같은 데이터의 (원본 슬롯, asset_id/target_weight 변경 슬롯, hold_days 변경 슬롯), 다른 데이터
+        When: SignalTrackStore.get
+        Then: 앞의 두 슬롯은 같은 트랙 객체, 나머지는 별도 항목 (총 3개)
+        """
+        store = SignalTrackStore()
+        signal_df = _make_signal_df(7)
+        trade_dates = list(signal_df[COL_DATE])
+        other_df = _make_signal_df(8)
+
+        track = store.get(buffer_slot, signal_df, trade_dates)
+        renamed = dataclasses.replace(buffer_slot, asset_id="bbb", target_weight=0.2)
+
+        assert store.get(renamed, signal_df.copy(), trade_dates) is track
+        assert store.get(dataclasses.replace(buffer_slot, hold_days=0), signal_df, trade_dates) is not track
+        assert store.get(buffer_slot, other_df, list(other_df[COL_DATE])) is not track
+        assert len(store) == 3
+
+    def test_evicts_least_recently_used_track(self, buffer_slot):  # type: ignore[no-untyped-def]
+        """
+        목적: max_entries 초과 시 가장 오래 사용되지 않은 트랙부터 제거되는지 검증
+
+        Given: max_entries=2 저장소에 트랙 A, B 저장 후 A 재조회
+        When: 트랙 C 저장
+        Then: B가 제거되어 다시 계산되고, A는 같은 객체로 유지
+        """
+        store = SignalTrackStore(max_entries=2)
+        signal_df = _make_signal_df(7)
+        trade_dates = list(signal_df[COL_DATE])
+        slot_a, slot_b, slot_c = (dataclasses.replace(buffer_slot, hold_days=d) for d in (0, 1, 2))
+
+        track_a = store.get(slot_a, signal_df, trade_dates)
+        track_b = store.get(slot_b, signal_df, trade_dates)
+        store.get(slot_a, signal_df, trade_dates)
+        store.get(slot_c, signal_df, trade_dates)
+
+        assert len(store) == 2
+        assert store.get(slot_a, signal_df, trade_dates) is track_a
+        assert store.get(slot_b, signal_df, trade_dates) is not track_b
@@ -342,3 +342,92 @@ class TestExitAllSharesZero:
                     violations.append(f"{row['Date']} {aid}: EXIT_ALL 체결 후 shares={shares} (0이어야 함)")
 
         assert len(violations) == 0, f"EXIT_ALL 후 주수 비정상 {len(violations)}건:\n" + "\n".join(violations[:10])
+
+
+# ============================================================================
+# capture_level: 기록 수준별 결과 범위
+# ============================================================================
+
+
+class TestCaptureLevel:
+    """run_portfolio_backtest capture_level 테스트"""
+
+    @pytest.mark.parametrize("capture_level", ["none", "summary", "equity"])
+    def test_lower_levels_keep_trades_and_summary(self, tmp_path, create_csv_file, capture_level):  # type: ignore[no-untyped-def]
+        """
+        목적: 기록 수준을 낮춰도 거래/요약은 "full"과 같고, 수준별로 생략할 DataFrame만 비는지 검증
+
+        Given: buy -> sell 전환이 포함된 2자산 설정
+        When: capture_level="full"과 낮은 수준으로 각각 실행
+        Then:
+          - trades_df, summary 동일
+          - state_log_df는 비어 있음
+          - "equity": equity_df 동일 / "summary": 포트폴리오 단위 컬럼만 동일 / "none": equity_df 비어 있음
+        """
+        # Given
+        stock_df = _make_stock_df_for_state_log(n_rows=80)
+        path_a = create_csv_file("ASSET_A_max.csv", stock_df)
+        path_b = create_csv_file("ASSET_B_max.csv", stock_df)
+        config = _make_portfolio_config_for_state_log(
+            asset_paths={"asset_a": (path_a, path_a), "asset_b": (path_b, path_b)},
+            result_dir=tmp_path,
+        )
+
+        # When
+        full = run_portfolio_backtest(config)
+        reduced = run_portfolio_backtest(config, capture_level=capture_level)
+
+        # Then
+        pd.testing.assert_frame_equal(reduced.trades_df, full.trades_df)
+        assert reduced.summary == full.summary
+        assert reduced.state_log_df.empty
+        if capture_level == "none":
+            assert reduced.equity_df.empty
+        else:
+            expected = full.equity_df[list(reduced.equity_df.columns)]
+            pd.testing.assert_frame_equal(reduced.equity_df, expected)
+            assert ("asset_a_shares" in reduced.equity_df.columns) == (capture_level == "equity")
+            if capture_level == "equity":
+                assert list(reduced.equity_df.columns) == list(full.equity_df.columns)
+
+    def test_none_level_skips_equity_frame_build(self, tmp_path, create_csv_file, monkeypatch):  # type: ignore[no-untyped-def]
+        """
+        목적: capture_level="none"은 equity_df 조립(build_combined_equity)을 건너뛰는지 검증
+
+        Given: 1자산 설정, build_combined_equity 호출 횟수를 세는 spy
+        When: capture_level="none"과 "summary"로 각각 실행
+        Then: "none"은 0회, "summary"는 1회 호출되고 summary는 같다
+        """
+        from qbt.backtest.engines import portfolio_engine
+
+        path = create_csv_file("ASSET_A_max.csv", _make_stock_df_for_state_log(n_rows=80))
+        config = _make_portfolio_config_for_state_log(asset_paths={"asset_a": (path, path)}, result_dir=tmp_path)
+
+        calls = {"n": 0}
+        original = portfolio_engine.build_combined_equity
+
+        def _spy(recorder, initial_capital):  # type: ignore[no-untyped-def]
+            calls["n"] += 1
+            return original(recorder, initial_capital)
+
+        monkeypatch.setattr(portfolio_engine, "build_combined_equity", _spy)
+
+        none_result = run_portfolio_backtest(config, capture_level="none")
+        assert calls["n"] == 0
+        summary_result = run_portfolio_backtest(config, capture_level="summary")
+        assert calls["n"] == 1
+        assert none_result.summary == summary_result.summary
+
+    def test_invalid_capture_level_raises(self, tmp_path, create_csv_file):  # type: ignore[no-untyped-def]
+        """
+        목적: 지원하지 않는 capture_level이면 ValueError
+
+        Given: 1자산 설정
+        When: capture_level="debug"로 실행
+        Then: ValueError
+        """
+        path = create_csv_file("ASSET_A_max.csv", _make_stock_df_for_state_log())
+        config = _make_portfolio_config_for_state_log(asset_paths={"asset_a": (path, path)}, result_dir=tmp_path)
+
+        with pytest.raises(ValueError, match="capture_level"):
+            run_portfolio_backtest(config, capture_level="debug")  # type: ignore[arg-type]
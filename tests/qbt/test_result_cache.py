@@ -0,0 +1,178 @@
+"""백테스트 결과 캐시 테스트
+
+result_cache 모듈이 동일 입력에 대해 원본 함수와 같은 결과를 돌려주는지,
+데이터가 바뀌면 미스가 나는지, 크기 상한/데이터 갱신 시 항목을 정리하는지 검증한다.
+"""
+
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from freezegun import freeze_time
+
+from qbt.backtest.engines.backtest_engine import run_buffer_strategy, run_grid_search
+from qbt.backtest.result_cache import (
+    ResultCache,
+    cached_buffer_strategy_summary,
+    cached_grid_search,
+    fingerprint_frame,
+)
+from qbt.backtest.types import BufferStrategyParams
+from qbt.utils.meta_manager import save_metadata
+
+
+def _make_price_df(n_days: int = 300, seed: int = 11) -> pd.DataFrame:
+    """돌파/이탈이 반복되는 랜덤워크 가격 DataFrame."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1 + rng.normal(0.0, 0.02, n_days))
+    return pd.DataFrame(
+        {
+            "Date": [date(2020, 1, 1) + timedelta(days=i) for i in range(n_days)],
+            "Open": close * (1 + rng.normal(0.0, 0.005, n_days)),
+            "Close": close,
+        }
+    )
+
+
+class TestFingerprintFrame:
+    """데이터 지문 테스트"""
+
+    def test_same_content_same_fingerprint_and_change_detected(self):
+        """
+        목적: 내용이 같으면 같은 지문, 값 하나만 달라도 다른 지문인지 검증
+
+        Given: 동일 DataFrame의 복사본(인덱스만 다름), Close 1개 값을 바꾼 복사본
+        When: fingerprint_frame 호출
+        Then: 복사본은 동일, 변경본은 상이
+        """
+        df = _make_price_df(50)
+        shifted_index = df.copy()
+        shifted_index.index = shifted_index.index + 100
+        modified = df.copy()
+        modified.loc[10, "Close"] = float(modified.loc[10, "Close"]) + 0.01
+
+        assert fingerprint_frame(df) == fingerprint_frame(shifted_index)
+        assert fingerprint_frame(df) != fingerprint_frame(modified)
+
+
+class TestCachedEvaluations:
+    """캐시 경유 평가 함수 테스트"""
+
+    def test_grid_search_roundtrip_matches_original(self, tmp_path):
+        """
+        목적: 캐시 미스/적중 모두 run_grid_search와 완전히 같은 DataFrame을 반환하는지 검증
+
+        Given: 랜덤워크 가격, 2x2x2x2 그리드
+        When: cached_grid_search 2회 호출 (두 번째는 적중)
+        Then: 두 결과 모두 run_grid_search 결과와 equals, 캐시 파일 1개 생성
+        """
+        df = _make_price_df()
+        cache = ResultCache(tmp_path / "cache")
+        grid = ([10, 30], [0.01, 0.03], [0.01, 0.05], [0, 2], 10_000.0)
+
+        expected = run_grid_search(df, df, *grid)
+        first = cached_grid_search(cache, df, df, *grid)
+        second = cached_grid_search(cache, df, df, *grid)
+
+        assert first.equals(expected)
+        assert second.equals(expected)
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def test_summary_cache_hit_and_data_change_miss(self, tmp_path):
+        """
+        목적: 같은 입력은 저장된 요약을 재사용하고, 데이터가 바뀌면 새로 계산하는지 검증
+
+        Given: 요약을 한 번 캐시한 상태
+        When: 같은 입력으로 재호출 / Close를 바꾼 데이터로 호출
+        Then: 재호출 결과는 원본 요약과 동일, 변경 데이터는 별도 항목으로 저장
+        """
+        df = _make_price_df()
+        cache = ResultCache(tmp_path / "cache")
+        params = BufferStrategyParams(
+            initial_capital=10_000.0, ma_window=20, buy_buffer_zone_pct=0.01, sell_buffer_zone_pct=0.03, hold_days=2
+        )
+
+        _, _, expected = run_buffer_strategy(df, df, params, log_trades=False)
+        assert cached_buffer_strategy_summary(cache, df, df, params) == expected
+        assert cached_buffer_strategy_summary(cache, df, df, params) == expected
+
+        modified = df.copy()
+        modified["Close"] = modified["Close"] * 1.01
+        cached_buffer_strategy_summary(cache, modified, modified, params)
+
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+
+class TestResultCacheStorage:
+    """저장소 축출/무효화 테스트"""
+
+    def test_evicts_least_recently_used_over_limit(self, tmp_path):
+        """
+        목적: 크기 상한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제되는지 검증
+
+        Given: 항목 3개를 저장할 수 있는 크기 상한, 항목 a/b/c 저장 후 a를 조회
+        When: 항목 d 저장
+        Then: 가장 오래 사용되지 않은 b가 삭제되고 a/c/d는 유지
+        """
+        cache_dir = tmp_path / "cache"
+        probe = ResultCache(cache_dir)
+        probe.put("probe", "x" * 100)
+        entry_size = (cache_dir / "probe.json").stat().st_size
+        probe.clear()
+
+        cache = ResultCache(cache_dir, max_bytes=entry_size * 3)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, "x" * 100)
+            # mtime 해상도에 의존하지 않도록 사용 시각을 명시적으로 설정
+            os.utime(cache_dir / f"{key}.json", (1000 + i, 1000 + i))
+        assert cache.get("a") is not None
+
+        cache.put("d", "x" * 100)
+
+        assert cache.get("b") is None
+        for key in ["a", "c", "d"]:
+            assert cache.get(key) is not None
+
+    def test_invalidates_when_data_metadata_updated(self, tmp_path, mock_results_dir):
+        """
+        목적: meta.json의 데이터 갱신 시각이 바뀔 때만 캐시를 비우는지 검증
+
+        Given: stock_download 이력 기록 후 무효화 확인 및 항목 저장
+        When: 같은 이력으로 재확인 / 새 다운로드 이력 기록 후 재확인
+        Then: 첫 재확인은 유지, 새 이력 이후에는 항목 삭제
+        """
+        cache = ResultCache(tmp_path / "cache")
+        with freeze_time("2024-01-01 09:00:00"):
+            save_metadata("stock_download", {"tickers": ["QQQ"]})
+        cache.invalidate_if_data_updated()
+        cache.put("k", {"v": 1})
+
+        assert cache.invalidate_if_data_updated() is False
+        assert cache.get("k") == {"v": 1}
+
+        with freeze_time("2024-02-01 09:00:00"):
+            save_metadata("stock_download", {"tickers": ["QQQ"]})
+
+        assert cache.invalidate_if_data_updated() is True
+        assert cache.get("k") is None
+
+    def test_invalidates_after_synthetic_batch_regeneration(self, tmp_path, mock_results_dir):
+        """
+        목적: 합성 시계열 일괄 생성(synthetic_batch) 이력도 캐시 무효화 대상인지 검증
+
+        Given: stock_download 이력 기록 후 항목 저장
+        When: synthetic_batch 이력 기록 후 재확인
+        Then: 항목 삭제
+        """
+        cache = ResultCache(tmp_path / "cache")
+        with freeze_time("2024-01-01 09:00:00"):
+            save_metadata("stock_download", {"tickers": ["QQQ"]})
+        cache.invalidate_if_data_updated()
+        cache.put("k", {"v": 1})
+
+        with freeze_time("2024-02-01 09:00:00"):
+            save_metadata("synthetic_batch", {"series": {}})
+
+        assert cache.invalidate_if_data_updated() is True
+        assert cache.get("k") is None
@@ -244,6 +244,24 @@ class TestBufferZoneStrategyInterface:
 
         assert result is False
 
+    def test_rebinds_arrays_when_signal_df_changes(self) -> None:
+        """
+        목적: 다른 signal_df 객체가 전달되면 캐싱된 배열 대신 새 데이터 기준으로 판단하는지 검증
+
+        Given: 같은 전략 객체, 첫 번째 df는 돌파 없음(Close 고정 100.0), 두 번째 df는 _make_signal_df()
+        When: 첫 번째 df로 i=0 초기화 후, 두 번째 df로 check_buy(i=1) 호출
+        Then: 두 번째 df의 Close[1]=101.5 > upper=100.94 기준으로 True 반환
+        """
+        flat_df = _make_signal_df()
+        flat_df["Close"] = 100.0
+        signal_df = _make_signal_df()
+        strategy = BufferZoneStrategy("ma_200", 0.03, 0.05, 0)
+
+        strategy.check_buy(flat_df, 0, date(2020, 1, 1))
+        result = strategy.check_buy(signal_df, 1, date(2020, 1, 2))
+
+        assert result is True
+
 
 # ============================================================================
 # BuyAndHoldStrategy 테스트 (새 인터페이스)
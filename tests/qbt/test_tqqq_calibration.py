@@ -0,0 +1,378 @@
+"""
+tqqq/calibration 모듈 테스트
+
+이 파일은 무엇을 검증하나요?
+1. 후보 배열 일괄 RMSE가 simulate + calculate_validation_metrics 경로와 같은가? (전체/월 구간, FFR fallback 포함)
+2. 2단계 그리드 / local refine 탐색이 정의된 격자 안에서 최적점을 찾는가?
+3. 워크포워드의 탐색 방식, 테스트 RMSE, stitched RMSE, 병렬 실행 결과가 일관적인가?
+4. 잘못된 입력을 거부하는가?
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_OPEN
+from qbt.tqqq import build_monthly_spread_map, calculate_validation_metrics, simulate
+from qbt.tqqq.calibration import (
+    build_static_spread_series,
+    evaluate_softplus_rmse,
+    local_refine_softplus,
+    prepare_calibration_data,
+    run_softplus_walkforward,
+    search_softplus_two_stage,
+)
+from qbt.tqqq.constants import (
+    COL_A,
+    COL_A_BEST,
+    COL_A_GLOBAL,
+    COL_B,
+    COL_B_BEST,
+    COL_B_GLOBAL,
+    COL_EXPENSE_DATE,
+    COL_EXPENSE_VALUE,
+    COL_FFR_DATE,
+    COL_FFR_PCT,
+    COL_FFR_VALUE,
+    COL_MONTH,
+    COL_N_TEST_DAYS,
+    COL_N_TRAIN_DAYS,
+    COL_RMSE_PCT,
+    COL_SEARCH_MODE,
+    COL_SPREAD_GLOBAL,
+    COL_TEST_MONTH,
+    COL_TEST_RMSE_PCT,
+    COL_TRAIN_START,
+    KEY_CUMUL_MULTIPLE_LOG_DIFF_RMSE,
+    SEARCH_MODE_FIXED_AB,
+    SEARCH_MODE_FULL_GRID,
+    SEARCH_MODE_LOCAL_REFINE,
+    SOFTPLUS_GRID_STAGE1_B_RANGE,
+    WALKFORWARD_LOCAL_REFINE_A_DELTA,
+    WALKFORWARD_LOCAL_REFINE_B_DELTA,
+    WALKFORWARD_RATE_BOUNDARY_PCT,
+)
+
+# ============================================================================
+# fixture
+# ============================================================================
+
+# 합성 "실제" 가격을 만든 (a, b) — 1단계 그리드 격자점
+_TRUE_A = -6.0
+_TRUE_B = 0.35
+
+
+def _make_market(true_a: float, true_b: float) -> dict[str, pd.DataFrame]:
+    """기초 자산 / FFR (2023-05 누락, fallback) / Expense / softplus(true_a, true_b)로 만든 실제 레버리지 ETF (10개월)."""
+    rng = np.random.default_rng(23)
+    dates = [ts.date() for ts in pd.bdate_range("2023-01-03", "2023-10-31")]
+    closes = 100.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.012, len(dates)))
+    underlying_df = pd.DataFrame({COL_DATE: dates, COL_OPEN: closes * 0.998, COL_CLOSE: closes})
+
+    months = [f"2023-{m:02d}" for m in range(1, 11) if m != 5]
+    ffr_df = pd.DataFrame({COL_FFR_DATE: months, COL_FFR_VALUE: np.linspace(0.005, 0.05, len(months))})
+    expense_df = pd.DataFrame({COL_EXPENSE_DATE: ["2023-01"], COL_EXPENSE_VALUE: [0.0095]})
+
+    spread_map = build_monthly_spread_map(ffr_df, true_a, true_b)
+    actual = simulate(underlying_df, 3.0, expense_df, 50.0, ffr_df=ffr_df, funding_spread=spread_map)
+    actual_df = pd.DataFrame({COL_DATE: actual[COL_DATE], COL_CLOSE: actual[COL_CLOSE]})
+    return {"underlying": underlying_df, "ffr": ffr_df, "expense": expense_df, "actual": actual_df}
+
+
+@pytest.fixture
+def market() -> dict[str, pd.DataFrame]:
+    """생성 파라미터 (_TRUE_A, _TRUE_B)의 합성 시장 데이터."""
+    return _make_market(_TRUE_A, _TRUE_B)
+
+
+def _noisy(market: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """실제 가격에 잡음을 더해 어떤 (a, b)로도 RMSE가 0이 아니게 만든다."""
+    rng = np.random.default_rng(7)
+    actual_df = market["actual"].copy()
+    actual_df[COL_CLOSE] = actual_df[COL_CLOSE] * np.exp(rng.normal(0.0, 0.002, len(actual_df)).cumsum())
+    return {**market, "actual": actual_df}
+
+
+def _simulate_rmse(market: dict[str, pd.DataFrame], a: float, b: float, rows: slice) -> float:
+    """비교 기준: 구간 행만 잘라 simulate + calculate_validation_metrics로 구한 RMSE."""
+    underlying_df = market["underlying"].iloc[rows].reset_index(drop=True)
+    actual_df = market["actual"].iloc[rows].reset_index(drop=True)
+    simulated = simulate(
+        underlying_df,
+        3.0,
+        market["expense"],
+        float(actual_df[COL_CLOSE].iloc[0]),
+        ffr_df=market["ffr"],
+        funding_spread=build_monthly_spread_map(market["ffr"], a, b),
+    )
+    return calculate_validation_metrics(simulated, actual_df)[KEY_CUMUL_MULTIPLE_LOG_DIFF_RMSE]
+
+
+def _prepare(market: dict[str, pd.DataFrame]):
+    return prepare_calibration_data(market["underlying"], market["actual"], market["ffr"], market["expense"])
+
+
+# ============================================================================
+# evaluate_softplus_rmse
+# ============================================================================
+
+
+class TestEvaluateSoftplusRmse:
+    def test_matches_simulate_path(self, market):
+        """
+        목적: 후보 배열 일괄 RMSE가 후보별 simulate + calculate_validation_metrics 결과와 같은지 검증
+
+        Given: 잡음이 섞인 실제 가격, (a, b) 후보 4개, 전체 기간 / 월 구간 [3, 7) (FFR 누락 월 포함)
+        When: evaluate_softplus_rmse
+        Then: 후보별 simulate 경로 RMSE와 상대 오차 1e-9 이내로 일치
+        """
+        noisy = _noisy(market)
+        data = _prepare(noisy)
+        a = np.array([-6.0, -5.2, -8.0, -4.0])
+        b = np.array([0.35, 0.9, 0.0, 1.4])
+        start, end = int(data.month_starts[3]), int(data.month_starts[7])
+
+        full = evaluate_softplus_rmse(data, a, b)
+        window = evaluate_softplus_rmse(data, a, b, 3, 7)
+
+        for k in range(len(a)):
+            assert full[k] == pytest.approx(_simulate_rmse(noisy, a[k], b[k], slice(None)), rel=1e-9)
+            assert window[k] == pytest.approx(_simulate_rmse(noisy, a[k], b[k], slice(start, end)), rel=1e-9)
+
+    def test_broadcasts_scalar_and_grid_shapes(self, market):
+        """스칼라 입력은 shape (1,), 2차원 격자 입력은 같은 shape로 반환한다."""
+        data = _prepare(_noisy(market))
+        a_mesh, b_mesh = np.meshgrid([-7.0, -6.0, -5.0], [0.2, 0.4], indexing="ij")
+
+        assert evaluate_softplus_rmse(data, -6.0, 0.35).shape == (1,)
+        grid = evaluate_softplus_rmse(data, a_mesh, b_mesh)
+        assert grid.shape == (3, 2)
+        assert grid[1, 0] == evaluate_softplus_rmse(data, -6.0, 0.2)[0]
+
+    @pytest.mark.parametrize(("start_month", "end_month"), [(-1, 3), (3, 3), (0, 11)])
+    def test_invalid_month_range_raises(self, market, start_month, end_month):
+        """월 구간이 비었거나 범위를 벗어나면 ValueError"""
+        data = _prepare(market)
+        with pytest.raises(ValueError, match="월 구간"):
+            evaluate_softplus_rmse(data, -6.0, 0.35, start_month, end_month)
+
+
+# ============================================================================
+# 탐색
+# ============================================================================
+
+
+class TestSearch:
+    def test_two_stage_recovers_generating_params(self, market):
+        """
+        목적: 잡음 없는 합성 가격에서 2단계 탐색이 생성 파라미터를 찾는지 검증
+
+        Given: softplus(a=-6.0, b=0.35)로 만든 실제 가격
+        When: search_softplus_two_stage (전체 / b 고정)
+        Then: 첫 행이 (-6.0, 0.35)이고 RMSE ≈ 0, RMSE 오름차순 정렬, (a, b) 중복 없음
+        """
+        data = _prepare(market)
+
+        table = search_softplus_two_stage(data)
+        fixed_b = search_softplus_two_stage(data, fixed_b=_TRUE_B)
+
+        assert (table.iloc[0][COL_A], table.iloc[0][COL_B]) == (_TRUE_A, _TRUE_B)
+        assert table.iloc[0][COL_RMSE_PCT] < 1e-9
+        assert table[COL_RMSE_PCT].is_monotonic_increasing
+        assert not table.duplicated(subset=[COL_A, COL_B]).any()
+        assert set(fixed_b[COL_B]) == {_TRUE_B}
+        assert fixed_b.iloc[0][COL_A] == _TRUE_A
+
+    def test_two_stage_refines_b_beyond_stage1_upper_bound(self):
+        """
+        목적: 1단계 b 상한 경계에 걸린 최적점을 2단계가 상한 너머로 다듬는지 검증 (b는 하한만 제한)
+
+        Given: 1단계 b 범위 상한(SOFTPLUS_GRID_STAGE1_B_RANGE[1]) 밖의 b=1.7로 만든 실제 가격
+        When: search_softplus_two_stage
+        Then: 첫 행이 생성 파라미터 (-7.0, 1.7)이고 RMSE ≈ 0
+        """
+        assert SOFTPLUS_GRID_STAGE1_B_RANGE[1] < 1.7
+        data = _prepare(_make_market(-7.0, 1.7))
+
+        table = search_softplus_two_stage(data)
+
+        assert (table.iloc[0][COL_A], table.iloc[0][COL_B]) == (-7.0, 1.7)
+        assert table.iloc[0][COL_RMSE_PCT] < 1e-9
+
+    def test_local_refine_stays_within_radius(self, market):
+        """
+        목적: local refine이 기준점 반경 안만 탐색하고 그 안의 최적점을 찾는지 검증
+
+        Given: 생성 파라미터를 반경 안에 포함하는 기준점 (-5.8, 0.25), b 반경이 0 아래로 걸치는 기준점 (-5.8, 0.1)
+        When: local_refine_softplus (a/b 탐색, a만 탐색)
+        Then: 후보가 반경 안이며 b >= 0, 첫 행이 생성 파라미터, refine_b=False면 b 고정
+        """
+        data = _prepare(market)
+
+        table = local_refine_softplus(data, -5.8, 0.25)
+        clipped = local_refine_softplus(data, -5.8, 0.1)
+        a_only = local_refine_softplus(data, -5.8, 0.1, refine_b=False)
+
+        a_delta, b_delta = WALKFORWARD_LOCAL_REFINE_A_DELTA, WALKFORWARD_LOCAL_REFINE_B_DELTA
+        assert table[COL_A].between(-5.8 - a_delta, -5.8 + a_delta).all()
+        assert table[COL_B].between(0.25 - b_delta, 0.25 + b_delta).all()
+        assert (table.iloc[0][COL_A], table.iloc[0][COL_B]) == (_TRUE_A, _TRUE_B)
+        assert clipped[COL_B].min() == 0.0
+        assert set(a_only[COL_B]) == {0.1}
+
+
+class TestBuildStaticSpreadSeries:
+    def test_monthly_spread_matches_spread_map(self, market):
+        """
+        목적: 정적 spread 시계열이 캘리브레이션 월마다 build_monthly_spread_map 값과 같은지 검증
+
+        Given: FFR 2023-05 누락 (이전 월 fallback)
+        When: build_static_spread_series(a=-6.1, b=0.37)
+        Then: 월 = data.months, ffr_pct = 월별 FFR × 100, spread_global = 해당(또는 fallback) 월의 spread 맵 값
+        """
+        data = _prepare(market)
+        spread_map = build_monthly_spread_map(market["ffr"], -6.1, 0.37)
+
+        static_df = build_static_spread_series(data, -6.1, 0.37)
+
+        assert static_df[COL_MONTH].tolist() == list(data.months)
+        np.testing.assert_allclose(static_df[COL_FFR_PCT].to_numpy(), 100.0 * data.ffr)
+        assert set(static_df[COL_A_GLOBAL]) == {-6.1} and set(static_df[COL_B_GLOBAL]) == {0.37}
+        expected = [spread_map.get(month, spread_map["2023-04"]) for month in data.months]
+        np.testing.assert_allclose(static_df[COL_SPREAD_GLOBAL].to_numpy(), expected, rtol=1e-12)
+
+
+# ============================================================================
+# 워크포워드
+# ============================================================================
+
+
+class TestRunSoftplusWalkforward:
+    def test_dynamic_rows_and_metrics(self, market):
+        """
+        목적: 동적 워크포워드의 행 구성, 탐색 방식, 테스트/stitched RMSE 정의를 검증
+
+        Given: 10개월 데이터, 학습 3개월
+        When: run_softplus_walkforward
+        Then: 테스트 7개월, 첫 행 full_grid_2stage 이후 local_refine,
+              테스트 RMSE = 테스트 월 구간 평가값, 거래일 수 = 월 구간 길이
+        """
+        noisy = _noisy(market)
+        data = _prepare(noisy)
+
+        result_df, summary = run_softplus_walkforward(data, train_window_months=3)
+
+        assert result_df[COL_TEST_MONTH].tolist() == list(data.months[3:])
+        assert result_df[COL_TRAIN_START].tolist() == list(data.months[:7])
+        assert result_df[COL_SEARCH_MODE].tolist() == [SEARCH_MODE_FULL_GRID] + [SEARCH_MODE_LOCAL_REFINE] * 6
+        for k, row in result_df.iterrows():
+            m = 3 + int(k)
+            expected = evaluate_softplus_rmse(data, row[COL_A_BEST], row[COL_B_BEST], m, m + 1)[0]
+            assert row[COL_TEST_RMSE_PCT] == expected
+            assert row[COL_N_TRAIN_DAYS] == data.n_days(m - 3, m)
+            assert row[COL_N_TEST_DAYS] == data.n_days(m, m + 1)
+        assert summary["n_test_months"] == 7.0
+        assert summary["test_rmse_mean"] == pytest.approx(result_df[COL_TEST_RMSE_PCT].mean())
+
+    def test_fixed_ab_stitched_equals_single_simulation(self, market):
+        """
+        목적: 완전 고정 워크포워드의 stitched RMSE가 테스트 기간 전체 simulate RMSE와 같은지 검증
+
+        Given: (a, b) = (-6.1, 0.37) 고정
+        When: run_softplus_walkforward(fixed_ab=...)
+        Then: 모든 행 fixed_ab, stitched RMSE = 테스트 시작일부터의 simulate 경로 RMSE
+        """
+        noisy = _noisy(market)
+        data = _prepare(noisy)
+
+        result_df, summary = run_softplus_walkforward(data, train_window_months=3, fixed_ab=(-6.1, 0.37))
+
+        assert set(result_df[COL_SEARCH_MODE]) == {SEARCH_MODE_FIXED_AB}
+        expected = _simulate_rmse(noisy, -6.1, 0.37, slice(int(data.month_starts[3]), None))
+        assert summary["stitched_rmse"] == pytest.approx(expected, rel=1e-9)
+
+    def test_fixed_ab_summary_has_rate_segmented_rmse(self, market):
+        """
+        목적: 완전 고정 요약에 금리 구간별 RMSE 분해(앱 금리 구간 섹션 입력)가 포함되는지 검증
+
+        Given: FFR 0.5%~5% (학습 1개월 이후 테스트 월에 2% 미만/이상 모두 포함), (a, b) 고정
+        When: run_softplus_walkforward(fixed_ab=...)
+        Then: low/high_rate_rmse, low/high_rate_days, rate_boundary_pct 키 존재,
+              거래일 합 = 테스트 기간 거래일, 두 구간 제곱합 = stitched RMSE 제곱합, 동적 요약에는 없음
+        """
+        data = _prepare(_noisy(market))
+
+        _, summary = run_softplus_walkforward(data, train_window_months=1, fixed_ab=(-6.1, 0.37))
+        _, dynamic_summary = run_softplus_walkforward(data, train_window_months=1)
+
+        rate_keys = {"low_rate_rmse", "high_rate_rmse", "low_rate_days", "high_rate_days", "rate_boundary_pct"}
+        assert rate_keys <= set(summary)
+        assert not rate_keys & set(dynamic_summary)
+        assert summary["rate_boundary_pct"] == WALKFORWARD_RATE_BOUNDARY_PCT
+        n_days = data.n_days(1, len(data.months))
+        assert summary["low_rate_days"] > 0 and summary["high_rate_days"] > 0
+        assert summary["low_rate_days"] + summary["high_rate_days"] == n_days
+        combined = (
+            summary["low_rate_days"] * summary["low_rate_rmse"] ** 2
+            + summary["high_rate_days"] * summary["high_rate_rmse"] ** 2
+        )
+        assert combined / n_days == pytest.approx(summary["stitched_rmse"] ** 2, rel=1e-9)
+
+    def test_parallel_full_grid_matches_sequential(self, market):
+        """
+        목적: local refine 미사용 시 월별 독립 탐색의 병렬 결과가 순차 결과와 같은지 검증
+
+        Given: b 고정 워크포워드 (학습 3개월)
+        When: local_refine=False, max_workers=1 / 2
+        Then: 두 결과 DataFrame과 요약이 동일하고, 모든 행이 full_grid_2stage
+        """
+        data = _prepare(_noisy(market))
+
+        sequential = run_softplus_walkforward(data, train_window_months=3, fixed_b=0.35, local_refine=False)
+        parallel = run_softplus_walkforward(
+            data, train_window_months=3, fixed_b=0.35, local_refine=False, max_workers=2
+        )
+
+        pd.testing.assert_frame_equal(parallel[0], sequential[0])
+        assert parallel[1] == sequential[1]
+        assert set(sequential[0][COL_SEARCH_MODE]) == {SEARCH_MODE_FULL_GRID}
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"train_window_months": 0}, "train_window_months"),
+            ({"train_window_months": 10}, "테스트 월이 없습니다"),
+            ({"fixed_b": 0.3, "fixed_ab": (-6.0, 0.3)}, "동시에"),
+            ({"max_workers": 0}, "max_workers"),
+        ],
+    )
+    def test_invalid_inputs_raise(self, market, kwargs, match):
+        """학습 개월 수 / 테스트 월 없음 / 고정값 동시 지정 / 워커 수 오류 → ValueError"""
+        data = _prepare(market)
+        with pytest.raises(ValueError, match=match):
+            run_softplus_walkforward(data, **kwargs)
+
+
+class TestPrepareCalibrationData:
+    def test_month_layout_and_ffr_fallback(self, market):
+        """
+        목적: 월 경계와 월별 FFR 조회(누락 월 fallback)를 검증
+
+        Given: 2023-01 ~ 2023-10 거래일, FFR 2023-05 누락
+        When: prepare_calibration_data
+        Then: 월 10개, 월 경계 = 월별 첫 거래일, 2023-05 FFR = 2023-04 값
+        """
+        data = _prepare(market)
+
+        assert data.months == tuple(f"2023-{m:02d}" for m in range(1, 11))
+        assert data.month_starts[-1] == len(market["underlying"])
+        first_dates = [market["underlying"][COL_DATE].iloc[int(i)] for i in data.month_starts[:-1]]
+        assert [d.day for d in first_dates] == [3, 1, 1, 3, 1, 1, 3, 1, 1, 2]
+        assert data.ffr[4] == data.ffr[3]
+
+    def test_non_positive_close_raises(self, market):
+        """실제 종가에 0 이하 값이 있으면 ValueError"""
+        actual_df = market["actual"].copy()
+        actual_df.loc[5, COL_CLOSE] = 0.0
+        with pytest.raises(ValueError, match="0 이하"):
+            prepare_calibration_data(market["underlying"], actual_df, market["ffr"], market["expense"])
@@ -10,6 +10,7 @@ TQQQ 도메인 전용 데이터 로더 테스트
 6. FFR/Expense 딕셔너리 생성 및 조회가 정확한가?
 7. 월별 데이터 중복/갭 검증이 작동하는가?
 8. 운용비율 딕셔너리 확장이 정확한가? (1999-01부터 고정값 채우기)
+9. MonthlySeries 조회가 딕셔너리 조회와 같은 값/에러를 내는가? (단건/배열 일괄 조회)
 
 왜 중요한가요?
 TQQQ 시뮬레이션의 모든 결과는 FFR 데이터와 비교 데이터에 의존합니다.
@@ -18,16 +19,21 @@ TQQQ 시뮬레이션의 모든 결과는 FFR 데이터와 비교 데이터에 
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from qbt.tqqq.constants import COL_EXPENSE_DATE, COL_EXPENSE_VALUE, COL_FFR_DATE, COL_FFR_VALUE
 from qbt.tqqq.data_loader import (
+    MonthlySeries,
+    create_expense_series,
     create_ffr_dict,
+    create_ffr_series,
     load_comparison_data,
     load_expense_ratio_data,
     load_ffr_data,
     lookup_ffr,
+    month_codes_from_dates,
 )
 
 
@@ -620,3 +626,128 @@ class TestBuildExtendedExpenseDict:
         assert len(result) == 2
         assert result["1999-01"] == pytest.approx(0.0095)
         assert result["1999-02"] == pytest.approx(0.0093)
+
+
+class TestMonthlySeries:
+    """정수 월 코드 기반 월별 시계열 테스트"""
+
+    def test_lookup_matches_dict_lookup(self):
+        """
+        목적: MonthlySeries 조회가 딕셔너리 조회와 같은 값을 반환하는지 검증
+
+        Given: 2023-03~05가 빠진 FFR 데이터 (순서 섞임)
+        When: 직접 월, 1~2개월 fallback 월을 딕셔너리와 MonthlySeries로 각각 조회
+        Then: 모든 날짜에서 값이 같다
+        """
+        # Given
+        ffr_df = pd.DataFrame(
+            {COL_FFR_DATE: ["2023-06", "2023-01", "2023-02", "2023-07"], COL_FFR_VALUE: [0.05, 0.045, 0.046, 0.051]}
+        )
+        ffr_dict = create_ffr_dict(ffr_df)
+        ffr_series = create_ffr_series(ffr_df)
+
+        # When & Then
+        for d in [date(2023, 1, 3), date(2023, 2, 28), date(2023, 3, 1), date(2023, 4, 30), date(2023, 7, 31)]:
+            assert ffr_series.lookup(d) == lookup_ffr(d, ffr_dict)
+            assert lookup_ffr(d, ffr_series) == lookup_ffr(d, ffr_dict)
+
+    def test_lookup_errors_match_dict_lookup(self):
+        """
+        목적: 이전 데이터 없음 / 월 차이 초과 시 딕셔너리 조회와 같은 메시지로 실패하는지 검증
+
+        Given: 2023-02, 2023-06 FFR 데이터
+        When: 2023-01 (이전 데이터 없음), 2023-05 (3개월 차이) 조회
+        Then: 딕셔너리 조회와 같은 ValueError 메시지
+        """
+        # Given
+        ffr_df = pd.DataFrame({COL_FFR_DATE: ["2023-02", "2023-06"], COL_FFR_VALUE: [0.045, 0.05]})
+        ffr_dict = create_ffr_dict(ffr_df)
+        ffr_series = create_ffr_series(ffr_df)
+
+        # When & Then
+        for d in [date(2023, 1, 15), date(2023, 5, 15)]:
+            with pytest.raises(ValueError) as dict_error:
+                lookup_ffr(d, ffr_dict)
+            with pytest.raises(ValueError) as series_error:
+                ffr_series.lookup(d)
+            assert str(series_error.value) == str(dict_error.value)
+
+    def test_lookup_many_matches_lookup(self):
+        """
+        목적: 날짜 배열 일괄 조회가 단건 조회와 같은 값을 반환하는지 검증
+
+        Given: 12개월 Expense 데이터와 date 객체 / datetime64 날짜 배열
+        When: lookup_many 호출
+        Then: 각 날짜의 lookup 결과와 같다 (두 날짜 타입 모두)
+        """
+        # Given
+        expense_df = pd.DataFrame(
+            {
+                COL_EXPENSE_DATE: [f"2023-{m:02d}" for m in range(1, 13, 2)],
+                COL_EXPENSE_VALUE: np.linspace(0.009, 0.0095, 6),
+            }
+        )
+        expense_series = create_expense_series(expense_df)
+        dates = [date(2023, m, d) for m in range(1, 13) for d in (1, 15)] + [date(2024, 6, 30)]
+
+        # When
+        from_objects = expense_series.lookup_many(np.array(dates, dtype=object))
+        from_datetime64 = expense_series.lookup_many(pd.to_datetime(pd.Series(dates)).to_numpy())
+
+        # Then
+        expected = np.array([expense_series.lookup(d) for d in dates])
+        np.testing.assert_array_equal(from_objects, expected)
+        np.testing.assert_array_equal(from_datetime64, expected)
+
+    def test_lookup_many_raises_for_first_invalid_date(self):
+        """
+        목적: 일괄 조회 실패 시 배열 순서상 첫 조회 불가 날짜 기준으로 에러가 나는지 검증
+
+        Given: 2023-01, 2023-02 FFR 데이터
+        When: 2023-02, 2023-06, 2023-09 날짜 배열 조회 (2023-06부터 한도 초과)
+        Then: 2023-06 기준 ValueError
+        """
+        # Given
+        ffr_series = create_ffr_series(
+            pd.DataFrame({COL_FFR_DATE: ["2023-01", "2023-02"], COL_FFR_VALUE: [0.04, 0.05]})
+        )
+        dates = np.array([date(2023, 2, 1), date(2023, 6, 1), date(2023, 9, 1)], dtype=object)
+
+        # When & Then
+        with pytest.raises(ValueError, match="FFR 데이터 부족: 필요 월 2023-06.*4개월 전"):
+            ffr_series.lookup_many(dates)
+
+    def test_from_dict_round_trip_and_year_boundary(self):
+        """
+        목적: 딕셔너리 변환 왕복과 연도 경계 월 코드 계산 검증
+
+        Given: 연도 경계를 넘는 월 딕셔너리 (순서 섞임)
+        When: MonthlySeries.from_dict → to_dict, 2024-01 조회
+        Then: 월 오름차순 딕셔너리로 복원되고 2023-12 값으로 fallback
+        """
+        # Given
+        data_dict = {"2024-02": 0.3, "2023-11": 0.1, "2023-12": 0.2}
+
+        # When
+        series = MonthlySeries.from_dict(data_dict, max_months_diff=2, data_type="funding_spread")
+
+        # Then
+        assert list(series.to_dict().items()) == [("2023-11", 0.1), ("2023-12", 0.2), ("2024-02", 0.3)]
+        assert (series.first_month, series.last_month) == ("2023-11", "2024-02")
+        assert series.lookup(date(2024, 1, 31)) == pytest.approx(0.2)
+        assert month_codes_from_dates([date(2023, 12, 1), date(2024, 1, 1)]).tolist() == [2023 * 12 + 11, 2024 * 12]
+
+    def test_create_series_duplicate_month_raises(self):
+        """
+        목적: 중복 월이 있으면 딕셔너리 생성과 같은 무결성 에러가 나는지 검증
+
+        Given: 2023-02가 중복된 FFR 데이터
+        When: create_ffr_series 호출
+        Then: ValueError (중복 월 포함)
+        """
+        # Given
+        ffr_df = pd.DataFrame({COL_FFR_DATE: ["2023-01", "2023-02", "2023-02"], COL_FFR_VALUE: [0.04, 0.045, 0.046]})
+
+        # When & Then
+        with pytest.raises(ValueError, match="FFR 데이터 무결성 오류.*2023-02.*중복"):
+            create_ffr_series(ffr_df)
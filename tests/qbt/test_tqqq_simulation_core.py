@@ -3,12 +3,13 @@
 simulate() 함수의 핵심 계약, 입력 검증, 오버나이트 오픈 동작을 검증한다.
 """
 
-from datetime import date
+from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from qbt.common_constants import COL_CLOSE, COL_DATE, COL_HIGH, COL_LOW, COL_OPEN
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_HIGH, COL_LOW, COL_OPEN, TRADING_DAYS_PER_YEAR
 from qbt.tqqq.constants import COL_EXPENSE_DATE, COL_EXPENSE_VALUE, COL_FFR_DATE, COL_FFR_VALUE
 from qbt.tqqq.simulation import (
     simulate,
@@ -493,3 +494,69 @@ class TestSimulateOvernightOpen:
                 ffr_df=ffr_df,
                 funding_spread=0.006,
             )
+
+
+class TestSimulateMonthlyCostVectorization:
+    """월별 비용 배열 + 누적곱 계산 테스트"""
+
+    def test_matches_daily_recurrence_across_months(self):
+        """
+        목적: 월별 비용을 날짜에 펼쳐 누적곱으로 계산한 Close가 일별 점화식과 같은지 검증
+
+        Given: 3개월에 걸친 60거래일 QQQ 데이터, 월별로 다른 FFR/Expense/spread (2월 FFR은 1월 fallback)
+        When: simulate() 호출
+        Then: Close가 TQQQ_Close(t) = TQQQ_Close(t-1) × (1 + r(t) × 3 - daily_cost(t))를 날짜별로 계산한 값과 동일
+        """
+        # Given
+        dates = [date(2023, 1, 2) + timedelta(days=i) for i in range(60)]
+        closes = [100.0 * (1 + 0.01 * ((i * 7) % 5 - 2)) ** (i % 3) for i in range(60)]
+        underlying_df = pd.DataFrame({COL_DATE: dates, COL_OPEN: closes, COL_CLOSE: closes})
+        ffr_df = pd.DataFrame({COL_FFR_DATE: ["2023-01", "2023-03"], COL_FFR_VALUE: [0.045, 0.05]})
+        expense_df = pd.DataFrame({COL_EXPENSE_DATE: ["2023-01", "2023-02"], COL_EXPENSE_VALUE: [0.0095, 0.0088]})
+        spread = {"2023-01": 0.004, "2023-02": 0.006, "2023-03": 0.008}
+        ffr = {"2023-01": 0.045, "2023-02": 0.045, "2023-03": 0.05}
+        expense = {"2023-01": 0.0095, "2023-02": 0.0088, "2023-03": 0.0088}
+
+        # When
+        result = simulate(
+            underlying_df=underlying_df,
+            leverage=3.0,
+            expense_df=expense_df,
+            initial_price=30.0,
+            ffr_df=ffr_df,
+            funding_spread=spread,
+        )
+
+        # Then
+        expected = [30.0]
+        for i in range(1, len(dates)):
+            key = f"{dates[i].year:04d}-{dates[i].month:02d}"
+            daily_cost = ((ffr[key] + spread[key]) * 2.0 + expense[key]) / TRADING_DAYS_PER_YEAR
+            underlying_return = closes[i] / closes[i - 1] - 1
+            expected.append(expected[-1] * (1 + (underlying_return * 3.0 - daily_cost)))
+        np.testing.assert_allclose(result[COL_CLOSE].to_numpy(), expected, rtol=1e-12)
+
+    def test_missing_spread_month_raises(self):
+        """
+        목적: 월별 비용 사전 계산에서도 spread 데이터 부족 시 ValueError가 발생하는지 검증
+
+        Given: 2023-01~2023-06 거래일, spread dict는 2023-01만 존재 (2개월 초과 공백)
+        When: simulate() 호출
+        Then: funding_spread 데이터 부족 ValueError
+        """
+        dates = [date(2023, 1, 2) + timedelta(days=7 * i) for i in range(25)]
+        underlying_df = pd.DataFrame(
+            {COL_DATE: dates, COL_OPEN: [100.0] * 25, COL_CLOSE: [100.0 + i for i in range(25)]}
+        )
+        ffr_df = pd.DataFrame({COL_FFR_DATE: [f"2023-0{m}" for m in range(1, 7)], COL_FFR_VALUE: [0.045] * 6})
+        expense_df = pd.DataFrame({COL_EXPENSE_DATE: ["2023-01"], COL_EXPENSE_VALUE: [0.0095]})
+
+        with pytest.raises(ValueError, match="funding_spread 데이터 부족"):
+            simulate(
+                underlying_df=underlying_df,
+                leverage=3.0,
+                expense_df=expense_df,
+                initial_price=30.0,
+                ffr_df=ffr_df,
+                funding_spread={"2023-01": 0.006},
+            )
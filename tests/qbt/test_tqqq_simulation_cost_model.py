@@ -1,19 +1,25 @@
 """TQQQ 시뮬레이션 비용 모델 테스트
 
-일일 비용 계산, FFR 커버리지 검증, 동적 비용 계산, softplus 함수, 동적 펀딩 스프레드를 검증한다.
+일일 비용 계산, FFR 커버리지 검증, 동적 비용 계산, softplus 함수, 동적 펀딩 스프레드,
+MonthlySeries 기반 일괄 비용 계산을 검증한다.
 """
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from qbt.common_constants import TRADING_DAYS_PER_YEAR
 from qbt.tqqq.constants import COL_EXPENSE_DATE, COL_EXPENSE_VALUE, COL_FFR_DATE, COL_FFR_VALUE
-from qbt.tqqq.data_loader import create_expense_dict, create_ffr_dict
+from qbt.tqqq.data_loader import create_expense_dict, create_expense_series, create_ffr_dict, create_ffr_series
 from qbt.tqqq.simulation import (
     _calculate_daily_cost,
+    _calculate_daily_costs,
     _validate_ffr_coverage,
+    build_monthly_spread_map,
+    build_monthly_spread_series,
+    simulate,
 )
 
 
@@ -767,3 +773,171 @@ class TestDynamicFundingSpread:
                 funding_spread=-0.005,
                 leverage=3.0,
             )
+
+
+class TestMonthlySeriesCosts:
+    """MonthlySeries 기반 일괄 비용 계산 테스트"""
+
+    @pytest.fixture
+    def monthly_inputs(self):
+        """2023-01 ~ 2023-06 FFR (04 누락)과 Expense (03~06 누락, 12개월 fallback)"""
+        ffr_df = pd.DataFrame(
+            {
+                COL_FFR_DATE: ["2023-01", "2023-02", "2023-03", "2023-05", "2023-06"],
+                COL_FFR_VALUE: [0.045, 0.046, 0.047, 0.05, 0.051],
+            }
+        )
+        expense_df = pd.DataFrame({COL_EXPENSE_DATE: ["2023-01", "2023-02"], COL_EXPENSE_VALUE: [0.0095, 0.0088]})
+        dates = np.array([date(2023, m, d) for m in range(1, 7) for d in (3, 17, 28)], dtype=object)
+        return ffr_df, expense_df, dates
+
+    def test_vectorized_softplus_matches_scalar_within_tolerance(self):
+        """
+        목적: 배열 softplus spread가 스칼라 _compute_softplus_spread와 허용 오차 내에서 같은지 검증
+
+        Given: 넓은 범위의 (a, b, FFR) 무작위 조합 (exp 인자의 부호가 섞이도록)
+        When: compute_softplus_spreads 호출
+        Then: 각 값이 스칼라 경로와 rtol=1e-14 이내 (NumPy/math의 exp·log1p 구현 차이로 비트 일치는 보장하지 않음)
+        """
+        from qbt.tqqq.simulation import _compute_softplus_spread, compute_softplus_spreads
+
+        # Given
+        rng = np.random.default_rng(42)
+        a = rng.uniform(-12.0, 4.0, 2000)
+        b = rng.uniform(0.0, 3.0, 2000)
+        ffr = rng.uniform(0.0, 0.2, 2000)
+
+        # When
+        spreads = compute_softplus_spreads(a, b, ffr)
+
+        # Then
+        expected = [_compute_softplus_spread(float(x), float(y), float(z)) for x, y, z in zip(a, b, ffr, strict=True)]
+        np.testing.assert_allclose(spreads, expected, rtol=1e-14, atol=0)
+
+    def test_spread_series_matches_scalar_softplus(self):
+        """
+        목적: 월별 spread 시계열/맵이 월별 스칼라 계산과 같은지 검증
+
+        Given: 3개월 FFR 데이터, a=-6.1, b=0.37
+        When: build_monthly_spread_series / build_monthly_spread_map 호출
+        Then: 각 월 값이 _compute_softplus_spread 결과와 rtol=1e-14 이내에서 같다
+        """
+        from qbt.tqqq.simulation import _compute_softplus_spread
+
+        # Given
+        ffr_df = pd.DataFrame({COL_FFR_DATE: ["2023-01", "2023-02", "2023-03"], COL_FFR_VALUE: [0.001, 0.045, 0.2]})
+
+        # When
+        series = build_monthly_spread_series(ffr_df, a=-6.1, b=0.37)
+        spread_map = build_monthly_spread_map(ffr_df, a=-6.1, b=0.37)
+
+        # Then
+        expected = [_compute_softplus_spread(-6.1, 0.37, ffr) for ffr in ffr_df[COL_FFR_VALUE]]
+        assert series.data_type == "funding_spread"
+        assert list(spread_map) == ["2023-01", "2023-02", "2023-03"]
+        np.testing.assert_allclose(series.values, expected, rtol=1e-14, atol=0)
+        np.testing.assert_allclose(list(spread_map.values()), expected, rtol=1e-14, atol=0)
+
+    def test_spread_map_keeps_last_duplicate_month(self):
+        """
+        목적: build_monthly_spread_map이 중복 월을 거부하지 않고 마지막 행 값을 쓰는지 검증
+
+        Given: 2023-02가 두 번 있는 FFR 데이터
+        When: build_monthly_spread_map / build_monthly_spread_series 호출
+        Then: 맵은 2023-02에 마지막 행(FFR 5%) spread를 담고, 시계열은 중복 월로 ValueError
+        """
+        from qbt.tqqq.simulation import _compute_softplus_spread
+
+        # Given
+        ffr_df = pd.DataFrame(
+            {COL_FFR_DATE: ["2023-01", "2023-02", "2023-03", "2023-02"], COL_FFR_VALUE: [0.04, 0.045, 0.046, 0.05]}
+        )
+
+        # When
+        spread_map = build_monthly_spread_map(ffr_df, a=-5.0, b=1.0)
+
+        # Then
+        assert list(spread_map) == ["2023-01", "2023-02", "2023-03"]
+        assert spread_map["2023-02"] == pytest.approx(_compute_softplus_spread(-5.0, 1.0, 0.05), rel=1e-14)
+        with pytest.raises(ValueError, match="중복"):
+            build_monthly_spread_series(ffr_df, a=-5.0, b=1.0)
+
+    def test_daily_costs_match_per_date_calculation(self, monthly_inputs):
+        """
+        목적: 날짜 배열 일괄 비용 계산이 날짜별 _calculate_daily_cost와 같은지 검증
+
+        Given: fallback이 필요한 FFR/Expense와 월별 spread
+        When: _calculate_daily_costs(MonthlySeries) 호출
+        Then: 각 날짜의 딕셔너리 기반 단건 계산과 일치
+        """
+        # Given
+        ffr_df, expense_df, dates = monthly_inputs
+        spread_map = build_monthly_spread_map(ffr_df, a=-5.0, b=1.0)
+
+        # When
+        costs = _calculate_daily_costs(
+            dates, create_ffr_series(ffr_df), create_expense_series(expense_df), spread_map, leverage=3.0
+        )
+
+        # Then
+        expected = [
+            _calculate_daily_cost(d, create_ffr_dict(ffr_df), create_expense_dict(expense_df), spread_map, 3.0)
+            for d in dates
+        ]
+        np.testing.assert_allclose(costs, expected, rtol=1e-15, atol=0)
+
+    def test_daily_costs_raise_earliest_error(self):
+        """
+        목적: 여러 데이터가 부족할 때 날짜 순서상 가장 이른 에러가 발생하는지 검증
+
+        Given: FFR은 2023-06에서 부족, Expense는 2023-03부터 이전 데이터 없음
+        When: 2023-01 ~ 2023-06 날짜로 _calculate_daily_costs 호출
+        Then: 배열 조회는 FFR을 먼저 하지만, 일별 계산과 같이 가장 이른 2023-01의 Expense 에러 발생
+        """
+        # Given
+        ffr_df = pd.DataFrame({COL_FFR_DATE: ["2023-01", "2023-02", "2023-03"], COL_FFR_VALUE: [0.045, 0.046, 0.047]})
+        expense_df = pd.DataFrame({COL_EXPENSE_DATE: ["2023-03"], COL_EXPENSE_VALUE: [0.0095]})
+        dates = np.array([date(2023, m, 10) for m in range(1, 7)], dtype=object)
+
+        # When & Then
+        with pytest.raises(ValueError, match="Expense 데이터 부족: 2023-01"):
+            _calculate_daily_costs(
+                dates, create_ffr_series(ffr_df), create_expense_series(expense_df), 0.006, leverage=3.0
+            )
+
+    def test_simulate_series_inputs_match_dict_inputs(self, monthly_inputs):
+        """
+        목적: simulate()에 MonthlySeries를 넘겨도 딕셔너리 입력과 같은 결과인지 검증
+
+        Given: 같은 FFR/Expense/spread를 딕셔너리와 MonthlySeries로 준비
+        When: 두 입력으로 simulate 호출
+        Then: 결과 DataFrame이 동일
+        """
+        # Given
+        ffr_df, expense_df, dates = monthly_inputs
+        underlying_df = pd.DataFrame(
+            {"Date": dates, "Open": np.linspace(100, 110, len(dates)), "Close": np.linspace(101, 111, len(dates))}
+        )
+
+        # When
+        from_dicts = simulate(
+            underlying_df,
+            3.0,
+            expense_df,
+            100.0,
+            funding_spread=build_monthly_spread_map(ffr_df, a=-5.0, b=1.0),
+            ffr_dict=create_ffr_dict(ffr_df),
+            expense_dict=create_expense_dict(expense_df),
+        )
+        from_series = simulate(
+            underlying_df,
+            3.0,
+            expense_df,
+            100.0,
+            funding_spread=build_monthly_spread_series(ffr_df, a=-5.0, b=1.0),
+            ffr_dict=create_ffr_series(ffr_df),
+            expense_dict=create_expense_series(expense_df),
+        )
+
+        # Then
+        pd.testing.assert_frame_equal(from_series, from_dicts)
@@ -0,0 +1,304 @@
+"""레버리지 ETF 합성 시계열 일괄 생성 테스트
+
+synthetic 모듈의 접합점 병합, 생성 대상 선언 검증, 조합 1개 생성, 일괄 생성(순차/병렬) 계약을 검증한다.
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from qbt.common_constants import COL_CLOSE, COL_DATE, COL_HIGH, COL_LOW, COL_OPEN, COL_VOLUME
+from qbt.tqqq.constants import (
+    COL_EXPENSE_DATE,
+    COL_EXPENSE_VALUE,
+    COL_FFR_DATE,
+    COL_FFR_VALUE,
+    DEFAULT_SYNTHETIC_INITIAL_PRICE,
+)
+from qbt.tqqq.data_loader import create_ffr_series
+from qbt.tqqq.simulation import build_monthly_spread_series, simulate
+from qbt.tqqq.synthetic import (
+    SYNTHETIC_SPECS,
+    SyntheticSpec,
+    build_synthetic_series,
+    generate_synthetic_batch,
+    merge_synthetic_with_actual,
+)
+
+
+def _make_price_df(start: str, periods: int, base: float, step: float) -> pd.DataFrame:
+    """영업일 기준 단조 증가 가격 DataFrame을 만든다."""
+    dates = [ts.date() for ts in pd.bdate_range(start=start, periods=periods)]
+    closes = [base + step * i for i in range(periods)]
+    return pd.DataFrame(
+        {
+            COL_DATE: dates,
+            COL_OPEN: closes,
+            COL_HIGH: [c * 1.01 for c in closes],
+            COL_LOW: [c * 0.99 for c in closes],
+            COL_CLOSE: closes,
+            COL_VOLUME: [1_000_000] * periods,
+        }
+    )
+
+
+def _make_ffr_df() -> pd.DataFrame:
+    return pd.DataFrame({COL_FFR_DATE: ["2023-01", "2023-02", "2023-03"], COL_FFR_VALUE: [0.045, 0.046, 0.047]})
+
+
+def _make_spec(tmp_path: Path, ticker: str = "TEST", expense_ratio: float = 0.0095) -> SyntheticSpec:
+    return SyntheticSpec(
+        ticker=ticker,
+        underlying_path=tmp_path / "UNDERLYING_max.csv",
+        actual_path=tmp_path / f"{ticker}_max.csv",
+        output_path=tmp_path / f"{ticker}_synthetic_max.csv",
+        leverage=2.0,
+        expense_ratio=expense_ratio,
+    )
+
+
+class TestMergeSyntheticWithActual:
+    """접합점 스케일링 + 병합 테스트"""
+
+    def test_scales_synthetic_before_overlap(self):
+        """
+        목적: 접합점 이전 합성 가격이 (실제 종가 / 합성 종가) 배율로 스케일링되는지 검증
+
+        Given: 합성 접합점 종가 46, 실제 접합점(2023-01-09) 종가 92
+        When: merge_synthetic_with_actual 호출
+        Then:
+          - 스케일 팩터 92 / 46
+          - 접합점 이전 합성 구간 가격에 스케일 팩터 적용
+          - 접합점 이후는 실제 데이터 그대로
+        """
+        # Given
+        synthetic_df = _make_price_df("2023-01-02", 10, base=41.0, step=1.0)  # 접합점(6번째 행) 종가 46
+        actual_df = _make_price_df("2023-01-09", 5, base=92.0, step=2.0)  # 첫 행 종가 92
+        overlap_close = float(synthetic_df.loc[synthetic_df[COL_DATE] == date(2023, 1, 9), COL_CLOSE].iloc[0])
+
+        # When
+        merged_df, scale_factor = merge_synthetic_with_actual(synthetic_df, actual_df)
+
+        # Then
+        assert scale_factor == pytest.approx(92.0 / overlap_close)
+        assert len(merged_df) == 5 + 5
+        assert merged_df[COL_DATE].tolist() == sorted(merged_df[COL_DATE].tolist())
+        assert merged_df[COL_CLOSE].iloc[0] == pytest.approx(41.0 * scale_factor)
+        assert merged_df[COL_HIGH].iloc[0] == pytest.approx(41.0 * 1.01 * scale_factor)
+        pd.testing.assert_frame_equal(merged_df.iloc[5:].reset_index(drop=True), actual_df)
+
+    def test_empty_actual_raises(self):
+        """
+        목적: 실제 데이터가 비어있으면 ValueError
+
+        Given: 빈 실제 DataFrame
+        When: merge_synthetic_with_actual 호출
+        Then: ValueError
+        """
+        synthetic_df = _make_price_df("2023-01-02", 5, base=10.0, step=1.0)
+        with pytest.raises(ValueError, match="비어있습니다"):
+            merge_synthetic_with_actual(synthetic_df, synthetic_df.iloc[0:0])
+
+    def test_missing_overlap_raises(self):
+        """
+        목적: 실제 첫 거래일이 합성 데이터에 없으면 ValueError
+
+        Given: 합성 구간이 실제 첫 거래일 이전에 끝남
+        When: merge_synthetic_with_actual 호출
+        Then: ValueError (접합점)
+        """
+        synthetic_df = _make_price_df("2023-01-02", 5, base=10.0, step=1.0)
+        actual_df = _make_price_df("2023-02-01", 5, base=10.0, step=1.0)
+        with pytest.raises(ValueError, match="접합점"):
+            merge_synthetic_with_actual(synthetic_df, actual_df)
+
+
+class TestSyntheticSpec:
+    """생성 대상 선언 검증 테스트"""
+
+    def test_requires_exactly_one_expense_source(self, tmp_path):
+        """
+        목적: expense_ratio / expense_ratio_path 중 정확히 하나만 허용
+
+        Given: 둘 다 지정 / 둘 다 미지정
+        When: SyntheticSpec 생성
+        Then: ValueError
+        """
+        common = {
+            "ticker": "TEST",
+            "underlying_path": tmp_path / "a.csv",
+            "actual_path": tmp_path / "b.csv",
+            "output_path": tmp_path / "c.csv",
+            "leverage": 2.0,
+        }
+        with pytest.raises(ValueError, match="정확히 하나"):
+            SyntheticSpec(**common)
+        with pytest.raises(ValueError, match="정확히 하나"):
+            SyntheticSpec(**common, expense_ratio=0.01, expense_ratio_path=tmp_path / "e.csv")
+
+    def test_invalid_leverage_and_expense_raise(self, tmp_path):
+        """
+        목적: 비양수 레버리지와 음수 운용비율 거부
+
+        Given: leverage=0 / expense_ratio=-0.01
+        When: SyntheticSpec 생성
+        Then: ValueError
+        """
+        with pytest.raises(ValueError, match="leverage"):
+            SyntheticSpec("TEST", tmp_path / "a.csv", tmp_path / "b.csv", tmp_path / "c.csv", 0.0, expense_ratio=0.01)
+        with pytest.raises(ValueError, match="expense_ratio"):
+            SyntheticSpec("TEST", tmp_path / "a.csv", tmp_path / "b.csv", tmp_path / "c.csv", 2.0, expense_ratio=-0.01)
+
+    def test_declared_specs_unique(self):
+        """
+        목적: 기본 선언 조합의 티커/출력 경로가 중복되지 않는지 검증
+
+        Given: SYNTHETIC_SPECS
+        When: 티커/출력 경로 수집
+        Then: 모두 고유, TQQQ는 월별 운용비율 CSV 사용
+        """
+        tickers = [spec.ticker for spec in SYNTHETIC_SPECS]
+        assert len(set(tickers)) == len(tickers)
+        assert len({spec.output_path for spec in SYNTHETIC_SPECS}) == len(SYNTHETIC_SPECS)
+        tqqq_spec = next(spec for spec in SYNTHETIC_SPECS if spec.ticker == "TQQQ")
+        assert tqqq_spec.expense_ratio_path is not None
+        assert tqqq_spec.leverage == 3.0
+
+
+class TestBuildSyntheticSeries:
+    """조합 1개 생성 테스트"""
+
+    def test_fixed_expense_matches_direct_simulate(self, tmp_path):
+        """
+        목적: 고정 운용비율 조합이 같은 월별 운용비율로 simulate를 직접 호출한 결과와 일치하는지 검증
+
+        Given: 2023-01 ~ 2023-02 기초 자산, 2023-02-01 상장 실제 ETF, 고정 운용비율 0.95%
+        When: build_synthetic_series 호출
+        Then: 합성 구간이 직접 simulate + 스케일링 결과와 일치
+        """
+        # Given
+        spec = _make_spec(tmp_path)
+        underlying_df = _make_price_df("2023-01-02", 40, base=100.0, step=0.5)
+        actual_df = _make_price_df("2023-02-01", 20, base=50.0, step=0.3)
+        ffr_df = _make_ffr_df()
+        ffr_series = create_ffr_series(ffr_df)
+        spread_series = build_monthly_spread_series(ffr_df, -5.0, 0.5)
+
+        # When
+        result = build_synthetic_series(spec, underlying_df, actual_df, ffr_series, spread_series)
+
+        # Then
+        expense_df = pd.DataFrame(
+            {COL_EXPENSE_DATE: ["2023-01", "2023-02", "2023-03"], COL_EXPENSE_VALUE: [0.0095] * 3}
+        )
+        expected_sim = simulate(
+            underlying_df=underlying_df,
+            leverage=2.0,
+            expense_df=expense_df,
+            initial_price=DEFAULT_SYNTHETIC_INITIAL_PRICE,
+            ffr_df=ffr_df,
+            funding_spread=build_monthly_spread_series(ffr_df, -5.0, 0.5).to_dict(),
+        )
+        expected_merged, expected_scale = merge_synthetic_with_actual(expected_sim, actual_df)
+
+        assert result.overlap_date == date(2023, 2, 1)
+        assert result.synthetic_days == 22
+        assert result.scale_factor == pytest.approx(expected_scale, rel=1e-12)
+        pd.testing.assert_frame_equal(result.merged_df, expected_merged, rtol=1e-12)
+
+    def test_clips_underlying_before_ffr_start(self, tmp_path):
+        """
+        목적: FFR 데이터 시작 월 이전의 기초 자산 구간을 제외하는지 검증
+
+        Given: 기초 자산이 2022-12부터 시작, FFR은 2023-01부터
+        When: build_synthetic_series 호출
+        Then: 병합 결과 시작일이 2023-01 첫 영업일
+        """
+        spec = _make_spec(tmp_path)
+        underlying_df = _make_price_df("2022-12-01", 60, base=100.0, step=0.2)
+        actual_df = _make_price_df("2023-02-01", 10, base=50.0, step=0.3)
+        ffr_df = _make_ffr_df()
+
+        result = build_synthetic_series(
+            spec, underlying_df, actual_df, create_ffr_series(ffr_df), build_monthly_spread_series(ffr_df, -5.0, 0.5)
+        )
+
+        assert result.merged_df[COL_DATE].iloc[0] == date(2023, 1, 2)
+
+    def test_expense_path_spec_requires_expense_df(self, tmp_path):
+        """
+        목적: 월별 운용비율 CSV 조합에 expense_df가 없으면 ValueError
+
+        Given: expense_ratio_path 지정 조합, expense_df=None
+        When: build_synthetic_series 호출
+        Then: ValueError
+        """
+        spec = SyntheticSpec(
+            "TEST",
+            tmp_path / "a.csv",
+            tmp_path / "b.csv",
+            tmp_path / "c.csv",
+            3.0,
+            expense_ratio_path=tmp_path / "expense.csv",
+        )
+        ffr_df = _make_ffr_df()
+        underlying_df = _make_price_df("2023-01-02", 20, base=100.0, step=0.5)
+
+        with pytest.raises(ValueError, match="expense_df"):
+            build_synthetic_series(
+                spec,
+                underlying_df,
+                underlying_df,
+                create_ffr_series(ffr_df),
+                build_monthly_spread_series(ffr_df, -5.0, 0.5),
+            )
+
+
+class TestGenerateSyntheticBatch:
+    """일괄 생성 테스트"""
+
+    def test_parallel_matches_sequential(self, tmp_path, create_csv_file):
+        """
+        목적: 조합 단위 병렬 실행 결과가 순차 실행과 같은지 검증
+
+        Given: 같은 기초 자산을 공유하는 2개 조합 (운용비율만 다름)
+        When: max_workers=1 / max_workers=2로 generate_synthetic_batch 호출
+        Then: specs 순서 유지, 병합 결과 동일
+        """
+        # Given
+        create_csv_file("UNDERLYING_max.csv", _make_price_df("2023-01-02", 40, base=100.0, step=0.5))
+        create_csv_file("AAA_max.csv", _make_price_df("2023-02-01", 20, base=50.0, step=0.3))
+        create_csv_file("BBB_max.csv", _make_price_df("2023-02-01", 20, base=30.0, step=0.1))
+        specs = [_make_spec(tmp_path, "AAA", 0.0095), _make_spec(tmp_path, "BBB", 0.0089)]
+        ffr_df = _make_ffr_df()
+
+        # When
+        sequential = generate_synthetic_batch(specs, ffr_df, a=-5.0, b=0.5, max_workers=1)
+        parallel = generate_synthetic_batch(specs, ffr_df, a=-5.0, b=0.5, max_workers=2)
+
+        # Then
+        assert [r.spec.ticker for r in sequential] == ["AAA", "BBB"]
+        assert [r.spec.ticker for r in parallel] == ["AAA", "BBB"]
+        for seq_result, par_result in zip(sequential, parallel, strict=True):
+            assert seq_result.scale_factor == par_result.scale_factor
+            pd.testing.assert_frame_equal(seq_result.merged_df, par_result.merged_df)
+
+    def test_invalid_specs_raise(self, tmp_path):
+        """
+        목적: 빈 specs / 중복 티커 / 잘못된 워커 수 거부
+
+        Given: 빈 리스트, 같은 티커 2개, max_workers=0
+        When: generate_synthetic_batch 호출
+        Then: ValueError
+        """
+        ffr_df = _make_ffr_df()
+        spec = _make_spec(tmp_path)
+
+        with pytest.raises(ValueError, match="비어있습니다"):
+            generate_synthetic_batch([], ffr_df)
+        with pytest.raises(ValueError, match="중복"):
+            generate_synthetic_batch([spec, spec], ffr_df)
+        with pytest.raises(ValueError, match="max_workers"):
+            generate_synthetic_batch([spec], ffr_df, max_workers=0)
@@ -439,6 +439,36 @@ class TestRunWalkforward:
         assert "oos_calmar" in first
         assert "wfe_calmar" in first
 
+    def test_incremental_is_matches_full_grid_search(self):
+        """
+        목적: Expanding 모드에서 증분 IS 그리드 서치 결과가 윈도우별 전체 재계산과 동일한지 검증
+
+        Given: 상승 추세 + 진동 구간 데이터 (매매가 여러 번 발생), 2×2×1×2 그리드
+        When: run_walkforward(incremental_is=True) / run_walkforward(incremental_is=False)
+        Then: 모든 윈도우 결과(최적 파라미터, IS/OOS 지표)가 정확히 일치
+        """
+        from qbt.backtest.walkforward import run_walkforward
+
+        # Given
+        df = _make_trend_and_oscillating_df(n_is=700, n_oos=1100, oos_center=150.0, oos_amplitude=20.0)
+        kwargs = {
+            "ma_window_list": [20, 50],
+            "buy_buffer_zone_pct_list": [0.01, 0.03],
+            "sell_buffer_zone_pct_list": [0.03],
+            "hold_days_list": [0, 2],
+            "initial_is_months": 24,
+            "oos_months": 12,
+            "min_trades": 0,
+        }
+
+        # When
+        incremental = run_walkforward(signal_df=df, trade_df=df, incremental_is=True, **kwargs)
+        full = run_walkforward(signal_df=df, trade_df=df, incremental_is=False, **kwargs)
+
+        # Then
+        assert len(incremental) >= 3
+        assert incremental == full
+
 
 class TestBuildParamsSchedule:
     """build_params_schedule() 함수 테스트."""